@@ -6,6 +6,8 @@ from typing import Dict, Any, Literal, Optional, List
 from urllib.parse import urlsplit
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
+from core.retry_queue.api_budget_limiter import AdaptiveRateConfig
+
 # config.yaml 및 tr_ids_config.yaml 파일 경로 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 MAIN_CONFIG_PATH = os.path.join(BASE_DIR, 'config.yaml')
@@ -97,6 +99,10 @@ class KillSwitchConfig(BaseModel):
     max_consecutive_api_errors: int = 10
     abnormal_fill_deviation_pct: float = 3.0
     state_file_path: str = "data/kill_switch_state.json"
+    # 카운터 delta journal 의 durability window(초)와 compaction 주기(delta 수).
+    # 트립/해제는 window 와 무관하게 즉시 동기 snapshot 으로 저장된다.
+    journal_flush_interval_sec: float = 0.2
+    journal_compact_every: int = 500
 
 class PositionSizingRealOverrides(BaseModel):
     """real_limited overlay (실전 제한 운영). paper 동작은 영향 없음.
@@ -270,6 +276,47 @@ class PaperAccountExpiryAlertConfig(BaseModel):
     model_config = {"extra": "allow"}
 
 
+class WarmRestartSnapshotConfig(BaseModel):
+    enabled: bool = True
+    path: str = "data/warm_restart/hot_state.snap"
+    interval_sec: int = Field(default=60, ge=5)
+    ohlcv_limit: int = Field(default=600, ge=1)
+
+    model_config = {"extra": "allow"}
+
+
+_ADAPTIVE_RATE_DEFAULTS = AdaptiveRateConfig()
+
+
+class ApiAdaptiveRateConfig(BaseModel):
+    # KIS 호출 한도 AIMD 탐색 (ApiBudgetLimiter adaptive). 꺼져 있으면 설정 rate 고정.
+    # 기본값은 AdaptiveRateConfig 에서 가져와 설정 없이 만든 limiter 와 어긋나지 않게 한다.
+    enabled: bool = False
+    min_rate_ratio: float = Field(default=_ADAPTIVE_RATE_DEFAULTS.min_rate_ratio, gt=0, le=1.0)
+    max_rate_ratio: float = Field(default=_ADAPTIVE_RATE_DEFAULTS.max_rate_ratio, ge=1.0)  # 설정 rate 대비 탐색 상한
+    increase_per_sec: float = Field(default=_ADAPTIVE_RATE_DEFAULTS.increase_per_sec, ge=0)
+    decrease_factor: float = Field(default=_ADAPTIVE_RATE_DEFAULTS.decrease_factor, gt=0, lt=1.0)
+
+    model_config = {"extra": "allow"}
+
+
+class ScanFunnelConfig(BaseModel):
+    # 전략 거절 후보 로그 샘플링 (1=모두, N=reason 별 N건당 1건, 0=끔). 거절 집계는 항상 유지된다.
+    rejection_log_sample_every: int = Field(default=1, ge=0)
+
+    model_config = {"extra": "allow"}
+
+
+class MarketSessionConfig(BaseModel):
+    enabled: bool = True
+    calendar_path: str = "data/market_calendar/krx_business_days.json"
+    late_open_first_trading_day: bool = True
+    # {"YYYYMMDD": {"open_delay_min": 60, "close_delay_min": 60}} — 수능일 등 개장/마감 이동
+    day_overrides: Dict[str, Dict[str, int]] = Field(default_factory=dict)
+
+    model_config = {"extra": "allow"}
+
+
 class DataQualityConfig(BaseModel):
     enabled: bool = True
     max_tick_age_sec: float = 30.0
@@ -303,8 +350,22 @@ class NotificationTelegramConfig(BaseModel):
     model_config = {"extra": "allow"}
 
 
+class NotificationDispatchConfig(BaseModel):
+    """외부 알림 디스패처(NotificationQueueTask) 배치·요약·속도 제한 설정."""
+    batch_max: int = Field(50, ge=1)
+    coalesce_window_sec: float = Field(0.5, ge=0)
+    digest_min_events: int = Field(4, ge=2)
+    digest_max_lines: int = Field(15, ge=1)
+    handler_concurrency: int = Field(2, ge=1)
+    rate_per_sec: float = Field(1.0, gt=0)
+    burst: int = Field(3, ge=1)
+
+    model_config = {"extra": "allow"}
+
+
 class NotificationsConfig(BaseModel):
     telegram: NotificationTelegramConfig = Field(default_factory=NotificationTelegramConfig)
+    dispatch: NotificationDispatchConfig = Field(default_factory=NotificationDispatchConfig)
 
     model_config = {"extra": "allow"}
 
@@ -321,6 +382,10 @@ class DartDisclosureConfig(BaseModel):
     daily_digest_enabled: bool = True
     daily_digest_time: str = "19:40"
     max_pages_per_poll: int = Field(5, ge=1, le=100)
+    # 본문 AI 분석 단계: 규칙 기반 즉시 알림을 먼저 보낸 뒤 동시성 상한·건별 마감 안에서 보강한다.
+    ai_analysis_concurrency: int = Field(3, ge=1, le=16)
+    ai_analysis_timeout_sec: float = Field(45.0, gt=0)
+    ai_analysis_batch_size: int = Field(20, ge=1, le=200)
 
     model_config = {"extra": "allow"}
 
@@ -565,6 +630,11 @@ class OverseasStockConfig(BaseModel):
     allow_live_trading: bool = False
     dryrun_slot_usd: float = Field(1000.0, gt=0)
     dryrun_max_qty: Optional[int] = Field(default=None, gt=0)
+    # 후보 거래대금 산출용 해외 일봉 라이브 조회: 동시 worker 수와 실행(세션)당 호출 예산.
+    candidate_fetch_concurrency: int = Field(4, ge=1, le=32)
+    candidate_max_live_fetches: Optional[int] = Field(default=600, ge=0)
+    # dry-run 전략 묶음이 후보·일봉·공통 지표를 실행당 1회만 준비해 공유한다 (False 면 서비스별 조회).
+    dryrun_shared_snapshot: bool = True
     intraday_vbo: OverseasIntradayVBOConfig = Field(default_factory=OverseasIntradayVBOConfig)
 
     model_config = {"extra": "allow"}
@@ -607,6 +677,10 @@ class AppConfig(BaseModel):
         default_factory=PaperAccountExpiryAlertConfig
     )
     data_quality: DataQualityConfig = Field(default_factory=DataQualityConfig)
+    warm_restart_snapshot: WarmRestartSnapshotConfig = Field(default_factory=WarmRestartSnapshotConfig)
+    market_session: MarketSessionConfig = Field(default_factory=MarketSessionConfig)
+    scan_funnel: ScanFunnelConfig = Field(default_factory=ScanFunnelConfig)
+    api_adaptive_rate: ApiAdaptiveRateConfig = Field(default_factory=ApiAdaptiveRateConfig)
     notifications: NotificationsConfig = Field(default_factory=NotificationsConfig)
     dart_disclosure: DartDisclosureConfig = Field(default_factory=DartDisclosureConfig)
     trade_trend_monitor: TradeTrendMonitorConfig = Field(default_factory=TradeTrendMonitorConfig)
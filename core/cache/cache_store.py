@@ -91,8 +91,10 @@ class CacheStore:
         return raw, cache_type
     
     def get(self, key: str):
-        # 내부적으로 get_raw를 호출하거나 구현체에서 오버라이드
-        pass
+        """메모리 캐시에 set() 한 값을 그대로 반환 (wrapper 없는 값 — 지표 확정 캐시 등). 없으면 None."""
+        if self.memory_cache:
+            return self.memory_cache.get(key)
+        return None
 
     def set(self, key: str, value: Any, save_to_file: bool = False):
         if self.memory_cache:
@@ -0,0 +1,39 @@
+"""
+데이터 버전 레지스트리.
+
+장마감 배치(일별 시세 스냅샷, OHLCV, 랭킹)가 저장소를 갱신할 때 토픽별 버전을 올린다.
+버전은 단조 증가 정수라 캐시는 "내가 만든 시점의 버전과 지금 버전이 같은가"만 비교하면
+별도 무효화 호출 없이 갱신 여부를 알 수 있다 (view.web.response_cache 가 사용).
+"""
+from __future__ import annotations
+
+import threading
+
+# 토픽 이름 — 갱신 주체(장마감 태스크)와 소비자(응답 캐시)가 같은 상수를 쓴다.
+DAILY_PRICES = "daily_prices"   # DailyPriceCollectorTask: daily_prices 스냅샷 (히트맵·YTD 랭킹)
+OHLCV = "ohlcv"                 # OhlcvUpdateTask: 종목별 일봉 (차트·지표)
+RANKING = "ranking"             # RankingTask: 기본/투자자/프로그램 랭킹 캐시
+
+
+class DataVersionRegistry:
+    """토픽별 단조 증가 버전 카운터. 스레드 안전 (배치가 executor 에서 bump 해도 된다)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+
+    def get(self, topic: str) -> int:
+        return self._versions.get(topic, 0)
+
+    def bump(self, topic: str) -> int:
+        with self._lock:
+            version = self._versions.get(topic, 0) + 1
+            self._versions[topic] = version
+            return version
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self._versions)
+
+
+# 프로세스 전역 레지스트리. 버전은 오르기만 하므로 테스트 사이에 공유되어도 안전하다.
+data_versions = DataVersionRegistry()
@@ -0,0 +1,86 @@
+"""LazyService — 매매 경로에 필요 없는 서비스를 첫 사용 시점에 만드는 프록시.
+
+AI·YouTube·테마 리포트·해외 종목 마스터처럼 기동 직후 매매에 쓰이지 않는 객체는
+팩토리만 ctx 에 걸어 두고, 라우트·태스크가 처음 쓰는 시점에 생성한다.
+팩토리는 DB 로드·다운로드처럼 블로킹이므로 비동기 사용처는 ``await aresolve_lazy(x)`` 로
+이벤트 루프 밖(스레드)에서 만든 실제 인스턴스를 받아 쓴다. 팩토리가 실패하면 경고를 남기고
+None 으로 확정된다 — 사용처는 resolve 결과를 ``is None`` 으로 판정한다.
+프록시 자체는 None 이 아니고 truthiness 로 팩토리를 돌리지도 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class LazyService:
+    """팩토리를 한 번만 호출해 만든 인스턴스로 속성 접근을 위임한다 (스레드 안전).
+
+    속성 위임(``__getattr__``)은 동기 사용처용 폴백이라 미생성 상태면 호출 스레드에서
+    팩토리를 돌린다. 이벤트 루프 위에서는 먼저 ``aresolve`` 로 만든다.
+    """
+
+    __slots__ = ("_factory", "_name", "_logger", "_lock", "_resolved", "_instance")
+
+    def __init__(self, factory: Callable[[], Any], *, name: str, logger=None) -> None:
+        self._factory = factory
+        self._name = name
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._resolved = False
+        self._instance: Optional[Any] = None
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._resolved
+
+    def resolve(self) -> Optional[Any]:
+        if self._resolved:
+            return self._instance
+        with self._lock:
+            if not self._resolved:
+                started = time.perf_counter()
+                try:
+                    self._instance = self._factory()
+                    if self._logger is not None:
+                        elapsed_ms = (time.perf_counter() - started) * 1000.0
+                        self._logger.info(f"[LazyService] {self._name} 생성 ({elapsed_ms:.0f}ms)")
+                except Exception as exc:
+                    if self._logger is not None:
+                        self._logger.warning(f"[LazyService] {self._name} 생성 실패(비활성): {exc}")
+                    self._instance = None
+                self._factory = None
+                self._resolved = True
+        return self._instance
+
+    async def aresolve(self) -> Optional[Any]:
+        """resolve 를 워커 스레드에서 돌린다. 이미 만들어졌으면 루프에서 바로 반환한다."""
+        if self._resolved:
+            return self._instance
+        return await asyncio.to_thread(self.resolve)
+
+    def __getattr__(self, attr: str) -> Any:
+        instance = self.resolve()
+        if instance is None:
+            raise AttributeError(f"{self._name} 를 사용할 수 없습니다 (생성 실패): {attr}")
+        return getattr(instance, attr)
+
+    def __repr__(self) -> str:
+        state = repr(self._instance) if self._resolved else "unresolved"
+        return f"<LazyService {self._name}: {state}>"
+
+
+def resolve_lazy(value: Any) -> Any:
+    """LazyService 면 실제 인스턴스(또는 None)를, 아니면 값을 그대로 반환한다."""
+    if isinstance(value, LazyService):
+        return value.resolve()
+    return value
+
+
+async def aresolve_lazy(value: Any) -> Any:
+    """resolve_lazy 의 비동기판 — 팩토리를 이벤트 루프 밖에서 돌린다."""
+    if isinstance(value, LazyService):
+        return await value.aresolve()
+    return value
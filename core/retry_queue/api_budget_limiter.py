@@ -1,8 +1,10 @@
 import asyncio
+from collections import deque
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import math
 import time
-from typing import AsyncIterator, Awaitable, Callable, Mapping, Optional
+from typing import AsyncIterator, Awaitable, Callable, Deque, Mapping, Optional
 
 from core.api_priority import PRIORITY_EMERGENCY, PRIORITY_NORMAL
 
@@ -59,6 +61,111 @@ DEFAULT_API_GLOBAL_RATE_LIMIT_PER_SEC = 8.0
 DEFAULT_API_EMERGENCY_GLOBAL_RATE_LIMIT_PER_SEC = 2.0
 
 
+@dataclass(frozen=True)
+class AdaptiveRateConfig:
+    """카테고리별 AIMD rate 제어 파라미터.
+
+    설정 rate(DEFAULT_API_RATE_LIMITS_PER_SEC 등)를 시작값으로 두고, 성공 응답이 이어지면
+    초당 `increase_per_sec` 만큼 올리고 rate limit 오류(EGW00201)·p95 지연 상승 시 곱으로 줄인다.
+    기본값의 단일 출처 — config 의 ApiAdaptiveRateConfig 도 이 값을 기본값으로 쓴다.
+    """
+
+    min_rate_ratio: float = 0.25            # 설정 rate 대비 하한
+    max_rate_ratio: float = 1.25            # 설정 rate 대비 상한
+    increase_per_sec: float = 1.0           # 성공 traffic 1초당 additive increase (req/s)
+    probe_ratio: float = 0.25               # rate limit 지점(knee) 위로 탐색하는 속도 (increase 대비)
+    probe_accel_sec: float = 5.0            # 마지막 감속 후 이 시간마다 탐색 속도 +1배 (한도 상향 추종)
+    decrease_factor: float = 0.7            # rate limit 오류 시 곱
+    latency_decrease_factor: float = 0.85   # p95 지연 상승 시 곱
+    latency_window: int = 50                # p95 계산 표본 수
+    latency_p95_ratio: float = 2.0          # baseline p95 대비 이 배수를 넘으면 감속
+    decrease_cooldown_sec: float = 1.0      # 연속 감속 방지 (in-flight 요청의 중복 오류 흡수)
+
+
+class _AimdController:
+    """lane 1개의 live rate. rate limit 지점(knee) 아래로 headroom 을 남기고 수렴한다."""
+
+    def __init__(
+        self,
+        base_rate: float,
+        config: AdaptiveRateConfig,
+        *,
+        headroom_per_sec: float = 0.0,
+    ) -> None:
+        self._config = config
+        self.min_rate = max(1e-3, base_rate * config.min_rate_ratio)
+        self.max_rate = max(self.min_rate, base_rate * config.max_rate_ratio)
+        self.rate = min(max(base_rate, self.min_rate), self.max_rate)
+        # 증가 상한. rate limit 오류가 나면 (knee - headroom) 으로 내려가고 천천히 다시 올라간다.
+        self.ceiling = self.max_rate
+        self._headroom = max(0.0, headroom_per_sec)
+        self._last_decrease_at = -math.inf
+        self._latencies: Deque[float] = deque(maxlen=max(5, int(config.latency_window)))
+        self._baseline_p95: Optional[float] = None
+        self.increase_total = 0
+        self.rate_limited_total = 0
+        self.rate_limit_decrease_total = 0
+        self.latency_decrease_total = 0
+
+    def on_success(self, now: float, latency_sec: Optional[float] = None) -> None:
+        cfg = self._config
+        step = cfg.increase_per_sec / max(self.rate, 1e-9)
+        # knee 근처에서는 천천히, 오류 없이 오래 버틸수록 빠르게 상한을 올린다 (한도 상향 추종).
+        calm_sec = now - self._last_decrease_at if math.isfinite(self._last_decrease_at) else 0.0
+        probe = cfg.probe_ratio * (1.0 + calm_sec / max(cfg.probe_accel_sec, 1e-9))
+        self.ceiling = min(self.max_rate, self.ceiling + step * probe)
+        if self.rate < self.ceiling:
+            self.rate = min(self.ceiling, self.rate + step)
+            self.increase_total += 1
+        if latency_sec is not None:
+            self._observe_latency(now, latency_sec)
+
+    def on_rate_limited(self, now: float) -> None:
+        self.rate_limited_total += 1
+        if now - self._last_decrease_at < self._config.decrease_cooldown_sec:
+            return
+        knee = self.rate
+        self.rate = max(self.min_rate, knee * self._config.decrease_factor)
+        self.ceiling = max(self.min_rate, knee - self._headroom)
+        self._last_decrease_at = now
+        self.rate_limit_decrease_total += 1
+
+    def _observe_latency(self, now: float, latency_sec: float) -> None:
+        window = self._latencies
+        window.append(max(0.0, float(latency_sec)))
+        if len(window) < window.maxlen:
+            return
+        ordered = sorted(window)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+        elif (
+            self._baseline_p95 > 0
+            and p95 > self._baseline_p95 * self._config.latency_p95_ratio
+            and now - self._last_decrease_at >= self._config.decrease_cooldown_sec
+        ):
+            self.rate = max(self.min_rate, self.rate * self._config.latency_decrease_factor)
+            self._last_decrease_at = now
+            self.latency_decrease_total += 1
+            window.clear()
+        else:
+            # 지연 분포가 서서히 변하는 경우를 위해 baseline 을 아주 천천히 따라 올린다.
+            self._baseline_p95 += (p95 - self._baseline_p95) * 0.01
+
+    def snapshot(self) -> dict:
+        return {
+            "live_rate_per_sec": round(self.rate, 4),
+            "ceiling_per_sec": round(self.ceiling, 4),
+            "min_rate_per_sec": round(self.min_rate, 4),
+            "max_rate_per_sec": round(self.max_rate, 4),
+            "baseline_p95_sec": self._baseline_p95,
+            "increase_total": self.increase_total,
+            "rate_limited_total": self.rate_limited_total,
+            "rate_limit_decrease_total": self.rate_limit_decrease_total,
+            "latency_decrease_total": self.latency_decrease_total,
+        }
+
+
 @dataclass
 class _LaneState:
     limit: int
@@ -73,6 +180,7 @@ class _LaneState:
     rate_wait_seconds_total: float = 0.0
     semaphore_wait_total: int = 0
     semaphore_wait_seconds_total: float = 0.0
+    controller: Optional[_AimdController] = field(default=None, repr=False)
 
 
 @dataclass
@@ -87,6 +195,10 @@ class ApiBudgetLimiter:
     카테고리별로 normal lane(기본) 과 선택적 emergency lane 을 갖는다.
     emergency lane 은 청산/킬스위치 경로가 일반 traffic 과 분리된 별도 슬롯을
     확보하도록 한다. lane 간 semaphore 와 rate bucket 은 독립.
+
+    `adaptive` 를 주면 normal lane(카테고리 + global)의 rate 가 `record_result` 피드백으로
+    AIMD 조정된다. emergency lane 은 고정 rate 를 유지하고, global normal lane 은
+    rate limit 지점 아래로 emergency global rate 만큼 headroom 을 남긴다.
     """
 
     def __init__(
@@ -102,13 +214,22 @@ class ApiBudgetLimiter:
         default_rate_limit_per_sec: float = 8.0,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
         monotonic: Callable[[], float] = time.monotonic,
+        adaptive: AdaptiveRateConfig | None = None,
     ) -> None:
         self._default_limit = self._validate_limit(default_limit)
         self._default_rate_limit_per_sec = self._validate_rate_limit(default_rate_limit_per_sec)
         self._sleep = sleep
         self._monotonic = monotonic
+        self._adaptive = adaptive
         self._global_lane = self._new_lane(1, global_rate_limit_per_sec)
         self._emergency_global_lane = self._new_lane(1, emergency_global_rate_limit_per_sec)
+        self._global_lane.controller = self._new_controller(
+            self._global_lane.rate_limit_per_sec,
+            headroom_per_sec=(
+                self._emergency_global_lane.rate_limit_per_sec
+                if math.isfinite(self._emergency_global_lane.rate_limit_per_sec) else 0.0
+            ),
+        )
         configured = dict(DEFAULT_API_BUDGET_LIMITS if limits is None else limits)
         configured_rates = dict(
             DEFAULT_API_RATE_LIMITS_PER_SEC
@@ -160,6 +281,53 @@ class ApiBudgetLimiter:
             lane.active -= 1
             lane.semaphore.release()
 
+    def record_result(
+        self,
+        category: str | None,
+        *,
+        success: bool,
+        rate_limited: bool = False,
+        latency_sec: float | None = None,
+        priority: str = PRIORITY_NORMAL,
+    ) -> None:
+        """broker 응답 피드백. adaptive 가 꺼져 있으면 no-op.
+
+        - success: 성공 응답 → normal lane rate additive increase (+ 지연 표본)
+        - rate_limited: EGW00201 등 호출 한도 초과 → multiplicative decrease
+        emergency 호출의 rate limit 도 서버 한도 신호이므로 global normal lane 을 줄인다.
+        """
+        if self._adaptive is None:
+            return
+        now = self._monotonic()
+        budget = self._budget_for(category if category is not None else "default")
+        lanes = [self._global_lane]
+        if priority != PRIORITY_EMERGENCY or budget.emergency is None:
+            lanes.append(budget.normal)
+        for lane in lanes:
+            controller = lane.controller
+            if controller is None:
+                continue
+            if rate_limited:
+                controller.on_rate_limited(now)
+            elif success:
+                if priority == PRIORITY_EMERGENCY:
+                    continue
+                controller.on_success(now, latency_sec if lane is budget.normal else None)
+            else:
+                continue
+            self._apply_live_rate(lane, now)
+
+    def _apply_live_rate(self, lane: _LaneState, now: float) -> None:
+        new_rate = lane.controller.rate
+        old_rate = lane.rate_limit_per_sec
+        if new_rate == old_rate:
+            return
+        lane.rate_limit_per_sec = new_rate
+        # 이미 예약된 다음 slot 을 새 간격 기준으로 다시 잡는다 (감속 즉시 반영).
+        if lane.next_available_at > now:
+            remaining = lane.next_available_at - now
+            lane.next_available_at = now + remaining * (old_rate / new_rate)
+
     def snapshot(self) -> dict[str, dict]:
         result: dict[str, dict] = {
             "_global": self._lane_snapshot(self._global_lane),
@@ -173,7 +341,7 @@ class ApiBudgetLimiter:
         return result
 
     def _lane_snapshot(self, lane: _LaneState) -> dict:
-        return {
+        entry = {
             "limit": lane.limit,
             "rate_limit_per_sec": lane.rate_limit_per_sec,
             "active": lane.active,
@@ -184,6 +352,9 @@ class ApiBudgetLimiter:
             "semaphore_wait_total": lane.semaphore_wait_total,
             "semaphore_wait_seconds_total": lane.semaphore_wait_seconds_total,
         }
+        if lane.controller is not None:
+            entry["adaptive"] = lane.controller.snapshot()
+        return entry
 
     def _budget_for(self, category: str) -> _CategoryBudget:
         budget = self._budgets.get(category)
@@ -213,6 +384,7 @@ class ApiBudgetLimiter:
         rate_limit_per_sec: float,
     ) -> _CategoryBudget:
         normal = self._new_lane(limit, rate_limit_per_sec)
+        normal.controller = self._new_controller(normal.rate_limit_per_sec)
         emergency_limit = self._emergency_limits.get(category)
         emergency_rate = self._emergency_rate_limits.get(category)
         emergency: Optional[_LaneState] = None
@@ -221,6 +393,11 @@ class ApiBudgetLimiter:
             emergency = self._new_lane(emergency_limit, rate)
         return _CategoryBudget(normal=normal, emergency=emergency)
 
+    def _new_controller(self, base_rate: float, *, headroom_per_sec: float = 0.0) -> Optional[_AimdController]:
+        if self._adaptive is None or not math.isfinite(base_rate):
+            return None
+        return _AimdController(base_rate, self._adaptive, headroom_per_sec=headroom_per_sec)
+
     def _new_lane(self, limit: int, rate_limit_per_sec: float) -> _LaneState:
         validated = self._validate_limit(limit)
         validated_rate = self._validate_rate_limit(rate_limit_per_sec)
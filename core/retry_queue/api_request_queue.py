@@ -2,12 +2,31 @@
 import asyncio
 import dataclasses
 import random
+import time
 from typing import Callable, Coroutine, Any
 
-from core.retry_queue.retry_classifier import classify, RequestOutcome
+from core.retry_queue.retry_classifier import classify, is_rate_limit_error, RequestOutcome
 from core.performance_profiler import layer_profiler
 
 
+def report_budget_result(limiter, category: str, result: Any, latency_sec: float, priority: str | None = None) -> None:
+    """ApiBudgetLimiter adaptive rate 피드백. record_result 가 없는 limiter 는 무시한다."""
+    record_result = getattr(limiter, "record_result", None)
+    if not callable(record_result):
+        return
+    kwargs = {} if priority is None else {"priority": priority}
+    try:
+        record_result(
+            category,
+            success=classify(result) == RequestOutcome.DONE,
+            rate_limited=is_rate_limit_error(result),
+            latency_sec=latency_sec,
+            **kwargs,
+        )
+    except Exception:
+        pass
+
+
 @dataclasses.dataclass
 class QueuedRequest:
     fn: Callable[..., Coroutine]
@@ -107,7 +126,12 @@ class ApiRequestQueue:
                 _t_bud = self._pm.start_timer()
                 async with limiter.acquire(req.request_category):
                     self._pm.log_timer(f"RQBudget.{req.request_category}", _t_bud)
-                    result = await req.fn(*req.args, **req.kwargs)
+                    started = time.monotonic()
+                    result = None
+                    try:
+                        result = await req.fn(*req.args, **req.kwargs)
+                    finally:
+                        report_budget_result(limiter, req.request_category, result, time.monotonic() - started)
         except Exception as e:
             self._logger.warning(
                 f"[RetryQueue] 예외 발생 (id={req.request_id}, attempt={req.attempt}): {e}"
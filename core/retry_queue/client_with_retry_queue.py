@@ -1,7 +1,8 @@
 # core/retry_queue/client_with_retry_queue.py
 import asyncio
+import time
 from core.api_priority import current_priority
-from core.retry_queue.api_request_queue import ApiRequestQueue
+from core.retry_queue.api_request_queue import ApiRequestQueue, report_budget_result
 from core.performance_profiler import layer_profiler
 
 
@@ -66,6 +67,7 @@ _ACCOUNT_METHODS = frozenset({
 
 _METHOD_BUDGET_CATEGORIES = {
     "get_current_price": "quotation_price",
+    "get_multi_price": "quotation_price",
     "get_current_conclusion": "quotation_conclusion",
     "inquire_daily_itemchartprice": "quotation_ohlcv",
     "inquire_time_itemchartprice": "quotation_ohlcv",
@@ -86,6 +88,13 @@ API_BUDGET_COVERAGE_MATRIX = (
         "execution_path": "retry_queue",
         "lane": "normal",
     },
+    {
+        "operation": "multi_price_rest",
+        "method_name": "get_multi_price",
+        "category": "quotation_price",
+        "execution_path": "retry_queue",
+        "lane": "normal",
+    },
     {
         "operation": "ohlcv_daily_rest",
         "method_name": "inquire_daily_itemchartprice",
@@ -320,8 +329,18 @@ class ClientWithRetryQueue:
                 # [S3 계층 타이머] budget 대기 + 직접 호출 총 소요(주문/WS 경로).
                 _t_perf = self._pm.start_timer()
                 try:
-                    async with self._budget_limiter.acquire(category, priority=current_priority()):
-                        return await attr(*args, **kwargs)
+                    priority = current_priority()
+                    async with self._budget_limiter.acquire(category, priority=priority):
+                        started = time.monotonic()
+                        result = None
+                        try:
+                            result = await attr(*args, **kwargs)
+                            return result
+                        finally:
+                            report_budget_result(
+                                self._budget_limiter, category, result,
+                                time.monotonic() - started, priority,
+                            )
                 finally:
                     self._pm.log_timer(f"RetryQueue.{name}(budget)", _t_perf)
 
@@ -93,3 +93,14 @@ def is_non_retriable_business_error(result: ResCommonResponse | None) -> bool:
     except ValueError:
         return False
     return code in _NON_RETRIABLE_CODES
+
+
+def is_rate_limit_error(result: ResCommonResponse | None) -> bool:
+    """KIS 호출 한도 초과(EGW00201 "초당 거래건수를 초과하였습니다")·과부하 응답인지 판정.
+
+    ApiBudgetLimiter 의 adaptive rate 감속 신호로 쓰며, 재시도 가능 과부하 키워드를 공유한다.
+    """
+    if result is None or result.rt_cd == ErrorCode.SUCCESS.value:
+        return False
+    msg = result.msg1 or ""
+    return "EGW00201" in msg or any(kw in msg for kw in _RETRIABLE_MSG_PATTERNS)
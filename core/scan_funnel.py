@@ -0,0 +1,226 @@
+"""ScanFunnel — 전략 scan 깔때기(후보 → 거절 사유 → 신호) 계측을 logging 과 분리해 직접 누적한다.
+
+P2 2-2 후속. 기존 `EntryRejectionCounter` / `StrategyCalcFailureCounter` 는 scan() 동안 strategy
+logger 에 붙는 logging.Handler 라, 전략이 거절 후보마다 구조화 dict 를 만들어 log 해야 했고
+카운트가 LOG_LEVEL 에 좌우됐다 (운영 INFO 에서 debug 거절은 집계 누락).
+
+이제 전략은 funnel API 를 직접 호출한다.
+
+    _R_NO_SURGE = intern_reason("no_surge_history")      # 모듈 로드 시 1회
+    ...
+    if self.funnel.reject(_R_NO_SURGE):                  # 카운트는 항상, 반환값은 로그 샘플 여부
+        self._logger.info({"event": "entry_rejected", ..., "funnel_counted": True})
+
+  - reason 은 프로세스 전역 정수 id 로 intern 되고, 카운터는 id 로 인덱싱하는 list 다 (dict·문자열 해시 없음).
+  - 누적값은 거래일 단위 단조 증가 카운터이며, cycle 통계는 begin/end 사이 delta 로 구한다.
+    scan cycle 밖(이벤트 라우터 evaluate_single 등)에서 난 거절도 일 누적에는 들어간다.
+  - log_sample_every: 1=모두 로그(기본, 기존 동작), N=reason 별 N건당 1건, 0=로그 끔. 카운트는 무관.
+  - 로그 payload 의 `funnel_counted: True` 는 RejectionDistributionService 핸들러가 같은 거절을
+    두 번 세지 않게 하는 표식이다 (일별 분포는 스케줄러가 funnel 에서 직접 넘긴다).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Union
+
+Reason = Union[int, str]
+
+_REASON_NAMES: List[str] = []
+_REASON_IDS: Dict[str, int] = {}
+_GROW_STEP = 16
+_HISTORY_DAYS = 7
+
+
+def intern_reason(name: str) -> int:
+    """reason 문자열을 프로세스 전역 정수 id 로 바꾼다. 같은 문자열은 항상 같은 id."""
+    reason_id = _REASON_IDS.get(name)
+    if reason_id is None:
+        reason_id = len(_REASON_NAMES)
+        _REASON_NAMES.append(name)
+        _REASON_IDS[name] = reason_id
+    return reason_id
+
+
+def reason_name(reason_id: int) -> str:
+    return _REASON_NAMES[reason_id]
+
+
+@dataclass(frozen=True)
+class FunnelCycleStats:
+    """scan/check_exits 1회 동안의 깔때기 통계."""
+    kind: str
+    candidate_count: int = 0
+    signal_count: int = 0
+    rejected_reasons: Dict[str, int] = field(default_factory=dict)
+    calc_failures: Dict[str, int] = field(default_factory=dict)
+    calc_failure_code_count: int = 0
+
+    @property
+    def rejected_count(self) -> int:
+        return sum(self.rejected_reasons.values())
+
+    @property
+    def calc_failure_count(self) -> int:
+        return sum(self.calc_failures.values())
+
+    def failure_rate_pct(self, denominator: int) -> float:
+        if denominator <= 0:
+            return 0.0
+        return round(self.calc_failure_code_count / denominator * 100.0, 4)
+
+
+class FunnelCycle:
+    """begin_cycle 이 돌려주는 cycle 핸들 (누적 카운터 기준점 + cycle 내 실패 종목)."""
+
+    __slots__ = ("kind", "trading_date", "rejection_base", "failure_base", "failed_codes")
+
+    def __init__(self, kind: str, trading_date: str, rejection_base: List[int], failure_base: Dict[str, int]):
+        self.kind = kind
+        self.trading_date = trading_date
+        self.rejection_base = rejection_base
+        self.failure_base = failure_base
+        self.failed_codes: Set[str] = set()
+
+
+class ScanFunnel:
+    """전략 1개의 거래일 단위 깔때기 카운터."""
+
+    __slots__ = (
+        "strategy_name", "log_sample_every", "_trading_date", "_rejections", "_reported",
+        "_calc_failures", "_failed_codes", "_scan_cycles", "_candidates", "_signals",
+        "_active_cycle", "_history",
+    )
+
+    def __init__(self, strategy_name: str, *, log_sample_every: int = 1) -> None:
+        self.strategy_name = strategy_name
+        self.log_sample_every = int(log_sample_every)
+        self._trading_date: Optional[str] = None
+        self._rejections: List[int] = [0] * max(_GROW_STEP, len(_REASON_NAMES))
+        self._reported: List[int] = [0] * len(self._rejections)
+        self._calc_failures: Dict[str, int] = {}
+        self._failed_codes: Set[str] = set()
+        self._scan_cycles = 0
+        self._candidates = 0
+        self._signals = 0
+        self._active_cycle: Optional[FunnelCycle] = None
+        self._history: Dict[str, Dict] = {}
+
+    # ── 전략 hot path ──────────────────────────────────────────────
+
+    def reject(self, reason: Reason) -> bool:
+        """거절 1건을 센다. 이 후보를 로그로 남겨야 하면 True (샘플링 정책)."""
+        reason_id = reason if type(reason) is int else intern_reason(reason)
+        counts = self._rejections
+        if reason_id >= len(counts):
+            grow = reason_id + _GROW_STEP - len(counts)
+            counts.extend([0] * grow)
+            self._reported.extend([0] * grow)
+        counts[reason_id] += 1
+        every = self.log_sample_every
+        if every == 1:
+            return True
+        if every <= 0:
+            return False
+        return counts[reason_id] % every == 1
+
+    def calc_failure(self, event: str, code: str) -> None:
+        """종목 단위 계산 실패 1건을 센다 (실패율 분모와 맞추기 위해 code 없는 실패는 무시)."""
+        if not event or not code:
+            return
+        self._calc_failures[event] = self._calc_failures.get(event, 0) + 1
+        self._failed_codes.add(code)
+        if self._active_cycle is not None:
+            self._active_cycle.failed_codes.add(code)
+
+    # ── 스케줄러 cycle 경계 ────────────────────────────────────────
+
+    def begin_cycle(self, trading_date: str, kind: str = "scan") -> FunnelCycle:
+        if trading_date != self._trading_date:
+            self._roll_day(trading_date)
+        cycle = FunnelCycle(kind, trading_date, list(self._rejections), dict(self._calc_failures))
+        self._active_cycle = cycle
+        return cycle
+
+    def end_cycle(self, cycle: FunnelCycle, *, candidate_count: int = 0, signal_count: int = 0) -> FunnelCycleStats:
+        if self._active_cycle is cycle:
+            self._active_cycle = None
+        if cycle.trading_date != self._trading_date:
+            # cycle 도중 거래일이 바뀌었다 — 기준점이 없으므로 빈 통계로 돌려준다
+            return FunnelCycleStats(kind=cycle.kind, candidate_count=candidate_count, signal_count=signal_count)
+        if cycle.kind == "scan":
+            self._scan_cycles += 1
+            self._candidates += candidate_count
+            self._signals += signal_count
+        base = cycle.rejection_base
+        rejected = {
+            _REASON_NAMES[i]: count - (base[i] if i < len(base) else 0)
+            for i, count in enumerate(self._rejections)
+            if count and count != (base[i] if i < len(base) else 0)
+        }
+        failures = {
+            event: count - cycle.failure_base.get(event, 0)
+            for event, count in self._calc_failures.items()
+            if count != cycle.failure_base.get(event, 0)
+        }
+        return FunnelCycleStats(
+            kind=cycle.kind,
+            candidate_count=candidate_count,
+            signal_count=signal_count,
+            rejected_reasons=rejected,
+            calc_failures=failures,
+            calc_failure_code_count=len(cycle.failed_codes),
+        )
+
+    def abort_cycle(self, cycle: FunnelCycle) -> None:
+        """scan 예외 등으로 끝나지 못한 cycle 을 닫는다. 이미 센 거절은 일 누적에 남는다."""
+        if self._active_cycle is cycle:
+            self._active_cycle = None
+
+    def take_unreported_rejections(self) -> Dict[str, int]:
+        """지난 호출 이후 늘어난 거절 수 (일별 분포 서비스로 넘기는 용도)."""
+        delta = {}
+        reported = self._reported
+        for i, count in enumerate(self._rejections):
+            if count != reported[i]:
+                delta[_REASON_NAMES[i]] = count - reported[i]
+                reported[i] = count
+        return delta
+
+    # ── 일 누적 ────────────────────────────────────────────────────
+
+    @property
+    def trading_date(self) -> Optional[str]:
+        return self._trading_date
+
+    def daily_summary(self, trading_date: Optional[str] = None) -> Dict:
+        """거래일 누적 깔때기. 지난 거래일은 최근 7일까지 보관한다."""
+        if trading_date is not None and trading_date != self._trading_date:
+            return dict(self._history.get(trading_date) or {})
+        rejected = {_REASON_NAMES[i]: count for i, count in enumerate(self._rejections) if count}
+        return {
+            "strategy_name": self.strategy_name,
+            "trading_date": self._trading_date,
+            "scan_cycles": self._scan_cycles,
+            "candidates": self._candidates,
+            "signals": self._signals,
+            "rejected_total": sum(rejected.values()),
+            "rejected_reasons": rejected,
+            "calc_failure_count": sum(self._calc_failures.values()),
+            "calc_failures": dict(self._calc_failures),
+            "calc_failure_code_count": len(self._failed_codes),
+        }
+
+    def _roll_day(self, trading_date: str) -> None:
+        if self._trading_date is None:
+            # 첫 cycle 전(기동 직후 이벤트 평가 등)에 센 거절은 첫 거래일에 포함한다
+            self._trading_date = trading_date
+            return
+        self._history[self._trading_date] = self.daily_summary()
+        for stale in sorted(self._history)[:-_HISTORY_DAYS]:
+            del self._history[stale]
+        self._trading_date = trading_date
+        self._rejections = [0] * len(self._rejections)
+        self._reported = [0] * len(self._rejections)
+        self._calc_failures = {}
+        self._failed_codes = set()
+        self._scan_cycles = self._candidates = self._signals = 0
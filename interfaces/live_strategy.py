@@ -2,6 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from common.types import TradeSignal
+from core.scan_funnel import ScanFunnel
 
 
 class LiveStrategy(ABC):
@@ -90,6 +91,16 @@ class LiveStrategy(ABC):
         """
         return []
 
+    def backtest_prescreen(self):
+        """기간 백테스트용 벡터화 후보 필요조건 (services.backtest_candidate_prescreen).
+
+        CandidatePrescreen 을 돌려주면 BacktestPeriodRunner 가 (거래일 × 종목) 일봉 패널로
+        후보 마스크를 미리 계산하고, 마스크에 남은 종목만 scan() 에 넘긴다. 조건은 반드시
+        '만족하지 않으면 scan() 이 BUY 를 낼 수 없는' 필요조건이어야 한다. 기본 구현은
+        None (= 프리스크린 미지원, 매일 watchlist 전체 scan).
+        """
+        return None
+
     async def load_state(self) -> None:
         """전략 state 명시 로드 hook.
 
@@ -152,3 +163,12 @@ class LiveStrategy(ABC):
     def strategy_logger(self) -> Optional[object]:
         """전략 자체 logger (스케줄러가 메트릭 counter 를 일시 attach 하는 용도). 없으면 None."""
         return getattr(self, "_logger", None)
+
+    @property
+    def funnel(self) -> ScanFunnel:
+        """scan 깔때기 카운터 (거절 사유·계산 실패). 전략이 직접 호출하고 스케줄러가 cycle 경계를 긋는다."""
+        funnel = getattr(self, "_scan_funnel", None)
+        if funnel is None:
+            funnel = ScanFunnel(self.name)
+            self._scan_funnel = funnel
+        return funnel
@@ -165,6 +165,15 @@ class _LFUCache:
             if key in self._freq:
                 del self._freq[key]
 
+    def __contains__(self, key) -> bool:
+        return key in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def keys(self) -> list:
+        return list(self._cache)
+
     def clear(self):
         self._cache.clear()
         self._freq.clear()
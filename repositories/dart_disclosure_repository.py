@@ -1,11 +1,17 @@
-"""OpenDART 공시 감지·발송 상태 SQLite 저장소."""
+"""OpenDART 공시 감지·발송 상태 SQLite 저장소.
+
+연결은 인스턴스당 하나를 열어 두고 재사용한다 (폴링마다 공시 건수만큼 connect/PRAGMA/DDL 을
+반복하지 않도록). 모든 조회·갱신은 같은 연결에서 asyncio.Lock 으로 직렬화되며, 종료 시 close() 로 닫는다.
+"""
 from __future__ import annotations
 
+import asyncio
 import json
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Union
+from typing import AsyncIterator, Iterable, Optional, Union
 
 import aiosqlite
 
@@ -32,7 +38,8 @@ CREATE TABLE IF NOT EXISTS disclosures (
     alert_suppressed INTEGER NOT NULL DEFAULT 0,
     immediate_sent_at TEXT,
     digest_sent_at TEXT,
-    send_retry_count INTEGER NOT NULL DEFAULT 0
+    send_retry_count INTEGER NOT NULL DEFAULT 0,
+    analysis_pending INTEGER NOT NULL DEFAULT 0
 )
 """
 
@@ -43,6 +50,8 @@ CREATE TABLE IF NOT EXISTS monitor_state (
 )
 """
 
+_RECEIPT_CURSOR_PREFIX = "receipt_cursor:"
+
 
 @dataclass(frozen=True)
 class StoredDisclosure:
@@ -58,6 +67,30 @@ class DartDisclosureRepository:
     def __init__(self, db_path: Union[str, Path, None] = None) -> None:
         self._db_path = Path(db_path or self.DB_PATH)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._conn is None:
+                conn = await aiosqlite.connect(self._db_path)
+                try:
+                    conn.row_factory = aiosqlite.Row
+                    await self._setup(conn)
+                except BaseException:
+                    await conn.close()
+                    raise
+                self._conn = conn
+            yield self._conn
+
+    async def close(self) -> None:
+        """열어 둔 연결을 닫는다. 이후 호출은 새 연결을 다시 연다."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
 
     async def _setup(self, conn: aiosqlite.Connection) -> None:
         await conn.execute("PRAGMA journal_mode=WAL")
@@ -72,6 +105,10 @@ class DartDisclosureRepository:
             await conn.execute(
                 "ALTER TABLE disclosures ADD COLUMN ai_summary TEXT NOT NULL DEFAULT ''"
             )
+        if "analysis_pending" not in columns:
+            await conn.execute(
+                "ALTER TABLE disclosures ADD COLUMN analysis_pending INTEGER NOT NULL DEFAULT 0"
+            )
         await conn.execute(_DDL_STATE)
         await conn.commit()
 
@@ -83,18 +120,18 @@ class DartDisclosureRepository:
         suppress_immediate: bool = False,
         event_key: str = "",
         summary: str = "",
+        analysis_pending: bool = False,
     ) -> bool:
         detected_at = datetime.now().isoformat()
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             cur = await conn.execute(
                 """
                 INSERT OR IGNORE INTO disclosures(
                     rcept_no, corp_code, stock_code, corp_name, report_name,
                     filer_name, receipt_date, remarks, importance_score,
                     importance_level, importance_reasons, event_key, ai_summary,
-                    detected_at, alert_suppressed
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    detected_at, alert_suppressed, analysis_pending
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     disclosure.receipt_no,
@@ -112,26 +149,111 @@ class DartDisclosureRepository:
                     str(summary or "").strip()[:1000],
                     detected_at,
                     int(suppress_immediate),
+                    int(analysis_pending),
                 ),
             )
             await conn.commit()
             return cur.rowcount > 0
 
+    async def get_pending_analysis(self, *, limit: int = 50) -> list[StoredDisclosure]:
+        """본문 AI 분석을 아직 마치지 않은 공시 (재기동 전에 남은 건 포함)."""
+        return await self._query_stored(
+            """
+            SELECT * FROM disclosures
+            WHERE analysis_pending = 1
+            ORDER BY importance_score DESC, rcept_no ASC
+            LIMIT ?
+            """,
+            (max(1, int(limit)),),
+        )
+
+    async def save_analysis(
+        self,
+        receipt_no: str,
+        importance: Optional[DisclosureImportance] = None,
+        *,
+        event_key: str = "",
+        summary: str = "",
+    ) -> bool:
+        """AI 분석 결과를 반영하고 분석 대기를 해제한다.
+
+        importance 가 None 이면(분석 실패·마감 초과) 규칙 판정을 그대로 두고 대기만 푼다.
+        반환값은 이 공시의 즉시 알림이 이미 나갔는지 여부 — True 면 보강 메시지를 따로 보내야 한다.
+        """
+        async with self._connection() as conn:
+            if importance is None:
+                await conn.execute(
+                    "UPDATE disclosures SET analysis_pending = 0 WHERE rcept_no = ?",
+                    (receipt_no,),
+                )
+            else:
+                await conn.execute(
+                    """
+                    UPDATE disclosures
+                    SET importance_score = ?, importance_level = ?, importance_reasons = ?,
+                        event_key = ?, ai_summary = ?, analysis_pending = 0
+                    WHERE rcept_no = ?
+                    """,
+                    (
+                        importance.score,
+                        importance.level,
+                        json.dumps(importance.reasons, ensure_ascii=False),
+                        str(event_key or "")[:300],
+                        str(summary or "").strip()[:1000],
+                        receipt_no,
+                    ),
+                )
+            await conn.commit()
+            async with conn.execute(
+                "SELECT immediate_sent_at FROM disclosures WHERE rcept_no = ?",
+                (receipt_no,),
+            ) as cur:
+                row = await cur.fetchone()
+        return bool(row and row[0])
+
     async def has_receipt(self, receipt_no: str) -> bool:
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             async with conn.execute(
                 "SELECT 1 FROM disclosures WHERE rcept_no = ? LIMIT 1", (receipt_no,)
             ) as cur:
                 return await cur.fetchone() is not None
 
+    async def get_receipt_cursor(self, receipt_date: str) -> str:
+        """해당 접수일에 이미 훑은 가장 큰 접수번호. 없으면 빈 문자열."""
+        async with self._connection() as conn:
+            async with conn.execute(
+                "SELECT value FROM monitor_state WHERE key = ?",
+                (_RECEIPT_CURSOR_PREFIX + str(receipt_date),),
+            ) as cur:
+                row = await cur.fetchone()
+        return str(row[0]) if row else ""
+
+    async def advance_receipt_cursor(self, receipt_date: str, receipt_no: str) -> None:
+        """접수일 커서를 receipt_no 까지 올린다 (뒤로 가지 않음). 지난 날짜 커서는 지운다."""
+        if not receipt_no:
+            return
+        key = _RECEIPT_CURSOR_PREFIX + str(receipt_date)
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                INSERT INTO monitor_state(key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                WHERE excluded.value > monitor_state.value
+                """,
+                (key, str(receipt_no)),
+            )
+            await conn.execute(
+                "DELETE FROM monitor_state WHERE key LIKE ? AND key < ?",
+                (_RECEIPT_CURSOR_PREFIX + "%", key),
+            )
+            await conn.commit()
+
     async def get_known_receipt_nos(self, receipt_nos: Iterable[str]) -> set[str]:
         receipt_nos = list(dict.fromkeys(str(value) for value in receipt_nos if value))
         if not receipt_nos:
             return set()
         placeholders = ",".join("?" for _ in receipt_nos)
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             async with conn.execute(
                 f"SELECT rcept_no FROM disclosures WHERE rcept_no IN ({placeholders})",
                 tuple(receipt_nos),
@@ -166,8 +288,7 @@ class DartDisclosureRepository:
         await self._update_timestamp("immediate_sent_at", [receipt_no], sent_at)
 
     async def increment_send_retry(self, receipt_no: str) -> None:
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             await conn.execute(
                 "UPDATE disclosures SET send_retry_count = send_retry_count + 1 WHERE rcept_no = ?",
                 (receipt_no,),
@@ -190,8 +311,7 @@ class DartDisclosureRepository:
         await self._update_timestamp("digest_sent_at", list(receipt_nos), sent_at)
 
     async def is_initialized(self) -> bool:
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             async with conn.execute(
                 "SELECT value FROM monitor_state WHERE key = 'initialized'"
             ) as cur:
@@ -199,17 +319,14 @@ class DartDisclosureRepository:
         return bool(row and row[0] == "1")
 
     async def mark_initialized(self) -> None:
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             await conn.execute(
                 "INSERT OR REPLACE INTO monitor_state(key, value) VALUES ('initialized', '1')"
             )
             await conn.commit()
 
     async def _query_stored(self, sql: str, params: tuple) -> list[StoredDisclosure]:
-        async with aiosqlite.connect(self._db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            await self._setup(conn)
+        async with self._connection() as conn:
             async with conn.execute(sql, params) as cur:
                 rows = await cur.fetchall()
         return [self._from_row(row) for row in rows]
@@ -220,8 +337,7 @@ class DartDisclosureRepository:
         if not receipt_nos:
             return
         placeholders = ",".join("?" for _ in receipt_nos)
-        async with aiosqlite.connect(self._db_path) as conn:
-            await self._setup(conn)
+        async with self._connection() as conn:
             await conn.execute(
                 f"UPDATE disclosures SET {column} = ? WHERE rcept_no IN ({placeholders})",
                 (sent_at.isoformat(), *receipt_nos),
@@ -1,16 +1,17 @@
-"""체결강도 장중 시계열 SQLite 저장소."""
+"""체결강도 장중 시계열 저장소 (일자별 append-only 컬럼형 세그먼트)."""
 from __future__ import annotations
 
 import logging
-import os
 import sqlite3
 import threading
 import time
 from typing import Optional
 
+from repositories.tick_segment_store import EXECUTION_STRENGTH_STREAM, TickSegmentStore
+
 
 class ExecutionStrengthRepository:
-    """WS 체결 틱(H0STCNT0)의 체결강도를 종목당 샘플링해 SQLite에 축적한다.
+    """WS 체결 틱(H0STCNT0)의 체결강도를 종목당 샘플링해 `TickSegmentStore` 에 축적한다.
 
     todo 1-5: 체결강도는 EOD REST 스칼라 1개/종목만 확보 가능해 "체결강도 ≥120%"
     장중 게이트의 리플레이가 불가능했다 — 기존 PRICE 틱에 포함된 체결강도를
@@ -23,6 +24,8 @@ class ExecutionStrengthRepository:
       - 백그라운드 태스크/스레드 없음 — 틱 경로에서 버퍼 flush를 amortize한다.
         프로세스 종료 시 마지막 flush 이후 버퍼(샘플링 주기상 종목당 최대 1행
         수준)는 유실될 수 있다.
+      - 당일 샘플은 {base_dir}/{YYYYMMDD}/execution_strength.log 에 append 하고,
+        지난 일자 log 는 기동·일자 전환·종료 시 종목별 블록 seg 로 봉인한다.
     """
 
     DEFAULT_BASE_DIR = "data/execution_strength"
@@ -30,6 +33,11 @@ class ExecutionStrengthRepository:
     FLUSH_INTERVAL_SEC = 30.0
     FLUSH_BUFFER_SIZE = 20
     RETENTION_DAYS = 30
+    LEGACY_DB_FILENAME = "execution_strength.db"  # 세그먼트 전환 전 SQLite 저장 파일 — 기동 시 seg 로 옮긴 뒤 삭제
+    LEGACY_QUERY = (
+        "SELECT trade_date, code, CAST(trade_time AS INTEGER), strength, created_at"
+        " FROM es_history WHERE trade_date >= ? ORDER BY trade_date, id"
+    )
 
     def __init__(
         self,
@@ -40,47 +48,41 @@ class ExecutionStrengthRepository:
     ):
         self._logger = logger or logging.getLogger(__name__)
         self._base_dir = base_dir
-        self._db_path = os.path.join(base_dir, "execution_strength.db")
         self._sample_interval_sec = (
             sample_interval_sec if sample_interval_sec is not None else self.SAMPLE_INTERVAL_SEC
         )
         self._retention_days = retention_days if retention_days is not None else self.RETENTION_DAYS
 
-        self._conn: Optional[sqlite3.Connection] = None
+        self._store: Optional[TickSegmentStore] = None
+        self._active_date: Optional[str] = None
         self._buffer: list = []
         self._buffer_lock = threading.Lock()
         self._last_sampled: dict[str, float] = {}
         self._last_flush = time.time()
 
-        os.makedirs(self._base_dir, exist_ok=True)
-        self._init_db()
+        self._init_store()
 
-    def _init_db(self) -> None:
+    def _init_store(self) -> None:
+        try:
+            self._store = TickSegmentStore(self._base_dir, EXECUTION_STRENGTH_STREAM, self._logger)
+            today = time.strftime("%Y%m%d")
+            cutoff = time.strftime("%Y%m%d", time.localtime(time.time() - self._retention_days * 86400))
+            self._store.prune_before(cutoff)
+            self._migrate_legacy_db(cutoff)
+            self._store.seal_before(today)
+        except (OSError, ValueError) as exc:
+            self._logger.error(f"ExecutionStrengthRepository 저장소 초기화 실패: {exc}")
+            self._store = None
+
+    def _migrate_legacy_db(self, cutoff: str) -> None:
+        """이전 SQLite 저장 파일의 보관 기간 내 행을 일자 seg 로 옮긴다. 실패하면 파일을 남긴다."""
         try:
-            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
-            with self._conn:
-                self._conn.execute("PRAGMA journal_mode=WAL")
-                self._conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS es_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        code TEXT NOT NULL,
-                        trade_date TEXT NOT NULL,
-                        trade_time TEXT NOT NULL,
-                        strength REAL NOT NULL,
-                        created_at REAL NOT NULL
-                    )
-                    """
-                )
-                self._conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_es_history_code_date"
-                    " ON es_history(code, trade_date)"
-                )
-                cutoff = time.time() - self._retention_days * 86400
-                self._conn.execute("DELETE FROM es_history WHERE created_at < ?", (cutoff,))
-        except sqlite3.Error as exc:
-            self._logger.error(f"ExecutionStrengthRepository DB 초기화 실패: {exc}")
-            self._conn = None
+            migrated = self._store.migrate_legacy_sqlite(self.LEGACY_DB_FILENAME, self.LEGACY_QUERY, cutoff)
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            self._logger.error(f"ExecutionStrengthRepository 이전 SQLite 저장 파일 변환 실패 (파일 유지): {exc}")
+            return
+        if migrated is not None:
+            self._logger.info(f"ExecutionStrengthRepository 이전 SQLite 저장 파일 변환 완료: {migrated}행 → seg, {self.LEGACY_DB_FILENAME} 삭제")
 
     def record_tick(
         self,
@@ -94,7 +96,7 @@ class ExecutionStrengthRepository:
 
         종목당 SAMPLE_INTERVAL_SEC 이내 중복 틱과 파싱 불가 값은 조용히 skip한다.
         """
-        if self._conn is None or not code:
+        if self._store is None or not code:
             return False
         strength = self._parse_float(strength_raw)
         if strength is None:
@@ -112,7 +114,7 @@ class ExecutionStrengthRepository:
         )
         self._last_sampled[code] = now
         with self._buffer_lock:
-            self._buffer.append((code, trade_date, trade_time, strength, now))
+            self._buffer.append((trade_date, code, int(trade_time), strength, now))
             should_flush = (
                 len(self._buffer) >= self.FLUSH_BUFFER_SIZE
                 or (now - self._last_flush) >= self.FLUSH_INTERVAL_SEC
@@ -122,8 +124,8 @@ class ExecutionStrengthRepository:
         return True
 
     def flush(self) -> None:
-        """버퍼를 DB에 일괄 저장한다."""
-        if self._conn is None:
+        """버퍼를 일자별 log 에 일괄 append 한다. 일자가 바뀌었으면 지난 log 를 봉인한다."""
+        if self._store is None:
             return
         with self._buffer_lock:
             batch = self._buffer
@@ -131,21 +133,30 @@ class ExecutionStrengthRepository:
             self._last_flush = time.time()
         if not batch:
             return
+        by_date: dict[str, list] = {}
+        for trade_date, *row in batch:
+            by_date.setdefault(trade_date, []).append(tuple(row))
         try:
-            with self._conn:
-                self._conn.executemany(
-                    "INSERT INTO es_history (code, trade_date, trade_time, strength, created_at)"
-                    " VALUES (?, ?, ?, ?, ?)",
-                    batch,
-                )
-        except sqlite3.Error as exc:
+            for trade_date, rows in by_date.items():
+                self._store.append(trade_date, rows)
+            latest = max(by_date)
+            if self._active_date is not None and latest > self._active_date:
+                self._store.seal_before(latest)
+            self._active_date = max(latest, self._active_date or latest)
+        except (OSError, ValueError) as exc:
             self._logger.error(f"ExecutionStrengthRepository flush 실패: {exc}")
 
     def close(self) -> None:
+        """남은 버퍼를 쓰고 당일 log 까지 봉인한다."""
         self.flush()
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        if self._store is not None:
+            try:
+                for day in self._store.days():
+                    self._store.seal(day)
+            except (OSError, ValueError) as exc:
+                self._logger.error(f"ExecutionStrengthRepository 봉인 실패: {exc}")
+            self._store.close()
+            self._store = None
 
     @staticmethod
     def _parse_float(value) -> Optional[float]:
@@ -0,0 +1,179 @@
+# repositories/latest_price_table.py
+"""
+종목별 최신가 공유 테이블 (사전 할당 슬롯 + 불변 스냅샷 교체).
+
+PriceStreamService._latest_prices 는 틱마다 13개 키 dict 를 새로 만들어 갈아 끼웠고,
+StockQueryService·DataQualityService·VirtualTradeView·웹 라우트는 그 dict 에서 문자열을 꺼내
+다시 float 로 파싱했다. StockPriceRepository 는 틱만 받은 종목까지 LRU 에 별도 dict 로 들고 있었다.
+
+이 테이블은 종목마다 슬롯 하나를 배정하고, 틱이 오면 가격·거래량·거래대금·최우선 호가·
+수신 시각을 이미 파싱된 값으로 담은 PriceQuote 를 그 슬롯에 통째로 대입한다.
+  - writer: 슬롯 seq 를 올린 PriceQuote 를 만들어 rows[slot] 에 한 번 대입 (단일 writer = 이벤트 루프)
+  - reader: rows[slot] 한 번 읽기 → 여러 필드가 항상 같은 틱의 값. 읽을 때 dict 생성·파싱 없음
+CPython 에서 리스트 원소 대입은 원자적이라 to_thread 워커 reader 도 반쯤 쓰인 값을 보지 않는다.
+바이트 버퍼에 필드를 덮어쓰고 홀짝 seq 를 재확인하는 seqlock 방식도 측정했으나 언팩·재조립
+비용 때문에 읽기가 dict 보다 느렸다 (tests/unit_test/repositories/test_latest_price_table_benchmark.py).
+seq 는 종목별 갱신 횟수라 reader 가 "지난번 본 뒤로 바뀌었는지" 를 값 비교 없이 판단할 수 있다.
+"""
+from __future__ import annotations
+
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+DEFAULT_CAPACITY = 3000  # KOSPI+KOSDAQ 전종목(~2300) + 여유분
+
+
+class PriceQuote(NamedTuple):
+    """테이블 한 슬롯의 불변 스냅샷. 수치 필드는 이미 float/int 로 파싱돼 있다."""
+
+    code: str
+    seq: int  # 해당 종목 누적 갱신 횟수 (같은 값이면 같은 스냅샷)
+    price: float
+    change: float
+    rate: float
+    acml_vol: int
+    acml_tr_pbmn: int
+    high: Optional[float]
+    low: Optional[float]
+    open: Optional[float]
+    bid: Optional[float]
+    ask: Optional[float]
+    received_at: float
+    latency_sec: float
+    sign: str
+    quality_status: str
+    quality_reason: str
+
+    def to_legacy_dict(self) -> dict:
+        """기존 PriceStreamService._latest_prices dict 포맷(가격·등락 문자열)으로 변환."""
+        return {
+            "price": _num_str(self.price),
+            "change": _num_str(self.change),
+            "rate": f"{self.rate:.2f}",
+            "sign": self.sign,
+            "acml_vol": self.acml_vol,
+            "acml_tr_pbmn": self.acml_tr_pbmn,
+            "high": self.high,
+            "low": self.low,
+            "open": self.open,
+            "received_at": self.received_at,
+            "latency_sec": self.latency_sec,
+            "quality_status": self.quality_status,
+            "quality_reason": self.quality_reason,
+        }
+
+
+def _num_str(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+_new_quote = tuple.__new__  # NamedTuple 생성자(__new__ 키워드 처리)를 건너뛰는 빠른 경로
+
+
+class LatestPriceTable:
+    """종목코드 → 고정 슬롯 최신가 테이블. 슬롯이 모자라면 두 배로 늘린다."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        capacity = max(1, int(capacity))
+        self._rows: List[Optional[PriceQuote]] = [None] * capacity
+        self._seqs: List[int] = [0] * capacity  # 슬롯 반납·재사용 후에도 seq 가 되돌아가지 않게 따로 둔다
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+        self._next_slot = 0
+        self._writes = 0
+        self._grows = 0
+
+    def write(
+        self,
+        code: str,
+        price: float,
+        *,
+        change: float = 0.0,
+        rate: float = 0.0,
+        sign: str = "3",
+        acml_vol: int = 0,
+        acml_tr_pbmn: int = 0,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        open: Optional[float] = None,
+        bid: Optional[float] = None,
+        ask: Optional[float] = None,
+        received_at: Optional[float] = None,
+        latency_sec: float = 0.0,
+        quality_status: str = "ok",
+        quality_reason: str = "websocket",
+    ) -> int:
+        """종목 슬롯의 스냅샷을 교체하고 새 seq 를 반환한다."""
+        slot = self._slots.get(code)
+        if slot is None:
+            slot = self._allocate(code)
+        seq = self._seqs[slot] + 1
+        self._seqs[slot] = seq
+        self._rows[slot] = _new_quote(PriceQuote, (
+            code, seq, price, change, rate, acml_vol, acml_tr_pbmn, high, low, open, bid, ask,
+            time.time() if received_at is None else received_at,
+            latency_sec, sign, quality_status, quality_reason,
+        ))
+        self._writes += 1
+        return seq
+
+    def read(self, code: str) -> Optional[PriceQuote]:
+        """종목의 최신가 스냅샷. 없으면 None."""
+        slot = self._slots.get(code)
+        if slot is None:
+            return None
+        quote = self._rows[slot]
+        # 슬롯을 찾은 직후 반납·재배정됐으면 다른 종목 스냅샷일 수 있다
+        if quote is None or quote.code != code:
+            return None
+        return quote
+
+    def seq(self, code: str) -> int:
+        """종목의 현재 seq (없으면 0). 마지막으로 본 seq 와 같으면 그 사이 갱신이 없었다."""
+        quote = self.read(code)
+        return 0 if quote is None else quote.seq
+
+    def remove(self, code: str) -> bool:
+        """종목 슬롯을 반납한다. 반납된 슬롯은 다음 신규 종목이 재사용한다."""
+        slot = self._slots.pop(code, None)
+        if slot is None:
+            return False
+        self._rows[slot] = None
+        self._free_slots.append(slot)
+        return True
+
+    def clear(self) -> None:
+        for code in list(self._slots):
+            self.remove(code)
+
+    def _allocate(self, code: str) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self._next_slot >= len(self._rows):
+                # 리스트를 제자리에서 늘려 reader 가 들고 있는 슬롯 번호가 그대로 유효하다
+                grow_by = len(self._rows)
+                self._rows.extend([None] * grow_by)
+                self._seqs.extend([0] * grow_by)
+                self._grows += 1
+            slot = self._next_slot
+            self._next_slot += 1
+        self._slots[code] = slot
+        return slot
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def codes(self) -> List[str]:
+        return list(self._slots)
+
+    def get_stats(self) -> dict:
+        return {
+            "capacity": len(self._rows),
+            "rows": len(self._slots),
+            "writes": self._writes,
+            "grows": self._grows,
+        }
@@ -0,0 +1,76 @@
+# repositories/market_calendar_repository.py
+"""
+국내 휴장일 달력 로컬 저장소 (JSON).
+
+MarketCalendarService 가 chk-holiday API 로 동기화한 월별 개장 여부를 파일에 남겨 두고,
+재기동 시 읽어 같은 달의 API 재호출을 생략한다.
+
+파일 형식:
+  {"version": 1, "months": {"202601": {"20260102": true, "20260103": false, ...}}}
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Optional
+
+DEFAULT_CALENDAR_PATH = os.path.join("data", "market_calendar", "krx_business_days.json")
+
+
+class MarketCalendarRepository:
+    """월(YYYYMM) → {날짜(YYYYMMDD): 개장 여부} 맵을 JSON 파일로 보관한다."""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str = DEFAULT_CALENDAR_PATH, logger: Optional[logging.Logger] = None) -> None:
+        self._path = path
+        self._logger = logger or logging.getLogger(__name__)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load_months(self) -> Dict[str, Dict[str, bool]]:
+        """저장된 월별 달력을 읽는다. 파일이 없거나 손상·버전 불일치면 빈 dict."""
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            self._logger.warning(f"[MarketCalendarRepository] 달력 파일 로드 실패: {exc}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.FORMAT_VERSION:
+            self._logger.warning(f"[MarketCalendarRepository] 달력 파일 버전 불일치 → 무시: {self._path}")
+            return {}
+        months = data.get("months") or {}
+        return {
+            str(month): {str(day): bool(is_open) for day, is_open in days.items()}
+            for month, days in months.items()
+            if isinstance(days, dict)
+        }
+
+    def save_month(self, month: str, days: Dict[str, bool]) -> None:
+        """한 달치 개장 여부를 병합 저장한다 (tempfile → os.replace 원자 교체)."""
+        months = self.load_months()
+        merged = dict(months.get(month) or {})
+        merged.update({str(day): bool(is_open) for day, is_open in days.items()})
+        months[month] = dict(sorted(merged.items()))
+        payload = {"version": self.FORMAT_VERSION, "months": dict(sorted(months.items()))}
+
+        dirname = os.path.dirname(self._path) or "."
+        try:
+            os.makedirs(dirname, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".calendar-", suffix=".tmp", dir=dirname)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except Exception as exc:
+            self._logger.warning(f"[MarketCalendarRepository] 달력 파일 저장 실패: {exc}")
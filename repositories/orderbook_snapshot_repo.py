@@ -1,19 +1,22 @@
-"""체결 틱에 포함된 최우선 호가·잔량 장중 시계열 SQLite 저장소."""
+"""체결 틱에 포함된 최우선 호가·잔량 장중 시계열 저장소 (일자별 append-only 컬럼형 세그먼트)."""
 from __future__ import annotations
 
 import logging
-import os
 import sqlite3
 import threading
 import time
 from typing import Any, Optional
 
+from repositories.tick_segment_store import TOP_OF_BOOK_STREAM, TickSegmentStore
+
 
 class OrderbookSnapshotRepository:
     """H0STCNT0/H0UNCNT0 체결 틱의 top-of-book을 종목당 샘플링한다.
 
     별도 H0STASP0 구독 없이 기존 PRICE 틱의 최우선 매도·매수호가와 잔량을
     저장한다. 따라서 WebSocket 슬롯을 추가로 소비하지 않는다.
+    당일 샘플은 {base_dir}/{YYYYMMDD}/top_of_book.log 에 append 하고, 지난 일자 log 는
+    기동·일자 전환·종료 시 종목별 블록 seg 로 봉인한다 (`TickSegmentStore`).
     """
 
     DEFAULT_BASE_DIR = "data/orderbook_snapshots"
@@ -21,6 +24,13 @@ class OrderbookSnapshotRepository:
     FLUSH_INTERVAL_SEC = 30.0
     FLUSH_BUFFER_SIZE = 20
     RETENTION_DAYS = 30
+    LEGACY_DB_FILENAME = "orderbook_snapshots.db"  # 세그먼트 전환 전 SQLite 저장 파일 — 기동 시 seg 로 옮긴 뒤 삭제
+    LEGACY_QUERY = (
+        "SELECT trade_date, code, CAST(trade_time AS INTEGER), ask_price, bid_price,"
+        " COALESCE(ask_qty, -1), COALESCE(bid_qty, -1),"
+        " COALESCE(total_ask_qty, -1), COALESCE(total_bid_qty, -1), created_at"
+        " FROM top_of_book_history WHERE trade_date >= ? ORDER BY trade_date, id"
+    )
 
     def __init__(
         self,
@@ -31,7 +41,6 @@ class OrderbookSnapshotRepository:
     ) -> None:
         self._logger = logger or logging.getLogger(__name__)
         self._base_dir = base_dir
-        self._db_path = os.path.join(base_dir, "orderbook_snapshots.db")
         self._sample_interval_sec = (
             sample_interval_sec
             if sample_interval_sec is not None
@@ -40,48 +49,38 @@ class OrderbookSnapshotRepository:
         self._retention_days = (
             retention_days if retention_days is not None else self.RETENTION_DAYS
         )
-        self._conn: Optional[sqlite3.Connection] = None
+        self._store: Optional[TickSegmentStore] = None
+        self._active_date: Optional[str] = None
         self._buffer: list[tuple] = []
         self._buffer_lock = threading.Lock()
         self._last_sampled: dict[str, float] = {}
         self._last_flush = time.time()
 
-        os.makedirs(self._base_dir, exist_ok=True)
-        self._init_db()
+        self._init_store()
+
+    def _init_store(self) -> None:
+        try:
+            self._store = TickSegmentStore(self._base_dir, TOP_OF_BOOK_STREAM, self._logger)
+            today = time.strftime("%Y%m%d")
+            cutoff = time.strftime(
+                "%Y%m%d", time.localtime(time.time() - self._retention_days * 86400)
+            )
+            self._store.prune_before(cutoff)
+            self._migrate_legacy_db(cutoff)
+            self._store.seal_before(today)
+        except (OSError, ValueError) as exc:
+            self._logger.error(f"OrderbookSnapshotRepository 저장소 초기화 실패: {exc}")
+            self._store = None
 
-    def _init_db(self) -> None:
+    def _migrate_legacy_db(self, cutoff: str) -> None:
+        """이전 SQLite 저장 파일의 보관 기간 내 행을 일자 seg 로 옮긴다. 실패하면 파일을 남긴다."""
         try:
-            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
-            with self._conn:
-                self._conn.execute("PRAGMA journal_mode=WAL")
-                self._conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS top_of_book_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        code TEXT NOT NULL,
-                        trade_date TEXT NOT NULL,
-                        trade_time TEXT NOT NULL,
-                        ask_price INTEGER NOT NULL,
-                        bid_price INTEGER NOT NULL,
-                        ask_qty INTEGER,
-                        bid_qty INTEGER,
-                        total_ask_qty INTEGER,
-                        total_bid_qty INTEGER,
-                        created_at REAL NOT NULL
-                    )
-                    """
-                )
-                self._conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_top_of_book_code_date "
-                    "ON top_of_book_history(code, trade_date)"
-                )
-                cutoff = time.time() - self._retention_days * 86400
-                self._conn.execute(
-                    "DELETE FROM top_of_book_history WHERE created_at < ?", (cutoff,)
-                )
-        except sqlite3.Error as exc:
-            self._logger.error(f"OrderbookSnapshotRepository DB 초기화 실패: {exc}")
-            self._conn = None
+            migrated = self._store.migrate_legacy_sqlite(self.LEGACY_DB_FILENAME, self.LEGACY_QUERY, cutoff)
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            self._logger.error(f"OrderbookSnapshotRepository 이전 SQLite 저장 파일 변환 실패 (파일 유지): {exc}")
+            return
+        if migrated is not None:
+            self._logger.info(f"OrderbookSnapshotRepository 이전 SQLite 저장 파일 변환 완료: {migrated}행 → seg, {self.LEGACY_DB_FILENAME} 삭제")
 
     def record_tick(
         self,
@@ -91,7 +90,7 @@ class OrderbookSnapshotRepository:
         now: Optional[float] = None,
     ) -> bool:
         """유효한 최우선 호가 스냅샷을 샘플링 버퍼에 채택하면 True."""
-        if self._conn is None or not code or not isinstance(realtime_data, dict):
+        if self._store is None or not code or not isinstance(realtime_data, dict):
             return False
         ask_price = self._parse_int(realtime_data.get("매도호가1"))
         bid_price = self._parse_int(realtime_data.get("매수호가1"))
@@ -114,15 +113,15 @@ class OrderbookSnapshotRepository:
             "%Y%m%d", time.localtime(now)
         )
         row = (
-            code,
             trade_date,
-            trade_time,
+            code,
+            int(trade_time),
             ask_price,
             bid_price,
-            self._parse_int(realtime_data.get("매도호가잔량")),
-            self._parse_int(realtime_data.get("매수호가잔량")),
-            self._parse_int(realtime_data.get("총매도호가잔량")),
-            self._parse_int(realtime_data.get("총매수호가잔량")),
+            self._qty(realtime_data.get("매도호가잔량")),
+            self._qty(realtime_data.get("매수호가잔량")),
+            self._qty(realtime_data.get("총매도호가잔량")),
+            self._qty(realtime_data.get("총매수호가잔량")),
             now,
         )
         self._last_sampled[code] = now
@@ -137,7 +136,7 @@ class OrderbookSnapshotRepository:
         return True
 
     def flush(self) -> None:
-        if self._conn is None:
+        if self._store is None:
             return
         with self._buffer_lock:
             batch = self._buffer
@@ -145,23 +144,35 @@ class OrderbookSnapshotRepository:
             self._last_flush = time.time()
         if not batch:
             return
+        by_date: dict[str, list[tuple]] = {}
+        for trade_date, *row in batch:
+            by_date.setdefault(trade_date, []).append(tuple(row))
         try:
-            with self._conn:
-                self._conn.executemany(
-                    "INSERT INTO top_of_book_history "
-                    "(code, trade_date, trade_time, ask_price, bid_price, ask_qty, "
-                    "bid_qty, total_ask_qty, total_bid_qty, created_at) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    batch,
-                )
-        except sqlite3.Error as exc:
+            for trade_date, rows in by_date.items():
+                self._store.append(trade_date, rows)
+            latest = max(by_date)
+            if self._active_date is not None and latest > self._active_date:
+                self._store.seal_before(latest)
+            self._active_date = max(latest, self._active_date or latest)
+        except (OSError, ValueError) as exc:
             self._logger.error(f"OrderbookSnapshotRepository flush 실패: {exc}")
 
     def close(self) -> None:
         self.flush()
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        if self._store is not None:
+            try:
+                for day in self._store.days():
+                    self._store.seal(day)
+            except (OSError, ValueError) as exc:
+                self._logger.error(f"OrderbookSnapshotRepository 봉인 실패: {exc}")
+            self._store.close()
+            self._store = None
+
+    @classmethod
+    def _qty(cls, value: Any) -> int:
+        """잔량 결측은 세그먼트 결측 표식(-1)으로 저장한다."""
+        parsed = cls._parse_int(value)
+        return -1 if parsed is None or parsed < 0 else parsed
 
     @staticmethod
     def _parse_int(value: Any) -> Optional[int]:
@@ -0,0 +1,154 @@
+# repositories/overseas_daily_bar_repository.py
+"""해외 일봉 로컬 저장소 (SQLite).
+
+`OverseasCandidateService` 가 후보 거래대금 산출에 쓰는 일봉을 (거래소, 심볼, 일자) 키로 쌓아 둔다.
+매 실행마다 유니버스 전 심볼의 일봉을 해외시세 API 로 다시 받지 않고, 저장된 마지막 일자 이후
+(마감된 세션까지)만 채워 넣는다. 국내 `StockOhlcvRepository` 와는 키(6자리 코드 vs 티커)·통화가
+달라 파일을 분리한다.
+
+조회는 `load_frame` 한 번으로 여러 심볼의 최근 N봉을 DataFrame 으로 돌려주며, 통계는 호출 측에서
+벡터 연산으로 계산한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS overseas_daily_bars (
+    exchange TEXT NOT NULL,
+    code     TEXT NOT NULL,
+    date     TEXT NOT NULL,
+    open     REAL NOT NULL DEFAULT 0,
+    high     REAL NOT NULL DEFAULT 0,
+    low      REAL NOT NULL DEFAULT 0,
+    close    REAL NOT NULL DEFAULT 0,
+    volume   REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (exchange, code, date)
+) WITHOUT ROWID;
+"""
+
+_FRAME_COLUMNS = ["code", "date", "open", "high", "low", "close", "volume"]
+# SQLite 기본 바인딩 상한(999) 아래로 IN 절을 끊는다.
+_IN_CHUNK = 500
+
+
+def _chunks(values: List[str]) -> Iterable[List[str]]:
+    for start in range(0, len(values), _IN_CHUNK):
+        yield values[start:start + _IN_CHUNK]
+
+
+class OverseasDailyBarRepository:
+    DEFAULT_DB_PATH = "data/overseas_daily_bars.db"
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path or self.DEFAULT_DB_PATH
+        dir_path = os.path.dirname(self.db_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_DDL)
+
+    @staticmethod
+    def _exchange_value(exchange) -> str:
+        return str(getattr(exchange, "value", exchange) or "").upper()
+
+    # ---- 조회 ----
+
+    def last_dates(self, exchange, codes: Iterable[str]) -> Dict[str, str]:
+        """심볼별 저장된 마지막 일자(YYYYMMDD). 저장분이 없는 심볼은 키가 없다."""
+        ex = self._exchange_value(exchange)
+        wanted = list(dict.fromkeys(str(c).upper() for c in codes if c))
+        result: Dict[str, str] = {}
+        for chunk in _chunks(wanted):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self._db.execute(
+                f"SELECT code, MAX(date) FROM overseas_daily_bars "
+                f"WHERE exchange = ? AND code IN ({placeholders}) GROUP BY code",
+                (ex, *chunk),
+            ).fetchall()
+            result.update({str(code): str(last) for code, last in rows if last})
+        return result
+
+    def load_frame(self, exchange, codes: Iterable[str], lookback: int) -> pd.DataFrame:
+        """심볼별 최근 lookback 봉을 (code, date) 오름차순 DataFrame 으로 반환한다."""
+        ex = self._exchange_value(exchange)
+        wanted = list(dict.fromkeys(str(c).upper() for c in codes if c))
+        frames = []
+        for chunk in _chunks(wanted):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self._db.execute(
+                f"""
+                SELECT code, date, open, high, low, close, volume FROM (
+                    SELECT code, date, open, high, low, close, volume,
+                           ROW_NUMBER() OVER (PARTITION BY code ORDER BY date DESC) AS rn
+                    FROM overseas_daily_bars
+                    WHERE exchange = ? AND code IN ({placeholders})
+                ) WHERE rn <= ?
+                """,
+                (ex, *chunk, max(1, int(lookback))),
+            ).fetchall()
+            if rows:
+                frames.append(pd.DataFrame(rows, columns=_FRAME_COLUMNS))
+        if not frames:
+            return pd.DataFrame(columns=_FRAME_COLUMNS)
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        return frame.sort_values(["code", "date"], kind="stable").reset_index(drop=True)
+
+    # ---- 기록 ----
+
+    def upsert_bars(self, exchange, code: str, rows: Iterable[dict]) -> int:
+        """일봉 행(`{"date","open","high","low","close","volume"}`)을 저장하고 저장 건수를 반환한다."""
+        ex = self._exchange_value(exchange)
+        symbol = str(code).upper()
+        params = []
+        for row in rows or []:
+            date = str(row.get("date") or "").replace("-", "")
+            if len(date) != 8:
+                continue
+            params.append((
+                ex, symbol, date,
+                float(row.get("open") or 0), float(row.get("high") or 0),
+                float(row.get("low") or 0), float(row.get("close") or 0),
+                float(row.get("volume") or 0),
+            ))
+        if not params:
+            return 0
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO overseas_daily_bars "
+                "(exchange, code, date, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                params,
+            )
+        return len(params)
+
+    def prune_before(self, exchange, date: str) -> int:
+        """date 이전 일봉을 지운다 (보관 기간 관리)."""
+        with self._db:
+            cur = self._db.execute(
+                "DELETE FROM overseas_daily_bars WHERE exchange = ? AND date < ?",
+                (self._exchange_value(exchange), str(date)),
+            )
+        return cur.rowcount
+
+    # ---- 비동기 래퍼 (이벤트 루프 블로킹 방지) ----
+
+    async def last_dates_async(self, exchange, codes: Iterable[str]) -> Dict[str, str]:
+        return await asyncio.to_thread(self.last_dates, exchange, list(codes))
+
+    async def load_frame_async(self, exchange, codes: Iterable[str], lookback: int) -> pd.DataFrame:
+        return await asyncio.to_thread(self.load_frame, exchange, list(codes), lookback)
+
+    async def upsert_many_async(self, exchange, rows_by_code: Dict[str, List[dict]]) -> int:
+        def _write() -> int:
+            return sum(self.upsert_bars(exchange, code, rows) for code, rows in rows_by_code.items())
+
+        return await asyncio.to_thread(_write)
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,115 @@
+# repositories/period_return_table.py
+"""
+최신 거래일 기준 기간 수익률 materialized 테이블 (히트맵·YTD 랭킹용).
+
+daily_prices 최신 스냅샷과 ohlcv 기준종가는 장마감 배치(DailyPriceCollectorTask /
+OhlcvUpdateTask)가 끝날 때만 바뀐다. 그런데 /heatmap/domestic?period=… 와 /ranking/ytd 는
+요청마다 MAX(trade_date) → GLOB 필터 조인으로 기준일 탐색 → 기준종가 전체 로드를 반복했다.
+거래일 하나에 대해 지원 기간(1w/1m/3m/6m/1y/ytd) 전부를 한 번 계산해 두고, 조회는
+dict/list 조회로 끝낸다. 구성·무효화는 StockOhlcvRepository 가 맡는다.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+YTD = "ytd"
+
+# 기간 키 → 달력일 (ytd 는 '올해 첫 거래일' 기준이라 달력일이 없다).
+# 히트맵 라우트의 _HEATMAP_PERIOD_DAYS 와 같은 값이어야 테이블 조회로 처리된다.
+PERIOD_DAYS: Dict[str, int] = {"1w": 7, "1m": 30, "3m": 91, "6m": 182, "1y": 365}
+
+
+def period_key(period_days: int = 0, ytd: bool = False) -> Optional[str]:
+    """get_period_base_closes 인자 → 테이블 기간 키. 테이블에 없는 기간이면 None."""
+    if ytd:
+        return YTD
+    for key, days in PERIOD_DAYS.items():
+        if days == period_days:
+            return key
+    return None
+
+
+@dataclass
+class PeriodReturnTable:
+    """한 거래일(trade_date)의 스냅샷 행 + 기간별 기준일/기준종가/수익률 + 시총 순위."""
+
+    trade_date: str
+    rows: List[Dict[str, Any]]                      # 최신 스냅샷 전 종목, 시가총액 내림차순
+    base_dates: Dict[str, Optional[str]]            # 기간 키 → 기준일 (이력 부족이면 None)
+    closes: Dict[str, Dict[str, Any]]               # 기간 키 → {code: 기준종가}
+    returns: Dict[str, Dict[str, float]] = field(default_factory=dict)  # 기간 키 → {code: 수익률(%)}
+    market_cap_rank: Dict[str, int] = field(default_factory=dict)       # code → 전체 시총 순위 (1부터)
+    _ytd_sorted: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+
+    @classmethod
+    def build(cls, trade_date: str, rows: List[Dict[str, Any]],
+              base_dates: Dict[str, Optional[str]], closes: Dict[str, Dict[str, Any]]) -> "PeriodReturnTable":
+        table = cls(trade_date=trade_date, rows=rows, base_dates=base_dates, closes=closes)
+        rank = 0
+        for row in rows:
+            if (row.get("market_cap") or 0) > 0:
+                rank += 1
+                table.market_cap_rank[row["code"]] = rank
+
+        for key, base_closes in closes.items():
+            period_returns = {}
+            for row in rows:
+                base = base_closes.get(row.get("code"))
+                price = row.get("current_price")
+                if base and base > 0 and price and price > 0:
+                    period_returns[row["code"]] = round((price / base - 1.0) * 100, 2)
+            table.returns[key] = period_returns
+
+        # YTD 랭킹: 수익률 내림차순 (SQL 의 ORDER BY ratio DESC 와 같은 비교식)
+        ytd_base = closes.get(YTD) or {}
+        ytd_rows = [
+            row for row in rows
+            if (row.get("current_price") or 0) > 0 and (ytd_base.get(row.get("code")) or 0) > 0
+        ]
+        ytd_rows.sort(key=lambda r: float(r["current_price"]) / ytd_base[r["code"]] - 1.0, reverse=True)
+        table._ytd_sorted = ytd_rows
+        return table
+
+    # ── 조회 (get_* SQL 메서드와 같은 반환 형태) ─────────────────────────────
+
+    def snapshot_codes(self) -> set:
+        return {row["code"] for row in self.rows if row.get("code")}
+
+    def market_cap_snapshot(self, limit: int, market: Optional[str]) -> List[Dict]:
+        result = []
+        for row in self.rows:
+            if len(result) >= limit:
+                break
+            if (row.get("market_cap") or 0) <= 0:
+                continue
+            if market and market != "ALL" and row.get("market") != market:
+                continue
+            result.append(dict(row))
+        return result
+
+    def period_base_closes(self, key: str) -> Dict[str, Any]:
+        base_date = self.base_dates.get(key)
+        return {
+            "base_date": base_date,
+            "latest_date": self.trade_date,
+            "closes": dict(self.closes.get(key) or {}) if base_date else {},
+        }
+
+    def ytd_ranking(self, limit: int, market: Optional[str]) -> List[Dict]:
+        base_date = self.base_dates.get(YTD)
+        if not base_date:
+            return []
+        base_closes = self.closes[YTD]
+        results = []
+        for row in self._ytd_sorted:
+            if len(results) >= limit:
+                break
+            if market and market != "ALL" and row.get("market") != market:
+                continue
+            item = dict(row)
+            item["base_price"] = base_closes[row["code"]]
+            item["base_date"] = base_date
+            item["latest_date"] = self.trade_date
+            item["ytd_return_rate"] = round((item["current_price"] / item["base_price"] - 1.0) * 100, 2)
+            item["data_rank"] = str(len(results) + 1)
+            results.append(item)
+        return results
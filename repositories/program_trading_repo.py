@@ -146,6 +146,17 @@ class ProgramTradingRepo:
     def load_today_history(self) -> dict:
         """DB에서 금일 프로그램 매매 이력을 dict로 반환."""
         result: dict = {}
+        for code, restored_data, _created_at in self.load_today_history_rows():
+            result.setdefault(code, []).append(restored_data)
+        return result
+
+    def load_today_history_rows(self) -> list:
+        """금일 이력을 수신 순서대로 (code, 복원 dict, created_at) 행 목록으로 반환.
+
+        ProgramTradingStreamService 는 이 행으로 열 지향 히스토리를 복원한다 (created_at 이
+        다운샘플 버킷의 기준 시각).
+        """
+        result: list = []
         try:
             today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
             today_ts = today_start.timestamp()
@@ -154,7 +165,7 @@ class ProgramTradingRepo:
                 cursor = conn.execute("""
                     SELECT
                         code, trade_time, price, rate, sell_vol, sell_amt, buy_vol, buy_amt,
-                        net_vol, net_amt, sell_rem, buy_rem, net_rem
+                        net_vol, net_amt, sell_rem, buy_rem, net_rem, created_at
                     FROM pt_history
                     WHERE created_at >= ? ORDER BY id ASC
                 """, (today_ts,))
@@ -162,7 +173,7 @@ class ProgramTradingRepo:
                 count = 0
                 for row in cursor.fetchall():
                     (code, trade_time, price, rate, sell_vol, sell_amt, buy_vol, buy_amt,
-                     net_vol, net_amt, sell_rem, buy_rem, net_rem) = row
+                     net_vol, net_amt, sell_rem, buy_rem, net_rem, created_at) = row
                     restored_data = {
                         "유가증권단축종목코드": code,
                         "주식체결시간": trade_time,
@@ -178,7 +189,7 @@ class ProgramTradingRepo:
                         "매수호가잔량": str(buy_rem),
                         "전체순매수호가잔량": str(net_rem),
                     }
-                    result.setdefault(code, []).append(restored_data)
+                    result.append((code, restored_data, created_at))
                     count += 1
 
             if count > 0:
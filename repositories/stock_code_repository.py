@@ -118,6 +118,27 @@ class StockCodeRepository:
                 self.code_to_name = dict(zip(self.df["종목코드"], self.df["종목명"]))
                 self.name_to_code = dict(zip(self.df["종목명"], self.df["종목코드"]))
 
+    @classmethod
+    def from_snapshot(cls, document: dict, db_path=None, logger=None) -> "StockCodeRepository":
+        """웜 리스타트 스냅샷의 종목 마스터로 SQLite 조회 없이 인스턴스를 만든다."""
+        repo = cls.__new__(cls)
+        repo.logger = logger
+        if db_path is None:
+            root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            db_path = os.path.join(root, "data", "stock_code_list.db")
+        repo._db_path = db_path
+        repo.df = pd.DataFrame(document["rows"], columns=document["columns"]).astype({"종목코드": str})
+        repo.code_to_name = dict(zip(repo.df["종목코드"], repo.df["종목명"]))
+        repo.name_to_code = dict(zip(repo.df["종목명"], repo.df["종목코드"]))
+        if logger:
+            logger.info(f"🔄 종목코드 매핑 스냅샷 복원 완료: {len(repo.df)}종목")
+        return repo
+
+    def to_snapshot(self) -> dict:
+        """웜 리스타트 스냅샷용 종목 마스터 (컬럼 + 행)."""
+        frame = self.df.astype(object).where(self.df.notna(), None)
+        return {"columns": [str(c) for c in frame.columns], "rows": frame.values.tolist()}
+
     def get_name_by_code(self, code: str) -> str:
         name = self.code_to_name.get(code, "")
         if not name and self.logger:
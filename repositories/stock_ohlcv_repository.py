@@ -15,6 +15,7 @@ from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 from repositories.cache import _LFUCache
+from repositories.period_return_table import PERIOD_DAYS, YTD, PeriodReturnTable, period_key
 
 if TYPE_CHECKING:
     from core.logger import CacheEventLogger
@@ -40,6 +41,13 @@ class StockOhlcvRepository:
             on_evict=self._on_ohlcv_evicted,
         )
 
+        # 기간 수익률 materialized 테이블 — daily_prices/ohlcv 쓰기 시 무효화, 다음 조회나
+        # 장마감 배치(materialize_period_returns)에서 다시 만든다. generation 은 구성 도중
+        # 쓰기가 끼어들면 낡은 결과를 버리기 위한 카운터.
+        self._period_table: Optional[PeriodReturnTable] = None
+        self._period_generation = 0
+        self._period_build_lock = asyncio.Lock()
+
         os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
         self._init_db_sync()
 
@@ -224,6 +232,109 @@ class StockOhlcvRepository:
             self._logger.error(f"StockOhlcvRepository OHLCV 조회 실패 ({code}): {e}")
             return None
 
+    async def preload_stock_data(self, codes: List[str], ohlcv_limit: int = 600,
+                                 caller: str = "bulk_preload") -> Dict[str, List[Dict]]:
+        """
+        여러 종목의 최근 ohlcv_limit 일봉을 code/date 정렬된 DB 스캔 한 번으로 읽어 LFU 캐시에 적재합니다.
+
+        장전 웜업용 — 장중 첫 scan 이 종목마다 get_stock_data() 로 DB 를 두드리지 않게 한다.
+        이미 ohlcv_limit 이상 캐시된 종목은 다시 읽지 않고, 캐시 용량을 넘는 종목은 앞쪽 순서만 적재한다.
+        반환: {code: 확정 일봉 rows(오름차순)} — 캐시 히트 종목 포함.
+        """
+        loaded: Dict[str, List[Dict]] = {}
+        pending: List[str] = []
+        for code in dict.fromkeys(str(c) for c in codes if c):
+            cached = self._ohlcv_cache.get(code, count_stats=False, item_type="ohlcv")
+            if cached and cached.get("historical_complete") and len(cached.get("ohlcv_historical", [])) >= ohlcv_limit:
+                loaded[code] = cached["ohlcv_historical"]
+            else:
+                pending.append(code)
+
+        # 이미 캐시에 있는 종목은 교체라 자리를 더 차지하지 않는다.
+        room = max(self._ohlcv_cache.capacity - len(self._ohlcv_cache), 0) + sum(
+            1 for code in pending if code in self._ohlcv_cache
+        )
+        if len(pending) > room:
+            self._logger.warning(
+                f"StockOhlcvRepository 일괄 적재 대상 {len(pending)}종목이 캐시 여유({room})를 넘어 앞쪽만 적재합니다."
+            )
+            pending = pending[:room]
+
+        try:
+            async with self._get_read_connection() as conn:
+                # SQLite 바인딩 변수 한도(구버전 999) 안에서 종목 묶음 단위로 읽는다.
+                for i in range(0, len(pending), 500):
+                    chunk = pending[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    async with conn.execute(
+                        "SELECT code, date, open, high, low, close, volume FROM ("
+                        "SELECT code, date, open, high, low, close, volume, "
+                        "ROW_NUMBER() OVER (PARTITION BY code ORDER BY date DESC) AS rn "
+                        f"FROM ohlcv WHERE code IN ({placeholders})"
+                        ") WHERE rn <= ? ORDER BY code, date",
+                        (*chunk, ohlcv_limit),
+                    ) as cursor:
+                        rows = await cursor.fetchall()
+                    by_code: Dict[str, List[Dict]] = {}
+                    for row in rows:
+                        record = dict(row)
+                        by_code.setdefault(record.pop("code"), []).append(record)
+                    now = time.time()
+                    for code, historical in by_code.items():
+                        self._ohlcv_cache.put(code, {
+                            "ohlcv_historical": historical,
+                            "ohlcv_today": None,
+                            "historical_complete": True,
+                            "last_loaded": now,
+                        })
+                        if self._cache_logger:
+                            self._cache_logger.log_ohlcv_loaded(code, caller, len(historical), historical[-1].get("date"))
+                        loaded[code] = historical
+        except Exception as e:
+            self._logger.error(f"StockOhlcvRepository OHLCV 일괄 적재 실패: {e}")
+        return loaded
+
+    def export_ohlcv_cache(self, ohlcv_limit: int = 600) -> Dict[str, List[Dict]]:
+        """
+        캐시에 적재된 종목별 확정 일봉(최근 ohlcv_limit건)을 반환합니다 (웜 리스타트 스냅샷용).
+
+        ohlcv_today(장중 병합 봉)는 제외하고, 리스트만 얕게 복사해 이벤트 루프 밖에서
+        직렬화해도 캐시 교체와 엉키지 않게 한다.
+        """
+        exported: Dict[str, List[Dict]] = {}
+        for code in self._ohlcv_cache.keys():
+            cached = self._ohlcv_cache.get(code, count_stats=False, item_type="snapshot")
+            if not cached or not cached.get("historical_complete"):
+                continue
+            historical = cached.get("ohlcv_historical") or []
+            if historical:
+                exported[code] = historical[-ohlcv_limit:]
+        return exported
+
+    def restore_ohlcv_cache(self, histories: Dict[str, List[Dict]]) -> int:
+        """
+        스냅샷의 종목별 확정 일봉을 DB 조회 없이 LFU 캐시에 적재합니다.
+
+        이미 캐시에 있는 종목은 더 최신일 수 있으므로 건드리지 않고, 캐시 여유만큼만 적재한다.
+        반환: 적재한 종목 수.
+        """
+        room = max(self._ohlcv_cache.capacity - len(self._ohlcv_cache), 0)
+        now = time.time()
+        restored = 0
+        for code, historical in histories.items():
+            if restored >= room:
+                break
+            if not historical or code in self._ohlcv_cache:
+                continue
+            self._ohlcv_cache.put(code, {
+                "ohlcv_historical": historical,
+                "ohlcv_today": None,
+                "historical_complete": True,
+                "last_loaded": now,
+            })
+            restored += 1
+        return restored
+
     def update_today_candle(self, code: str, current_price: float, volume: int = 0):
         """
         WebSocket 틱 데이터로 당일 OHLCV 캔들을 갱신합니다.
@@ -276,6 +387,7 @@ class StockOhlcvRepository:
                     records,
                 )
             # upsert 성공 후에만 캐시 무효화 — 다음 get_stock_data 시 신선한 DB 데이터 로드
+            self._invalidate_period_table(ohlcv_from=min(str(r.get("date") or "") for r in records))
             for code in codes_to_invalidate:
                 self._ohlcv_cache.delete(code)
                 if self._cache_logger:
@@ -395,6 +507,7 @@ class StockOhlcvRepository:
                       "rs_rating": r.get("rs_rating")}
                      for r in records],
                 )
+            self._invalidate_period_table(snapshot_date=trade_date)
             self._logger.debug(
                 f"StockOhlcvRepository: daily_prices {len(records)}건 upsert 완료 (date={trade_date})"
             )
@@ -431,6 +544,7 @@ class StockOhlcvRepository:
                         for r in records
                     ],
                 )
+            self._invalidate_period_table(snapshot_date=trade_date)
             self._logger.debug(
                 f"StockOhlcvRepository: minervini fields {len(records)}건 update 완료 (date={trade_date})"
             )
@@ -468,6 +582,7 @@ class StockOhlcvRepository:
                             for r in records
                         ],
                     )
+            self._invalidate_period_table(snapshot_date=trade_date)
             self._logger.debug(
                 f"StockOhlcvRepository: newhigh fields {len(records)}건 update 완료 (date={trade_date})"
             )
@@ -502,6 +617,129 @@ class StockOhlcvRepository:
             self._logger.error(f"StockOhlcvRepository daily_prices 전종목 조회 실패: {e}")
             return []
 
+    # ── 기간 수익률 materialized 테이블 ──────────────────────────────────────
+
+    def _invalidate_period_table(self, *, snapshot_date: Optional[str] = None,
+                                 ohlcv_from: Optional[str] = None) -> None:
+        """쓰기가 테이블 내용에 영향을 줄 수 있으면 버린다.
+
+        최신 거래일보다 과거의 daily_prices 수정이나, 최신 거래일 이후 날짜의 ohlcv 추가(장중
+        당일 봉 등)는 최신 스냅샷·기준종가를 바꾸지 않으므로 유지한다.
+        """
+        table = self._period_table
+        if table is not None:
+            if snapshot_date is not None and snapshot_date < table.trade_date:
+                return
+            if ohlcv_from is not None and ohlcv_from > table.trade_date and table.base_dates.get(YTD):
+                return
+        self._period_generation += 1
+        self._period_table = None
+
+    async def materialize_period_returns(self) -> Optional[PeriodReturnTable]:
+        """최신 거래일의 지원 기간 전부에 대한 기준일·기준종가·수익률·시총 순위를 계산해 둔다.
+
+        장마감 배치 완료 직후 호출한다. 이미 최신이면 그대로 돌려주고, 실패하면 None
+        (조회 메서드는 SQL 경로로 폴백한다).
+        """
+        if self._period_table is not None:
+            return self._period_table
+        async with self._period_build_lock:
+            if self._period_table is not None:
+                return self._period_table
+            generation = self._period_generation
+            try:
+                table = await self._build_period_table()
+            except Exception as e:
+                self._logger.error(f"StockOhlcvRepository 기간 수익률 테이블 구성 실패: {e}")
+                return None
+            if table is not None and generation == self._period_generation:
+                self._period_table = table
+            return table
+
+    async def _build_period_table(self) -> Optional[PeriodReturnTable]:
+        async with self._get_read_connection() as conn:
+            latest_date = await self._latest_snapshot_date(conn)
+            if not latest_date:
+                return None
+            async with conn.execute(
+                "SELECT * FROM daily_prices WHERE trade_date = ? ORDER BY market_cap DESC",
+                (latest_date,),
+            ) as cursor:
+                rows = [dict(row) for row in await cursor.fetchall()]
+
+            base_dates = {YTD: await self._find_base_date(conn, latest_date, ytd=True)}
+            for key, days in PERIOD_DAYS.items():
+                base_dates[key] = await self._find_base_date(conn, latest_date, period_days=days)
+
+            closes_by_date: Dict[str, Dict[str, Any]] = {}
+            for base_date in {d for d in base_dates.values() if d}:
+                closes_by_date[base_date] = await self._load_base_closes(conn, base_date)
+
+        closes = {key: closes_by_date.get(base_date, {}) for key, base_date in base_dates.items()}
+        return PeriodReturnTable.build(latest_date, rows, base_dates, closes)
+
+    async def _fresh_period_table(self) -> Optional[PeriodReturnTable]:
+        """조회 경로용 — 테이블이 없으면 한 번 만든다 (동시 요청은 lock 으로 1회만 구성)."""
+        table = self._period_table
+        if table is not None:
+            return table
+        return await self.materialize_period_returns()
+
+    def get_period_return_table(self) -> Optional[PeriodReturnTable]:
+        """현재 materialized 테이블 (없으면 None). 기간별 수익률·시총 순위 조회용."""
+        return self._period_table
+
+    @staticmethod
+    async def _latest_snapshot_date(conn) -> Optional[str]:
+        async with conn.execute("SELECT MAX(trade_date) FROM daily_prices") as cursor:
+            latest_row = await cursor.fetchone()
+        return latest_row[0] if latest_row and latest_row[0] else None
+
+    @staticmethod
+    async def _find_base_date(conn, latest_date: str, period_days: int = 0, ytd: bool = False) -> Optional[str]:
+        """기간 기준일 탐색 (get_period_base_closes 의 기준일 규칙)."""
+        from datetime import datetime, timedelta
+
+        # 자릿수가 어긋난 레코드가 섞여도 8자리 날짜만 기준일 후보로 삼고,
+        # 최신 스냅샷 종목과 실제로 겹치는 코드가 있는 날짜만 채택한다(휴장일 배제).
+        if ytd:
+            base_sql = """
+                SELECT MIN(base.date)
+                FROM ohlcv AS base
+                JOIN daily_prices AS latest
+                  ON latest.code = base.code AND latest.trade_date = ?
+                WHERE base.date GLOB ?
+            """
+            base_params = (latest_date, f"{latest_date[:4]}[0-1][0-9][0-3][0-9]")
+        else:
+            target_date = (
+                datetime.strptime(latest_date, "%Y%m%d") - timedelta(days=period_days)
+            ).strftime("%Y%m%d")
+            base_sql = """
+                SELECT MAX(base.date)
+                FROM ohlcv AS base
+                JOIN daily_prices AS latest
+                  ON latest.code = base.code AND latest.trade_date = ?
+                WHERE base.date <= ?
+                  AND base.date GLOB '[0-9][0-9][0-9][0-9][0-1][0-9][0-3][0-9]'
+            """
+            base_params = (latest_date, target_date)
+
+        async with conn.execute(base_sql, base_params) as cursor:
+            base_row = await cursor.fetchone()
+        return base_row[0] if base_row and base_row[0] else None
+
+    @staticmethod
+    async def _load_base_closes(conn, base_date: str) -> Dict[str, Any]:
+        async with conn.execute(
+            "SELECT code, close FROM ohlcv WHERE date = ? AND close > 0",
+            (base_date,),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    # ── 최신 스냅샷 조회 (테이블 우선, 실패 시 SQL) ──────────────────────────
+
     async def get_snapshot_codes(self) -> set:
         """최신 거래일 스냅샷이 담고 있는 종목코드 집합.
 
@@ -509,6 +747,12 @@ class StockOhlcvRepository:
         종목 집합을 그리려면 이 유니버스로 잘라야 한다. 정지주(시총 0원)도 유니버스에는
         남긴다 — 면적 계산에서만 빠질 뿐이다.
         """
+        table = await self._fresh_period_table()
+        if table is not None:
+            return table.snapshot_codes()
+        return await self._query_snapshot_codes()
+
+    async def _query_snapshot_codes(self) -> set:
         try:
             async with self._get_read_connection() as conn:
                 async with conn.execute(
@@ -529,11 +773,15 @@ class StockOhlcvRepository:
         정지주는 시가총액 0원 행으로 저장되므로 면적 계산에서 제외한다.
         market: "KOSPI"/"KOSDAQ" 지정 시 해당 시장으로 필터링, None/"ALL"이면 전체.
         """
+        table = await self._fresh_period_table()
+        if table is not None:
+            return table.market_cap_snapshot(limit, market)
+        return await self._query_market_cap_snapshot(limit=limit, market=market)
+
+    async def _query_market_cap_snapshot(self, limit: int = 300, market: Optional[str] = None) -> List[Dict]:
         try:
             async with self._get_read_connection() as conn:
-                async with conn.execute("SELECT MAX(trade_date) FROM daily_prices") as cursor:
-                    latest_row = await cursor.fetchone()
-                latest_date = latest_row[0] if latest_row and latest_row[0] else None
+                latest_date = await self._latest_snapshot_date(conn)
                 if not latest_date:
                     return []
 
@@ -568,30 +816,21 @@ class StockOhlcvRepository:
         연초 기준가는 더 오래 축적된 ohlcv 테이블에서 조회한다.
         market: "KOSPI"/"KOSDAQ" 지정 시 해당 시장으로 필터링, None/"ALL"이면 전체.
         """
+        table = await self._fresh_period_table()
+        if table is not None:
+            return table.ytd_ranking(limit, market)
+        return await self._query_ytd_return_ranking(limit=limit, market=market)
+
+    async def _query_ytd_return_ranking(self, limit: int = 100, market: Optional[str] = None) -> List[Dict]:
         try:
             async with self._get_read_connection() as conn:
-                async with conn.execute("SELECT MAX(trade_date) FROM daily_prices") as cursor:
-                    latest_row = await cursor.fetchone()
-                latest_date = latest_row[0] if latest_row and latest_row[0] else None
+                latest_date = await self._latest_snapshot_date(conn)
                 if not latest_date:
                     return []
 
-                year = latest_date[:4]
-                date_glob = f"{year}[0-1][0-9][0-3][0-9]"
                 # 휴장일(채권 등 현재 추적 종목과 무관한 코드만 존재)이 연초 최초 날짜로
                 # 잡히지 않도록, 최신 스냅샷 종목과 실제로 겹치는 코드가 있는 날짜만 후보로 삼는다.
-                async with conn.execute(
-                    """
-                    SELECT MIN(base.date)
-                    FROM ohlcv AS base
-                    JOIN daily_prices AS latest
-                      ON latest.code = base.code AND latest.trade_date = ?
-                    WHERE base.date GLOB ?
-                    """,
-                    (latest_date, date_glob),
-                ) as cursor:
-                    base_row = await cursor.fetchone()
-                base_date = base_row[0] if base_row and base_row[0] else None
+                base_date = await self._find_base_date(conn, latest_date, ytd=True)
                 if not base_date:
                     return []
 
@@ -645,58 +884,31 @@ class StockOhlcvRepository:
 
         ytd=True 면 달력일 대신 '올해 첫 거래일' 을 기준일로 삼는다 (period_days 는 무시).
         연초 첫 종가 기준은 get_ytd_return_ranking 과 같아 두 화면의 YTD 수치가 일치한다.
+        지원 기간(PERIOD_DAYS, ytd)은 materialized 테이블 조회로 끝난다.
         """
-        from datetime import datetime, timedelta
-
+        key = period_key(period_days, ytd)
+        if key is not None:
+            table = await self._fresh_period_table()
+            if table is not None:
+                return table.period_base_closes(key)
+        return await self._query_period_base_closes(period_days=period_days, ytd=ytd)
+
+    async def _query_period_base_closes(self, period_days: int = 0, ytd: bool = False) -> Dict[str, Any]:
         empty = {"base_date": None, "latest_date": None, "closes": {}}
         try:
             async with self._get_read_connection() as conn:
-                async with conn.execute("SELECT MAX(trade_date) FROM daily_prices") as cursor:
-                    latest_row = await cursor.fetchone()
-                latest_date = latest_row[0] if latest_row and latest_row[0] else None
+                latest_date = await self._latest_snapshot_date(conn)
                 if not latest_date:
                     return empty
 
-                # 자릿수가 어긋난 레코드가 섞여도 8자리 날짜만 기준일 후보로 삼고,
-                # 최신 스냅샷 종목과 실제로 겹치는 코드가 있는 날짜만 채택한다(휴장일 배제).
-                if ytd:
-                    base_sql = """
-                        SELECT MIN(base.date)
-                        FROM ohlcv AS base
-                        JOIN daily_prices AS latest
-                          ON latest.code = base.code AND latest.trade_date = ?
-                        WHERE base.date GLOB ?
-                    """
-                    base_params = (latest_date, f"{latest_date[:4]}[0-1][0-9][0-3][0-9]")
-                else:
-                    target_date = (
-                        datetime.strptime(latest_date, "%Y%m%d") - timedelta(days=period_days)
-                    ).strftime("%Y%m%d")
-                    base_sql = """
-                        SELECT MAX(base.date)
-                        FROM ohlcv AS base
-                        JOIN daily_prices AS latest
-                          ON latest.code = base.code AND latest.trade_date = ?
-                        WHERE base.date <= ?
-                          AND base.date GLOB '[0-9][0-9][0-9][0-9][0-1][0-9][0-3][0-9]'
-                    """
-                    base_params = (latest_date, target_date)
-
-                async with conn.execute(base_sql, base_params) as cursor:
-                    base_row = await cursor.fetchone()
-                base_date = base_row[0] if base_row and base_row[0] else None
+                base_date = await self._find_base_date(conn, latest_date, period_days=period_days, ytd=ytd)
                 if not base_date:
                     return {"base_date": None, "latest_date": latest_date, "closes": {}}
 
-                async with conn.execute(
-                    "SELECT code, close FROM ohlcv WHERE date = ? AND close > 0",
-                    (base_date,),
-                ) as cursor:
-                    rows = await cursor.fetchall()
                 return {
                     "base_date": base_date,
                     "latest_date": latest_date,
-                    "closes": {row[0]: row[1] for row in rows},
+                    "closes": await self._load_base_closes(conn, base_date),
                 }
         except Exception as e:
             self._logger.error(f"StockOhlcvRepository 기간 기준종가 조회 실패: {e}")
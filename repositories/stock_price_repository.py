@@ -3,12 +3,16 @@
 현재가 인메모리 캐시 및 WebSocket 스트리밍 상태를 전담하는 Repository.
 - 용량 3000: KOSPI+KOSDAQ 전종목을 커버하여 대량 스캔 시에도 eviction 없음
 - TTL: streaming 종목은 ∞, non-streaming 종목은 기본 3초
+- LRU 에는 REST 현재가 응답 전체만 둔다. 틱 최신가는 공유 LatestPriceTable
+  (PriceStreamService 가 기록) 한 곳에만 있고, REST 응답이 없는 종목은 테이블에서
+  _source="tick" 최소 구조를 만들어 돌려준다.
 """
 import time
 import logging
 from typing import Optional, TYPE_CHECKING
 
 from repositories.cache import _LRUCache
+from repositories.latest_price_table import LatestPriceTable
 
 if TYPE_CHECKING:
     from core.logger import CacheEventLogger
@@ -27,6 +31,8 @@ class StockPriceRepository:
             capacity=_PRICE_CACHE_CAPACITY,
             on_evict=self._on_price_evicted,
         )
+        # 틱 최신가 공유 테이블 (PriceStreamService·StockQueryService 등이 같은 인스턴스를 읽고 쓴다)
+        self.latest_prices = LatestPriceTable(capacity=_PRICE_CACHE_CAPACITY)
         # 현재 WebSocket으로 실시간 스트리밍 중인 종목 코드 집합
         self._streaming_codes: set = set()
 
@@ -61,9 +67,9 @@ class StockPriceRepository:
         """캐시된 현재가 데이터를 반환합니다. TTL 만료 시 None 반환."""
         cached = self._price_cache.get(code, count_stats=count_stats,
                                        caller=caller, item_type="current_price")
+        is_streaming = code in self._streaming_codes
+        effective_max_age = float('inf') if is_streaming else max_age_sec
         if cached and "current_price_data" in cached:
-            is_streaming = code in self._streaming_codes
-            effective_max_age = float('inf') if is_streaming else max_age_sec
             age_sec = time.time() - cached.get("price_updated_at", 0)
             if age_sec <= effective_max_age:
                 if self._cache_logger and count_stats:
@@ -72,32 +78,53 @@ class StockPriceRepository:
             if self._cache_logger and count_stats:
                 self._cache_logger.log_price_miss(code, caller, "ttl_expired")
             return None
+        quote = self.latest_prices.read(code)
+        if quote is not None:
+            age_sec = time.time() - quote.received_at
+            if age_sec <= effective_max_age:
+                if self._cache_logger and count_stats:
+                    self._cache_logger.log_price_hit(code, caller, age_sec, is_streaming)
+                return self._tick_price_data(quote)
+            if self._cache_logger and count_stats:
+                self._cache_logger.log_price_miss(code, caller, "ttl_expired")
+            return None
         if self._cache_logger and count_stats:
             self._cache_logger.log_price_miss(code, caller, "not_found")
         return None
 
+    @staticmethod
+    def _tick_price_data(quote) -> dict:
+        """틱만 수신된 종목의 최소 현재가 구조 (_source="tick" 으로 불완전 캐시임을 표시)."""
+        legacy = quote.to_legacy_dict()
+        return {
+            "output": {
+                "stck_prpr": legacy["price"],
+                "acml_vol": str(quote.acml_vol),
+                "prdy_ctrt": legacy["rate"],
+            },
+            "_source": "tick",
+        }
+
     def update_current_price(self, code: str, current_price: float, volume: int = 0, rate=None):
-        """WebSocket 틱 데이터로 현재가 캐시를 즉시 갱신합니다.
+        """WebSocket 틱 데이터로 REST 현재가 응답(output)을 즉시 갱신합니다.
 
+        틱 최신가 자체는 보통 호출자(PriceStreamService)가 latest_prices 테이블에 이미 기록했다.
+        테이블에 행이 없을 때만 가격·거래량·등락률로 최소 행을 만들고, 틱만 받은 종목을 위해
+        LRU 항목을 새로 만들지는 않는다. REST 응답이 캐시돼 있으면 output 도 맞춰 둔다.
         rate(전일대비율)가 전달되면 등락률(prdy_ctrt)도 함께 갱신하여
         가격만 최신이고 등락률은 과거 값에 고정되는 문제를 방지합니다.
         """
-        cached = self._price_cache.get(code, count_stats=False, item_type="update_tick")
-        if not cached:
-            cached = {}
-            self._price_cache.put(code, cached)
+        if code not in self.latest_prices:
+            try:
+                rate_f = float(rate) if rate not in (None, "", "N/A") else 0.0
+            except (TypeError, ValueError):
+                rate_f = 0.0
+            self.latest_prices.write(
+                code, float(current_price), rate=rate_f, acml_vol=volume, quality_reason="tick"
+            )
 
-        if "current_price_data" not in cached:
-            # 틱만 수신된 경우 최소 구조로 캐시 생성 (_source="tick" 마킹)
-            # stock_query_service는 _source 필드로 불완전 캐시를 식별할 수 있음
-            output = {"stck_prpr": str(int(current_price)), "acml_vol": str(volume)}
-            if rate is not None:
-                output["prdy_ctrt"] = str(rate)
-            cached["current_price_data"] = {
-                "output": output,
-                "_source": "tick",
-            }
-            cached["price_updated_at"] = time.time()
+        cached = self._price_cache.get(code, count_stats=False, item_type="update_tick")
+        if not cached or "current_price_data" not in cached:
             return
 
         output = cached["current_price_data"].get("output")
@@ -146,6 +173,7 @@ class StockPriceRepository:
         """현재가 캐시 통계를 반환합니다."""
         stats = self._price_cache.get_stats(expand=expand)
         stats["streaming_count"] = len(self._streaming_codes)
+        stats["latest_price_table"] = self.latest_prices.get_stats()
         if expand and "items" in stats:
             for item in stats["items"]:
                 item["is_streaming"] = item.get("code") in self._streaming_codes
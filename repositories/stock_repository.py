@@ -9,6 +9,7 @@ import logging
 from typing import Optional, List, Dict, Any
 
 from repositories.cache import _LRUCache, _LFUCache  # 하위호환 re-export 용
+from repositories.latest_price_table import LatestPriceTable
 from repositories.stock_price_repository import StockPriceRepository
 from repositories.stock_ohlcv_repository import StockOhlcvRepository
 from core.logger import get_cache_event_logger
@@ -43,6 +44,11 @@ class StockRepository:
 
     # ── 현재가 캐시 ──────────────────────────────────────────────────────────────
 
+    @property
+    def latest_prices(self) -> LatestPriceTable:
+        """틱 최신가 공유 테이블 (PriceStreamService 가 기록, 조회 서비스들이 읽는다)."""
+        return self._price_repo.latest_prices
+
     def set_current_price(self, code: str, price_data: dict):
         """현재가 API 응답 전체 데이터를 캐시에 저장합니다."""
         self._price_repo.set_current_price(code, price_data)
@@ -61,6 +67,19 @@ class StockRepository:
         """메모리 캐시 또는 DB에서 OHLCV 데이터를 반환합니다."""
         return await self._ohlcv_repo.get_stock_data(code, ohlcv_limit=ohlcv_limit, caller=caller)
 
+    async def preload_stock_data(self, codes: List[str], ohlcv_limit: int = 600,
+                                 caller: str = "bulk_preload") -> Dict[str, List[Dict]]:
+        """여러 종목 OHLCV 를 정렬된 DB 스캔 한 번으로 읽어 캐시에 적재합니다 (장전 웜업용)."""
+        return await self._ohlcv_repo.preload_stock_data(codes, ohlcv_limit=ohlcv_limit, caller=caller)
+
+    def export_ohlcv_cache(self, ohlcv_limit: int = 600) -> Dict[str, List[Dict]]:
+        """캐시에 올라온 종목별 확정 일봉(최근 ohlcv_limit)을 반환합니다 (웜 리스타트 스냅샷용)."""
+        return self._ohlcv_repo.export_ohlcv_cache(ohlcv_limit=ohlcv_limit)
+
+    def restore_ohlcv_cache(self, histories: Dict[str, List[Dict]]) -> int:
+        """스냅샷의 종목별 확정 일봉을 DB 조회 없이 캐시에 적재합니다."""
+        return self._ohlcv_repo.restore_ohlcv_cache(histories)
+
     async def upsert_ohlcv(self, records: List[Dict]):
         """여러 종목의 일봉(OHLCV) 데이터를 일괄 upsert 후 해당 종목 캐시 무효화."""
         await self._ohlcv_repo.upsert_ohlcv(records)
@@ -118,6 +137,14 @@ class StockRepository:
         """최신 거래일에서 period_days 달력일 이전(ytd=True 면 올해 첫 거래일)의 종목별 기준종가 조회."""
         return await self._ohlcv_repo.get_period_base_closes(period_days=period_days, ytd=ytd)
 
+    async def materialize_period_returns(self):
+        """최신 거래일의 기간 수익률·시총 순위 테이블을 미리 계산한다 (장마감 배치 완료 후 호출)."""
+        return await self._ohlcv_repo.materialize_period_returns()
+
+    def get_period_return_table(self):
+        """materialized 기간 수익률 테이블 (아직 없으면 None)."""
+        return self._ohlcv_repo.get_period_return_table()
+
     async def update_newhigh_fields(self, trade_date: str, records: List[Dict]):
         """is_newhigh 및 is_historical_newhigh 컬럼 업데이트."""
         await self._ohlcv_repo.update_newhigh_fields(trade_date, records)
@@ -0,0 +1,429 @@
+"""장중 틱 샘플링용 일자별 append-only 컬럼형 세그먼트 저장소.
+
+체결강도·최우선호가 샘플러는 장중 내내 쓰고, microstructure 캡처는 장마감 후 (종목, 일자)
+단위로 하루치를 통째로 읽는다. SQLite 행 단위 INSERT + 종목별 인덱스 조회 대신 쓰기·읽기
+모양에 맞춘 파일 포맷을 둔다.
+
+디렉터리: {base_dir}/{YYYYMMDD}/{stream}.log | {stream}.seg
+
+  - .log (장중 쓰기): 16바이트 헤더(magic·버전·레코드 크기·세대 id) + 고정폭 레코드 append.
+    레코드마다 CRC32 를 달아, 프로세스가 쓰기 도중 죽어 꼬리가 잘리거나 깨져도 다시 열 때
+    마지막 온전한 레코드까지 잘라내고(tail recovery) 이어 쓴다.
+  - .seg (봉인): 레코드를 (code, time, 입력 순서)로 정렬해 컬럼별 연속 배열로 쓰고, 헤더 JSON 에
+    종목별 블록 인덱스(code → [시작 행, 행 수])를 둔다. 읽기는 종목 블록을 컬럼마다 한 번의
+    연속 read 로 가져온다. 봉인은 임시 파일 → os.replace 로 원자적이며, 이미 병합한 log 세대 id 를
+    헤더에 남겨 봉인 직후 log 삭제 전에 죽어도 재봉인 시 중복 병합하지 않는다.
+
+봉인 전 당일 log 도 읽을 수 있다 (캡처가 같은 날 장마감 후 돈다) — 이 경우 log 의 유효 구간만
+메모리에서 종목별로 골라낸다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_LOG_MAGIC = b"TKLG"
+_SEG_MAGIC = b"TKSG"
+_VERSION = 1
+_LOG_HEADER = struct.Struct("<4sHHQ")  # magic, version, record_size, generation
+_SEG_PREFIX = struct.Struct("<4sHHI")  # magic, version, reserved, header_len
+_CODE_WIDTH = 12
+
+
+@dataclass(frozen=True)
+class TickStream:
+    """스트림 스키마. fields 는 code/time 뒤에 오는 고정폭 컬럼 (numpy dtype 문자열)."""
+    name: str
+    fields: Tuple[Tuple[str, str], ...]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(
+            [("code", f"S{_CODE_WIDTH}"), ("time", "<u4")]
+            + list(self.fields)
+            + [("crc", "<u4")]
+        )
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return ("code", "time") + tuple(name for name, _ in self.fields)
+
+
+EXECUTION_STRENGTH_STREAM = TickStream(
+    "execution_strength",
+    (("strength", "<f8"), ("created_at", "<f8")),
+)
+# 잔량은 원본이 비어 있을 수 있어 -1 을 결측 표식으로 쓴다.
+TOP_OF_BOOK_STREAM = TickStream(
+    "top_of_book",
+    (
+        ("ask_price", "<i8"),
+        ("bid_price", "<i8"),
+        ("ask_qty", "<i8"),
+        ("bid_qty", "<i8"),
+        ("total_ask_qty", "<i8"),
+        ("total_bid_qty", "<i8"),
+        ("created_at", "<f8"),
+    ),
+)
+
+
+class TickSegmentStore:
+    def __init__(self, base_dir: str, stream: TickStream, logger=None) -> None:
+        self._base_dir = base_dir
+        self._stream = stream
+        self._dtype = stream.dtype
+        self._logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._handles: Dict[str, object] = {}
+        os.makedirs(self._base_dir, exist_ok=True)
+
+    @property
+    def stream(self) -> TickStream:
+        return self._stream
+
+    # ── 경로 ───────────────────────────────────────────────────────
+
+    def _day_dir(self, date: str) -> str:
+        return os.path.join(self._base_dir, date)
+
+    def _log_path(self, date: str) -> str:
+        return os.path.join(self._day_dir(date), f"{self._stream.name}.log")
+
+    def _seg_path(self, date: str) -> str:
+        return os.path.join(self._day_dir(date), f"{self._stream.name}.seg")
+
+    def days(self) -> List[str]:
+        """이 스트림의 log/seg 가 있는 일자 (오름차순)."""
+        if not os.path.isdir(self._base_dir):
+            return []
+        result = []
+        for name in os.listdir(self._base_dir):
+            if len(name) == 8 and name.isdigit() and (
+                os.path.exists(self._log_path(name)) or os.path.exists(self._seg_path(name))
+            ):
+                result.append(name)
+        return sorted(result)
+
+    # ── 쓰기 ───────────────────────────────────────────────────────
+
+    def append(self, date: str, rows: Sequence[tuple]) -> int:
+        """(code, hhmmss_int, *fields) 행들을 date 의 log 끝에 붙인다."""
+        if not rows:
+            return 0
+        records = np.array(
+            [(str(row[0]).encode(), *row[1:], 0) for row in rows],
+            dtype=self._dtype,
+        )
+        self._fill_crc(records)
+        with self._lock:
+            handle = self._handles.get(date)
+            if handle is None:
+                handle = self._open_log_for_append(date)
+                self._handles[date] = handle
+            handle.write(records.tobytes())
+            handle.flush()
+        return len(rows)
+
+    def seal(self, date: str) -> bool:
+        """date 의 log 를 seg 로 병합한다. 병합할 것이 없으면 False."""
+        with self._lock:
+            handle = self._handles.pop(date, None)
+            if handle is not None:
+                handle.close()
+            log_path = self._log_path(date)
+            if not os.path.exists(log_path):
+                return False
+            generation, records = self._read_log(log_path)
+            header, columns = self._read_seg_columns(date)
+            merged = list(header.get("merged_logs", [])) if header else []
+            if generation is not None and f"{generation:016x}" in merged:
+                os.remove(log_path)
+                return False
+            if len(records):
+                parts = [columns] if columns is not None else []
+                parts.append({name: records[name] for name in self._stream.column_names})
+                combined = {
+                    name: np.concatenate([part[name] for part in parts])
+                    for name in self._stream.column_names
+                }
+                if generation is not None:
+                    merged.append(f"{generation:016x}")
+                self._write_seg(date, combined, merged)
+            os.remove(log_path)
+            return bool(len(records))
+
+    def seal_before(self, date: str) -> int:
+        """date 이전 일자의 봉인 안 된 log 를 모두 봉인한다."""
+        return sum(1 for day in self.days() if day < date and self.seal(day))
+
+    def prune_before(self, date: str) -> int:
+        """date 이전 일자 디렉터리를 지운다 (보관 기간)."""
+        removed = 0
+        for day in self.days():
+            if day >= date:
+                continue
+            with self._lock:
+                handle = self._handles.pop(day, None)
+                if handle is not None:
+                    handle.close()
+            for path in (self._log_path(day), self._seg_path(day)):
+                if os.path.exists(path):
+                    os.remove(path)
+            day_dir = self._day_dir(day)
+            if os.path.isdir(day_dir) and not os.listdir(day_dir):
+                shutil.rmtree(day_dir, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def migrate_legacy_sqlite(self, filename: str, query: str, since: str) -> Optional[int]:
+        """base_dir 의 이전 SQLite 저장 파일 행을 일자 seg 로 옮긴 뒤 파일(+ -wal/-shm/-journal)을 지운다.
+
+        query 는 since 를 인자로 받아 (trade_date, code, hhmmss_int, *fields) 를 trade_date 순으로
+        돌려줘야 한다 — since 이전 일자는 보관 기간이 지나 옮기지 않고 파일과 함께 버린다.
+        변환 직후 파일 삭제 전에 죽어도 중복 병합하지 않도록, 이미 log/seg 가 있는 일자는
+        건너뛴다. 옮긴 행 수를 돌려주고 파일이 없으면 None. 읽기·쓰기에 실패하면 예외를 올리고
+        파일은 남겨 다음 기동에서 다시 시도한다.
+        """
+        db_path = os.path.join(self._base_dir, filename)
+        if not os.path.isfile(db_path):
+            return None
+        existing = set(self.days())
+        migrated = 0
+        conn = sqlite3.connect(db_path)
+        try:
+            # 일자 단위로 흘려 보내 30일치를 한꺼번에 메모리에 올리지 않는다
+            for date, rows in groupby(conn.execute(query, (since,)), key=lambda row: row[0]):
+                if date in existing:
+                    continue
+                migrated += self.append(date, [tuple(row[1:]) for row in rows])
+                self.seal(date)
+        finally:
+            conn.close()
+        for path in (db_path, f"{db_path}-wal", f"{db_path}-shm", f"{db_path}-journal"):
+            if os.path.isfile(path):
+                os.remove(path)
+        return migrated
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+    # ── 읽기 ───────────────────────────────────────────────────────
+
+    def codes(self, date: str) -> List[str]:
+        """date 에 기록된 종목 (seg 인덱스 ∪ 봉인 전 log)."""
+        found = set()
+        seg_path = self._seg_path(date)
+        if os.path.exists(seg_path):
+            with open(seg_path, "rb") as f:
+                header, _ = self._read_seg_header(f)
+            found.update(header["index"])
+        log_path = self._log_path(date)
+        if os.path.exists(log_path):
+            _, records = self._read_log(log_path)
+            found.update(code.decode() for code in np.unique(records["code"]))
+        return sorted(found)
+
+    def read(
+        self,
+        date: str,
+        codes: Iterable[str],
+        *,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """종목별 {컬럼: 배열} (시각 오름차순, 같은 시각은 기록 순서). 없는 종목은 키가 없다."""
+        wanted = list(dict.fromkeys(codes))
+        lo = int(start_time) if start_time else None
+        hi = int(end_time) if end_time else None
+        result: Dict[str, List[Dict[str, np.ndarray]]] = {}
+        merged: List[str] = []
+
+        seg_path = self._seg_path(date)
+        if os.path.exists(seg_path):
+            with open(seg_path, "rb") as f:
+                header, data_start = self._read_seg_header(f)
+                merged = list(header.get("merged_logs", []))
+                index = header["index"]
+                for code in wanted:
+                    block = index.get(code)
+                    if not block:
+                        continue
+                    start, count = block
+                    result.setdefault(code, []).append(
+                        self._read_block(f, header, data_start, start, count)
+                    )
+
+        log_path = self._log_path(date)
+        if os.path.exists(log_path):
+            generation, records = self._read_log(log_path)
+            if len(records) and (generation is None or f"{generation:016x}" not in merged):
+                # 봉인 전 log: 한 번 (code, time) 정렬한 뒤 종목 경계를 이분 탐색으로 자른다
+                order = np.lexsort((records["time"], records["code"]))
+                ordered = {name: records[name][order] for name in self._stream.column_names}
+                codes_col = ordered["code"]
+                for code in wanted:
+                    key = code.encode()
+                    left = int(np.searchsorted(codes_col, key, side="left"))
+                    right = int(np.searchsorted(codes_col, key, side="right"))
+                    if right > left:
+                        result.setdefault(code, []).append(
+                            {name: col[left:right] for name, col in ordered.items()}
+                        )
+
+        out: Dict[str, Dict[str, np.ndarray]] = {}
+        for code, parts in result.items():
+            columns = (
+                parts[0] if len(parts) == 1
+                else self._sorted_by_time({
+                    name: np.concatenate([p[name] for p in parts]) for name in self._stream.column_names
+                })
+            )
+            times = columns["time"]
+            left = 0 if lo is None else int(np.searchsorted(times, lo, side="left"))
+            right = len(times) if hi is None else int(np.searchsorted(times, hi, side="right"))
+            if right > left:
+                out[code] = {name: col[left:right] for name, col in columns.items()}
+        return out
+
+    # ── 내부: log ──────────────────────────────────────────────────
+
+    def _fill_crc(self, records: np.ndarray) -> None:
+        body = self._dtype.itemsize - 4
+        raw = records.view(np.uint8).reshape(len(records), self._dtype.itemsize)
+        records["crc"] = [zlib.crc32(raw[i, :body].tobytes()) for i in range(len(records))]
+
+    def _valid_prefix(self, records: np.ndarray) -> int:
+        """append-only 이므로 손상은 꼬리에만 생긴다 — 뒤에서부터 첫 온전한 레코드를 찾는다."""
+        body = self._dtype.itemsize - 4
+        raw = records.view(np.uint8).reshape(len(records), self._dtype.itemsize)
+        crcs = records["crc"]
+        end = len(records)
+        while end > 0 and zlib.crc32(raw[end - 1, :body].tobytes()) != int(crcs[end - 1]):
+            end -= 1
+        return end
+
+    def _read_log(self, path: str) -> Tuple[Optional[int], np.ndarray]:
+        """log 의 (세대 id, 온전한 레코드). 헤더가 깨졌으면 (None, 빈 배열)."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _LOG_HEADER.size:
+            return None, np.zeros(0, dtype=self._dtype)
+        magic, version, record_size, generation = _LOG_HEADER.unpack_from(data)
+        if magic != _LOG_MAGIC or version != _VERSION or record_size != self._dtype.itemsize:
+            self._logger.error(f"TickSegmentStore log 헤더 불일치 — 무시: {path}")
+            return None, np.zeros(0, dtype=self._dtype)
+        body = data[_LOG_HEADER.size:]
+        whole = len(body) // record_size
+        records = np.frombuffer(body[: whole * record_size], dtype=self._dtype)
+        valid = self._valid_prefix(records)
+        return generation, records[:valid]
+
+    def _open_log_for_append(self, date: str):
+        os.makedirs(self._day_dir(date), exist_ok=True)
+        path = self._log_path(date)
+        if os.path.exists(path):
+            generation, records = self._read_log(path)
+            if generation is not None:
+                good_size = _LOG_HEADER.size + len(records) * self._dtype.itemsize
+                if os.path.getsize(path) != good_size:
+                    self._logger.warning(
+                        f"TickSegmentStore log 꼬리 복구: {path} → {len(records)} records"
+                    )
+                    with open(path, "r+b") as f:
+                        f.truncate(good_size)
+                return open(path, "ab")
+            os.replace(path, path + ".corrupt")
+        handle = open(path, "ab")
+        generation = int.from_bytes(os.urandom(8), "little")
+        handle.write(_LOG_HEADER.pack(_LOG_MAGIC, _VERSION, self._dtype.itemsize, generation))
+        handle.flush()
+        return handle
+
+    # ── 내부: seg ──────────────────────────────────────────────────
+
+    def _sorted_by_time(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        order = np.argsort(columns["time"], kind="stable")
+        return {name: col[order] for name, col in columns.items()}
+
+    def _write_seg(self, date: str, columns: Dict[str, np.ndarray], merged_logs: List[str]) -> None:
+        order = np.lexsort((columns["time"], columns["code"]))
+        columns = {name: col[order] for name, col in columns.items()}
+        codes = columns["code"]
+        index: Dict[str, List[int]] = {}
+        if len(codes):
+            boundaries = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+            starts = np.concatenate([[0], boundaries])
+            ends = np.concatenate([boundaries, [len(codes)]])
+            for start, end in zip(starts, ends):
+                index[codes[start].decode()] = [int(start), int(end - start)]
+
+        layout = []
+        offset = 0
+        for name in self._stream.column_names:
+            dtype = self._dtype.fields[name][0]
+            layout.append({"name": name, "dtype": dtype.str, "offset": offset})
+            offset += dtype.itemsize * len(codes)
+            offset += (-offset) % 8
+        header = json.dumps({
+            "stream": self._stream.name,
+            "date": date,
+            "rows": int(len(codes)),
+            "columns": layout,
+            "index": index,
+            "merged_logs": merged_logs,
+        }).encode()
+
+        path = self._seg_path(date)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_SEG_PREFIX.pack(_SEG_MAGIC, _VERSION, 0, len(header)))
+            f.write(header)
+            f.write(b"\0" * ((-(_SEG_PREFIX.size + len(header))) % 8))
+            data_start = f.tell()
+            for column in layout:
+                f.seek(data_start + column["offset"])
+                f.write(np.ascontiguousarray(columns[column["name"]]).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read_seg_header(f) -> Tuple[dict, int]:
+        magic, version, _, header_len = _SEG_PREFIX.unpack(f.read(_SEG_PREFIX.size))
+        if magic != _SEG_MAGIC or version != _VERSION:
+            raise ValueError("unsupported tick segment")
+        header = json.loads(f.read(header_len).decode())
+        prefix = _SEG_PREFIX.size + header_len
+        return header, prefix + ((-prefix) % 8)
+
+    @staticmethod
+    def _read_block(f, header: dict, data_start: int, start: int, count: int) -> Dict[str, np.ndarray]:
+        block = {}
+        for column in header["columns"]:
+            dtype = np.dtype(column["dtype"])
+            f.seek(data_start + column["offset"] + start * dtype.itemsize)
+            block[column["name"]] = np.frombuffer(f.read(count * dtype.itemsize), dtype=dtype)
+        return block
+
+    def _read_seg_columns(self, date: str) -> Tuple[Optional[dict], Optional[Dict[str, np.ndarray]]]:
+        path = self._seg_path(date)
+        if not os.path.exists(path):
+            return None, None
+        with open(path, "rb") as f:
+            header, data_start = self._read_seg_header(f)
+            return header, self._read_block(f, header, data_start, 0, int(header["rows"]))
@@ -261,6 +261,15 @@ class VirtualTradeRepository:
                 f.write("1")
             logger.info("[마이그레이션] 레거시 데이터 마이그레이션 완료.")
 
+    def write_version(self) -> tuple[int, int]:
+        """trades/snapshots 변경 감지용 카운터. 값이 같으면 마지막 조회 이후 쓰기가 없었다.
+
+        이 연결의 누적 변경 행 수(total_changes)와 다른 연결의 커밋을 반영하는
+        PRAGMA data_version 의 쌍이라 전체를 다시 읽지 않고 O(1) 로 비교할 수 있다.
+        """
+        data_version = self._db.execute("PRAGMA data_version").fetchone()[0]
+        return int(data_version), int(self._db.total_changes)
+
     def _read(self) -> pd.DataFrame:
         df = pd.read_sql_query(_SELECT_TRADES, self._db, dtype={'code': str, 'sell_date': object})
         df['return_rate'] = df['return_rate'].fillna(0.0)
@@ -1253,6 +1262,10 @@ class VirtualTradeRepository:
         data = self._load_data()
         daily = data.get("daily", {})
 
+        # 같은 값으로 오늘 스냅샷을 다시 쓰지 않는다 (폴링마다 전체 재작성 → write_version 변동 방지)
+        if daily.get(today) == normalized_returns:
+            return
+
         if daily:
             prev_dates = [d for d in daily if d < today]
             if prev_dates:
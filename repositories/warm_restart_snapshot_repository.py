@@ -0,0 +1,214 @@
+# repositories/warm_restart_snapshot_repository.py
+"""
+웜 리스타트용 hot state 스냅샷 파일 저장소.
+
+크래시·배포 후 재기동 시 종목 마스터 / OHLCV / 지표 캐시 / 최신가 / 구독 장부를
+SQLite 재조회·재계산 없이 되살리기 위한 단일 바이너리 파일을 쓰고 읽는다.
+
+파일 레이아웃 (little-endian):
+  [magic 8B][version u16][reserved u16][meta_len u32][meta JSON][pad → 64B 정렬][sections...]
+  meta = {"trading_date", "created_at", "sections": {name: {kind, offset, nbytes, crc32, dtype, shape}}}
+  - kind="array": numpy 배열 원본 바이트 (64B 정렬) — 로드 시 mmap 위에 복사 없이 view 로 연다.
+  - kind="json" : UTF-8 JSON 문서 (종목 마스터·최신가·구독 장부처럼 작은 구조체).
+
+쓰기는 temp 파일 → fsync → os.replace 로 원자 교체한다 (utils.atomic_json 과 같은 방식).
+로드는 버전·기준일(trading_date)·섹션별 crc32 를 모두 통과해야 하며, 하나라도 어긋나면
+None 을 반환하고 호출 측은 콜드 스타트 경로로 간다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+_MAGIC = b"IVWSNAP1"
+_HEADER = struct.Struct("<8sHHI")
+_ALIGN = 64
+
+DEFAULT_SNAPSHOT_PATH = os.path.join("data", "warm_restart", "hot_state.snap")
+
+
+def _pad(size: int) -> int:
+    return (-size) % _ALIGN
+
+
+class HotStateSnapshot:
+    """mmap 으로 연 스냅샷. arrays 는 mmap 위 read-only view, documents 는 파싱된 JSON."""
+
+    def __init__(self, path: str, trading_date: str, created_at: float,
+                 arrays: Dict[str, np.ndarray], documents: Dict[str, Any],
+                 size_bytes: int, mapped: Optional[mmap.mmap] = None) -> None:
+        self.path = path
+        self.trading_date = trading_date
+        self.created_at = created_at
+        self.arrays = arrays
+        self.documents = documents
+        self.size_bytes = size_bytes
+        self._mapped = mapped
+
+    def close(self) -> None:
+        """배열 view 를 놓고 mmap 을 닫는다. 바깥에 view 가 남아 있으면 GC 에 맡긴다."""
+        self.arrays = {}
+        mapped, self._mapped = self._mapped, None
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+
+
+class WarmRestartSnapshotRepository:
+    """버전·기준일이 붙은 hot state 바이너리 스냅샷을 원자적으로 쓰고 mmap 으로 읽는다."""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH, logger=None) -> None:
+        self._path = path
+        self._logger = logger or logging.getLogger(__name__)
+        # 마지막 load() 결과 사유 — "ok" / "missing" / "version_mismatch" / "stale_trading_date" / "corrupt"
+        self.last_load_status: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def write(self, trading_date: str, *, arrays: Dict[str, np.ndarray],
+              documents: Dict[str, Any]) -> int:
+        """섹션들을 한 파일로 원자 저장하고 파일 크기(byte)를 반환한다."""
+        blobs = []
+        sections: Dict[str, dict] = {}
+        offset = 0
+        for name, array in arrays.items():
+            data = np.ascontiguousarray(array)
+            raw = data.tobytes()
+            sections[name] = {
+                "kind": "array", "offset": offset, "nbytes": len(raw), "crc32": zlib.crc32(raw),
+                "dtype": data.dtype.str, "shape": list(data.shape),
+            }
+            blobs.append(raw)
+            offset += len(raw) + _pad(len(raw))
+        for name, document in documents.items():
+            raw = json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            sections[name] = {"kind": "json", "offset": offset, "nbytes": len(raw), "crc32": zlib.crc32(raw)}
+            blobs.append(raw)
+            offset += len(raw) + _pad(len(raw))
+
+        meta = json.dumps({
+            "trading_date": trading_date,
+            "created_at": time.time(),
+            "sections": sections,
+        }, separators=(",", ":")).encode("utf-8")
+        preamble = _HEADER.pack(_MAGIC, self.FORMAT_VERSION, 0, len(meta)) + meta
+        preamble += b"\0" * _pad(len(preamble))
+
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self._path) + ".", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(preamble)
+                for raw in blobs:
+                    f.write(raw)
+                    f.write(b"\0" * _pad(len(raw)))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return len(preamble) + offset
+
+    def load(self, trading_date: str) -> Optional[HotStateSnapshot]:
+        """trading_date 와 같은 날 만든 유효한 스냅샷을 mmap 으로 연다. 아니면 None."""
+        if not os.path.exists(self._path):
+            self.last_load_status = "missing"
+            return None
+        try:
+            with open(self._path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self._reject("corrupt", f"열기 실패: {e}")
+            return None
+
+        try:
+            snapshot = self._parse(mapped, trading_date)
+        except Exception as e:
+            snapshot = None
+            self._reject("corrupt", f"파싱 실패: {e}")
+        if snapshot is None:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+            return None
+        self.last_load_status = "ok"
+        return snapshot
+
+    def _parse(self, mapped: mmap.mmap, trading_date: str) -> Optional[HotStateSnapshot]:
+        if len(mapped) < _HEADER.size:
+            self._reject("corrupt", "헤더 길이 부족")
+            return None
+        magic, version, _reserved, meta_len = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            self._reject("corrupt", "magic 불일치")
+            return None
+        if version != self.FORMAT_VERSION:
+            self._reject("version_mismatch", f"포맷 버전 {version} != {self.FORMAT_VERSION}")
+            return None
+        meta = json.loads(mapped[_HEADER.size:_HEADER.size + meta_len])
+        if meta.get("trading_date") != trading_date:
+            self._reject("stale_trading_date", f"기준일 {meta.get('trading_date')} != {trading_date}")
+            return None
+
+        base = _HEADER.size + meta_len
+        base += _pad(base)
+        view = memoryview(mapped)
+        arrays: Dict[str, np.ndarray] = {}
+        documents: Dict[str, Any] = {}
+        try:
+            for name, section in meta["sections"].items():
+                start = base + int(section["offset"])
+                end = start + int(section["nbytes"])
+                if end > len(mapped):
+                    self._reject("corrupt", f"{name} 섹션이 파일 끝을 넘습니다")
+                    return None
+                with view[start:end] as chunk:
+                    if zlib.crc32(chunk) != section["crc32"]:
+                        self._reject("corrupt", f"{name} 섹션 crc32 불일치")
+                        return None
+                    if section["kind"] == "json":
+                        documents[name] = json.loads(bytes(chunk))
+                        continue
+                dtype = np.dtype(section["dtype"])
+                shape = tuple(section["shape"])
+                count = int(np.prod(shape))
+                if count == 0:
+                    arrays[name] = np.empty(shape, dtype=dtype)
+                else:
+                    arrays[name] = np.frombuffer(mapped, dtype=dtype, count=count, offset=start).reshape(shape)
+        finally:
+            view.release()
+        return HotStateSnapshot(
+            path=self._path,
+            trading_date=trading_date,
+            created_at=float(meta.get("created_at") or 0.0),
+            arrays=arrays,
+            documents=documents,
+            size_bytes=len(mapped),
+            mapped=mapped,
+        )
+
+    def _reject(self, status: str, reason: str) -> None:
+        self.last_load_status = status
+        self._logger.warning(f"[WarmRestartSnapshot] 스냅샷 무시 ({status}): {reason} — {self._path}")
@@ -31,7 +31,7 @@ from repositories.stock_code_repository import StockCodeRepository
 from services.stock_query_service import StockQueryService
 from core.market_clock import MarketClock
 from core.performance_profiler import PerformanceProfiler
-from core.scan_rejection_counter import EntryRejectionCounter, StrategyCalcFailureCounter
+from core.scan_funnel import FunnelCycleStats, ScanFunnel
 
 from scheduler.strategy_scheduler_store import StrategySchedulerStore, SCHEDULER_DB_FILE
 from services.price_subscription_service import SubscriptionPriority
@@ -141,6 +141,8 @@ class StrategyScheduler:
         live_expansion_gate_service=None,
         market_regime_service=None,
         price_stream_service=None,
+        rejection_distribution_service=None,
+        rejection_log_sample_every: int = 1,
     ):
         self._virtual_trade_service = virtual_trade_service
         self._oes = order_execution_service
@@ -160,6 +162,9 @@ class StrategyScheduler:
         self._account_snapshot_cache = account_snapshot_cache
         self._position_sizer = position_sizing_service
         self._price_stream_svc = price_stream_service
+        # scan 깔때기 일별 거절 분포 전달처 + 전략 거절 로그 샘플링 (1=모두, N=reason별 N건당 1건, 0=끔)
+        self._rejection_distribution = rejection_distribution_service
+        self._rejection_log_sample_every = int(rejection_log_sample_every)
         self._live_expansion_gate = live_expansion_gate_service
         # P2 2-4 event-driven shadow 구독/저널링은 EventShadowManager 로 분리(S-9).
         self._event_shadow_manager = EventShadowManager(
@@ -365,6 +370,9 @@ class StrategyScheduler:
 
     def register(self, config: StrategySchedulerConfig):
         self._strategies.append(config)
+        funnel = self._funnel_for(config)
+        if funnel is not None:
+            funnel.log_sample_every = self._rejection_log_sample_every
         self._logger.info(
             f"[Scheduler] 전략 등록: {config.strategy.name} "
             f"(주기={config.interval_minutes}분, 최대포지션={config.max_positions})"
@@ -697,16 +705,16 @@ class StrategyScheduler:
         sells_dispatched = False
         if holdings:
             t_exit = self._pm.start_timer()
-            strategy_logger = getattr(cfg.strategy, "strategy_logger", None)
-            exit_failure_counter = StrategyCalcFailureCounter() if strategy_logger is not None else None
-            if exit_failure_counter is not None:
-                strategy_logger.addHandler(exit_failure_counter)
+            funnel = self._funnel_for(cfg)
+            exit_cycle = funnel.begin_cycle(self._funnel_trading_date(), kind="exit") if funnel is not None else None
             t_exit_metric = time.monotonic()
             try:
                 sell_signals = await cfg.strategy.check_exits(holdings)
             finally:
-                if exit_failure_counter is not None:
-                    strategy_logger.removeHandler(exit_failure_counter)
+                exit_stats = (
+                    funnel.end_cycle(exit_cycle, candidate_count=len(holdings))
+                    if funnel is not None else FunnelCycleStats(kind="exit")
+                )
             self._pm.log_timer(f"{name}.check_exits({len(holdings)}건)", t_exit)
             self._logger.info({
                 "event": "exit_metrics",
@@ -714,13 +722,10 @@ class StrategyScheduler:
                 "latency_ms": round((time.monotonic() - t_exit_metric) * 1000.0, 3),
                 "holding_count": len(holdings),
                 "signal_count": len(sell_signals or []),
-                "calc_failures": exit_failure_counter.snapshot() if exit_failure_counter is not None else {},
-                "calc_failure_count": exit_failure_counter.total_count() if exit_failure_counter is not None else 0,
-                "calc_failure_code_count": exit_failure_counter.failed_code_count() if exit_failure_counter is not None else 0,
-                "calc_failure_rate_pct": (
-                    exit_failure_counter.failure_rate_pct(len(holdings))
-                    if exit_failure_counter is not None else 0.0
-                ),
+                "calc_failures": exit_stats.calc_failures,
+                "calc_failure_count": exit_stats.calc_failure_count,
+                "calc_failure_code_count": exit_stats.calc_failure_code_count,
+                "calc_failure_rate_pct": exit_stats.failure_rate_pct(len(holdings)),
             })
             # P2 2-2 후속: signal-to-order latency 측정용 — 미stamp 신호에만 현재 시각 부여.
             # P3-4 Phase 2c: signal_id / strategy_id 도 동일 시점에 자동 stamp.
@@ -775,15 +780,10 @@ class StrategyScheduler:
             return
 
         t_scan = self._pm.start_timer()
-        # P2 2-2 1차: scan cycle 성능 계측. entry_rejected 로그를 카운트하기 위해
-        # strategy logger 에 EntryRejectionCounter 를 일시 attach. 예외에도 detach 보장.
-        strategy_logger = getattr(cfg.strategy, "strategy_logger", None)
-        rejection_counter = EntryRejectionCounter() if strategy_logger is not None else None
-        scan_failure_counter = StrategyCalcFailureCounter() if strategy_logger is not None else None
-        if rejection_counter is not None:
-            strategy_logger.addHandler(rejection_counter)
-        if scan_failure_counter is not None:
-            strategy_logger.addHandler(scan_failure_counter)
+        # P2 2-2: scan cycle 성능 계측. 거절 사유·계산 실패는 전략이 funnel 에 직접 누적하고
+        # 여기서는 cycle 경계만 긋는다 (로그 레벨·샘플링과 무관).
+        funnel = self._funnel_for(cfg)
+        scan_cycle = funnel.begin_cycle(self._funnel_trading_date(), kind="scan") if funnel is not None else None
         # P2 2-2 2차: scan cycle 동안의 현재가/캐시 조회 지표 delta 산출
         sqs_snapshot_before = {}
         sqs_snapshot_fn = getattr(self._sqs, "price_lookup_stats_snapshot", None) if self._sqs is not None else None
@@ -795,11 +795,10 @@ class StrategyScheduler:
         t_scan_metric = time.monotonic()
         try:
             buy_signals = await cfg.strategy.scan()
-        finally:
-            if rejection_counter is not None:
-                strategy_logger.removeHandler(rejection_counter)
-            if scan_failure_counter is not None:
-                strategy_logger.removeHandler(scan_failure_counter)
+        except BaseException:
+            if funnel is not None:
+                funnel.abort_cycle(scan_cycle)
+            raise
         # P2 2-2 후속: signal-to-order latency 측정용 — scan 직후 stamp.
         # P3-4 Phase 2c: signal_id / strategy_id 도 동일 시점에 자동 stamp.
         buy_signals = list(buy_signals or [])
@@ -810,6 +809,11 @@ class StrategyScheduler:
             candidate_count = len(cfg.strategy.current_candidate_codes() or [])
         except Exception:
             candidate_count = 0
+        scan_stats = (
+            funnel.end_cycle(scan_cycle, candidate_count=candidate_count, signal_count=len(buy_signals))
+            if funnel is not None else FunnelCycleStats(kind="scan")
+        )
+        self._report_funnel_rejections(cfg, funnel)
         lookup_stats_delta: Dict[str, int] = {}
         if callable(sqs_snapshot_fn):
             try:
@@ -826,14 +830,12 @@ class StrategyScheduler:
             "latency_ms": round((time.monotonic() - t_scan_metric) * 1000.0, 3),
             "candidate_count": candidate_count,
             "signal_count": len(buy_signals),
-            "rejected_reasons": rejection_counter.snapshot() if rejection_counter is not None else {},
-            "calc_failures": scan_failure_counter.snapshot() if scan_failure_counter is not None else {},
-            "calc_failure_count": scan_failure_counter.total_count() if scan_failure_counter is not None else 0,
-            "calc_failure_code_count": scan_failure_counter.failed_code_count() if scan_failure_counter is not None else 0,
-            "calc_failure_rate_pct": (
-                scan_failure_counter.failure_rate_pct(candidate_count)
-                if scan_failure_counter is not None else 0.0
-            ),
+            "rejected_reasons": scan_stats.rejected_reasons,
+            "rejected_count": scan_stats.rejected_count,
+            "calc_failures": scan_stats.calc_failures,
+            "calc_failure_count": scan_stats.calc_failure_count,
+            "calc_failure_code_count": scan_stats.calc_failure_code_count,
+            "calc_failure_rate_pct": scan_stats.failure_rate_pct(candidate_count),
             "lookup_stats_delta": lookup_stats_delta,
         })
 
@@ -881,6 +883,39 @@ class StrategyScheduler:
         self._pm.log_timer(f"{name}.run_strategy", t_run)
         self._logger.info(f"[Scheduler] {name} 실행 완료")
 
+    @staticmethod
+    def _funnel_for(cfg: StrategySchedulerConfig) -> Optional[ScanFunnel]:
+        funnel = getattr(cfg.strategy, "funnel", None)
+        return funnel if isinstance(funnel, ScanFunnel) else None
+
+    def _funnel_trading_date(self) -> str:
+        return self._tm.get_current_kst_time().strftime("%Y%m%d")
+
+    def _report_funnel_rejections(self, cfg: StrategySchedulerConfig, funnel: Optional[ScanFunnel]) -> None:
+        """funnel 에 쌓인 거절 수를 일별 거절 분포 서비스로 넘긴다 (cycle 밖 이벤트 평가분 포함)."""
+        if funnel is None or self._rejection_distribution is None:
+            return
+        counts = funnel.take_unreported_rejections()
+        if not counts:
+            return
+        # 분포 서비스의 기존 키(로거 이름 기반)와 맞춘다: "strategy.OneilPocketPivot" → "OneilPocketPivot"
+        logger_name = getattr(getattr(cfg.strategy, "strategy_logger", None), "name", "") or ""
+        parts = logger_name.split(".", 1)
+        strategy_key = parts[1] if parts[0] == "strategy" and len(parts) > 1 else cfg.strategy.name
+        try:
+            self._rejection_distribution.record_counts(strategy_key, counts, date=funnel.trading_date)
+        except Exception as e:
+            self._logger.warning(f"[Scheduler] 거절 분포 전달 실패 ({cfg.strategy.name}): {e}")
+
+    def get_funnel_summaries(self, trading_date: Optional[str] = None) -> Dict[str, dict]:
+        """전략별 거래일 깔때기 누적 (scan cycle 수, 후보, 신호, 거절 사유, 계산 실패)."""
+        summaries = {}
+        for cfg in self._strategies:
+            funnel = self._funnel_for(cfg)
+            if funnel is not None:
+                summaries[cfg.strategy.name] = funnel.daily_summary(trading_date)
+        return summaries
+
     def _log_position_limit_rejections(
         self,
         cfg: StrategySchedulerConfig,
@@ -38,21 +38,21 @@ def build_parser() -> argparse.ArgumentParser:
         "--execution-strength-source",
         choices=("rest_scalar", "es_db"),
         default="rest_scalar",
-        help="체결강도 출처: rest_scalar=EOD REST 스칼라, es_db=장중 WS 샘플링 DB(미스 종목은 스칼라 폴백)",
+        help="체결강도 출처: rest_scalar=EOD REST 스칼라, es_db=장중 WS 샘플링 세그먼트(미스 종목은 스칼라 폴백)",
     )
     parser.add_argument(
-        "--execution-strength-db-path",
-        default="data/execution_strength/execution_strength.db",
+        "--execution-strength-dir",
+        default="data/execution_strength",
     )
     parser.add_argument(
         "--orderbook-source",
         choices=("none", "orderbook_db"),
         default="none",
-        help="최우선 호가·잔량 출처: orderbook_db=기존 PRICE 틱 샘플링 DB",
+        help="최우선 호가·잔량 출처: orderbook_db=기존 PRICE 틱 샘플링 세그먼트",
     )
     parser.add_argument(
-        "--orderbook-db-path",
-        default="data/orderbook_snapshots/orderbook_snapshots.db",
+        "--orderbook-dir",
+        default="data/orderbook_snapshots",
     )
     parser.add_argument("--output-dir", default="data/backtest_microstructure")
     parser.add_argument("--paper", action="store_true", default=False)
@@ -76,8 +76,8 @@ async def _run(args: argparse.Namespace) -> int:
         stock_query_service=sqs,
         program_provider=_get_program_provider(sqs),
         program_db_path=args.program_db_path,
-        execution_strength_db_path=args.execution_strength_db_path,
-        orderbook_db_path=args.orderbook_db_path,
+        execution_strength_dir=args.execution_strength_dir,
+        orderbook_dir=args.orderbook_dir,
     )
     payload = await service.capture(
         codes=_parse_codes(args.codes),
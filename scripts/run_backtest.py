@@ -208,9 +208,100 @@ def _parse_args() -> argparse.Namespace:
         dest="pit_min_trading_value",
         help="상폐 후보 합류 시 5일 평균 거래대금 하한(원). 0이면 전략 자체 필터에 위임.",
     )
+    parser.add_argument(
+        "--prescreen",
+        choices=("off", "on", "verify"),
+        default="off",
+        help=(
+            "전략이 선언한 벡터화 후보 프리스크린(backtest_prescreen) 사용. on: 일봉 필요조건을 "
+            "통과한 (거래일, 종목)만 scan. verify: on + 표본 거래일은 전체 scan 으로 시그널 일치 검증."
+        ),
+    )
+    parser.add_argument(
+        "--portfolio",
+        action="store_true",
+        default=False,
+        help=(
+            "포트폴리오 백테스트 — --portfolio-strategies(기본: 활성 전략 전체)를 하나의 replay "
+            "컨텍스트·장부로 거래일마다 함께 진행하고, 전략별 평가는 동시에 실행한다."
+        ),
+    )
+    parser.add_argument(
+        "--portfolio-strategies",
+        default=None,
+        dest="portfolio_strategies",
+        help="포트폴리오 백테스트 전략 키 (쉼표 구분). 미지정 시 활성 전략 전체.",
+    )
+    parser.add_argument(
+        "--portfolio-compare-single",
+        action="store_true",
+        default=False,
+        dest="portfolio_compare_single",
+        help="포트폴리오 실행 후 각 전략을 별도 replay 컨텍스트로 단독 실행해 wall time 합계와 비교.",
+    )
+    parser.add_argument(
+        "--cache-retain-days",
+        type=int,
+        default=1,
+        dest="cache_retain_days",
+        help="포트폴리오 백테스트 공유 replay 캐시에 남길 최근 거래일 수 (기본 1 — 지난 거래일 분봉은 버림).",
+    )
+    parser.add_argument(
+        "--cache-budget-mb",
+        type=int,
+        default=512,
+        dest="cache_budget_mb",
+        help="replay 분봉/일봉/레짐 캐시 전체 메모리 상한 MB (기본 512, 0 이면 상한 없이 집계만). "
+             "넘으면 현재 거래일 외 항목을 LRU 로 버린다.",
+    )
+    parser.add_argument(
+        "--prescreen-verify-every",
+        type=int,
+        default=5,
+        dest="prescreen_verify_every",
+        help="--prescreen verify 시 N 거래일마다 1일 검증 (기본 5).",
+    )
     return parser.parse_args()
 
 
+def _build_candidate_prescreen(
+    strategy: Any,
+    *,
+    mode: str,
+    replay_sqs: Any,
+    dates: list[str],
+    verify_every: int,
+) -> Any | None:
+    """--prescreen 모드에 따라 BacktestCandidatePrescreen 을 만든다. 전략이 선언하지 않으면 None."""
+    if mode == "off":
+        return None
+    declared = strategy.backtest_prescreen()
+    if declared is None:
+        print(f"[WARN] {strategy.name} 은 backtest_prescreen 을 선언하지 않아 프리스크린 없이 실행합니다.")
+        return None
+    from services.backtest_candidate_prescreen import BacktestCandidatePrescreen
+
+    return BacktestCandidatePrescreen(
+        declared,
+        stock_query_service=replay_sqs,
+        dates=dates,
+        verify_every=verify_every if mode == "verify" else 0,
+    )
+
+
+def _parse_portfolio_strategies(value: str | None) -> list[str]:
+    """--portfolio-strategies → 전략 키 목록 (미지정 시 활성 전략 전체, 입력 순서 유지)."""
+    if not value:
+        return list(ACTIVE_BACKTEST_STRATEGIES)
+    keys = list(dict.fromkeys(key.strip() for key in str(value).split(",") if key.strip()))
+    unknown = [key for key in keys if key not in ACTIVE_BACKTEST_STRATEGIES]
+    if unknown:
+        raise ValueError(f"지원하지 않는 포트폴리오 전략입니다: {', '.join(unknown)}")
+    if not keys:
+        raise ValueError("--portfolio-strategies 에 전략이 없습니다.")
+    return keys
+
+
 def _build_dates(args: argparse.Namespace) -> list[str]:
     if args.dates:
         return [date.strip() for date in str(args.dates).split(",") if date.strip()]
@@ -328,10 +419,24 @@ def _wrap_pit_universe(
     )
 
 
+@dataclass(frozen=True)
+class _ReplayContext:
+    """한 번의 백테스트 실행이 공유하는 replay 서비스 + bar provider 묶음."""
+
+    replay_sqs: Any
+    bar_provider: Any
+    mtm_bar_provider: Any
+
+    @property
+    def cache_targets(self) -> list[Any]:
+        return [self.replay_sqs, self.bar_provider, self.mtm_bar_provider]
+
+
 def _build_replay_bar_providers(
     replay_sqs: Any,
     *,
     microstructure_dir: str | None = None,
+    cache_budget: Any | None = None,
 ) -> tuple[Any, Any]:
     from services.backtest_replay_adapter import (
         StockQueryDailyMtmBarProvider,
@@ -342,8 +447,28 @@ def _build_replay_bar_providers(
         StockQueryIntradayReplayBarProvider(
             replay_sqs,
             microstructure_dir=microstructure_dir,
+            cache_budget=cache_budget,
         ),
-        StockQueryDailyMtmBarProvider(replay_sqs),
+        StockQueryDailyMtmBarProvider(replay_sqs, cache_budget=cache_budget),
+    )
+
+
+def _build_cache_budget(args: argparse.Namespace):
+    from services.backtest_cache_budget import BacktestCacheBudget
+
+    budget_mb = int(getattr(args, "cache_budget_mb", 0) or 0)
+    return BacktestCacheBudget(budget_mb * 1024 * 1024 if budget_mb > 0 else None)
+
+
+def _format_replay_cache_console_line(stats: dict[str, Any] | None) -> str | None:
+    if not stats:
+        return None
+    max_bytes = stats.get("max_bytes")
+    cap = f"{max_bytes / 1024 / 1024:,.0f}MB" if max_bytes else "무제한"
+    return (
+        f"replay 캐시: 상한 {cap}, 최대 {stats.get('peak_bytes', 0) / 1024 / 1024:,.1f}MB, "
+        f"hit {stats.get('hits', 0):,} / miss {stats.get('misses', 0):,} "
+        f"(hit {stats.get('hit_ratio', 0.0) * 100:.1f}%), 축출 {stats.get('evictions', 0):,}"
     )
 
 
@@ -581,6 +706,18 @@ def _format_console(result) -> str:
     saved_run = getattr(result, "saved_journal_run", None) or {}
     if saved_run.get("run_id"):
         lines.append(f"journal run: {saved_run['run_id']}")
+    prescreen = getattr(result, "prescreen", None)
+    if prescreen:
+        lines.append(
+            f"후보 프리스크린: {prescreen.get('prescreen')} "
+            f"scan {prescreen.get('pairs_kept', 0):,}/{prescreen.get('pairs_total', 0):,} 쌍 "
+            f"(skip {prescreen.get('skip_ratio', 0.0) * 100:.1f}%, "
+            f"마스크 {prescreen.get('mask_build_ms', 0.0):,.0f}ms, "
+            f"검증 {prescreen.get('verified_dates', 0)}일)"
+        )
+    replay_cache_line = _format_replay_cache_console_line(getattr(result, "replay_cache", None))
+    if replay_cache_line:
+        lines.append(replay_cache_line)
     monte_carlo = getattr(result, "monte_carlo", None)
     if monte_carlo:
         lines.extend(_format_monte_carlo_console_lines(monte_carlo))
@@ -647,6 +784,8 @@ def _result_to_payload(result) -> dict[str, Any]:
         "journal_records": result.journal_records,
         "portfolio": result.portfolio,
         "saved_journal_run": getattr(result, "saved_journal_run", {}),
+        "prescreen": getattr(result, "prescreen", None) or None,
+        "replay_cache": getattr(result, "replay_cache", None),
         "execution_bar_policy": getattr(result, "execution_bar_policy", ""),
         "monte_carlo": getattr(result, "monte_carlo", None),
         "profitability_gate": getattr(result, "profitability_gate", None),
@@ -660,6 +799,65 @@ def _format_json(result) -> str:
     return json.dumps(payload, ensure_ascii=False, indent=2)
 
 
+def _format_portfolio_console(result) -> str:
+    portfolio = result.portfolio or {}
+    positions = portfolio.get("positions") or {}
+    lines = [
+        "[PORTFOLIO BACKTEST RESULT]",
+        f"전략: {', '.join(result.strategy_results)} ({len(result.strategy_results)}개)",
+        f"기간: {result.dates[0]} ~ {result.dates[-1]} ({len(result.dates)}일)",
+    ]
+    for name, strategy_result in result.strategy_results.items():
+        buy_count = sum(1 for report in strategy_result.execution_reports if report.order.side.value == "BUY")
+        sell_count = sum(1 for report in strategy_result.execution_reports if report.order.side.value == "SELL")
+        lines.append(
+            f"  - {name}: BUY {buy_count} / SELL {sell_count} / 기록 {len(strategy_result.journal_records)} "
+            f"/ 평가 {result.strategy_eval_sec.get(name, 0.0):.2f}s"
+        )
+    lines.extend([
+        f"보유 종목: {len(positions)}",
+        f"현금: {portfolio.get('cash', 0):,.0f}",
+        f"가용현금: {portfolio.get('available_cash', 0):,.0f}",
+        f"실현손익(순): {portfolio.get('realized_net_pnl', 0):,.0f}",
+        f"wall time: {result.wall_time_sec:.2f}s",
+    ])
+    if result.single_run_wall_sec:
+        single_total = sum(result.single_run_wall_sec.values())
+        speedup = single_total / result.wall_time_sec if result.wall_time_sec else 0.0
+        lines.append(f"단독 실행 합계: {single_total:.2f}s (포트폴리오 대비 {speedup:.1f}x)")
+    cache = result.cache or {}
+    if cache:
+        line = (
+            f"공유 캐시: 보존 {cache.get('retain_days')}거래일, 상주 {cache.get('resident_entries', 0):,} "
+            f"/ 축출 {cache.get('evicted_entries', 0):,}"
+        )
+        regime = cache.get("regime")
+        if regime:
+            line += f", 레짐 hit {regime.get('hits', 0)} / miss {regime.get('misses', 0)}"
+        lines.append(line)
+    replay_cache_line = _format_replay_cache_console_line(getattr(result, "replay_cache", None))
+    if replay_cache_line:
+        lines.append(replay_cache_line)
+    return "\n".join(lines)
+
+
+def _format_portfolio_json(result) -> str:
+    payload = {
+        "dates": result.dates,
+        "portfolio": result.portfolio,
+        "wall_time_sec": result.wall_time_sec,
+        "strategy_eval_sec": result.strategy_eval_sec,
+        "single_run_wall_sec": result.single_run_wall_sec or None,
+        "cache": result.cache,
+        "replay_cache": getattr(result, "replay_cache", None),
+        "strategies": {
+            name: _result_to_payload(strategy_result)
+            for name, strategy_result in result.strategy_results.items()
+        },
+    }
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
 def _format_walk_forward_console(result) -> str:
     summary = result.summary or {}
     lines = [
@@ -673,6 +871,9 @@ def _format_walk_forward_console(result) -> str:
         f"검증 체결 수: {summary.get('test_execution_count', 0)}",
         f"검증 거부 기록: {summary.get('test_rejected_count', 0)}",
     ]
+    replay_cache_line = _format_replay_cache_console_line(getattr(result, "replay_cache", None))
+    if replay_cache_line:
+        lines.append(replay_cache_line)
     monte_carlo = getattr(result, "monte_carlo", None)
     if monte_carlo:
         lines.extend(_format_monte_carlo_console_lines(monte_carlo))
@@ -685,6 +886,7 @@ def _format_walk_forward_console(result) -> str:
 def _format_walk_forward_json(result) -> str:
     payload = {
         "summary": result.summary,
+        "replay_cache": getattr(result, "replay_cache", None),
         "monte_carlo": getattr(result, "monte_carlo", None),
         "profitability_gate": getattr(result, "profitability_gate", None),
         "segments": [
@@ -1470,6 +1672,66 @@ def _build_execution_simulator(args: argparse.Namespace):
     ))
 
 
+async def _run_portfolio_backtest(
+    args: argparse.Namespace,
+    *,
+    dates: list[str],
+    make_runner: Callable[..., Any],
+    shared_context: _ReplayContext,
+    build_replay_context: Callable[[], _ReplayContext],
+    market_regime_service: Any | None,
+):
+    """--portfolio: 전략들을 한 장부·replay 컨텍스트로 함께 진행한다.
+
+    --portfolio-compare-single 이면 이어서 전략마다 새 replay 컨텍스트·장부로 단독 실행해
+    (기존 전략별 실행과 같은 조건) wall time 을 결과에 붙인다. 비교 실행은 journal 을 남기지 않는다.
+    """
+    import time
+
+    from services.backtest_execution_simulator import BacktestPortfolioLedger
+    from services.backtest_portfolio_runner import BacktestPortfolioRunner, SharedRegimeSnapshotCache
+
+    if args.walk_forward or args.ablation or args.parameter_stability:
+        raise ValueError("--portfolio 는 --walk-forward/--ablation/--parameter-stability 와 함께 쓸 수 없습니다.")
+
+    strategy_keys = _parse_portfolio_strategies(args.portfolio_strategies)
+    ledger = BacktestPortfolioLedger(initial_cash=args.initial_cash)
+    regime_cache = (
+        SharedRegimeSnapshotCache(market_regime_service) if market_regime_service is not None else None
+    )
+    runners = [
+        make_runner(
+            strategy_key=key,
+            ledger=ledger,
+            context=shared_context,
+            regime_service=regime_cache,
+            state_tag="_portfolio",
+        )
+        for key in strategy_keys
+    ]
+    print(f"[INFO] 포트폴리오 백테스트 실행 중... ({', '.join(strategy_keys)})\n")
+    result = await BacktestPortfolioRunner(
+        runners,
+        cache_targets=shared_context.cache_targets,
+        cache_retain_days=args.cache_retain_days,
+        regime_cache=regime_cache,
+    ).run(dates)
+
+    if args.portfolio_compare_single:
+        for key in strategy_keys:
+            print(f"[INFO] 단독 비교 실행: {key}")
+            runner = make_runner(
+                strategy_key=key,
+                context=build_replay_context(),
+                persist_journal=False,
+                state_tag="_single",
+            )
+            started = time.perf_counter()
+            await runner.run(dates)
+            result.single_run_wall_sec[runner.strategy_name] = round(time.perf_counter() - started, 4)
+    return result
+
+
 async def _run(args: argparse.Namespace) -> None:
     from scripts._bootstrap import bootstrap_pp_strategy, make_stdout_logger
     from config.config_loader import load_configs
@@ -1511,24 +1773,33 @@ async def _run(args: argparse.Namespace) -> None:
                 "상폐 종목 일봉 fallback 불가로 후보 평가가 제한됩니다."
             )
 
-    replay_sqs = StockQueryBacktestReplayService(
-        sqs,
-        program_provider=_get_program_provider(sqs),
-        delisted_ohlcv_store=delisted_ohlcv_store,
-    )
     backtest_clock = BacktestMarketClock.from_clock(
         market_clock,
         default_time=args.backtest_time,
     )
-    apply_backtest_snapshot_context(
-        universe_service,
-        stock_query_service=replay_sqs,
-        market_clock=backtest_clock,
-    )
-    bar_provider, mtm_bar_provider = _build_replay_bar_providers(
-        replay_sqs,
-        microstructure_dir=args.microstructure_dir,
-    )
+
+    cache_budget = _build_cache_budget(args)
+
+    def build_replay_context(budget=None) -> _ReplayContext:
+        context_sqs = StockQueryBacktestReplayService(
+            sqs,
+            program_provider=_get_program_provider(sqs),
+            delisted_ohlcv_store=delisted_ohlcv_store,
+            cache_budget=budget,
+        )
+        apply_backtest_snapshot_context(
+            universe_service,
+            stock_query_service=context_sqs,
+            market_clock=backtest_clock,
+        )
+        context_bar_provider, context_mtm_bar_provider = _build_replay_bar_providers(
+            context_sqs,
+            microstructure_dir=args.microstructure_dir,
+            cache_budget=budget,
+        )
+        return _ReplayContext(context_sqs, context_bar_provider, context_mtm_bar_provider)
+
+    shared_context = build_replay_context(cache_budget)
     indicator_service = getattr(sqs, "indicator_service", None)
     # 라이브 StrategyScheduler 의 마켓타이밍 진입 게이트를 백테스트에서도 적용한다.
     # (#766 이 게이트를 전략 → 스케줄러로 옮겨 백테스트 경로에서 사라졌다.)
@@ -1541,8 +1812,19 @@ async def _run(args: argparse.Namespace) -> None:
             segment=None,
             phase_dates: list[str] | None = None,
             variant=None,
+            strategy_key: str | None = None,
+            ledger: BacktestPortfolioLedger | None = None,
+            context: _ReplayContext | None = None,
+            regime_service=None,
+            persist_journal: bool = True,
+            state_tag: str = "",
         ) -> BacktestPeriodRunner:
-            ledger = BacktestPortfolioLedger(initial_cash=args.initial_cash)
+            strategy_key = strategy_key or args.strategy
+            context = context or shared_context
+            # 비교용 단독 실행 컨텍스트는 공유 예산 밖에서 돈다 (기존 전략별 실행 조건).
+            budget = cache_budget if context is shared_context else None
+            replay_sqs = context.replay_sqs
+            ledger = ledger or BacktestPortfolioLedger(initial_cash=args.initial_cash)
             risk_sizing = _build_risk_sizing_services(
                 use_risk_sizing=args.use_risk_sizing,
                 config=app_config,
@@ -1553,8 +1835,9 @@ async def _run(args: argparse.Namespace) -> None:
             state_suffix = f"_{segment.index}_{phase}" if segment is not None else ""
             if variant is not None:
                 state_suffix = f"{state_suffix}_ablation_{variant.name}"
+            state_suffix = f"{state_suffix}{state_tag}"
             variant_universe, variant_config = _build_ablation_overrides(
-                strategy_key=args.strategy,
+                strategy_key=strategy_key,
                 base_universe=universe_service,
                 variant=variant,
             )
@@ -1569,14 +1852,14 @@ async def _run(args: argparse.Namespace) -> None:
                     min_trading_value=args.pit_min_trading_value,
                 )
             strategy = _build_backtest_strategy(
-                strategy_key=args.strategy,
+                strategy_key=strategy_key,
                 replay_sqs=replay_sqs,
                 universe_service=variant_universe,
                 indicator_service=indicator_service,
                 backtest_clock=backtest_clock,
                 state_dir=tmp_dir,
                 state_suffix=state_suffix,
-                logger=logging.getLogger(f"backtest.{args.strategy}"),
+                logger=logging.getLogger(f"backtest.{strategy_key}"),
                 config=variant_config,
             )
             max_positions = (
@@ -1594,13 +1877,14 @@ async def _run(args: argparse.Namespace) -> None:
                 "cli": "scripts.run_backtest",
                 "initial_cash": args.initial_cash,
                 "max_positions": args.max_positions,
-                "strategy_key": args.strategy,
+                "strategy_key": strategy_key,
                 "backtest_time": args.backtest_time,
                 "execution_bar_policy": args.execution_bar_policy,
                 "market_slippage_pct": args.market_slippage_pct,
                 "spread_pct": args.spread_pct,
                 "microstructure_dir": args.microstructure_dir,
                 "use_risk_sizing": args.use_risk_sizing,
+                "prescreen": args.prescreen,
                 "output": args.output,
                 "walk_forward": segment is not None,
             }
@@ -1616,10 +1900,10 @@ async def _run(args: argparse.Namespace) -> None:
                 )
             return BacktestPeriodRunner(
                 strategy=strategy,
-                bar_provider=bar_provider,
+                bar_provider=context.bar_provider,
                 ledger=ledger,
                 simulator=_build_execution_simulator(args),
-                backtest_journal_repository=BacktestJournalRepository(),
+                backtest_journal_repository=BacktestJournalRepository() if persist_journal else None,
                 run_id="_".join(run_parts),
                 metadata=metadata,
                 config=BacktestPeriodRunnerConfig(
@@ -1628,13 +1912,36 @@ async def _run(args: argparse.Namespace) -> None:
                 ),
                 position_sizing_service=risk_sizing.position_sizing_service,
                 risk_gate_service=risk_sizing.risk_gate_service,
-                date_context_targets=[backtest_clock, replay_sqs],
-                mtm_bar_provider=mtm_bar_provider,
-                market_regime_service=market_regime_service,
+                date_context_targets=[backtest_clock, replay_sqs, *([budget] if budget else [])],
+                mtm_bar_provider=context.mtm_bar_provider,
+                market_regime_service=regime_service or market_regime_service,
                 market_resolver=market_resolver,
+                candidate_prescreen=_build_candidate_prescreen(
+                    strategy,
+                    mode=args.prescreen,
+                    replay_sqs=replay_sqs,
+                    dates=target_dates,
+                    verify_every=args.prescreen_verify_every,
+                ),
+                cache_budget=budget,
             )
 
-        if args.walk_forward:
+        if args.portfolio:
+            result = await _run_portfolio_backtest(
+                args,
+                dates=dates,
+                make_runner=make_runner,
+                shared_context=shared_context,
+                build_replay_context=build_replay_context,
+                market_regime_service=market_regime_service,
+            )
+            object.__setattr__(result, "replay_cache", cache_budget.stats())
+            rendered = (
+                _format_portfolio_json(result)
+                if args.output == "json"
+                else _format_portfolio_console(result)
+            )
+        elif args.walk_forward:
             config = BacktestWalkForwardConfig(
                 train_size=args.wf_train_days,
                 tune_size=args.wf_tune_days,
@@ -1652,6 +1959,7 @@ async def _run(args: argparse.Namespace) -> None:
                 runner_factory=runner_factory,
                 config=config,
             ).run(dates)
+            object.__setattr__(result, "replay_cache", cache_budget.stats())
             if args.monte_carlo:
                 _run_monte_carlo_for_walk_forward(result, args)
             if args.profitability_gate:
@@ -1697,6 +2005,7 @@ async def _run(args: argparse.Namespace) -> None:
                 )
             if args.profitability_gate:
                 _run_profitability_gate_for_result(result, app_config, initial_cash=args.initial_cash)
+            object.__setattr__(result, "replay_cache", cache_budget.stats())
             rendered = _format_json(result) if args.output == "json" else _format_console(result)
 
     if args.output_file:
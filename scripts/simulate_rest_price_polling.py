@@ -0,0 +1,349 @@
+"""CLI: 구독 슬롯 밖 종목 REST 폴링 정책 오프라인 재생 비교기.
+
+기록된 하루의 틱을 재생하며, WebSocket 슬롯을 받지 못한 종목의 현재가를 두 정책으로 갱신한다.
+  - fixed    : 전략 스캔 주기(scan_interval_sec)마다 전 종목을 30종목 배치로 조회 (기존 prefetch_prices)
+  - adaptive : RestPricePoller (트리거 근접·보유·장중 변동폭으로 종목별 갱신 주기, 1초 sweep, token bucket)
+
+재생 모델:
+  - 시나리오의 모든 종목을 구독 대기(REST 전용) 종목으로 본다.
+  - REST 응답은 호출 시각의 최신 틱 가격이며, 캐시의 received_at 은 호출 시각이다.
+  - staleness: 1초마다 종목별로 (현재 시각 - 캐시 갱신 시각)을 표본으로 모은다.
+    urgent 표본은 실제 가격이 트리거에서 trigger_band_pct 안에 있던 순간만 모은 것이다.
+  - 예산: 초당 호출 수를 `quotation_price` 한도(초당 8건) 대비 % 로 환산한다.
+  - 트리거 감지 지연: 실제 돌파 틱 시각 → 돌파 가격을 처음 받아온 REST 호출 시각.
+
+입력 형식은 scripts/simulate_subscription_allocation.py 와 같다 (`--ticks-jsonl` 또는
+`--orderbook-dir` + `--date`, `--scenario-json`).
+
+Examples:
+    python scripts/simulate_rest_price_polling.py \\
+        --orderbook-dir data/orderbook_snapshots --date 20260704 \\
+        --scenario-json reports/subscription_scenario_20260704.json \\
+        --output-json reports/rest_price_polling_20260704.json \\
+        --output-markdown reports/rest_price_polling_20260704.md
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from core.retry_queue.api_budget_limiter import DEFAULT_API_RATE_LIMITS_PER_SEC
+from repositories.latest_price_table import LatestPriceTable
+from scripts.simulate_subscription_allocation import (
+    Tick,
+    default_scenario,
+    load_orderbook_ticks,
+    load_scenario,
+    load_ticks_jsonl,
+)
+from services.rest_price_poller import RestPollConfig, RestPricePoller, build_rest_price_poller
+
+DEFAULT_SCAN_INTERVAL_SEC = 5.0
+BATCH_SIZE = 30
+QUOTATION_PRICE_RATE_PER_SEC = DEFAULT_API_RATE_LIMITS_PER_SEC["quotation_price"]
+
+
+# ── Simulation ───────────────────────────────────────────────────────────────
+
+def simulate(
+    ticks: List[Tick],
+    priorities: Dict[str, int],
+    trigger_levels: Dict[str, float],
+    *,
+    poller_config: Optional[RestPollConfig] = None,
+    adaptive: bool = True,
+    scan_interval_sec: float = DEFAULT_SCAN_INTERVAL_SEC,
+) -> Dict[str, Any]:
+    """한 정책으로 하루를 재생한다. adaptive=False 면 scan_interval_sec 고정 주기 전 종목 조회."""
+    config = poller_config or RestPollConfig()
+    table = LatestPriceTable()
+    last: Dict[str, float] = {}
+    opens: Dict[str, float] = {}
+    highs: Dict[str, float] = {}
+    lows: Dict[str, float] = {}
+    direction: Dict[str, int] = {}
+    crossed_at: Dict[str, float] = {}
+    detected_at: Dict[str, float] = {}
+    calls_by_second: Dict[int, int] = {}
+    ages: List[float] = []
+    urgent_ages: List[float] = []
+    codes = sorted(priorities)
+    requests = {
+        code: {
+            "priority": priorities[code],
+            "trigger_levels": [trigger_levels[code]] if code in trigger_levels else [],
+        }
+        for code in codes
+    }
+    poller = RestPricePoller(None, table.read, lambda: requests, config=config, clock=lambda: 0.0)
+
+    def _beyond(code: str, price: float) -> bool:
+        level = trigger_levels[code]
+        return price >= level if direction[code] > 0 else price <= level
+
+    def _fetch(batch: List[str], now: float) -> List[str]:
+        calls_by_second[int(now)] = calls_by_second.get(int(now), 0) + 1
+        refreshed = []
+        for code in batch:
+            if code not in last:
+                continue
+            table.write(
+                code, last[code],
+                high=highs[code], low=lows[code], open=opens[code],
+                received_at=now, quality_reason="rest_poll",
+            )
+            refreshed.append(code)
+            if code in crossed_at and code not in detected_at and _beyond(code, last[code]):
+                detected_at[code] = now
+        return refreshed
+
+    def _step(now: float) -> None:
+        if adaptive:
+            for batch in poller.plan_sweep(now):
+                poller.record_result(batch, _fetch(batch, now), now)
+        elif (now - start) % scan_interval_sec == 0:
+            known = [code for code in codes if code in last]
+            for i in range(0, len(known), BATCH_SIZE):
+                _fetch(known[i:i + BATCH_SIZE], now)
+        for code in codes:
+            quote = table.read(code)
+            if quote is None:
+                continue
+            age = now - quote.received_at
+            ages.append(age)
+            level = trigger_levels.get(code)
+            if level and abs(last[code] - level) / last[code] * 100.0 <= config.trigger_band_pct:
+                urgent_ages.append(age)
+
+    if not ticks:
+        return _summarize(calls_by_second, 0.0, ages, urgent_ages, crossed_at, detected_at)
+
+    start = math.floor(ticks[0][0])
+    now = start
+    index = 0
+    end = ticks[-1][0]
+    while now <= end:
+        while index < len(ticks) and ticks[index][0] <= now:
+            ts, code, price = ticks[index]
+            index += 1
+            if code not in priorities:
+                continue
+            last[code] = price
+            opens.setdefault(code, price)
+            highs[code] = max(highs.get(code, price), price)
+            lows[code] = min(lows.get(code, price), price)
+            if code in trigger_levels and code not in direction:
+                level = trigger_levels[code]
+                # 시작가가 이미 트리거에 붙어 있으면 돌파 이벤트로 보지 않는다
+                direction[code] = 1 if price < level else (-1 if price > level else 0)
+            if direction.get(code) and code not in crossed_at and _beyond(code, price):
+                crossed_at[code] = ts
+        _step(now)
+        now += 1.0
+    return _summarize(calls_by_second, now - start, ages, urgent_ages, crossed_at, detected_at)
+
+
+def _pct(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return round(sorted_values[int(q * (len(sorted_values) - 1))], 3)
+
+
+def _summarize(
+    calls_by_second: Dict[int, int],
+    duration_sec: float,
+    ages: List[float],
+    urgent_ages: List[float],
+    crossed_at: Dict[str, float],
+    detected_at: Dict[str, float],
+) -> Dict[str, Any]:
+    calls = sum(calls_by_second.values())
+    mean_rate = calls / duration_sec if duration_sec > 0 else 0.0
+    peak_rate = max(calls_by_second.values(), default=0)
+    ages = sorted(ages)
+    urgent_ages = sorted(urgent_ages)
+    latencies = sorted(detected_at[c] - crossed_at[c] for c in crossed_at if c in detected_at)
+    return {
+        "rest_calls": calls,
+        "duration_sec": duration_sec,
+        "calls_per_sec_mean": round(mean_rate, 4),
+        "calls_per_sec_peak": peak_rate,
+        "budget_share_mean_pct": round(mean_rate / QUOTATION_PRICE_RATE_PER_SEC * 100.0, 2),
+        "budget_share_peak_pct": round(peak_rate / QUOTATION_PRICE_RATE_PER_SEC * 100.0, 2),
+        "staleness_p50_sec": _pct(ages, 0.5),
+        "staleness_p90_sec": _pct(ages, 0.9),
+        "staleness_p99_sec": _pct(ages, 0.99),
+        "urgent_staleness_p50_sec": _pct(urgent_ages, 0.5),
+        "urgent_staleness_p90_sec": _pct(urgent_ages, 0.9),
+        "triggers": len(crossed_at),
+        "detected": len(latencies),
+        "latency_mean_sec": round(statistics.fmean(latencies), 3) if latencies else None,
+        "latency_p90_sec": _pct(latencies, 0.9),
+        "latency_max_sec": round(latencies[-1], 3) if latencies else None,
+    }
+
+
+def compare_policies(
+    ticks: List[Tick],
+    priorities: Dict[str, int],
+    trigger_levels: Dict[str, float],
+    *,
+    poller_config: Optional[Dict[str, Any]] = None,
+    scan_interval_sec: float = DEFAULT_SCAN_INTERVAL_SEC,
+) -> Dict[str, Any]:
+    cfg = {**(poller_config or {}), "enabled": True}
+    # 재생은 가상 시각을 쓰므로 fetch/clock 없이 설정만 빌려 쓴다
+    config = build_rest_price_poller(
+        cfg, fetch_batch=None, quote_reader=lambda code: None, request_source=dict,
+    ).config
+    fixed = simulate(ticks, priorities, trigger_levels, poller_config=config,
+                     adaptive=False, scan_interval_sec=scan_interval_sec)
+    adaptive = simulate(ticks, priorities, trigger_levels, poller_config=config, adaptive=True)
+    saved = fixed["rest_calls"] - adaptive["rest_calls"]
+    return {
+        "fixed": fixed,
+        "adaptive": adaptive,
+        "comparison": {
+            "rest_calls_saved": saved,
+            "rest_calls_saved_pct": round(saved / fixed["rest_calls"] * 100.0, 2) if fixed["rest_calls"] else 0.0,
+            "staleness_p90_delta_sec": _delta(adaptive["staleness_p90_sec"], fixed["staleness_p90_sec"]),
+            "urgent_staleness_p90_delta_sec": _delta(
+                adaptive["urgent_staleness_p90_sec"], fixed["urgent_staleness_p90_sec"]
+            ),
+            "latency_mean_delta_sec": _delta(adaptive["latency_mean_sec"], fixed["latency_mean_sec"]),
+        },
+        "config": {
+            "codes": len(priorities),
+            "ticks": len(ticks),
+            "scan_interval_sec": scan_interval_sec,
+            "quotation_price_rate_per_sec": QUOTATION_PRICE_RATE_PER_SEC,
+            "poller": cfg,
+        },
+    }
+
+
+def _delta(new: Optional[float], old: Optional[float]) -> Optional[float]:
+    if new is None or old is None:
+        return None
+    return round(new - old, 3)
+
+
+# ── Reporting ────────────────────────────────────────────────────────────────
+
+_ROWS = [
+    ("rest_calls", "REST 호출"),
+    ("calls_per_sec_mean", "초당 호출 평균"),
+    ("calls_per_sec_peak", "초당 호출 최대"),
+    ("budget_share_mean_pct", "quotation_price 예산 평균(%)"),
+    ("budget_share_peak_pct", "quotation_price 예산 최대(%)"),
+    ("staleness_p50_sec", "staleness p50(초)"),
+    ("staleness_p90_sec", "staleness p90(초)"),
+    ("staleness_p99_sec", "staleness p99(초)"),
+    ("urgent_staleness_p50_sec", "트리거 근접 staleness p50(초)"),
+    ("urgent_staleness_p90_sec", "트리거 근접 staleness p90(초)"),
+    ("triggers", "트리거 돌파 종목"),
+    ("detected", "감지"),
+    ("latency_mean_sec", "감지 지연 평균(초)"),
+    ("latency_p90_sec", "감지 지연 p90(초)"),
+    ("latency_max_sec", "감지 지연 최대(초)"),
+]
+
+
+def format_markdown_report(report: Dict[str, Any]) -> str:
+    cfg = report["config"]
+    cmp_ = report["comparison"]
+    lines: List[str] = []
+    lines.append("# 구독 슬롯 밖 종목 REST 폴링 정책 재생 비교")
+    lines.append("")
+    lines.append(
+        f"- 종목 {cfg['codes']}개, 틱 {cfg['ticks']}건, 고정 스캔 주기 {cfg['scan_interval_sec']}s, "
+        f"quotation_price 한도 초당 {cfg['quotation_price_rate_per_sec']}건"
+    )
+    lines.append(f"- REST 절감: **{cmp_['rest_calls_saved']}회 ({cmp_['rest_calls_saved_pct']}%)**")
+    lines.append(
+        f"- staleness p90 변화: 전체 {cmp_['staleness_p90_delta_sec']}s, "
+        f"트리거 근접 {cmp_['urgent_staleness_p90_delta_sec']}s"
+    )
+    lines.append(f"- 감지 지연 평균 변화: {cmp_['latency_mean_delta_sec']}s")
+    lines.append("")
+    lines.append("| 지표 | fixed | adaptive |")
+    lines.append("|------|-------|----------|")
+    for key, label in _ROWS:
+        lines.append(f"| {label} | {report['fixed'][key]} | {report['adaptive'][key]} |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="구독 슬롯 밖 종목 REST 폴링 정책 오프라인 재생 비교")
+    p.add_argument("--ticks-jsonl", default="", help="틱 jsonl 경로 ({ts|time, code, price})")
+    p.add_argument("--orderbook-dir", default="", help="최우선 호가 세그먼트 디렉토리")
+    p.add_argument("--date", default="", help="YYYYMMDD (--orderbook-dir 사용 시)")
+    p.add_argument("--scenario-json", default="", help="구독 요청·트리거 가격 시나리오 JSON")
+    p.add_argument("--default-trigger-pct", type=float, default=2.0,
+                   help="시나리오 생략 시 첫 가격 대비 트리거 %%")
+    p.add_argument("--poller-config-json", default="",
+                   help="rest_price_poller 설정 JSON (생략 시 기본값)")
+    p.add_argument("--scan-interval-sec", type=float, default=DEFAULT_SCAN_INTERVAL_SEC,
+                   help="fixed 정책의 전 종목 조회 주기")
+    p.add_argument("--output-json", default="", help="JSON 리포트 출력 경로")
+    p.add_argument("--output-markdown", default="", help="Markdown 리포트 출력 경로")
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.ticks_jsonl:
+        ticks = load_ticks_jsonl(Path(args.ticks_jsonl))
+    elif args.orderbook_dir and args.date:
+        ticks = load_orderbook_ticks(Path(args.orderbook_dir), args.date)
+    else:
+        print("[ERROR] --ticks-jsonl 또는 --orderbook-dir/--date 가 필요합니다.", file=sys.stderr)
+        return 2
+    if not ticks:
+        print("[WARN] 재생할 틱이 없습니다.", file=sys.stderr)
+
+    if args.scenario_json:
+        priorities, levels = load_scenario(Path(args.scenario_json))
+    else:
+        priorities, levels = default_scenario(ticks, args.default_trigger_pct)
+    poller_config = (
+        json.loads(Path(args.poller_config_json).read_text(encoding="utf-8"))
+        if args.poller_config_json else None
+    )
+
+    report = compare_policies(
+        ticks,
+        priorities,
+        levels,
+        poller_config=poller_config,
+        scan_interval_sec=args.scan_interval_sec,
+    )
+
+    if args.output_json:
+        out_json = Path(args.output_json)
+        out_json.parent.mkdir(parents=True, exist_ok=True)
+        out_json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"[INFO] JSON report: {out_json}")
+    if args.output_markdown:
+        out_md = Path(args.output_markdown)
+        out_md.parent.mkdir(parents=True, exist_ok=True)
+        out_md.write_text(format_markdown_report(report), encoding="utf-8")
+        print(f"[INFO] Markdown report: {out_md}")
+    if not (args.output_json or args.output_markdown):
+        print(format_markdown_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,408 @@
+"""CLI: WebSocket 슬롯 배정 정책 오프라인 재생 비교기.
+
+기록된 하루의 틱을 재생하며 두 정책으로 40슬롯을 배정하고 비교한다.
+  - static  : 기존 SubscriptionPolicy 순서 (우선순위 클래스, 종목코드)
+  - utility : SubscriptionSlotAllocator (보유·트리거 근접·장중 변동폭·REST fallback 빈도 + 히스테리시스)
+
+재생 모델:
+  - resolve_interval_sec 마다 정책이 상위 slots 개 종목을 구독한다.
+  - 트리거 가격이 있는 종목(전략 감시)과 HIGH(보유) 종목은 구독되지 않은 동안
+    rest_poll_interval_sec 마다 REST 현재가 1회를 호출한다고 본다 (전략 스캔 주기 폴링).
+    UI·관심종목처럼 트리거가 없는 요청은 폴링하지 않는다.
+    이 호출 수가 utility 정책의 REST fallback 빈도 입력이 된다.
+  - 트리거 가격을 시작가 쪽에서 처음 넘은 틱 시각이 실제 돌파 시각이다. 구독 중이면 그 틱에서,
+    아니면 다음 REST 폴링(또는 구독 전환 뒤 첫 틱)에서 감지한다. 감지 지연 = 감지 - 실제 돌파.
+
+입력:
+  - 틱: `--ticks-jsonl` (줄마다 {"ts": epoch초 | "time": "HHMMSS", "code", "price"}) 또는
+        `--orderbook-dir` + `--date` (OrderbookSnapshotRepository 세그먼트, 최우선 호가 중간값을 가격으로 사용)
+  - 시나리오: `--scenario-json` {"requests": [{"code", "priority": "HIGH"|1, ...}],
+        "trigger_levels": {code: 가격}}. 생략하면 기록된 모든 종목을 MEDIUM 전략 후보로 두고
+        첫 가격 대비 +`--default-trigger-pct`% 를 트리거로 쓴다.
+
+Examples:
+    python scripts/simulate_subscription_allocation.py \\
+        --orderbook-dir data/orderbook_snapshots --date 20260704 \\
+        --scenario-json reports/subscription_scenario_20260704.json \\
+        --output-json reports/subscription_allocation_20260704.json \\
+        --output-markdown reports/subscription_allocation_20260704.md
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from services.subscription_policy import SubscriptionPriority
+from services.subscription_slot_allocator import (
+    SubscriptionSlotAllocator,
+    build_candidate,
+    build_slot_allocator,
+)
+
+Tick = Tuple[float, str, float]
+
+DEFAULT_SLOTS = 40
+DEFAULT_RESOLVE_INTERVAL_SEC = 30.0
+DEFAULT_REST_POLL_INTERVAL_SEC = 5.0
+
+
+# ── Loaders ──────────────────────────────────────────────────────────────────
+
+def _hhmmss_to_sec(value) -> float:
+    hhmmss = int(value)
+    return float(hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100)
+
+
+def load_ticks_jsonl(path: Path) -> List[Tick]:
+    """{"ts"|"time", "code", "price"} 줄 JSON → 시각 오름차순 (ts, code, price)."""
+    ticks: List[Tick] = []
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+                ts = float(rec["ts"]) if "ts" in rec else _hhmmss_to_sec(rec["time"])
+                price = float(rec["price"])
+            except (KeyError, TypeError, ValueError, json.JSONDecodeError):
+                continue
+            if price > 0:
+                ticks.append((ts, str(rec["code"]), price))
+    ticks.sort(key=lambda t: t[0])
+    return ticks
+
+
+def load_orderbook_ticks(orderbook_dir: Path, date: str, codes: Optional[List[str]] = None) -> List[Tick]:
+    """최우선 호가 세그먼트에서 (초, 종목, 중간값) 틱을 만든다."""
+    from repositories.tick_segment_store import TOP_OF_BOOK_STREAM, TickSegmentStore
+
+    store = TickSegmentStore(str(orderbook_dir), TOP_OF_BOOK_STREAM)
+    try:
+        blocks = store.read(date, codes or store.codes(date))
+    finally:
+        store.close()
+    ticks: List[Tick] = []
+    for code, block in blocks.items():
+        for t, ask, bid in zip(block["time"], block["ask_price"], block["bid_price"]):
+            ask, bid = int(ask), int(bid)
+            if ask > 0 and bid > 0:
+                price = (ask + bid) / 2.0
+            else:
+                price = float(ask or bid)
+            if price > 0:
+                ticks.append((_hhmmss_to_sec(t), code, price))
+    ticks.sort(key=lambda t: t[0])
+    return ticks
+
+
+def _parse_priority(value) -> int:
+    if isinstance(value, str) and not value.isdigit():
+        return int(SubscriptionPriority[value.upper()])
+    return int(value)
+
+
+def load_scenario(path: Path) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """시나리오 JSON → ({code: 최우선 priority}, {code: 트리거 가격})."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    priorities: Dict[str, int] = {}
+    for req in raw.get("requests", []):
+        code = str(req["code"])
+        priority = _parse_priority(req.get("priority", int(SubscriptionPriority.MEDIUM)))
+        priorities[code] = min(priority, priorities.get(code, priority))
+    levels = {str(code): float(level) for code, level in (raw.get("trigger_levels") or {}).items()}
+    return priorities, levels
+
+
+def default_scenario(ticks: List[Tick], trigger_pct: float) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """시나리오가 없으면 모든 종목을 MEDIUM 후보로, 첫 가격 +trigger_pct% 를 트리거로 둔다."""
+    first: Dict[str, float] = {}
+    for _, code, price in ticks:
+        first.setdefault(code, price)
+    priorities = {code: int(SubscriptionPriority.MEDIUM) for code in first}
+    levels = {code: price * (1.0 + trigger_pct / 100.0) for code, price in first.items()}
+    return priorities, levels
+
+
+# ── Simulation ───────────────────────────────────────────────────────────────
+
+def simulate(
+    ticks: List[Tick],
+    priorities: Dict[str, int],
+    trigger_levels: Dict[str, float],
+    *,
+    allocator: Optional[SubscriptionSlotAllocator] = None,
+    slots: int = DEFAULT_SLOTS,
+    resolve_interval_sec: float = DEFAULT_RESOLVE_INTERVAL_SEC,
+    rest_poll_interval_sec: float = DEFAULT_REST_POLL_INTERVAL_SEC,
+) -> Dict[str, Any]:
+    """한 정책으로 하루를 재생한다. allocator 가 None 이면 기존 우선순위 순서."""
+    last: Dict[str, float] = {}
+    opens: Dict[str, float] = {}
+    highs: Dict[str, float] = {}
+    lows: Dict[str, float] = {}
+    direction: Dict[str, int] = {}
+    crossed_at: Dict[str, float] = {}
+    detected_at: Dict[str, float] = {}
+    rest_by_code: Counter = Counter()
+    subscribed: set = set()
+    churn = 0
+    # 전략이 트리거를 감시하는 종목과 보유 종목만 REST 로 폴링한다 (UI·관심종목 알림은 틱이 없으면 그냥 멈춘다)
+    polled_codes = [
+        code for code, priority in priorities.items()
+        if code in trigger_levels or priority == int(SubscriptionPriority.HIGH)
+    ]
+
+    def _beyond(code: str, price: float) -> bool:
+        level = trigger_levels[code]
+        return price >= level if direction[code] > 0 else price <= level
+
+    def _resolve(now: float) -> None:
+        nonlocal subscribed, churn
+        if allocator is None:
+            order = sorted(priorities, key=lambda c: (priorities[c], c))
+        else:
+            allocator.observe_rest_fallbacks(rest_by_code, now)
+            candidates = [
+                build_candidate(
+                    code,
+                    priority,
+                    price=last.get(code),
+                    high=highs.get(code),
+                    low=lows.get(code),
+                    open_price=opens.get(code),
+                    trigger_levels=[trigger_levels[code]] if code in trigger_levels else [],
+                    rest_fallback_per_min=allocator.rest_fallback_rate(code),
+                )
+                for code, priority in priorities.items()
+            ]
+            order = allocator.rank(candidates, incumbents=subscribed, now=now)
+        chosen = set(order[:slots])
+        churn += len(chosen ^ subscribed)
+        subscribed = chosen
+        if allocator is not None:
+            allocator.note_active(subscribed, now)
+
+    def _poll(now: float) -> None:
+        for code in polled_codes:
+            if code in subscribed:
+                continue
+            rest_by_code[code] += 1
+            if code in crossed_at and code not in detected_at and _beyond(code, last[code]):
+                detected_at[code] = now
+
+    if not ticks:
+        return _summarize(rest_by_code, churn, crossed_at, detected_at)
+
+    next_resolve = next_poll = ticks[0][0]
+    for ts, code, price in ticks:
+        while min(next_resolve, next_poll) <= ts:
+            if next_resolve <= next_poll:
+                _resolve(next_resolve)
+                next_resolve += resolve_interval_sec
+            else:
+                _poll(next_poll)
+                next_poll += rest_poll_interval_sec
+        if code not in priorities:
+            continue
+        last[code] = price
+        opens.setdefault(code, price)
+        highs[code] = max(highs.get(code, price), price)
+        lows[code] = min(lows.get(code, price), price)
+        if code in trigger_levels and code not in direction:
+            level = trigger_levels[code]
+            # 시작가가 이미 트리거 위/아래에 붙어 있으면 돌파 이벤트로 보지 않는다
+            direction[code] = 1 if price < level else (-1 if price > level else 0)
+        if not direction.get(code):
+            continue
+        if code not in crossed_at and _beyond(code, price):
+            crossed_at[code] = ts
+        if code in subscribed and code in crossed_at and code not in detected_at and _beyond(code, price):
+            detected_at[code] = ts
+    return _summarize(rest_by_code, churn, crossed_at, detected_at)
+
+
+def _summarize(
+    rest_by_code: Counter,
+    churn: int,
+    crossed_at: Dict[str, float],
+    detected_at: Dict[str, float],
+) -> Dict[str, Any]:
+    latencies = sorted(detected_at[c] - crossed_at[c] for c in crossed_at if c in detected_at)
+    return {
+        "rest_calls": int(sum(rest_by_code.values())),
+        "subscription_changes": churn,
+        "triggers": len(crossed_at),
+        "detected": len(latencies),
+        "undetected": len(crossed_at) - len(latencies),
+        "latency_mean_sec": round(statistics.fmean(latencies), 3) if latencies else None,
+        "latency_median_sec": round(statistics.median(latencies), 3) if latencies else None,
+        "latency_p90_sec": round(latencies[int(0.9 * (len(latencies) - 1))], 3) if latencies else None,
+        "latency_max_sec": round(latencies[-1], 3) if latencies else None,
+        "tick_detected": sum(1 for v in latencies if v == 0),
+    }
+
+
+def compare_policies(
+    ticks: List[Tick],
+    priorities: Dict[str, int],
+    trigger_levels: Dict[str, float],
+    *,
+    allocator_config: Optional[Dict[str, Any]] = None,
+    slots: int = DEFAULT_SLOTS,
+    resolve_interval_sec: float = DEFAULT_RESOLVE_INTERVAL_SEC,
+    rest_poll_interval_sec: float = DEFAULT_REST_POLL_INTERVAL_SEC,
+) -> Dict[str, Any]:
+    kwargs = dict(
+        slots=slots,
+        resolve_interval_sec=resolve_interval_sec,
+        rest_poll_interval_sec=rest_poll_interval_sec,
+    )
+    static = simulate(ticks, priorities, trigger_levels, **kwargs)
+    cfg = {**(allocator_config or {}), "enabled": True}
+    # 재생은 가상 시각을 쓰므로 할당기 clock 은 쓰이지 않는다 (모든 호출에 now 전달)
+    utility = simulate(ticks, priorities, trigger_levels, allocator=build_slot_allocator(cfg), **kwargs)
+    saved = static["rest_calls"] - utility["rest_calls"]
+    return {
+        "static": static,
+        "utility": utility,
+        "comparison": {
+            "rest_calls_saved": saved,
+            "rest_calls_saved_pct": round(saved / static["rest_calls"] * 100.0, 2) if static["rest_calls"] else 0.0,
+            "latency_mean_delta_sec": _delta(utility["latency_mean_sec"], static["latency_mean_sec"]),
+            "latency_p90_delta_sec": _delta(utility["latency_p90_sec"], static["latency_p90_sec"]),
+            "extra_subscription_changes": utility["subscription_changes"] - static["subscription_changes"],
+        },
+        "config": {
+            "codes": len(priorities),
+            "ticks": len(ticks),
+            "slots": slots,
+            "resolve_interval_sec": resolve_interval_sec,
+            "rest_poll_interval_sec": rest_poll_interval_sec,
+            "allocator": cfg,
+        },
+    }
+
+
+def _delta(new: Optional[float], old: Optional[float]) -> Optional[float]:
+    if new is None or old is None:
+        return None
+    return round(new - old, 3)
+
+
+# ── Reporting ────────────────────────────────────────────────────────────────
+
+_ROWS = [
+    ("rest_calls", "REST 호출"),
+    ("subscription_changes", "구독/해지 횟수"),
+    ("triggers", "트리거 돌파 종목"),
+    ("detected", "감지"),
+    ("tick_detected", "틱 즉시 감지"),
+    ("undetected", "미감지"),
+    ("latency_mean_sec", "감지 지연 평균(초)"),
+    ("latency_median_sec", "감지 지연 중앙값(초)"),
+    ("latency_p90_sec", "감지 지연 p90(초)"),
+    ("latency_max_sec", "감지 지연 최대(초)"),
+]
+
+
+def format_markdown_report(report: Dict[str, Any]) -> str:
+    cfg = report["config"]
+    cmp_ = report["comparison"]
+    lines: List[str] = []
+    lines.append("# WebSocket 슬롯 배정 정책 재생 비교")
+    lines.append("")
+    lines.append(
+        f"- 종목 {cfg['codes']}개, 틱 {cfg['ticks']}건, 슬롯 {cfg['slots']}, "
+        f"재배정 {cfg['resolve_interval_sec']}s, REST 폴링 {cfg['rest_poll_interval_sec']}s"
+    )
+    lines.append(f"- REST 절감: **{cmp_['rest_calls_saved']}회 ({cmp_['rest_calls_saved_pct']}%)**")
+    lines.append(
+        f"- 감지 지연 변화: 평균 {cmp_['latency_mean_delta_sec']}s, p90 {cmp_['latency_p90_delta_sec']}s"
+    )
+    lines.append(f"- 추가 구독/해지: {cmp_['extra_subscription_changes']}회")
+    lines.append("")
+    lines.append("| 지표 | static | utility |")
+    lines.append("|------|--------|---------|")
+    for key, label in _ROWS:
+        lines.append(f"| {label} | {report['static'][key]} | {report['utility'][key]} |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="WebSocket 슬롯 배정 정책 오프라인 재생 비교")
+    p.add_argument("--ticks-jsonl", default="", help="틱 jsonl 경로 ({ts|time, code, price})")
+    p.add_argument("--orderbook-dir", default="", help="최우선 호가 세그먼트 디렉토리")
+    p.add_argument("--date", default="", help="YYYYMMDD (--orderbook-dir 사용 시)")
+    p.add_argument("--scenario-json", default="", help="구독 요청·트리거 가격 시나리오 JSON")
+    p.add_argument("--default-trigger-pct", type=float, default=2.0,
+                   help="시나리오 생략 시 첫 가격 대비 트리거 %%")
+    p.add_argument("--allocator-config-json", default="",
+                   help="subscription_slot_allocator 설정 JSON (생략 시 기본값)")
+    p.add_argument("--slots", type=int, default=DEFAULT_SLOTS)
+    p.add_argument("--resolve-interval-sec", type=float, default=DEFAULT_RESOLVE_INTERVAL_SEC)
+    p.add_argument("--rest-poll-interval-sec", type=float, default=DEFAULT_REST_POLL_INTERVAL_SEC)
+    p.add_argument("--output-json", default="", help="JSON 리포트 출력 경로")
+    p.add_argument("--output-markdown", default="", help="Markdown 리포트 출력 경로")
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.ticks_jsonl:
+        ticks = load_ticks_jsonl(Path(args.ticks_jsonl))
+    elif args.orderbook_dir and args.date:
+        ticks = load_orderbook_ticks(Path(args.orderbook_dir), args.date)
+    else:
+        print("[ERROR] --ticks-jsonl 또는 --orderbook-dir/--date 가 필요합니다.", file=sys.stderr)
+        return 2
+    if not ticks:
+        print("[WARN] 재생할 틱이 없습니다.", file=sys.stderr)
+
+    if args.scenario_json:
+        priorities, levels = load_scenario(Path(args.scenario_json))
+    else:
+        priorities, levels = default_scenario(ticks, args.default_trigger_pct)
+    allocator_config = (
+        json.loads(Path(args.allocator_config_json).read_text(encoding="utf-8"))
+        if args.allocator_config_json else None
+    )
+
+    report = compare_policies(
+        ticks,
+        priorities,
+        levels,
+        allocator_config=allocator_config,
+        slots=args.slots,
+        resolve_interval_sec=args.resolve_interval_sec,
+        rest_poll_interval_sec=args.rest_poll_interval_sec,
+    )
+
+    if args.output_json:
+        out_json = Path(args.output_json)
+        out_json.parent.mkdir(parents=True, exist_ok=True)
+        out_json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"[INFO] JSON report: {out_json}")
+    if args.output_markdown:
+        out_md = Path(args.output_markdown)
+        out_md.parent.mkdir(parents=True, exist_ok=True)
+        out_md.write_text(format_markdown_report(report), encoding="utf-8")
+        print(f"[INFO] Markdown report: {out_md}")
+    if not (args.output_json or args.output_markdown):
+        print(format_markdown_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""Backtest replay 캐시 메모리 예산.
+
+replay 서비스·bar provider·runner 레짐 캐시는 (종목, 거래일) 단위로 계속 쌓인다. 기간이 길거나
+walk-forward 구간·parameter sweep 을 한 프로세스에서 여러 번 돌리면 실행 내내 커져 결국 스왑에
+들어간다. 여기서는 캐시들을 하나의 바이트 예산(BacktestCacheBudget)에 등록해
+
+  - 캐시별 크기를 근사 바이트로 집계하고,
+  - 예산을 넘으면 ``bytes / weight`` 가 가장 큰 캐시의 가장 오래 안 쓴 항목(LRU)부터 버리되,
+  - 현재 거래일 창(pin_days)의 항목은 버리지 않는다 (같은 날 scan·체결·MTM 이 다시 읽는다).
+
+캐시는 값을 다시 로드할 수 있는 순수 캐시만 대상이다 — 축출은 속도에만 영향을 주고 결과는 같다.
+hit/miss/eviction 카운터는 stats() 로 실행 요약에 붙는다.
+"""
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+# 캐시 이름별 기본 가중치 — 클수록 예산을 더 많이 차지할 수 있다 (다시 읽는 비용이 큰 캐시).
+DEFAULT_CACHE_WEIGHTS: Dict[str, float] = {
+    "replay_rows": 1.0,
+    "replay_program": 0.25,
+    "intraday_bars": 1.0,
+    "intraday_rows": 0.5,
+    "orderbook_rows": 0.5,
+    "mtm_bars": 0.5,
+    "regime_snapshots": 0.25,
+}
+
+_SAMPLE_ITEMS = 8
+
+
+def approx_size(value: Any, _depth: int = 0) -> int:
+    """list/dict/dataclass 값의 근사 바이트 (sys.getsizeof 재귀 합, 공유 객체 중복 집계 허용)."""
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        return size + sum(approx_size(item, _depth + 1) for item in value.values())
+    if isinstance(value, (list, tuple)) and len(value) > _SAMPLE_ITEMS:
+        # 분봉 rows 처럼 같은 모양의 항목이 많으면 앞쪽 표본 평균으로 외삽한다 (setitem 비용 상한).
+        sampled = sum(approx_size(item, _depth + 1) for item in value[:_SAMPLE_ITEMS])
+        return size + sampled * len(value) // _SAMPLE_ITEMS
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(approx_size(item, _depth + 1) for item in value)
+    attrs = getattr(value, "__dict__", None)
+    if isinstance(attrs, dict):
+        return size + approx_size(attrs, _depth + 1)
+    return size
+
+
+class BoundedReplayCache(MutableMapping):
+    """예산에 등록되는 LRU dict. 키의 date_index 위치 값(YYYYMMDD)으로 거래일 고정/정리를 판단한다.
+
+    ``get`` / ``[]`` 가 hit·miss 를 센다 (``in`` 검사는 세지 않는다).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        budget: Optional["BacktestCacheBudget"] = None,
+        date_index: int = 1,
+        sizer: Callable[[Any], int] = approx_size,
+    ) -> None:
+        self.name = name
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._date_index = date_index
+        self._sizer = sizer
+        self._budget = budget
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if budget is not None:
+            budget.register(self)
+
+    # ── MutableMapping ────────────────────────────────────────────
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if key in self._entries:
+            return self[key]
+        self.misses += 1
+        return default
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        if key in self._entries:
+            self.bytes -= self._sizes[key]
+        size = int(self._sizer(value))
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self.bytes += size
+        if self._budget is not None:
+            self._budget.enforce()
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._entries[key]
+        self.bytes -= self._sizes.pop(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── 예산 ──────────────────────────────────────────────────────
+
+    def entry_date(self, key: Hashable) -> Optional[str]:
+        if isinstance(key, tuple) and len(key) > self._date_index:
+            return str(key[self._date_index])
+        return None
+
+    def evict_lru(self, pinned_dates: Iterable[str]) -> int:
+        """고정되지 않은 가장 오래된 항목 하나를 버리고 확보한 바이트를 반환 (없으면 0)."""
+        pinned = set(pinned_dates)
+        for key in self._entries:
+            if self.entry_date(key) in pinned:
+                continue
+            freed = self._sizes[key]
+            del self[key]
+            self.evictions += 1
+            return freed
+        return 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class BacktestCacheBudget:
+    """여러 BoundedReplayCache 가 공유하는 전역 바이트 예산.
+
+    max_bytes 가 None 이면 축출하지 않고 집계만 한다. runner 의 date_context_targets 에 넣으면
+    set_backtest_date() 로 최근 pin_days 거래일을 고정한다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int],
+        *,
+        weights: Optional[Dict[str, float]] = None,
+        pin_days: int = 1,
+    ) -> None:
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self._weights = {**DEFAULT_CACHE_WEIGHTS, **(weights or {})}
+        self._caches: List[BoundedReplayCache] = []
+        self._recent_dates: deque = deque(maxlen=max(int(pin_days), 1))
+        self._pinned: frozenset = frozenset()
+        self.peak_bytes = 0
+        self.over_budget = 0
+
+    def register(self, cache: BoundedReplayCache) -> None:
+        self._caches.append(cache)
+
+    def set_backtest_date(self, date_ymd: str) -> None:
+        date_ymd = str(date_ymd)
+        if not self._recent_dates or self._recent_dates[-1] != date_ymd:
+            self._recent_dates.append(date_ymd)
+        self._pinned = frozenset(self._recent_dates)
+        self.enforce()
+
+    @property
+    def pinned_dates(self) -> frozenset:
+        return self._pinned
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(cache.bytes for cache in self._caches)
+
+    def enforce(self) -> None:
+        total = self.total_bytes
+        if self.max_bytes is not None and total > self.max_bytes:
+            exhausted: set = set()
+            while total > self.max_bytes:
+                victim = self._pick_victim(exhausted)
+                if victim is None:
+                    # 고정된 현재 거래일 항목만 남았다 — 예산을 잠시 넘기고 다음 거래일에 정리한다.
+                    self.over_budget += 1
+                    break
+                freed = victim.evict_lru(self._pinned)
+                if freed <= 0:
+                    exhausted.add(id(victim))
+                    continue
+                total -= freed
+        self.peak_bytes = max(self.peak_bytes, total)
+
+    def _pick_victim(self, exhausted: set) -> Optional[BoundedReplayCache]:
+        candidates = [cache for cache in self._caches if cache.bytes > 0 and id(cache) not in exhausted]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda cache: cache.bytes / self._weights.get(cache.name, 1.0))
+
+    def stats(self) -> dict:
+        per_cache: Dict[str, Dict[str, int]] = {}
+        for cache in self._caches:
+            merged = per_cache.setdefault(cache.name, dict.fromkeys(
+                ("entries", "bytes", "hits", "misses", "evictions"), 0,
+            ))
+            for field, value in cache.stats().items():
+                merged[field] += value
+        hits = sum(item["hits"] for item in per_cache.values())
+        misses = sum(item["misses"] for item in per_cache.values())
+        return {
+            "max_bytes": self.max_bytes,
+            "bytes": self.total_bytes,
+            "peak_bytes": self.peak_bytes,
+            "over_budget": self.over_budget,
+            "hits": hits,
+            "misses": misses,
+            "evictions": sum(item["evictions"] for item in per_cache.values()),
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "caches": per_cache,
+        }
@@ -0,0 +1,267 @@
+"""Vectorized candidate pre-screen for period backtests.
+
+BacktestPeriodRunner 는 거래일마다 라이브 전략의 scan() 을 그대로 await 하고, scan 은
+watchlist 종목마다 replay get_current_price(분봉 재구성)를 호출한다. 그런데 대부분의
+(거래일, 종목) 쌍은 그날 일봉만 봐도 진입이 불가능하다 — 거래량 급증이 없거나, 직전 고가를
+넘지 못했거나.
+
+전략은 ``LiveStrategy.backtest_prescreen()`` 으로 **필요조건**(만족하지 않으면 scan 이 절대
+BUY 를 내지 않는 조건)을 선언한다. 여기서는 그 조건을 (거래일 × 종목) 일봉 패널 위에서
+numpy 로 한 번에 계산해 후보 마스크를 만들고, runner 는 마스크에 남은 종목만 watchlist 에
+남긴 채 라이브 scan 을 실행한다. 판정 로직은 여전히 라이브 경로 그대로다.
+
+안전장치:
+  - 패널에 없는 종목/날짜, 이력이 부족한 구간은 항상 후보로 남긴다 (보수적).
+  - verify 모드: 표본 거래일에는 필터 없이 전체 scan 을 돌리고, 마스크로 걸렀다면 같은
+    시그널이 나왔는지 확인한다. 어긋나면 PrescreenMismatchError.
+"""
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from common.types import ErrorCode, TradeSignal
+from utils.async_concurrency import bounded_gather
+
+# 신규 종목 일봉 로드 동시성 (로컬 DB 조회라 REST TPS 제한과 무관)
+_LOAD_CONCURRENCY = 8
+
+
+class PrescreenMismatchError(RuntimeError):
+    """verify 모드에서 마스크 경로와 전체 scan 경로의 시그널이 다를 때."""
+
+
+@dataclass(frozen=True)
+class DailyOhlcvPanel:
+    """(거래일 × 종목) 일봉 패널. 값이 없는 칸은 NaN."""
+
+    dates: List[str]
+    codes: List[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows_by_code: Dict[str, Sequence[dict]]) -> "DailyOhlcvPanel":
+        codes = list(rows_by_code)
+        dates = sorted({
+            date for rows in rows_by_code.values() for date in (_row_date(row) for row in rows) if date
+        })
+        date_index = {date: i for i, date in enumerate(dates)}
+        shape = (len(dates), len(codes))
+        columns = {name: np.full(shape, np.nan) for name in ("open", "high", "low", "close", "volume")}
+        for j, code in enumerate(codes):
+            for row in rows_by_code[code]:
+                i = date_index.get(_row_date(row))
+                if i is None:
+                    continue
+                for name, column in columns.items():
+                    column[i, j] = _to_float(row.get(name))
+        return cls(dates=dates, codes=codes, **columns)
+
+
+def rolling_prior(values: np.ndarray, window: int, reducer) -> np.ndarray:
+    """행 t 에 대해 values[t-window:t] (당일 제외) 를 reducer 로 줄인 값. 이력이 모자라면 NaN."""
+    out = np.full(values.shape, np.nan)
+    if window <= 0 or values.shape[0] <= window:
+        return out
+    windows = sliding_window_view(values[:-1], window, axis=0)  # (D - window, C, window)
+    out[window:] = reducer(windows, axis=-1)
+    return out
+
+
+class CandidatePrescreen(ABC):
+    """전략이 선언하는 (거래일, 종목) 필요조건."""
+
+    #: 마스크 계산에 필요한 거래일 이전 일봉 수
+    lookback_days: int = 0
+
+    @abstractmethod
+    def candidate_mask(self, panel: DailyOhlcvPanel) -> np.ndarray:
+        """panel 과 같은 shape 의 bool 배열. False 인 쌍은 scan 이 BUY 를 낼 수 없어야 한다."""
+
+
+@dataclass(frozen=True)
+class BreakoutVolumePrescreen(CandidatePrescreen):
+    """당일 고가가 직전 고가를 버퍼 이상 넘고, 당일 거래량이 평균 대비 하한 이상인 쌍만 남긴다.
+
+    watchlist 의 high_20d / avg_vol_20d 는 유니버스 경로에 따라 당일 봉을 포함하기도 하므로,
+    어느 쪽이든 포함되는 직전 (period - 1) 거래일만 쓴다. 장중 현재가·누적거래량은 당일
+    최종 고가·거래량을 넘을 수 없어 이 조건은 필요조건이 된다.
+    """
+
+    breakout_period: int = 20
+    breakout_buffer_pct: float = 0.0
+    min_volume_ratio: float = 0.0
+
+    @property
+    def lookback_days(self) -> int:  # type: ignore[override]
+        return self.breakout_period
+
+    def candidate_mask(self, panel: DailyOhlcvPanel) -> np.ndarray:
+        window = max(self.breakout_period - 1, 1)
+        prior_high = rolling_prior(panel.high, window, np.max)
+        prior_volume_sum = rolling_prior(panel.volume, window, np.sum)
+
+        breakout_ok = panel.high >= np.floor(prior_high * (1 + self.breakout_buffer_pct / 100))
+        volume_ok = panel.volume >= prior_volume_sum / self.breakout_period * self.min_volume_ratio
+        unknown = (
+            np.isnan(prior_high) | np.isnan(prior_volume_sum) | np.isnan(panel.high) | np.isnan(panel.volume)
+        )
+        return unknown | (breakout_ok & volume_ok)
+
+
+class BacktestCandidatePrescreen:
+    """runner 가 쓰는 마스크 저장소 + 통계.
+
+    처음 보는 종목은 watchlist 에 등장한 시점에 전 기간 일봉을 한 번에 읽어 (거래일 × 신규 종목)
+    패널로 마스크를 계산해 둔다. 이후 같은 종목은 조회 없이 마스크만 본다.
+    """
+
+    def __init__(
+        self,
+        prescreen: CandidatePrescreen,
+        *,
+        stock_query_service: Any,
+        dates: Sequence[str],
+        verify_every: int = 0,
+    ) -> None:
+        self._prescreen = prescreen
+        self._sqs = stock_query_service
+        self._dates = [str(date) for date in dates]
+        self._date_index = {date: i for i, date in enumerate(self._dates)}
+        self._verify_every = max(int(verify_every or 0), 0)
+        self._masks: Dict[str, np.ndarray] = {}
+        self._stats = {
+            "pairs_total": 0, "pairs_kept": 0, "codes_loaded": 0, "mask_build_ms": 0.0,
+            "verified_dates": 0, "verified_signals": 0,
+        }
+
+    @property
+    def verify_every(self) -> int:
+        return self._verify_every
+
+    def should_verify(self, date_ymd: str) -> bool:
+        index = self._date_index.get(str(date_ymd))
+        return self._verify_every > 0 and index is not None and index % self._verify_every == 0
+
+    async def prepare(self, codes: Iterable[str]) -> None:
+        """마스크가 없는 종목의 일봉을 읽어 마스크를 계산한다."""
+        missing = [code for code in dict.fromkeys(codes) if code not in self._masks]
+        if not missing or not self._dates:
+            return
+        started = time.perf_counter()
+        limit = len(self._dates) + self._prescreen.lookback_days + 30
+        loaded = await bounded_gather((self._load_rows(code, limit) for code in missing), _LOAD_CONCURRENCY)
+        rows_by_code: Dict[str, List[dict]] = dict(zip(missing, loaded))
+        panel = DailyOhlcvPanel.from_rows(rows_by_code)
+        mask = self._prescreen.candidate_mask(panel)
+        rows = np.asarray(_row_positions(panel.dates, self._dates), dtype=np.int64)
+        for j, code in enumerate(panel.codes):
+            code_mask = np.ones(len(self._dates), dtype=bool)  # 패널에 없는 거래일은 후보로 둔다
+            present = rows >= 0
+            code_mask[present] = mask[rows[present], j]
+            self._masks[code] = code_mask
+        self._stats["codes_loaded"] += len(missing)
+        self._stats["mask_build_ms"] += (time.perf_counter() - started) * 1000
+
+    def allowed_codes(self, date_ymd: str, codes: Iterable[str]) -> Set[str]:
+        """codes 중 date_ymd 에 후보로 남는 종목. 마스크가 없으면 남긴다."""
+        index = self._date_index.get(str(date_ymd))
+        allowed: Set[str] = set()
+        total = 0
+        for code in codes:
+            total += 1
+            mask = self._masks.get(code)
+            if index is None or mask is None or mask[index]:
+                allowed.add(code)
+        self._stats["pairs_total"] += total
+        self._stats["pairs_kept"] += len(allowed)
+        return allowed
+
+    def verify(self, date_ymd: str, signals: Sequence[TradeSignal], allowed: Set[str]) -> None:
+        """전체 scan 시그널이 마스크 경로(후보만 scan)의 시그널과 같은지 확인한다."""
+        masked = [signal for signal in signals if signal.code in allowed]
+        self._stats["verified_dates"] += 1
+        self._stats["verified_signals"] += len(signals)
+        if len(masked) != len(signals):
+            dropped = sorted({signal.code for signal in signals if signal.code not in allowed})
+            raise PrescreenMismatchError(
+                f"prescreen {type(self._prescreen).__name__} dropped signalling codes on {date_ymd}: {dropped}"
+            )
+
+    def stats_snapshot(self) -> dict:
+        stats = dict(self._stats)
+        stats["pairs_skipped"] = stats["pairs_total"] - stats["pairs_kept"]
+        stats["skip_ratio"] = (
+            round(stats["pairs_skipped"] / stats["pairs_total"], 4) if stats["pairs_total"] else 0.0
+        )
+        stats["mask_build_ms"] = round(stats["mask_build_ms"], 2)
+        stats["prescreen"] = type(self._prescreen).__name__
+        stats["verify_every"] = self._verify_every
+        return stats
+
+    async def _load_rows(self, code: str, limit: int) -> List[dict]:
+        try:
+            response = await self._sqs.get_recent_daily_ohlcv(code, limit=limit, end_date=self._dates[-1])
+        except Exception:
+            return []
+        if getattr(response, "rt_cd", None) != ErrorCode.SUCCESS.value:
+            return []
+        data = getattr(response, "data", None)
+        return [row for row in data if isinstance(row, dict)] if isinstance(data, list) else []
+
+
+class PrescreenUniverseProxy:
+    """전략의 universe 를 감싸 get_watchlist() 결과를 해당 거래일 후보로 줄인다.
+
+    passthrough=True 면 (verify 거래일) 걸러내지 않고 후보 집합만 계산해 둔다.
+    그 외 메서드는 원본에 위임한다 (StrategyDebugRunner 의 _UniverseFilterProxy 와 같은 방식).
+    """
+
+    def __init__(self, inner: Any, prescreen: BacktestCandidatePrescreen, date_ymd: str,
+                 *, passthrough: bool = False) -> None:
+        self._inner = inner
+        self._prescreen = prescreen
+        self._date_ymd = date_ymd
+        self._passthrough = passthrough
+        self.allowed_codes: Set[str] = set()
+
+    async def get_watchlist(self, **kw) -> Dict:
+        full = await self._inner.get_watchlist(**kw)
+        if not full:
+            return full
+        await self._prescreen.prepare(full.keys())
+        self.allowed_codes = self._prescreen.allowed_codes(self._date_ymd, full.keys())
+        if self._passthrough:
+            return full
+        return {code: item for code, item in full.items() if code in self.allowed_codes}
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+
+def _row_positions(panel_dates: List[str], dates: List[str]) -> List[int]:
+    index = {date: i for i, date in enumerate(panel_dates)}
+    return [index.get(date, -1) for date in dates]
+
+
+def _row_date(row: dict) -> Optional[str]:
+    value = row.get("date") or row.get("stck_bsop_date")
+    if value is None:
+        return None
+    return str(value).replace("-", "")[:8]
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -7,6 +7,13 @@ from pathlib import Path
 from typing import Any
 
 from common.types import ErrorCode
+from repositories.execution_strength_repo import ExecutionStrengthRepository
+from repositories.orderbook_snapshot_repo import OrderbookSnapshotRepository
+from repositories.tick_segment_store import (
+    EXECUTION_STRENGTH_STREAM,
+    TOP_OF_BOOK_STREAM,
+    TickSegmentStore,
+)
 
 
 class BacktestMicrostructureCaptureService:
@@ -18,14 +25,14 @@ class BacktestMicrostructureCaptureService:
         stock_query_service: Any,
         program_provider: Any | None = None,
         program_db_path: str | Path = "data/program_subscribe/program_trading.db",
-        execution_strength_db_path: str | Path = "data/execution_strength/execution_strength.db",
-        orderbook_db_path: str | Path = "data/orderbook_snapshots/orderbook_snapshots.db",
+        execution_strength_dir: str | Path = ExecutionStrengthRepository.DEFAULT_BASE_DIR,
+        orderbook_dir: str | Path = OrderbookSnapshotRepository.DEFAULT_BASE_DIR,
     ) -> None:
         self._sqs = stock_query_service
         self._program_provider = program_provider
         self._program_db_path = Path(program_db_path)
-        self._execution_strength_db_path = Path(execution_strength_db_path)
-        self._orderbook_db_path = Path(orderbook_db_path)
+        self._execution_strength_dir = Path(execution_strength_dir)
+        self._orderbook_dir = Path(orderbook_dir)
 
     async def capture(
         self,
@@ -245,26 +252,17 @@ class BacktestMicrostructureCaptureService:
         result: dict[str, list[dict]] = {code: [] for code in codes}
         if source == "rest_scalar":
             return result, []
-        # es_db: 장중 WS 틱 샘플링 DB(es_history). 미스 종목(무틱/미구독)은
+        # es_db: 장중 WS 틱 샘플링 세그먼트(ExecutionStrengthRepository). 미스 종목(무틱/미구독)은
         # 기존 REST 스칼라(execution_strength)가 폴백 역할을 한다.
-        if self._execution_strength_db_path.exists():
-            with sqlite3.connect(self._execution_strength_db_path) as conn:
-                for code in codes:
-                    rows = conn.execute(
-                        """
-                        SELECT trade_time, strength
-                        FROM es_history
-                        WHERE code = ?
-                          AND trade_date = ?
-                          AND trade_time >= ?
-                          AND trade_time <= ?
-                        ORDER BY trade_time ASC, id ASC
-                        """,
-                        (code, date_ymd, start_hhmmss, end_hhmmss),
-                    ).fetchall()
-                    result[code] = [
-                        {"time": row[0], "strength": row[1]} for row in rows
-                    ]
+        if self._execution_strength_dir.is_dir():
+            blocks = TickSegmentStore(
+                str(self._execution_strength_dir), EXECUTION_STRENGTH_STREAM
+            ).read(date_ymd, codes, start_time=start_hhmmss, end_time=end_hhmmss)
+            for code, block in blocks.items():
+                result[code] = [
+                    {"time": f"{int(t):06d}", "strength": float(v)}
+                    for t, v in zip(block["time"], block["strength"])
+                ]
         fallback_codes = [code for code in codes if not result[code]]
         return result, fallback_codes
 
@@ -282,32 +280,23 @@ class BacktestMicrostructureCaptureService:
         result: dict[str, list[dict]] = {code: [] for code in codes}
         if source == "none":
             return result, []
-        if self._orderbook_db_path.exists():
-            with sqlite3.connect(self._orderbook_db_path) as conn:
-                for code in codes:
-                    rows = conn.execute(
-                        """
-                        SELECT trade_time, ask_price, bid_price, ask_qty, bid_qty,
-                               total_ask_qty, total_bid_qty
-                        FROM top_of_book_history
-                        WHERE code = ? AND trade_date = ?
-                          AND trade_time >= ? AND trade_time <= ?
-                        ORDER BY trade_time ASC, id ASC
-                        """,
-                        (code, date_ymd, start_hhmmss, end_hhmmss),
-                    ).fetchall()
-                    result[code] = [
-                        {
-                            "time": row[0],
-                            "ask_price": row[1],
-                            "bid_price": row[2],
-                            "ask_qty": row[3],
-                            "bid_qty": row[4],
-                            "total_ask_qty": row[5],
-                            "total_bid_qty": row[6],
-                        }
-                        for row in rows
-                    ]
+        if self._orderbook_dir.is_dir():
+            blocks = TickSegmentStore(str(self._orderbook_dir), TOP_OF_BOOK_STREAM).read(
+                date_ymd, codes, start_time=start_hhmmss, end_time=end_hhmmss
+            )
+            for code, block in blocks.items():
+                result[code] = [
+                    {
+                        "time": f"{int(block['time'][i]):06d}",
+                        "ask_price": int(block["ask_price"][i]),
+                        "bid_price": int(block["bid_price"][i]),
+                        "ask_qty": _qty_or_none(block["ask_qty"][i]),
+                        "bid_qty": _qty_or_none(block["bid_qty"][i]),
+                        "total_ask_qty": _qty_or_none(block["total_ask_qty"][i]),
+                        "total_bid_qty": _qty_or_none(block["total_bid_qty"][i]),
+                    }
+                    for i in range(len(block["time"]))
+                ]
         return result, [code for code in codes if not result[code]]
 
     async def _capture_program_trades(
@@ -441,6 +430,12 @@ class BacktestMicrostructureCaptureService:
         return paths
 
 
+def _qty_or_none(value: Any) -> int | None:
+    """top_of_book 세그먼트의 잔량 결측 표식(-1)을 None 으로 되돌린다."""
+    value = int(value)
+    return None if value < 0 else value
+
+
 def _extract_execution_strength(resp: Any) -> float | None:
     if not _is_success(resp):
         return None
@@ -14,6 +14,8 @@ from common.types import Exchange, OrderSide as LiveOrderSide
 from common.trade_journal_schema import normalize_backtest_decision, normalize_backtest_execution
 from common.types import TradeSignal
 from interfaces.live_strategy import LiveStrategy
+from services.backtest_cache_budget import BacktestCacheBudget, BoundedReplayCache
+from services.backtest_candidate_prescreen import BacktestCandidatePrescreen, PrescreenUniverseProxy
 from services.backtest_execution_simulator import (
     BacktestBar,
     BacktestExecutionReport,
@@ -25,6 +27,7 @@ from services.backtest_execution_simulator import (
 )
 from services.portfolio_concentration_service import compute_portfolio_concentration_summary
 
+_MISSING = object()
 
 class BacktestBarProvider(Protocol):
     async def get_bar(
@@ -89,6 +92,7 @@ class BacktestPeriodRunResult:
     journal_records: list[dict] = field(default_factory=list)
     portfolio: dict = field(default_factory=dict)
     saved_journal_run: dict = field(default_factory=dict)
+    prescreen: dict = field(default_factory=dict)
 
 
 class BacktestPeriodRunner:
@@ -109,6 +113,8 @@ class BacktestPeriodRunner:
         mtm_bar_provider: MarkToMarketBarProvider | None = None,
         market_regime_service=None,
         market_resolver: Callable[[str], str] | None = None,
+        candidate_prescreen: BacktestCandidatePrescreen | None = None,
+        cache_budget: BacktestCacheBudget | None = None,
     ) -> None:
         self._strategy = strategy
         self._bar_provider = bar_provider
@@ -124,28 +130,57 @@ class BacktestPeriodRunner:
         self._mtm_bar_provider = mtm_bar_provider
         self._market_regime_service = market_regime_service
         self._market_resolver = market_resolver
+        self._candidate_prescreen = candidate_prescreen
         self._position_excursions: dict[str, dict[str, object]] = {}
-        self._regime_snapshot_cache: dict[tuple[str, str], object] = {}
+        self._regime_snapshot_cache = BoundedReplayCache(
+            "regime_snapshots", budget=cache_budget, date_index=0,
+        )
+
+    @property
+    def strategy_name(self) -> str:
+        return self._strategy.name
+
+    @property
+    def ledger(self) -> BacktestPortfolioLedger:
+        return self._ledger
 
     async def run(self, dates: Sequence[str]) -> BacktestPeriodRunResult:
-        result = BacktestPeriodRunResult(
-            strategy_name=self._strategy.name,
-            dates=[str(date) for date in dates],
-            execution_bar_policy=_execution_bar_policy_value(self._config.execution_bar_policy),
-        )
+        result = self._new_result(dates)
 
         for date_ymd in result.dates:
             self._set_backtest_date(date_ymd)
             await self._run_exits(date_ymd, result)
             await self._run_entries(date_ymd, result)
 
+        self._finish(result)
+        return result
+
+    def _new_result(self, dates: Sequence[str]) -> BacktestPeriodRunResult:
+        return BacktestPeriodRunResult(
+            strategy_name=self._strategy.name,
+            dates=[str(date) for date in dates],
+            execution_bar_policy=_execution_bar_policy_value(self._config.execution_bar_policy),
+        )
+
+    def _finish(self, result: BacktestPeriodRunResult) -> None:
         result.portfolio = self._portfolio_summary()
+        if self._candidate_prescreen is not None:
+            result.prescreen = self._candidate_prescreen.stats_snapshot()
         self._persist_journal(result)
-        return result
 
     async def _run_exits(self, date_ymd: str, result: BacktestPeriodRunResult) -> None:
-        holdings = self._holdings_for_strategy()
-        sell_signals = await self._strategy.check_exits(holdings)
+        await self._apply_exits(date_ymd, await self._evaluate_exits(), result)
+
+    async def _evaluate_exits(self) -> list[TradeSignal]:
+        """전략 check_exits 만 실행한다 (장부 반영 없음 — 포트폴리오 runner 가 전략별로 동시에 부른다)."""
+        return await self._strategy.check_exits(self._holdings_for_strategy())
+
+    async def _apply_exits(
+        self,
+        date_ymd: str,
+        sell_signals: Sequence[TradeSignal],
+        result: BacktestPeriodRunResult,
+    ) -> None:
         for signal in sell_signals:
             order = self._signal_to_order(signal, 0, side=OrderSide.SELL)
             blocked_reason = await self._risk_gate_rejection_reason(order, signal, side=OrderSide.SELL)
@@ -171,10 +206,15 @@ class BacktestPeriodRunner:
             )
 
     async def _run_entries(self, date_ymd: str, result: BacktestPeriodRunResult) -> None:
-        buy_signals = [
-            signal for signal in await self._strategy.scan()
-            if signal.action == "BUY"
-        ]
+        await self._apply_entries(date_ymd, await self._scan(date_ymd), result)
+
+    async def _apply_entries(
+        self,
+        date_ymd: str,
+        signals: Sequence[TradeSignal],
+        result: BacktestPeriodRunResult,
+    ) -> None:
+        buy_signals = [signal for signal in signals if signal.action == "BUY"]
         buy_signals = await self._filter_market_timing_blocked_buys(
             buy_signals, date_ymd, result
         )
@@ -243,6 +283,32 @@ class BacktestPeriodRunner:
                     )
                 )
 
+    async def _scan(self, date_ymd: str) -> list[TradeSignal]:
+        """라이브 scan() 실행. 후보 프리스크린이 있으면 그날 마스크에 남은 종목만 watchlist 에 둔다.
+
+        verify 거래일에는 watchlist 를 줄이지 않고 전체 scan 결과가 마스크 경로와 같은지 확인한다
+        (scan 이 시그널 시 포지션 state 를 바꾸므로 같은 날 두 번 돌리지 않는다).
+        """
+        prescreen = self._candidate_prescreen
+        universe = getattr(self._strategy, "_universe", None)
+        if prescreen is None or universe is None:
+            return await self._strategy.scan()
+
+        verify = prescreen.should_verify(date_ymd)
+        proxy = PrescreenUniverseProxy(universe, prescreen, date_ymd, passthrough=verify)
+        self._strategy._universe = proxy
+        try:
+            signals = await self._strategy.scan()
+        finally:
+            self._strategy._universe = universe
+        if verify:
+            prescreen.verify(
+                date_ymd,
+                [signal for signal in signals if signal.action == "BUY"],
+                proxy.allowed_codes,
+            )
+        return signals
+
     async def _filter_market_timing_blocked_buys(
         self,
         signals: list[TradeSignal],
@@ -280,11 +346,12 @@ class BacktestPeriodRunner:
 
     async def _get_regime_snapshot(self, market: str, date_ymd: str):
         cache_key = (date_ymd, market)
-        if cache_key not in self._regime_snapshot_cache:
-            self._regime_snapshot_cache[cache_key] = await self._market_regime_service.classify_on_date(
-                market, date_ymd
-            )
-        return self._regime_snapshot_cache[cache_key]
+        snapshot = self._regime_snapshot_cache.get(cache_key, _MISSING)
+        if snapshot is not _MISSING:
+            return snapshot
+        snapshot = await self._market_regime_service.classify_on_date(market, date_ymd)
+        self._regime_snapshot_cache[cache_key] = snapshot
+        return snapshot
 
     async def _market_regime_for_signal(self, signal: TradeSignal, date_ymd: str) -> dict | None:
         if self._market_regime_service is None or self._market_resolver is None:
@@ -611,6 +678,7 @@ class BacktestPeriodRunner:
             "execution_report_count": len(result.execution_reports),
             "execution_bar_policy": _execution_bar_policy_value(self._config.execution_bar_policy),
             "portfolio": result.portfolio,
+            **({"prescreen": result.prescreen} if result.prescreen else {}),
             **self._metadata,
         }
         result.saved_journal_run = self._backtest_journal_repository.save_run(
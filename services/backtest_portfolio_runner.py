@@ -0,0 +1,168 @@
+"""Portfolio backtest: 여러 활성 전략을 하나의 replay 컨텍스트·장부로 함께 돌린다.
+
+전략별 단독 백테스트(BacktestPeriodRunner.run)는 전략마다 replay 서비스·bar provider·
+레짐 캐시를 새로 만들어 같은 일봉/분봉/레짐 스냅샷을 전략 수만큼 다시 읽는다. 이 runner 는
+
+  - 모든 전략이 거래일을 함께 진행하며 replay 서비스·bar provider·레짐 스냅샷을 공유하고,
+  - 거래일마다 전략별 평가(check_exits → scan)를 동시에 실행한 뒤,
+  - 주문 예약/체결은 전략 순서대로 하나의 BacktestPortfolioLedger 에 반영한다
+    (현금·포지션 한도가 전략 간에 공유된다 — 평가는 동시, 장부 반영은 결정적 순서).
+
+공유 캐시는 거래일 단위로 커지므로, 각 거래일을 마친 뒤 ``cache_retain_days`` 보다 오래된
+거래일 항목을 ``evict_before()`` 로 버려 메모리 상한을 둔다.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from services.backtest_period_runner import BacktestPeriodRunner, BacktestPeriodRunResult
+
+
+class SharedRegimeSnapshotCache:
+    """MarketRegimeService.classify_on_date 공유 캐시 (전략 runner 들이 함께 쓴다).
+
+    같은 (시장, 거래일)을 동시에 요청하면 계산은 한 번만 하고, 항목 수가 max_entries 를
+    넘으면 오래된 것부터 버린다. 그 외 속성은 원본 서비스에 위임한다.
+    """
+
+    def __init__(self, market_regime_service: Any, *, max_entries: int = 256) -> None:
+        self._inner = market_regime_service
+        self._max_entries = max(int(max_entries), 1)
+        self._snapshots: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def classify_on_date(self, market: str, date_ymd: str):
+        key = (str(market), str(date_ymd))
+        if key in self._snapshots:
+            self.hits += 1
+            self._snapshots.move_to_end(key)
+            return self._snapshots[key]
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._load(key))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _done, key=key: self._inflight.pop(key, None))
+        else:
+            self.hits += 1
+        return await asyncio.shield(pending)
+
+    async def _load(self, key: tuple[str, str]):
+        snapshot = await self._inner.classify_on_date(*key)
+        self._snapshots[key] = snapshot
+        while len(self._snapshots) > self._max_entries:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+    def stats(self) -> dict:
+        return {"entries": len(self._snapshots), "hits": self.hits, "misses": self.misses}
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+
+@dataclass
+class BacktestPortfolioRunResult:
+    dates: list[str]
+    strategy_results: dict[str, BacktestPeriodRunResult] = field(default_factory=dict)
+    portfolio: dict = field(default_factory=dict)
+    wall_time_sec: float = 0.0
+    strategy_eval_sec: dict[str, float] = field(default_factory=dict)
+    cache: dict = field(default_factory=dict)
+    # 단독 실행 비교(--portfolio-compare-single)를 돌렸을 때만 채운다.
+    single_run_wall_sec: dict[str, float] = field(default_factory=dict)
+
+
+class BacktestPortfolioRunner:
+    def __init__(
+        self,
+        runners: Sequence[BacktestPeriodRunner],
+        *,
+        cache_targets: Sequence[object] = (),
+        cache_retain_days: int = 1,
+        regime_cache: SharedRegimeSnapshotCache | None = None,
+    ) -> None:
+        if not runners:
+            raise ValueError("portfolio backtest 에는 전략 runner 가 1개 이상 필요합니다.")
+        ledger = runners[0].ledger
+        if any(runner.ledger is not ledger for runner in runners):
+            raise ValueError("portfolio backtest runner 들은 같은 BacktestPortfolioLedger 를 공유해야 합니다.")
+        names = [runner.strategy_name for runner in runners]
+        if len(set(names)) != len(names):
+            raise ValueError(f"portfolio backtest 전략 이름이 중복됩니다: {names}")
+        self._runners = list(runners)
+        self._ledger = ledger
+        self._cache_targets = list(cache_targets)
+        self._cache_retain_days = max(int(cache_retain_days), 1)
+        self._regime_cache = regime_cache
+
+    async def run(self, dates: Sequence[str]) -> BacktestPortfolioRunResult:
+        started = time.perf_counter()
+        date_list = [str(date) for date in dates]
+        result = BacktestPortfolioRunResult(dates=date_list)
+        results = {runner.strategy_name: runner._new_result(date_list) for runner in self._runners}
+        eval_sec = {runner.strategy_name: 0.0 for runner in self._runners}
+        evicted = 0
+
+        for index, date_ymd in enumerate(date_list):
+            for runner in self._runners:
+                runner._set_backtest_date(date_ymd)
+
+            exit_signals = await self._evaluate_all(lambda runner: runner._evaluate_exits(), eval_sec)
+            for runner, signals in zip(self._runners, exit_signals):
+                await runner._apply_exits(date_ymd, signals, results[runner.strategy_name])
+
+            entry_signals = await self._evaluate_all(lambda runner: runner._scan(date_ymd), eval_sec)
+            for runner, signals in zip(self._runners, entry_signals):
+                await runner._apply_entries(date_ymd, signals, results[runner.strategy_name])
+
+            keep_from = index - self._cache_retain_days + 1
+            if keep_from > 0:
+                evicted += self._evict_before(date_list[keep_from])
+
+        for runner in self._runners:
+            runner._finish(results[runner.strategy_name])
+        result.strategy_results = results
+        result.portfolio = self._runners[0]._portfolio_summary()
+        result.strategy_eval_sec = {name: round(sec, 4) for name, sec in eval_sec.items()}
+        result.cache = self._cache_stats(evicted)
+        result.wall_time_sec = round(time.perf_counter() - started, 4)
+        return result
+
+    async def _evaluate_all(self, evaluate, eval_sec: dict[str, float]) -> list[list]:
+        async def _timed(runner: BacktestPeriodRunner):
+            started = time.perf_counter()
+            try:
+                return await evaluate(runner)
+            finally:
+                eval_sec[runner.strategy_name] += time.perf_counter() - started
+
+        return list(await asyncio.gather(*(_timed(runner) for runner in self._runners)))
+
+    def _evict_before(self, date_ymd: str) -> int:
+        evicted = 0
+        for target in self._cache_targets:
+            evict = getattr(target, "evict_before", None)
+            if callable(evict):
+                evicted += int(evict(date_ymd) or 0)
+        return evicted
+
+    def _cache_stats(self, evicted: int) -> dict:
+        stats: dict[str, Any] = {
+            "retain_days": self._cache_retain_days,
+            "evicted_entries": evicted,
+            "resident_entries": sum(
+                int(target.cache_entry_count())
+                for target in self._cache_targets
+                if callable(getattr(target, "cache_entry_count", None))
+            ),
+        }
+        if self._regime_cache is not None:
+            stats["regime"] = self._regime_cache.stats()
+        return stats
@@ -1,6 +1,7 @@
 """Replay adapters for period backtests."""
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from bisect import bisect_right
@@ -10,6 +11,7 @@ from typing import Any, Optional, Sequence, Tuple
 
 from common.market_snapshot import ConclusionSnapshot, MarketSnapshot
 from common.types import ErrorCode, ResCommonResponse, TradeSignal
+from services.backtest_cache_budget import BacktestCacheBudget, BoundedReplayCache
 from services.backtest_execution_simulator import BacktestBar
 from services.data_quality_service import DataQualityService
 
@@ -31,6 +33,7 @@ class StockQueryBacktestReplayService:
         market_clock: Any | None = None,
         session: str = "REGULAR",
         delisted_ohlcv_store: Any | None = None,
+        cache_budget: BacktestCacheBudget | None = None,
     ) -> None:
         self._stock_query_service = stock_query_service
         self._program_provider = program_provider
@@ -39,12 +42,21 @@ class StockQueryBacktestReplayService:
         # R-1 생존편향: primary sqs 에 없는 상폐 종목 일봉을 fallback 제공(opt-in).
         self._delisted_ohlcv_store = delisted_ohlcv_store
         self._backtest_date: str | None = None
-        self._row_cache: dict[tuple[str, str, str, str], list[dict]] = {}
-        self._program_cache: dict[tuple[str, str], dict] = {}
+        # (code, date, session, cutoff) → 분봉 row / (code, date) → 프로그램매매 일별
+        self._row_cache = BoundedReplayCache("replay_rows", budget=cache_budget)
+        self._row_inflight: dict[tuple[str, str, str, str], asyncio.Future] = {}
+        self._program_cache = BoundedReplayCache("replay_program", budget=cache_budget)
 
     def set_backtest_date(self, date_ymd: str) -> None:
         self._backtest_date = str(date_ymd)
 
+    def evict_before(self, date_ymd: str) -> int:
+        """date_ymd 이전 거래일의 분봉/프로그램 캐시를 버린다. 버린 항목 수를 반환."""
+        return _evict_dated(self._row_cache, date_ymd) + _evict_dated(self._program_cache, date_ymd)
+
+    def cache_entry_count(self) -> int:
+        return len(self._row_cache) + len(self._program_cache)
+
     async def get_current_price(self, stock_code: str, *args, **kwargs) -> ResCommonResponse:
         date_ymd = self._require_date()
         rows = await self._get_intraday_rows(stock_code, date_ymd)
@@ -296,9 +308,24 @@ class StockQueryBacktestReplayService:
 
     async def _get_intraday_rows(self, stock_code: str, date_ymd: str) -> list[dict]:
         key = (stock_code, date_ymd, self._session, self._cutoff_hhmmss())
-        if key in self._row_cache:
-            return self._row_cache[key]
-
+        cached = self._row_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # 포트폴리오 백테스트에서는 여러 전략이 같은 종목을 동시에 조회한다 — 로드는 한 번만.
+        pending = self._row_inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_intraday_rows(key, stock_code, date_ymd))
+            self._row_inflight[key] = pending
+            pending.add_done_callback(lambda _done, key=key: self._row_inflight.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _load_intraday_rows(
+        self,
+        key: tuple[str, str, str, str],
+        stock_code: str,
+        date_ymd: str,
+    ) -> list[dict]:
         rows = await self._stock_query_service.get_day_intraday_minutes_list(
             stock_code,
             date_ymd=date_ymd,
@@ -338,7 +365,8 @@ class StockQueryBacktestReplayService:
         if self._program_provider is None:
             return None
         key = (stock_code, date_ymd)
-        if key not in self._program_cache:
+        row = self._program_cache.get(key)
+        if row is None:
             getter = getattr(self._program_provider, "get_program_trade_by_stock_daily", None)
             if not callable(getter):
                 return None
@@ -347,9 +375,9 @@ class StockQueryBacktestReplayService:
                 data = response.data if response.rt_cd == ErrorCode.SUCCESS.value else None
             else:
                 data = response
-            self._program_cache[key] = data if isinstance(data, dict) else {}
+            row = data if isinstance(data, dict) else {}
+            self._program_cache[key] = row
 
-        row = self._program_cache[key]
         return self._to_int(self._first(
             row,
             "whol_smtn_ntby_qty",
@@ -404,6 +432,7 @@ class StockQueryIntradayReplayBarProvider:
         session: str = "REGULAR",
         microstructure_dir: str | Path | None = None,
         max_orderbook_age_sec: int = 120,
+        cache_budget: BacktestCacheBudget | None = None,
     ) -> None:
         self._stock_query_service = stock_query_service
         self._session = session
@@ -411,9 +440,10 @@ class StockQueryIntradayReplayBarProvider:
             Path(microstructure_dir) if microstructure_dir is not None else None
         )
         self._max_orderbook_age_sec = max(0, int(max_orderbook_age_sec))
-        self._cache: dict[tuple[str, str, str], list[BacktestBar]] = {}
-        self._row_cache: dict[tuple[str, str, str], list[dict]] = {}
-        self._orderbook_cache: dict[tuple[str, str], list[dict]] = {}
+        # (code, date, session) → bar / 원본 row, (code, date) → 호가 overlay
+        self._cache = BoundedReplayCache("intraday_bars", budget=cache_budget)
+        self._row_cache = BoundedReplayCache("intraday_rows", budget=cache_budget)
+        self._orderbook_cache = BoundedReplayCache("orderbook_rows", budget=cache_budget)
         self._quality_manifest: dict | None = None
         self._date_quality_cache: dict[str, bool | None] = {}
 
@@ -422,6 +452,17 @@ class StockQueryIntradayReplayBarProvider:
         if callable(setter):
             setter(date_ymd)
 
+    def evict_before(self, date_ymd: str) -> int:
+        """date_ymd 이전 거래일의 분봉 bar/row/호가 캐시를 버린다. 버린 항목 수를 반환."""
+        return (
+            _evict_dated(self._cache, date_ymd)
+            + _evict_dated(self._row_cache, date_ymd)
+            + _evict_dated(self._orderbook_cache, date_ymd)
+        )
+
+    def cache_entry_count(self) -> int:
+        return len(self._cache) + len(self._row_cache) + len(self._orderbook_cache)
+
     async def get_bar(
         self,
         *,
@@ -446,8 +487,9 @@ class StockQueryIntradayReplayBarProvider:
 
     async def _get_bars(self, code: str, date_ymd: str) -> list[BacktestBar]:
         key = (code, date_ymd, self._session)
-        if key in self._cache:
-            return self._cache[key]
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
         rows = await self._stock_query_service.get_day_intraday_minutes_list(
             code,
@@ -531,8 +573,9 @@ class StockQueryIntradayReplayBarProvider:
 
     def _load_orderbook_rows(self, code: str, date_ymd: str) -> list[dict]:
         key = (code, date_ymd)
-        if key in self._orderbook_cache:
-            return self._orderbook_cache[key]
+        cached = self._orderbook_cache.get(key)
+        if cached is not None:
+            return cached
         rows: list[dict] = []
         if self._microstructure_dir is not None and self._overlay_date_is_valid(date_ymd):
             path = self._microstructure_dir / f"replay_orderbook_intraday_{date_ymd}.json"
@@ -651,10 +694,19 @@ class StockQueryDailyMtmBarProvider:
         stock_query_service: Any,
         *,
         lookback_padding_days: int = 10,
+        cache_budget: BacktestCacheBudget | None = None,
     ) -> None:
         self._stock_query_service = stock_query_service
         self._lookback_padding_days = max(int(lookback_padding_days), 0)
-        self._cache: dict[tuple[str, str, int], list[BacktestBar]] = {}
+        # (code, end_ymd, limit) → 보유기간 일봉
+        self._cache = BoundedReplayCache("mtm_bars", budget=cache_budget)
+
+    def evict_before(self, date_ymd: str) -> int:
+        """매도일(end_ymd)이 date_ymd 이전인 보유기간 일봉 캐시를 버린다."""
+        return _evict_dated(self._cache, date_ymd)
+
+    def cache_entry_count(self) -> int:
+        return len(self._cache)
 
     async def get_holding_bars(
         self,
@@ -675,8 +727,9 @@ class StockQueryDailyMtmBarProvider:
 
     async def _get_daily_bars(self, code: str, end_ymd: str, limit: int) -> list[BacktestBar]:
         key = (code, end_ymd, limit)
-        if key in self._cache:
-            return self._cache[key]
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
         response = await self._stock_query_service.get_recent_daily_ohlcv(
             code,
@@ -752,6 +805,14 @@ class StockQueryDailyMtmBarProvider:
         return int(result) if result is not None else None
 
 
+def _evict_dated(cache: dict, date_ymd: str) -> int:
+    """(code, date_ymd, ...) 키 캐시에서 date_ymd 이전 항목을 지운다."""
+    stale = [key for key in cache if str(key[1]) < str(date_ymd)]
+    for key in stale:
+        del cache[key]
+    return len(stale)
+
+
 def _policy_value(policy) -> str:
     return str(getattr(policy, "value", policy) or "current_bar")
 
@@ -313,21 +313,21 @@ class DataQualityService:
         if qty <= 0 or price < 0:
             return self._result(False, self.REASON_INVALID_TICK, "error", code=stock_code)
 
-        cached = None
+        quote = None
         if self._price_stream_service is not None:
             try:
-                cached = self._price_stream_service.get_cached_price(stock_code)
+                quote = self._price_stream_service.get_price_quote(stock_code)
             except Exception as exc:
                 if self._logger:
                     self._logger.warning(f"DataQuality 가격 캐시 조회 실패 ({stock_code}): {exc}")
 
-        if not cached:
+        if quote is None:
             return self._result(True, "no_realtime_reference", "info", code=stock_code)
 
-        received_at = self._to_float(cached.get("received_at"))
+        received_at = quote.received_at
         now_ts = time.time()
         latency = max(now_ts - received_at, 0.0) if received_at else None
-        reference_price = self._to_float(cached.get("price"))
+        reference_price = quote.price
         if latency is None or latency > self._cfg.max_tick_age_sec:
             ok = not self._cfg.block_on_stale_price
             return self._result(
@@ -342,7 +342,7 @@ class DataQualityService:
                     "order_price": price,
                     "reference_price": reference_price,
                     "reference_received_at": received_at,
-                    "reference_source": cached.get("quality_reason") or "unknown",
+                    "reference_source": quote.quality_reason or "unknown",
                 },
             )
 
@@ -5,12 +5,18 @@
 `get_recent_daily_ohlcv` 와 동일한 행 스키마(`date`=YYYYMMDD 오름차순,
 open/high/low/close=float, volume=int)로 돌려준다.
 
+내부 저장은 종목별 날짜 오름차순 컬럼 배열이다. end_date/limit 질의는 날짜 배열
+bisect 로 구간을 잘라 그 구간만 행으로 만든다 — 날짜마다 전체 행을 필터링하지 않는다
+(`PointInTimeUniverseIndex` 와 같은 날짜 인덱스 방식).
+
 이 store 는 행(row) 데이터만 돌려주는 순수 소스다. replay_sqs 가 primary
 데이터에 없는 상폐 코드를 이 store 로 fallback 시키는 배선은 다음 단계(3단계).
 """
 from __future__ import annotations
 
 import csv
+from bisect import bisect_right
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
@@ -50,11 +56,46 @@ def _normalize_code(value: Any) -> str:
     return text.zfill(6) if text.isdigit() else text
 
 
+_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True)
+class _DailyColumns:
+    """한 종목의 일봉 컬럼 배열 (dates 오름차순, 나머지는 같은 인덱스)."""
+
+    dates: tuple[str, ...]
+    open: tuple[float | None, ...]
+    high: tuple[float | None, ...]
+    low: tuple[float | None, ...]
+    close: tuple[float | None, ...]
+    volume: tuple[int | None, ...]
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "_DailyColumns":
+        return cls(
+            dates=tuple(r["date"] for r in rows),
+            **{col: tuple(r[col] for r in rows) for col in _COLUMNS},
+        )
+
+    def rows(self, lo: int, hi: int) -> list[dict]:
+        return [
+            {
+                "date": self.dates[i],
+                "open": self.open[i],
+                "high": self.high[i],
+                "low": self.low[i],
+                "close": self.close[i],
+                "volume": self.volume[i],
+            }
+            for i in range(lo, hi)
+        ]
+
+
 class DelistedOhlcvStore:
     """상폐 종목 일봉을 get_recent_daily_ohlcv 호환 행으로 제공한다."""
 
     def __init__(self, rows_by_code: Mapping[str, Iterable[Mapping[str, Any]]]):
-        normalized: dict[str, list[dict]] = {}
+        normalized: dict[str, _DailyColumns] = {}
         for code, rows in (rows_by_code or {}).items():
             norm_code = _normalize_code(code)
             if not norm_code:
@@ -62,8 +103,8 @@ class DelistedOhlcvStore:
             norm_rows = [r for r in (_normalize_row(row) for row in rows) if r is not None]
             norm_rows.sort(key=lambda r: r["date"])
             if norm_rows:
-                normalized[norm_code] = norm_rows
-        self._rows_by_code = normalized
+                normalized[norm_code] = _DailyColumns.from_rows(norm_rows)
+        self._columns_by_code = normalized
 
     @classmethod
     def from_backfill_dir(cls, path: Any) -> "DelistedOhlcvStore":
@@ -80,10 +121,10 @@ class DelistedOhlcvStore:
         return cls(rows_by_code)
 
     def codes(self) -> set[str]:
-        return set(self._rows_by_code.keys())
+        return set(self._columns_by_code.keys())
 
     def has(self, code: str) -> bool:
-        return _normalize_code(code) in self._rows_by_code
+        return _normalize_code(code) in self._columns_by_code
 
     def get_daily_rows(
         self,
@@ -93,12 +134,12 @@ class DelistedOhlcvStore:
         end_date: str | None = None,
     ) -> list[dict]:
         """code 의 일봉 행(오름차순). end_date(YYYYMMDD/YYYY-MM-DD) 이하만, 최근 limit 개."""
-        rows = self._rows_by_code.get(_normalize_code(code))
-        if not rows:
+        columns = self._columns_by_code.get(_normalize_code(code))
+        if columns is None:
             return []
         end_compact = _compact_date(end_date) if end_date else ""
-        if end_compact:
-            rows = [r for r in rows if r["date"] <= end_compact]
+        hi = bisect_right(columns.dates, end_compact) if end_compact else len(columns.dates)
+        lo = 0
         if limit is not None and limit >= 0:
-            rows = rows[-limit:] if limit else []
-        return [dict(r) for r in rows]
+            lo = max(0, hi - limit)
+        return columns.rows(lo, hi)
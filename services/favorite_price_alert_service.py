@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Callable, Optional
 from zoneinfo import ZoneInfo
 
+from core.lazy_service import aresolve_lazy
 from repositories.favorite_repository import MARKET_DOMESTIC, MARKET_OVERSEAS_US
 from services.notification_service import (
     NotificationCategory,
@@ -123,7 +124,7 @@ class FavoritePriceAlertService:
         await self._save_alert_state()
 
         threshold_pct = int(bucket * self._threshold_step_pct)
-        name = self._stock_name(normalized)
+        name = await self._stock_name(normalized)
         direction = "상승" if threshold_pct > 0 else "하락"
         signed_threshold = self._format_signed_pct(threshold_pct)
         signed_rate = self._format_signed_pct(rate_value)
@@ -151,7 +152,7 @@ class FavoritePriceAlertService:
         return True
 
     async def _emit_upper_limit_alert(self, code: str, price, rate_value: float) -> bool:
-        name = self._stock_name(code)
+        name = await self._stock_name(code)
         signed_rate = self._format_signed_pct(rate_value)
         formatted_price = self._format_price(price)
 
@@ -310,11 +311,13 @@ class FavoritePriceAlertService:
             return -rate
         return rate
 
-    def _stock_name(self, code: str) -> str:
-        if self._stock_code_repository is None:
+    async def _stock_name(self, code: str) -> str:
+        # 해외 종목 마스터는 지연 생성 프록시(LazyService)라 루프 밖에서 만든다.
+        repository = await aresolve_lazy(self._stock_code_repository)
+        if repository is None:
             return code
         try:
-            return self._stock_code_repository.get_name_by_code(code) or code
+            return repository.get_name_by_code(code) or code
         except Exception:
             return code
 
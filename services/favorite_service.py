@@ -2,6 +2,7 @@
 관심종목 서비스 - 비즈니스 로직 담당.
 """
 import asyncio
+from core.lazy_service import aresolve_lazy
 from repositories.favorite_repository import (
     FavoriteRepository,
     MARKET_DOMESTIC,
@@ -236,11 +237,13 @@ class FavoriteService:
         if not symbols:
             return []
 
+        # 심볼 마스터는 지연 생성 프록시(LazyService)라 루프 밖에서 만든다.
+        repository = await aresolve_lazy(self.overseas_stock_code_repository)
         result = {}
         for symbol in symbols:
             meta = None
-            if self.overseas_stock_code_repository:
-                meta = self.overseas_stock_code_repository.get_meta(symbol)
+            if repository:
+                meta = repository.get_meta(symbol)
             result[symbol] = {
                 "code": symbol,
                 "name": (meta or {}).get("name") or symbol,
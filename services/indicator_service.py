@@ -15,6 +15,15 @@ if TYPE_CHECKING:
     from services.stock_query_service import StockQueryService
     from services.operator_alert_service import OperatorAlertService
 
+# 장전 웜업이 미리 계산해 두는 확정 일봉 지표 — 라이브 전략/사이징이 exclude_today=True 로 조회하는 조합.
+# (지표, 인자) 인자 순서는 get_rsi / get_moving_average / get_bollinger_bands / calculate_atr 와 같다.
+DEFAULT_WARMUP_INDICATORS = (
+    ("rsi", (2,)),              # RSI2 눌림목 진입
+    ("ma", (5, "sma")),         # RSI2 익절 MA
+    ("ma", (200, "sma")),       # RSI2 추세 붕괴 MA
+    ("atr", (14,)),             # 포지션 사이징 ATR
+)
+
 class IndicatorService:
     """
     기술적 지표 계산을 담당하는 서비스.
@@ -180,8 +189,7 @@ class IndicatorService:
         # exclude_today=True 면 effective_data 전체가 confirmed → partial merge 없이 캐시 결과만 반환.
         # cache_key 는 effective_data 마지막 행 날짜 기준 (include 경로와 같은 confirmed 일자) → cache 공유.
         if exclude_today:
-            confirmed_last_date = str(effective_data[-1]['date'])
-            cache_key = f"{indicator_name}_{stock_code}_{confirmed_last_date}"
+            cache_key = self._confirmed_cache_key(indicator_name, stock_code, effective_data)
             cached_result = self.cache_store.get(cache_key)
             if not cached_result:
                 calc_resp = calc_func(stock_code, effective_data, *calc_args)
@@ -196,10 +204,9 @@ class IndicatorService:
 
         # 2. 확정 데이터(어제까지)와 당일 데이터 분리
         confirmed_data = data[:-1]
-        confirmed_last_date = str(confirmed_data[-1]['date'])
 
-        # 캐시 키 생성 (지표명_종목코드_마지막확정일자)
-        cache_key = f"{indicator_name}_{stock_code}_{confirmed_last_date}"
+        # 캐시 키 생성 (지표명_종목코드_첫확정일자_마지막확정일자_길이)
+        cache_key = self._confirmed_cache_key(indicator_name, stock_code, confirmed_data)
 
         # 3. 캐시 조회
         cached_result = self.cache_store.get(cache_key)
@@ -245,6 +252,92 @@ class IndicatorService:
 
         return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="성공(CacheHit)", data=final_data)
 
+    @staticmethod
+    def _confirmed_cache_key(indicator_name: str, stock_code: str, confirmed_data: List[Dict]) -> str:
+        # 마지막 일자만으로는 조회 구간(ohlcv_limit)이 다른 호출이 한 항목을 공유해 길이·값이 어긋난다.
+        return (
+            f"{indicator_name}_{stock_code}_{confirmed_data[0]['date']}_"
+            f"{confirmed_data[-1]['date']}_{len(confirmed_data)}"
+        )
+
+    def _warmup_indicator_plan(self, kind: str, args: tuple) -> tuple:
+        """(캐시 지표명, lookback, 계산 함수) — get_* 메서드가 쓰는 이름과 같아야 캐시를 공유한다."""
+        if kind == "rsi":
+            (period,) = args
+            return f"rsi_{period}", period, self._calculate_rsi_series
+        if kind == "ma":
+            period, method = args
+            return f"ma_{period}_{method}", period, self._calculate_moving_average_full
+        if kind == "bb":
+            period, multiplier = args
+            return f"bb_{period}_{multiplier}", period, self._calculate_bollinger_bands_full
+        if kind == "atr":
+            (period,) = args
+            return f"atr_{period}", period, self._calculate_atr_full
+        raise ValueError(f"지원하지 않는 웜업 지표: {kind}")
+
+    def warm_confirmed_indicators(
+        self,
+        stock_code: str,
+        confirmed_data: List[Dict],
+        specs=DEFAULT_WARMUP_INDICATORS,
+    ) -> int:
+        """확정 일봉(당일 미포함)으로 지표를 계산해 증분 캐시에 미리 넣는다 (장전 웜업).
+
+        장중 get_* 호출은 같은 마지막 확정일 키로 캐시를 적중해 전체 재계산 없이 당일 봉만 계산한다.
+        동기 CPU 작업이므로 호출 측이 스레드로 넘긴다. 반환: 새로 캐시한 지표 수.
+        """
+        if not self.cache_store or not confirmed_data:
+            return 0
+        warmed = 0
+        for kind, args in specs:
+            indicator_name, lookback, calc_func = self._warmup_indicator_plan(kind, tuple(args))
+            if len(confirmed_data) <= lookback:
+                continue  # _get_with_incremental_cache 도 이 길이에선 캐시를 쓰지 않는다
+            cache_key = self._confirmed_cache_key(indicator_name, stock_code, confirmed_data)
+            if self.cache_store.get(cache_key):
+                continue
+            resp = calc_func(stock_code, confirmed_data, *args)
+            if isinstance(resp, ResCommonResponse):
+                if resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+                    continue
+                resp = resp.data
+            self.cache_store.set(cache_key, resp)
+            warmed += 1
+        return warmed
+
+    def export_confirmed_indicators(
+        self,
+        stock_code: str,
+        confirmed_data: List[Dict],
+        specs=DEFAULT_WARMUP_INDICATORS,
+    ) -> Dict[str, List[Dict]]:
+        """확정 일봉 기준으로 증분 캐시에 올라와 있는 지표 시계열을 {캐시 키: rows} 로 반환한다 (웜 리스타트 스냅샷용)."""
+        if not self.cache_store or not confirmed_data:
+            return {}
+        exported: Dict[str, List[Dict]] = {}
+        for kind, args in specs:
+            indicator_name, lookback, _ = self._warmup_indicator_plan(kind, tuple(args))
+            if len(confirmed_data) <= lookback:
+                continue
+            cache_key = self._confirmed_cache_key(indicator_name, stock_code, confirmed_data)
+            rows = self.cache_store.get(cache_key)
+            if rows:
+                exported[cache_key] = rows
+        return exported
+
+    def restore_confirmed_indicators(self, entries: Dict[str, List[Dict]]) -> int:
+        """스냅샷의 지표 시계열을 재계산 없이 증분 캐시에 넣는다. 이미 있는 키는 건드리지 않는다."""
+        if not self.cache_store:
+            return 0
+        restored = 0
+        for cache_key, rows in entries.items():
+            if not rows or self.cache_store.get(cache_key):
+                continue
+            self.cache_store.set(cache_key, rows)
+            restored += 1
+        return restored
+
     async def get_bollinger_bands(self, stock_code: str, period: int = 20, multiplier: float = 2.0, candle_type: str = "D",
                                  ohlcv_data: Optional[List[Dict]] = None) -> ResCommonResponse:
         """볼린저 밴드 조회"""
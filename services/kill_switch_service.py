@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -10,8 +9,8 @@ import pytz
 from common.operator_alert_types import AlertSource
 from common.strategy_identity import STRATEGY_IDENTITY_RESOLVER
 from config.config_loader import KillSwitchConfig
+from services.kill_switch_state_journal import KillSwitchStateJournal
 from services.notification_service import NotificationCategory, NotificationLevel, NotificationService
-from utils.atomic_json import write_json_atomic
 
 if TYPE_CHECKING:
     from config.config_loader import RiskGateConfig
@@ -62,6 +61,14 @@ class KillSwitchService:
         self._strategy_daily_loss_won: dict[str, int] = {}               # 전략명 → 일손실누적(원)
 
         self._state_path = Path(self._cfg.state_file_path)
+        # 카운터 변경은 delta journal 로 coalescing, 트립/해제는 동기 snapshot.
+        self._journal = KillSwitchStateJournal(
+            self._state_path,
+            self._state_dict,
+            flush_interval_sec=getattr(self._cfg, "journal_flush_interval_sec", 0.2),
+            compact_every=getattr(self._cfg, "journal_compact_every", 500),
+            logger=self._logger,
+        )
         self._load_state()
 
     # ── 조회 ──────────────────────────────────────────────────────────
@@ -127,7 +134,10 @@ class KillSwitchService:
             elif count_for_consecutive_loss:
                 self._consecutive_losses = 0
 
-            self._save_state()
+            self._journal_state({
+                "consecutive_losses": self._consecutive_losses,
+                "daily_realized_loss_won": self._daily_realized_loss_won,
+            })
 
             meta = {"code": code, "strategy": strategy, "profit_won": profit_won}
 
@@ -160,7 +170,7 @@ class KillSwitchService:
             return
         async with self._lock:
             self._consecutive_api_errors += 1
-            self._save_state()
+            self._journal_state({"consecutive_api_errors": self._consecutive_api_errors})
             if self._consecutive_api_errors >= self._cfg.max_consecutive_api_errors:
                 await self._trip(
                     f"연속 API 오류 {self._consecutive_api_errors}회 (한도: {self._cfg.max_consecutive_api_errors}회)",
@@ -173,7 +183,7 @@ class KillSwitchService:
             return
         async with self._lock:
             self._consecutive_api_errors = 0
-            self._save_state()
+            self._journal_state({"consecutive_api_errors": 0})
 
     async def record_fill_event(
         self,
@@ -314,7 +324,16 @@ class KillSwitchService:
             else:
                 self._strategy_consecutive_losses[strategy_name] = 0
 
-            self._save_state()
+            delta: dict[str, Any] = {
+                "strategy_consecutive_losses": {
+                    strategy_name: self._strategy_consecutive_losses[strategy_name],
+                },
+            }
+            if strategy_name in self._strategy_daily_loss_won:
+                delta["strategy_daily_loss_won"] = {
+                    strategy_name: self._strategy_daily_loss_won[strategy_name],
+                }
+            self._journal_state(delta)
 
             if strategy_name in self._strategy_tripped:
                 return  # 이미 트립 중
@@ -478,36 +497,53 @@ class KillSwitchService:
                 metadata,
             )
 
+    def _state_dict(self) -> dict[str, Any]:
+        """영속 상태 전체 (snapshot 용). dict 필드는 복사본."""
+        return {
+            "is_tripped": self._is_tripped,
+            "trip_reason": self._trip_reason,
+            "trip_timestamp": self._trip_timestamp.isoformat() if self._trip_timestamp else None,
+            "trip_metadata": self._trip_metadata,
+            "consecutive_losses": self._consecutive_losses,
+            "consecutive_api_errors": self._consecutive_api_errors,
+            "daily_realized_loss_won": self._daily_realized_loss_won,
+            "strategy_tripped": dict(self._strategy_tripped),
+            "strategy_consecutive_losses": dict(self._strategy_consecutive_losses),
+            "strategy_daily_loss_won": dict(self._strategy_daily_loss_won),
+        }
+
     def _save_state(self) -> None:
-        """현재 상태를 JSON 파일에 저장. Lock 보유 중에 호출."""
+        """현재 상태를 JSON 파일에 동기 저장(트립/해제/초기화 경로). Lock 보유 중에 호출.
+
+        반환 시점에 디스크에 반영돼 있어야 하는 변경만 이 경로를 쓴다. 주문마다 바뀌는
+        카운터는 `_journal_state` 로 delta 만 남긴다.
+        """
         try:
-            self._state_path.parent.mkdir(parents=True, exist_ok=True)
-            state = {
-                "is_tripped": self._is_tripped,
-                "trip_reason": self._trip_reason,
-                "trip_timestamp": self._trip_timestamp.isoformat() if self._trip_timestamp else None,
-                "trip_metadata": self._trip_metadata,
-                "consecutive_losses": self._consecutive_losses,
-                "consecutive_api_errors": self._consecutive_api_errors,
-                "daily_realized_loss_won": self._daily_realized_loss_won,
-                "strategy_tripped": self._strategy_tripped,
-                "strategy_consecutive_losses": self._strategy_consecutive_losses,
-                "strategy_daily_loss_won": self._strategy_daily_loss_won,
-            }
             # P0 0-11: atomic write (tempfile → fsync → os.replace) — 강제 종료/쓰기 실패 시
             # 기존 상태 파일 truncate 방지. 기존 truncate-write(write_text) 대체.
-            write_json_atomic(str(self._state_path), state, indent=2, ensure_ascii=False)
+            self._journal.write_snapshot(self._state_dict())
         except Exception as e:
             self._logger.error("[KillSwitch] 상태 저장 실패: %s", e)
 
+    def _journal_state(self, delta: dict[str, Any]) -> None:
+        """카운터 변경 delta 를 journal 버퍼에 기록. 디스크 쓰기는 durability window 안에 배치."""
+        try:
+            self._journal.append(delta)
+        except Exception as e:
+            self._logger.error("[KillSwitch] 상태 journal 기록 실패: %s", e)
+
+    async def flush_state(self) -> None:
+        """버퍼에 남은 카운터 delta 를 즉시 journal 에 기록 (graceful shutdown)."""
+        await self._journal.flush()
+
     def _load_state(self) -> None:
         """재시작 시 JSON 파일에서 상태 복원."""
         if not self._cfg.enabled:
             return
-        if not self._state_path.exists():
-            return
         try:
-            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+            state = self._journal.load()
+            if state is None:
+                return
             self._is_tripped = bool(state.get("is_tripped", False))
             self._trip_reason = state.get("trip_reason")
             ts = state.get("trip_timestamp")
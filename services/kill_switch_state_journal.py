@@ -0,0 +1,278 @@
+"""KillSwitchStateJournal — Kill Switch 상태의 write-coalescing 영속 계층.
+
+`KillSwitchService` 는 주문 응답마다 `record_api_success/failure` 를 await 한다.
+매 호출마다 전체 상태를 `write_json_atomic(indent=2)` + fsync 로 다시 쓰면 주문 burst·
+브로커 장애 시 이벤트 루프가 파일 쓰기에 묶인다. 이 모듈은 저장을 두 층으로 나눈다.
+
+- **snapshot**: 기존 `state_file_path` JSON (atomic write). `journal_seq` 로 어디까지
+  반영됐는지 기록한다. 트립/해제처럼 확정이 필요한 변경은 호출자가 동기 snapshot 으로
+  남긴다 — 반환 시점에 디스크에 있다.
+- **journal**: `<state_file>.journal` 에 append 되는 compact delta(JSON line). 카운터
+  변경은 메모리에서 즉시 반영되고(메모리가 authoritative), delta 는 버퍼에 쌓였다가
+  `flush_interval_sec` 안에 백그라운드 스레드에서 한 번에 append + fsync 된다.
+  `compact_every` 개가 쌓이면 snapshot 을 다시 쓰고 journal 을 비운다.
+
+복원은 snapshot 을 읽고 `journal_seq` 이후의 delta 만 순서대로 적용한다. 마지막 줄이
+쓰다 만(torn) 상태면 그 지점에서 멈추고 파일을 마지막 온전한 줄 끝까지 잘라낸다 —
+잃는 것은 durability window 안의 카운터뿐이고, 이후 append 는 깨끗한 줄부터 이어진다.
+
+설계 가정: 단일 event loop (`StrategyStateIO` 와 동일). 파일 쓰기는 `asyncio.to_thread`.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import orjson
+
+from utils.atomic_json import write_json_atomic
+
+SNAPSHOT_SEQ_KEY = "journal_seq"
+
+
+def apply_delta(state: dict[str, Any], delta: dict[str, Any]) -> None:
+    """delta 를 state 에 병합. dict 값은 key 단위 병합(None 이면 삭제), 나머지는 대입."""
+    for field_name, value in delta.items():
+        if isinstance(value, dict):
+            target = state.get(field_name)
+            if not isinstance(target, dict):
+                target = {}
+                state[field_name] = target
+            for key, item in value.items():
+                if item is None:
+                    target.pop(key, None)
+                else:
+                    target[key] = item
+        else:
+            state[field_name] = value
+
+
+class KillSwitchStateJournal:
+    """snapshot + append-only delta journal. 쓰기는 coalescing, 트립은 호출자가 동기 snapshot."""
+
+    def __init__(
+        self,
+        state_path: Path,
+        snapshot_provider: Callable[[], dict[str, Any]],
+        *,
+        flush_interval_sec: float = 0.2,
+        compact_every: int = 500,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._state_path = Path(state_path)
+        self._journal_path = self._state_path.with_name(self._state_path.name + ".journal")
+        self._snapshot_provider = snapshot_provider
+        self._flush_interval_sec = max(0.0, float(flush_interval_sec))
+        self._compact_every = max(1, int(compact_every))
+        self._logger = logger or logging.getLogger(__name__)
+
+        self._seq = 0                                  # 마지막으로 부여한 delta seq
+        self._buffer: list[tuple[int, bytes]] = []     # 아직 journal 에 쓰지 않은 delta
+        self._since_snapshot = 0                       # 마지막 snapshot 이후 기록된 delta 수
+        self._flush_task: Optional[asyncio.Task] = None
+        self._writing = False                          # 백그라운드 스레드가 journal 을 쓰는 중
+        self._needs_truncate = False
+        self._disk_lock = threading.Lock()
+        self._disk_snapshot_seq = -1
+
+        self.appended_count = 0
+        self.flush_count = 0
+        self.snapshot_count = 0
+
+    @property
+    def journal_path(self) -> Path:
+        return self._journal_path
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._buffer)
+
+    # ── 복원 ──────────────────────────────────────────────────────────
+
+    def load(self) -> Optional[dict[str, Any]]:
+        """snapshot + journal replay 결과. 둘 다 없으면 None."""
+        state: Optional[dict[str, Any]] = None
+        if self._state_path.exists():
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        snapshot_seq = int((state or {}).get(SNAPSHOT_SEQ_KEY) or 0)
+        last_seq = snapshot_seq
+        replayed = 0
+        if self._journal_path.exists():
+            data = self._journal_path.read_bytes()
+            good_end = 0  # 마지막으로 온전히 읽은 줄의 끝 (개행 포함) 오프셋
+            pos = 0
+            while pos < len(data):
+                newline = data.find(b"\n", pos)
+                end = len(data) if newline < 0 else newline + 1
+                line = data[pos:end]
+                pos = end
+                if not line.strip():
+                    good_end = end
+                    continue
+                try:
+                    if newline < 0:
+                        raise ValueError("개행 없는 마지막 줄")
+                    record = orjson.loads(line)
+                    seq = int(record["s"])
+                    delta = record["d"]
+                except Exception:
+                    # 크래시로 잘린 마지막 줄 — 이후는 신뢰할 수 없다.
+                    self._logger.warning("[KillSwitch] journal tail 손상 — seq %s 이후 무시", last_seq)
+                    break
+                good_end = end
+                if seq <= snapshot_seq:
+                    continue
+                if state is None:
+                    state = {}
+                apply_delta(state, delta)
+                last_seq = max(last_seq, seq)
+                replayed += 1
+            if good_end < len(data):
+                # 잘린 조각을 남겨 두면 다음 append 가 그 뒤에 붙어 이후 delta 가 모두 손상된다.
+                with open(self._journal_path, "r+b") as fp:
+                    fp.truncate(good_end)
+                    fp.flush()
+                    os.fsync(fp.fileno())
+        if replayed:
+            self._logger.info("[KillSwitch] journal delta %d건 복원 (seq=%d)", replayed, last_seq)
+        self._seq = last_seq
+        self._disk_snapshot_seq = snapshot_seq
+        if state is not None:
+            state.pop(SNAPSHOT_SEQ_KEY, None)
+        return state
+
+    # ── 기록 ──────────────────────────────────────────────────────────
+
+    def append(self, delta: dict[str, Any]) -> None:
+        """delta 를 버퍼에 넣고 flush 를 예약한다. 디스크 I/O 없음."""
+        self._seq += 1
+        self._buffer.append((self._seq, orjson.dumps({"s": self._seq, "d": delta}) + b"\n"))
+        self.appended_count += 1
+        self._schedule_flush()
+
+    def write_snapshot(self, state: dict[str, Any]) -> None:
+        """state 전체를 동기 atomic write. 반환 시점에 durable — 트립/해제 경로용.
+
+        snapshot 이 현재 seq 까지 모두 포함하므로 버퍼의 delta 는 버린다.
+        실패 시 예외를 호출자에게 그대로 전파한다.
+        """
+        seq = self._seq
+        self._write_snapshot_file(state, seq)
+        self._buffer.clear()
+        self._since_snapshot = 0
+        if self._writing:
+            # 스레드가 (이미 snapshot 에 포함된) 이전 delta 를 쓰는 중 — 끝난 뒤 비운다.
+            self._needs_truncate = True
+            self._schedule_flush()
+        else:
+            self._truncate_journal()
+
+    async def flush(self) -> None:
+        """버퍼를 즉시 journal 에 반영 (graceful shutdown / 테스트용)."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            if self._writing:
+                # 이미 쓰는 중 — 끊으면 스레드 쓰기와 겹치므로 끝날 때까지 기다린다.
+                await task
+            else:
+                # durability window 대기 중 — 기다리지 않고 바로 쓴다.
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = None
+        await self._drain()
+
+    # ── 내부 ──────────────────────────────────────────────────────────
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # event loop 밖(동기 호출) — 바로 쓴다.
+            self._drain_sync()
+            return
+        self._flush_task = loop.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        if self._flush_interval_sec > 0:
+            await asyncio.sleep(self._flush_interval_sec)
+        await self._drain()
+
+    async def _drain(self) -> None:
+        if self._writing:
+            return  # 다른 drain 이 버퍼가 빌 때까지 돌고 있다
+        while self._buffer or self._needs_truncate:
+            self._writing = True
+            try:
+                if self._needs_truncate:
+                    self._needs_truncate = False
+                    await asyncio.to_thread(self._truncate_journal)
+                if self._buffer:
+                    batch, self._buffer = self._buffer, []
+                    try:
+                        await asyncio.to_thread(self._append_lines, [line for _, line in batch])
+                    except Exception:
+                        # 다음 flush 에서 재시도 — 메모리 상태는 이미 반영돼 있다.
+                        self._buffer = batch + self._buffer
+                        raise
+                    self._since_snapshot += len(batch)
+                    self.flush_count += 1
+                if self._since_snapshot >= self._compact_every:
+                    await self._compact()
+            except Exception as e:
+                self._logger.error("[KillSwitch] journal flush 실패: %s", e)
+                return
+            finally:
+                self._writing = False
+
+    def _drain_sync(self) -> None:
+        if self._needs_truncate:
+            self._needs_truncate = False
+            self._truncate_journal()
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._append_lines([line for _, line in batch])
+            self._since_snapshot += len(batch)
+            self.flush_count += 1
+
+    async def _compact(self) -> None:
+        # provider 호출과 seq 캡처 사이에 await 가 없으므로 둘은 같은 시점의 상태다.
+        seq = self._seq
+        state = self._snapshot_provider()
+        self._buffer = [(s, line) for s, line in self._buffer if s > seq]
+        self._since_snapshot = 0
+        await asyncio.to_thread(self._write_snapshot_file, state, seq)
+        # 이 시점 journal 파일에는 seq 이하 delta 만 있다 (이후 delta 는 아직 버퍼).
+        await asyncio.to_thread(self._truncate_journal)
+
+    def _write_snapshot_file(self, state: dict[str, Any], seq: int) -> None:
+        with self._disk_lock:
+            if seq < self._disk_snapshot_seq:
+                return  # 더 최신 snapshot(예: 트립)이 이미 기록됨
+            payload = dict(state)
+            payload[SNAPSHOT_SEQ_KEY] = seq
+            write_json_atomic(str(self._state_path), payload, indent=2, ensure_ascii=False)
+            self._disk_snapshot_seq = seq
+            self.snapshot_count += 1
+
+    def _append_lines(self, lines: list[bytes]) -> None:
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._journal_path, "ab") as fp:
+            fp.write(b"".join(lines))
+            fp.flush()
+            os.fsync(fp.fileno())
+
+    def _truncate_journal(self) -> None:
+        # snapshot 이후 seq 이하 delta 는 replay 시 어차피 무시된다 — fsync 불필요.
+        if self._journal_path.exists():
+            with open(self._journal_path, "wb"):
+                pass
@@ -1,16 +1,26 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from common.types import ResCommonResponse
 from core.performance_profiler import PerformanceProfiler
 
+if TYPE_CHECKING:
+    from repositories.market_calendar_repository import MarketCalendarRepository
+    from services.market_session_clock import MarketSessionClock
+
 class MarketCalendarService:
     """
     주식 시장의 개장일, 휴장일, 과거 최신 영업일 및 다음 개장 시간을 통합 관리하는 달력(Calendar) 매니저입니다.
     """
-    def __init__(self, market_clock, logger=None, performance_profiler: Optional[PerformanceProfiler] = None):
+    def __init__(
+        self,
+        market_clock,
+        logger=None,
+        performance_profiler: Optional[PerformanceProfiler] = None,
+        calendar_repository: Optional["MarketCalendarRepository"] = None,
+    ):
         self._market_clock = market_clock
         self._logger = logger or logging.getLogger(__name__)
         self._broker = None
@@ -24,9 +34,23 @@ class MarketCalendarService:
         self._business_days_cache = {}
         self._synced_months: set = set()  # 동기화 완료된 월 집합 (단일 변수 → set으로 변경: 월 경계 재호출 방지)
 
+        # [로컬 저장] 동기화한 월 달력을 파일로 남겨 재기동 시 API 재호출을 생략
+        self._calendar_repository = calendar_repository
+        self._persisted_loaded = False
+
+        # [세션 시계] 시작된 MarketSessionClock 이 붙어 있으면 is_market_open_now 는 그 상태를 읽는다
+        self._session_clock: Optional["MarketSessionClock"] = None
+
     def set_broker(self, broker):
         self._broker = broker
 
+    def attach_session_clock(self, session_clock: Optional["MarketSessionClock"]) -> None:
+        self._session_clock = session_clock
+
+    @property
+    def session_clock(self) -> Optional["MarketSessionClock"]:
+        return self._session_clock
+
     # ==============================================================================
     # 1. 과거/현재 기준 최신 영업일 조회 (기존 구현 완벽 유지 -> 기존 TC 통과 보장)
     # ==============================================================================
@@ -127,17 +151,48 @@ class MarketCalendarService:
         holiday_data: ResCommonResponse = await self._broker.check_holiday(target_date_str)
 
         if holiday_data and holiday_data.rt_cd == "0" and holiday_data.data and "output" in holiday_data.data:
+            synced = {}
             for day_info in holiday_data.data["output"]:
                 date_str = day_info["bass_dt"]
                 # 영업일이면서 거래일이어야 개장일
                 is_open = (day_info["bzdy_yn"] == "Y" and day_info["tr_day_yn"] == "Y")
                 self._business_days_cache[date_str] = is_open
+                synced[date_str] = is_open
             self._synced_months.add(target_month)
+            if self._calendar_repository is not None and synced:
+                self._calendar_repository.save_month(target_month, synced)
         else:
             self._logger.warning(f"휴장일 API 동기화 실패 ({target_month}): {holiday_data.msg1 if holiday_data else 'No response'}")
 
         self._pm.log_timer(f"MarketCalendarService._sync_calendar_if_needed({target_date_str})", t_start)
 
+    def load_persisted_calendar(self) -> int:
+        """로컬 달력 파일을 캐시에 올린다 (프로세스당 1회). 올린 월 수를 반환."""
+        if self._persisted_loaded or self._calendar_repository is None:
+            return 0
+        self._persisted_loaded = True
+        months = self._calendar_repository.load_months()
+        for month, days in months.items():
+            for date_str, is_open in days.items():
+                self._business_days_cache.setdefault(date_str, is_open)
+            self._synced_months.add(month)
+        return len(months)
+
+    async def preload_calendar(self, target_date: Optional[datetime] = None) -> None:
+        """이번 달과 다음 달 달력을 미리 채운다. 로컬 파일에 있으면 API 를 부르지 않는다."""
+        self.load_persisted_calendar()
+        if target_date is None:
+            target_date = self._market_clock.get_current_kst_time()
+        await self._sync_calendar_if_needed(target_date)
+        next_month = (target_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+        await self._sync_calendar_if_needed(next_month)
+
+    def get_cached_business_day(self, date_str: str) -> Optional[bool]:
+        """API 호출 없이 캐시만 본다. 주말은 False, 캐시에 없으면 None."""
+        if datetime.strptime(date_str, "%Y%m%d").weekday() >= 5:
+            return False
+        return self._business_days_cache.get(date_str)
+
     async def is_business_day(self, date_str: str = None) -> bool:
         """특정 날짜(YYYYMMDD)가 공휴일/휴장일이 아닌 영업일인지 확인합니다."""
         if not date_str:
@@ -157,7 +212,12 @@ class MarketCalendarService:
         """현재 시점이 휴일이 아니며, 장 운영 시간 이내인지 확인합니다.
 
         include_nxt=True 이면 실시간 구독용으로 NXT 확장 시간(08:00~20:00)을 포함한다.
+        세션 시계가 돌고 있으면 달력·API 확인 없이 그 상태를 그대로 읽는다.
         """
+        session_clock = self._session_clock
+        if session_clock is not None and session_clock.is_live:
+            return session_clock.is_nxt_open if include_nxt else session_clock.is_open
+
         # 장 운영 시간이 아니면 달력(API/캐시)을 확인할 필요도 없이 바로 False 반환 (성능 최적화)
         is_operating_hours = self._market_clock.is_market_operating_hours()
         if not is_operating_hours and include_nxt:
@@ -0,0 +1,367 @@
+# services/market_session_clock.py
+"""
+국내 장 세션 시계 — 타이머 하나로 세션 단계를 미리 계산해 두고 동기 속성으로 노출한다.
+
+MarketCalendarService.is_market_open_now() 는 호출마다 영업일 확인(월 달력 동기화 포함)과
+최신 거래일 조회를 거칠 수 있다. 틱·API 호출마다 이를 await 하는 대신, 이 시계가
+세션 경계 시각에만 깨어나 상태를 갱신하고 다음을 제공한다.
+
+  - phase / is_open / is_nxt_open / is_business_day : 동기 속성 읽기
+  - subscribe() / transitions()                      : 세션 전환 이벤트 스트림
+
+세션 단계 (영업일, KST):
+  08:00 NXT 프리마켓 → 08:30 장전 시간외 → 08:40 시가 동시호가 → 09:00 정규장
+  → 15:20 종가 동시호가 → 15:30 장후 시간외(KRX) + NXT 애프터마켓 → 18:00 NXT 애프터마켓 → 20:00 종료
+
+is_open 은 MarketClock 운영 시간(기본 09:00~15:40)과 같아 기존 is_market_open_now() 와 판정이 일치하고,
+is_nxt_open 은 include_nxt=True(08:00~20:00) 판정과 일치한다.
+
+개장 지연일(연초 첫 거래일 10:00 개장, 수능일 등)은 day_overrides 의 open_delay_min / close_delay_min
+으로 개장 전 단계와 마감 단계를 각각 밀거나 당긴다. NXT 시간대는 밀지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta
+from enum import Enum
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+TransitionQueue = asyncio.Queue
+
+
+class MarketSessionPhase(str, Enum):
+    CLOSED = "closed"
+    NXT_PRE_MARKET = "nxt_pre_market"        # NXT 프리마켓 단독
+    PRE_OPEN = "pre_open"                    # KRX 장전 시간외 종가 · 시가 동시호가 접수
+    OPENING_AUCTION = "opening_auction"      # 시가 단일가 매매 (동시호가)
+    OPEN = "open"                            # 정규장 접속매매
+    CLOSING_AUCTION = "closing_auction"      # 종가 단일가 매매 (동시호가)
+    AFTER_HOURS = "after_hours"              # KRX 장후 시간외 + NXT 애프터마켓
+    NXT_AFTER_MARKET = "nxt_after_market"    # NXT 애프터마켓 단독
+
+
+@dataclass(frozen=True)
+class SessionDayOverride:
+    """특정 영업일의 개장/마감 시각 이동(분). 음수면 앞당김(조기 마감 등)."""
+    open_delay_min: int = 0
+    close_delay_min: int = 0
+
+
+@dataclass(frozen=True)
+class SessionTransition:
+    previous: MarketSessionPhase
+    current: MarketSessionPhase
+    at: datetime
+    trading_date: str
+    is_open: bool
+    is_nxt_open: bool
+
+
+# (시작 시각, 단계, 이동 기준). 시작 시각 None 은 MarketClock 개장 시각.
+_SESSION_SCHEDULE: Tuple[Tuple[Optional[dt_time], MarketSessionPhase, Optional[str]], ...] = (
+    (dt_time(8, 0), MarketSessionPhase.NXT_PRE_MARKET, None),
+    (dt_time(8, 30), MarketSessionPhase.PRE_OPEN, "open"),
+    (dt_time(8, 40), MarketSessionPhase.OPENING_AUCTION, "open"),
+    (None, MarketSessionPhase.OPEN, "open"),
+    (dt_time(15, 20), MarketSessionPhase.CLOSING_AUCTION, "close"),
+    (dt_time(15, 30), MarketSessionPhase.AFTER_HOURS, "close"),
+    (dt_time(18, 0), MarketSessionPhase.NXT_AFTER_MARKET, None),
+    (dt_time(20, 0), MarketSessionPhase.CLOSED, None),
+)
+_NXT_START = dt_time(8, 0)
+_NXT_END = dt_time(20, 0)
+_FIRST_TRADING_DAY_OPEN_DELAY_MIN = 60
+_WAKE_EPSILON_SEC = 0.001
+
+
+def _parse_hhmm(value: str) -> dt_time:
+    hour, minute = value.split(":")[:2]
+    return dt_time(int(hour), int(minute))
+
+
+@dataclass
+class _DayState:
+    trading_date: str
+    is_business_day: bool
+    override: SessionDayOverride
+    schedule: List[Tuple[datetime, MarketSessionPhase]]
+    open_at: datetime
+    close_at: datetime
+    nxt_start: datetime
+    nxt_end: datetime
+    next_midnight: datetime
+    confirm_pending: bool = False
+
+
+class MarketSessionClock:
+    """국내 장 세션 상태를 하나의 타이머로 갱신·배포한다."""
+
+    DEFAULT_MAX_SLEEP_SEC = 300.0
+    SUBSCRIBER_QUEUE_SIZE = 32
+
+    def __init__(
+        self,
+        market_calendar,
+        market_clock,
+        *,
+        logger: Optional[logging.Logger] = None,
+        day_overrides: Optional[Mapping[str, object]] = None,
+        late_open_first_trading_day: bool = True,
+        now_fn: Optional[Callable[[], datetime]] = None,
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+        max_sleep_sec: float = DEFAULT_MAX_SLEEP_SEC,
+    ) -> None:
+        self._calendar = market_calendar
+        self._market_clock = market_clock
+        self._logger = logger or logging.getLogger(__name__)
+        self._overrides: Dict[str, SessionDayOverride] = {
+            str(day): self._coerce_override(value) for day, value in (day_overrides or {}).items()
+        }
+        self._late_open_first_trading_day = late_open_first_trading_day
+        self._now_fn = now_fn or market_clock.get_current_kst_time
+        self._sleep = sleep or asyncio.sleep
+        self._max_sleep_sec = float(max_sleep_sec)
+
+        # 동기 읽기용 상태 — refresh 만 갱신한다
+        self.phase: MarketSessionPhase = MarketSessionPhase.CLOSED
+        self.is_open: bool = False
+        self.is_nxt_open: bool = False
+        self.is_business_day: bool = False
+        self.trading_date: Optional[str] = None
+        self.updated_at: Optional[datetime] = None
+
+        self._day: Optional[_DayState] = None
+        self._healthy = False
+        self._initialized = False
+        self._task: Optional[asyncio.Task] = None
+        self._subscribers: List[TransitionQueue] = []
+        self._transition_count = 0
+
+    # ── 수명 주기 ──────────────────────────────────────────────────
+
+    @property
+    def is_live(self) -> bool:
+        """타이머가 돌고 마지막 갱신이 성공했으면 True. 아니면 호출부는 기존 판정으로 돌아간다."""
+        return self._healthy and self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        preload = getattr(self._calendar, "preload_calendar", None)
+        if preload is not None:
+            try:
+                await preload()
+            except Exception as exc:
+                self._logger.warning(f"[MarketSessionClock] 달력 선적재 실패 (refresh 시 재시도): {exc}")
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._sleep(self.seconds_until_next_change())
+                await self.refresh()
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                self._healthy = False
+                self._logger.error(f"[MarketSessionClock] 타이머 오류: {exc}", exc_info=True)
+                await self._sleep(self._max_sleep_sec)
+
+    # ── 상태 계산 ──────────────────────────────────────────────────
+
+    async def refresh(self, now: Optional[datetime] = None) -> MarketSessionPhase:
+        """현재 시각 기준으로 세션 상태를 다시 계산하고, 바뀌었으면 전환 이벤트를 낸다."""
+        now = now or self._now_fn()
+        try:
+            day = await self._day_state_for(now)
+            if day.confirm_pending and now >= day.open_at:
+                day = await self._confirm_trading_day(day, now)
+        except Exception as exc:
+            if self._healthy:
+                self._logger.warning(f"[MarketSessionClock] 세션 상태 갱신 실패 → 기존 판정으로 대체: {exc}")
+            self._healthy = False
+            return self.phase
+
+        phase, is_open, is_nxt_open = self._state_at(day, now)
+        previous = self.phase
+        changed = (phase, is_open, is_nxt_open) != (self.phase, self.is_open, self.is_nxt_open)
+        self.phase, self.is_open, self.is_nxt_open = phase, is_open, is_nxt_open
+        self.is_business_day = day.is_business_day
+        self.trading_date = day.trading_date
+        self.updated_at = now
+        self._healthy = True
+        if changed and self._initialized:
+            self._publish(SessionTransition(previous, phase, now, day.trading_date, is_open, is_nxt_open))
+        self._initialized = True
+        return phase
+
+    def seconds_until_next_change(self, now: Optional[datetime] = None) -> float:
+        """다음 세션 경계(또는 자정)까지 남은 초. 최대 max_sleep_sec."""
+        day = self._day
+        if day is None:
+            return self._max_sleep_sec
+        now = now or self._now_fn()
+        candidates = [day.next_midnight]
+        if day.is_business_day:
+            candidates += [at for at, _ in day.schedule if at > now]
+            candidates += [edge for edge in (day.open_at, day.nxt_start) if edge > now]
+            # 마감 경계는 포함 비교(<=)이므로 경계 시각 자체까지는 열린 상태로 본다
+            candidates += [edge for edge in (day.close_at, day.nxt_end) if edge >= now]
+        elif day.confirm_pending and day.open_at > now:
+            candidates.append(day.open_at)
+        wait = (min(candidates) - now).total_seconds() + _WAKE_EPSILON_SEC
+        return max(_WAKE_EPSILON_SEC, min(wait, self._max_sleep_sec))
+
+    @staticmethod
+    def _state_at(day: _DayState, now: datetime) -> Tuple[MarketSessionPhase, bool, bool]:
+        if not day.is_business_day:
+            return MarketSessionPhase.CLOSED, False, False
+        phase = MarketSessionPhase.CLOSED
+        for at, candidate in day.schedule:
+            if at > now:
+                break
+            phase = candidate
+        return phase, day.open_at <= now <= day.close_at, day.nxt_start <= now <= day.nxt_end
+
+    async def _day_state_for(self, now: datetime) -> _DayState:
+        trading_date = now.strftime("%Y%m%d")
+        if self._day is not None and self._day.trading_date == trading_date:
+            return self._day
+        weekday = now.weekday() < 5
+        is_business_day = bool(weekday and await self._calendar.is_business_day(trading_date))
+        self._day = self._build_day(now, is_business_day)
+        # 휴장일 API 가 평일을 비영업일로 본 경우, 개장 시각에 최신 거래일로 한 번 더 확인한다
+        self._day.confirm_pending = weekday and not is_business_day
+        return self._day
+
+    async def _confirm_trading_day(self, day: _DayState, now: datetime) -> _DayState:
+        day.confirm_pending = False
+        get_latest = getattr(self._calendar, "get_latest_trading_date", None)
+        if get_latest is None or await get_latest() != day.trading_date:
+            return day
+        self._logger.warning(
+            "휴장일 API는 오늘을 비영업일로 판단했지만 최신 거래일이 오늘이므로 장중으로 처리합니다. "
+            f"(date={day.trading_date})"
+        )
+        self._day = self._build_day(now, True)
+        return self._day
+
+    def _build_day(self, now: datetime, is_business_day: bool) -> _DayState:
+        day = now.date()
+        trading_date = day.strftime("%Y%m%d")
+        override = self._override_for(day, is_business_day)
+        shifts = {"open": override.open_delay_min, "close": override.close_delay_min, None: 0}
+        open_time = _parse_hhmm(self._market_clock.market_open_time_str)
+        close_time = _parse_hhmm(self._market_clock.market_close_time_str)
+
+        def _at(t: dt_time, shift_min: int = 0) -> datetime:
+            # now 의 tzinfo 를 그대로 써서 비교 대상과 naive/aware 가 섞이지 않게 한다
+            base = now.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
+            return base + timedelta(minutes=shift_min)
+
+        schedule = [(_at(start or open_time, shifts[kind]), phase) for start, phase, kind in _SESSION_SCHEDULE]
+        schedule.sort(key=lambda item: item[0])
+        return _DayState(
+            trading_date=trading_date,
+            is_business_day=is_business_day,
+            override=override,
+            schedule=schedule,
+            open_at=_at(open_time, override.open_delay_min),
+            close_at=_at(close_time, override.close_delay_min),
+            nxt_start=_at(_NXT_START),
+            nxt_end=_at(_NXT_END),
+            next_midnight=_at(dt_time(0, 0)) + timedelta(days=1),
+        )
+
+    def _override_for(self, day: date, is_business_day: bool) -> SessionDayOverride:
+        configured = self._overrides.get(day.strftime("%Y%m%d"))
+        if configured is not None:
+            return configured
+        if is_business_day and self._late_open_first_trading_day and self._is_first_trading_day_of_year(day):
+            return SessionDayOverride(open_delay_min=_FIRST_TRADING_DAY_OPEN_DELAY_MIN)
+        return SessionDayOverride()
+
+    def _is_first_trading_day_of_year(self, day: date) -> bool:
+        """1/1 부터 전날까지 모두 휴장으로 확인되면 연초 첫 거래일 (KRX 10:00 개장)."""
+        if day.month != 1:
+            return False
+        cached = getattr(self._calendar, "get_cached_business_day", None)
+        if cached is None:
+            return False
+        probe = date(day.year, 1, 1)
+        while probe < day:
+            if cached(probe.strftime("%Y%m%d")) is not False:
+                return False
+            probe += timedelta(days=1)
+        return True
+
+    @staticmethod
+    def _coerce_override(value) -> SessionDayOverride:
+        if isinstance(value, SessionDayOverride):
+            return value
+        if isinstance(value, Mapping):
+            return SessionDayOverride(
+                open_delay_min=int(value.get("open_delay_min", 0)),
+                close_delay_min=int(value.get("close_delay_min", 0)),
+            )
+        raise TypeError(f"지원하지 않는 세션 override 형식: {value!r}")
+
+    # ── 전환 이벤트 스트림 ─────────────────────────────────────────
+
+    def subscribe(self, maxsize: int = SUBSCRIBER_QUEUE_SIZE) -> TransitionQueue:
+        queue: TransitionQueue = asyncio.Queue(maxsize=maxsize)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: TransitionQueue) -> None:
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    async def transitions(self) -> AsyncIterator[SessionTransition]:
+        """세션 전환을 차례로 내보내는 async iterator. 빠져나가면 구독이 해제된다."""
+        queue = self.subscribe()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(queue)
+
+    def _publish(self, transition: SessionTransition) -> None:
+        self._transition_count += 1
+        self._logger.info(
+            f"[MarketSessionClock] {transition.trading_date} {transition.previous.value} → "
+            f"{transition.current.value} (open={transition.is_open}, nxt={transition.is_nxt_open})"
+        )
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(transition)
+            except asyncio.QueueFull:
+                try:
+                    queue.get_nowait()
+                    queue.put_nowait(transition)
+                except Exception:
+                    pass
+
+    def snapshot(self) -> Dict:
+        day = self._day
+        return {
+            "live": self.is_live,
+            "phase": self.phase.value,
+            "is_open": self.is_open,
+            "is_nxt_open": self.is_nxt_open,
+            "is_business_day": self.is_business_day,
+            "trading_date": self.trading_date,
+            "open_delay_min": day.override.open_delay_min if day else 0,
+            "close_delay_min": day.override.close_delay_min if day else 0,
+            "transitions": self._transition_count,
+            "subscribers": len(self._subscribers),
+        }
@@ -0,0 +1,303 @@
+# services/notification_dispatcher.py
+"""
+외부 알림 디스패처 — NotificationService 외부 핸들러 큐에서 꺼낸 이벤트 배치를 전달한다.
+
+  1. 라우팅 필터 (notifications.telegram.route_levels / enabled / force_external)
+  2. 같은 카테고리 이벤트 묶음 요약 (digest_min_events 이상이면 digest 1건)
+  3. 핸들러별 채널로 동시 전달 — 채널마다 동시 전송 수 상한(Semaphore) + token bucket
+
+token bucket 기본값은 Telegram Bot API 한도에 맞춘다.
+  - 같은 chat 에는 초당 1건을 넘기지 않는다 (짧은 burst 는 허용)
+  - 봇 전체 초당 30건, 그룹 chat 분당 20건 — 그룹으로 보낸다면 rate_per_sec 를 0.33 으로 낮출 것
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from services.notification_service import NotificationEvent, NotificationLevel
+
+if TYPE_CHECKING:
+    from services.notification_service import NotificationService
+
+TELEGRAM_CHAT_RATE_PER_SEC = 1.0
+TELEGRAM_CHAT_BURST = 3
+
+_LEVEL_RANK = {
+    NotificationLevel.INFO: 0,
+    NotificationLevel.WARNING: 1,
+    NotificationLevel.ERROR: 2,
+    NotificationLevel.CRITICAL: 3,
+}
+_LATENCY_WINDOW = 1024
+_DIGEST_LINE_MAX_CHARS = 120
+
+
+class _TokenBucket:
+    """예약 방식 token bucket. 토큰이 모자라면 다음 토큰이 찰 때까지 한 번만 잔다."""
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int,
+        *,
+        sleep: Callable[[float], Awaitable[None]],
+        monotonic: Callable[[], float],
+    ) -> None:
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be > 0")
+        self.rate_per_sec = float(rate_per_sec)
+        self.burst = max(1, int(burst))
+        self._sleep = sleep
+        self._monotonic = monotonic
+        self._tokens = float(self.burst)
+        self._updated_at = monotonic()
+        self.throttled_total = 0
+        self.throttle_wait_sec_total = 0.0
+
+    async def acquire(self) -> None:
+        now = self._monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate_per_sec)
+        self._updated_at = now
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            wait_sec = -self._tokens / self.rate_per_sec
+            self.throttled_total += 1
+            self.throttle_wait_sec_total += wait_sec
+            await self._sleep(wait_sec)
+
+
+class _HandlerChannel:
+    """외부 핸들러 하나의 전달 채널 (동시 전송 상한 + token bucket)."""
+
+    def __init__(self, name: str, concurrency: int, bucket: _TokenBucket) -> None:
+        self.name = name
+        self.bucket = bucket
+        self.concurrency = max(1, int(concurrency))
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.active = 0
+        self.max_active = 0
+        self.sent_total = 0
+        self.error_total = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "rate_per_sec": self.bucket.rate_per_sec,
+            "burst": self.bucket.burst,
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "max_active": self.max_active,
+            "sent": self.sent_total,
+            "errors": self.error_total,
+            "throttled": self.bucket.throttled_total,
+            "throttle_wait_sec": round(self.bucket.throttle_wait_sec_total, 3),
+        }
+
+
+class NotificationDispatcher:
+    """이벤트 배치를 필터 → 요약 → 핸들러별 채널 동시 전달 순으로 처리한다."""
+
+    def __init__(
+        self,
+        notification_service: "NotificationService",
+        *,
+        telegram_config=None,
+        dispatch_config=None,
+        logger: Optional[logging.Logger] = None,
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ns = notification_service
+        self._telegram_config = telegram_config
+        self._logger = logger or logging.getLogger(__name__)
+        self._sleep = sleep or asyncio.sleep
+        self._monotonic = monotonic
+
+        self.batch_max = int(getattr(dispatch_config, "batch_max", 50))
+        self.coalesce_window_sec = float(getattr(dispatch_config, "coalesce_window_sec", 0.5))
+        self._digest_min_events = int(getattr(dispatch_config, "digest_min_events", 4))
+        self._digest_max_lines = int(getattr(dispatch_config, "digest_max_lines", 15))
+        self._handler_concurrency = int(getattr(dispatch_config, "handler_concurrency", 2))
+        self._rate_per_sec = float(getattr(dispatch_config, "rate_per_sec", TELEGRAM_CHAT_RATE_PER_SEC))
+        self._burst = int(getattr(dispatch_config, "burst", TELEGRAM_CHAT_BURST))
+
+        self._channels: Dict[Any, _HandlerChannel] = {}
+        self._queue_latency_ms: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._batches_total = 0
+        self._max_batch_size = 0
+        self._events_total = 0
+        self._filtered_total = 0
+        self._digest_total = 0
+        self._digested_events_total = 0
+
+    # ── 배치 처리 ──────────────────────────────────────────────────
+
+    async def dispatch(self, events: List[NotificationEvent]) -> Dict[str, int]:
+        """배치 하나를 전달하고 {events, filtered, messages} 를 반환한다."""
+        now = self._monotonic()
+        for event in events:
+            enqueued_at = self._ns.pop_external_enqueue_time(event.id)
+            if enqueued_at is not None:
+                self._queue_latency_ms.append(max(0.0, now - enqueued_at) * 1000)
+        self._batches_total += 1
+        self._events_total += len(events)
+        self._max_batch_size = max(self._max_batch_size, len(events))
+
+        sendable = [event for event in events if self.should_send_external(event)]
+        self._filtered_total += len(events) - len(sendable)
+        handlers = self._ns.external_handlers
+        if not sendable or not handlers:
+            return {"events": len(events), "filtered": len(events) - len(sendable), "messages": 0}
+
+        messages = self.coalesce(sendable)
+        await asyncio.gather(*(self._deliver(handler, messages) for handler in handlers))
+        return {"events": len(events), "filtered": len(events) - len(sendable), "messages": len(messages)}
+
+    def should_send_external(self, event: NotificationEvent) -> bool:
+        cfg = self._telegram_config
+        if cfg is None:
+            return True
+        if not getattr(cfg, "enabled", True):
+            return False
+        metadata = getattr(event, "metadata", {}) or {}
+        if isinstance(metadata, dict) and metadata.get("force_external"):
+            return True
+        route_levels = getattr(cfg, "route_levels", None)
+        if not route_levels:
+            return True
+        category = getattr(event.category, "value", str(event.category))
+        level = getattr(event.level, "value", str(event.level))
+        allowed = route_levels.get(category) or route_levels.get(category.upper()) or []
+        return level in allowed
+
+    def coalesce(self, events: List[NotificationEvent]) -> List[NotificationEvent]:
+        """같은 카테고리(·전송 채널) 이벤트가 digest_min_events 이상이면 digest 1건으로 묶는다.
+
+        CRITICAL 이벤트는 묶지 않는다. 묶이지 않은 이벤트는 원래 순서를 유지하고,
+        digest 는 해당 그룹의 첫 이벤트 자리에 놓인다.
+        """
+        groups: Dict[Tuple, List[NotificationEvent]] = {}
+        for event in events:
+            key = self._group_key(event)
+            if key is not None:
+                groups.setdefault(key, []).append(event)
+        digested = {key for key, group in groups.items() if len(group) >= self._digest_min_events}
+        if not digested:
+            return list(events)
+
+        messages: List[NotificationEvent] = []
+        emitted = set()
+        for event in events:
+            key = self._group_key(event)
+            if key not in digested:
+                messages.append(event)
+            elif key not in emitted:
+                emitted.add(key)
+                messages.append(self._build_digest(groups[key]))
+                self._digest_total += 1
+                self._digested_events_total += len(groups[key])
+        return messages
+
+    @staticmethod
+    def _group_key(event: NotificationEvent) -> Optional[Tuple]:
+        if event.level == NotificationLevel.CRITICAL:
+            return None
+        metadata = event.metadata or {}
+        return (event.category, metadata.get("telegram_channel"))
+
+    def _build_digest(self, group: List[NotificationEvent]) -> NotificationEvent:
+        first = group[0]
+        lines = []
+        for event in group[:self._digest_max_lines]:
+            body = str(event.message).splitlines()[0] if event.message else ""
+            if len(body) > _DIGEST_LINE_MAX_CHARS:
+                body = body[:_DIGEST_LINE_MAX_CHARS - 1] + "…"
+            clock = str(event.timestamp)[11:19]
+            lines.append(f"• {clock} {event.title}" + (f" — {body}" if body else ""))
+        if len(group) > self._digest_max_lines:
+            lines.append(f"… 외 {len(group) - self._digest_max_lines}건")
+
+        metadata: Dict[str, Any] = {
+            "digest": True,
+            "digest_count": len(group),
+            "digest_event_ids": [event.id for event in group],
+        }
+        channel = (first.metadata or {}).get("telegram_channel")
+        if channel:
+            metadata["telegram_channel"] = channel
+        return NotificationEvent(
+            id=uuid.uuid4().hex[:12],
+            timestamp=first.timestamp,
+            category=first.category,
+            level=max((event.level for event in group), key=lambda level: _LEVEL_RANK.get(level, 0)),
+            title=f"{first.title} 외 {len(group) - 1}건",
+            message="\n".join(lines),
+            metadata=metadata,
+        )
+
+    # ── 채널 전달 ──────────────────────────────────────────────────
+
+    async def _deliver(self, handler, messages: List[NotificationEvent]) -> None:
+        channel = self._channel_for(handler)
+        await asyncio.gather(*(self._send(channel, handler, message) for message in messages))
+
+    async def _send(self, channel: _HandlerChannel, handler, message: NotificationEvent) -> None:
+        async with channel.semaphore:
+            await channel.bucket.acquire()
+            channel.active += 1
+            channel.max_active = max(channel.max_active, channel.active)
+            try:
+                await handler(message)
+                channel.sent_total += 1
+            except Exception as e:
+                channel.error_total += 1
+                self._logger.error(f"[NotificationDispatcher] 핸들러 오류 ({channel.name}): {e}")
+            finally:
+                channel.active -= 1
+
+    def _channel_for(self, handler) -> _HandlerChannel:
+        channel = self._channels.get(handler)
+        if channel is None:
+            channel = _HandlerChannel(
+                name=getattr(handler, "__qualname__", None) or type(handler).__qualname__,
+                concurrency=self._handler_concurrency,
+                bucket=_TokenBucket(
+                    self._rate_per_sec, self._burst, sleep=self._sleep, monotonic=self._monotonic,
+                ),
+            )
+            self._channels[handler] = channel
+        return channel
+
+    # ── 지표 ───────────────────────────────────────────────────────
+
+    def get_metrics(self) -> Dict[str, Any]:
+        samples = sorted(self._queue_latency_ms)
+
+        def _pct(q: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 1)
+
+        queue_stats = self._ns.external_queue_stats()
+        return {
+            "queue_depth": queue_stats["depth"],
+            "queue_capacity": queue_stats["capacity"],
+            "dropped": queue_stats["dropped"],
+            "queue_latency_ms": {
+                "p50": _pct(0.50),
+                "p95": _pct(0.95),
+                "max": round(samples[-1], 1) if samples else 0.0,
+                "samples": len(samples),
+            },
+            "batches": self._batches_total,
+            "max_batch_size": self._max_batch_size,
+            "events": self._events_total,
+            "filtered": self._filtered_total,
+            "digests": self._digest_total,
+            "digested_events": self._digested_events_total,
+            "channels": {channel.name: channel.snapshot() for channel in self._channels.values()},
+        }
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
@@ -65,6 +66,9 @@ class NotificationService:
         self._external_handler_queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_EXTERNAL_QUEUE_SIZE)
         # 외부 핸들러 2차 dedup: (dedup_key, severity) → 마지막 emit 단조 시각
         self._ext_dedup_seen: Dict[tuple, float] = {}
+        # 외부 큐 지표: event.id → 적재 단조 시각 (디스패처가 대기 지연 측정 후 제거), 오버플로 폐기 수
+        self._ext_enqueued_at: Dict[str, float] = {}
+        self._ext_dropped_total = 0
 
     # ── 이벤트 발행 ──
 
@@ -106,11 +110,17 @@ class NotificationService:
             try:
                 self._external_handler_queue.put_nowait(event)
             except asyncio.QueueFull:
+                # 가장 오래된 이벤트를 버리고 새 이벤트를 넣는다.
                 try:
-                    self._external_handler_queue.get_nowait()
+                    dropped = self._external_handler_queue.get_nowait()
+                    self._external_handler_queue.task_done()
+                    self._ext_enqueued_at.pop(dropped.id, None)
+                    self._ext_dropped_total += 1
                     self._external_handler_queue.put_nowait(event)
                 except Exception:
-                    pass
+                    self._ext_dropped_total += 1
+                    return event
+            self._ext_enqueued_at[event.id] = time.monotonic()
 
         return event
 
@@ -168,9 +178,21 @@ class NotificationService:
 
     @property
     def external_handler_queue(self) -> asyncio.Queue:
-        """외부 핸들러 전달 대기 큐 (NotificationQueueTask가 소비)."""
+        """외부 핸들러 전달 대기 큐 (NotificationQueueTask가 배치로 소비)."""
         return self._external_handler_queue
 
+    def pop_external_enqueue_time(self, event_id: str) -> Optional[float]:
+        """외부 큐 적재 시각(time.monotonic)을 꺼낸다. 디스패처가 대기 지연 측정에 쓴다."""
+        return self._ext_enqueued_at.pop(event_id, None)
+
+    def external_queue_stats(self) -> Dict[str, int]:
+        """외부 핸들러 큐 깊이·용량·오버플로 폐기 누계."""
+        return {
+            "depth": self._external_handler_queue.qsize(),
+            "capacity": self._external_handler_queue.maxsize,
+            "dropped": self._ext_dropped_total,
+        }
+
     @property
     def external_handlers(self):
         """등록된 외부 핸들러 목록 (방어적 복사)."""
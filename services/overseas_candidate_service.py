@@ -6,13 +6,55 @@ OverseasStockCodeRepository(전 심볼) + 일봉 거래대금 필터로 watchlis
 일봉은 StockQueryService.get_recent_daily_ohlcv(exchange=해외) — Phase 1-1 어댑터 경유.
 
 배선(VBO 주입)은 Phase 3. 본 서비스는 후보 리스트 산출만 담당한다.
+
+유동성 점수는 세션(마감된 미국 거래일) 단위로 한 번만 계산한다.
+  - `bar_repository`(OverseasDailyBarRepository) 가 있으면 심볼별 마지막 저장일 이후 빠진 일봉만
+    라이브로 채우고, 통계는 저장소에서 읽은 DataFrame 에 대해 벡터 연산으로 낸다.
+  - 라이브 조회는 `OverseasDailyBarFetcher`(고정 worker·실행당 호출 예산) 를 거친다.
+  - 같은 세션·거래소·유니버스의 점수는 캐시되고 진행 중 계산은 공유되므로, dry-run suite 의
+    여러 서비스(VBO/PP/BGU/CB/RSI2/OSB)·장중 VBO 가 get_candidates 를 불러도 계산은 1회다.
+    min_avg_trading_value·top_n 은 캐시된 점수 위에서 적용한다.
 """
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from common.overseas_types import OverseasExchange
-from common.types import ErrorCode
+from core.lazy_service import aresolve_lazy
+from services.overseas_daily_bar_fetcher import OverseasDailyBarFetcher
+
+SessionDateProvider = Callable[[], Awaitable[Optional[str]]]
+
+
+def compute_liquidity_stats(frame: pd.DataFrame) -> pd.DataFrame:
+    """심볼별 일봉 frame(code,date,close,volume) → 유동성 통계 (code 인덱스).
+
+    거래대금은 close*volume 이며 close·volume 이 양수인 봉만 센다. 유효 봉이 없는 심볼은 빠진다.
+    """
+    columns = ["avg_trading_value", "median_trading_value", "avg_volume", "last_close", "bars"]
+    if frame is None or frame.empty:
+        return pd.DataFrame(columns=columns)
+    close = pd.to_numeric(frame["close"], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+    volume = pd.to_numeric(frame["volume"], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+    valid = (close > 0) & (volume > 0)
+    if not valid.any():
+        return pd.DataFrame(columns=columns)
+    data = pd.DataFrame({
+        "code": frame["code"].to_numpy()[valid],
+        "trading_value": close[valid] * volume[valid],
+        "volume": volume[valid],
+        "close": close[valid],
+    })
+    grouped = data.groupby("code", sort=False)
+    stats = grouped["trading_value"].agg(["mean", "median", "size"])
+    stats.columns = ["avg_trading_value", "median_trading_value", "bars"]
+    stats["avg_volume"] = grouped["volume"].mean()
+    stats["last_close"] = grouped["close"].last()
+    return stats[columns]
 
 
 class OverseasCandidateService:
@@ -26,7 +68,11 @@ class OverseasCandidateService:
         min_avg_trading_value: float = 10_000_000.0,
         top_n: int = 50,
         max_universe: int = 300,
-        concurrency: int = 10,
+        concurrency: int = 4,
+        max_live_fetches: Optional[int] = None,
+        bar_repository=None,
+        bar_fetcher: Optional[OverseasDailyBarFetcher] = None,
+        session_date_provider: Optional[SessionDateProvider] = None,
     ):
         self._repo = overseas_stock_code_repository
         self._sqs = stock_query_service
@@ -35,7 +81,14 @@ class OverseasCandidateService:
         self._min_avg_trading_value = min_avg_trading_value
         self._top_n = top_n
         self._max_universe = max_universe
-        self._concurrency = concurrency
+        self._bars = bar_repository
+        self._fetcher = bar_fetcher or OverseasDailyBarFetcher(
+            stock_query_service, self._logger, concurrency=concurrency, max_calls=max_live_fetches,
+        )
+        self._session_date_provider = session_date_provider
+        self._scored_cache: Dict[Tuple, Dict[str, Dict[str, Any]]] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._last_run: Dict[str, Any] = {}
 
     async def get_candidates(
         self,
@@ -47,41 +100,154 @@ class OverseasCandidateService:
     ) -> List[Dict[str, Any]]:
         """거래대금 필터를 통과한 해외 후보를 내림차순으로 반환한다.
 
-        반환: [{"code","name","exchange","avg_trading_value"}], avg_trading_value 내림차순.
+        반환: [{"code","name","exchange","avg_trading_value", "median_trading_value","avg_volume"}],
+        avg_trading_value 내림차순.
         """
         min_tv = self._min_avg_trading_value if min_avg_trading_value is None else min_avg_trading_value
         cap = self._top_n if top_n is None else top_n
 
+        if not symbols:
+            # 심볼 마스터는 지연 생성 프록시(LazyService)일 수 있다 — 첫 조회 때 루프 밖에서 만든다.
+            self._repo = await aresolve_lazy(self._repo)
         meta = self._resolve_universe(exchange, symbols)
         if not meta:
             return []
 
-        sem = asyncio.Semaphore(self._concurrency)
+        scored = await self._scored_universe(exchange, meta)
+        candidates = [
+            {**stats, "name": entry.get("name", entry["code"])}
+            for entry in meta
+            for stats in (scored.get(entry["code"]),)
+            if stats is not None and stats["avg_trading_value"] >= min_tv
+        ]
+        candidates.sort(key=lambda c: c["avg_trading_value"], reverse=True)
+        return candidates[:cap] if cap else candidates
+
+    def get_last_run_stats(self) -> Dict[str, Any]:
+        """가장 최근 점수 계산(캐시 미스)의 조회·저장 통계."""
+        return dict(self._last_run)
+
+    async def _scored_universe(
+        self, exchange: OverseasExchange, meta: List[Dict[str, str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """세션·거래소·유니버스 단위로 캐시·공유되는 심볼별 유동성 점수."""
+        session = await self._session_date()
+        codes = tuple(entry["code"] for entry in meta)
+        key = (exchange.value, session, codes)
+        cached = self._scored_cache.get(key)
+        if cached is not None:
+            return cached
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            scored = await self._score(exchange, session, list(codes))
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 'never retrieved' 경고 방지
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        # 지난 세션 점수는 버린다 (세션당 유니버스 몇 개 수준)
+        self._scored_cache = {k: v for k, v in self._scored_cache.items() if k[1] == session}
+        self._scored_cache[key] = scored
+        future.set_result(scored)
+        return scored
+
+    async def _score(
+        self, exchange: OverseasExchange, session: str, codes: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        lookback = max(1, int(self._lookback_days))
+        run: Dict[str, Any] = {"exchange": exchange.value, "session": session, "universe": len(codes)}
+        if self._bars is not None:
+            last_dates = await self._bars.last_dates_async(exchange, codes)
+            limits = self._missing_bar_counts(codes, last_dates, session, lookback)
+            fetched = await self._fetcher.fetch(list(limits), exchange, limits=limits, default_limit=lookback)
+            new_rows = {
+                code: [
+                    row for row in rows
+                    if last_dates.get(code, "") < str(row.get("date") or "") <= session
+                ]
+                for code, rows in fetched.rows.items()
+            }
+            run["stale"] = len(limits)
+            run["stored_bars"] = await self._bars.upsert_many_async(exchange, new_rows)
+            frame = await self._bars.load_frame_async(exchange, codes, lookback)
+        else:
+            fetched = await self._fetcher.fetch(codes, exchange, default_limit=lookback)
+            frame = self._rows_to_frame(fetched.rows, lookback)
+            run["stale"] = len(codes)
+        run.update({
+            "live_fetches": fetched.calls,
+            "failed": len(fetched.failed),
+            "budget_skipped": len(fetched.budget_skipped),
+        })
+        for code in fetched.failed:
+            self._logger.debug({"event": "overseas_candidate_fetch_failed", "code": code})
 
-        async def _score(entry: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            async with sem:
-                avg_tv = await self._avg_trading_value(entry["code"], exchange)
-            if avg_tv is None or avg_tv < min_tv:
-                return None
-            return {
-                "code": entry["code"],
-                "name": entry.get("name", entry["code"]),
+        stats = compute_liquidity_stats(frame)
+        scored = {
+            code: {
+                "code": code,
                 "exchange": exchange.value,
-                "avg_trading_value": avg_tv,
+                "avg_trading_value": float(row.avg_trading_value),
+                "median_trading_value": float(row.median_trading_value),
+                "avg_volume": float(row.avg_volume),
             }
+            for code, row in stats.iterrows()
+        }
+        run["scored"] = len(scored)
+        self._last_run = run
+        self._logger.info({"event": "overseas_candidate_scored", **run})
+        return scored
 
-        scored = await asyncio.gather(*[_score(e) for e in meta], return_exceptions=True)
+    @staticmethod
+    def _missing_bar_counts(
+        codes: List[str], last_dates: Dict[str, str], session: str, lookback: int
+    ) -> Dict[str, int]:
+        """심볼별 조회 봉 수 — 세션까지 빠진 일봉 수(평일 기준, lookback 상한) + 1. 최신 심볼은 제외된다.
 
-        candidates: List[Dict[str, Any]] = []
-        for r in scored:
-            if isinstance(r, Exception):
-                self._logger.warning({"event": "overseas_candidate_error", "error": str(r)})
-                continue
-            if r:
-                candidates.append(r)
+        장중에는 최근 봉이 진행 중 세션의 미완성 봉이라 `<= session` 필터에서 버려지므로,
+        빠진 마감 봉을 모두 받으려면 한 봉을 더 요청해야 한다.
+        """
+        stale = [code for code in codes if last_dates.get(code, "") < session]
+        if not stale:
+            return {}
+        session_day = np.datetime64(f"{session[:4]}-{session[4:6]}-{session[6:8]}", "D")
+        last = np.array(
+            [
+                np.datetime64(f"{d[:4]}-{d[4:6]}-{d[6:8]}", "D") if d else session_day - 3650
+                for d in (last_dates.get(code, "") for code in stale)
+            ],
+            dtype="datetime64[D]",
+        )
+        missing = np.busday_count(last + 1, session_day + 1)
+        missing = np.clip(missing, 1, lookback) + 1
+        return {code: int(count) for code, count in zip(stale, missing)}
 
-        candidates.sort(key=lambda c: c["avg_trading_value"], reverse=True)
-        return candidates[:cap] if cap else candidates
+    @staticmethod
+    def _rows_to_frame(rows_by_code: Dict[str, List[dict]], lookback: int) -> pd.DataFrame:
+        records = [
+            (code, str(row.get("date") or ""), row.get("close"), row.get("volume"))
+            for code, rows in rows_by_code.items()
+            for row in rows[-lookback:]
+        ]
+        return pd.DataFrame(records, columns=["code", "date", "close", "volume"])
+
+    async def _session_date(self) -> str:
+        """점수 캐시·저장 기준 세션일. provider 가 없으면 로컬 날짜(하루 1회 재계산)."""
+        if self._session_date_provider is not None:
+            try:
+                session = await self._session_date_provider()
+            except Exception as e:
+                self._logger.warning({"event": "overseas_candidate_session_error", "error": str(e)})
+                session = None
+            if session:
+                return str(session)
+        return datetime.now().strftime("%Y%m%d")
 
     def _resolve_universe(
         self, exchange: OverseasExchange, symbols: Optional[List[str]]
@@ -105,24 +271,3 @@ class OverseasCandidateService:
             if len(result) >= self._max_universe:
                 break
         return result
-
-    async def _avg_trading_value(self, symbol: str, exchange: OverseasExchange) -> Optional[float]:
-        """최근 lookback_days 일봉의 평균 거래대금(close*volume)을 USD로 반환. 실패 시 None."""
-        try:
-            resp = await self._sqs.get_recent_daily_ohlcv(
-                symbol, limit=self._lookback_days, exchange=exchange
-            )
-        except Exception as e:
-            self._logger.warning({"event": "overseas_candidate_ohlcv_error", "code": symbol, "error": str(e)})
-            return None
-        if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
-            return None
-        values = []
-        for row in resp.data:
-            close = float(row.get("close") or 0)
-            volume = float(row.get("volume") or 0)
-            if close > 0 and volume > 0:
-                values.append(close * volume)
-        if not values:
-            return None
-        return sum(values) / len(values)
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from common.overseas_types import OverseasExchange
 from common.types import ErrorCode
+from services.overseas_dryrun_data_plane import BarRequirement, DryRunBarSnapshot
 
 
 @dataclass
@@ -60,12 +61,16 @@ class OverseasChannelBreakoutDryRunService:
         top_n: Optional[int] = None,
         min_avg_trading_value: Optional[float] = None,
         record: bool = True,
+        snapshot: Optional[DryRunBarSnapshot] = None,
     ) -> List[Dict[str, Any]]:
         """후보를 평가해 CB BUY would-be 신호를 반환하고(선택) shadow 저널에 기록한다."""
         ex = exchange or self._default_exchange
-        candidates = await self._candidate_service.get_candidates(
-            ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
-        )
+        if snapshot is not None:
+            candidates = snapshot.candidates
+        else:
+            candidates = await self._candidate_service.get_candidates(
+                ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
+            )
 
         fx_rate = await self._resolve_fx_rate()
         signals: List[Dict[str, Any]] = []
@@ -73,15 +78,22 @@ class OverseasChannelBreakoutDryRunService:
             code = cand.get("code")
             if not code:
                 continue
-            try:
-                resp = await self._sqs.get_recent_daily_ohlcv(code, limit=60, exchange=ex)
-            except Exception as e:
-                self._logger.warning({"event": "overseas_cb_ohlcv_error", "code": code, "error": str(e)})
-                continue
-            if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
-                continue
-
-            sig = self._evaluate(code, cand, resp.data)
+            if snapshot is not None:
+                view = snapshot.view(code)
+                if view is None:
+                    continue
+                rows = view.tail(60)
+            else:
+                try:
+                    resp = await self._sqs.get_recent_daily_ohlcv(code, limit=60, exchange=ex)
+                except Exception as e:
+                    self._logger.warning({"event": "overseas_cb_ohlcv_error", "code": code, "error": str(e)})
+                    continue
+                if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+                    continue
+                rows = resp.data
+
+            sig = self._evaluate(code, cand, rows)
             if not sig:
                 continue
             if self._sizing_service is not None:
@@ -103,7 +115,7 @@ class OverseasChannelBreakoutDryRunService:
                     snapshot={
                         "exchange": ex.value,
                         "avg_trading_value": cand.get("avg_trading_value"),
-                        "bar": self._bar_ohlc(resp.data[-1]),
+                        "bar": self._bar_ohlc(rows[-1]),
                     },
                     signal_source=self.SIGNAL_SOURCE,
                 )
@@ -116,6 +128,9 @@ class OverseasChannelBreakoutDryRunService:
         })
         return signals
 
+    def bar_requirement(self) -> BarRequirement:
+        return BarRequirement(history=60)
+
     async def _resolve_fx_rate(self) -> Optional[float]:
         if self._sizing_service is None or self._fx_provider is None:
             return None
@@ -0,0 +1,98 @@
+# services/overseas_daily_bar_fetcher.py
+"""해외 일봉 라이브 조회를 동시성·호출 예산 안에서 수행하는 fetcher.
+
+S&P500 급 유니버스를 `asyncio.gather` 로 한꺼번에 띄우면 수백 개 코루틴이 동시에 API limiter
+대기열에 들어가 다른 조회(장중 현재가 등)를 밀어낸다. 여기서는 고정 개수의 worker 가 큐에서
+심볼을 하나씩 꺼내 조회하고, 실행당 호출 예산(`max_calls`)을 넘으면 남은 심볼은 조회하지 않고
+`budget_skipped` 로 돌려준다 — 호출 측은 저장소에 남은 이전 일봉으로 계산을 이어간다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from common.overseas_types import OverseasExchange
+from common.types import ErrorCode
+
+
+@dataclass
+class BarFetchResult:
+    """fetch 1회 결과. rows 는 성공한 심볼만 담는다 (오름차순 일봉)."""
+    rows: Dict[str, List[dict]] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+    budget_skipped: List[str] = field(default_factory=list)
+    calls: int = 0
+
+
+class OverseasDailyBarFetcher:
+    def __init__(
+        self,
+        stock_query_service,
+        logger: Optional[logging.Logger] = None,
+        *,
+        concurrency: int = 4,
+        max_calls: Optional[int] = None,
+    ):
+        self._sqs = stock_query_service
+        self._logger = logger if logger else logging.getLogger(__name__)
+        self._concurrency = max(1, int(concurrency))
+        self._max_calls = None if max_calls is None else max(0, int(max_calls))
+
+    async def fetch(
+        self,
+        codes: Iterable[str],
+        exchange: OverseasExchange,
+        *,
+        limits: Optional[Mapping[str, int]] = None,
+        default_limit: int = 5,
+        max_calls: Optional[int] = None,
+    ) -> BarFetchResult:
+        """codes 의 최근 일봉을 조회한다. limits 로 심볼별 요청 봉 수를 줄 수 있다."""
+        budget = self._max_calls if max_calls is None else max(0, int(max_calls))
+        ordered = list(dict.fromkeys(codes))
+        result = BarFetchResult()
+        if budget is not None and len(ordered) > budget:
+            result.budget_skipped = ordered[budget:]
+            ordered = ordered[:budget]
+        if not ordered:
+            return result
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for code in ordered:
+            queue.put_nowait(code)
+
+        async def _worker() -> None:
+            while True:
+                try:
+                    code = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                limit = int((limits or {}).get(code, default_limit))
+                result.calls += 1
+                rows = await self._fetch_one(code, exchange, limit)
+                if rows is None:
+                    result.failed.append(code)
+                else:
+                    result.rows[code] = rows
+
+        await asyncio.gather(*[_worker() for _ in range(min(self._concurrency, len(ordered)))])
+        if result.budget_skipped:
+            self._logger.warning({
+                "event": "overseas_bar_fetch_budget_exhausted",
+                "exchange": exchange.value,
+                "budget": budget,
+                "skipped": len(result.budget_skipped),
+            })
+        return result
+
+    async def _fetch_one(self, code: str, exchange: OverseasExchange, limit: int) -> Optional[List[dict]]:
+        try:
+            resp = await self._sqs.get_recent_daily_ohlcv(code, limit=max(1, limit), exchange=exchange)
+        except Exception as e:
+            self._logger.warning({"event": "overseas_candidate_ohlcv_error", "code": code, "error": str(e)})
+            return None
+        if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+            return None
+        return list(resp.data)
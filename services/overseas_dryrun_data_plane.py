@@ -0,0 +1,281 @@
+# services/overseas_dryrun_data_plane.py
+"""해외 dry-run 전략 묶음이 공유하는 일봉·지표 스냅샷 (suite 단위 data plane).
+
+`OverseasDryRunSuiteService` 의 전략 서비스 6종은 같은 후보 목록을 두고 각자
+`get_recent_daily_ohlcv` 를 심볼마다 다시 호출했다 (후보 N개면 6N 회, limit 만 3~207 로 다름).
+여기서는 실행 1회에 한 번만:
+
+  1. 후보 목록을 한 번 받고,
+  2. 각 심볼 일봉을 서비스들이 요구하는 최대 봉 수로 한 번씩 조회하고
+     (`OverseasDailyBarFetcher` — 동시성 상한 안에서),
+  3. 서비스들이 선언한 지표(`BarRequirement`)의 합집합을 심볼×봉 행렬 위에서 한 번에 계산한 뒤,
+  4. 심볼별 읽기 전용 view(`SymbolBarView`)로 넘긴다.
+
+각 서비스는 `view.tail(limit)` 으로 자기 limit 만큼만 잘라 쓰므로, 기존처럼 limit 별로 따로 조회한
+결과와 같은 입력으로 평가한다. 공유 지표는 서비스가 검증을 마친 뒤 가져다 쓰고, 값이 없으면
+(데이터 부족·비양수 종가 구간) 서비스 자체 계산으로 돌아간다.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from common.overseas_types import OverseasExchange
+from services.overseas_daily_bar_fetcher import OverseasDailyBarFetcher
+
+IndicatorKey = Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class BarRequirement:
+    """서비스 1개가 선언하는 일봉 수요.
+
+    history: 조회할 최근 봉 수 (기존 `get_recent_daily_ohlcv` limit)
+    sma_periods: 최근 종가 단순이동평균 기간
+    rsi_periods: 최근 period 개 변동의 단순평균 RSI 기간
+    bb_windows: (bollinger_period, squeeze_lookback) — 당일 봉을 뺀 이력의 BB 폭 시계열
+    """
+    history: int
+    sma_periods: Tuple[int, ...] = ()
+    rsi_periods: Tuple[int, ...] = ()
+    bb_windows: Tuple[Tuple[int, int], ...] = ()
+
+    def indicator_keys(self) -> Tuple[IndicatorKey, ...]:
+        return (
+            tuple(("sma", int(p)) for p in self.sma_periods)
+            + tuple(("rsi", int(p)) for p in self.rsi_periods)
+            + tuple(("bb_width", int(p), int(lb)) for p, lb in self.bb_windows)
+        )
+
+
+@dataclass(frozen=True)
+class SymbolBarView:
+    """심볼 1개의 읽기 전용 일봉 view. 행은 MappingProxyType 이라 서비스가 고칠 수 없다."""
+    code: str
+    rows: Tuple[Mapping[str, Any], ...]
+    indicators: Mapping[IndicatorKey, Any]
+    positive_close_tail: int = 0
+
+    def tail(self, limit: int) -> Tuple[Mapping[str, Any], ...]:
+        """기존 `get_recent_daily_ohlcv(limit=...)` 와 같은 최근 limit 봉."""
+        return self.rows[-max(1, int(limit)):]
+
+    def indicator(self, kind: str, *params: int) -> Any:
+        return self.indicators.get((kind, *params))
+
+    def closes_positive(self, count: int) -> bool:
+        """최근 count 봉 종가가 모두 양수인지 (서비스의 공유 지표 사용 조건)."""
+        return self.positive_close_tail >= count
+
+
+@dataclass(frozen=True)
+class DataPlaneStats:
+    """스냅샷 1회 구성 통계. legacy_* 는 서비스별 개별 조회였다면 들었을 비용."""
+    exchange: str
+    consumers: int = 0
+    symbols: int = 0
+    fetch_calls: int = 0
+    legacy_fetch_calls: int = 0
+    fetch_failed: int = 0
+    budget_skipped: int = 0
+    bars_loaded: int = 0
+    legacy_bars_requested: int = 0
+    indicator_series: int = 0
+    legacy_indicator_series: int = 0
+    load_ms: float = 0.0
+    compute_ms: float = 0.0
+
+    @property
+    def fetches_saved(self) -> int:
+        return max(0, self.legacy_fetch_calls - self.fetch_calls)
+
+    @property
+    def indicator_series_saved(self) -> int:
+        return max(0, self.legacy_indicator_series - self.indicator_series)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "exchange": self.exchange,
+            "consumers": self.consumers,
+            "symbols": self.symbols,
+            "fetch_calls": self.fetch_calls,
+            "legacy_fetch_calls": self.legacy_fetch_calls,
+            "fetches_saved": self.fetches_saved,
+            "fetch_failed": self.fetch_failed,
+            "budget_skipped": self.budget_skipped,
+            "bars_loaded": self.bars_loaded,
+            "legacy_bars_requested": self.legacy_bars_requested,
+            "indicator_series": self.indicator_series,
+            "legacy_indicator_series": self.legacy_indicator_series,
+            "indicator_series_saved": self.indicator_series_saved,
+            "load_ms": self.load_ms,
+            "compute_ms": self.compute_ms,
+        }
+
+
+@dataclass(frozen=True)
+class DryRunBarSnapshot:
+    """suite 실행 1회분 스냅샷. 후보 순서는 candidate_service 결과 그대로다."""
+    exchange: OverseasExchange
+    candidates: Tuple[Mapping[str, Any], ...]
+    views: Mapping[str, SymbolBarView]
+    stats: DataPlaneStats = field(default_factory=lambda: DataPlaneStats(exchange=""))
+
+    def view(self, code: str) -> Optional[SymbolBarView]:
+        return self.views.get(code)
+
+
+def _f(x) -> float:
+    try:
+        return float(x or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _close_matrix(series: List[List[float]], width: int) -> np.ndarray:
+    """심볼별 종가를 오른쪽 정렬한 (심볼 × width) 행렬. 모자란 앞부분은 NaN."""
+    matrix = np.full((len(series), width), np.nan)
+    for i, closes in enumerate(series):
+        if closes:
+            tail = closes[-width:]
+            matrix[i, width - len(tail):] = tail
+    return matrix
+
+
+def compute_indicators(
+    series: List[List[float]],
+    keys: Iterable[IndicatorKey],
+) -> Tuple[List[Dict[IndicatorKey, Any]], np.ndarray]:
+    """지표 합집합을 한 번에 계산한다.
+
+    반환: (심볼별 {key: 값}, 심볼별 뒤에서부터 연속 양수 종가 개수).
+    창 안에 NaN(봉 부족)이나 비양수 종가가 있으면 그 지표는 넣지 않는다.
+    """
+    keys = list(dict.fromkeys(keys))
+    results: List[Dict[IndicatorKey, Any]] = [{} for _ in series]
+    if not series:
+        return results, np.zeros(0, dtype=int)
+    width = max(1, max((len(s) for s in series), default=1))
+    closes = _close_matrix(series, width)
+    positive = np.nan_to_num(closes, nan=0.0) > 0
+    # 뒤에서부터 처음 비양수를 만나기 전까지의 길이
+    first_bad_from_end = np.argmin(positive[:, ::-1], axis=1)
+    positive_tail = np.where(positive.all(axis=1), width, first_bad_from_end)
+
+    for key in keys:
+        kind = key[0]
+        if kind == "sma":
+            period = key[1]
+            if period <= 0 or period > width:
+                continue
+            window = closes[:, -period:]
+            valid = positive_tail >= period
+            values = window.mean(axis=1)
+            for i in np.flatnonzero(valid):
+                results[i][key] = float(values[i])
+        elif kind == "rsi":
+            period = key[1]
+            if period <= 0 or period + 1 > width:
+                continue
+            deltas = np.diff(closes[:, -(period + 1):], axis=1)
+            valid = ~np.isnan(deltas).any(axis=1)
+            avg_gain = np.clip(deltas, 0, None).sum(axis=1) / period
+            avg_loss = np.clip(-deltas, 0, None).sum(axis=1) / period
+            for i in np.flatnonzero(valid):
+                gain, loss = float(avg_gain[i]), float(avg_loss[i])
+                if loss == 0:
+                    results[i][key] = 100.0 if gain > 0 else 50.0
+                else:
+                    results[i][key] = 100.0 - (100.0 / (1.0 + gain / loss))
+        elif kind == "bb_width":
+            period, lookback = key[1], key[2]
+            span = period + lookback - 1
+            if period <= 0 or lookback <= 0 or span + 1 > width:
+                continue
+            # 당일 봉을 뺀 이력의 마지막 lookback 개 창
+            history = closes[:, -(span + 1):-1]
+            windows = np.lib.stride_tricks.sliding_window_view(history, period, axis=1)
+            mean = windows.mean(axis=2)
+            std = windows.std(axis=2)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                widths = 4.0 * std / mean
+            valid = positive_tail - 1 >= span
+            for i in np.flatnonzero(valid):
+                results[i][key] = tuple(float(w) for w in widths[i])
+    return results, positive_tail
+
+
+class OverseasDryRunDataPlane:
+    def __init__(
+        self,
+        candidate_service,
+        stock_query_service,
+        logger: Optional[logging.Logger] = None,
+        *,
+        bar_fetcher: Optional[OverseasDailyBarFetcher] = None,
+        concurrency: int = 4,
+    ) -> None:
+        self._candidate_service = candidate_service
+        self._logger = logger or logging.getLogger(__name__)
+        self._fetcher = bar_fetcher or OverseasDailyBarFetcher(
+            stock_query_service, self._logger, concurrency=concurrency
+        )
+
+    async def build(
+        self,
+        exchange: OverseasExchange,
+        requirements: Iterable[BarRequirement],
+    ) -> DryRunBarSnapshot:
+        requirements = [r for r in requirements if r is not None]
+        started = time.perf_counter()
+        candidates = await self._candidate_service.get_candidates(exchange)
+        frozen_candidates = tuple(MappingProxyType(dict(c)) for c in candidates or [])
+        codes = list(dict.fromkeys(c.get("code") for c in frozen_candidates if c.get("code")))
+        history = max((int(r.history) for r in requirements), default=0)
+
+        fetched = await self._fetcher.fetch(codes, exchange, default_limit=max(1, history)) if codes else None
+        load_ms = (time.perf_counter() - started) * 1000
+        rows_by_code = fetched.rows if fetched else {}
+
+        compute_started = time.perf_counter()
+        loaded = [code for code in codes if rows_by_code.get(code)]
+        series = [[_f(r.get("close")) for r in rows_by_code[code]] for code in loaded]
+        keys = [key for r in requirements for key in r.indicator_keys()]
+        indicators, positive_tail = compute_indicators(series, keys)
+        views: Dict[str, SymbolBarView] = {}
+        for i, code in enumerate(loaded):
+            views[code] = SymbolBarView(
+                code=code,
+                rows=tuple(MappingProxyType(dict(r)) for r in rows_by_code[code]),
+                indicators=MappingProxyType(indicators[i]),
+                positive_close_tail=int(positive_tail[i]),
+            )
+        compute_ms = (time.perf_counter() - compute_started) * 1000
+
+        stats = DataPlaneStats(
+            exchange=exchange.value,
+            consumers=len(requirements),
+            symbols=len(codes),
+            fetch_calls=fetched.calls if fetched else 0,
+            legacy_fetch_calls=len(codes) * len(requirements),
+            fetch_failed=len(fetched.failed) if fetched else 0,
+            budget_skipped=len(fetched.budget_skipped) if fetched else 0,
+            bars_loaded=sum(len(rows_by_code[code]) for code in loaded),
+            legacy_bars_requested=len(codes) * sum(int(r.history) for r in requirements),
+            indicator_series=len(loaded) * len(set(keys)),
+            legacy_indicator_series=len(loaded) * len(keys),
+            load_ms=round(load_ms, 3),
+            compute_ms=round(compute_ms, 3),
+        )
+        self._logger.info({"event": "overseas_dryrun_data_plane", **stats.as_dict()})
+        return DryRunBarSnapshot(
+            exchange=exchange,
+            candidates=frozen_candidates,
+            views=MappingProxyType(views),
+            stats=stats,
+        )
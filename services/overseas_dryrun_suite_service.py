@@ -1,29 +1,92 @@
-"""여러 해외 dry-run 서비스를 한 번의 after-market 태스크에서 실행하는 합성 서비스."""
+"""여러 해외 dry-run 서비스를 한 번의 after-market 태스크에서 실행하는 합성 서비스.
+
+data_plane 이 주어지면 후보·일봉·공유 지표를 실행당 한 번만 준비해(`DryRunBarSnapshot`)
+`bar_requirement()` 를 선언한 서비스에 넘기고, 서비스들은 동시에 평가한다. 스냅샷 구성이
+실패하거나 요구를 선언하지 않은 서비스는 기존처럼 각자 조회한다.
+"""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Iterable, List, Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional
 
 from common.overseas_types import OverseasExchange
+from services.overseas_dryrun_data_plane import DryRunBarSnapshot, OverseasDryRunDataPlane
 
 
 class OverseasDryRunSuiteService:
-    def __init__(self, services: Iterable[Any], logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        services: Iterable[Any],
+        logger: Optional[logging.Logger] = None,
+        *,
+        data_plane: Optional[OverseasDryRunDataPlane] = None,
+    ) -> None:
         self._services = list(services or [])
         self._logger = logger or logging.getLogger(__name__)
+        self._data_plane = data_plane
+        self._last_run_stats: Dict[str, Any] = {}
 
     async def scan_dry_run(self, exchange: OverseasExchange = OverseasExchange.NASD) -> List[dict]:
+        started = time.perf_counter()
+        snapshot = await self._build_snapshot(exchange)
+        results = await asyncio.gather(*[
+            self._run_service(service, exchange, snapshot) for service in self._services
+        ])
         signals: List[dict] = []
-        for service in self._services:
-            try:
-                result = await service.scan_dry_run(exchange)
-            except Exception as e:
-                self._logger.error({
-                    "event": "overseas_dryrun_suite_service_error",
-                    "service": service.__class__.__name__,
-                    "exchange": exchange.value,
-                    "error": str(e),
-                }, exc_info=True)
-                continue
+        for result in results:
             signals.extend(result or [])
+
+        stats: Dict[str, Any] = {
+            "exchange": exchange.value,
+            "services": len(self._services),
+            "signals": len(signals),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            "shared_snapshot": snapshot is not None,
+        }
+        if snapshot is not None:
+            stats.update(snapshot.stats.as_dict())
+        self._last_run_stats = stats
+        self._logger.info({"event": "overseas_dryrun_suite_scan", **stats})
         return signals
+
+    def get_last_run_stats(self) -> Dict[str, Any]:
+        return dict(self._last_run_stats)
+
+    async def _build_snapshot(self, exchange: OverseasExchange) -> Optional[DryRunBarSnapshot]:
+        if self._data_plane is None:
+            return None
+        requirements = [
+            service.bar_requirement() for service in self._services if hasattr(service, "bar_requirement")
+        ]
+        if not requirements:
+            return None
+        try:
+            return await self._data_plane.build(exchange, requirements)
+        except Exception as e:
+            self._logger.error({
+                "event": "overseas_dryrun_data_plane_error",
+                "exchange": exchange.value,
+                "error": str(e),
+            }, exc_info=True)
+            return None
+
+    async def _run_service(
+        self,
+        service: Any,
+        exchange: OverseasExchange,
+        snapshot: Optional[DryRunBarSnapshot],
+    ) -> List[dict]:
+        try:
+            if snapshot is not None and hasattr(service, "bar_requirement"):
+                return await service.scan_dry_run(exchange, snapshot=snapshot)
+            return await service.scan_dry_run(exchange)
+        except Exception as e:
+            self._logger.error({
+                "event": "overseas_dryrun_suite_service_error",
+                "service": service.__class__.__name__,
+                "exchange": exchange.value,
+                "error": str(e),
+            }, exc_info=True)
+            return []
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from common.overseas_types import OverseasExchange
 from common.types import ErrorCode
+from services.overseas_dryrun_data_plane import BarRequirement, DryRunBarSnapshot, SymbolBarView
 
 
 @dataclass
@@ -57,12 +58,16 @@ class OverseasPocketPivotDryRunService:
         top_n: Optional[int] = None,
         min_avg_trading_value: Optional[float] = None,
         record: bool = True,
+        snapshot: Optional[DryRunBarSnapshot] = None,
     ) -> List[Dict[str, Any]]:
         """후보를 평가해 PP BUY would-be 신호를 반환하고(선택) shadow 저널에 기록한다."""
         ex = exchange or self._default_exchange
-        candidates = await self._candidate_service.get_candidates(
-            ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
-        )
+        if snapshot is not None:
+            candidates = snapshot.candidates
+        else:
+            candidates = await self._candidate_service.get_candidates(
+                ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
+            )
 
         fx_rate = await self._resolve_fx_rate()
         signals: List[Dict[str, Any]] = []
@@ -70,15 +75,23 @@ class OverseasPocketPivotDryRunService:
             code = cand.get("code")
             if not code:
                 continue
-            try:
-                resp = await self._sqs.get_recent_daily_ohlcv(code, limit=60, exchange=ex)
-            except Exception as e:
-                self._logger.warning({"event": "overseas_pp_ohlcv_error", "code": code, "error": str(e)})
-                continue
-            if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
-                continue
+            view = None
+            if snapshot is not None:
+                view = snapshot.view(code)
+                if view is None:
+                    continue
+                rows = view.tail(60)
+            else:
+                try:
+                    resp = await self._sqs.get_recent_daily_ohlcv(code, limit=60, exchange=ex)
+                except Exception as e:
+                    self._logger.warning({"event": "overseas_pp_ohlcv_error", "code": code, "error": str(e)})
+                    continue
+                if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+                    continue
+                rows = resp.data
 
-            sig = self._evaluate(code, cand, resp.data)
+            sig = self._evaluate(code, cand, rows, view)
             if not sig:
                 continue
             if self._sizing_service is not None:
@@ -100,7 +113,7 @@ class OverseasPocketPivotDryRunService:
                     snapshot={
                         "exchange": ex.value,
                         "avg_trading_value": cand.get("avg_trading_value"),
-                        "bar": self._bar_ohlc(resp.data[-1]),
+                        "bar": self._bar_ohlc(rows[-1]),
                     },
                     signal_source=self.SIGNAL_SOURCE,
                 )
@@ -113,6 +126,9 @@ class OverseasPocketPivotDryRunService:
         })
         return signals
 
+    def bar_requirement(self) -> BarRequirement:
+        return BarRequirement(history=60, sma_periods=(10, 20, 50))
+
     async def _resolve_fx_rate(self) -> Optional[float]:
         if self._sizing_service is None or self._fx_provider is None:
             return None
@@ -132,6 +148,7 @@ class OverseasPocketPivotDryRunService:
         code: str,
         candidate: Dict[str, Any],
         rows: List[Dict[str, Any]],
+        view: Optional[SymbolBarView] = None,
     ) -> Optional[Dict[str, Any]]:
         if not rows or len(rows) < max(10, self._cfg.pp_down_day_lookback):
             return None
@@ -150,9 +167,11 @@ class OverseasPocketPivotDryRunService:
         if len(closes) < 10:
             return None
 
-        ma_10d = sum(closes[-10:]) / 10
-        ma_20d = sum(closes[-20:]) / 20 if len(closes) >= 20 else 0.0
-        ma_50d = sum(closes[-50:]) / 50 if len(closes) >= 50 else 0.0
+        # 공유 스냅샷 이평은 rows 전체가 양수 종가일 때만 위 closes(양수 필터)와 같은 창이다
+        shared = view if view is not None and view.closes_positive(len(rows)) else None
+        ma_10d = self._ma(closes, 10, shared)
+        ma_20d = self._ma(closes, 20, shared)
+        ma_50d = self._ma(closes, 50, shared)
         supporting_ma, support_ma_value = self._find_supporting_ma(current, ma_10d, ma_20d, ma_50d)
         if not supporting_ma:
             return None
@@ -218,6 +237,13 @@ class OverseasPocketPivotDryRunService:
                 return name, value
         return "", 0.0
 
+    @staticmethod
+    def _ma(closes: List[float], period: int, view: Optional[SymbolBarView] = None) -> float:
+        if len(closes) < period:
+            return 0.0
+        value = view.indicator("sma", period) if view is not None else None
+        return value if value is not None else sum(closes[-period:]) / period
+
     @staticmethod
     def _bar_ohlc(bar: Dict[str, Any]) -> Dict[str, Any]:
         return {k: bar.get(k) for k in ("date", "open", "high", "low", "close", "volume")}
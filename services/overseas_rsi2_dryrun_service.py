@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 
 from common.overseas_types import OverseasExchange
 from common.types import ErrorCode
+from services.overseas_dryrun_data_plane import BarRequirement, DryRunBarSnapshot, SymbolBarView
 
 
 @dataclass
@@ -57,29 +58,41 @@ class OverseasRSI2DryRunService:
         top_n: Optional[int] = None,
         min_avg_trading_value: Optional[float] = None,
         record: bool = True,
+        snapshot: Optional[DryRunBarSnapshot] = None,
     ) -> List[Dict[str, Any]]:
         """후보를 평가해 RSI2 BUY would-be 신호를 반환하고 shadow 저널에 기록한다."""
         ex = exchange or self._default_exchange
-        candidates = await self._candidate_service.get_candidates(
-            ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
-        )
+        if snapshot is not None:
+            candidates = snapshot.candidates
+        else:
+            candidates = await self._candidate_service.get_candidates(
+                ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
+            )
 
         fx_rate = await self._resolve_fx_rate()
         signals: List[Dict[str, Any]] = []
-        limit = max(self._cfg.trend_ma_period + self._cfg.rsi_period + 5, self._cfg.min_history_days)
+        limit = self._history_limit()
         for cand in candidates or []:
             code = cand.get("code")
             if not code:
                 continue
-            try:
-                resp = await self._sqs.get_recent_daily_ohlcv(code, limit=limit, exchange=ex)
-            except Exception as e:
-                self._logger.warning({"event": "overseas_rsi2_ohlcv_error", "code": code, "error": str(e)})
-                continue
-            if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
-                continue
-
-            sig = self._evaluate(code, cand, resp.data)
+            view = None
+            if snapshot is not None:
+                view = snapshot.view(code)
+                if view is None:
+                    continue
+                rows = view.tail(limit)
+            else:
+                try:
+                    resp = await self._sqs.get_recent_daily_ohlcv(code, limit=limit, exchange=ex)
+                except Exception as e:
+                    self._logger.warning({"event": "overseas_rsi2_ohlcv_error", "code": code, "error": str(e)})
+                    continue
+                if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+                    continue
+                rows = resp.data
+
+            sig = self._evaluate(code, cand, rows, view)
             if not sig:
                 continue
             if self._sizing_service is not None:
@@ -101,7 +114,7 @@ class OverseasRSI2DryRunService:
                     snapshot={
                         "exchange": ex.value,
                         "avg_trading_value": cand.get("avg_trading_value"),
-                        "bar": self._bar_ohlc(resp.data[-1]),
+                        "bar": self._bar_ohlc(rows[-1]),
                     },
                     signal_source=self.SIGNAL_SOURCE,
                 )
@@ -114,6 +127,16 @@ class OverseasRSI2DryRunService:
         })
         return signals
 
+    def _history_limit(self) -> int:
+        return max(self._cfg.trend_ma_period + self._cfg.rsi_period + 5, self._cfg.min_history_days)
+
+    def bar_requirement(self) -> BarRequirement:
+        return BarRequirement(
+            history=self._history_limit(),
+            sma_periods=(self._cfg.trend_ma_period, self._cfg.take_profit_ma_period),
+            rsi_periods=(self._cfg.rsi_period,),
+        )
+
     async def _resolve_fx_rate(self) -> Optional[float]:
         if self._sizing_service is None or self._fx_provider is None:
             return None
@@ -133,6 +156,7 @@ class OverseasRSI2DryRunService:
         code: str,
         candidate: Dict[str, Any],
         rows: List[Dict[str, Any]],
+        view: Optional[SymbolBarView] = None,
     ) -> Optional[Dict[str, Any]]:
         min_rows = max(self._cfg.min_history_days, self._cfg.trend_ma_period + self._cfg.rsi_period)
         if not rows or len(rows) < min_rows:
@@ -143,15 +167,24 @@ class OverseasRSI2DryRunService:
             return None
         cur = rows[-1]
         current = closes[-1]
-        ma_200d = sum(closes[-self._cfg.trend_ma_period:]) / self._cfg.trend_ma_period
+        def shared(kind: str, *params: int):
+            return view.indicator(kind, *params) if view is not None else None
+
+        ma_200d = shared("sma", self._cfg.trend_ma_period)
+        if ma_200d is None:
+            ma_200d = sum(closes[-self._cfg.trend_ma_period:]) / self._cfg.trend_ma_period
         if current <= ma_200d:
             return None
 
-        rsi2 = self._rsi(closes, self._cfg.rsi_period)
+        rsi2 = shared("rsi", self._cfg.rsi_period)
+        if rsi2 is None:
+            rsi2 = self._rsi(closes, self._cfg.rsi_period)
         if rsi2 is None or rsi2 > self._cfg.rsi_threshold:
             return None
 
-        ma_5d = sum(closes[-self._cfg.take_profit_ma_period:]) / self._cfg.take_profit_ma_period
+        ma_5d = shared("sma", self._cfg.take_profit_ma_period)
+        if ma_5d is None:
+            ma_5d = sum(closes[-self._cfg.take_profit_ma_period:]) / self._cfg.take_profit_ma_period
         stop_price = current * (1 + self._cfg.hard_stop_pct / 100)
         confidence = max(0.0, min(1.0, (self._cfg.rsi_threshold - rsi2) / max(self._cfg.rsi_threshold, 1.0)))
         return {
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 
 from common.overseas_types import OverseasExchange
 from common.types import ErrorCode
+from services.overseas_dryrun_data_plane import BarRequirement, DryRunBarSnapshot, SymbolBarView
 
 
 @dataclass
@@ -62,12 +63,16 @@ class OverseasSqueezeBreakoutDryRunService:
         top_n: Optional[int] = None,
         min_avg_trading_value: Optional[float] = None,
         record: bool = True,
+        snapshot: Optional[DryRunBarSnapshot] = None,
     ) -> List[Dict[str, Any]]:
         """후보를 평가해 OSB BUY would-be 신호를 반환하고(선택) shadow 저널에 기록한다."""
         ex = exchange or self._default_exchange
-        candidates = await self._candidate_service.get_candidates(
-            ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
-        )
+        if snapshot is not None:
+            candidates = snapshot.candidates
+        else:
+            candidates = await self._candidate_service.get_candidates(
+                ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
+            )
 
         fx_rate = await self._resolve_fx_rate()
         signals: List[Dict[str, Any]] = []
@@ -76,15 +81,23 @@ class OverseasSqueezeBreakoutDryRunService:
             code = cand.get("code")
             if not code:
                 continue
-            try:
-                resp = await self._sqs.get_recent_daily_ohlcv(code, limit=limit, exchange=ex)
-            except Exception as e:
-                self._logger.warning({"event": "overseas_osb_ohlcv_error", "code": code, "error": str(e)})
-                continue
-            if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
-                continue
+            view = None
+            if snapshot is not None:
+                view = snapshot.view(code)
+                if view is None:
+                    continue
+                rows = view.tail(limit)
+            else:
+                try:
+                    resp = await self._sqs.get_recent_daily_ohlcv(code, limit=limit, exchange=ex)
+                except Exception as e:
+                    self._logger.warning({"event": "overseas_osb_ohlcv_error", "code": code, "error": str(e)})
+                    continue
+                if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+                    continue
+                rows = resp.data
 
-            sig = self._evaluate(code, cand, resp.data)
+            sig = self._evaluate(code, cand, rows, view)
             if not sig:
                 continue
             if self._sizing_service is not None:
@@ -106,7 +119,7 @@ class OverseasSqueezeBreakoutDryRunService:
                     snapshot={
                         "exchange": ex.value,
                         "avg_trading_value": cand.get("avg_trading_value"),
-                        "bar": self._bar_ohlc(resp.data[-1]),
+                        "bar": self._bar_ohlc(rows[-1]),
                     },
                     signal_source=self.SIGNAL_SOURCE,
                 )
@@ -125,6 +138,12 @@ class OverseasSqueezeBreakoutDryRunService:
             self._cfg.bollinger_period + self._cfg.squeeze_lookback,
         ) + 1
 
+    def bar_requirement(self) -> BarRequirement:
+        return BarRequirement(
+            history=self._history_limit(),
+            bb_windows=((self._cfg.bollinger_period, self._cfg.squeeze_lookback),),
+        )
+
     async def _resolve_fx_rate(self) -> Optional[float]:
         if self._sizing_service is None or self._fx_provider is None:
             return None
@@ -144,6 +163,7 @@ class OverseasSqueezeBreakoutDryRunService:
         code: str,
         candidate: Dict[str, Any],
         rows: List[Dict[str, Any]],
+        view: Optional[SymbolBarView] = None,
     ) -> Optional[Dict[str, Any]]:
         min_rows = self._history_limit()
         if not rows or len(rows) < min_rows:
@@ -162,14 +182,22 @@ class OverseasSqueezeBreakoutDryRunService:
         if any(v <= 0 for v in closes[-(self._cfg.bollinger_period + self._cfg.squeeze_lookback):]):
             return None
 
-        bb_width = self._bb_width(closes[-self._cfg.bollinger_period:])
-        widths = [
-            self._bb_width(closes[i - self._cfg.bollinger_period:i])
-            for i in range(
-                len(closes) - self._cfg.squeeze_lookback + 1,
-                len(closes) + 1,
-            )
-        ]
+        shared = (
+            view.indicator("bb_width", self._cfg.bollinger_period, self._cfg.squeeze_lookback)
+            if view is not None else None
+        )
+        if shared:
+            bb_width = shared[-1]
+            widths = list(shared)
+        else:
+            bb_width = self._bb_width(closes[-self._cfg.bollinger_period:])
+            widths = [
+                self._bb_width(closes[i - self._cfg.bollinger_period:i])
+                for i in range(
+                    len(closes) - self._cfg.squeeze_lookback + 1,
+                    len(closes) + 1,
+                )
+            ]
         widths = [w for w in widths if w > 0]
         if not widths or bb_width <= 0:
             return None
@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 
 from common.overseas_types import OverseasExchange
 from common.types import ErrorCode
+from services.overseas_dryrun_data_plane import BarRequirement, DryRunBarSnapshot
 
 
 class OverseasVBODryRunService:
@@ -55,12 +56,16 @@ class OverseasVBODryRunService:
         top_n: Optional[int] = None,
         min_avg_trading_value: Optional[float] = None,
         record: bool = True,
+        snapshot: Optional[DryRunBarSnapshot] = None,
     ) -> List[Dict[str, Any]]:
         """후보를 평가해 BUY would-be 신호를 반환하고(선택) shadow 저널에 기록한다."""
         ex = exchange or self._default_exchange
-        candidates = await self._candidate_service.get_candidates(
-            ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
-        )
+        if snapshot is not None:
+            candidates = snapshot.candidates
+        else:
+            candidates = await self._candidate_service.get_candidates(
+                ex, top_n=top_n, min_avg_trading_value=min_avg_trading_value
+            )
 
         fx_rate = await self._resolve_fx_rate()
         signals: List[Dict[str, Any]] = []
@@ -68,15 +73,22 @@ class OverseasVBODryRunService:
             code = cand.get("code")
             if not code:
                 continue
-            try:
-                resp = await self._sqs.get_recent_daily_ohlcv(code, limit=3, exchange=ex)
-            except Exception as e:
-                self._logger.warning({"event": "overseas_dryrun_ohlcv_error", "code": code, "error": str(e)})
-                continue
-            if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
-                continue
-
-            sig = self._evaluate(code, resp.data)
+            if snapshot is not None:
+                view = snapshot.view(code)
+                if view is None:
+                    continue
+                rows = view.tail(3)
+            else:
+                try:
+                    resp = await self._sqs.get_recent_daily_ohlcv(code, limit=3, exchange=ex)
+                except Exception as e:
+                    self._logger.warning({"event": "overseas_dryrun_ohlcv_error", "code": code, "error": str(e)})
+                    continue
+                if not resp or resp.rt_cd != ErrorCode.SUCCESS.value or not resp.data:
+                    continue
+                rows = resp.data
+
+            sig = self._evaluate(code, rows)
             if not sig:
                 continue
             if self._sizing_service is not None:
@@ -99,7 +111,7 @@ class OverseasVBODryRunService:
                         "exchange": ex.value,
                         "avg_trading_value": cand.get("avg_trading_value"),
                         # 청산 모델을 사후에 재계산할 수 있도록 판정 근거인 당일 봉을 남긴다.
-                        "bar": self._bar_ohlc(resp.data[-1]),
+                        "bar": self._bar_ohlc(rows[-1]),
                     },
                     signal_source=self.SIGNAL_SOURCE,
                 )
@@ -107,6 +119,9 @@ class OverseasVBODryRunService:
                            "candidates": len(candidates or []), "signals": len(signals)})
         return signals
 
+    def bar_requirement(self) -> BarRequirement:
+        return BarRequirement(history=3)
+
     async def _resolve_fx_rate(self) -> Optional[float]:
         """scan당 1회 USD/KRW 환율을 조회한다(사이징·provider 모두 있을 때만).
 
@@ -0,0 +1,226 @@
+"""PointInTimeUniverseIndex — 상장/상폐 구간 인덱스 (R-1 생존편향 질의 가속).
+
+`build_point_in_time_snapshot` 은 as_of 날짜마다 전체 레코드를 dedupe·순회한다.
+walk-forward/기간 백테스트는 수백 개 날짜를 같은 레코드로 질의하므로, 레코드를
+한 번만 정규화해 시장별 구간 `[listing, delisting)` 인덱스로 만들어 둔다.
+
+- `snapshot(D, markets)`: 시장별 centered interval tree 로 O(log n + k) 질의.
+- `iter_deltas(dates, markets)`: 연속 날짜 사이에 새로 상장/상폐된 종목만 흘려보낸다.
+  시작일·종료일 정렬 배열을 bisect 하므로 구간 (D1, D2] 의 이벤트만 읽는다.
+
+상장 포함 규칙은 `_is_listed_on` 과 동일하다 — 상장일 당일부터, 상폐일 전날까지.
+dedupe(상폐 이력 우선)·SPAC 제외·심볼 정렬도 스냅샷 빌더와 같은 결과를 낸다.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Sequence
+
+from services.point_in_time_universe_service import (
+    PointInTimeUniverseRecord,
+    _compact_date,
+    _dedupe_preferring_history,
+    _is_spac,
+)
+
+# 빈 상장일은 "항상 상장돼 있었음", 빈 상폐일은 "아직 상장 중" — 문자열 비교용 경계값.
+_MIN_DATE = ""
+_MAX_DATE = "99999999"
+
+
+@dataclass(frozen=True)
+class _Interval:
+    start: str
+    end: str
+    record: PointInTimeUniverseRecord
+
+
+@dataclass
+class _Node:
+    center: str
+    by_start: list[_Interval]
+    by_end_desc: list[_Interval]
+    left: "_Node | None" = None
+    right: "_Node | None" = None
+
+
+def _build_tree(intervals: list[_Interval]) -> _Node | None:
+    if not intervals:
+        return None
+    # center 를 시작점 중 하나로 잡아야 그 구간이 최소 하나는 node 에 남아 재귀가 줄어든다.
+    starts = sorted(iv.start for iv in intervals)
+    center = starts[len(starts) // 2]
+    left: list[_Interval] = []
+    right: list[_Interval] = []
+    here: list[_Interval] = []
+    for iv in intervals:
+        if iv.end <= center:
+            left.append(iv)
+        elif iv.start > center:
+            right.append(iv)
+        else:
+            here.append(iv)
+    return _Node(
+        center=center,
+        by_start=sorted(here, key=lambda iv: iv.start),
+        by_end_desc=sorted(here, key=lambda iv: iv.end, reverse=True),
+        left=_build_tree(left),
+        right=_build_tree(right),
+    )
+
+
+def _stab(node: _Node | None, as_of: str, out: list[PointInTimeUniverseRecord]) -> None:
+    while node is not None:
+        if as_of < node.center:
+            # node 에 걸친 구간은 모두 end > center > as_of → start 만 보면 된다.
+            for iv in node.by_start:
+                if iv.start > as_of:
+                    break
+                out.append(iv.record)
+            node = node.left
+        else:
+            # node 에 걸친 구간은 모두 start <= center <= as_of → end 만 보면 된다.
+            for iv in node.by_end_desc:
+                if iv.end <= as_of:
+                    break
+                out.append(iv.record)
+            node = node.right
+
+
+@dataclass
+class _MarketIndex:
+    tree: _Node | None
+    starts: list[str] = field(default_factory=list)
+    start_intervals: list[_Interval] = field(default_factory=list)
+    ends: list[str] = field(default_factory=list)
+    end_intervals: list[_Interval] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, intervals: list[_Interval]) -> "_MarketIndex":
+        by_start = sorted(intervals, key=lambda iv: iv.start)
+        by_end = sorted(intervals, key=lambda iv: iv.end)
+        return cls(
+            tree=_build_tree(intervals),
+            starts=[iv.start for iv in by_start],
+            start_intervals=by_start,
+            ends=[iv.end for iv in by_end],
+            end_intervals=by_end,
+        )
+
+    def listed_between(self, after: str, upto: str) -> Iterator[_Interval]:
+        """start 가 (after, upto] 인 구간."""
+        lo = bisect_right(self.starts, after)
+        hi = bisect_right(self.starts, upto)
+        return iter(self.start_intervals[lo:hi])
+
+    def delisted_between(self, after: str, upto: str) -> Iterator[_Interval]:
+        """end 가 (after, upto] 인 구간."""
+        lo = bisect_right(self.ends, after)
+        hi = bisect_right(self.ends, upto)
+        return iter(self.end_intervals[lo:hi])
+
+
+@dataclass(frozen=True)
+class UniverseDelta:
+    """연속 날짜 사이 universe 변화. 첫 날짜는 전체 스냅샷이 added 로 온다."""
+
+    as_of: str
+    added: list[PointInTimeUniverseRecord]
+    removed: list[PointInTimeUniverseRecord]
+
+
+class PointInTimeUniverseIndex:
+    """정규화된 PIT 레코드 위의 시장별 상장 구간 인덱스."""
+
+    def __init__(self, records: Iterable[PointInTimeUniverseRecord]):
+        by_market: dict[str, list[_Interval]] = {}
+        for record in _dedupe_preferring_history(records):
+            start = _compact_date(record.listing_date) or _MIN_DATE
+            end = _compact_date(record.delisting_date) or _MAX_DATE
+            if end <= start:
+                # 상장일 당일 이전에 상폐 — 어떤 날짜에도 포함되지 않는다.
+                continue
+            by_market.setdefault(record.market, []).append(_Interval(start, end, record))
+        self._markets = {m: _MarketIndex.build(ivs) for m, ivs in by_market.items()}
+
+    def markets(self) -> set[str]:
+        return set(self._markets.keys())
+
+    def _selected(self, markets: Sequence[str] | None) -> list[_MarketIndex]:
+        if not markets:
+            return list(self._markets.values())
+        return [self._markets[m] for m in dict.fromkeys(markets) if m in self._markets]
+
+    def snapshot(
+        self,
+        as_of_date: str,
+        *,
+        markets: Sequence[str] | None = ("KOSPI", "KOSDAQ"),
+        exclude_spac: bool = False,
+    ) -> list[PointInTimeUniverseRecord]:
+        """`build_point_in_time_snapshot` 과 같은 결과(심볼 정렬)를 인덱스로 계산한다."""
+        as_of = _compact_date(as_of_date)
+        if not as_of:
+            raise ValueError("as_of_date must be YYYYMMDD or YYYY-MM-DD")
+        found: list[PointInTimeUniverseRecord] = []
+        for index in self._selected(markets):
+            _stab(index.tree, as_of, found)
+        if exclude_spac:
+            found = [r for r in found if not _is_spac(r)]
+        found.sort(key=lambda r: r.symbol)
+        return found
+
+    def listed_symbols(
+        self,
+        as_of_date: str,
+        *,
+        markets: Sequence[str] | None = None,
+    ) -> set[str]:
+        """as_of 날짜에 상장 중인 종목코드 집합 (markets=None 이면 전체 시장)."""
+        as_of = _compact_date(as_of_date)
+        if not as_of:
+            return set()
+        found: list[PointInTimeUniverseRecord] = []
+        for index in self._selected(markets):
+            _stab(index.tree, as_of, found)
+        return {r.symbol for r in found}
+
+    def iter_deltas(
+        self,
+        dates: Iterable[str],
+        *,
+        markets: Sequence[str] | None = ("KOSPI", "KOSDAQ"),
+        exclude_spac: bool = False,
+    ) -> Iterator[UniverseDelta]:
+        """오름차순 dates 를 따라 universe 증감분을 흘려보낸다.
+
+        D1 → D2 사이에 added 는 start ∈ (D1, D2] 이면서 end > D2 인 구간,
+        removed 는 end ∈ (D1, D2] 이면서 start <= D1 인 구간이다 — 둘 다 bisect 로
+        구간 이벤트만 읽으므로 날짜당 비용은 O(log n + 변화량).
+        """
+        selected = self._selected(markets)
+        prev = ""
+        for raw in dates:
+            as_of = _compact_date(raw)
+            if not as_of:
+                raise ValueError("dates must be YYYYMMDD or YYYY-MM-DD")
+            if not prev:
+                added = self.snapshot(as_of, markets=markets, exclude_spac=exclude_spac)
+                yield UniverseDelta(as_of=as_of, added=added, removed=[])
+                prev = as_of
+                continue
+            if as_of < prev:
+                raise ValueError("dates must be in ascending order")
+            added = []
+            removed = []
+            for index in selected:
+                added.extend(iv.record for iv in index.listed_between(prev, as_of) if iv.end > as_of)
+                removed.extend(iv.record for iv in index.delisted_between(prev, as_of) if iv.start <= prev)
+            if exclude_spac:
+                added = [r for r in added if not _is_spac(r)]
+                removed = [r for r in removed if not _is_spac(r)]
+            added.sort(key=lambda r: r.symbol)
+            removed.sort(key=lambda r: r.symbol)
+            yield UniverseDelta(as_of=as_of, added=added, removed=removed)
+            prev = as_of
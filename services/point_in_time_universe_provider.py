@@ -15,11 +15,8 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Mapping
 
-from services.point_in_time_universe_service import (
-    PointInTimeUniverseRecord,
-    _compact_date,
-    _is_listed_on,
-)
+from services.point_in_time_universe_service import PointInTimeUniverseRecord
+from services.point_in_time_universe_index import PointInTimeUniverseIndex
 
 _RECORD_FIELDS = {f for f in PointInTimeUniverseRecord.__dataclass_fields__}
 
@@ -72,6 +69,8 @@ class PointInTimeUniverseProvider:
             if existing is None or (existing.source != "delisted" and record.source == "delisted"):
                 by_symbol[record.symbol] = record
         self._by_symbol = by_symbol
+        # 날짜별 질의는 구간 인덱스로 — 레코드 전체 순회를 날짜마다 반복하지 않는다.
+        self._index = PointInTimeUniverseIndex(by_symbol.values())
 
     @classmethod
     def from_records_dicts(cls, dicts: Iterable[Mapping[str, Any]]) -> "PointInTimeUniverseProvider":
@@ -83,26 +82,21 @@ class PointInTimeUniverseProvider:
 
     def listed_codes_as_of(self, date_ymd: str) -> set[str]:
         """date_ymd(YYYYMMDD 또는 YYYY-MM-DD) 시점에 상장돼 있던 종목코드 집합."""
-        as_of_compact = _compact_date(date_ymd)
-        if not as_of_compact:
-            return set()
-        return {
-            symbol
-            for symbol, record in self._by_symbol.items()
-            if _is_listed_on(record, as_of_compact)
-        }
+        return self._index.listed_symbols(date_ymd, markets=None)
 
     def delisted_codes_as_of(self, date_ymd: str) -> set[str]:
         """date_ymd 시점에 상장 중이면서 source=='delisted' 인(=결국 상폐될) 종목코드."""
-        as_of_compact = _compact_date(date_ymd)
-        if not as_of_compact:
-            return set()
         return {
             symbol
-            for symbol, record in self._by_symbol.items()
-            if record.source == "delisted" and _is_listed_on(record, as_of_compact)
+            for symbol in self._index.listed_symbols(date_ymd, markets=None)
+            if self._by_symbol[symbol].source == "delisted"
         }
 
+    @property
+    def index(self) -> PointInTimeUniverseIndex:
+        """시장별 스냅샷·증감분 스트리밍용 구간 인덱스."""
+        return self._index
+
     def all_codes(self) -> set[str]:
         return set(self._by_symbol.keys())
 
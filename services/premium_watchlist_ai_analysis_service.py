@@ -5,6 +5,7 @@ import asyncio
 import logging
 from typing import Any
 
+from core.lazy_service import aresolve_lazy
 from services.ai_signal import extract_signal
 
 
@@ -112,6 +113,7 @@ class PremiumWatchlistAiAnalysisService:
 
     @staticmethod
     async def _optional_call(target, method_name: str, *args, **kwargs) -> Any:
+        target = await aresolve_lazy(target)  # 뉴스 수집기 등 지연 생성 프록시는 루프 밖에서 만든다
         method = getattr(target, method_name, None) if target is not None else None
         if method is None:
             return None
@@ -0,0 +1,154 @@
+"""PriceRequestCoalescer — 단건 현재가 REST 요청을 복수종목 시세 TR 로 묶는다.
+
+전략 `_check_entry`·청산 점검·웹 라우트는 종목마다 `StockQueryService.get_current_price`
+를 부른다. snapshot 이 없거나 오래된 종목은 종목당 `quotation_price` 예산을 1건씩 쓰는데,
+`asyncio.gather` 로 동시에 들어오는 요청이라면 `get_multi_price`(최대 30종목) 1회로
+대체할 수 있다.
+
+- 첫 요청이 들어오면 `window_sec` 동안(또는 `max_batch` 종목이 찰 때까지) 모은 뒤
+  batch fetch 를 1회 호출하고, 결과를 종목별 waiter 에게 나눠준다.
+- 같은 종목을 동시에 기다리는 waiter 는 하나의 future 를 공유한다.
+- 종목 단위로 격리한다: batch 응답에 없는 종목만 `None` 을 받고, batch 자체가 실패하면
+  모든 waiter 가 `None` 을 받는다. `None` 을 받은 호출자는 기존 단건 경로로 fallback 한다.
+- waiter 취소는 공유 future 에 전파하지 않는다 (`asyncio.shield`).
+
+설계 가정: 단일 event loop. batch fetch 는 `{code: item}` 또는 실패 시 `None` 을 돌려준다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+BatchFetch = Callable[[List[str]], Awaitable[Optional[Dict[str, dict]]]]
+
+
+class PriceRequestCoalescer:
+    """짧은 window 동안 들어온 단건 요청을 모아 batch fetch 1회로 처리한다."""
+
+    def __init__(
+        self,
+        fetch_batch: BatchFetch,
+        *,
+        window_sec: float = 0.01,
+        max_batch: int = 30,
+        clock: Callable[[], float] = time.monotonic,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._fetch_batch = fetch_batch
+        self._window_sec = max(0.0, float(window_sec))
+        self._max_batch = max(1, int(max_batch))
+        self._clock = clock
+        self._logger = logger or logging.getLogger(__name__)
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._enqueued_at: Dict[str, float] = {}
+        self._waiters: Dict[str, int] = {}
+        self._timer: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+        self._stats: Dict[str, float] = {
+            "requests": 0,          # fetch() 호출 수
+            "deduplicated": 0,      # 이미 대기 중인 종목에 합류한 요청
+            "batch_calls": 0,       # batch fetch 호출 수
+            "batched_codes": 0,     # batch 로 보낸 종목 수
+            "resolved": 0,          # batch 결과를 받은 waiter 수
+            "fallbacks": 0,         # None 을 받은 waiter 수 (단건 fallback 대상)
+            "batch_failures": 0,    # batch fetch 실패(예외/None) 횟수
+            "added_latency_ms_total": 0.0,  # 종목별 window 대기 시간 합
+            "added_latency_ms_max": 0.0,
+        }
+
+    @property
+    def max_batch(self) -> int:
+        return self._max_batch
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        """카운터 사본. calls_saved = batch 로 해결된 waiter 수 - batch 호출 수."""
+        snap = dict(self._stats)
+        snap["calls_saved"] = max(0, int(snap["resolved"]) - int(snap["batch_calls"]))
+        batched = int(snap["batched_codes"])
+        snap["added_latency_ms_avg"] = (
+            round(snap["added_latency_ms_total"] / batched, 3) if batched else 0.0
+        )
+        return snap
+
+    async def fetch(self, code: str) -> Optional[dict]:
+        """code 의 batch 결과 item. batch 실패·응답 누락이면 None."""
+        loop = asyncio.get_running_loop()
+        self._stats["requests"] += 1
+        future = self._pending.get(code)
+        if future is None:
+            future = loop.create_future()
+            self._pending[code] = future
+            self._enqueued_at[code] = self._clock()
+            self._waiters[code] = 1
+            if len(self._pending) >= self._max_batch:
+                self._dispatch(loop)
+            elif self._timer is None:
+                self._timer = loop.create_task(self._dispatch_after_window())
+        else:
+            self._stats["deduplicated"] += 1
+            self._waiters[code] = self._waiters.get(code, 0) + 1
+        return await asyncio.shield(future)
+
+    async def flush(self) -> None:
+        """대기 중인 요청을 즉시 batch 로 보내고 진행 중인 batch 가 끝날 때까지 기다린다."""
+        if self._pending:
+            self._dispatch(asyncio.get_running_loop())
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    # ── 내부 ──────────────────────────────────────────────────────────
+
+    async def _dispatch_after_window(self) -> None:
+        if self._window_sec > 0:
+            await asyncio.sleep(self._window_sec)
+        self._timer = None
+        if self._pending:
+            self._dispatch(asyncio.get_running_loop())
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        batch = self._pending
+        enqueued_at = self._enqueued_at
+        waiters = self._waiters
+        self._pending, self._enqueued_at, self._waiters = {}, {}, {}
+
+        now = self._clock()
+        for started in enqueued_at.values():
+            waited_ms = max(0.0, (now - started) * 1000.0)
+            self._stats["added_latency_ms_total"] += waited_ms
+            if waited_ms > self._stats["added_latency_ms_max"]:
+                self._stats["added_latency_ms_max"] = waited_ms
+
+        task = loop.create_task(self._run_batch(batch, waiters))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: Dict[str, asyncio.Future], waiters: Dict[str, int]) -> None:
+        codes = list(batch.keys())
+        self._stats["batch_calls"] += 1
+        self._stats["batched_codes"] += len(codes)
+        items: Optional[Dict[str, dict]] = None
+        try:
+            items = await self._fetch_batch(codes)
+        except Exception as e:
+            self._logger.debug({"event": "price_coalesce_batch_failed", "count": len(codes), "error": str(e)})
+            items = None
+        if items is None:
+            self._stats["batch_failures"] += 1
+            items = {}
+
+        for code, future in batch.items():
+            item = items.get(code)
+            count = waiters.get(code, 1)
+            if item is None:
+                self._stats["fallbacks"] += count
+            else:
+                self._stats["resolved"] += count
+            if not future.done():
+                future.set_result(item)
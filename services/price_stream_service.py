@@ -3,7 +3,7 @@
 실시간 체결가 스트림 소비 서비스.
 
 역할:
-  - WebSocket 체결가(H0UNCNT0 / H0STCNT0) 틱 수신 → 최신가 캐시 갱신
+  - WebSocket 체결가(H0UNCNT0 / H0STCNT0) 틱 수신 → 최신가 테이블(LatestPriceTable) 제자리 갱신
   - StockRepository.update_realtime_data() 호출 (TTL 없이 최신가 즉시 반영)
 
 StreamingService와의 역할 구분:
@@ -22,6 +22,7 @@ import time
 from typing import Dict, List, Optional
 
 from common.market_snapshot import ConclusionSnapshot, MarketSnapshot
+from repositories.latest_price_table import LatestPriceTable, PriceQuote
 from repositories.stock_repository import StockRepository
 from services.notification_service import NotificationCategory, NotificationLevel
 
@@ -48,7 +49,11 @@ class PriceStreamService:
         self._event_router = event_router
         self._execution_strength_recorder = execution_strength_recorder
         self._orderbook_recorder = orderbook_recorder
-        self._latest_prices: Dict[str, dict] = {}
+        # StockRepository 와 같은 테이블을 공유한다 (주입된 repo 가 테이블을 안 주면 자체 생성)
+        shared_table = getattr(stock_repo, "latest_prices", None)
+        self._prices: LatestPriceTable = (
+            shared_table if isinstance(shared_table, LatestPriceTable) else LatestPriceTable()
+        )
         self._latest_conclusions: Dict[str, dict] = {}  # code → conclusion snapshot dict
         self._sse_queues: Dict[tuple, List[asyncio.Queue]] = {}  # (code, exchange) → SSE 구독 큐 목록
         self._last_tick_ts: Dict[str, float] = {}
@@ -131,7 +136,7 @@ class PriceStreamService:
         """
         StreamingService로부터 'realtime_price' 이벤트를 수신한다.
 
-        1. 내부 최신가 캐시(_latest_prices) 갱신
+        1. 최신가 테이블(LatestPriceTable) 슬롯 갱신
         2. StockRepository.update_realtime_data() 즉시 반영
         """
         stock_code = realtime_data.get('유가증권단축종목코드')
@@ -203,43 +208,33 @@ class PriceStreamService:
             except Exception as e:
                 self._logger.warning(f"최우선 호가 기록 실패: code={stock_code}, error={e}")
 
-        cum_vol = realtime_data.get('누적거래량', '0')
-        try:
-            vol_int = int(cum_vol) if cum_vol and cum_vol != 'N/A' else 0
-        except (ValueError, TypeError):
-            vol_int = 0
-
-        cum_tr_pbmn = realtime_data.get('누적거래대금', '0')
-        try:
-            tr_pbmn_int = int(cum_tr_pbmn) if cum_tr_pbmn and cum_tr_pbmn != 'N/A' else 0
-        except (ValueError, TypeError):
-            tr_pbmn_int = 0
-
-        def _sf(val: str, default: float = 0.0) -> Optional[float]:
-            try:
-                return float(val) if val and val != 'N/A' else None
-            except (ValueError, TypeError):
-                return None
-
-        self._latest_prices[stock_code] = {
-            "price": current_price,
-            "change": realtime_data.get('전일대비', '0'),
-            "rate": realtime_data.get('전일대비율', '0.00'),
-            "sign": realtime_data.get('전일대비부호', '3'),
-            "acml_vol": vol_int,
-            "acml_tr_pbmn": tr_pbmn_int,
-            "high": _sf(realtime_data.get('주식최고가', '')),
-            "low": _sf(realtime_data.get('주식최저가', '')),
-            "open": _sf(realtime_data.get('주식시가', '')),
-            "received_at": now_ts,
-            "latency_sec": latency_sec,
-            "quality_status": quality_status,
-            "quality_reason": "websocket",
-        }
+        price_f = self._parse_float(current_price)
+        if price_f is None:
+            self._tick_ingest_malformed[stock_code] = self._tick_ingest_malformed.get(stock_code, 0) + 1
+            return
+        vol_int = self._parse_int(realtime_data.get('누적거래량'))
+        self._prices.write(
+            stock_code,
+            price_f,
+            change=self._parse_float(realtime_data.get('전일대비')) or 0.0,
+            rate=self._parse_float(realtime_data.get('전일대비율')) or 0.0,
+            sign=realtime_data.get('전일대비부호') or '3',
+            acml_vol=vol_int,
+            acml_tr_pbmn=self._parse_int(realtime_data.get('누적거래대금')),
+            high=self._parse_float(realtime_data.get('주식최고가')),
+            low=self._parse_float(realtime_data.get('주식최저가')),
+            open=self._parse_float(realtime_data.get('주식시가')),
+            bid=self._parse_float(realtime_data.get('매수호가1')) or None,
+            ask=self._parse_float(realtime_data.get('매도호가1')) or None,
+            received_at=now_ts,
+            latency_sec=latency_sec,
+            quality_status=quality_status,
+            quality_reason="websocket",
+        )
 
         try:
             self._stock_repo.update_realtime_data(
-                stock_code, float(current_price), vol_int,
+                stock_code, price_f, vol_int,
                 rate=realtime_data.get('전일대비율'),
             )
         except Exception as e:
@@ -265,7 +260,7 @@ class PriceStreamService:
 
         if self._event_router is not None:
             try:
-                snapshot = dict(self._latest_prices[stock_code])
+                snapshot = self._prices.read(stock_code).to_legacy_dict()
                 snapshot["code"] = stock_code
                 snapshot["snapshot_ts"] = now_ts
                 self._schedule_background_task(
@@ -283,15 +278,38 @@ class PriceStreamService:
                 self._logger.warning(f"StrategyEventRouter dispatch 실패: {e}")
 
     def get_market_snapshot(self, code: str) -> Optional[MarketSnapshot]:
-        """메모리 캐시에서 MarketSnapshot 을 반환한다.
+        """최신가 테이블에서 MarketSnapshot 을 반환한다.
 
-        snapshot 이 없으면 None. 타입 정보가 필요 없는 기존 경로는 get_cached_price() 사용.
+        snapshot 이 없으면 None. 필드 몇 개만 필요한 경로는 get_price_quote() 가 더 가볍다.
         """
-        cached = self._latest_prices.get(code)
-        if cached is None:
+        quote = self._prices.read(code)
+        if quote is None:
             return None
-        source = "websocket" if cached.get("quality_reason") == "websocket" else "rest"
-        return MarketSnapshot.from_legacy_dict(code, cached, source=source)
+        return MarketSnapshot(
+            code=code,
+            price=quote.price,
+            change=quote.change,
+            rate=quote.rate,
+            sign=quote.sign,
+            acml_vol=quote.acml_vol,
+            acml_tr_pbmn=quote.acml_tr_pbmn,
+            high=quote.high,
+            low=quote.low,
+            open=quote.open,
+            received_at=quote.received_at,
+            latency_sec=quote.latency_sec,
+            quality_status=quote.quality_status,
+            quality_reason=quote.quality_reason,
+            source="websocket" if quote.quality_reason == "websocket" else "rest",
+        )
+
+    def get_price_quote(self, code: str) -> Optional[PriceQuote]:
+        """최신가 테이블의 일관된 스냅샷(수치 필드 파싱 완료). 없으면 None."""
+        return self._prices.read(code)
+
+    @property
+    def latest_prices(self) -> LatestPriceTable:
+        return self._prices
 
     @staticmethod
     def _is_upper_limit_tick(realtime_data: dict) -> bool:
@@ -334,8 +352,12 @@ class PriceStreamService:
         )
 
     def get_cached_price(self, code: str) -> Optional[dict]:
-        """메모리 캐시에서 최신가 정보를 반환한다."""
-        return self._latest_prices.get(code)
+        """최신가 정보를 기존 dict 포맷으로 반환한다 (웹 라우트 등 하위호환 경로).
+
+        호출마다 dict 를 새로 만든다. 수치 비교만 하는 경로는 get_price_quote() 를 쓴다.
+        """
+        quote = self._prices.read(code)
+        return quote.to_legacy_dict() if quote is not None else None
 
     def cache_price_snapshot(
         self,
@@ -350,50 +372,32 @@ class PriceStreamService:
         low: Optional[str] = None,
         open_price: Optional[str] = None,
         evaluate_favorite_alert: bool = True,
+        quality_reason: str = "rest_snapshot",
     ) -> None:
-        """REST 스냅샷 현재가를 최신가 캐시에 반영한다."""
+        """REST 스냅샷 현재가를 최신가 캐시에 반영한다. quality_reason 은 출처 표기 (rest_snapshot/rest_poll)."""
         if not code or not price:
             return
 
-        try:
-            vol_int = int(volume) if volume and volume != 'N/A' else 0
-        except (ValueError, TypeError):
-            vol_int = 0
-
-        try:
-            tr_pbmn_int = (
-                int(acml_tr_pbmn) if acml_tr_pbmn and acml_tr_pbmn != 'N/A' else 0
-            )
-        except (ValueError, TypeError):
-            tr_pbmn_int = 0
-
-        def _parse_opt(v: Optional[str]) -> Optional[float]:
-            if not v or v == 'N/A':
-                return None
-            try:
-                return float(v)
-            except (ValueError, TypeError):
-                return None
-
-        now_ts = time.time()
-        self._latest_prices[code] = {
-            "price": price,
-            "change": change,
-            "rate": rate,
-            "sign": sign,
-            "acml_vol": vol_int,
-            "acml_tr_pbmn": tr_pbmn_int,
-            "high": _parse_opt(high),
-            "low": _parse_opt(low),
-            "open": _parse_opt(open_price),
-            "received_at": now_ts,
-            "latency_sec": 0.0,
-            "quality_status": "ok",
-            "quality_reason": "rest_snapshot",
-        }
+        price_f = self._parse_float(price)
+        if price_f is None:
+            return
+        vol_int = self._parse_int(volume)
+        self._prices.write(
+            code,
+            price_f,
+            change=self._parse_float(change) or 0.0,
+            rate=self._parse_float(rate) or 0.0,
+            sign=sign or '3',
+            acml_vol=vol_int,
+            acml_tr_pbmn=self._parse_int(acml_tr_pbmn),
+            high=self._parse_float(high),
+            low=self._parse_float(low),
+            open=self._parse_float(open_price),
+            quality_reason=quality_reason,
+        )
 
         try:
-            self._stock_repo.update_realtime_data(code, float(price), vol_int, rate=rate)
+            self._stock_repo.update_realtime_data(code, price_f, vol_int, rate=rate)
         except Exception as e:
             self._logger.warning(f"StockRepository 현재가 스냅샷 캐시 갱신 실패: {e}")
 
@@ -413,21 +417,60 @@ class PriceStreamService:
             except Exception as e:
                 self._logger.warning(f"관심종목 REST 가격 알림 평가 실패: {e}")
 
+    def export_latest_prices(self) -> Dict[str, dict]:
+        """종목별 최신가를 dict 포맷으로 반환한다 (웜 리스타트 스냅샷용)."""
+        exported = {}
+        for code in self._prices.codes():
+            quote = self._prices.read(code)
+            if quote is not None:
+                exported[code] = quote.to_legacy_dict()
+        return exported
+
+    def restore_latest_prices(self, entries: Dict[str, dict]) -> int:
+        """스냅샷의 종목별 최신가를 최신가 캐시에 되살린다.
+
+        이미 받은 틱이 있으면 덮지 않는다. received_at 은 원래 수신 시각을 유지하고
+        tick 수신 시각(_last_tick_ts)은 건드리지 않아 stale 판정은 실제 틱 기준으로 남는다.
+        """
+        restored = 0
+        for code, entry in entries.items():
+            if not code or code in self._prices:
+                continue
+            price_f = self._parse_float(entry.get("price"))
+            if not price_f:
+                continue
+            self._prices.write(
+                code,
+                price_f,
+                change=self._parse_float(entry.get("change")) or 0.0,
+                rate=self._parse_float(entry.get("rate")) or 0.0,
+                sign=str(entry.get("sign") or "3"),
+                acml_vol=self._parse_int(entry.get("acml_vol")),
+                acml_tr_pbmn=self._parse_int(entry.get("acml_tr_pbmn")),
+                high=self._parse_float(entry.get("high")),
+                low=self._parse_float(entry.get("low")),
+                open=self._parse_float(entry.get("open")),
+                received_at=self._parse_float(entry.get("received_at")) or 0.0,
+                latency_sec=self._parse_float(entry.get("latency_sec")) or 0.0,
+                quality_status=str(entry.get("quality_status") or "ok"),
+                quality_reason="warm_restart_snapshot",
+            )
+            restored += 1
+        return restored
+
     def get_liquidity_snapshot(self, code: str) -> Optional[dict]:
         """체결틱 스냅샷에서 거래량/거래대금/수신시각을 반환한다.
 
         반환 dict: {'acml_vol': int, 'acml_tr_pbmn': int, 'received_at': float}
-        snapshot 이 없거나 acml 필드가 미저장(예: 옛 캐시) 인 경우 None.
+        snapshot 이 없으면 None.
         """
-        cached = self._latest_prices.get(code)
-        if not cached:
-            return None
-        if 'acml_vol' not in cached or 'acml_tr_pbmn' not in cached:
+        quote = self._prices.read(code)
+        if quote is None:
             return None
         return {
-            'acml_vol': cached['acml_vol'],
-            'acml_tr_pbmn': cached['acml_tr_pbmn'],
-            'received_at': cached.get('received_at', 0.0),
+            'acml_vol': quote.acml_vol,
+            'acml_tr_pbmn': quote.acml_tr_pbmn,
+            'received_at': quote.received_at,
         }
 
     def mark_subscription_requested(self, code: str) -> None:
@@ -439,7 +482,7 @@ class PriceStreamService:
         """구독 해제 시 감시용 상태를 정리한다."""
         self._subscription_requested_ts.pop(code, None)
         self._last_tick_ts.pop(code, None)
-        self._latest_prices.pop(code, None)
+        self._prices.remove(code)
         self._latest_conclusions.pop(code, None)
 
     def get_last_tick_ts(self, code: str) -> float:
@@ -476,6 +519,24 @@ class PriceStreamService:
 
         return sorted(stale_codes)
 
+    @staticmethod
+    def _parse_float(value) -> Optional[float]:
+        if value is None or value == '' or value == 'N/A':
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _parse_int(value) -> int:
+        if not value or value == 'N/A':
+            return 0
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return 0
+
     @staticmethod
     def _tick_exchange(realtime_data: dict) -> str:
         """틱이 어느 거래소 스트림에서 왔는지 반환한다 (태그가 없으면 통합)."""
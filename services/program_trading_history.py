@@ -0,0 +1,337 @@
+# services/program_trading_history.py
+"""
+프로그램매매 당일 히스토리 — 종목별 열 지향(columnar) 메모리 저장소.
+
+기존에는 수신한 원본 dict 를 종목별 list 에 그대로 쌓았다. 구독 종목 수십 개 × 장중 수만 틱이면
+dict(키 문자열·값 문자열 포함) 하나가 1KB 를 넘어 메모리가 수백 MB 까지 커지고, 차트 재접속
+시 SSE replay 가 틱을 하나씩 재직렬화했다. 여기서는 종목마다 필드별 numpy 열을 미리 잡아 두고
+(용량이 차면 2배로 확장) 틱당 ~110 bytes 로 보관하며, 차트용으로는 1s/10s/60s 버킷 집계
+(시가/고가/저가/종가 + 누적값의 버킷 마지막 값)를 since 커서와 함께 돌려준다.
+
+하위 호환: ProgramTradingHistory 는 code → ProgramTradingSeries 매핑처럼 동작하고,
+시리즈의 [i] / 반복은 load_today_history() 와 같은 키의 dict 를 재구성해 돌려준다.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+INITIAL_CAPACITY = 1024
+DOWNSAMPLE_BUCKETS = (1, 10, 60)
+
+# 열 이름 → (dtype, 원본 dict 키). ts 는 수신 시각(epoch 초)이라 원본 키가 없다.
+_COLUMNS: Dict[str, tuple] = {
+    "ts": (np.float64, None),
+    "trade_time": (np.int32, "주식체결시간"),
+    "price": (np.int64, "price"),
+    "rate": (np.float64, "rate"),
+    "change": (np.int64, "change"),
+    "sign": (np.int8, "sign"),
+    "sell_vol": (np.int64, "매도체결량"),
+    "sell_amt": (np.int64, "매도거래대금"),
+    "buy_vol": (np.int64, "매수2체결량"),
+    "buy_amt": (np.int64, "매수2거래대금"),
+    "net_vol": (np.int64, "순매수체결량"),
+    "net_amt": (np.int64, "순매수거래대금"),
+    "sell_rem": (np.int64, "매도호가잔량"),
+    "buy_rem": (np.int64, "매수호가잔량"),
+    "net_rem": (np.int64, "전체순매수호가잔량"),
+}
+
+# 누적값(및 마지막 틱 표시값)이라 버킷의 마지막 값을 그대로 쓰는 열
+_LAST_VALUE_COLUMNS = (
+    "trade_time", "rate",
+    "sell_vol", "buy_vol", "net_vol", "net_amt", "sell_rem", "buy_rem",
+)
+REPLAY_BUCKET_SEC = 60  # SSE replay·차트 첫 로드 — 차트가 분 단위로 그려 1분 버킷이면 충분하다
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(str(value).replace(",", "")))
+        except (TypeError, ValueError):
+            return 0
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _encode_trade_time(value) -> int:
+    """'HHMMSS' → 정수. 비어 있거나 숫자가 아니면 -1 (재구성 시 빈 문자열)."""
+    digits = "".join(ch for ch in str(value or "") if ch.isdigit())
+    return int(digits[:6]) if digits else -1
+
+
+class ProgramTradingSeries:
+    """한 종목의 당일 틱 열 묶음. append 는 O(1) 상각, 조회는 길이 n 까지의 뷰로 복사 없이 읽는다."""
+
+    __slots__ = ("code", "_cols", "_size")
+
+    def __init__(self, code: str, capacity: int = INITIAL_CAPACITY):
+        self.code = code
+        self._cols = {name: np.zeros(capacity, dtype=dtype) for name, (dtype, _) in _COLUMNS.items()}
+        self._size = 0
+
+    # ── 쓰기 ────────────────────────────────────────────────────────
+
+    def _grow(self) -> None:
+        capacity = max(INITIAL_CAPACITY, len(self._cols["ts"]) * 2)
+        for name, col in self._cols.items():
+            grown = np.zeros(capacity, dtype=col.dtype)
+            grown[: self._size] = col[: self._size]
+            self._cols[name] = grown
+
+    def append(self, data: dict, received_at: float) -> None:
+        if self._size >= len(self._cols["ts"]):
+            self._grow()
+        i = self._size
+        cols = self._cols
+        cols["ts"][i] = received_at
+        cols["trade_time"][i] = _encode_trade_time(data.get("주식체결시간"))
+        cols["rate"][i] = _to_float(data.get("rate", 0.0))
+        cols["sign"][i] = _to_int(data.get("sign", 0))
+        for name in ("price", "change", "sell_vol", "sell_amt", "buy_vol", "buy_amt",
+                     "net_vol", "net_amt", "sell_rem", "buy_rem", "net_rem"):
+            cols[name][i] = _to_int(data.get(_COLUMNS[name][1], 0))
+        self._size = i + 1
+
+    # ── 조회 ────────────────────────────────────────────────────────
+
+    def column(self, name: str) -> np.ndarray:
+        """길이 n 까지의 읽기 전용 뷰 (복사 없음)."""
+        view = self._cols[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._size):
+            yield self._row(i)
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        cols = self._cols
+        trade_time = int(cols["trade_time"][i])
+        sign = int(cols["sign"][i])
+        row: Dict[str, Any] = {
+            "유가증권단축종목코드": self.code,
+            "주식체결시간": f"{trade_time:06d}" if trade_time >= 0 else "",
+            "price": int(cols["price"][i]),
+            "rate": float(cols["rate"][i]),
+            "change": int(cols["change"][i]),
+            "sign": str(sign) if sign else "",
+        }
+        for name in ("sell_vol", "sell_amt", "buy_vol", "buy_amt", "net_vol", "net_amt",
+                     "sell_rem", "buy_rem", "net_rem"):
+            row[_COLUMNS[name][1]] = int(cols[name][i])
+        return row
+
+    def stream_rows(self) -> Iterator[list]:
+        """SSE replay 용 12필드 배열 — on_data_received 브로드캐스트 배열과 같은 순서."""
+        n = self._size
+        cols = {name: col[:n].tolist() for name, col in self._cols.items()}
+        for i in range(n):
+            trade_time = cols["trade_time"][i]
+            sign = cols["sign"][i]
+            yield [
+                self.code,
+                f"{trade_time:06d}" if trade_time >= 0 else "",
+                cols["price"][i],
+                cols["rate"][i],
+                cols["change"][i],
+                str(sign) if sign else "",
+                cols["sell_vol"][i],
+                cols["buy_vol"][i],
+                cols["net_vol"][i],
+                cols["net_amt"][i],
+                cols["sell_rem"][i],
+                cols["buy_rem"][i],
+            ]
+
+    def memory_bytes(self) -> int:
+        return sum(col.nbytes for col in self._cols.values())
+
+    def downsample(self, bucket_sec: int, since: Optional[float] = None) -> Dict[str, Any]:
+        """수신 시각 기준 bucket_sec 버킷 집계.
+
+        가격은 버킷의 시가/고가/저가/종가(0원 틱은 제외), 누적값(순매수·잔량·등락률)은 버킷 마지막
+        값이다. since 가 주어지면 since 가 속한 버킷부터 돌려준다. next_since 는 마지막 버킷의
+        시작 시각 — 그 버킷은 아직 채워지는 중일 수 있어 다음 폴링에서 다시 받아 덮어쓴다.
+        """
+        if bucket_sec <= 0:
+            raise ValueError("bucket_sec must be positive")
+        ts = self.column("ts")
+        start = 0
+        if since is not None:
+            start = int(np.searchsorted(ts, np.floor(since / bucket_sec) * bucket_sec, side="left"))
+        empty = {"t": [], "open": [], "high": [], "low": [], "close": [], "count": [],
+                 **{name: [] for name in _LAST_VALUE_COLUMNS}}
+        result: Dict[str, Any] = {"code": self.code, "bucket_sec": bucket_sec, "next_since": since}
+        if start >= self._size:
+            return {**result, **empty}
+
+        buckets = np.floor(ts[start:] / bucket_sec).astype(np.int64)
+        boundaries = np.flatnonzero(np.diff(buckets)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(buckets)])) - 1
+
+        price = self.column("price")[start:]
+        valid = price > 0
+        # 버킷 안의 0원 틱(가격 미수신)을 고가/저가 계산에서 빼고, 전부 0원이면 0 으로 둔다.
+        high = np.maximum.reduceat(np.where(valid, price, 0), starts)
+        low = np.minimum.reduceat(np.where(valid, price, np.iinfo(np.int64).max), starts)
+        low[low == np.iinfo(np.int64).max] = 0
+        # 시가/종가: 버킷 안 첫/마지막 유효 가격 (없으면 0)
+        valid_pos = np.where(valid, np.arange(len(price)), -1)
+        last_valid = np.maximum.reduceat(valid_pos, starts)
+        first_valid = np.minimum.reduceat(np.where(valid, np.arange(len(price)), len(price)), starts)
+        close = np.where(last_valid >= 0, price[np.clip(last_valid, 0, None)], 0)
+        open_ = np.where(first_valid < len(price), price[np.clip(first_valid, None, len(price) - 1)], 0)
+
+        times = buckets[starts] * bucket_sec
+        result.update({
+            "t": times.tolist(),
+            "open": open_.tolist(),
+            "high": high.tolist(),
+            "low": low.tolist(),
+            "close": close.tolist(),
+            "count": (ends - starts + 1).tolist(),
+            "next_since": float(times[-1]),
+        })
+        for name in _LAST_VALUE_COLUMNS:
+            result[name] = self.column(name)[start:][ends].tolist()
+        return result
+
+
+class ProgramTradingHistory:
+    """code → ProgramTradingSeries. 기존 dict[str, list[dict]] 사용처와 호환되는 최소 매핑 인터페이스."""
+
+    def __init__(self):
+        self._series: Dict[str, ProgramTradingSeries] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "ProgramTradingHistory":
+        """ProgramTradingRepo.load_today_history_rows() 행(code, 원본 dict, created_at)으로 복원."""
+        history = cls()
+        for code, data, created_at in rows:
+            history.append(code, data, created_at)
+        return history
+
+    def append(self, code: str, data: dict, received_at: float) -> None:
+        series = self._series.get(code)
+        if series is None:
+            series = self._series[code] = ProgramTradingSeries(code)
+        series.append(data, received_at)
+
+    def get(self, code: str, default=None):
+        return self._series.get(code, default)
+
+    def __getitem__(self, code: str) -> ProgramTradingSeries:
+        return self._series[code]
+
+    def __setitem__(self, code: str, ticks: Iterable[dict]) -> None:
+        """dict 목록으로 한 종목을 통째로 채운다 (수신 시각은 0 — 집계 대상 아님)."""
+        series = ProgramTradingSeries(code)
+        for tick in ticks:
+            series.append(tick, 0.0)
+        self._series[code] = series
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._series
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._series)
+
+    def keys(self):
+        return self._series.keys()
+
+    def items(self):
+        return self._series.items()
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def tick_count(self) -> int:
+        return sum(len(series) for series in self._series.values())
+
+    def memory_bytes(self) -> int:
+        return sum(series.memory_bytes() for series in self._series.values())
+
+
+def bucket_rows(series: Dict[str, Any]) -> Iterator[list]:
+    """downsample() 결과를 버킷당 1행의 12필드 배열로 (가격은 버킷 종가).
+
+    대비·부호는 DB 에 저장하지 않아 재시작 복원분과 맞추려고 집계하지 않는다 — 대비는 0,
+    부호는 등락률 부호로 채운다 (2 상승 / 5 하락 / 3 보합).
+    """
+    code = series["code"]
+    for i in range(len(series["t"])):
+        trade_time = series["trade_time"][i]
+        rate = series["rate"][i]
+        yield [
+            code,
+            f"{trade_time:06d}" if trade_time >= 0 else "",
+            series["close"][i],
+            rate,
+            0,
+            "2" if rate > 0 else ("5" if rate < 0 else "3"),
+            series["sell_vol"][i],
+            series["buy_vol"][i],
+            series["net_vol"][i],
+            series["net_amt"][i],
+            series["sell_rem"][i],
+            series["buy_rem"][i],
+        ]
+
+
+def replay_rows(code: str, ticks, bucket_sec: int = REPLAY_BUCKET_SEC) -> Iterator[list]:
+    """SSE replay 행. 열 저장소는 bucket_sec 버킷 집계로 줄여 보내고, dict 목록은 틱 그대로 보낸다."""
+    if isinstance(ticks, ProgramTradingSeries):
+        yield from bucket_rows(ticks.downsample(bucket_sec))
+        return
+    yield from stream_rows(code, ticks)
+
+
+def stream_rows(code: str, ticks) -> Iterator[list]:
+    """SSE replay 12필드 배열. 열 저장소면 열에서 바로, 그 외(dict 목록)는 기존 방식으로 만든다."""
+    if isinstance(ticks, ProgramTradingSeries):
+        yield from ticks.stream_rows()
+        return
+    for item in list(ticks):
+        yield [
+            code,
+            item.get('주식체결시간', ''),
+            item.get('price', 0),
+            item.get('rate', 0),
+            item.get('change', 0),
+            item.get('sign', ''),
+            item.get('매도체결량', 0),
+            item.get('매수2체결량', 0),
+            item.get('순매수체결량', 0),
+            item.get('순매수거래대금', 0),
+            item.get('매도호가잔량', 0),
+            item.get('매수호가잔량', 0),
+        ]
+
@@ -9,6 +9,7 @@ from contextlib import contextmanager
 from typing import Awaitable, Callable
 
 from repositories.program_trading_repo import ProgramTradingRepo
+from services.program_trading_history import ProgramTradingHistory
 
 
 class ProgramTradingStreamService:
@@ -39,8 +40,8 @@ class ProgramTradingStreamService:
         self.logger = logger if logger else logging.getLogger(__name__)
         self._after_market_runner = after_market_runner
 
-        # 메모리 캐시 (성능 최적화)
-        self._pt_history: dict = {}
+        # 메모리 캐시 — 종목별 열 지향 틱 저장소 (services/program_trading_history.py)
+        self._pt_history: ProgramTradingHistory = ProgramTradingHistory()
         self._last_tick_ts_by_code: dict[str, float] = {}
         self.last_data_ts = 0.0
         self._history_date = datetime.now().date().isoformat()
@@ -112,7 +113,7 @@ class ProgramTradingStreamService:
             yield conn
 
     def _load_pt_history(self):
-        self._pt_history = self._repo.load_today_history()
+        self._pt_history = ProgramTradingHistory.from_rows(self._repo.load_today_history_rows())
 
     def _ensure_current_day_history(self) -> None:
         """자정 이후 전일 메모리 tick이 오늘 데이터로 노출되지 않도록 초기화한다."""
@@ -182,8 +183,8 @@ class ProgramTradingStreamService:
         self.last_data_ts = now
         self._last_tick_ts_by_code[code] = now
 
-        # 1. 메모리 저장 (기존 프론트엔드/백엔드 호환용 원본 유지)
-        self._pt_history.setdefault(code, []).append(data)
+        # 1. 메모리 저장 (원본 dict 대신 종목별 숫자 열에 적재)
+        self._pt_history.append(code, data, now)
 
         # 2. 버퍼에 적재 (이벤트 루프 블로킹 방지) — repo에 위임
         self._repo.add_record_to_buffer(data, created_at=now)
@@ -235,6 +236,14 @@ class ProgramTradingStreamService:
         self._ensure_current_day_history()
         return self._pt_history
 
+    def get_history_series(self, code: str, bucket_sec: int, since: float | None = None) -> dict | None:
+        """종목의 당일 틱을 bucket_sec 단위로 집계한 열 지향 시계열. 이력이 없으면 None."""
+        self._ensure_current_day_history()
+        series = self._pt_history.get(code)
+        if not series:
+            return None
+        return series.downsample(bucket_sec, since=since)
+
     # ── 스냅샷 저장/로드 (repo 위임) ─────────────────────────────────
 
     def save_snapshot(self, data_dict: dict):
@@ -39,6 +39,21 @@ class RejectionDistributionService:
         key = date or datetime.now().strftime("%Y%m%d")
         self._counts[key][strategy_name][reason_code] += 1
 
+    def record_counts(
+        self,
+        strategy_name: str,
+        counts: Dict[str, int],
+        date: Optional[str] = None,
+    ) -> None:
+        """reason 별 누적 건수를 한 번에 더한다 (ScanFunnel 집계 전달용)."""
+        if not strategy_name:
+            return
+        key = date or datetime.now().strftime("%Y%m%d")
+        bucket = self._counts[key][strategy_name]
+        for reason_code, count in counts.items():
+            if reason_code and count:
+                bucket[reason_code] += count
+
     def get_distribution(self, strategy_name: str, date: str) -> Dict[str, int]:
         """{reason_code: count} 반환. 해당 날짜/전략 데이터 없으면 빈 dict."""
         return dict(self._counts.get(date, {}).get(strategy_name, {}))
@@ -119,6 +134,9 @@ class _StrategyRejectionHandler(logging.Handler):
         event = msg.get("event", "")
         if event not in _REJECTION_EVENTS:
             return
+        if msg.get("funnel_counted"):
+            # ScanFunnel 이 이미 센 거절의 샘플 로그 — 스케줄러가 funnel 집계를 record_counts 로 넘긴다
+            return
         reason = str(msg.get("reason", event))
         # logger name: "strategy.OneilPocketPivot" → "OneilPocketPivot"
         parts = record.name.split(".", 1)
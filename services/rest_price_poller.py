@@ -0,0 +1,282 @@
+# services/rest_price_poller.py
+"""
+WebSocket 슬롯을 받지 못한 종목의 현재가를 중앙에서 REST 로 갱신하는 적응형 폴러.
+
+가격 구독 요청은 SubscriptionPolicy 가 40슬롯 안에서 배정하고, 밀려난 종목은 지금까지
+전략 스캔의 `get_current_price` 단건 fallback · 스캔 주기 `prefetch_prices` · 화면 조회가
+각자 REST 를 불러 채웠다. 종목별로 얼마나 자주 갱신할지를 조율하는 곳이 없어, 트리거에
+바짝 붙은 종목과 하루 종일 움직이지 않는 관심종목이 같은 주기로 `quotation_price` 예산을 썼다.
+
+이 폴러는 구독 대기 종목마다 갱신 주기(refresh interval)를 정한다.
+  - 트리거 근접도 : 전략이 알려준 트리거 가격까지 거리(%)가 trigger_band_pct 안일수록 짧게
+  - 장중 변동폭   : (고가-저가)/시가 % 가 클수록 짧게 (volatility_weight 만큼만 반영)
+  - 보유 여부     : HIGH 요청(보유/진입 종목)은 holding_interval_sec 이하로 고정
+  - 신호가 없으면 max_interval_sec
+마지막 수신(WebSocket·REST 무관) 이후 주기가 지난 종목을 오래된 순으로 모아 30종목
+`get_multi_price` 배치로 조회한다. 마지막 배치에 자리가 남으면 주기의 fill_ratio 이상 지난
+종목으로 채워 호출 1회당 갱신 종목 수를 늘린다. 호출 수는 token bucket(max_calls_per_sec,
+burst_calls)으로 `quotation_price` 예산(초당 8건)의 일부만 쓰도록 제한한다.
+
+조회 결과는 StockQueryService 가 WebSocket 틱과 같은 최신가 테이블에 quality_reason="rest_poll"
+로 기록한다. 소비자는 `StockQueryService.get_fresh_price` / `get_current_price` 로 읽으며,
+폴링 대상 종목은 `max_age_for()`(갱신 주기 + stale_grace_sec) 안의 값을 신선한 것으로 본다.
+scripts/simulate_rest_price_polling.py 가 같은 폴러로 기록된 하루를 재생해 예산 사용량과
+staleness 분포를 고정 주기 폴링과 비교한다.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Mapping, Optional
+
+from services.subscription_slot_allocator import build_candidate
+
+# codes(≤batch_size) → 갱신된 종목코드 목록. 호출 자체가 실패하면 None.
+FetchBatch = Callable[[List[str]], Awaitable[Optional[List[str]]]]
+# {code: {"priority": int, "trigger_levels": [float, ...]}} — 구독 슬롯 밖의 가격 요청
+RequestSource = Callable[[], Mapping[str, Mapping[str, Any]]]
+# code → PriceQuote(received_at·price·high·low·open) 또는 None
+QuoteReader = Callable[[str], Any]
+
+
+@dataclass(frozen=True)
+class RestPollConfig:
+    min_interval_sec: float = 2.0
+    max_interval_sec: float = 30.0
+    holding_interval_sec: float = 3.0
+    trigger_band_pct: float = 3.0  # 트리거까지 거리가 이 % 밖이면 근접도 0
+    volatility_cap_pct: float = 10.0  # 장중 변동폭 포화 지점
+    volatility_weight: float = 0.5  # 변동폭만으로 줄일 수 있는 주기 비율 상한
+    max_calls_per_sec: float = 2.0  # quotation_price(초당 8건) 중 폴러 몫
+    burst_calls: float = 4.0
+    batch_size: int = 30
+    fill_ratio: float = 0.5  # 빈 배치 자리를 채울 때 주기 대비 경과 비율 하한
+    stale_grace_sec: float = 2.0  # 소비자 신선도 판정 여유 (sweep 간격 + 응답 지연)
+
+
+@dataclass
+class _PollStats:
+    sweeps: int = 0
+    calls: int = 0
+    polled_codes: int = 0
+    refreshed: int = 0
+    failures: int = 0
+    budget_skipped: int = 0
+    ages: Deque[float] = field(default_factory=lambda: deque(maxlen=4096))
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+class RestPricePoller:
+    """구독 대기 종목의 갱신 주기를 관리하고 due 종목을 배치 REST 로 갱신한다."""
+
+    def __init__(
+        self,
+        fetch_batch: Optional[FetchBatch],
+        quote_reader: QuoteReader,
+        request_source: RequestSource,
+        *,
+        config: Optional[RestPollConfig] = None,
+        clock: Callable[[], float] = time.time,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._fetch_batch = fetch_batch
+        self._read_quote = quote_reader
+        self._request_source = request_source
+        self.config = config or RestPollConfig()
+        self._clock = clock
+        self._logger = logger or logging.getLogger(__name__)
+        self._intervals: Dict[str, float] = {}
+        self._last_attempt: Dict[str, float] = {}
+        self._tokens = float(self.config.burst_calls)
+        self._refilled_at: Optional[float] = None
+        self._stats = _PollStats()
+
+    # ── 갱신 주기 ─────────────────────────────────────────────────
+
+    def interval_for(
+        self,
+        code: str,
+        priority: int,
+        trigger_levels: Iterable[float] = (),
+        quote=None,
+    ) -> float:
+        """종목의 갱신 주기(초). 트리거 근접·변동폭이 클수록, 보유 종목일수록 짧다."""
+        cfg = self.config
+        candidate = build_candidate(
+            code,
+            priority,
+            price=quote.price if quote else None,
+            high=quote.high if quote else None,
+            low=quote.low if quote else None,
+            open_price=quote.open if quote else None,
+            trigger_levels=trigger_levels,
+        )
+        urgency = 0.0
+        if candidate.trigger_distance_pct is not None and cfg.trigger_band_pct > 0:
+            urgency = max(0.0, 1.0 - candidate.trigger_distance_pct / cfg.trigger_band_pct)
+        if candidate.volatility_pct and cfg.volatility_cap_pct > 0:
+            volatility = min(candidate.volatility_pct / cfg.volatility_cap_pct, 1.0)
+            urgency = max(urgency, cfg.volatility_weight * volatility)
+        # 로그 스케일 보간 — 근접도가 절반만 돼도 주기가 max 의 1/4 안팎으로 줄어든다
+        interval = cfg.max_interval_sec * (cfg.min_interval_sec / cfg.max_interval_sec) ** urgency
+        if candidate.is_holding:
+            interval = min(interval, cfg.holding_interval_sec)
+        return max(cfg.min_interval_sec, interval)
+
+    def max_age_for(self, code: str) -> Optional[float]:
+        """폴링 대상이면 소비자가 신선하다고 볼 최대 나이(초). 대상이 아니면 None."""
+        interval = self._intervals.get(code)
+        if interval is None:
+            return None
+        return interval + self.config.stale_grace_sec
+
+    def clear_intervals(self) -> None:
+        """추적 중인 갱신 주기를 비운다. 폴링을 쉬는 동안(장 마감·일시중지) 지난 주기로
+        max_age_for() 가 오래된 값을 신선하다고 늘려주지 않도록 태스크가 호출한다."""
+        self._intervals = {}
+
+    # ── sweep ────────────────────────────────────────────────────
+
+    def plan_sweep(self, now: Optional[float] = None) -> List[List[str]]:
+        """이번 sweep 에 호출할 배치 목록. 예산(token)을 차감하며, 못 보낸 배치는 다음 sweep 으로 미룬다."""
+        now = self._clock() if now is None else now
+        cfg = self.config
+        requests = self._request_source() or {}
+        self._stats.sweeps += 1
+
+        intervals: Dict[str, float] = {}
+        overdue: Dict[str, float] = {}
+        for code, req in requests.items():
+            quote = self._read_quote(code)
+            interval = self.interval_for(
+                code,
+                int(req.get("priority", 2)),
+                req.get("trigger_levels") or (),
+                quote,
+            )
+            intervals[code] = interval
+            received_at = quote.received_at if quote else 0.0
+            if received_at > 0:
+                self._stats.ages.append(now - received_at)
+            last = max(self._last_attempt.get(code, 0.0), received_at)
+            overdue[code] = (now - last) / interval if last > 0 else float("inf")
+        self._intervals = intervals
+        for code in list(self._last_attempt):
+            if code not in intervals:
+                del self._last_attempt[code]
+
+        due = sorted((c for c, ratio in overdue.items() if ratio >= 1.0), key=lambda c: (-overdue[c], c))
+        if not due:
+            return []
+        size = max(1, int(cfg.batch_size))
+        batches = [due[i:i + size] for i in range(0, len(due), size)]
+        room = size - len(batches[-1])
+        if room > 0:
+            fillers = sorted(
+                (c for c, ratio in overdue.items() if cfg.fill_ratio <= ratio < 1.0),
+                key=lambda c: (-overdue[c], c),
+            )
+            batches[-1].extend(fillers[:room])
+
+        self._refill(now)
+        allowed = min(len(batches), int(self._tokens))
+        self._tokens -= allowed
+        self._stats.budget_skipped += len(batches) - allowed
+        return batches[:allowed]
+
+    def record_result(self, batch: List[str], refreshed: Optional[List[str]], now: Optional[float] = None) -> None:
+        """배치 결과 반영. 실패한 배치는 min_interval_sec 뒤에 다시 due 가 된다."""
+        now = self._clock() if now is None else now
+        self._stats.calls += 1
+        self._stats.polled_codes += len(batch)
+        if refreshed is None:
+            self._stats.failures += 1
+            for code in batch:
+                interval = self._intervals.get(code, self.config.max_interval_sec)
+                self._last_attempt[code] = now - interval + self.config.min_interval_sec
+            return
+        self._stats.refreshed += len(refreshed)
+        for code in batch:
+            self._last_attempt[code] = now
+
+    async def run_sweep(self, now: Optional[float] = None) -> int:
+        """due 종목을 배치 조회한다. 반환: 갱신된 종목 수."""
+        if self._fetch_batch is None:
+            return 0
+        now = self._clock() if now is None else now
+        refreshed_total = 0
+        for batch in self.plan_sweep(now):
+            try:
+                refreshed = await self._fetch_batch(batch)
+            except Exception as e:
+                self._logger.debug({"event": "rest_price_poll_failed", "count": len(batch), "error": str(e)})
+                refreshed = None
+            self.record_result(batch, refreshed, now)
+            refreshed_total += len(refreshed or ())
+        return refreshed_total
+
+    def _refill(self, now: float) -> None:
+        cfg = self.config
+        if self._refilled_at is not None and now > self._refilled_at:
+            self._tokens = min(
+                float(cfg.burst_calls),
+                self._tokens + (now - self._refilled_at) * cfg.max_calls_per_sec,
+            )
+        self._refilled_at = now if self._refilled_at is None else max(self._refilled_at, now)
+
+    # ── 모니터링 ─────────────────────────────────────────────────
+
+    def get_stats(self) -> dict:
+        ages = sorted(self._stats.ages)
+        stats = self._stats
+        return {
+            "tracked_codes": len(self._intervals),
+            "sweeps": stats.sweeps,
+            "calls": stats.calls,
+            "polled_codes": stats.polled_codes,
+            "refreshed": stats.refreshed,
+            "failures": stats.failures,
+            "budget_skipped": stats.budget_skipped,
+            "staleness_p50_sec": _round(_percentile(ages, 0.5)),
+            "staleness_p90_sec": _round(_percentile(ages, 0.9)),
+            "staleness_p99_sec": _round(_percentile(ages, 0.99)),
+        }
+
+
+def build_rest_price_poller(
+    cfg: Optional[Mapping],
+    *,
+    fetch_batch: FetchBatch,
+    quote_reader: QuoteReader,
+    request_source: RequestSource,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[RestPricePoller]:
+    """config 의 rest_price_poller 섹션(dict)으로 폴러를 만든다. 비활성이면 None."""
+    if not isinstance(cfg, Mapping) or not cfg.get("enabled", False):
+        return None
+    defaults = RestPollConfig()
+    config = RestPollConfig(
+        min_interval_sec=float(cfg.get("min_interval_sec", defaults.min_interval_sec)),
+        max_interval_sec=float(cfg.get("max_interval_sec", defaults.max_interval_sec)),
+        holding_interval_sec=float(cfg.get("holding_interval_sec", defaults.holding_interval_sec)),
+        trigger_band_pct=float(cfg.get("trigger_band_pct", defaults.trigger_band_pct)),
+        volatility_cap_pct=float(cfg.get("volatility_cap_pct", defaults.volatility_cap_pct)),
+        volatility_weight=float(cfg.get("volatility_weight", defaults.volatility_weight)),
+        max_calls_per_sec=float(cfg.get("max_calls_per_sec", defaults.max_calls_per_sec)),
+        burst_calls=float(cfg.get("burst_calls", defaults.burst_calls)),
+        batch_size=min(30, int(cfg.get("batch_size", defaults.batch_size))),
+        fill_ratio=float(cfg.get("fill_ratio", defaults.fill_ratio)),
+        stale_grace_sec=float(cfg.get("stale_grace_sec", defaults.stale_grace_sec)),
+    )
+    return RestPricePoller(fetch_batch, quote_reader, request_source, config=config, logger=logger)
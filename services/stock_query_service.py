@@ -8,11 +8,22 @@ from common.overseas_types import OverseasExchange
 from common.types import ErrorCode, ResCommonResponse, ResTopMarketCapApiItem, ResBasicStockInfo, \
     ResStockFullInfoApiOutput, Exchange
 from config.DynamicConfig import DynamicConfig
-from typing import List, Dict, Optional, Tuple, Literal
+from typing import List, Dict, NamedTuple, Optional, Tuple, Literal
 from core.performance_profiler import PerformanceProfiler
+from repositories.latest_price_table import PriceQuote
 from services.data_quality_service import DataQualityService
 from services.notification_service import NotificationService, NotificationCategory, NotificationLevel
 from services.market_data_service import MarketDataService
+from services.price_request_coalescer import PriceRequestCoalescer
+
+
+class FreshPrice(NamedTuple):
+    """신선도 표기가 붙은 최신가 — source 는 websocket/rest_poll/rest_snapshot 등 quality_reason."""
+    quote: PriceQuote
+    age_sec: float
+    max_age_sec: float
+    source: str
+    fresh: bool
 
 
 def _to_float(value) -> Optional[float]:
@@ -36,7 +47,8 @@ class StockQueryService:
                  streaming_logger=None,
                  price_stream_service=None,
                  price_subscription_service=None,
-                 snapshot_max_age_sec: float = 5.0):
+                 snapshot_max_age_sec: float = 5.0,
+                 price_coalesce_window_sec: float = 0.01):
         self.broker = broker_api_wrapper
         self.market_data_service = market_data_service
         self.logger = logger
@@ -50,6 +62,8 @@ class StockQueryService:
         self.price_stream_service = price_stream_service
         self.price_subscription_service = price_subscription_service
         self._snapshot_max_age_sec = snapshot_max_age_sec
+        # 구독 슬롯 밖 종목을 갱신 주기별로 REST 폴링하는 중앙 폴러 (후주입, None 이면 비활성)
+        self.rest_price_poller = None
         self._price_lookup_stats: Dict[str, int] = {
             "snapshot_hit": 0,
             "no_tick_fallback": 0,
@@ -67,21 +81,40 @@ class StockQueryService:
             "batch_prefetch_skip_fresh": 0,
             "batch_prefetch_failure": 0,
             "batch_prefetch_circuit_open": 0,
+            "coalesced_hit": 0,
+            "coalesced_fallback": 0,
+            "rest_poll_call": 0,
+            "rest_poll_backfill": 0,
+            "rest_poll_failure": 0,
         }
+        # 종목별 REST fallback 누적 횟수 (WebSocket 슬롯 할당기의 REST 비용 신호)
+        self._rest_fallback_by_code: Dict[str, int] = {}
         self._multi_price_prefetch_failure_threshold = 3
         self._multi_price_prefetch_cooldown_sec = 300.0
         self._multi_price_prefetch_consecutive_failures = 0
         self._multi_price_prefetch_disabled_until = 0.0
+        # snapshot fallback 으로 REST 가 필요한 단건 조회를 get_multi_price 로 묶는다.
+        # window 0 이하면 비활성 (항상 단건 REST).
+        self._price_coalescer: Optional[PriceRequestCoalescer] = (
+            PriceRequestCoalescer(
+                self._fetch_multi_price_items,
+                window_sec=price_coalesce_window_sec,
+                max_batch=30,
+            )
+            if price_coalesce_window_sec > 0 else None
+        )
 
     def set_minervini_stage_service(self, minervini_stage_service) -> None:
         """MinerviniStageService 후주입 — 차트 일자별 Stage 표기용 (ServiceContainer 호출)."""
         self.minervini_stage_service = minervini_stage_service
 
-    def _count_price_lookup(self, key: str, enabled: bool = True) -> None:
-        """운영 현재가 조회 통계를 선택적으로 증가시킨다."""
+    def _count_price_lookup(self, key: str, enabled: bool = True, code: Optional[str] = None) -> None:
+        """운영 현재가 조회 통계를 선택적으로 증가시킨다. code 를 주면 종목별 REST fallback 도 센다."""
         if not enabled:
             return
         self._price_lookup_stats[key] = self._price_lookup_stats.get(key, 0) + 1
+        if code and key == "rest_fallback":
+            self._rest_fallback_by_code[code] = self._rest_fallback_by_code.get(code, 0) + 1
 
     def _is_multi_price_prefetch_circuit_open(self, now: Optional[float] = None) -> bool:
         now = time.time() if now is None else now
@@ -114,15 +147,53 @@ class StockQueryService:
         """
         return dict(self._price_lookup_stats)
 
+    def _snapshot_max_age_for(self, code: str) -> float:
+        """snapshot 을 신선하다고 볼 최대 나이. 폴러가 관리하는 종목은 그 갱신 주기(+여유)까지 늘린다."""
+        poller = self.rest_price_poller
+        if poller is None:
+            return self._snapshot_max_age_sec
+        return max(self._snapshot_max_age_sec, poller.max_age_for(code) or 0.0)
+
+    def latest_price_quote(self, code: str) -> Optional[PriceQuote]:
+        """최신가 테이블의 스냅샷 (REST 호출 없음). price_stream_service 미주입이면 None."""
+        if self.price_stream_service is None:
+            return None
+        return self.price_stream_service.get_price_quote(code)
+
+    def get_fresh_price(self, code: str) -> Optional[FreshPrice]:
+        """최신가와 나이·출처·신선 여부를 REST 호출 없이 반환한다. 값이 없으면 None.
+
+        WebSocket 구독 종목은 snapshot_max_age_sec, 폴러 대상 종목은 폴러 갱신 주기 기준으로
+        fresh 를 판정한다. fresh=False 여도 값은 돌려주므로 호출자가 지연 허용 여부를 정한다.
+        """
+        quote = self.latest_price_quote(code)
+        if quote is None:
+            return None
+        age = max(0.0, time.time() - quote.received_at)
+        max_age = self._snapshot_max_age_for(code)
+        return FreshPrice(quote, age, max_age, quote.quality_reason, age <= max_age)
+
+    def rest_fallback_counts_snapshot(self) -> Dict[str, int]:
+        """종목별 누적 REST fallback 횟수 사본 (SubscriptionPolicy 슬롯 할당기가 분당 빈도로 환산)."""
+        return dict(self._rest_fallback_by_code)
+
+    def price_coalescer_stats_snapshot(self) -> Dict[str, float]:
+        """단건 현재가 batch 합치기 지표 (calls_saved, added_latency_ms_* 등). 비활성이면 빈 dict."""
+        if self._price_coalescer is None:
+            return {}
+        return self._price_coalescer.stats_snapshot()
+
     async def sync_price_subscriptions(
         self,
         codes: List[str],
         category_key: str,
         priority=None,
+        trigger_levels: Optional[Dict[str, float]] = None,
     ) -> bool:
         """전략 후보군을 실시간 현재가 구독 대상으로 동기화한다.
 
-        구독 서비스가 없거나 실패해도 전략 스캔 자체는 계속 진행한다.
+        trigger_levels({code: 트리거 가격})를 주면 구독 정책의 슬롯 할당기가 트리거 근접 종목을
+        우선 배정하는 데 쓴다. 구독 서비스가 없거나 실패해도 전략 스캔 자체는 계속 진행한다.
         """
         sub_svc = self.price_subscription_service
         if sub_svc is None:
@@ -148,6 +219,11 @@ class StockQueryService:
             return False
 
         try:
+            set_trigger_levels = getattr(sub_svc, "set_trigger_levels", None)
+            if trigger_levels is not None and callable(set_trigger_levels):
+                set_trigger_levels(category_key, {
+                    code: level for code, level in trigger_levels.items() if code in seen
+                })
             await sync_subscriptions(unique_codes, category_key, priority)
             return True
         except Exception as e:
@@ -168,8 +244,8 @@ class StockQueryService:
         else:  # 3:보합 (또는 기타)
             return ""
 
-    def _build_snapshot_response(self, snap: dict) -> ResCommonResponse:
-        """PriceStreamService 캐시 dict → ResCommonResponse(output=ResStockFullInfoApiOutput) 변환.
+    def _build_snapshot_response(self, snap: PriceQuote) -> ResCommonResponse:
+        """PriceStreamService 최신가 스냅샷(PriceQuote) → ResCommonResponse(output=ResStockFullInfoApiOutput) 변환.
 
         snapshot에 없는 필드는 ""로 채워진다. 호출자가 per/pbr 같은
         REST 전용 필드가 필요하면 force_fresh=True를 사용한다.
@@ -183,15 +259,15 @@ class StockQueryService:
 
         fields = {name: "" for name in ResStockFullInfoApiOutput.model_fields}
         fields.update({
-            "stck_prpr": _snapshot_value(snap.get("price")),
-            "prdy_vrss": _snapshot_value(snap.get("change")),
-            "prdy_ctrt": _snapshot_value(snap.get("rate"), "0.00"),
-            "prdy_vrss_sign": _snapshot_value(snap.get("sign"), "3"),
-            "acml_vol": _snapshot_value(snap.get("acml_vol")),
-            "acml_tr_pbmn": _snapshot_value(snap.get("acml_tr_pbmn")),
-            "stck_hgpr": _snapshot_value(snap.get("high")),
-            "stck_lwpr": _snapshot_value(snap.get("low")),
-            "stck_oprc": _snapshot_value(snap.get("open")),
+            "stck_prpr": _snapshot_value(snap.price),
+            "prdy_vrss": _snapshot_value(snap.change),
+            "prdy_ctrt": f"{snap.rate:.2f}",
+            "prdy_vrss_sign": _snapshot_value(snap.sign, "3"),
+            "acml_vol": _snapshot_value(snap.acml_vol),
+            "acml_tr_pbmn": _snapshot_value(snap.acml_tr_pbmn),
+            "stck_hgpr": _snapshot_value(snap.high),
+            "stck_lwpr": _snapshot_value(snap.low),
+            "stck_oprc": _snapshot_value(snap.open),
         })
         output = ResStockFullInfoApiOutput.model_validate(fields)
         return ResCommonResponse(
@@ -200,6 +276,51 @@ class StockQueryService:
             data={"output": output},
         )
 
+    def _build_multi_price_response(self, item: dict) -> ResCommonResponse:
+        """get_multi_price 응답 item → ResCommonResponse(output=ResStockFullInfoApiOutput) 변환.
+
+        복수종목 TR 이 주지 않는 필드(per/pbr 등)는 snapshot 응답과 같이 ""로 채워진다.
+        """
+        fields = {name: "" for name in ResStockFullInfoApiOutput.model_fields}
+        for name in fields:
+            value = item.get(name)
+            if value not in (None, ""):
+                fields[name] = str(value)
+        if not fields.get("stck_shrn_iscd"):
+            fields["stck_shrn_iscd"] = str(item.get("stck_shrn_iscd") or item.get("mksc_shrn_iscd") or "")
+        output = ResStockFullInfoApiOutput.model_validate(fields)
+        return ResCommonResponse(
+            rt_cd=ErrorCode.SUCCESS.value,
+            msg1="multi_price",
+            data={"output": output},
+        )
+
+    async def _fetch_multi_price_items(self, codes: List[str]) -> Optional[Dict[str, dict]]:
+        """PriceRequestCoalescer batch fetch — {code: item}. 실패·circuit open 이면 None.
+
+        실패는 prefetch 와 같은 circuit 에 반영하되, 집계는 coalescer 의 batch_failures 로 한다.
+        """
+        if self._is_multi_price_prefetch_circuit_open():
+            return None
+        try:
+            resp = await self.get_multi_price(codes)
+        except Exception as e:
+            self.logger.debug({"event": "price_coalesce_multi_failed", "error": str(e), "count": len(codes)})
+            self._record_multi_price_prefetch_failure(count_stats=False)
+            return None
+        if resp is None or resp.rt_cd != ErrorCode.SUCCESS.value or not isinstance(resp.data, list):
+            self._record_multi_price_prefetch_failure(count_stats=False)
+            return None
+        self._record_multi_price_prefetch_success()
+        items: Dict[str, dict] = {}
+        for item in resp.data:
+            if not isinstance(item, dict):
+                continue
+            code = str(item.get("stck_shrn_iscd") or item.get("mksc_shrn_iscd") or "").strip()
+            if code and item.get("stck_prpr") not in (None, "", "0"):
+                items[code] = item
+        return items
+
     async def get_current_price(
         self,
         stock_code: str,
@@ -234,7 +355,7 @@ class StockQueryService:
             fallback_force_fresh = True
 
         if not is_exchange_specific and not force_fresh and self.price_stream_service is not None:
-            snap = self.price_stream_service.get_cached_price(stock_code)
+            snap = self.price_stream_service.get_price_quote(stock_code)
             if snap is None:
                 # 구독 중이나 tick 미수신 → REST fallback
                 self._count_price_lookup("no_tick_fallback", count_stats)
@@ -250,13 +371,13 @@ class StockQueryService:
                 if subscription_age >= self._snapshot_max_age_sec:
                     unhealthy_stream_reason = "no_tick"
             else:
-                received_at = snap.get("received_at", 0.0) or 0.0
-                age = time.time() - received_at
-                if age <= self._snapshot_max_age_sec and allow_snapshot:
+                age = time.time() - snap.received_at
+                max_age = self._snapshot_max_age_for(stock_code)
+                if age <= max_age and allow_snapshot:
                     self._count_price_lookup("snapshot_hit", count_stats)
                     return self._build_snapshot_response(snap)
                 else:
-                    if age > self._snapshot_max_age_sec:
+                    if age > max_age:
                         self._count_price_lookup("stale_fallback", count_stats)
                         self.logger.debug({"event": "price_lookup_stale", "code": stock_code,
                                            "age_sec": round(age, 2), "caller": caller})
@@ -273,10 +394,26 @@ class StockQueryService:
         elif not is_exchange_specific and not force_fresh:
             self._count_price_lookup("stream_unavailable_fallback", count_stats)
 
-        self._count_price_lookup("rest_fallback", count_stats)
-        resp = await self.market_data_service.get_current_price(
-            stock_code, exchange=exchange, count_stats=count_stats, caller=caller, force_fresh=fallback_force_fresh
-        )
+        self._count_price_lookup("rest_fallback", count_stats, code=stock_code)
+        resp = None
+        # snapshot 대체용 조회(미수신/stale)만 묶는다 — 호출자가 snapshot 형태 응답을 이미 허용한 경우.
+        # force_fresh·full output·거래소 지정 요청은 전체 필드가 필요할 수 있어 단건 REST 를 유지한다.
+        if (self._price_coalescer is not None
+                and fallback_force_fresh
+                and allow_snapshot
+                and not force_fresh
+                and not is_exchange_specific
+                and not self._is_multi_price_prefetch_circuit_open()):
+            item = await self._price_coalescer.fetch(stock_code)
+            if item is not None:
+                self._count_price_lookup("coalesced_hit", count_stats)
+                resp = self._build_multi_price_response(item)
+            else:
+                self._count_price_lookup("coalesced_fallback", count_stats)
+        if resp is None:
+            resp = await self.market_data_service.get_current_price(
+                stock_code, exchange=exchange, count_stats=count_stats, caller=caller, force_fresh=fallback_force_fresh
+            )
 
         if unhealthy_stream_reason and self.price_subscription_service is not None:
             drop_subscription = getattr(
@@ -371,16 +508,14 @@ class StockQueryService:
         if not unique_codes:
             return 0
 
-        # 신선 snapshot 보유 종목은 batch 대상에서 제외
+        # 신선 snapshot 보유 종목은 batch 대상에서 제외 (폴러 대상 종목은 폴러 갱신 주기 기준)
         now = time.time()
         stale_codes: List[str] = []
         for code in unique_codes:
-            snap = self.price_stream_service.get_cached_price(code)
-            if snap is not None:
-                received_at = snap.get("received_at", 0.0) or 0.0
-                if now - received_at <= self._snapshot_max_age_sec:
-                    self._count_price_lookup("batch_prefetch_skip_fresh", count_stats)
-                    continue
+            fresh = self.get_fresh_price(code)
+            if fresh is not None and fresh.fresh:
+                self._count_price_lookup("batch_prefetch_skip_fresh", count_stats)
+                continue
             stale_codes.append(code)
         if not stale_codes:
             return 0
@@ -388,10 +523,6 @@ class StockQueryService:
             self._count_price_lookup("batch_prefetch_circuit_open", count_stats)
             return 0
 
-        def _opt(v) -> Optional[str]:
-            s = str(v) if v is not None else ""
-            return s if s and s not in ("0", "N/A") else None
-
         backfilled = 0
         for i in range(0, len(stale_codes), 30):
             if self._is_multi_price_prefetch_circuit_open():
@@ -411,33 +542,72 @@ class StockQueryService:
             self._record_multi_price_prefetch_success()
             items = resp.data if isinstance(resp.data, list) else []
             for item in items:
-                if not isinstance(item, dict):
-                    continue
-                code = str(item.get("stck_shrn_iscd") or item.get("mksc_shrn_iscd") or "").strip()
-                price = item.get("stck_prpr")
-                if not code or price in (None, "", "0"):
-                    continue
-                try:
-                    self.price_stream_service.cache_price_snapshot(
-                        code,
-                        price=str(price),
-                        change=str(item.get("prdy_vrss", "0") or "0"),
-                        rate=str(item.get("prdy_ctrt", "0.00") or "0.00"),
-                        sign=str(item.get("prdy_vrss_sign", "3") or "3"),
-                        volume=str(item.get("acml_vol", "0") or "0"),
-                        acml_tr_pbmn=_opt(item.get("acml_tr_pbmn")),
-                        high=_opt(item.get("stck_hgpr")),
-                        low=_opt(item.get("stck_lwpr")),
-                        open_price=_opt(item.get("stck_oprc")),
-                    )
+                if self._backfill_multi_price_item(item, quality_reason="rest_snapshot") is not None:
                     self._count_price_lookup("batch_prefetch_backfill", count_stats)
                     backfilled += 1
-                except Exception as e:
-                    self.logger.debug(
-                        {"event": "batch_prefetch_backfill_skipped", "code": code, "error": str(e)}
-                    )
         return backfilled
 
+    async def refresh_price_snapshots(self, codes: List[str]) -> Optional[List[str]]:
+        """RestPricePoller 배치 조회 — get_multi_price 1회로 최신가 테이블을 갱신한다 (최대 30종목).
+
+        결과는 WebSocket 틱과 같은 경로(cache_price_snapshot)에 quality_reason="rest_poll" 로 기록한다.
+        반환: 갱신된 종목코드 목록. 호출 실패·circuit open 이면 None (폴러가 재시도 시점을 정한다).
+        """
+        if self.price_stream_service is None or not codes:
+            return None
+        if self._is_multi_price_prefetch_circuit_open():
+            return None
+        self._count_price_lookup("rest_poll_call")
+        try:
+            resp = await self.get_multi_price(list(codes)[:30])
+        except Exception as e:
+            self.logger.debug({"event": "rest_poll_failed", "error": str(e), "count": len(codes)})
+            resp = None
+        if resp is None or resp.rt_cd != ErrorCode.SUCCESS.value or not isinstance(resp.data, list):
+            self._count_price_lookup("rest_poll_failure")
+            self._record_multi_price_prefetch_failure(count_stats=False)
+            return None
+        self._record_multi_price_prefetch_success()
+        refreshed: List[str] = []
+        for item in resp.data:
+            code = self._backfill_multi_price_item(item, quality_reason="rest_poll")
+            if code is not None:
+                refreshed.append(code)
+        self._price_lookup_stats["rest_poll_backfill"] += len(refreshed)
+        return refreshed
+
+    def _backfill_multi_price_item(self, item, *, quality_reason: str) -> Optional[str]:
+        """get_multi_price 응답 item 1건을 snapshot 캐시에 기록한다. 기록한 종목코드 또는 None."""
+        if not isinstance(item, dict):
+            return None
+        code = str(item.get("stck_shrn_iscd") or item.get("mksc_shrn_iscd") or "").strip()
+        price = item.get("stck_prpr")
+        if not code or price in (None, "", "0"):
+            return None
+
+        def _opt(v) -> Optional[str]:
+            s = str(v) if v is not None else ""
+            return s if s and s not in ("0", "N/A") else None
+
+        try:
+            self.price_stream_service.cache_price_snapshot(
+                code,
+                price=str(price),
+                change=str(item.get("prdy_vrss", "0") or "0"),
+                rate=str(item.get("prdy_ctrt", "0.00") or "0.00"),
+                sign=str(item.get("prdy_vrss_sign", "3") or "3"),
+                volume=str(item.get("acml_vol", "0") or "0"),
+                acml_tr_pbmn=_opt(item.get("acml_tr_pbmn")),
+                high=_opt(item.get("stck_hgpr")),
+                low=_opt(item.get("stck_lwpr")),
+                open_price=_opt(item.get("stck_oprc")),
+                quality_reason=quality_reason,
+            )
+        except Exception as e:
+            self.logger.debug({"event": "batch_prefetch_backfill_skipped", "code": code, "error": str(e)})
+            return None
+        return code
+
     async def get_top_trading_value_stocks(self) -> ResCommonResponse:
         """거래대금 상위 종목 조회 (MarketDataService 래퍼)."""
         return await self.market_data_service.get_top_trading_value_stocks()
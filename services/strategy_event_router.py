@@ -38,6 +38,7 @@ import time
 from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 from common.types import TradeSignal
+from services.market_session_clock import MarketSessionClock
 from services.strategy_signal_sink import SignalSink
 
 EvaluatorFn = Callable[[str, dict], Awaitable[Optional[TradeSignal]]]
@@ -190,7 +191,13 @@ class StrategyEventRouter:
         return signals
 
     async def _is_market_open(self) -> bool:
-        """MarketCalendarService 우선, MarketClock 주입 시 시간대 판정으로 fallback."""
+        """MarketCalendarService 우선, MarketClock 주입 시 시간대 판정으로 fallback.
+
+        세션 시계가 돌고 있으면 await 없이 그 상태를 읽는다 (tick 마다 호출되는 경로).
+        """
+        session_clock = getattr(self._mc, "session_clock", None)
+        if isinstance(session_clock, MarketSessionClock) and session_clock.is_live:
+            return session_clock.is_open
         if hasattr(self._mc, "is_market_open_now"):
             return bool(await _maybe_await(self._mc.is_market_open_now()))
         if hasattr(self._mc, "is_market_operating_hours"):
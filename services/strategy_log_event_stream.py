@@ -0,0 +1,172 @@
+"""StrategyLogEventStream — 전략 로그 파일의 증분(byte offset) 이벤트 스트림.
+
+`StrategyLogReportService` 는 리포트마다 `logs/**/*.log.json*` 을 처음부터 다시 읽었다.
+전략 로그는 append-only 이고 롤오버 시 `_N+1` 새 파일을 만든다
+(`SizeTimeRotatingFileHandler`). 그래서 파일별로 "어디까지 읽었는지"만 기억하면
+재실행·장중 미리보기는 새로 덧붙은 줄만 읽으면 된다.
+
+- 완결된 줄(개행으로 끝남)만 소비한다. 쓰는 중인 마지막 줄은 다음 read 로 미룬다.
+- 이미 읽은 구간이 바뀌었는지(파일 재작성/축소/삭제) `is_consistent` 로 확인한다.
+  바뀌었으면 호출자가 누적 상태를 버리고 처음부터 다시 읽어야 한다 — 이미 반영된
+  이벤트를 되돌릴 수 없기 때문이다.
+- `.gz` 는 압축 해제 기준 offset 을 쓰고, 압축 파일 크기·mtime 으로 변경을 감지한다.
+
+offset 표는 `checkpoint()` / `from_checkpoint()` 로 JSON 직렬화할 수 있다.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional
+
+# 이미 읽은 구간 끝 N 바이트의 digest 로 재작성 여부를 판단한다.
+_FINGERPRINT_BYTES = 64
+
+
+class StrategyLogEvent(NamedTuple):
+    strategy: str
+    path: str
+    level: str
+    ts: str
+    data: dict
+
+
+def _digest(chunk: bytes) -> str:
+    return hashlib.blake2b(chunk, digest_size=8).hexdigest()
+
+
+class StrategyLogEventStream:
+    """파일별 offset 을 기억하며 date_prefix 이벤트를 순서대로 흘려보낸다."""
+
+    def __init__(self, loads: Callable[[bytes], Any]):
+        self._loads = loads
+        # path → {"offset": int, "tail": str, "gz_stat": [size, mtime_ns] | None}
+        self._files: Dict[str, dict] = {}
+        self.bytes_read = 0
+        self.lines_read = 0
+
+    # ── 체크포인트 ────────────────────────────────────────────────
+
+    def checkpoint(self) -> dict:
+        return {path: dict(info) for path, info in self._files.items()}
+
+    @classmethod
+    def from_checkpoint(cls, state: Mapping[str, Any], loads: Callable[[bytes], Any]) -> "StrategyLogEventStream":
+        stream = cls(loads)
+        for path, info in (state or {}).items():
+            if isinstance(info, Mapping):
+                stream._files[str(path)] = {
+                    "offset": int(info.get("offset") or 0),
+                    "tail": str(info.get("tail") or ""),
+                    "gz_stat": list(info["gz_stat"]) if info.get("gz_stat") else None,
+                }
+        return stream
+
+    def tracked_paths(self) -> List[str]:
+        return list(self._files.keys())
+
+    # ── 정합성 ──────────────────────────────────────────────────
+
+    def is_consistent(self, current_paths: Mapping[str, Any] | List[str]) -> bool:
+        """이전에 읽은 모든 파일이 그대로 남아 있고 읽은 구간이 변하지 않았는가."""
+        current = set(current_paths)
+        for path, info in self._files.items():
+            if path not in current or not os.path.exists(path):
+                return False
+            offset = info["offset"]
+            if path.endswith(".gz"):
+                if info.get("gz_stat") != self._gz_stat(path):
+                    return False
+                continue
+            try:
+                if os.path.getsize(path) < offset:
+                    return False
+                if offset and self._tail_digest(path, offset) != info.get("tail"):
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _gz_stat(path: str) -> Optional[list]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
+    @staticmethod
+    def _tail_digest(path: str, offset: int) -> str:
+        start = max(0, offset - _FINGERPRINT_BYTES)
+        with open(path, "rb") as f:
+            f.seek(start)
+            return _digest(f.read(offset - start))
+
+    # ── 읽기 ────────────────────────────────────────────────────
+
+    def read_new(
+        self,
+        strategy_files: Mapping[str, List[str]],
+        date_prefix: str,
+    ) -> Iterator[StrategyLogEvent]:
+        """전략 이름순 → 파일 경로순으로 새로 덧붙은 이벤트만 yield."""
+        for name, files in sorted(strategy_files.items()):
+            for path in sorted(files):
+                yield from self._read_file(name, path, date_prefix)
+
+    def _read_file(self, name: str, path: str, date_prefix: str) -> Iterator[StrategyLogEvent]:
+        info = self._files.get(path) or {"offset": 0, "tail": "", "gz_stat": None}
+        offset = info["offset"]
+        is_gz = path.endswith(".gz")
+        consumed = offset
+        last_chunk = b""
+        try:
+            open_fn = gzip.open if is_gz else open
+            with open_fn(path, "rb") as f:
+                if offset:
+                    f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        # 쓰는 중인 마지막 줄 — 완결된 JSON 이 아니면 다음 read 로 미룬다.
+                        try:
+                            entry = self._loads(raw.strip()) if raw.strip() else None
+                        except Exception:
+                            break
+                    else:
+                        entry = None
+                    consumed += len(raw)
+                    last_chunk = (last_chunk + raw)[-_FINGERPRINT_BYTES:]
+                    self.bytes_read += len(raw)
+                    stripped = raw.strip()
+                    if not stripped:
+                        continue
+                    self.lines_read += 1
+                    if entry is None:
+                        try:
+                            entry = self._loads(stripped)
+                        except Exception:
+                            continue
+                    if not isinstance(entry, dict):
+                        continue
+                    ts = entry.get("timestamp", "")
+                    if not isinstance(ts, str) or not ts.startswith(date_prefix):
+                        continue
+                    data = entry.get("data")
+                    if isinstance(data, dict):
+                        yield StrategyLogEvent(name, path, entry.get("level", "INFO"), ts, data)
+        except Exception:
+            pass
+        finally:
+            if consumed != offset or path not in self._files:
+                tail = info.get("tail", "")
+                if consumed != offset and not is_gz:
+                    if len(last_chunk) >= min(consumed, _FINGERPRINT_BYTES):
+                        tail = _digest(last_chunk[-min(consumed, _FINGERPRINT_BYTES):])
+                    else:
+                        tail = self._tail_digest(path, consumed)
+                self._files[path] = {
+                    "offset": consumed,
+                    "tail": tail,
+                    "gz_stat": self._gz_stat(path) if is_gz else None,
+                }
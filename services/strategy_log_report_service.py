@@ -16,6 +16,7 @@ from common.strategy_identity import STRATEGY_IDENTITY_RESOLVER, StrategyStatus
 from common.trade_journal_comparison import compare_trade_journals
 from services.multiple_testing_bias_service import compute_multiple_testing_bias_summary
 from services.strategy_correlation_service import compute_strategy_correlation_summary
+from services.strategy_log_event_stream import StrategyLogEvent, StrategyLogEventStream
 from services.overnight_exposure_service import compute_overnight_exposure_summary
 from services.regime_performance_service import (
     BUCKET_KEYS,
@@ -30,6 +31,7 @@ from services.strategy_profitability_gate_service import (
     StrategyProfitabilityGateConfig,
     evaluate_strategy_profitability_gate,
 )
+from utils.atomic_json import write_json_atomic
 
 
 def _esc(value: Any) -> str:
@@ -469,6 +471,310 @@ def _fmt_date(date_str: str) -> str:
     return date_str
 
 
+# ── 섹션 누적기 ─────────────────────────────────────────────────────
+#
+# 리포트 섹션은 공유 이벤트 스트림(StrategyLogEventStream)을 한 번만 흘려보내며
+# 각자 상태를 누적한다. 상태는 target_date 단위로 유지되어 재실행 시 새로 덧붙은
+# 이벤트만 consume 하고, to_checkpoint()/from_checkpoint() 로 JSON 직렬화된다.
+# 누적기는 _build_section_accumulators 에 등록된 순서대로 각 이벤트를 받는다.
+
+
+class _ReportSectionAccumulator:
+    key: str = ""
+
+    def consume(self, event: StrategyLogEvent) -> None:
+        raise NotImplementedError
+
+    def to_checkpoint(self) -> dict:
+        raise NotImplementedError
+
+    def from_checkpoint(self, state: Mapping[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class _StrategyActivity:
+    """전략 1개의 스캔/매수/탈락/근접/후보 유동성 누적 상태."""
+
+    __slots__ = (
+        "scan_count", "bought", "rejected", "near_miss", "name_map",
+        "early_guard_skipped", "data_error_count", "candidate_liquidity_records",
+    )
+
+    def __init__(self) -> None:
+        self.scan_count: int = 0
+        self.bought: Dict[str, dict] = {}
+        self.rejected: Dict[str, dict] = {}
+        self.near_miss: Dict[str, dict] = {}
+        self.name_map: Dict[str, str] = {}
+        self.early_guard_skipped: set[str] = set()
+        self.data_error_count: int = 0
+        self.candidate_liquidity_records: List[dict] = []
+
+    def to_checkpoint(self) -> dict:
+        return {
+            "scan_count": self.scan_count,
+            "bought": self.bought,
+            "rejected": self.rejected,
+            "near_miss": self.near_miss,
+            "name_map": self.name_map,
+            "early_guard_skipped": sorted(self.early_guard_skipped),
+            "data_error_count": self.data_error_count,
+            "candidate_liquidity_records": self.candidate_liquidity_records,
+        }
+
+    @classmethod
+    def from_checkpoint(cls, state: Mapping[str, Any]) -> "_StrategyActivity":
+        activity = cls()
+        activity.scan_count = int(state.get("scan_count") or 0)
+        activity.bought = dict(state.get("bought") or {})
+        activity.rejected = dict(state.get("rejected") or {})
+        activity.near_miss = dict(state.get("near_miss") or {})
+        activity.name_map = dict(state.get("name_map") or {})
+        activity.early_guard_skipped = set(state.get("early_guard_skipped") or [])
+        activity.data_error_count = int(state.get("data_error_count") or 0)
+        activity.candidate_liquidity_records = list(state.get("candidate_liquidity_records") or [])
+        return activity
+
+
+class _StrategyActivitySection(_ReportSectionAccumulator):
+    """전략별 매수 완료/실패/근접 요약, 데이터 오류, 후보 유동성 레코드."""
+
+    key = "strategy_activity"
+
+    def __init__(self, service: "StrategyLogReportService") -> None:
+        self._service = service
+        self.by_strategy: Dict[str, _StrategyActivity] = {}
+
+    def get(self, name: str) -> _StrategyActivity:
+        return self.by_strategy.get(name) or _StrategyActivity()
+
+    def consume(self, event: StrategyLogEvent) -> None:
+        acc = self.by_strategy.get(event.strategy)
+        if acc is None:
+            acc = self.by_strategy[event.strategy] = _StrategyActivity()
+        ts, data = event.ts, event.data
+        event_name = data.get('event', '')
+        code = data.get('code', '')
+        name_map = acc.name_map
+        bought = acc.bought
+        rejected = acc.rejected
+        near_miss = acc.near_miss
+
+        if code and data.get('name'):
+            name_map[code] = data['name']
+
+        acc.candidate_liquidity_records.extend(
+            self._service._extract_candidate_liquidity_records(event.strategy, ts, data, name_map)
+        )
+
+        if event_name == 'scan_with_watchlist':
+            acc.scan_count = max(acc.scan_count, data.get('count', 0))
+
+        elif event_name == 'buy_signal_generated' and code:
+            metrics = data.get('metrics', {})
+            price = metrics.get('price', data.get('price', 0))
+            bought[code] = {
+                'name': name_map.get(code, data.get('name', code)),
+                'price': price,
+                'reason': data.get('reason', ''),
+                'time': ts[11:16] if len(ts) >= 16 else '',
+                'volatility_20d_annualized': _to_float(metrics.get('volatility_20d_annualized')),
+                # P1 1-6: 신호 metadata fallback (전략이 metrics 에 실어 보낼 때만 채워짐).
+                'entry_reason': (str(metrics.get('entry_reason')) if metrics.get('entry_reason') else None),
+                'confidence': _to_float(metrics.get('confidence')),
+                'expected_holding_period_days': _to_float(metrics.get('expected_holding_period_days')),
+            }
+            rejected.pop(code, None)
+            near_miss.pop(code, None)
+
+        elif event_name == 'execution_quality' and code:
+            pass  # _ExecutionQualitySection 이 집계
+
+        elif code and (event_name in StrategyLogReportService.REJECTED_EVENTS or event_name.endswith('_rejected')):
+            if code not in bought:
+                raw_reason = data.get('reason', '')
+                if _is_data_error_reason(raw_reason):
+                    # 데이터 오류는 전략 통계에서 제외하고 시스템 경고로 집계
+                    acc.data_error_count += 1
+                else:
+                    prev = rejected.get(code, {'name': '', 'reason': '', 'event': '', 'data': {}, 'count': 0})
+                    cand_name = name_map.get(code) or data.get('name', '') or prev['name'] or code
+                    rejected[code] = {
+                        'name': cand_name,
+                        'reason': _normalize_reason(data.get('reason', prev['reason'])),
+                        'event': event_name,
+                        'data': data,
+                        'count': prev['count'] + 1,
+                    }
+
+        if event_name == 'breakout_skipped' and data.get('reason') == 'early_morning_guard' and code:
+            acc.early_guard_skipped.add(code)
+            if code in near_miss:
+                near_miss[code]['note'] = _HTF_EARLY_GUARD_NOTE
+
+        if event_name in _NEAR_MISS_EVENTS and code and code not in bought:
+            reason = data.get('reason', '')
+            gate = _GATE_PRIORITY.get((event_name, reason), 0)
+            sort_metric = _near_miss_sort_metric(event_name, reason, data)
+            prev = near_miss.get(code)
+            should_replace = (
+                gate > 0 and sort_metric is not None and (
+                    not prev
+                    or gate > prev.get('gate', -1)
+                    or (gate == prev.get('gate') and sort_metric < prev.get('sort_metric', float('inf')))
+                )
+            )
+            if should_replace:
+                near_miss[code] = {
+                    'name': name_map.get(code, data.get('name', code)),
+                    'gate': gate,
+                    'sort_metric': sort_metric,
+                    'reason_kr': _reason_to_korean("HTF 패턴 감지" if event_name == "htf_pattern_detected" else reason),
+                    'metric_str': _build_metric_str(event_name, reason, data),
+                    'time': ts[11:16] if len(ts) >= 16 else '',
+                    'note': _HTF_EARLY_GUARD_NOTE if code in acc.early_guard_skipped else "",
+                }
+
+    def to_checkpoint(self) -> dict:
+        return {name: acc.to_checkpoint() for name, acc in self.by_strategy.items()}
+
+    def from_checkpoint(self, state: Mapping[str, Any]) -> None:
+        self.by_strategy = {
+            str(name): _StrategyActivity.from_checkpoint(item)
+            for name, item in (state or {}).items()
+            if isinstance(item, Mapping)
+        }
+
+
+class _MarketTimingSection(_ReportSectionAccumulator):
+    """시장별 최신 MA20 추세 타이밍 (헤더 표시 + 유니버스 커버리지 경고)."""
+
+    key = "market_timing"
+
+    def __init__(self, service: "StrategyLogReportService") -> None:
+        self.market_timing: Dict[str, Tuple[str, bool]] = {}
+
+    def consume(self, event: StrategyLogEvent) -> None:
+        data = event.data
+        if data.get('event', '') != 'market_timing_updated':
+            return
+        mkt = data.get('market', '')
+        if mkt and event.ts >= self.market_timing.get(mkt, ('', False))[0]:
+            self.market_timing[mkt] = (event.ts, data.get('ok', False))
+
+    def to_checkpoint(self) -> dict:
+        return {mkt: list(value) for mkt, value in self.market_timing.items()}
+
+    def from_checkpoint(self, state: Mapping[str, Any]) -> None:
+        self.market_timing = {
+            str(mkt): (str(value[0]), bool(value[1]))
+            for mkt, value in (state or {}).items()
+            if isinstance(value, (list, tuple)) and len(value) == 2
+        }
+
+
+class _ExecutionQualitySection(_ReportSectionAccumulator):
+    """execution_quality 이벤트 원본 레코드. 활성 전략 필터·종목명 보완은 리포트 시점에."""
+
+    key = "execution_quality"
+
+    def __init__(self, service: "StrategyLogReportService", activity: _StrategyActivitySection) -> None:
+        self._activity = activity
+        # 로그 전략 이름 → 레코드. 증분 실행에서도 전략 이름순 연결 순서가 유지된다.
+        self.records_by_strategy: Dict[str, List[dict]] = {}
+
+    def records(self) -> List[dict]:
+        return [
+            record
+            for name in sorted(self.records_by_strategy)
+            for record in self.records_by_strategy[name]
+        ]
+
+    def consume(self, event: StrategyLogEvent) -> None:
+        data = event.data
+        code = data.get('code', '')
+        if data.get('event', '') != 'execution_quality' or not code:
+            return
+        name_map = self._activity.get(event.strategy).name_map
+        self.records_by_strategy.setdefault(event.strategy, []).append({
+            "timestamp": event.ts,
+            "order_key": data.get("order_key") or None,
+            "strategy": _strategy_name_from_source(data.get("source") or data.get("strategy_name")),
+            "code": str(code).strip(),
+            "name": str(name_map.get(code) or data.get('name') or code),
+            "side": data.get("side", ""),
+            "state": data.get("state", ""),
+            "order_type": str(data.get("order_type") or "unknown"),
+            "spread_pct": _to_float(data.get("spread_pct")),
+            "order_qty": int(_to_float(data.get("order_qty")) or 0),
+            "filled_qty": int(_to_float(data.get("filled_qty")) or 0),
+            "remaining_qty": int(_to_float(data.get("remaining_qty")) or 0),
+            "fill_ratio_pct": _to_float(data.get("fill_ratio_pct")),
+            "unfilled_ratio_pct": _to_float(data.get("unfilled_ratio_pct")),
+            "order_age_sec": _to_float(data.get("order_age_sec")),
+            "slippage_amount_won": _to_float(data.get("slippage_amount_won")),
+            "slippage_pct": _to_float(data.get("slippage_pct")),
+            "first_fill_latency_sec": _to_float(data.get("first_fill_latency_sec")),
+        })
+
+    def to_checkpoint(self) -> dict:
+        return {"records_by_strategy": self.records_by_strategy}
+
+    def from_checkpoint(self, state: Mapping[str, Any]) -> None:
+        raw = (state or {}).get("records_by_strategy") or {}
+        self.records_by_strategy = {str(name): list(items) for name, items in raw.items()}
+
+
+def _build_section_accumulators(service: "StrategyLogReportService") -> Dict[str, _ReportSectionAccumulator]:
+    activity = _StrategyActivitySection(service)
+    sections: List[_ReportSectionAccumulator] = [
+        activity,
+        _MarketTimingSection(service),
+        _ExecutionQualitySection(service, activity),
+    ]
+    return {section.key: section for section in sections}
+
+
+class _ReportAccumulationState:
+    """target_date 1일치의 스트림 offset + 섹션 누적 상태."""
+
+    def __init__(self, service: "StrategyLogReportService", target_date: str) -> None:
+        self.target_date = target_date
+        self.stream = StrategyLogEventStream(_loads)
+        self.sections = _build_section_accumulators(service)
+
+    def consume_new(self, strategy_files: Mapping[str, List[str]]) -> int:
+        date_prefix = _fmt_date(self.target_date)
+        sections = list(self.sections.values())
+        count = 0
+        for event in self.stream.read_new(strategy_files, date_prefix):
+            count += 1
+            for section in sections:
+                section.consume(event)
+        return count
+
+    def to_checkpoint(self) -> dict:
+        return {
+            "version": 1,
+            "target_date": self.target_date,
+            "offsets": self.stream.checkpoint(),
+            "sections": {key: section.to_checkpoint() for key, section in self.sections.items()},
+        }
+
+    @classmethod
+    def from_checkpoint(
+        cls, service: "StrategyLogReportService", state: Mapping[str, Any],
+    ) -> Optional["_ReportAccumulationState"]:
+        if state.get("version") != 1 or not state.get("target_date"):
+            return None
+        restored = cls(service, str(state["target_date"]))
+        restored.stream = StrategyLogEventStream.from_checkpoint(state.get("offsets") or {}, _loads)
+        section_states = state.get("sections") or {}
+        for key, section in restored.sections.items():
+            section.from_checkpoint(section_states.get(key) or {})
+        return restored
+
+
 class StrategyLogReportService:
     """당일 전략 로그 파일을 분석하여 매수 완료/실패 요약 HTML 리포트를 생성한다.
 
@@ -492,6 +798,7 @@ class StrategyLogReportService:
         strategy_degradation_config: Optional[Any] = None,
         profitability_gate_config: Optional[Any] = None,
         premium_stocks_file: str = os.path.join("data", "premium_stocks.json"),
+        checkpoint_path: Optional[str] = None,
     ):
         self._log_dir = log_dir
         self._stock_code_repo = stock_code_repo
@@ -506,6 +813,10 @@ class StrategyLogReportService:
         self._last_strategy_degradation_candidates: List[dict] = []
         self._last_same_day_exit_violations: List[dict] = []
         self._last_operational_decision_report: str = ""
+        # 증분 리포트: target_date 단위 파일 offset + 섹션 누적 상태 (선택적으로 파일에 checkpoint)
+        self._checkpoint_path = checkpoint_path
+        self._accumulation: Optional[_ReportAccumulationState] = None
+        self._checkpoint_loaded = False
 
     def get_last_execution_quality_candidates(self) -> List[dict]:
         """최근 generate_report 실행에서 산출된 체결 품질 비활성화 후보 목록."""
@@ -559,6 +870,47 @@ class StrategyLogReportService:
                 result.setdefault(name, []).append(fpath)
         return result
 
+    # ── 증분 누적 상태 ──────────────────────────────────────────
+
+    def _accumulation_state_for(
+        self,
+        target_date: str,
+        strategy_files: Mapping[str, List[str]],
+    ) -> _ReportAccumulationState:
+        """target_date 의 누적 상태. 날짜가 바뀌었거나 읽은 파일이 변했으면 새로 만든다."""
+        if not self._checkpoint_loaded:
+            self._checkpoint_loaded = True
+            if self._accumulation is None:
+                self._accumulation = self._load_checkpoint()
+        state = self._accumulation
+        current_paths = [path for files in strategy_files.values() for path in files]
+        if (
+            state is None
+            or state.target_date != target_date
+            or not state.stream.is_consistent(current_paths)
+        ):
+            state = _ReportAccumulationState(self, target_date)
+        self._accumulation = state
+        return state
+
+    def _load_checkpoint(self) -> Optional[_ReportAccumulationState]:
+        if not self._checkpoint_path or not os.path.exists(self._checkpoint_path):
+            return None
+        try:
+            with open(self._checkpoint_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return _ReportAccumulationState.from_checkpoint(self, data)
+        except Exception:
+            return None
+
+    def _save_checkpoint(self, state: _ReportAccumulationState) -> None:
+        if not self._checkpoint_path:
+            return
+        try:
+            write_json_atomic(self._checkpoint_path, state.to_checkpoint(), indent=None)
+        except Exception:
+            pass
+
     # ── 로그 파싱 ────────────────────────────────────────────────
 
     def _iter_events(self, path: str, date_prefix: str):
@@ -2306,7 +2658,6 @@ class StrategyLogReportService:
         target_date: "YYYYMMDD" 형식
         전략별 매수 완료/실패를 분석한 HTML 리포트 문자열을 반환한다.
         """
-        date_prefix = f"{target_date[:4]}-{target_date[4:6]}-{target_date[6:8]}"
         self._last_execution_quality_candidates = []
         self._last_strategy_degradation_candidates = []
         # 전략 로그가 없는 날에도 미청산 잔량은 남아 있을 수 있다 — 두 경로 모두에서 본다.
@@ -2334,7 +2685,6 @@ class StrategyLogReportService:
 
         strategy_summaries: List[dict] = []
         inactive_names: List[str] = []
-        market_timing: Dict[str, Tuple[str, bool]] = {}
         has_executed_buy_source, executed_buys_by_strategy = self._executed_buys_by_strategy(target_date)
         enabled_strategy_keys = self._get_enabled_strategy_keys()
 
@@ -2343,123 +2693,30 @@ class StrategyLogReportService:
         execution_quality_records: List[dict] = []
         candidate_liquidity_records: List[dict] = []
 
-        for name, files in sorted(strategy_files.items()):
-            bought: Dict[str, dict] = {}
-            rejected: Dict[str, dict] = {}
-            scan_count: int = 0
-            near_miss: Dict[str, dict] = {}
-            name_map: Dict[str, str] = {}
-            early_guard_skipped: set[str] = set()
-            data_error_count: int = 0
-            strategy_candidate_liquidity_records: List[dict] = []
-
-            for fpath in sorted(files):
-                for _level, ts, data in self._iter_events(fpath, date_prefix):
-                    event = data.get('event', '')
-                    code = data.get('code', '')
-
-                    if code and data.get('name'):
-                        name_map[code] = data['name']
-
-                    strategy_candidate_liquidity_records.extend(
-                        self._extract_candidate_liquidity_records(name, ts, data, name_map)
-                    )
-
-                    if event == 'scan_with_watchlist':
-                        scan_count = max(scan_count, data.get('count', 0))
-
-                    elif event == 'market_timing_updated':
-                        mkt = data.get('market', '')
-                        if mkt and ts >= market_timing.get(mkt, ('', False))[0]:
-                            market_timing[mkt] = (ts, data.get('ok', False))
-
-                    elif event == 'buy_signal_generated' and code:
-                        metrics = data.get('metrics', {})
-                        price = metrics.get('price', data.get('price', 0))
-                        bought[code] = {
-                            'name': name_map.get(code, data.get('name', code)),
-                            'price': price,
-                            'reason': data.get('reason', ''),
-                            'time': ts[11:16] if len(ts) >= 16 else '',
-                            'volatility_20d_annualized': _to_float(metrics.get('volatility_20d_annualized')),
-                            # P1 1-6: 신호 metadata fallback (전략이 metrics 에 실어 보낼 때만 채워짐).
-                            'entry_reason': (str(metrics.get('entry_reason')) if metrics.get('entry_reason') else None),
-                            'confidence': _to_float(metrics.get('confidence')),
-                            'expected_holding_period_days': _to_float(metrics.get('expected_holding_period_days')),
-                        }
-                        rejected.pop(code, None)
-                        near_miss.pop(code, None)
-
-                    elif event == 'execution_quality' and code:
-                        name_value = name_map.get(code) or data.get('name') or code
-                        strategy_name = _strategy_name_from_source(data.get("source") or data.get("strategy_name"))
-                        if not self._is_strategy_enabled_for_report(strategy_name, enabled_strategy_keys):
-                            continue
-                        execution_quality_records.append({
-                            "timestamp": ts,
-                            "order_key": data.get("order_key") or f"{ts}:{code}:{len(execution_quality_records)}",
-                            "strategy": strategy_name,
-                            "code": str(code).strip(),
-                            "name": self._db_resolve(str(code).strip(), str(name_value)),
-                            "side": data.get("side", ""),
-                            "state": data.get("state", ""),
-                            "order_type": str(data.get("order_type") or "unknown"),
-                            "spread_pct": _to_float(data.get("spread_pct")),
-                            "order_qty": int(_to_float(data.get("order_qty")) or 0),
-                            "filled_qty": int(_to_float(data.get("filled_qty")) or 0),
-                            "remaining_qty": int(_to_float(data.get("remaining_qty")) or 0),
-                            "fill_ratio_pct": _to_float(data.get("fill_ratio_pct")),
-                            "unfilled_ratio_pct": _to_float(data.get("unfilled_ratio_pct")),
-                            "order_age_sec": _to_float(data.get("order_age_sec")),
-                            "slippage_amount_won": _to_float(data.get("slippage_amount_won")),
-                            "slippage_pct": _to_float(data.get("slippage_pct")),
-                            "first_fill_latency_sec": _to_float(data.get("first_fill_latency_sec")),
-                        })
-
-                    elif code and (event in self.REJECTED_EVENTS or event.endswith('_rejected')):
-                        if code not in bought:
-                            raw_reason = data.get('reason', '')
-                            if _is_data_error_reason(raw_reason):
-                                # 데이터 오류는 전략 통계에서 제외하고 시스템 경고로 집계
-                                data_error_count += 1
-                            else:
-                                prev = rejected.get(code, {'name': '', 'reason': '', 'event': '', 'data': {}, 'count': 0})
-                                cand_name = name_map.get(code) or data.get('name', '') or prev['name'] or code
-                                rejected[code] = {
-                                    'name': cand_name,
-                                    'reason': _normalize_reason(data.get('reason', prev['reason'])),
-                                    'event': event,
-                                    'data': data,
-                                    'count': prev['count'] + 1,
-                                }
-
-                    if event == 'breakout_skipped' and data.get('reason') == 'early_morning_guard' and code:
-                        early_guard_skipped.add(code)
-                        if code in near_miss:
-                            near_miss[code]['note'] = _HTF_EARLY_GUARD_NOTE
-
-                    if event in _NEAR_MISS_EVENTS and code and code not in bought:
-                        reason = data.get('reason', '')
-                        gate = _GATE_PRIORITY.get((event, reason), 0)
-                        sort_metric = _near_miss_sort_metric(event, reason, data)
-                        prev = near_miss.get(code)
-                        should_replace = (
-                            gate > 0 and sort_metric is not None and (
-                                not prev
-                                or gate > prev.get('gate', -1)
-                                or (gate == prev.get('gate') and sort_metric < prev.get('sort_metric', float('inf')))
-                            )
-                        )
-                        if should_replace:
-                            near_miss[code] = {
-                                'name': name_map.get(code, data.get('name', code)),
-                                'gate': gate,
-                                'sort_metric': sort_metric,
-                                'reason_kr': _reason_to_korean("HTF 패턴 감지" if event == "htf_pattern_detected" else reason),
-                                'metric_str': _build_metric_str(event, reason, data),
-                                'time': ts[11:16] if len(ts) >= 16 else '',
-                                'note': _HTF_EARLY_GUARD_NOTE if code in early_guard_skipped else "",
-                            }
+        state = self._accumulation_state_for(target_date, strategy_files)
+        state.consume_new(strategy_files)
+        self._save_checkpoint(state)
+        activity = state.sections[_StrategyActivitySection.key]
+        market_timing = dict(state.sections[_MarketTimingSection.key].market_timing)
+
+        for record in state.sections[_ExecutionQualitySection.key].records():
+            if not self._is_strategy_enabled_for_report(record["strategy"], enabled_strategy_keys):
+                continue
+            record = dict(record)
+            if not record["order_key"]:
+                record["order_key"] = f"{record['timestamp']}:{record['code']}:{len(execution_quality_records)}"
+            record["name"] = self._db_resolve(record["code"], record["name"])
+            execution_quality_records.append(record)
+
+        for name in sorted(strategy_files):
+            # 누적 상태는 다음 증분 실행에 재사용되므로 리포트용 사본에서 보완한다.
+            acc = activity.get(name)
+            bought = {code: dict(info) for code, info in acc.bought.items()}
+            rejected = {code: dict(info) for code, info in acc.rejected.items()}
+            near_miss = {code: dict(info) for code, info in acc.near_miss.items()}
+            scan_count = acc.scan_count
+            data_error_count = acc.data_error_count
+            strategy_candidate_liquidity_records = acc.candidate_liquidity_records
 
             # StockCodeRepository로 미해결 종목명 보완
             if has_executed_buy_source:
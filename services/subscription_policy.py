@@ -16,6 +16,9 @@ StreamingService와의 역할 구분:
   - HIGH   : 보유 종목 (Portfolio) — category_key: "portfolio"
   - MEDIUM : 전략 감시 종목, 프리미엄 종목, 관심종목 알림 — category_key: "strategy_*", "favorite"
   - LOW    : 웹 UI 조회 종목 — category_key: "ui_*"
+
+slot_allocator(SubscriptionSlotAllocator)가 주입되면 CRITICAL 외 종목의 배정 순서를
+우선순위 클래스 대신 기대 효용(보유·트리거 근접·변동폭·REST fallback 빈도) 점수로 정한다.
 """
 from __future__ import annotations
 
@@ -23,8 +26,9 @@ import logging
 import time
 import inspect
 from enum import IntEnum
-from typing import Dict, Set, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Set, List, Optional, TYPE_CHECKING
 
+from repositories.latest_price_table import LatestPriceTable
 from repositories.streaming_stock_repo import StreamingStockRepo, StreamingType
 
 if TYPE_CHECKING:
@@ -32,6 +36,7 @@ if TYPE_CHECKING:
     from repositories.stock_repository import StockRepository
     from core.logger import StreamingEventLogger
     from services.market_calendar_service import MarketCalendarService
+    from services.subscription_slot_allocator import SubscriptionSlotAllocator
 
 
 class SubscriptionPriority(IntEnum):
@@ -66,6 +71,7 @@ class SubscriptionPolicy:
         streaming_logger: Optional["StreamingEventLogger"] = None,
         streaming_stock_repo: Optional["StreamingStockRepo"] = None,
         market_calendar: Optional["MarketCalendarService"] = None,
+        slot_allocator: Optional["SubscriptionSlotAllocator"] = None,
     ):
         self._streaming = streaming_service
         self._stock_repo = stock_repo
@@ -82,6 +88,12 @@ class SubscriptionPolicy:
         self._active_codes_pt: Set[str] = set()
         self._external_reserved_slots = 0
 
+        # 효용 기반 슬롯 배정 (None 이면 기존 우선순위 클래스 순서)
+        self._slot_allocator = slot_allocator
+        # category_key -> { code -> 트리거 가격 } (전략이 알려준 진입/돌파 기준선)
+        self._trigger_levels: Dict[str, Dict[str, float]] = {}
+        self._rest_fallback_source: Optional[Callable[[], Dict[str, int]]] = None
+
         # summary 로그 스로틀 (동시 다발적 rebalance 호출로 인한 중복 발화 방지)
         self._last_summary_time: float = 0.0
         self._SUMMARY_THROTTLE_SEC: float = 2.0
@@ -105,6 +117,34 @@ class SubscriptionPolicy:
         """정책 외부에서 복원한 PT/주문통보 슬롯을 일반 구독 배정에서 제외한다."""
         self._external_reserved_slots = max(0, min(int(slots), self.MAX_WS_SLOTS))
 
+    def set_trigger_levels(self, category_key: str, levels: Dict[str, float]) -> None:
+        """카테고리의 종목별 트리거 가격을 통째로 교체한다 (슬롯 할당기의 근접도 점수용)."""
+        cleaned = {}
+        for code, level in (levels or {}).items():
+            try:
+                value = float(level)
+            except (TypeError, ValueError):
+                continue
+            if value > 0:
+                cleaned[str(code)] = value
+        if cleaned:
+            self._trigger_levels[category_key] = cleaned
+        else:
+            self._trigger_levels.pop(category_key, None)
+
+    def set_rest_fallback_source(self, source: Optional[Callable[[], Dict[str, int]]]) -> None:
+        """종목별 누적 REST fallback 카운터 공급자 (StockQueryService.rest_fallback_counts_snapshot)."""
+        self._rest_fallback_source = source
+
+    async def resolve_slot_allocation(self) -> bool:
+        """슬롯 할당기가 켜져 있고 재계산 주기가 됐으면 재배정한다 (워치독 주기 호출)."""
+        if self._slot_allocator is None or not self._refs:
+            return False
+        if not self._slot_allocator.is_due():
+            return False
+        await self._rebalance()
+        return True
+
     async def add_subscription(
         self, code: str, priority: SubscriptionPriority, 
         category_key: str, stream_type: StreamingType = StreamingType.UNIFIED_PRICE,
@@ -145,6 +185,7 @@ class SubscriptionPolicy:
 
     async def remove_category(self, category_key: str) -> None:
         """카테고리 전체의 구독을 한 번에 해제합니다 (전략 종료 시 사용)."""
+        self._trigger_levels.pop(category_key, None)
         codes_in_category = [c for c, cats in self._refs.items() if category_key in cats]
         for code in codes_in_category:
             self._refs[code].pop(category_key, None)
@@ -231,6 +272,10 @@ class SubscriptionPolicy:
             self._refs[code].pop(category_key, None)
             if not self._refs[code]:
                 del self._refs[code]
+        levels = self._trigger_levels.get(category_key)
+        if levels:
+            for code in removed_codes:
+                levels.pop(code, None)
 
         for code in new_codes:
             self._refs.setdefault(code, {})[category_key] = {
@@ -252,6 +297,65 @@ class SubscriptionPolicy:
         if rebalance:
             await self._rebalance()
 
+    def export_refs(self) -> Dict[str, Dict[str, dict]]:
+        """구독 요청 장부(_refs)를 직렬화 가능한 형태로 반환한다 (웜 리스타트 스냅샷용).
+
+        웹 UI 조회(ui_*) 요청은 화면을 떠나면 사라지는 일회성이라, 프로그램매매 구독은
+        워치독이 program_trading.db 에서 따로 복원하므로 제외한다.
+        """
+        exported: Dict[str, Dict[str, dict]] = {}
+        for code, cats in self._refs.items():
+            kept = {
+                category_key: {"priority": int(req["priority"]), "type": StreamingType(req["type"]).value}
+                for category_key, req in cats.items()
+                if not category_key.startswith("ui_")
+                and StreamingType(req["type"]) != StreamingType.PROGRAM_TRADING
+            }
+            if kept:
+                exported[code] = kept
+        return exported
+
+    def restore_refs(self, refs: Dict[str, Dict[str, dict]]) -> int:
+        """스냅샷 장부를 재조정 없이 _refs 에 되살린다. 이미 있는 (종목, 카테고리) 요청은 유지한다.
+
+        실제 구독은 다음 _rebalance()(기동 구독 초기화 · 워치독 복원)에서 한 번에 반영되고,
+        카테고리 소유자가 sync_subscriptions() 를 호출하면 낡은 요청은 그때 정리된다.
+        """
+        restored = 0
+        for code, cats in refs.items():
+            for category_key, req in cats.items():
+                current = self._refs.setdefault(code, {})
+                if category_key in current:
+                    continue
+                current[category_key] = {
+                    "priority": SubscriptionPriority(int(req["priority"])),
+                    "type": StreamingType(req["type"]),
+                }
+                restored += 1
+        return restored
+
+    def pending_price_requests(self) -> Dict[str, dict]:
+        """가격 구독을 요청했지만 슬롯을 받지 못한 종목 (RestPricePoller 의 폴링 대상).
+
+        반환: {code: {"priority": 최우선 요청 우선순위, "trigger_levels": [트리거 가격, ...]}}
+        """
+        pending: Dict[str, dict] = {}
+        for code, cats in self._refs.items():
+            if code in self._active_codes_price:
+                continue
+            price_reqs = [req for req in cats.values() if req["type"] == StreamingType.UNIFIED_PRICE]
+            if not price_reqs:
+                continue
+            pending[code] = {
+                "priority": min(int(req["priority"]) for req in price_reqs),
+                "trigger_levels": [
+                    levels_by_code[code]
+                    for levels_by_code in self._trigger_levels.values()
+                    if code in levels_by_code
+                ],
+            }
+        return pending
+
     def is_streaming(self, code: str) -> bool:
         """해당 종목이 현재 실시간 구독 중인지 여부."""
         return code in self._active_codes_price or code in self._active_codes_pt
@@ -264,7 +368,7 @@ class SubscriptionPolicy:
             best = min(int(p["priority"]) for p in cats.values())
             pending_by_priority.setdefault(best, []).append(code)
 
-        return {
+        status = {
             "active_count": len(self._active_codes_price) + len(self._active_codes_pt),
             "max_subscriptions": self.MAX_WS_SLOTS,
             "active_codes_price": sorted(self._active_codes_price),
@@ -277,6 +381,9 @@ class SubscriptionPolicy:
                 "LOW": sorted(pending_by_priority.get(int(SubscriptionPriority.LOW), [])),
             },
         }
+        if self._slot_allocator is not None:
+            status["slot_allocator"] = self._slot_allocator.get_stats()
+        return status
 
     # ── Internal rebalance logic ────────────────────────────────────
 
@@ -285,11 +392,8 @@ class SubscriptionPolicy:
         요청된 구독 목록을 우선순위로 정렬하여 MAX_WS_SLOTS 한도 내에서 최적 분배.
         변경이 필요한 종목만 구독/해지 처리하며, 변동 사항을 로깅함.
         """
-        def _best_priority(code: str) -> int:
-            return min(int(req["priority"]) for req in self._refs[code].values())
-
-        # 1. 우선순위 높은 순으로 정렬
-        ranked_codes = sorted(self._refs.keys(), key=lambda c: (_best_priority(c), c))
+        # 1. 우선순위(또는 할당기 효용 점수) 높은 순으로 정렬
+        ranked_codes = self._rank_codes()
         
         desired_price: Set[str] = set()
         desired_pt: Set[str] = set()
@@ -342,6 +446,7 @@ class SubscriptionPolicy:
             await self._do_unsubscribe(code, StreamingType.PROGRAM_TRADING)
 
         if not await self._ensure_websocket_connected_for_subscribe(to_subscribe_price | to_subscribe_pt):
+            self._note_allocator_active()
             return
 
         # 슬롯이 모자라 브로커가 일부를 거절하더라도 우선순위 높은 종목이 먼저 자리를 잡도록
@@ -351,6 +456,7 @@ class SubscriptionPolicy:
             await self._do_subscribe(code, StreamingType.UNIFIED_PRICE)
         for code in sorted(to_subscribe_pt, key=lambda c: subscribe_rank.get(c, len(ranked_codes))):
             await self._do_subscribe(code, StreamingType.PROGRAM_TRADING)
+        self._note_allocator_active()
 
         # 5. [기존 로직 복원] 한도 초과(Dropped) 경고 로그
         total_requested = sum(
@@ -389,6 +495,52 @@ class SubscriptionPolicy:
                     pending_by_priority=status.get("pending_by_priority", {}),
                 )
 
+    def _best_priority(self, code: str) -> int:
+        return min(int(req["priority"]) for req in self._refs[code].values())
+
+    def _rank_codes(self) -> List[str]:
+        """슬롯 배정 순서. 할당기가 없거나 실패하면 (우선순위, 종목코드) 순."""
+        if self._slot_allocator is not None:
+            try:
+                return self._rank_codes_by_utility()
+            except Exception as e:
+                self._logger.warning(f"SubscriptionPolicy: 슬롯 할당기 실패 — 우선순위 순서 사용 ({e})")
+        return sorted(self._refs.keys(), key=lambda c: (self._best_priority(c), c))
+
+    def _rank_codes_by_utility(self) -> List[str]:
+        from services.subscription_slot_allocator import build_candidate
+
+        allocator = self._slot_allocator
+        if self._rest_fallback_source is not None:
+            allocator.observe_rest_fallbacks(self._rest_fallback_source() or {})
+
+        table = getattr(self._stock_repo, "latest_prices", None)
+        if not isinstance(table, LatestPriceTable):
+            table = None
+        candidates = []
+        for code in self._refs:
+            quote = table.read(code) if table is not None else None
+            levels = [
+                levels_by_code[code]
+                for levels_by_code in self._trigger_levels.values()
+                if code in levels_by_code
+            ]
+            candidates.append(build_candidate(
+                code,
+                self._best_priority(code),
+                price=quote.price if quote else None,
+                high=quote.high if quote else None,
+                low=quote.low if quote else None,
+                open_price=quote.open if quote else None,
+                trigger_levels=levels,
+                rest_fallback_per_min=allocator.rest_fallback_rate(code),
+            ))
+        return allocator.rank(candidates, incumbents=set(self._active_codes_price))
+
+    def _note_allocator_active(self) -> None:
+        if self._slot_allocator is not None:
+            self._slot_allocator.note_active(self._active_codes_price)
+
     async def _ensure_websocket_connected_for_subscribe(self, codes: Set[str]) -> bool:
         if not codes:
             return True
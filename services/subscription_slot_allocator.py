@@ -0,0 +1,249 @@
+# services/subscription_slot_allocator.py
+"""
+WebSocket 실시간 슬롯을 "구독 1슬롯당 기대 효용" 순으로 배정하는 할당기.
+
+SubscriptionPolicy 의 기본 배정은 우선순위 클래스(CRITICAL/HIGH/MEDIUM/LOW) + 종목코드 순이라,
+거의 움직이지 않는 관심종목·UI 조회가 슬롯을 차지하는 동안 트리거 가격 근처의 전략 후보는
+REST 폴링(quotation_price 예산 소모, 수 초 지연)으로 밀려난다.
+
+이 할당기는 종목마다 다음 신호로 점수를 매겨 순위를 정한다.
+  - 보유 여부          : HIGH 요청(보유/진입 종목)이면 holding 가중치
+  - 트리거 근접도      : 전략이 알려준 트리거 가격까지 거리(%)가 trigger_band_pct 안일수록 큼
+  - 장중 변동폭        : (고가-저가)/시가 % — 많이 움직이는 종목일수록 틱 가치가 큼
+  - REST fallback 비용 : StockQueryService 가 종목별로 센 REST 대체 조회 빈도(회/분)
+  - 우선순위 사전값    : 신호가 없을 때 기존 클래스 순서를 유지하는 작은 기본 점수
+
+잦은 구독/해지(churn) 를 막기 위한 히스테리시스:
+  - 현재 구독 중인 종목은 swap_margin 만큼 가산점을 받는다 (도전자가 그만큼 더 높아야 교체)
+  - 구독한 지 min_hold_sec 가 지나지 않은 종목은 순위에서 밀리지 않는다
+CRITICAL(프로그램 매매) 요청은 점수와 무관하게 항상 맨 앞이고, 그다음이 HIGH(보유/진입) 요청이다.
+보유 종목은 청산 판단에 틱이 필요하므로 min_hold_sec 보호 중인 다른 종목에 밀리지 않는다.
+
+실제 구독/해지·슬롯 회계는 여전히 SubscriptionPolicy._rebalance 가 하고, 할당기는 순위만 바꾼다.
+scripts/simulate_subscription_allocation.py 가 같은 할당기로 기록된 하루를 재생해
+기존 우선순위 정책과 REST 호출 수·트리거 감지 지연을 비교한다.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+_CRITICAL = 0
+_HIGH = 1
+
+
+@dataclass(frozen=True)
+class SlotAllocatorWeights:
+    holding: float = 3.0
+    trigger_proximity: float = 4.0
+    volatility: float = 1.0
+    rest_fallback: float = 2.0
+    trigger_band_pct: float = 3.0  # 트리거까지 거리가 이 % 밖이면 근접 점수 0
+    volatility_cap_pct: float = 10.0  # 장중 변동폭 점수 포화 지점
+    rest_fallback_cap_per_min: float = 6.0  # REST fallback 점수 포화 지점 (회/분)
+    # 우선순위 클래스별 기본 점수 (CRITICAL, HIGH, MEDIUM, LOW)
+    priority_prior: Tuple[float, float, float, float] = (0.0, 1.0, 0.5, 0.1)
+
+
+@dataclass
+class SlotCandidate:
+    code: str
+    priority: int  # 요청 중 가장 높은 우선순위 (SubscriptionPriority 값)
+    is_holding: bool = False
+    trigger_distance_pct: Optional[float] = None
+    volatility_pct: Optional[float] = None
+    rest_fallback_per_min: float = 0.0
+
+
+@dataclass
+class _RankState:
+    resolves: int = 0
+    last_resolve_at: float = 0.0
+    subscribes: int = 0
+    unsubscribes: int = 0
+    last_scores: Dict[str, float] = field(default_factory=dict)
+
+
+class SubscriptionSlotAllocator:
+    """후보 종목을 기대 효용 순으로 정렬한다. 상태는 보유 시작 시각·REST fallback 빈도뿐이다."""
+
+    def __init__(
+        self,
+        weights: Optional[SlotAllocatorWeights] = None,
+        *,
+        swap_margin: float = 0.5,
+        min_hold_sec: float = 60.0,
+        resolve_interval_sec: float = 30.0,
+        rest_rate_smoothing: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.weights = weights or SlotAllocatorWeights()
+        self.swap_margin = max(0.0, float(swap_margin))
+        self.min_hold_sec = max(0.0, float(min_hold_sec))
+        self.resolve_interval_sec = max(0.0, float(resolve_interval_sec))
+        self._alpha = min(1.0, max(0.0, float(rest_rate_smoothing)))
+        self._clock = clock
+        self._held_since: Dict[str, float] = {}
+        self._rest_counts: Dict[str, int] = {}
+        self._rest_rates: Dict[str, float] = {}
+        self._rest_observed_at: Optional[float] = None
+        self._state = _RankState()
+
+    # ── 점수 ──────────────────────────────────────────────────────
+
+    def score(self, candidate: SlotCandidate) -> float:
+        w = self.weights
+        priority = min(max(int(candidate.priority), 0), len(w.priority_prior) - 1)
+        value = w.priority_prior[priority]
+        if candidate.is_holding:
+            value += w.holding
+        if candidate.trigger_distance_pct is not None and w.trigger_band_pct > 0:
+            closeness = 1.0 - abs(candidate.trigger_distance_pct) / w.trigger_band_pct
+            value += w.trigger_proximity * max(0.0, closeness)
+        if candidate.volatility_pct and w.volatility_cap_pct > 0:
+            value += w.volatility * min(candidate.volatility_pct / w.volatility_cap_pct, 1.0)
+        if candidate.rest_fallback_per_min > 0 and w.rest_fallback_cap_per_min > 0:
+            value += w.rest_fallback * min(candidate.rest_fallback_per_min / w.rest_fallback_cap_per_min, 1.0)
+        return value
+
+    def rank(
+        self,
+        candidates: Iterable[SlotCandidate],
+        incumbents: Set[str],
+        now: Optional[float] = None,
+    ) -> List[str]:
+        """배정 순서대로 종목코드를 반환한다. 호출자는 앞에서부터 슬롯이 찰 때까지 구독한다."""
+        now = self._clock() if now is None else now
+        keyed = []
+        scores: Dict[str, float] = {}
+        for candidate in candidates:
+            code = candidate.code
+            value = self.score(candidate)
+            scores[code] = value
+            if int(candidate.priority) == _CRITICAL:
+                tier = 0
+            elif candidate.is_holding or int(candidate.priority) == _HIGH:
+                tier = 1
+            elif code in incumbents and now - self._held_since.get(code, now) < self.min_hold_sec:
+                tier = 2
+            else:
+                tier = 3
+            effective = value + (self.swap_margin if code in incumbents else 0.0)
+            keyed.append((tier, -effective, code))
+        keyed.sort()
+        self._state.resolves += 1
+        self._state.last_resolve_at = now
+        self._state.last_scores = scores
+        return [code for _, _, code in keyed]
+
+    def note_active(self, codes: Iterable[str], now: Optional[float] = None) -> None:
+        """실제 구독 결과를 알려준다. 새로 들어온 종목부터 min_hold_sec 를 잰다."""
+        now = self._clock() if now is None else now
+        active = set(codes)
+        for code in active - self._held_since.keys():
+            self._held_since[code] = now
+            self._state.subscribes += 1
+        for code in self._held_since.keys() - active:
+            del self._held_since[code]
+            self._state.unsubscribes += 1
+
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """주기적 재계산 시점인지. 한 번도 풀지 않았으면 항상 True."""
+        now = self._clock() if now is None else now
+        if self._state.resolves == 0:
+            return True
+        return now - self._state.last_resolve_at >= self.resolve_interval_sec
+
+    # ── REST fallback 빈도 ────────────────────────────────────────
+
+    def observe_rest_fallbacks(self, counts: Mapping[str, int], now: Optional[float] = None) -> None:
+        """종목별 누적 REST fallback 카운터를 받아 분당 빈도(EWMA)로 갱신한다."""
+        now = self._clock() if now is None else now
+        previous_at = self._rest_observed_at
+        self._rest_observed_at = now
+        if previous_at is None or now <= previous_at:
+            self._rest_counts = dict(counts)
+            return
+        minutes = (now - previous_at) / 60.0
+        for code in set(counts) | set(self._rest_rates):
+            if code in self._held_since:
+                # 구독 중에는 fallback 이 관측되지 않는다. 빈도를 깎으면 다음 재배정에서 밀려났다가
+                # 다시 fallback 이 쌓여 돌아오는 진동이 생기므로 마지막 빈도를 유지한다.
+                continue
+            current = int(counts.get(code, 0))
+            delta = max(0, current - self._rest_counts.get(code, 0))
+            rate = delta / minutes
+            smoothed = self._alpha * rate + (1.0 - self._alpha) * self._rest_rates.get(code, rate)
+            if smoothed > 1e-6:
+                self._rest_rates[code] = smoothed
+            else:
+                self._rest_rates.pop(code, None)
+        self._rest_counts = dict(counts)
+
+    def rest_fallback_rate(self, code: str) -> float:
+        return self._rest_rates.get(code, 0.0)
+
+    def get_stats(self, top: int = 10) -> dict:
+        ranked = sorted(self._state.last_scores.items(), key=lambda item: (-item[1], item[0]))
+        return {
+            "resolves": self._state.resolves,
+            "subscribes": self._state.subscribes,
+            "unsubscribes": self._state.unsubscribes,
+            "held": len(self._held_since),
+            "top_scores": {code: round(value, 3) for code, value in ranked[:top]},
+        }
+
+
+def build_candidate(
+    code: str,
+    priority: int,
+    *,
+    price: Optional[float] = None,
+    high: Optional[float] = None,
+    low: Optional[float] = None,
+    open_price: Optional[float] = None,
+    trigger_levels: Iterable[float] = (),
+    rest_fallback_per_min: float = 0.0,
+) -> SlotCandidate:
+    """최신가·트리거 가격으로 SlotCandidate 를 만든다 (정책·시뮬레이터 공용)."""
+    distance = None
+    if price and price > 0:
+        distances = [abs(price - level) / price * 100.0 for level in trigger_levels if level and level > 0]
+        if distances:
+            distance = min(distances)
+    volatility = None
+    if open_price and open_price > 0 and high is not None and low is not None and high >= low:
+        volatility = (high - low) / open_price * 100.0
+    return SlotCandidate(
+        code=code,
+        priority=int(priority),
+        is_holding=int(priority) == _HIGH,
+        trigger_distance_pct=distance,
+        volatility_pct=volatility,
+        rest_fallback_per_min=rest_fallback_per_min,
+    )
+
+
+def build_slot_allocator(cfg: Optional[Mapping]) -> Optional[SubscriptionSlotAllocator]:
+    """config 의 subscription_slot_allocator 섹션(dict)으로 할당기를 만든다. 비활성이면 None."""
+    if not isinstance(cfg, Mapping) or not cfg.get("enabled", False):
+        return None
+    defaults = SlotAllocatorWeights()
+    weights = SlotAllocatorWeights(
+        holding=float(cfg.get("holding_weight", defaults.holding)),
+        trigger_proximity=float(cfg.get("trigger_weight", defaults.trigger_proximity)),
+        volatility=float(cfg.get("volatility_weight", defaults.volatility)),
+        rest_fallback=float(cfg.get("rest_fallback_weight", defaults.rest_fallback)),
+        trigger_band_pct=float(cfg.get("trigger_band_pct", defaults.trigger_band_pct)),
+        volatility_cap_pct=float(cfg.get("volatility_cap_pct", defaults.volatility_cap_pct)),
+        rest_fallback_cap_per_min=float(
+            cfg.get("rest_fallback_cap_per_min", defaults.rest_fallback_cap_per_min)
+        ),
+    )
+    return SubscriptionSlotAllocator(
+        weights,
+        swap_margin=float(cfg.get("swap_margin", 0.5)),
+        min_hold_sec=float(cfg.get("min_hold_sec", 60.0)),
+        resolve_interval_sec=float(cfg.get("resolve_interval_sec", 30.0)),
+    )
@@ -749,6 +749,28 @@ class TelegramReporter:
         )
         return await self._send_message(message)
 
+    @_serialized_report_send
+    async def send_disclosure_ai_update(self, disclosure, importance, ai_summary: str) -> bool:
+        """규칙 판정으로 먼저 나간 즉시 알림에 AI 본문 분석 요약을 이어서 보낸다."""
+        summary_text = str(ai_summary or "").strip()
+        if not summary_text:
+            return True
+        if len(summary_text) > _DISCLOSURE_AI_SUMMARY_MAX_CHARS:
+            summary_text = summary_text[: _DISCLOSURE_AI_SUMMARY_MAX_CHARS - 1].rstrip() + "…"
+        company = html.escape(str(disclosure.corp_name or disclosure.stock_code), quote=False)
+        stock_code = html.escape(str(disclosure.stock_code), quote=False)
+        report_name = html.escape(str(disclosure.report_name), quote=False)
+        message = (
+            "🤖 <b>공시 AI 분석 업데이트</b>\n\n"
+            f"<b>{company} ({stock_code})</b>\n"
+            f"<b>공시:</b> {report_name}\n"
+            f"<b>중요도:</b> {html.escape(str(importance.level), quote=False)} "
+            f"({int(importance.score)}점)\n\n"
+            f"{_format_disclosure_ai_summary_html(summary_text)}\n\n"
+            f'<a href="{disclosure.viewer_url}">DART 원문 보기</a>'
+        )
+        return await self._send_message(message)
+
     @_serialized_report_send
     async def send_disclosure_digest(self, stored_items, report_date: str) -> bool:
         """즉시 알림 기준 미만 공시를 일일 요약으로 전송한다."""
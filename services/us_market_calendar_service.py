@@ -141,3 +141,23 @@ class USMarketCalendarService:
             d -= timedelta(days=1)
         self._logger.warning(f"USMarketCalendar: {today_str} 기준 최근 거래일 탐색 실패")
         return None
+
+    async def get_latest_closed_trading_date(self) -> Optional[str]:
+        """정규장 마감까지 끝난 가장 최근 거래일 (YYYYMMDD).
+
+        오늘이 거래일이라도 마감(조기폐장 포함) 전이면 직전 거래일을 돌려준다 — 장중에 받은
+        미완성 일봉을 확정 봉으로 저장하지 않기 위한 기준일.
+        """
+        latest = await self.get_latest_trading_date()
+        if not latest:
+            return None
+        now = self._market_clock.get_current_kst_time()
+        if latest != now.strftime(_DATE_FMT) or now.strftime("%H:%M") >= self.get_close_time_str(latest):
+            return latest
+        d = self._parse(latest) - timedelta(days=1)
+        for _ in range(15):
+            candidate = d.strftime(_DATE_FMT)
+            if self.is_trading_day(candidate):
+                return candidate
+            d -= timedelta(days=1)
+        return None
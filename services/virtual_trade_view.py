@@ -0,0 +1,532 @@
+"""VirtualTradeView — /virtual/history·/virtual/chart 용 증분 materialized view.
+
+대시보드는 수 초마다 /virtual/history 를 폴링하는데, 요청마다 전체 거래를 다시 읽고
+종목명·현재가·수익률을 다시 계산한 뒤 pandas 집계를 돌리면 거래가 수천 건일 때 가장 무거운
+웹 경로가 된다. 이 view 는 apply_cost 별로 enrich 된 거래 행을 유지하고 바뀐 부분만 갱신한다.
+
+- 원장 변경은 `write_version()`(SQLite 변경 카운터)으로 O(1) 감지한다. 바뀌었을 때만 전체
+  거래를 다시 읽어 행 단위로 diff 하고, 달라진 행만 다시 enrich 한다.
+- 현재가는 실시간 체결가 캐시(`get_fresh_price` — REST 폴러 종목은 폴러 갱신 주기까지 신선)
+  → 60초 REST 캐시(`price_cache`) → `get_multi_price`(30종목 batch) 순으로 채우고,
+  가격이 바뀐 종목의 행만 다시 계산한다. 응답에 없던 종목은 TTL 동안 재조회하지 않는다.
+- 행이나 집계가 바뀔 때마다 단조 증가 version 을 올린다. 각 행은 마지막으로 바뀐 version 을
+  가지므로 `changes_since()` 로 특정 version 이후 변경분만 cursor 페이지로 돌려줄 수 있다.
+- 집계와 응답 payload 는 version 단위로 캐시하고 ETag 도 version 으로 만든다.
+
+version 은 view 생성 시각(ms)에서 시작하므로 재기동 후에도 이전 프로세스의 값보다 크다.
+클라이언트의 since 가 이 base 보다 작으면 삭제(tombstone)를 보장할 수 없어 reset(전체) 대상이다.
+
+원장이 `write_version()` 을 제공하지 않으면(정수가 아닌 값) 요청마다 다시 읽는다. 이 경우에도
+행 diff 덕분에 version/ETag 는 실제 내용이 바뀔 때만 바뀐다.
+
+설계 가정: 단일 event loop. refresh 는 asyncio.Lock 으로 직렬화한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from repositories.latest_price_table import PriceQuote
+
+PRICE_CACHE_TTL_SEC = 60.0
+MULTI_PRICE_BATCH = 30
+CHART_CACHE_TTL_SEC = 60.0
+DEFAULT_PAGE_LIMIT = 500
+
+_KST = timezone(timedelta(hours=9))
+
+# (현재가, 전일대비율, 캐시 폴백 여부, 가격 시각)
+PriceEntry = Tuple[float, float, bool, float]
+MultiPriceFetch = Callable[[List[str]], Awaitable[Any]]
+# code → StockQueryService.get_fresh_price 결과(FreshPrice) 또는 None
+FreshPriceLookup = Callable[[str], Any]
+Aggregate = Callable[[list, Any, bool], dict]
+
+
+def _coerce_version(value) -> Optional[Any]:
+    """write_version() 결과가 정수 또는 정수 tuple 일 때만 비교 가능한 버전으로 쓴다."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, tuple) and value and all(
+        isinstance(v, int) and not isinstance(v, bool) for v in value
+    ):
+        return value
+    return None
+
+
+def trade_row_keys(trades: List[dict]) -> List[str]:
+    """(전략, 종목, 매수일, 같은 조합 내 순번) 행 식별자. 원장 id 를 노출하지 않아도 재작성에 안정적이다."""
+    seen: Dict[str, int] = {}
+    keys = []
+    for trade in trades:
+        base = f"{trade.get('strategy')}|{trade.get('code')}|{trade.get('buy_date')}"
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        keys.append(f"{base}|{n}")
+    return keys
+
+
+def _price_signature(entry: Optional[PriceEntry]) -> Optional[tuple]:
+    """행 재계산 여부 판단용. 실시간/신규 가격은 시각이 바뀌어도 값이 같으면 같은 가격으로 본다."""
+    if entry is None:
+        return None
+    price, rate, cached, ts = entry
+    return price, rate, cached, (ts if cached else None)
+
+
+def enrich_trade(trade: dict, row_key: str, stock_name, price: Optional[PriceEntry], vm, apply_cost: bool) -> Tuple[dict, Optional[float]]:
+    """거래 1건에 종목명·현재가·수익률을 반영한 사본과, 보정이 필요한 매도가(없으면 None)를 반환한다."""
+    row = dict(trade)
+    row["row_key"] = row_key
+    row["stock_name"] = stock_name
+    fix_price = None
+
+    if price is not None:
+        cur, daily_rate, cached, ts = price
+        row["current_price"] = cur
+        row["is_cached"] = cached
+        row["cache_ts"] = ts
+        if row.get("status") == "HOLD":
+            bp = float(row.get("buy_price", 0) or 0)
+            qty = float(row.get("qty", 1) or 1)
+            row["daily_change_rate"] = daily_rate
+            row["return_rate"] = vm.calculate_return(bp, cur, qty, apply_cost=apply_cost)
+
+    if row.get("status") == "SOLD":
+        sp = float(row.get("sell_price") or 0)
+        bp = float(row.get("buy_price", 0) or 0)
+        qty = float(row.get("qty", 1) or 1)
+        if sp == 0.0 and row.get("current_price"):
+            cur = row["current_price"]
+            row["sell_price"] = cur
+            row["return_rate"] = vm.calculate_return(bp, cur, qty, apply_cost=apply_cost)
+            fix_price = cur
+        else:
+            row["return_rate"] = vm.calculate_return(bp, sp, qty, apply_cost=apply_cost)
+            row["sell_price"] = sp
+
+        # 미매도 가정 수익률 (매수가 → 현재가)
+        cur = row.get("current_price")
+        if cur:
+            row["hold_return_rate"] = vm.calculate_return(bp, float(cur), qty, apply_cost=apply_cost)
+
+    return row, fix_price
+
+
+class _CostState:
+    """apply_cost 값 하나에 대한 materialized 상태."""
+
+    def __init__(self, base_version: int) -> None:
+        self.source_version = None
+        self.loaded = False
+        self.order: List[str] = []
+        self.raw: Dict[str, dict] = {}
+        self.rows: Dict[str, dict] = {}            # 바뀌면 새 dict 로 교체 (캐시된 payload 와 공유)
+        self.row_versions: Dict[str, int] = {}
+        self.tombstones: Dict[str, int] = {}       # 삭제된 key → 삭제 version
+        self.keys_by_code: Dict[Any, List[str]] = {}
+        self.applied_prices: Dict[Any, Optional[tuple]] = {}
+        self.rows_version = base_version
+        self.version = base_version
+        self.agg: Optional[dict] = None
+        self.agg_key = None
+        self.payload: Optional[dict] = None
+        self.payload_version: Optional[int] = None
+
+    def trades(self) -> List[dict]:
+        return [self.rows[key] for key in self.order]
+
+
+class VirtualTradeView:
+    """가상 매매 이력/집계의 증분 materialized view."""
+
+    def __init__(
+        self,
+        vm,
+        *,
+        aggregate: Aggregate,
+        sanitize: Callable[[Any], Any] = lambda obj: obj,
+        fetch_multi_price: Optional[MultiPriceFetch] = None,
+        price_stream=None,
+        fresh_price: Optional[FreshPriceLookup] = None,
+        name_resolver=None,
+        price_cache: Optional[Dict[str, tuple]] = None,
+        price_ttl_sec: float = PRICE_CACHE_TTL_SEC,
+        chart_ttl_sec: float = CHART_CACHE_TTL_SEC,
+        clock: Callable[[], float] = time.time,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.vm = vm
+        self._aggregate = aggregate
+        self._sanitize = sanitize
+        self._fetch_multi_price = fetch_multi_price
+        self._price_stream = price_stream
+        self._fresh_price = fresh_price
+        self._name_resolver = name_resolver
+        self._price_cache = price_cache if price_cache is not None else {}
+        self._price_ttl_sec = float(price_ttl_sec)
+        self._chart_ttl_sec = float(chart_ttl_sec)
+        self._clock = clock
+        self._logger = logger or logging.getLogger(__name__)
+
+        self.base_version = int(clock() * 1000)
+        self._version = self.base_version
+        self._states: Dict[bool, _CostState] = {}
+        self._names: Dict[Any, Any] = {}
+        self._prices: Dict[Any, PriceEntry] = {}   # 종목별 마지막으로 알던 가격
+        self._fetch_attempted: Dict[str, float] = {}
+        self._chart_cache: Dict[tuple, dict] = {}
+        self._lock = asyncio.Lock()
+        self._stats: Dict[str, int] = {
+            "refreshes": 0,
+            "reloads": 0,           # 원장 변경으로 전체 거래를 다시 읽은 횟수
+            "rows_enriched": 0,     # 다시 enrich 한 행 수
+            "aggregations": 0,      # pandas 집계 실행 횟수
+            "price_fetch_calls": 0,
+            "chart_hits": 0,
+            "chart_builds": 0,
+        }
+
+    # ── 조회 ─────────────────────────────────────────────────────────
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def version(self, apply_cost: bool) -> int:
+        return self._state(apply_cost).version
+
+    def etag(self, apply_cost: bool) -> str:
+        return f'"vt-{int(bool(apply_cost))}-{self._state(apply_cost).version}"'
+
+    def payload(self, apply_cost: bool) -> dict:
+        """전체 이력 응답. version 이 바뀌지 않았으면 직전에 만든 dict 를 그대로 돌려준다."""
+        state = self._state(apply_cost)
+        if state.payload is None or state.payload_version != state.version:
+            state.payload = self._sanitize({
+                "trades": state.trades(),
+                **(state.agg or {}),
+                "version": state.version,
+            })
+            state.payload_version = state.version
+        return state.payload
+
+    def changes_since(self, apply_cost: bool, since: int, *, cursor: Optional[str] = None,
+                      limit: int = DEFAULT_PAGE_LIMIT) -> Optional[dict]:
+        """since 이후 바뀐 행/삭제된 key 를 (version, key) 순 cursor 페이지로 반환한다.
+
+        since 를 보장할 수 없으면(다른 프로세스의 version 등) None — 호출자는 전체를 다시 준다.
+        """
+        state = self._state(apply_cost)
+        if since < self.base_version or since > state.version:
+            return None
+
+        entries = [(v, key, False) for key, v in state.row_versions.items() if v > since]
+        entries.extend((v, key, True) for key, v in state.tombstones.items() if v > since)
+        entries.sort(key=lambda e: (e[0], e[1]))
+
+        start = 0
+        after = _parse_cursor(cursor)
+        if after is not None:
+            start = next(
+                (i for i, (v, key, _) in enumerate(entries) if (v, key) > after),
+                len(entries),
+            )
+        limit = max(1, int(limit))
+        page = entries[start:start + limit]
+        has_more = start + limit < len(entries)
+
+        agg = state.agg or {}
+        return self._sanitize({
+            "version": state.version,
+            "since": since,
+            "trades": [state.rows[key] for _, key, removed in page if not removed],
+            "removed": [key for _, key, removed in page if removed],
+            "next_cursor": f"{page[-1][0]}:{page[-1][1]}" if has_more else None,
+            "has_more": has_more,
+            **agg,
+        })
+
+    # ── 갱신 ─────────────────────────────────────────────────────────
+
+    async def refresh(self, apply_cost: bool, *, force_code: Optional[str] = None) -> int:
+        """원장 변경·가격 변화를 반영하고 현재 version 을 반환한다."""
+        async with self._lock:
+            self._stats["refreshes"] += 1
+            state = self._state(apply_cost)
+            source_version = self.source_version()
+            if not state.loaded or source_version is None or source_version != state.source_version:
+                self._reload(state, apply_cost)
+                state.source_version = source_version
+
+            prices = await self._collect_prices(list(state.keys_by_code), force_code)
+            self._apply_prices(state, apply_cost, prices)
+            await self._refresh_aggregate(state, apply_cost, source_version)
+            return state.version
+
+    def source_version(self):
+        getter = getattr(self.vm, "write_version", None)
+        if getter is None:
+            return None
+        try:
+            return _coerce_version(getter())
+        except Exception as e:
+            self._logger.debug(f"[VirtualTradeView] write_version 조회 실패: {e}")
+            return None
+
+    def _state(self, apply_cost: bool) -> _CostState:
+        key = bool(apply_cost)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _CostState(self.base_version)
+        return state
+
+    def _next_version(self) -> int:
+        self._version += 1
+        return self._version
+
+    def _stock_name(self, code: str):
+        if code in self._names:
+            return self._names[code]
+        name = ""
+        if self._name_resolver is not None:
+            name = self._name_resolver.get_name_by_code(code)
+        if not isinstance(name, str):
+            return ""  # 이름을 모르면 매퍼 누락과 같이 빈 문자열 — 응답은 orjson 이 그대로 직렬화한다
+        self._names[code] = name
+        return name
+
+    def _reload(self, state: _CostState, apply_cost: bool) -> None:
+        self._stats["reloads"] += 1
+        trades = [t for t in self.vm.get_all_trades(apply_cost=apply_cost) if t.get("status") != "FAILED"]
+        keys = trade_row_keys(trades)
+        version = None
+        new_raw: Dict[str, dict] = {}
+        keys_by_code: Dict[Any, List[str]] = {}
+        for key, trade in zip(keys, trades):
+            new_raw[key] = trade
+            code = trade.get("code")
+            if str(code if code is not None else "").strip():
+                keys_by_code.setdefault(code, []).append(key)
+            if state.raw.get(key) == trade and key in state.rows:
+                continue
+            version = version or self._next_version()
+            self._enrich_into(state, key, trade, apply_cost, version)
+            state.tombstones.pop(key, None)
+
+        removed = [key for key in state.order if key not in new_raw]
+        if removed:
+            version = version or self._next_version()
+            for key in removed:
+                state.rows.pop(key, None)
+                state.row_versions.pop(key, None)
+                state.tombstones[key] = version
+
+        if keys != state.order:
+            version = version or self._next_version()
+        state.order = keys
+        state.raw = new_raw
+        state.keys_by_code = keys_by_code
+        state.loaded = True
+        if version is not None:
+            state.rows_version = state.version = version
+
+    def _enrich_into(self, state: _CostState, key: str, trade: dict, apply_cost: bool, version: int) -> None:
+        code = trade.get("code")
+        price = self._latest_price(code)
+        name = ""
+        try:
+            name = self._stock_name(str(code if code is not None else ""))
+            row, fix_price = enrich_trade(trade, key, name, price, self.vm, apply_cost)
+        except Exception as e:
+            self._logger.error(f"[WebAPI] virtual/history enrichment 오류: {e}")
+            row, fix_price = {**trade, "row_key": key, "stock_name": name}, None
+        if fix_price is not None:
+            try:
+                self.vm.fix_sell_price(code, trade.get("buy_date", ""), fix_price)
+            except Exception:
+                pass
+        state.rows[key] = row
+        state.row_versions[key] = version
+        state.applied_prices[code] = _price_signature(price)
+        self._stats["rows_enriched"] += 1
+
+    # ── 가격 ─────────────────────────────────────────────────────────
+
+    def _latest_price(self, code) -> Optional[PriceEntry]:
+        return self._prices.get(code)
+
+    def _stream_price(self, code: str, now: float) -> Optional[PriceEntry]:
+        """최신가 테이블 값. fresh_price 가 있으면 REST 폴러 갱신 주기까지 신선한 값으로 본다."""
+        max_age = self._price_ttl_sec
+        try:
+            if self._fresh_price is not None:
+                fresh = self._fresh_price(code)
+                if fresh is None:
+                    return None
+                quote, max_age = fresh.quote, max(max_age, fresh.max_age_sec)
+            elif self._price_stream is not None:
+                quote = self._price_stream.get_price_quote(code)
+            else:
+                return None
+        except Exception:
+            return None
+        if not isinstance(quote, PriceQuote):
+            return None
+        price = int(quote.price)
+        if price <= 0 or now - quote.received_at >= max_age:
+            return None
+        return price, quote.rate, False, quote.received_at
+
+    def _fresh_cached_price(self, code: str, now: float) -> Optional[PriceEntry]:
+        cached = self._price_cache.get(code)
+        if not cached:
+            return None
+        price, rate, ts = cached
+        if now - ts >= self._price_ttl_sec:
+            return None
+        return price, rate, False, ts
+
+    async def _collect_prices(self, codes: List[Any], force_code: Optional[str]) -> Dict[Any, PriceEntry]:
+        now = self._clock()
+        result: Dict[Any, PriceEntry] = {}
+        fetch_codes: List[Any] = []
+        for code in codes:
+            if code != force_code:
+                entry = self._stream_price(code, now) or self._fresh_cached_price(code, now)
+                if entry is not None:
+                    result[code] = entry
+                    continue
+                attempted = self._fetch_attempted.get(code)
+                if attempted is not None and now - attempted < self._price_ttl_sec:
+                    # 직전 조회에서 응답이 없던 종목 — TTL 동안은 마지막으로 알던 값 유지
+                    previous = self._latest_price(code)
+                    if previous is not None:
+                        result[code] = previous
+                    continue
+            fetch_codes.append(code)
+
+        if fetch_codes and self._fetch_multi_price is not None:
+            for batch_start in range(0, len(fetch_codes), MULTI_PRICE_BATCH):
+                batch = fetch_codes[batch_start:batch_start + MULTI_PRICE_BATCH]
+                self._stats["price_fetch_calls"] += 1
+                for code in batch:
+                    self._fetch_attempted[code] = now
+                try:
+                    resp = await self._fetch_multi_price(batch)
+                    if resp and resp.rt_cd == "0" and isinstance(resp.data, list):
+                        for item in resp.data:
+                            if not isinstance(item, dict):
+                                continue
+                            code = item.get("stck_shrn_iscd", "")
+                            if not code:
+                                continue
+                            price_val = int(float(item.get("stck_prpr", "0")))
+                            rate_val = _parse_rate(item.get("prdy_ctrt", "0"))
+                            if price_val > 0:
+                                fetched_at = self._clock()
+                                self._price_cache[code] = (price_val, rate_val, fetched_at)
+                                result[code] = (price_val, rate_val, False, fetched_at)
+                except Exception as e:
+                    self._logger.error(f"[WebAPI] 복수종목 조회 예외: {e}")
+
+            # API 실패 시 기존 캐시 폴백
+            for code in fetch_codes:
+                if code not in result and code in self._price_cache:
+                    cached_price, cached_rate, cached_time = self._price_cache[code]
+                    result[code] = (cached_price, cached_rate, True, cached_time)
+
+        self._prices.update(result)
+        return result
+
+    def _apply_prices(self, state: _CostState, apply_cost: bool, prices: Dict[Any, PriceEntry]) -> None:
+        version = None
+        for code, entry in prices.items():
+            signature = _price_signature(entry)
+            if state.applied_prices.get(code) == signature:
+                continue
+            keys = state.keys_by_code.get(code)
+            if not keys:
+                continue
+            version = version or self._next_version()
+            for key in keys:
+                self._enrich_into(state, key, state.raw[key], apply_cost, version)
+        if version is not None:
+            state.rows_version = state.version = version
+
+    # ── 집계 ─────────────────────────────────────────────────────────
+
+    async def _refresh_aggregate(self, state: _CostState, apply_cost: bool, source_version) -> None:
+        today = datetime.now(_KST).strftime("%Y-%m-%d")
+        key = (state.rows_version, source_version, today) if source_version is not None else None
+        if key is not None and key == state.agg_key and state.agg is not None:
+            return
+        self._stats["aggregations"] += 1
+        loop = asyncio.get_running_loop()
+        # CPU-bound pandas 집계는 thread pool 로 위임 (이벤트 루프 차단 방지)
+        agg = await loop.run_in_executor(None, self._aggregate, state.trades(), self.vm, apply_cost)
+        state.agg_key = key
+        if agg != state.agg:
+            state.agg = agg
+            state.version = self._next_version()
+
+    # ── 차트 ─────────────────────────────────────────────────────────
+
+    def get_chart(self, cache_key: tuple) -> Optional[dict]:
+        """같은 원장 version·날짜에서 TTL 안에 만든 차트 응답({payload, etag}) 또는 None."""
+        entry = self._chart_cache.get(cache_key)
+        source_version = self.source_version()
+        if (
+            entry is None
+            or source_version is None
+            or entry["source_version"] != source_version
+            or entry["day"] != datetime.now(_KST).strftime("%Y-%m-%d")
+            or self._clock() - entry["built_at"] >= self._chart_ttl_sec
+        ):
+            return None
+        self._stats["chart_hits"] += 1
+        return entry
+
+    def store_chart(self, cache_key: tuple, payload: dict) -> dict:
+        """차트 응답을 저장한다. 내용이 직전과 같으면 ETag 를 유지해 304 가 계속 유효하다."""
+        self._stats["chart_builds"] += 1
+        previous = self._chart_cache.get(cache_key)
+        if previous is not None and previous["payload"] == payload:
+            version = previous["version"]
+        else:
+            version = self._next_version()
+        entry = {
+            "payload": payload,
+            "version": version,
+            "etag": f'"vc-{version}"',
+            "source_version": self.source_version(),
+            "day": datetime.now(_KST).strftime("%Y-%m-%d"),
+            "built_at": self._clock(),
+        }
+        self._chart_cache[cache_key] = entry
+        return entry
+
+
+def _parse_rate(value) -> float:
+    if value in (None, "N/A", "", "None"):
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _parse_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    if not cursor:
+        return None
+    version, sep, key = str(cursor).partition(":")
+    if not sep:
+        return None
+    try:
+        return int(version), key
+    except ValueError:
+        return None
@@ -0,0 +1,263 @@
+# services/warm_restart_snapshot_service.py
+"""
+웜 리스타트 스냅샷 — 장중 hot state 를 주기적으로 파일에 떠 두고 재기동 시 되살린다.
+
+대상 (섹션):
+  - symbol_master    : StockCodeRepository 종목 마스터 (SQLite 로드 생략)
+  - ohlcv_*          : StockRepository OHLCV 캐시에 올라온 활성 종목의 확정 일봉 (numpy 배열)
+  - indicator_*      : IndicatorService 증분 캐시의 확정 지표 시계열 (numpy 배열, 재계산 생략)
+  - latest_ticks     : PriceStreamService 종목별 최신가
+  - subscription_refs: SubscriptionPolicy 구독 요청 장부
+
+수집(collect)은 이벤트 루프에서 얕은 복사만 하고, 배열 인코딩·파일 쓰기(write)는 스레드에서
+돈다. 복원(restore)은 이미 채워진 값을 덮지 않으므로 콜드 경로(DB 조회·장전 웜업)와 섞여도 안전하다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from repositories.warm_restart_snapshot_repository import HotStateSnapshot, WarmRestartSnapshotRepository
+from services.indicator_service import DEFAULT_WARMUP_INDICATORS
+
+if TYPE_CHECKING:
+    from repositories.stock_code_repository import StockCodeRepository
+    from repositories.stock_repository import StockRepository
+    from services.indicator_service import IndicatorService
+    from services.price_stream_service import PriceStreamService
+    from services.subscription_policy import SubscriptionPolicy
+
+_OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _to_float_matrix(rows: List[List]) -> np.ndarray:
+    """None 을 NaN 으로 바꾼 float64 행렬."""
+    return np.array([[np.nan if v is None else v for v in row] for row in rows], dtype=np.float64)
+
+
+def _decode_values(block: np.ndarray, integral: bool) -> List[List]:
+    """float64 행렬을 파이썬 값으로 되돌린다. NaN → None, integral 이면 int."""
+    if integral and not np.isnan(block).any():
+        return block.astype(np.int64).tolist()
+    cast = int if integral else float
+    return [[None if v != v else cast(v) for v in row] for row in block.tolist()]
+
+
+class WarmRestartSnapshotService:
+    """hot state 수집·저장과 재기동 시 복원을 담당한다."""
+
+    def __init__(
+        self,
+        repository: WarmRestartSnapshotRepository,
+        *,
+        stock_code_repository: Optional["StockCodeRepository"] = None,
+        stock_repository: Optional["StockRepository"] = None,
+        indicator_service: Optional["IndicatorService"] = None,
+        price_stream_service: Optional["PriceStreamService"] = None,
+        subscription_policy: Optional["SubscriptionPolicy"] = None,
+        logger=None,
+        ohlcv_limit: int = 600,
+        indicator_specs=DEFAULT_WARMUP_INDICATORS,
+    ) -> None:
+        self._repository = repository
+        self._stock_code_repository = stock_code_repository
+        self._stock_repository = stock_repository
+        self._indicator_service = indicator_service
+        self._price_stream_service = price_stream_service
+        self._subscription_policy = subscription_policy
+        self._logger = logger or logging.getLogger(__name__)
+        self._ohlcv_limit = int(ohlcv_limit)
+        self._indicator_specs = indicator_specs
+        self._last_capture: Dict = {}
+        self._last_restore: Dict = {}
+
+    @property
+    def repository(self) -> WarmRestartSnapshotRepository:
+        return self._repository
+
+    # ── 저장 ───────────────────────────────────────────────────────
+
+    async def capture(self, trading_date: str) -> Dict:
+        """현재 hot state 를 수집해 스냅샷 파일로 저장하고 통계를 반환한다."""
+        started = time.perf_counter()
+        collected = self.collect()
+        stats = await asyncio.to_thread(self.write, trading_date, collected)
+        stats["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self._last_capture = stats
+        return stats
+
+    def collect(self) -> Dict:
+        """이벤트 루프에서 각 컴포넌트 상태를 얕게 복사한다 (인코딩은 write 에서)."""
+        collected: Dict = {"symbol_master": None, "ohlcv": {}, "indicators": {}, "ticks": {}, "refs": {}}
+        if self._stock_code_repository is not None and getattr(self._stock_code_repository, "df", None) is not None:
+            collected["symbol_master"] = self._stock_code_repository.to_snapshot()
+        if self._stock_repository is not None:
+            collected["ohlcv"] = self._stock_repository.export_ohlcv_cache(ohlcv_limit=self._ohlcv_limit)
+        if self._indicator_service is not None:
+            for code, historical in collected["ohlcv"].items():
+                collected["indicators"].update(
+                    self._indicator_service.export_confirmed_indicators(code, historical, self._indicator_specs)
+                )
+        if self._price_stream_service is not None:
+            collected["ticks"] = self._price_stream_service.export_latest_prices()
+        if self._subscription_policy is not None:
+            collected["refs"] = self._subscription_policy.export_refs()
+        return collected
+
+    def write(self, trading_date: str, collected: Dict) -> Dict:
+        """수집 결과를 배열/문서 섹션으로 인코딩해 원자 저장한다 (스레드에서 호출)."""
+        arrays: Dict[str, np.ndarray] = {}
+        documents: Dict = {
+            "latest_ticks": collected["ticks"],
+            "subscription_refs": collected["refs"],
+        }
+        if collected["symbol_master"] is not None:
+            documents["symbol_master"] = collected["symbol_master"]
+
+        ohlcv_codes: List[str] = []
+        ohlcv_counts: List[int] = []
+        ohlcv_dates: List[str] = []
+        ohlcv_values: List[List] = []
+        for code, historical in collected["ohlcv"].items():
+            ohlcv_codes.append(code)
+            ohlcv_counts.append(len(historical))
+            for row in historical:
+                ohlcv_dates.append(str(row.get("date")))
+                ohlcv_values.append([row.get(field) for field in _OHLCV_FIELDS])
+        values = _to_float_matrix(ohlcv_values) if ohlcv_values else np.empty((0, len(_OHLCV_FIELDS)))
+        arrays["ohlcv_dates"] = np.array(ohlcv_dates, dtype="S")
+        arrays["ohlcv_values"] = values
+        finite = values[~np.isnan(values)]
+        documents["ohlcv_index"] = {
+            "codes": ohlcv_codes,
+            "counts": ohlcv_counts,
+            "integral": bool(np.all(finite == np.floor(finite))),
+        }
+
+        index: Dict[str, dict] = {}
+        indicator_dates: List[str] = []
+        indicator_values: List[float] = []
+        for cache_key, rows in collected["indicators"].items():
+            columns = [k for k in rows[0] if k not in ("code", "date")]
+            index[cache_key] = {
+                "code": rows[0].get("code"),
+                "columns": columns,
+                "date_start": len(indicator_dates),
+                "value_start": len(indicator_values),
+                "rows": len(rows),
+            }
+            for row in rows:
+                indicator_dates.append(str(row.get("date")))
+                indicator_values.extend(row.get(column) for column in columns)
+        arrays["indicator_dates"] = np.array(indicator_dates, dtype="S")
+        arrays["indicator_values"] = np.array(
+            [np.nan if v is None else v for v in indicator_values], dtype=np.float64,
+        )
+        documents["indicator_index"] = index
+
+        size = self._repository.write(trading_date, arrays=arrays, documents=documents)
+        return {
+            "trading_date": trading_date,
+            "bytes": size,
+            "symbols": len(collected["symbol_master"]["rows"]) if collected["symbol_master"] else 0,
+            "ohlcv_codes": len(ohlcv_codes),
+            "indicator_series": len(index),
+            "ticks": len(collected["ticks"]),
+            "subscription_codes": len(collected["refs"]),
+        }
+
+    # ── 복원 ───────────────────────────────────────────────────────
+
+    def load(self, trading_date: str) -> Optional[HotStateSnapshot]:
+        """trading_date 기준으로 유효한 스냅샷을 연다. 없거나 어긋나면 None."""
+        return self._repository.load(trading_date)
+
+    def restore(self, snapshot: HotStateSnapshot) -> Dict:
+        """스냅샷을 각 컴포넌트에 되살리고 섹션별 복원 수·소요(ms)를 반환한다.
+
+        종목 마스터는 기동 그래프의 code_master 단계가 StockCodeRepository.from_snapshot 으로
+        먼저 복원하므로 여기서는 다루지 않는다.
+        """
+        started = time.perf_counter()
+        counts: Dict[str, int] = {"ohlcv": 0, "indicators": 0, "ticks": 0, "subscriptions": 0}
+
+        histories = self.decode_ohlcv(snapshot)
+        if self._stock_repository is not None and histories:
+            counts["ohlcv"] = self._stock_repository.restore_ohlcv_cache(histories)
+        if self._indicator_service is not None:
+            counts["indicators"] = self._indicator_service.restore_confirmed_indicators(
+                self.decode_indicators(snapshot)
+            )
+        if self._price_stream_service is not None:
+            counts["ticks"] = self._price_stream_service.restore_latest_prices(
+                snapshot.documents.get("latest_ticks") or {}
+            )
+        if self._subscription_policy is not None:
+            counts["subscriptions"] = self._subscription_policy.restore_refs(
+                snapshot.documents.get("subscription_refs") or {}
+            )
+
+        self._last_restore = {
+            "trading_date": snapshot.trading_date,
+            "age_sec": round(max(0.0, time.time() - snapshot.created_at), 1),
+            "bytes": snapshot.size_bytes,
+            "restored": counts,
+            "restore_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        self._logger.info(
+            f"[WarmRestartSnapshot] 복원 완료 (기준일 {snapshot.trading_date}, "
+            f"스냅샷 {self._last_restore['age_sec']:.0f}초 전) 일봉 {counts['ohlcv']}종목, "
+            f"지표 {counts['indicators']}건, 최신가 {counts['ticks']}종목, 구독 요청 {counts['subscriptions']}건 "
+            f"({self._last_restore['restore_ms']:.0f}ms)"
+        )
+        return dict(self._last_restore)
+
+    @staticmethod
+    def decode_ohlcv(snapshot: HotStateSnapshot) -> Dict[str, List[Dict]]:
+        index = snapshot.documents.get("ohlcv_index") or {}
+        codes = index.get("codes") or []
+        if not codes:
+            return {}
+        dates = snapshot.arrays["ohlcv_dates"].astype(str).tolist()
+        values = _decode_values(snapshot.arrays["ohlcv_values"], bool(index.get("integral")))
+        histories: Dict[str, List[Dict]] = {}
+        start = 0
+        for code, count in zip(codes, index.get("counts") or []):
+            histories[code] = [
+                dict(zip(_OHLCV_FIELDS, row), date=day)
+                for day, row in zip(dates[start:start + count], values[start:start + count])
+            ]
+            start += count
+        return histories
+
+    @staticmethod
+    def decode_indicators(snapshot: HotStateSnapshot) -> Dict[str, List[Dict]]:
+        index = snapshot.documents.get("indicator_index") or {}
+        if not index:
+            return {}
+        dates = snapshot.arrays["indicator_dates"].astype(str).tolist()
+        values = snapshot.arrays["indicator_values"]
+        entries: Dict[str, List[Dict]] = {}
+        for cache_key, meta in index.items():
+            columns = meta["columns"]
+            n_rows = int(meta["rows"])
+            block = values[meta["value_start"]:meta["value_start"] + n_rows * len(columns)]
+            decoded = _decode_values(block.reshape(n_rows, len(columns)), integral=False)
+            day_slice = dates[meta["date_start"]:meta["date_start"] + n_rows]
+            entries[cache_key] = [
+                {"code": meta["code"], "date": day, **dict(zip(columns, row))}
+                for day, row in zip(day_slice, decoded)
+            ]
+        return entries
+
+    def get_status(self) -> Dict:
+        return {
+            "path": self._repository.path,
+            "last_load_status": self._repository.last_load_status,
+            "last_capture": dict(self._last_capture),
+            "last_restore": dict(self._last_restore),
+        }
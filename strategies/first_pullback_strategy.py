@@ -17,6 +17,7 @@ from core.market_clock import MarketClock
 from strategies.first_pullback_types import FirstPullbackConfig, FPPositionState
 from services.oneil_universe_service import OneilUniverseService
 from core.logger import get_strategy_logger
+from core.scan_funnel import intern_reason
 from utils.async_concurrency import bounded_gather
 from utils.strategy_state_io import StrategyStateIO
 from utils.transaction_cost_utils import TransactionCostUtils
@@ -27,6 +28,13 @@ from utils.atomic_json import write_json_atomic
 # 빠르게 마무리되도록 우선순위를 부여한다.
 _EXIT_CONCURRENCY = 15
 
+_R_NO_SURGE_HISTORY = intern_reason("no_surge_history")
+_R_MA_NOT_UPTRENDING = intern_reason("ma_not_uptrending")
+_R_PULLBACK_OUT_OF_RANGE = intern_reason("pullback_out_of_range")
+_R_VOLUME_NOT_DRY = intern_reason("volume_not_dry")
+_R_NO_BULLISH_REVERSAL = intern_reason("no_bullish_reversal")
+_R_LOW_EXECUTION_STRENGTH = intern_reason("low_execution_strength")
+
 
 class FirstPullbackStrategy(LiveStrategy):
     """주도주 첫 눌림목(Holy Grail) 매매 전략.
@@ -169,13 +177,17 @@ class FirstPullbackStrategy(LiveStrategy):
 
         surge_result = self._check_surge_history(ohlcv)
         if not surge_result:
-            self._logger.info({"event": "entry_rejected", "code": code, "reason": "no_surge_history"})
+            if self.funnel.reject(_R_NO_SURGE_HISTORY):
+                self._logger.info({"event": "entry_rejected", "code": code, "reason": "no_surge_history",
+                                   "funnel_counted": True})
             return None
 
         surge_volume, surge_day_high = surge_result
 
         if not self._check_ma_uptrend(ohlcv):
-            self._logger.info({"event": "entry_rejected", "code": code, "reason": "ma_not_uptrending"})
+            if self.funnel.reject(_R_MA_NOT_UPTRENDING):
+                self._logger.info({"event": "entry_rejected", "code": code, "reason": "ma_not_uptrending",
+                                   "funnel_counted": True})
             return None
 
         # ── Phase 2: Pullback (건전한 숨 고르기) ──
@@ -186,35 +198,39 @@ class FirstPullbackStrategy(LiveStrategy):
             return None
 
         if not self._check_pullback_to_ma(today_low, ma_20d):
-            pullback_pct = (today_low - ma_20d) / ma_20d * 100 if ma_20d > 0 else 0.0
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "reason": "pullback_out_of_range",
-                "pullback_pct": round(pullback_pct, 2),
-                "allowed_range": f"{self._cfg.pullback_lower_pct}% ~ {self._cfg.pullback_upper_pct}%",
-                "today_low": today_low, "ma_20d": round(ma_20d, 0),
-            })
+            if self.funnel.reject(_R_PULLBACK_OUT_OF_RANGE):
+                pullback_pct = (today_low - ma_20d) / ma_20d * 100 if ma_20d > 0 else 0.0
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "reason": "pullback_out_of_range",
+                    "pullback_pct": round(pullback_pct, 2),
+                    "allowed_range": f"{self._cfg.pullback_lower_pct}% ~ {self._cfg.pullback_upper_pct}%",
+                    "today_low": today_low, "ma_20d": round(ma_20d, 0), "funnel_counted": True,
+                })
             return None
 
         if not self._check_volume_dryup(ohlcv, surge_volume):
-            days = self._cfg.volume_dryup_days
-            recent_vols = [r.get("volume", 0) for r in ohlcv[-days:]]
-            avg_vol = sum(recent_vols) / len(recent_vols) if recent_vols else 0
-            vol_dryup_pct = (avg_vol / surge_volume * 100) if surge_volume > 0 else 0.0
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "reason": "volume_not_dry",
-                "vol_dryup_pct": round(vol_dryup_pct, 2), "threshold_pct": self._cfg.volume_dryup_ratio * 100,
-                "avg_vol": int(avg_vol), "surge_volume": surge_volume,
-            })
+            if self.funnel.reject(_R_VOLUME_NOT_DRY):
+                days = self._cfg.volume_dryup_days
+                recent_vols = [r.get("volume", 0) for r in ohlcv[-days:]]
+                avg_vol = sum(recent_vols) / len(recent_vols) if recent_vols else 0
+                vol_dryup_pct = (avg_vol / surge_volume * 100) if surge_volume > 0 else 0.0
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "reason": "volume_not_dry",
+                    "vol_dryup_pct": round(vol_dryup_pct, 2), "threshold_pct": self._cfg.volume_dryup_ratio * 100,
+                    "avg_vol": int(avg_vol), "surge_volume": surge_volume, "funnel_counted": True,
+                })
             return None
 
         # ── Phase 3: Trigger (매수 방아쇠) ──
         prev_high = ohlcv[-1].get("high", 0) if ohlcv else 0
         if not self._check_bullish_reversal(current, today_open, today_high, today_low, prev_close, prev_high):
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "name": item.name, "reason": "no_bullish_reversal",
-                "current": current, "today_open": today_open, "prev_high": prev_high,
-                "today_high": today_high, "today_low": today_low, "prev_close": prev_close,
-            })
+            if self.funnel.reject(_R_NO_BULLISH_REVERSAL):
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "name": item.name, "reason": "no_bullish_reversal",
+                    "current": current, "today_open": today_open, "prev_high": prev_high,
+                    "today_high": today_high, "today_low": today_low, "prev_close": prev_close,
+                    "funnel_counted": True,
+                })
             return None
 
         # 체결강도 확인
@@ -227,14 +243,16 @@ class FirstPullbackStrategy(LiveStrategy):
                     val = ccnl_output[0].get("tday_rltv")
                     cgld_val = float(val) if val else 0.0
         except Exception as e:
+            self.funnel.calc_failure("cgld_check_failed", code)
             self._logger.warning({"event": "cgld_check_failed", "code": code, "error": str(e)})
             return None
 
         if cgld_val < self._cfg.execution_strength_min:
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "name": item.name, "reason": "low_execution_strength",
-                "cgld": cgld_val, "threshold": self._cfg.execution_strength_min
-            })
+            if self.funnel.reject(_R_LOW_EXECUTION_STRENGTH):
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "name": item.name, "reason": "low_execution_strength",
+                    "cgld": cgld_val, "threshold": self._cfg.execution_strength_min, "funnel_counted": True,
+                })
             return None
 
         # ========= 모든 관문 통과! 매수 시그널 생성 =========
@@ -423,9 +441,11 @@ class FirstPullbackStrategy(LiveStrategy):
 
         signals: List[TradeSignal] = []
         state_dirty = False
-        for result in results:
+        for hold, result in zip(holdings, results):
             if isinstance(result, Exception):
-                self._logger.error({"event": "exit_check_error", "error": str(result)})
+                code = hold.get("code")
+                self._logger.error({"event": "exit_check_error", "code": code, "error": str(result)})
+                self.funnel.calc_failure("exit_check_error", code)
             elif result:
                 s_list, dirty = result
                 signals.extend(s_list)
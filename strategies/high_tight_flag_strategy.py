@@ -73,6 +73,8 @@ class HighTightFlagStrategy(LiveStrategy):
         return "high_tight_flag"
 
     def _log_entry_rejected(self, code: str, item, reason: str, **metrics) -> None:
+        if not self.funnel.reject(reason):
+            return
         payload = {
             "event": "entry_rejected",
             "code": code,
@@ -80,6 +82,7 @@ class HighTightFlagStrategy(LiveStrategy):
             "reason": reason,
         }
         payload.update(metrics)
+        payload["funnel_counted"] = True
         self._logger.info(payload)
 
     # ── scan ──────────────────────────────────────────────────────────
@@ -426,6 +429,7 @@ class HighTightFlagStrategy(LiveStrategy):
                     val = ccnl_output[0].get("tday_rltv")
                     cgld_val = float(val) if val else 0.0
         except Exception as e:
+            self.funnel.calc_failure("cgld_check_failed", code)
             self._logger.warning({"event": "cgld_check_failed", "code": code, "error": str(e)})
             self._log_entry_rejected(code, item, "cgld_check_failed", error=str(e))
             return None
@@ -553,9 +557,11 @@ class HighTightFlagStrategy(LiveStrategy):
 
         signals: List[TradeSignal] = []
         state_dirty = False
-        for result in results:
+        for hold, result in zip(holdings, results):
             if isinstance(result, Exception):
-                self._logger.error({"event": "exit_check_error", "error": str(result)})
+                code = hold.get("code")
+                self._logger.error({"event": "exit_check_error", "code": code, "error": str(result)})
+                self.funnel.calc_failure("exit_check_error", code)
             elif result:
                 s_list, dirty = result
                 signals.extend(s_list)
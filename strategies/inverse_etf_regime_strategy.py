@@ -20,12 +20,19 @@ from strategies.inverse_etf_regime_types import (
     InverseEtfRegimeConfig,
     InverseEtfPositionState,
 )
+from core.scan_funnel import intern_reason
 from utils.strategy_state_io import StrategyStateIO
 from utils.transaction_cost_utils import TransactionCostUtils
 from utils.atomic_json import write_json_atomic
 
 _BEAR = "bear"
 
+_R_REGIME_NOT_BEAR = intern_reason("regime_not_bear")
+_R_MA_UNAVAILABLE = intern_reason("ma_unavailable")
+_R_INVALID_CURRENT_PRICE = intern_reason("invalid_current_price")
+_R_BELOW_TREND_MA = intern_reason("below_trend_ma")
+_R_ZERO_QTY = intern_reason("zero_qty")
+
 
 class InverseEtfRegimeStrategy(LiveStrategy):
     """레짐 게이트 인버스 ETF 슬리브 (R-2 비상관 엣지).
@@ -99,10 +106,12 @@ class InverseEtfRegimeStrategy(LiveStrategy):
         # 1) 레짐 게이트 — bear 가 아니면 미진입 (R-2 디코릴레이션 핵심)
         regime = await self._regime.classify(self._cfg.regime_market, logger=self._logger)
         if regime.regime_label != _BEAR:
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "reason": "regime_not_bear",
-                "regime_label": regime.regime_label,
-            })
+            if self.funnel.reject(_R_REGIME_NOT_BEAR):
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "reason": "regime_not_bear",
+                    "regime_label": regime.regime_label,
+                    "funnel_counted": True,
+                })
             return []
 
         # 2) 추세 확인 — 인버스 ETF 현재가 > MA (당일 미확정 봉 제외)
@@ -111,24 +120,32 @@ class InverseEtfRegimeStrategy(LiveStrategy):
         )
         ma = self._latest_ma(ma_resp)
         if ma is None:
-            self._logger.info({"event": "entry_rejected", "code": code, "reason": "ma_unavailable"})
+            if self.funnel.reject(_R_MA_UNAVAILABLE):
+                self._logger.info({"event": "entry_rejected", "code": code, "reason": "ma_unavailable",
+                                   "funnel_counted": True})
             return []
 
         cp_resp = await self._sqs.get_current_price(code, caller=self.name)
         current = self._extract_current_price(cp_resp)
         if current <= 0:
-            self._logger.info({"event": "entry_rejected", "code": code, "reason": "invalid_current_price"})
+            if self.funnel.reject(_R_INVALID_CURRENT_PRICE):
+                self._logger.info({"event": "entry_rejected", "code": code, "reason": "invalid_current_price",
+                                   "funnel_counted": True})
             return []
         if current <= ma:
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "reason": "below_trend_ma",
-                "current": current, "ma": round(ma, 2),
-            })
+            if self.funnel.reject(_R_BELOW_TREND_MA):
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "reason": "below_trend_ma",
+                    "current": current, "ma": round(ma, 2),
+                    "funnel_counted": True,
+                })
             return []
 
         qty = self._calculate_qty(current)
         if qty <= 0:
-            self._logger.info({"event": "entry_rejected", "code": code, "reason": "zero_qty"})
+            if self.funnel.reject(_R_ZERO_QTY):
+                self._logger.info({"event": "entry_rejected", "code": code, "reason": "zero_qty",
+                                   "funnel_counted": True})
             return []
 
         # 포지션 등록 (고점 = 진입가)
@@ -16,6 +16,7 @@ from services.indicator_service import IndicatorService
 from services.oneil_universe_service import OneilUniverseService
 from core.market_clock import MarketClock
 from core.logger import get_strategy_logger
+from core.scan_funnel import intern_reason
 from strategies.larry_williams_cb_types import LarryWilliamsCBConfig, LarryWilliamsCBPositionState
 from utils.async_concurrency import bounded_gather
 from utils.strategy_state_io import StrategyStateIO
@@ -27,6 +28,15 @@ from utils.atomic_json import write_json_atomic
 # 빠르게 마무리되도록 우선순위를 부여한다.
 _EXIT_CONCURRENCY = 15
 
+_R_RS_RATING_BELOW_MIN = intern_reason("rs_rating_below_min")
+_R_OHLCV_UNAVAILABLE = intern_reason("ohlcv_unavailable")
+_R_ADX_UNAVAILABLE = intern_reason("adx_unavailable")
+_R_ADX_BELOW_THRESHOLD = intern_reason("adx_below_threshold")
+_R_ADX_NOT_RISING = intern_reason("adx_not_rising")
+_R_INVALID_CURRENT_PRICE = intern_reason("invalid_current_price")
+_R_NO_CHANNEL_BREAKOUT = intern_reason("no_channel_breakout")
+_R_INSUFFICIENT_VOLUME = intern_reason("insufficient_volume")
+
 
 class LarryWilliamsChannelBreakoutStrategy(LiveStrategy):
     """래리 윌리엄스 / 브렌트 펜볼드 돈천 채널 돌파 전략.
@@ -106,14 +116,16 @@ class LarryWilliamsChannelBreakoutStrategy(LiveStrategy):
             if today_str < self._cooldown.get(code, ""):
                 continue
             if item.rs_rating < self._cfg.rs_rating_min:
-                self._logger.info({
-                    "event": "entry_rejected",
-                    "code": code,
-                    "name": item.name,
-                    "reason": "rs_rating_below_min",
-                    "rs_rating": item.rs_rating,
-                    "threshold": self._cfg.rs_rating_min,
-                })
+                if self.funnel.reject(_R_RS_RATING_BELOW_MIN):
+                    self._logger.info({
+                        "event": "entry_rejected",
+                        "code": code,
+                        "name": item.name,
+                        "reason": "rs_rating_below_min",
+                        "rs_rating": item.rs_rating,
+                        "threshold": self._cfg.rs_rating_min,
+                        "funnel_counted": True,
+                    })
                 continue
             candidates.append((code, item))
 
@@ -139,12 +151,14 @@ class LarryWilliamsChannelBreakoutStrategy(LiveStrategy):
         # OHLCV 한 번 조회 후 ADX/채널 계산에 공유
         ohlcv_resp = await self._sqs.get_ohlcv(code, period="D", caller=self.name)
         if not ohlcv_resp or ohlcv_resp.rt_cd != "0" or not ohlcv_resp.data:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "ohlcv_unavailable",
-            })
+            if self.funnel.reject(_R_OHLCV_UNAVAILABLE):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "ohlcv_unavailable",
+                    "funnel_counted": True,
+                })
             return None
         # P0 0-8: get_ohlcv는 장중 당일 미확정 봉을 붙이므로 ADX/채널 baseline에서 제외한다.
         ohlcv = self._confirmed_bars(ohlcv_resp.data)
@@ -154,68 +168,74 @@ class LarryWilliamsChannelBreakoutStrategy(LiveStrategy):
             ohlcv, period=self._cfg.adx_period, slope_lookback=self._cfg.adx_slope_lookback
         )
         if not adx_result:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "adx_unavailable",
-            })
+            if self.funnel.reject(_R_ADX_UNAVAILABLE):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "adx_unavailable",
+                    "funnel_counted": True,
+                })
             return None
         if adx_result["adx"] < self._cfg.adx_threshold or not adx_result["adx_rising"]:
-            reason = (
-                "adx_below_threshold"
-                if adx_result["adx"] < self._cfg.adx_threshold
-                else "adx_not_rising"
-            )
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": reason,
-                "adx": adx_result.get("adx"),
-                "threshold": self._cfg.adx_threshold,
-                "rising": adx_result.get("adx_rising"),
-            })
+            below = adx_result["adx"] < self._cfg.adx_threshold
+            if self.funnel.reject(_R_ADX_BELOW_THRESHOLD if below else _R_ADX_NOT_RISING):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "adx_below_threshold" if below else "adx_not_rising",
+                    "adx": adx_result.get("adx"),
+                    "threshold": self._cfg.adx_threshold,
+                    "rising": adx_result.get("adx_rising"),
+                    "funnel_counted": True,
+                })
             return None
 
         # Phase 2-1: 현재가 조회 (종가 대용)
         cp_resp = await self._sqs.get_current_price(code, caller=self.name)
         current = self._extract_current_price(cp_resp)
         if current <= 0:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "invalid_current_price",
-                "current": current,
-            })
+            if self.funnel.reject(_R_INVALID_CURRENT_PRICE):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "invalid_current_price",
+                    "current": current,
+                    "funnel_counted": True,
+                })
             return None
 
         # Phase 2-2: 20일 채널 상단 돌파
         # item.high_20d = 어제까지의 20일 최고가 → 오늘 종가가 이를 초과하면 신고가 돌파
         if current <= item.high_20d:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "no_channel_breakout",
-                "current": current,
-                "high_20d": item.high_20d,
-            })
+            if self.funnel.reject(_R_NO_CHANNEL_BREAKOUT):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "no_channel_breakout",
+                    "current": current,
+                    "high_20d": item.high_20d,
+                    "funnel_counted": True,
+                })
             return None
 
         # Phase 2-3: 거래량 확인 (누적 거래량 ≥ avg_vol_20d × multiplier)
         today_vol = self._extract_today_volume(cp_resp)
         if today_vol > 0 and item.avg_vol_20d > 0:
             if today_vol < item.avg_vol_20d * self._cfg.volume_multiplier:
-                self._logger.info({
-                    "event": "entry_rejected",
-                    "code": code,
-                    "name": item.name,
-                    "reason": "insufficient_volume",
-                    "today_vol": today_vol,
-                    "required": int(item.avg_vol_20d * self._cfg.volume_multiplier),
-                })
+                if self.funnel.reject(_R_INSUFFICIENT_VOLUME):
+                    self._logger.info({
+                        "event": "entry_rejected",
+                        "code": code,
+                        "name": item.name,
+                        "reason": "insufficient_volume",
+                        "today_vol": today_vol,
+                        "required": int(item.avg_vol_20d * self._cfg.volume_multiplier),
+                        "funnel_counted": True,
+                    })
                 return None
 
         # 칼손절가 계산: max(20일 채널 하단, 진입가 × (1 + hard_stop_pct/100))
@@ -257,6 +257,7 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
                 })
 
             except Exception as e:
+                self.funnel.calc_failure("scan_error", code)
                 self._logger.error({
                     "event": "scan_error", "strategy_name": self.name,
                     "code": code, "error": str(e),
@@ -443,10 +444,12 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
         )
 
         signals: List[TradeSignal] = []
-        for result in results:
+        for hold, result in zip(holdings, results):
             if isinstance(result, Exception):
+                code = str(hold.get("code", ""))
                 self._logger.error({"event": "check_exits_error", "strategy_name": self.name,
-                                    "error": str(result)}, exc_info=True)
+                                    "code": code, "error": str(result)}, exc_info=True)
+                self.funnel.calc_failure("check_exits_error", code)
                 continue
             if result is not None:
                 signals.append(result)
@@ -517,6 +520,7 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
             return None
 
         except Exception as e:
+            self.funnel.calc_failure("check_exits_error", code)
             self._logger.error({"event": "check_exits_error", "strategy_name": self.name,
                                 "code": code, "error": str(e)}, exc_info=True)
             return None
@@ -591,6 +595,7 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
 
         for code, resp in zip(codes, results):
             if isinstance(resp, Exception):
+                self.funnel.calc_failure("range_cache_error", code)
                 self._logger.warning({"event": "range_cache_error", "code": code, "error": str(resp)})
                 continue
             if not resp or resp.rt_cd != ErrorCode.SUCCESS.value:
@@ -650,6 +655,7 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
                 end_hhmmss=now.strftime("%H%M%S"),
             )
         except Exception as e:
+            self.funnel.calc_failure("intraday_open_fallback_failed", code)
             self._logger.debug({"event": "intraday_open_fallback_failed", "code": code, "error": str(e)})
             return 0
 
@@ -678,6 +684,7 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
                     val = output[0].get("tday_rltv")
                     return float(val) if val else 0.0
         except Exception as e:
+            self.funnel.calc_failure("execution_strength_error", code)
             self._logger.warning({"event": "execution_strength_error", "code": code, "error": str(e)})
         return 0.0
 
@@ -724,12 +731,15 @@ class LarryWilliamsVBOStrategy(LiveStrategy):
                 return False
 
         except Exception as e:
+            self.funnel.calc_failure("program_filter_error", log_data.get("code"))
             self._logger.warning({"event": "program_filter_error", "code": log_data.get("code"), "error": str(e)})
             return False
 
         return True
 
     def _log_entry_rejected(self, log_data: dict, reason: str, message: str) -> None:
+        if not self.funnel.reject(reason):
+            return
         payload = {**log_data, "reason": reason, "message": message}
         self._logger.info({"event": "candidate_rejected", **payload})
-        self._logger.info({"event": "entry_rejected", **payload})
+        self._logger.info({"event": "entry_rejected", **payload, "funnel_counted": True})
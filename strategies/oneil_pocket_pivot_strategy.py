@@ -17,6 +17,7 @@ from core.market_clock import MarketClock
 from strategies.oneil_common_types import OneilPocketPivotConfig, PPPositionState
 from services.oneil_universe_service import OneilUniverseService
 from core.logger import get_strategy_logger
+from core.scan_funnel import intern_reason
 from utils.async_concurrency import bounded_gather
 from utils.strategy_state_io import StrategyStateIO
 from utils.transaction_cost_utils import TransactionCostUtils
@@ -27,6 +28,9 @@ from utils.atomic_json import write_json_atomic
 # 빠르게 마무리되도록 우선순위를 부여한다.
 _EXIT_CONCURRENCY = 15
 
+_R_LOW_EXECUTION_STRENGTH = intern_reason("low_execution_strength")
+_R_SMART_MONEY = intern_reason("entry_rejected_by_smart_money")
+
 
 class OneilPocketPivotStrategy(LiveStrategy):
     """오닐식 포켓 피봇 & BGU 매매 (O'Neil Pocket Pivot & Buyable Gap-Up).
@@ -217,16 +221,20 @@ class OneilPocketPivotStrategy(LiveStrategy):
                     val = ccnl_output[0].get("tday_rltv")
                     cgld_val = float(val) if val else 0.0
         except Exception as e:
+            self.funnel.calc_failure("cgld_check_failed", code)
             self._logger.warning({"event": "cgld_check_failed", "code": code, "error": str(e)})
             return None
 
         if cgld_val < self._cfg.execution_strength_min:
-            self._logger.info({"event": "entry_rejected", "code": code, "name": item.name, "reason": "low_execution_strength", "entry_type": entry_type, "cgld": cgld_val, "threshold": self._cfg.execution_strength_min})
+            if self.funnel.reject(_R_LOW_EXECUTION_STRENGTH):
+                self._logger.info({"event": "entry_rejected", "code": code, "name": item.name, "reason": "low_execution_strength", "entry_type": entry_type, "cgld": cgld_val, "threshold": self._cfg.execution_strength_min, "funnel_counted": True})
             return None
 
         # 6. ★ 공통 스마트 머니 필터 (cgld_val 전달로 유연 조건 활성화)
         if not self._check_smart_money(code, current, pg_buy, trade_value, item.market_cap, cgld_val):
-            self._logger.debug({"event": "entry_rejected_by_smart_money", "code": code, "entry_type": entry_type})
+            if self.funnel.reject(_R_SMART_MONEY):
+                self._logger.debug({"event": "entry_rejected_by_smart_money", "code": code, "entry_type": entry_type,
+                                    "funnel_counted": True})
             return None
 
         # ========= 모든 관문 통과! 매수 시그널 생성 =========
@@ -546,9 +554,11 @@ class OneilPocketPivotStrategy(LiveStrategy):
 
         signals: List[TradeSignal] = []
         state_dirty = False
-        for result in results:
+        for hold, result in zip(holdings, results):
             if isinstance(result, Exception):
-                self._logger.error({"event": "exit_check_error", "error": str(result)})
+                code = hold.get("code")
+                self._logger.error({"event": "exit_check_error", "code": code, "error": str(result)})
+                self.funnel.calc_failure("exit_check_error", code)
             elif result:
                 s_list, dirty = result
                 signals.extend(s_list)
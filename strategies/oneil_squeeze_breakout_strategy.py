@@ -15,7 +15,9 @@ from services.stock_query_service import StockQueryService
 from core.market_clock import MarketClock
 from strategies.oneil_common_types import OneilBreakoutConfig, OSBPositionState
 from services.oneil_universe_service import OneilUniverseService
+from services.backtest_candidate_prescreen import BreakoutVolumePrescreen
 from core.logger import get_strategy_logger
+from core.scan_funnel import intern_reason
 from utils.volatility_utils import annualized_return_std
 from utils.strategy_state_io import StrategyStateIO
 from utils.atomic_json import write_json_atomic
@@ -27,6 +29,12 @@ from utils.transaction_cost_utils import TransactionCostUtils
 # 빠르게 마무리되도록 우선순위를 부여한다.
 _EXIT_CONCURRENCY = 15
 
+_R_NOT_IN_SQUEEZE = intern_reason("not_in_squeeze")
+_R_BELOW_BREAKOUT_BUFFER = intern_reason("below_breakout_buffer")
+_R_OVER_EXTENDED = intern_reason("over_extended")
+_R_POOR_CANDLE_QUALITY = intern_reason("poor_candle_quality")
+_R_LOW_EXECUTION_STRENGTH = intern_reason("low_execution_strength")
+
 
 class OneilSqueezeBreakoutStrategy(LiveStrategy):
     """오닐식 스퀴즈 주도주 돌파매매 (O'Neil Squeeze Breakout).
@@ -134,6 +142,19 @@ class OneilSqueezeBreakoutStrategy(LiveStrategy):
         self._logger.info({"event": "scan_finished", "signals_found": len(signals)})
         return signals
 
+    def backtest_prescreen(self) -> BreakoutVolumePrescreen:
+        """_check_breakout 의 가격 돌파(high_20d + 안착 버퍼)·거래량 절대 하한 관문.
+
+        high_20d/avg_vol_20d 를 만드는 유니버스 기간(high_breakout_period)을 그대로 쓴다.
+        """
+        universe_cfg = getattr(self._universe, "_cfg", None)
+        period = getattr(universe_cfg, "high_breakout_period", None)
+        return BreakoutVolumePrescreen(
+            breakout_period=period if isinstance(period, int) and period > 0 else 20,
+            breakout_buffer_pct=self._cfg.breakout_min_buffer_pct,
+            min_volume_ratio=self._cfg.baseline_min_vol_ratio,
+        )
+
     async def _check_breakout(self, code, item, progress, market_timing_cache=None) -> Optional[TradeSignal]:
         # 1. 기본 시세 조회
         resp = await self._sqs.get_current_price(code, caller=self.name)
@@ -165,26 +186,30 @@ class OneilSqueezeBreakoutStrategy(LiveStrategy):
                     "bb_min": item.bb_width_min_20d,
                     "tolerance": self._cfg.osb_runtime_squeeze_tolerance,
                 })
-                self._logger.info({
-                    "event": "entry_rejected", "code": code, "name": item.name, "reason": "not_in_squeeze",
-                    "prev_bb_width": item.prev_bb_width,
-                    "bb_min": item.bb_width_min_20d,
-                    "tolerance": self._cfg.osb_runtime_squeeze_tolerance,
-                })
+                if self.funnel.reject(_R_NOT_IN_SQUEEZE):
+                    self._logger.info({
+                        "event": "entry_rejected", "code": code, "name": item.name, "reason": "not_in_squeeze",
+                        "prev_bb_width": item.prev_bb_width,
+                        "bb_min": item.bb_width_min_20d,
+                        "tolerance": self._cfg.osb_runtime_squeeze_tolerance,
+                        "funnel_counted": True,
+                    })
                 return None
 
         # 🚨 [관문 1] 가격 돌파 — 안착 버퍼 적용 (int 캐스팅으로 호가 단위 미스매치 방지)
         breakout_threshold = int(item.high_20d * (1 + self._cfg.breakout_min_buffer_pct / 100))
         if current < breakout_threshold:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "below_breakout_buffer",
-                "current": current,
-                "threshold": breakout_threshold,
-                "high_20d": item.high_20d,
-            })
+            if self.funnel.reject(_R_BELOW_BREAKOUT_BUFFER):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "below_breakout_buffer",
+                    "current": current,
+                    "threshold": breakout_threshold,
+                    "high_20d": item.high_20d,
+                    "funnel_counted": True,
+                })
             return None
 
         # 장 초반 15분 이내: proj_vol 뻥튀기로 인한 가짜 돌파 시그널 방지
@@ -199,10 +224,11 @@ class OneilSqueezeBreakoutStrategy(LiveStrategy):
                 "event": "breakout_rejected", "code": code, "reason": "over_extended",
                 "current": current, "max_entry": int(max_entry),
             })
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "name": item.name, "reason": "over_extended",
-                "current": current, "max_entry": int(max_entry),
-            })
+            if self.funnel.reject(_R_OVER_EXTENDED):
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "name": item.name, "reason": "over_extended",
+                    "current": current, "max_entry": int(max_entry), "funnel_counted": True,
+                })
             return None
 
         # 🚨 [신규 관문] 캔들 품질: 윗꼬리가 너무 길면 가짜 돌파 (상단 70% 유지 필수)
@@ -211,7 +237,8 @@ class OneilSqueezeBreakoutStrategy(LiveStrategy):
         if day_range > 0:
             relative_pos = (current - day_low) / day_range
             if relative_pos < self._cfg.osb_min_candle_relative_pos: # 0.7 권장
-                self._logger.info({"event": "entry_rejected", "code": code, "name": item.name, "reason": "poor_candle_quality", "pos": round(relative_pos, 2), "threshold": self._cfg.osb_min_candle_relative_pos})
+                if self.funnel.reject(_R_POOR_CANDLE_QUALITY):
+                    self._logger.info({"event": "entry_rejected", "code": code, "name": item.name, "reason": "poor_candle_quality", "pos": round(relative_pos, 2), "threshold": self._cfg.osb_min_candle_relative_pos, "funnel_counted": True})
                 return None
 
         # 🚨 [관문 2] 다이내믹 거래량 돌파 (시간대별 허들 차등 적용)
@@ -246,14 +273,17 @@ class OneilSqueezeBreakoutStrategy(LiveStrategy):
                 if ccnl_output and len(ccnl_output) > 0:
                     cgld_val = float(ccnl_output[0].get("tday_rltv") or 0.0)
         except Exception as e:
+            self.funnel.calc_failure("cgld_check_failed", code)
             self._logger.warning({"event": "cgld_check_failed", "code": code, "error": str(e)})
 
         if cgld_val < self._cfg.execution_strength_min:
-            self._logger.info({
-                "event": "entry_rejected", "code": code, "name": item.name,
-                "reason": "low_execution_strength",
-                "cgld": cgld_val, "threshold": self._cfg.execution_strength_min
-            })
+            if self.funnel.reject(_R_LOW_EXECUTION_STRENGTH):
+                self._logger.info({
+                    "event": "entry_rejected", "code": code, "name": item.name,
+                    "reason": "low_execution_strength",
+                    "cgld": cgld_val, "threshold": self._cfg.execution_strength_min,
+                    "funnel_counted": True,
+                })
             return None # 🌟 여기서 걸러져야 테스트가 통과됩니다.
 
         # 🚨 [관문 3] 스마트 머니 + 시총 가변 허들 + 체결강도 유연화 판정
@@ -417,9 +447,11 @@ class OneilSqueezeBreakoutStrategy(LiveStrategy):
 
         signals: List[TradeSignal] = []
         state_dirty = False
-        for result in results:
+        for hold, result in zip(holdings, results):
             if isinstance(result, Exception):
-                self._logger.error({"event": "exit_check_error", "error": str(result)})
+                code = hold.get("code")
+                self._logger.error({"event": "exit_check_error", "code": code, "error": str(result)})
+                self.funnel.calc_failure("exit_check_error", code)
             elif result:
                 s_list, dirty = result
                 signals.extend(s_list)
@@ -155,6 +155,7 @@ class ProgramBuyFollowStrategy(LiveStrategy):
                 scored.append((pg_ratio, code, stock_name, current, log_data))
 
             except Exception as e:
+                self.funnel.calc_failure("scan_error", code)
                 self._logger.error({
                     "event": "scan_error", "code": code, "error": str(e),
                 }, exc_info=True)
@@ -215,6 +216,7 @@ class ProgramBuyFollowStrategy(LiveStrategy):
                         "reason": "Failed to get current price for holding",
                         **log_data,
                     })
+                    self.funnel.calc_failure("check_exits_failed", code)
                     continue
 
                 output = self._extract_output(full_resp)
@@ -266,6 +268,7 @@ class ProgramBuyFollowStrategy(LiveStrategy):
 
 
             except Exception as e:
+                self.funnel.calc_failure("check_exits_error", code)
                 self._logger.error({
                     "event": "check_exits_error", "code": code, "error": str(e)
                 }, exc_info=True)
@@ -16,6 +16,7 @@ from services.indicator_service import IndicatorService
 from services.oneil_universe_service import OneilUniverseService
 from core.market_clock import MarketClock
 from core.logger import get_strategy_logger
+from core.scan_funnel import intern_reason
 from strategies.rsi2_pullback_types import RSI2PullbackConfig, RSI2PositionState
 from utils.async_concurrency import bounded_gather
 from utils.strategy_state_io import StrategyStateIO
@@ -29,6 +30,12 @@ _MINERVINI_STAGE_2 = 2  # services.minervini_stage_service.MinerviniStageService
 # 빠르게 마무리되도록 우선순위를 부여한다.
 _EXIT_CONCURRENCY = 15
 
+_R_NOT_STAGE2 = intern_reason("not_stage2")
+_R_RSI_UNAVAILABLE = intern_reason("rsi_unavailable")
+_R_RSI_ABOVE_THRESHOLD = intern_reason("rsi_above_threshold")
+_R_INVALID_CURRENT_PRICE = intern_reason("invalid_current_price")
+_R_ZERO_QTY = intern_reason("zero_qty")
+
 
 class RSI2PullbackStrategy(LiveStrategy):
     """래리 코너스 RSI(2) 눌림목 매매 전략.
@@ -141,36 +148,42 @@ class RSI2PullbackStrategy(LiveStrategy):
         """진입 조건 검사: Stage 2 → RSI(2) ≤ 10 → 시각 → 비중 결정."""
         # Phase 1-1: Stage 2 확인 (universe가 사전 분류)
         if self._cfg.require_minervini_stage2 and item.minervini_stage != _MINERVINI_STAGE_2:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "not_stage2",
-                "minervini_stage": item.minervini_stage,
-                "threshold": _MINERVINI_STAGE_2,
-            })
+            if self.funnel.reject(_R_NOT_STAGE2):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "not_stage2",
+                    "minervini_stage": item.minervini_stage,
+                    "threshold": _MINERVINI_STAGE_2,
+                    "funnel_counted": True,
+                })
             return None
 
         # Phase 1-2: 일봉 RSI(2) 조회 — P0 0-8: 당일 미확정 봉 제외 (인트라데이 RSI 깜빡임 방지)
         rsi_resp = await self._indicator.get_rsi(code, period=self._cfg.rsi_period, candle_type="D", exclude_today=True)
         if not rsi_resp or rsi_resp.rt_cd != "0" or not rsi_resp.data:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "rsi_unavailable",
-            })
+            if self.funnel.reject(_R_RSI_UNAVAILABLE):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "rsi_unavailable",
+                    "funnel_counted": True,
+                })
             return None
         latest_rsi = rsi_resp.data[-1].get("rsi")
         if latest_rsi is None or latest_rsi > self._cfg.rsi_threshold:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "rsi_above_threshold",
-                "rsi": latest_rsi,
-                "threshold": self._cfg.rsi_threshold,
-            })
+            if self.funnel.reject(_R_RSI_ABOVE_THRESHOLD):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "rsi_above_threshold",
+                    "rsi": latest_rsi,
+                    "threshold": self._cfg.rsi_threshold,
+                    "funnel_counted": True,
+                })
             return None
 
         # Phase 2: 마켓 타이밍 기반 비중 결정
@@ -180,25 +193,29 @@ class RSI2PullbackStrategy(LiveStrategy):
         cp_resp = await self._sqs.get_current_price(code, caller=self.name)
         current = self._extract_current_price(cp_resp)
         if current <= 0:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "invalid_current_price",
-                "current": current,
-            })
+            if self.funnel.reject(_R_INVALID_CURRENT_PRICE):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "invalid_current_price",
+                    "current": current,
+                    "funnel_counted": True,
+                })
             return None
 
         qty = self._calculate_qty(current, risk_off=risk_off)
         if qty <= 0:
-            self._logger.info({
-                "event": "entry_rejected",
-                "code": code,
-                "name": item.name,
-                "reason": "zero_qty",
-                "current": current,
-                "qty": qty,
-            })
+            if self.funnel.reject(_R_ZERO_QTY):
+                self._logger.info({
+                    "event": "entry_rejected",
+                    "code": code,
+                    "name": item.name,
+                    "reason": "zero_qty",
+                    "current": current,
+                    "qty": qty,
+                    "funnel_counted": True,
+                })
             return None
 
         # 포지션 등록
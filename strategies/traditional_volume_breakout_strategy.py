@@ -148,6 +148,7 @@ class TraditionalVolumeBreakoutStrategy(LiveStrategy):
         await self._sqs.sync_price_subscriptions(
             [code for code, _ in candidates],
             category_key="strategy_traditional_volume_breakout",
+            trigger_levels={code: item.high_20d for code, item in candidates},
         )
         for i in range(0, len(candidates), 10):
             chunk = candidates[i:i + 10]
@@ -155,9 +156,10 @@ class TraditionalVolumeBreakoutStrategy(LiveStrategy):
                 *[self._check_breakout_for_code(code, item, market_progress) for code, item in chunk],
                 return_exceptions=True,
             )
-            for result in results:
+            for (code, _), result in zip(chunk, results):
                 if isinstance(result, Exception):
-                    self._logger.error({"event": "scan_error", "error": str(result)})
+                    self._logger.error({"event": "scan_error", "code": code, "error": str(result)})
+                    self.funnel.calc_failure("scan_error", code)
                 elif result:
                     signals.append(result)
 
@@ -228,6 +230,7 @@ class TraditionalVolumeBreakoutStrategy(LiveStrategy):
                 volatility_20d_annualized=item.volatility_20d_annualized,
             )
         except Exception as e:
+            self.funnel.calc_failure("scan_error", code)
             self._logger.error({"event": "scan_error", "code": code, "error": str(e)}, exc_info=True)
             return None
 
@@ -334,6 +337,7 @@ class TraditionalVolumeBreakoutStrategy(LiveStrategy):
 
 
             except Exception as e:
+                self.funnel.calc_failure("check_exits_error", code)
                 self._logger.error({
                     "event": "check_exits_error", "code": code, "error": str(e),
                 }, exc_info=True)
@@ -380,6 +384,7 @@ class TraditionalVolumeBreakoutStrategy(LiveStrategy):
                     watchlist_items.append(item)
 
             except Exception as e:
+                self.funnel.calc_failure("build_watchlist_error", code)
                 self._logger.error({"event": "build_watchlist_error", "code": code, "error": str(e)}, exc_info=True)
 
         self._watchlist = {
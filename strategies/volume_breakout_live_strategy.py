@@ -175,6 +175,7 @@ class VolumeBreakoutLiveStrategy(LiveStrategy):
                 })
 
             except Exception as e:
+                self.funnel.calc_failure("scan_error", code)
                 self._logger.error({
                     "event": "scan_error",
                     "strategy_name": self.name,
@@ -216,6 +217,7 @@ class VolumeBreakoutLiveStrategy(LiveStrategy):
                         "reason": "Failed to get current price for holding",
                         **log_data,
                     })
+                    self.funnel.calc_failure("check_exits_failed", code)
                     continue
 
                 data = price_resp.data or {}
@@ -269,6 +271,7 @@ class VolumeBreakoutLiveStrategy(LiveStrategy):
                     })
 
             except Exception as e:
+                self.funnel.calc_failure("check_exits_error", code)
                 self._logger.error({
                     "event": "check_exits_error",
                     "strategy_name": self.name,
@@ -2,12 +2,21 @@
 """
 Watchlist / 보유종목 위주로 캐시를 사전 구성하는 백그라운드 태스크.
 
-장전 또는 장중 기동 직후 전략 실행에 자주 쓰이는 종목들의 가격 요약 데이터를
+장전 또는 장중 기동 직후 전략 실행에 자주 쓰이는 종목들의 데이터를
 미리 캐시에 적재하여 장중 전략이 빠르게 데이터에 접근할 수 있도록 한다.
 
 대상 종목 (우선순위 순):
   1. OneilUniverseService watchlist — 전략이 직접 참조하는 핵심 관심 풀
   2. 보유종목(계좌 잔고 output2.pdno) — 리스크 관리 최우선
+
+StockRepository 가 주입되면 일괄(bulk) 웜업을 한다 — 장중 첫 scan 이 종목마다
+SQLite 일봉 조회·지표 전체 계산·현재가 REST 를 하지 않도록:
+  1. ohlcv      — 대상 전 종목 확정 일봉을 정렬된 DB 스캔 한 번으로 OHLCV 캐시에 적재
+  2. indicators — 확정 일봉 지표(RSI/MA/ATR, DEFAULT_WARMUP_INDICATORS)를 증분 캐시에 선계산
+  3. prices     — get_multi_price(30종목 batch) 로 현재가 snapshot 캐시 priming
+끝나면 readiness(준비 완료 + 단계별 커버리지)를 get_readiness()/wait_until_ready() 로 알린다
+(GET /api/background/cache-warmup/readiness).
+StockRepository 가 없으면 기존처럼 종목별 가격 요약(get_price_summary)만 적재한다.
 """
 from __future__ import annotations
 
@@ -25,6 +34,8 @@ from services.notification_service import NotificationService, NotificationCateg
 if TYPE_CHECKING:
     from services.market_data_service import MarketDataService
     from services.stock_query_service import StockQueryService
+    from services.indicator_service import IndicatorService
+    from repositories.stock_repository import StockRepository
     from services.oneil_universe_service import OneilUniverseService
     from services.market_calendar_service import MarketCalendarService
     from core.market_clock import MarketClock
@@ -33,6 +44,12 @@ if TYPE_CHECKING:
 _API_CHUNK_SIZE = 10
 _CHUNK_SLEEP_SEC = 0.8
 
+# 일괄 웜업 — MarketDataService.get_ohlcv 가 읽는 것과 같은 창(600일)으로 적재해야
+# 선계산 지표가 장중 계산과 같은 값이 된다.
+_BULK_OHLCV_LIMIT = 600
+# 지표 선계산을 스레드로 넘기는 종목 묶음 크기 (묶음 사이에 이벤트 루프에 양보)
+_INDICATOR_CHUNK_SIZE = 20
+
 
 def _chunked(lst: list, size: int):
     for i in range(0, len(lst), size):
@@ -55,6 +72,9 @@ class CacheWarmupTask(SchedulableTask):
         notification_service: Optional["NotificationService"] = None,
         logger=None,
         worker_pool=None,
+        stock_repository: Optional["StockRepository"] = None,
+        indicator_service: Optional["IndicatorService"] = None,
+        indicator_specs=None,
     ) -> None:
         self._mcs = market_calendar_service
         self._market_clock = market_clock
@@ -64,6 +84,9 @@ class CacheWarmupTask(SchedulableTask):
         self._universe_service = universe_service
         self._ns = notification_service
         self._worker_pool = worker_pool
+        self._stock_repo = stock_repository
+        self._indicator_service = indicator_service
+        self._indicator_specs = indicator_specs
         self._state: TaskState = TaskState.IDLE
         self._tasks: List[asyncio.Task] = []
         self._running_depth: int = 0
@@ -83,6 +106,15 @@ class CacheWarmupTask(SchedulableTask):
             "last_warmed_date": None,
         }
 
+        # 일괄 웜업 완료 신호 — 기준일이 바뀌어 웜업이 다시 시작되면 내려간다.
+        self._ready_event: asyncio.Event = asyncio.Event()
+        self._readiness: Dict = {
+            "ready": False,
+            "trading_date": None,
+            "coverage": {},
+            "phase_ms": {},
+        }
+
     # ── SchedulableTask 인터페이스 ────────────────────────────────
 
     @property
@@ -136,6 +168,22 @@ class CacheWarmupTask(SchedulableTask):
     def get_progress(self) -> Dict:
         return dict(self._progress)
 
+    def get_readiness(self) -> Dict:
+        """일괄 웜업 준비 상태: ready, 기준일, 단계별 커버리지(적재/대상)·소요(ms)."""
+        return {
+            **self._readiness,
+            "coverage": dict(self._readiness["coverage"]),
+            "phase_ms": dict(self._readiness["phase_ms"]),
+        }
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """일괄 웜업이 끝날 때까지 기다린다. timeout 안에 준비되지 않으면 False."""
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     @asynccontextmanager
     async def _running_state(self):
         entered = self._state not in (TaskState.SUSPENDED, TaskState.STOPPED)
@@ -228,6 +276,10 @@ class CacheWarmupTask(SchedulableTask):
                 f"CacheWarmupTask 웜업 시작 (기준일: {trading_date}, 대상 {total}개 종목)"
             )
 
+            if self._stock_repo is not None:
+                await self._run_bulk_warmup(trading_date, sorted(codes), start_time)
+                return
+
             cached = 0
             failed = 0
             processed = 0
@@ -287,6 +339,103 @@ class CacheWarmupTask(SchedulableTask):
             self._is_warming = False
             self._progress["running"] = False
 
+    async def _run_bulk_warmup(self, trading_date: str, codes: List[str], start_time: float) -> None:
+        """ohlcv → indicators → prices 순서로 일괄 웜업하고 readiness 를 발행한다."""
+        self._ready_event.clear()
+        self._readiness = {"ready": False, "trading_date": trading_date, "coverage": {}, "phase_ms": {}}
+        total = len(codes)
+        phase_ms: Dict[str, float] = {}
+
+        await self._suspend_event.wait()
+        started = time.perf_counter()
+        history = await self._stock_repo.preload_stock_data(
+            codes, ohlcv_limit=_BULK_OHLCV_LIMIT, caller="cache_warmup",
+        )
+        phase_ms["ohlcv"] = round((time.perf_counter() - started) * 1000, 1)
+
+        await self._suspend_event.wait()
+        started = time.perf_counter()
+        indicator_codes = await self._warm_indicators(history)
+        phase_ms["indicators"] = round((time.perf_counter() - started) * 1000, 1)
+
+        await self._suspend_event.wait()
+        started = time.perf_counter()
+        primed = await self._prime_prices(codes)
+        phase_ms["prices"] = round((time.perf_counter() - started) * 1000, 1)
+
+        coverage = {
+            "total": total,
+            "ohlcv": len(history),
+            "indicators": indicator_codes,
+            "prices": primed,
+        }
+        elapsed = time.time() - start_time
+        self._last_warmed_date = trading_date
+        self._progress.update({
+            "processed": total,
+            "cached": len(history),
+            "failed": total - len(history),
+            "elapsed": round(elapsed, 1),
+            "last_warmed_date": trading_date,
+            "coverage": coverage,
+        })
+        self._readiness = {
+            "ready": True,
+            "trading_date": trading_date,
+            "coverage": coverage,
+            "phase_ms": phase_ms,
+        }
+        self._ready_event.set()
+
+        summary = (
+            f"일봉 {len(history)}/{total}, 지표 {indicator_codes}/{total}, 현재가 {primed}/{total} "
+            f"(소요: {elapsed:.1f}초 — ohlcv {phase_ms['ohlcv']:.0f}ms, "
+            f"지표 {phase_ms['indicators']:.0f}ms, 현재가 {phase_ms['prices']:.0f}ms)"
+        )
+        self._logger.info(f"CacheWarmupTask 일괄 웜업 완료 (기준일: {trading_date}) {summary}")
+        if self._ns:
+            await self._ns.emit(
+                NotificationCategory.BACKGROUND, NotificationLevel.INFO,
+                "캐시 웜업 완료", summary,
+            )
+
+    async def _warm_indicators(self, history: Dict[str, List[Dict]]) -> int:
+        """확정 일봉 지표를 선계산한다. 반환: 지표 캐시가 준비된 종목 수."""
+        if self._indicator_service is None or not history:
+            return 0
+        specs = self._indicator_specs
+        warm_kwargs = {} if specs is None else {"specs": specs}
+
+        def _warm_chunk(items):
+            ready = 0
+            for code, rows in items:
+                try:
+                    self._indicator_service.warm_confirmed_indicators(code, rows, **warm_kwargs)
+                    ready += 1
+                except Exception as e:
+                    self._logger.debug(f"CacheWarmupTask: {code} 지표 선계산 실패: {e}")
+            return ready
+
+        ready = 0
+        items = list(history.items())
+        for chunk in _chunked(items, _INDICATOR_CHUNK_SIZE):
+            await self._suspend_event.wait()
+            ready += await asyncio.to_thread(_warm_chunk, chunk)
+        return ready
+
+    async def _prime_prices(self, codes: List[str]) -> int:
+        """get_multi_price batch 로 현재가 snapshot 캐시를 채운다. 반환: 적재 종목 수."""
+        prefetch = getattr(self._sqs, "prefetch_prices", None)
+        if not callable(prefetch):
+            return 0
+        try:
+            return int(await prefetch(codes, count_stats=False) or 0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.warning(f"CacheWarmupTask: 현재가 batch priming 실패: {e}")
+            return 0
+
     async def _warmup_code(self, code: str) -> bool:
         """단일 종목의 가격 요약을 조회하여 캐시에 적재한다.
 
@@ -11,6 +11,7 @@ import FinanceDataReader as fdr
 
 from typing import Dict, List, Optional, TYPE_CHECKING
 from common.types import ErrorCode
+from core.cache.data_version import DAILY_PRICES, data_versions
 from core.performance_profiler import PerformanceProfiler
 from core.market_clock import MarketClock
 from task.background.after_market.after_market_task_base import AfterMarketTask
@@ -390,6 +391,7 @@ class DailyPriceCollectorTask(AfterMarketTask):
     async def _finish_collection(self, target_date: str, start_time: float, source: str) -> None:
         """수집 완료 후 공통 후처리 로직"""
         self._last_collected_date = target_date
+        data_versions.bump(DAILY_PRICES)
         elapsed = time.time() - start_time
         self._logger.info(f"전체 종목 수집 완료 (Source: {source}), 소요: {elapsed:.1f}s")
         if self._ns:
@@ -408,6 +410,14 @@ class DailyPriceCollectorTask(AfterMarketTask):
             except Exception as e:
                 self._logger.warning(f"RS Rating 계산 중 오류 (수집은 정상 완료): {e}")
 
+        # 히트맵·YTD 랭킹이 쓰는 기간 수익률 테이블을 미리 만들어 둔다 (실패해도 조회 시 SQL 폴백).
+        try:
+            table = await self._stock_repo.materialize_period_returns()
+            if table is not None:
+                self._logger.info(f"기간 수익률 테이블 구성 완료 (기준일: {table.trade_date}, {len(table.rows)}종목)")
+        except Exception as e:
+            self._logger.warning(f"기간 수익률 테이블 구성 실패 (조회 시 SQL 폴백): {e}")
+
     # # ── 내부 헬퍼 ─────────────────────────────────────────
 
     async def _fetch_with_retry(self, code: str, force_fresh: bool = False):
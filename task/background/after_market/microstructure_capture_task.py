@@ -36,8 +36,8 @@ class MicrostructureCaptureTask(AfterMarketTask):
         scheduler_store=None,
         output_dir: str | Path = "data/backtest_microstructure",
         program_db_path: str | Path = "data/program_subscribe/program_trading.db",
-        execution_strength_db_path: str | Path = "data/execution_strength/execution_strength.db",
-        orderbook_db_path: str | Path = "data/orderbook_snapshots/orderbook_snapshots.db",
+        execution_strength_dir: str | Path = "data/execution_strength",
+        orderbook_dir: str | Path = "data/orderbook_snapshots",
         max_codes: int = 40,
         logger=None,
         notification_service=None,
@@ -56,8 +56,8 @@ class MicrostructureCaptureTask(AfterMarketTask):
         self._stock_query_service = stock_query_service
         self._output_dir = Path(output_dir)
         self._program_db_path = Path(program_db_path)
-        self._execution_strength_db_path = Path(execution_strength_db_path)
-        self._orderbook_db_path = Path(orderbook_db_path)
+        self._execution_strength_dir = Path(execution_strength_dir)
+        self._orderbook_dir = Path(orderbook_dir)
         self._max_codes = max_codes
         self._notification_service = notification_service
         self._quality_retry_attempts = max(0, int(quality_retry_attempts))
@@ -167,10 +167,11 @@ class MicrostructureCaptureTask(AfterMarketTask):
             "program_db" if self._program_db_path.exists() else "daily_rest"
         )
         execution_strength_source = (
-            "es_db" if self._execution_strength_db_path.exists() else "rest_scalar"
+            # 틱 세그먼트 저장소는 {base_dir}/{YYYYMMDD}/ 단위 — 당일 디렉터리가 있으면 장중 샘플 사용
+            "es_db" if (self._execution_strength_dir / latest_trading_date).is_dir() else "rest_scalar"
         )
         orderbook_source = (
-            "orderbook_db" if self._orderbook_db_path.exists() else "none"
+            "orderbook_db" if (self._orderbook_dir / latest_trading_date).is_dir() else "none"
         )
         self._progress["running"] = True
         try:
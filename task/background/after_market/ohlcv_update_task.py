@@ -13,6 +13,7 @@ import FinanceDataReader as fdr
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, TYPE_CHECKING
 from common.types import ErrorCode
+from core.cache.data_version import OHLCV, data_versions
 from core.performance_profiler import PerformanceProfiler
 from core.market_clock import MarketClock
 from task.background.after_market.after_market_task_base import AfterMarketTask
@@ -442,6 +443,7 @@ class OhlcvUpdateTask(AfterMarketTask):
     async def _finish_collection(self, target_date: str, start_time: float, total_start_time: float, source: str) -> None:
         """수집 완료 후 공통 후처리 로직"""
         self._last_collected_date = target_date
+        data_versions.bump(OHLCV)
         elapsed = time.time() - start_time
         
         self._logger.info(
@@ -458,6 +460,14 @@ class OhlcvUpdateTask(AfterMarketTask):
                 f"소스: {source} / 소요: {elapsed:.1f}초"
             )
 
+        # 히트맵·YTD 랭킹이 쓰는 기간 수익률 테이블을 미리 만들어 둔다 (실패해도 조회 시 SQL 폴백).
+        try:
+            table = await self._stock_repo.materialize_period_returns()
+            if table is not None:
+                self._logger.info(f"기간 수익률 테이블 구성 완료 (기준일: {table.trade_date}, {len(table.rows)}종목)")
+        except Exception as e:
+            self._logger.warning(f"기간 수익률 테이블 구성 실패 (조회 시 SQL 폴백): {e}")
+
     # ── 내부 헬퍼 ─────────────────────────────────────────
     async def _verify_crawler_data(self, df_crawled: pd.DataFrame, source_name: str) -> bool:
         """증권사 API의 확정 데이터(시/고/저/종가)와 크롤링 데이터가 일치하는지 완벽 검증한다."""
@@ -15,6 +15,7 @@ from typing import List, Dict, Optional, TYPE_CHECKING
 from brokers.broker_api_wrapper import BrokerAPIWrapper
 from brokers.korea_investment.korea_invest_env import KoreaInvestApiEnv
 from common.types import ResCommonResponse, ErrorCode
+from core.cache.data_version import RANKING, data_versions
 from core.market_clock import MarketClock
 from task.background.after_market.after_market_task_base import AfterMarketTask
 from interfaces.schedulable_task import TaskState
@@ -244,6 +245,7 @@ class RankingTask(AfterMarketTask):
                         self._basic_ranking_cache[key] = resp
 
                 self._basic_ranking_updated_at = datetime.now()
+                data_versions.bump(RANKING)
                 self._logger.info(f"기본 랭킹 캐시 갱신 완료: {list(self._basic_ranking_cache.keys())}")
                 self.pm.log_timer("RankingTask.refresh_basic_ranking", t_start, threshold=1.0)
                 if notify and self._notification_service:
@@ -491,6 +493,7 @@ class RankingTask(AfterMarketTask):
 
             self._investor_ranking_updated_at = datetime.now()
             self._last_collected_date = target_date
+            data_versions.bump(RANKING)
 
             elapsed = time.time() - start_time
             self._logger.info(
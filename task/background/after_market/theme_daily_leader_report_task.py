@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 from common.types import ErrorCode
+from core.lazy_service import aresolve_lazy
 from task.background.after_market.after_market_task_base import AfterMarketTask
 from services.notification_service import NotificationCategory, NotificationLevel, NotificationService
 
@@ -76,7 +77,14 @@ class ThemeDailyLeaderReportTask(AfterMarketTask):
                     )
                 return
 
-            theme_resp = await self._theme_daily_leader_service.build_daily_theme_report(
+            # 지연 생성 프록시(LazyService)는 루프 밖에서 만들고, 생성 실패면 None 이다.
+            theme_service = await aresolve_lazy(self._theme_daily_leader_service)
+            if theme_service is None:
+                self._progress["last_error"] = "theme_service_unavailable"
+                self._logger.warning("당일 주도 테마 서비스 생성 실패 — 리포트를 건너뜁니다.")
+                return
+
+            theme_resp = await theme_service.build_daily_theme_report(
                 rankings,
                 report_date=report_date,
             )
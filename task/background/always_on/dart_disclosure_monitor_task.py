@@ -43,7 +43,6 @@ class DartDisclosureMonitorTask(SchedulableTask):
         self._logger = logger or logging.getLogger(__name__)
         self._ai_analyzer = ai_analyzer
         self._notification_service = notification_service
-        self._ai_summary_cache: Dict[str, Optional[str]] = {}
         self._state = TaskState.IDLE
         self._tasks: List[asyncio.Task] = []
         self._tick_lock: Optional[asyncio.Lock] = None
@@ -54,6 +53,8 @@ class DartDisclosureMonitorTask(SchedulableTask):
             "matched_count": 0,
             "sent_count": 0,
             "pending_digest_count": 0,
+            "ai_update_sent_count": 0,
+            "analysis_timeout_count": 0,
             "last_error": None,
         }
 
@@ -133,6 +134,7 @@ class DartDisclosureMonitorTask(SchedulableTask):
             self._progress["last_checked_at"] = now.isoformat()
             self._progress["matched_count"] = 0
             self._progress["sent_count"] = 0
+            self._progress["ai_update_sent_count"] = 0
             self._progress["last_error"] = None
 
             await self._send_digest_if_due(now, date)
@@ -162,47 +164,27 @@ class DartDisclosureMonitorTask(SchedulableTask):
             ]
             self._progress["matched_count"] = len(matching)
 
+            known = await self._repository.get_known_receipt_nos(
+                item.receipt_no for item in matching
+            )
+            analyze_later = initialized and self._ai_analyzer is not None
             baseline_items = []
             for disclosure in matching:
-                if await self._repository.has_receipt(disclosure.receipt_no):
+                if disclosure.receipt_no in known:
                     continue
-                preliminary = self._rules.evaluate(disclosure)
-                self._logger.info(
-                    "%s: 공시 분석 시작 receipt_no=%s stock_code=%s report=%s preliminary_score=%s",
-                    self.task_name,
-                    disclosure.receipt_no,
-                    disclosure.stock_code,
-                    disclosure.report_name,
-                    preliminary.score,
-                )
-                importance = preliminary
-                event_key = ""
-                ai_summary = None
-                if initialized:
-                    analysis = await self._analyze_actual_content(
-                        disclosure, preliminary
-                    )
-                    if analysis is not None:
-                        importance = self._merge_importance(
-                            preliminary, analysis.importance
-                        )
-                        event_key = analysis.event_key
-                        ai_summary = analysis.summary
-                    self._ai_summary_cache[disclosure.receipt_no] = (
-                        ai_summary
-                    )
+                importance = self._rules.evaluate(disclosure)
                 inserted = await self._repository.save_detected(
                     disclosure,
                     importance,
                     suppress_immediate=not initialized,
-                    event_key=event_key,
-                    summary=ai_summary or "",
+                    analysis_pending=analyze_later,
                 )
                 self._logger.info(
-                    "%s: 공시 분석 완료 receipt_no=%s stock_code=%s score=%s level=%s inserted=%s",
+                    "%s: 공시 규칙 판정 receipt_no=%s stock_code=%s report=%s score=%s level=%s inserted=%s",
                     self.task_name,
                     disclosure.receipt_no,
                     disclosure.stock_code,
+                    disclosure.report_name,
                     importance.score,
                     importance.level,
                     inserted,
@@ -210,6 +192,11 @@ class DartDisclosureMonitorTask(SchedulableTask):
                 if not initialized and inserted:
                     baseline_items.append(StoredDisclosure(disclosure, importance))
 
+            if disclosures:
+                await self._repository.advance_receipt_cursor(
+                    date, max(item.receipt_no for item in disclosures)
+                )
+
             if not initialized:
                 await self._repository.mark_initialized()
                 if baseline_items:
@@ -221,21 +208,26 @@ class DartDisclosureMonitorTask(SchedulableTask):
                             [item.disclosure.receipt_no for item in baseline_items], now
                         )
             else:
+                # 규칙 판정만으로 즉시 알림을 먼저 보내고, AI 본문 분석은 뒤따라 보강한다.
                 await self._send_pending_immediate(now)
+                if self._ai_analyzer is not None:
+                    promoted = await self._run_analysis_stage()
+                    if promoted:
+                        await self._send_pending_immediate(now)
 
             self._progress["last_success_at"] = now.isoformat()
 
     async def _fetch_recent(self, date: str) -> list:
+        """당일 공시를 최신순으로 받되, 접수번호 커서 이하가 보이는 페이지에서 멈춘다."""
         collected = []
+        cursor = await self._repository.get_receipt_cursor(date)
         max_pages = int(getattr(self._config, "max_pages_per_poll", 5))
         for page_no in range(1, max_pages + 1):
             page = await self._client.fetch_disclosures(date, page_no=page_no)
             collected.extend(page.items)
             if page_no >= page.total_page:
                 break
-            receipt_nos = [item.receipt_no for item in page.items]
-            known = await self._repository.get_known_receipt_nos(receipt_nos)
-            if receipt_nos and all(receipt_no in known for receipt_no in receipt_nos):
+            if cursor and any(item.receipt_no <= cursor for item in page.items):
                 break
         return collected
 
@@ -244,17 +236,7 @@ class DartDisclosureMonitorTask(SchedulableTask):
         pending = await self._repository.get_pending_immediate(threshold)
         for item in pending:
             receipt_no = item.disclosure.receipt_no
-            if receipt_no in self._ai_summary_cache:
-                ai_summary = self._ai_summary_cache[receipt_no]
-            else:
-                ai_summary = None
-                if self._ai_analyzer is not None:
-                    analysis = await self._analyze_actual_content(
-                        item.disclosure, item.importance
-                    )
-                    if analysis is not None:
-                        ai_summary = analysis.summary
-                    self._ai_summary_cache[receipt_no] = ai_summary
+            ai_summary = item.summary or None
             self._logger.info(
                 "%s: 텔레그램 발송 시작 receipt_no=%s stock_code=%s score=%s",
                 self.task_name,
@@ -279,7 +261,6 @@ class DartDisclosureMonitorTask(SchedulableTask):
                 await self._repository.mark_immediate_sent(
                     receipt_no, now
                 )
-                self._ai_summary_cache.pop(receipt_no, None)
                 self._progress["sent_count"] += 1
                 self._logger.info(
                     "%s: 텔레그램 발송 완료 receipt_no=%s", self.task_name, receipt_no
@@ -304,6 +285,93 @@ class DartDisclosureMonitorTask(SchedulableTask):
                     },
                 )
 
+    async def _run_analysis_stage(self) -> int:
+        """분석 대기 공시를 동시성 상한·건별 마감 시간 안에서 분석한다.
+
+        끝나는 순서대로 결과를 저장하고, 이미 즉시 알림이 나간 공시는 AI 요약 보강 메시지를 보낸다.
+        분석으로 즉시 알림 기준을 새로 넘긴(아직 미발송) 공시 수를 반환한다.
+        """
+        pending = await self._repository.get_pending_analysis(
+            limit=int(getattr(self._config, "ai_analysis_batch_size", 20))
+        )
+        if not pending:
+            return 0
+        semaphore = asyncio.Semaphore(
+            max(1, int(getattr(self._config, "ai_analysis_concurrency", 3)))
+        )
+        timeout_sec = float(getattr(self._config, "ai_analysis_timeout_sec", 45.0))
+        threshold = int(getattr(self._config, "immediate_alert_score", 70))
+
+        async def analyze(item: StoredDisclosure):
+            async with semaphore:
+                try:
+                    analysis = await asyncio.wait_for(
+                        self._analyze_actual_content(item.disclosure, item.importance),
+                        timeout=timeout_sec,
+                    )
+                except asyncio.TimeoutError:
+                    self._progress["analysis_timeout_count"] += 1
+                    self._logger.warning(
+                        "%s: 공시 AI 분석 마감 초과(%.0fs), 규칙 판정 유지 receipt_no=%s",
+                        self.task_name,
+                        timeout_sec,
+                        item.disclosure.receipt_no,
+                    )
+                    analysis = None
+                except Exception as exc:
+                    self._logger.warning(
+                        "%s: 공시 AI 분석 실패, 규칙 판정 유지 receipt_no=%s error=%s",
+                        self.task_name,
+                        item.disclosure.receipt_no,
+                        exc,
+                    )
+                    analysis = None
+            return item, analysis
+
+        promoted = 0
+        for finished in asyncio.as_completed([analyze(item) for item in pending]):
+            item, analysis = await finished
+            if analysis is None:
+                await self._repository.save_analysis(item.disclosure.receipt_no)
+                continue
+            importance = self._merge_importance(item.importance, analysis.importance)
+            already_sent = await self._repository.save_analysis(
+                item.disclosure.receipt_no,
+                importance,
+                event_key=analysis.event_key,
+                summary=analysis.summary or "",
+            )
+            self._logger.info(
+                "%s: 공시 AI 분석 완료 receipt_no=%s score=%s->%s already_sent=%s",
+                self.task_name,
+                item.disclosure.receipt_no,
+                item.importance.score,
+                importance.score,
+                already_sent,
+            )
+            if not already_sent:
+                if item.importance.score < threshold <= importance.score:
+                    promoted += 1
+                continue
+            if not analysis.summary:
+                continue
+            try:
+                sent = await self._reporter.send_disclosure_ai_update(
+                    item.disclosure, importance, analysis.summary
+                )
+            except Exception as exc:
+                sent = False
+                self._logger.error(
+                    "%s: AI 보강 메시지 발송 예외 receipt_no=%s error=%s",
+                    self.task_name,
+                    item.disclosure.receipt_no,
+                    exc,
+                    exc_info=True,
+                )
+            if sent:
+                self._progress["ai_update_sent_count"] += 1
+        return promoted
+
     async def _analyze_actual_content(
         self,
         disclosure,
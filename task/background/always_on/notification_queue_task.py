@@ -1,14 +1,19 @@
 """
 NotificationQueueTask — 알림 외부 핸들러(Telegram 등) 큐 소비 태스크.
 
-NotificationService.emit()이 enqueue한 이벤트를 저우선순위 백그라운드에서
-순차적으로 소비하여 외부 핸들러에 전달한다.
+NotificationService.emit()이 enqueue한 이벤트를 배치로 꺼내 NotificationDispatcher 에 넘긴다.
+디스패처가 라우팅 필터 · 같은 카테고리 digest 요약 · 핸들러별 동시 전송 상한과
+token bucket 속도 제한을 담당하므로, 이 태스크는 고정 sleep 없이 큐가 비는 대로 바로 다음 배치를 꺼낸다.
+
+배치 수집:
+  - 첫 이벤트를 기다린 뒤 이미 쌓인 이벤트를 batch_max 까지 즉시 꺼낸다.
+  - 두 건 이상이 몰려 있으면(burst) coalesce_window_sec 동안 더 모아 digest 로 묶일 기회를 준다.
+    단건은 기다리지 않고 바로 보낸다.
 
 idle 감지 전략:
   Layer 1 — ForegroundScheduler가 포그라운드 작업 시작 시 BackgroundScheduler.suspend_all()을
              호출하므로, 이 태스크도 자동으로 SUSPENDED 상태로 전환된다.
-  Layer 2 — asyncio cooperative scheduling: asyncio.wait_for(timeout=1.0) 대기 중 다른
-             코루틴이 실행되고, 이벤트 처리 후 asyncio.sleep(poll_interval)로 추가 양보한다.
+  Layer 2 — asyncio cooperative scheduling: 큐 대기 · token bucket 대기 중 다른 코루틴이 실행된다.
 """
 from __future__ import annotations
 
@@ -17,9 +22,10 @@ import logging
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 from interfaces.schedulable_task import SchedulableTask, TaskPriority, TaskState
+from services.notification_dispatcher import NotificationDispatcher
 
 if TYPE_CHECKING:
-    from services.notification_service import NotificationService
+    from services.notification_service import NotificationEvent, NotificationService
 
 
 class NotificationQueueTask(SchedulableTask):
@@ -28,14 +34,19 @@ class NotificationQueueTask(SchedulableTask):
     def __init__(
         self,
         notification_service: "NotificationService",
-        poll_interval: float = 1.0,
         telegram_config=None,
+        dispatch_config=None,
         logger: Optional[logging.Logger] = None,
+        dispatcher: Optional[NotificationDispatcher] = None,
     ) -> None:
         self._ns = notification_service
-        self._poll_interval = poll_interval
-        self._telegram_config = telegram_config
         self._logger = logger or logging.getLogger(__name__)
+        self._dispatcher = dispatcher or NotificationDispatcher(
+            notification_service,
+            telegram_config=telegram_config,
+            dispatch_config=dispatch_config,
+            logger=self._logger,
+        )
         self._state: TaskState = TaskState.IDLE
         self._tasks: List[asyncio.Task] = []
         self._resume_event: Optional[asyncio.Event] = None
@@ -97,12 +108,13 @@ class NotificationQueueTask(SchedulableTask):
         return {
             "running": self._state == TaskState.RUNNING,
             "queued_events": self._ns.external_handler_queue.qsize(),
+            "dispatch": self._dispatcher.get_metrics(),
         }
 
     # ── Drain loop ────────────────────────────────────────────────
 
     async def _drain_loop(self) -> None:
-        """큐에서 이벤트를 하나씩 꺼내 모든 외부 핸들러에 순차 전달한다."""
+        """큐에서 이벤트를 배치로 꺼내 디스패처로 전달한다."""
         queue = self._ns.external_handler_queue
         while True:
             try:
@@ -110,25 +122,17 @@ class NotificationQueueTask(SchedulableTask):
                 await self._resume_event.wait()
 
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=1.0)
+                    first = await asyncio.wait_for(queue.get(), timeout=1.0)
                 except asyncio.TimeoutError:
                     continue
 
-                if not self._should_send_external(event):
-                    queue.task_done()
-                    await asyncio.sleep(self._poll_interval)
-                    continue
-
-                for handler in self._ns.external_handlers:
-                    try:
-                        await handler(event)
-                    except Exception as e:
-                        self._logger.error(
-                            f"[NotificationQueueTask] 핸들러 오류 ({getattr(handler, '__name__', handler)}): {e}"
-                        )
-
-                queue.task_done()
-                await asyncio.sleep(self._poll_interval)
+                batch = [first]
+                try:
+                    await self._fill_batch(queue, batch)
+                    await self._dispatcher.dispatch(batch)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
 
             except asyncio.CancelledError:
                 self._logger.info("NotificationQueueTask drain_loop 취소됨")
@@ -137,19 +141,29 @@ class NotificationQueueTask(SchedulableTask):
                 self._logger.error(f"[NotificationQueueTask] drain_loop 예외: {e}", exc_info=True)
                 await asyncio.sleep(1.0)
 
-    def _should_send_external(self, event) -> bool:
-        cfg = self._telegram_config
-        if cfg is None:
-            return True
-        if not getattr(cfg, "enabled", True):
-            return False
-        metadata = getattr(event, "metadata", {}) or {}
-        if isinstance(metadata, dict) and metadata.get("force_external"):
-            return True
-        route_levels = getattr(cfg, "route_levels", None)
-        if not route_levels:
-            return True
-        category = getattr(event.category, "value", str(event.category))
-        level = getattr(event.level, "value", str(event.level))
-        allowed = route_levels.get(category) or route_levels.get(category.upper()) or []
-        return level in allowed
+    async def _fill_batch(self, queue: asyncio.Queue, batch: List["NotificationEvent"]) -> None:
+        """이미 쌓인 이벤트를 batch_max 까지 꺼내고, burst 면 coalesce 창 동안 더 모은다."""
+        batch_max = self._dispatcher.batch_max
+        self._drain_ready(queue, batch, batch_max)
+        window = self._dispatcher.coalesce_window_sec
+        if len(batch) < 2 or window <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window
+        while len(batch) < batch_max:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+            self._drain_ready(queue, batch, batch_max)
+
+    @staticmethod
+    def _drain_ready(queue: asyncio.Queue, batch: List["NotificationEvent"], batch_max: int) -> None:
+        while len(batch) < batch_max:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 
 from common.types import ErrorCode
+from core.lazy_service import aresolve_lazy
 from interfaces.schedulable_task import SchedulableTask, TaskPriority, TaskState
 from repositories.favorite_repository import MARKET_OVERSEAS_US
 
@@ -82,6 +83,8 @@ class OverseasFavoritePriceAlertTask(SchedulableTask):
         if not self._is_market_open_now():
             return
         symbols = await self._favorite_repository.get_all(market=MARKET_OVERSEAS_US)
+        # 심볼 마스터는 지연 생성 프록시(LazyService)라 루프 밖에서 만든다 (실패 시 None → 기본 거래소).
+        self._overseas_stock_code_repository = await aresolve_lazy(self._overseas_stock_code_repository)
         for symbol in symbols:
             symbol = self._normalize_symbol(symbol)
             if not symbol:
@@ -0,0 +1,96 @@
+"""WebSocket 슬롯 밖 종목 현재가 중앙 REST 폴링 태스크."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from interfaces.schedulable_task import SchedulableTask, TaskPriority, TaskState
+
+
+class RestPricePollTask(SchedulableTask):
+    """장중 매 초 RestPricePoller.run_sweep 을 호출해 due 종목을 배치 REST 로 갱신한다.
+
+    갱신 주기·배치·예산 판단은 폴러가 하고, 태스크는 장 운영 시간 판정과 루프만 맡는다.
+    장 마감·일시중지·종료로 sweep 이 멈추면 폴러의 갱신 주기를 비운다.
+    """
+
+    CHECK_INTERVAL_SEC = 1.0
+
+    def __init__(self, *, poller, market_clock, market_calendar_service=None,
+                 check_interval_sec: Optional[float] = None, logger=None) -> None:
+        self._poller = poller
+        self._market_clock = market_clock
+        self._mcs = market_calendar_service
+        self._check_interval_sec = check_interval_sec or self.CHECK_INTERVAL_SEC
+        self._logger = logger or logging.getLogger(__name__)
+        self._state = TaskState.IDLE
+        self._task: Optional[asyncio.Task] = None
+        self._business_day: Optional[tuple] = None  # (YYYYMMDD, 영업일 여부) — 매 초 조회 방지
+
+    @property
+    def task_name(self) -> str:
+        return "rest_price_poll"
+
+    @property
+    def priority(self) -> TaskPriority:
+        return TaskPriority.HIGH
+
+    @property
+    def state(self) -> TaskState:
+        return self._state
+
+    def get_progress(self) -> dict:
+        return {"running": self._state == TaskState.RUNNING, **self._poller.get_stats()}
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._state = TaskState.STOPPED
+        self._poller.clear_intervals()
+
+    async def suspend(self) -> None:
+        self._state = TaskState.SUSPENDED
+        self._poller.clear_intervals()
+
+    async def resume(self) -> None:
+        if self._state == TaskState.SUSPENDED:
+            self._state = TaskState.IDLE
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                if self._state != TaskState.SUSPENDED:
+                    self._state = TaskState.RUNNING
+                    await self._tick()
+                    if self._state == TaskState.RUNNING:
+                        self._state = TaskState.IDLE
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                self._logger.error("%s: loop error — %s", self.task_name, exc, exc_info=True)
+            await asyncio.sleep(self._check_interval_sec)
+
+    async def _tick(self) -> None:
+        if not await self._is_market_open_now():
+            # sweep 이 멈춘 동안 지난 주기로 신선도를 판정하지 않도록 비운다
+            self._poller.clear_intervals()
+            return
+        await self._poller.run_sweep()
+
+    async def _is_market_open_now(self) -> bool:
+        now = self._market_clock.get_current_kst_time()
+        if not self._market_clock.is_market_operating_hours(now):
+            return False
+        if self._mcs is None:
+            return True
+        today = now.strftime("%Y%m%d")
+        if self._business_day is None or self._business_day[0] != today:
+            self._business_day = (today, bool(await self._mcs.is_business_day(today)))
+        return self._business_day[1]
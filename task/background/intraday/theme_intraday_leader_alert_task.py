@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from common.types import ErrorCode
+from core.lazy_service import aresolve_lazy
 from interfaces.schedulable_task import SchedulableTask, TaskPriority, TaskState
 
 if TYPE_CHECKING:
@@ -189,13 +190,20 @@ class ThemeIntradayLeaderAlertTask(SchedulableTask):
 
     async def _refresh_latest_report(self, captured_at: str) -> None:
         self._progress["last_error"] = None
+        # 지연 생성 프록시(LazyService)는 루프 밖에서 만들고, 생성 실패면 None 이다.
+        theme_service = await aresolve_lazy(self._theme_daily_leader_service)
+        if theme_service is None:
+            self._progress["last_error"] = "theme_service_unavailable"
+            self._logger.warning(f"{self.task_name}: 주도테마 서비스 생성 실패 — {captured_at} 스킵")
+            return
+
         rankings = await self._build_intraday_rankings(captured_at)
         if not rankings or not rankings.get("all_stocks"):
             self._progress["last_error"] = "intraday_ranking_empty"
             self._logger.info(f"{self.task_name}: 장중 기본 랭킹 없음 — {captured_at} 스킵")
             return
 
-        theme_resp = await self._theme_daily_leader_service.build_intraday_theme_report(
+        theme_resp = await theme_service.build_intraday_theme_report(
             rankings,
             report_time=captured_at,
         )
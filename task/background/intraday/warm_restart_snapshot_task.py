@@ -0,0 +1,122 @@
+"""장중 hot state 를 주기적으로 웜 리스타트 스냅샷 파일에 떠 두는 태스크."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from interfaces.schedulable_task import SchedulableTask, TaskPriority, TaskState
+
+if TYPE_CHECKING:
+    from core.market_clock import MarketClock
+    from services.warm_restart_snapshot_service import WarmRestartSnapshotService
+
+
+class WarmRestartSnapshotTask(SchedulableTask):
+    """장 운영 시간에 interval_sec 마다 스냅샷을 저장한다.
+
+    크래시 시 최대 interval_sec 만큼의 상태만 잃는다. 정상 종료(stop) 때는 이번 프로세스에서
+    한 번이라도 저장한 적이 있으면 마지막 상태를 한 번 더 저장해 배포 재기동 공백을 줄인다.
+    """
+
+    CHECK_INTERVAL_SEC = 60
+
+    def __init__(
+        self,
+        *,
+        snapshot_service: "WarmRestartSnapshotService",
+        market_clock: Optional["MarketClock"],
+        logger: Optional[logging.Logger] = None,
+        interval_sec: int = CHECK_INTERVAL_SEC,
+    ) -> None:
+        self._snapshot_service = snapshot_service
+        self._market_clock = market_clock
+        self._logger = logger or logging.getLogger(__name__)
+        self._interval_sec = int(interval_sec)
+        self._state = TaskState.IDLE
+        self._tasks: List[asyncio.Task] = []
+        self._capture_count = 0
+        self._last_result: Dict = {}
+
+    @property
+    def task_name(self) -> str:
+        return "warm_restart_snapshot"
+
+    @property
+    def priority(self) -> TaskPriority:
+        return TaskPriority.LOW
+
+    @property
+    def state(self) -> TaskState:
+        return self._state
+
+    async def start(self) -> None:
+        if any(not task.done() for task in self._tasks):
+            return
+        if self._state == TaskState.STOPPED:
+            self._state = TaskState.IDLE
+        self._tasks.append(asyncio.create_task(self._loop()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._capture_count > 0:
+            await self.run_once()
+        self._state = TaskState.STOPPED
+
+    async def suspend(self) -> None:
+        if self._state == TaskState.RUNNING:
+            self._state = TaskState.SUSPENDED
+
+    async def resume(self) -> None:
+        if self._state == TaskState.SUSPENDED:
+            self._state = TaskState.IDLE
+
+    def get_progress(self) -> Dict:
+        return {
+            "running": self._state == TaskState.RUNNING,
+            "capture_count": self._capture_count,
+            "last_result": dict(self._last_result),
+        }
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self._interval_sec)
+                if self._state == TaskState.SUSPENDED:
+                    continue
+                if self._market_clock is None or not self._market_clock.is_market_operating_hours():
+                    continue
+                self._state = TaskState.RUNNING
+                try:
+                    await self.run_once()
+                finally:
+                    if self._state == TaskState.RUNNING:
+                        self._state = TaskState.IDLE
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                self._logger.error(f"[WarmRestartSnapshot] loop error: {exc}", exc_info=True)
+
+    async def run_once(self) -> Dict:
+        """오늘 기준일로 스냅샷을 한 번 저장한다. 실패는 로그만 남긴다."""
+        if self._market_clock is None:
+            return {"saved": False, "reason": "market_clock_missing"}
+        trading_date = self._market_clock.get_current_kst_time().strftime("%Y%m%d")
+        try:
+            stats = await self._snapshot_service.capture(trading_date)
+        except Exception as exc:
+            self._logger.warning(f"[WarmRestartSnapshot] 스냅샷 저장 실패: {exc}", exc_info=True)
+            self._last_result = {"saved": False, "reason": str(exc)}
+            return self._last_result
+        self._capture_count += 1
+        self._last_result = {"saved": True, **stats}
+        self._logger.debug(
+            f"[WarmRestartSnapshot] 저장 완료 {stats['bytes']}B "
+            f"(일봉 {stats['ohlcv_codes']}종목, 지표 {stats['indicator_series']}건, {stats['elapsed_ms']:.0f}ms)"
+        )
+        return self._last_result
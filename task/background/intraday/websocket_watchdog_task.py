@@ -304,6 +304,10 @@ class WebSocketWatchdogTask(SchedulableTask):
                         if refreshable_no_tick_codes:
                             await self._refresh_subscribed_no_tick_codes(refreshable_no_tick_codes)
 
+                    # 효용 기반 슬롯 배정은 주기마다 재계산한다 (교체 억제는 정책 히스테리시스가 담당).
+                    if receive_alive:
+                        await self._resolve_slot_allocation()
+
                 reconnect_trigger = None
                 if not receive_alive:
                     # 연결이 죽었으면 PT/체결가 구분 없이 재연결
@@ -395,6 +399,17 @@ class WebSocketWatchdogTask(SchedulableTask):
             self.REALTIME_HEALTH_CHECK_END_MINUTE,
         )
 
+    async def _resolve_slot_allocation(self) -> None:
+        resolver = getattr(self._price_subscription_service, "resolve_slot_allocation", None)
+        if not callable(resolver):
+            return
+        try:
+            result = resolver()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self._logger.warning(f"[WebSocketWatchdog] 슬롯 재배정 실패 — {e}")
+
     def _release_recovered_no_tick_codes(self) -> None:
         """격리된 종목이 다시 틱을 받으면 격리를 해제한다."""
         if not self._price_stream_service:
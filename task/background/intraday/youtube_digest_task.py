@@ -20,6 +20,7 @@ from datetime import timedelta
 from typing import Dict, List, Optional
 
 from common.types import ErrorCode
+from core.lazy_service import aresolve_lazy
 from interfaces.schedulable_task import SchedulableTask, TaskPriority, TaskState
 from services.notification_service import NotificationCategory, NotificationLevel
 
@@ -165,6 +166,12 @@ class YoutubeDigestTask(SchedulableTask):
         report_date = now.strftime("%Y%m%d")
         self._last_error = None
         try:
+            # 지연 생성 프록시(LazyService)는 첫 실행 때 루프 밖에서 만들어 실제 인스턴스로 바꿔 둔다.
+            self._channel_repo = await aresolve_lazy(self._channel_repo)
+            self._collector = await aresolve_lazy(self._collector)
+            self._digest_repo = await aresolve_lazy(self._digest_repo)
+            if self._channel_repo is None or self._collector is None or self._digest_repo is None:
+                raise RuntimeError("채널 저장소·자막 수집기·리포트 저장소 생성 실패")
             channels = await self._channel_repo.get_all(enabled_only=True)
             if not channels:
                 self._logger.info("[YoutubeDigest] 등록된 채널이 없어 건너뜁니다.")
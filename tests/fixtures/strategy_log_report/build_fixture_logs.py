@@ -0,0 +1,122 @@
+"""StrategyLogReportService golden 비교용 fixture 로그 디렉토리 생성기.
+
+`golden_report_20260418.html` 은 single-pass/incremental 리팩토링 이전 구현이 이
+디렉토리로 생성한 리포트(생성 시각 footer 제외)다. 로그 파일은 48시간 mtime
+필터를 통과해야 하므로 저장소에 고정 파일로 두지 않고 테스트마다 새로 쓴다.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+
+TARGET_DATE = "20260418"
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden_report_20260418.html")
+
+
+def _entry(ts: str, data: dict, level: str = "DEBUG") -> dict:
+    return {"timestamp": f"2026-04-18 {ts},000", "level": level, "name": "strategy.test", "data": data}
+
+
+def _rej(ts, event, code, name, reason, **extra):
+    return _entry(ts, {"event": event, "code": code, "name": name, "reason": reason, **extra})
+
+
+def fixture_files() -> dict[str, list]:
+    """상대 경로 → 로그 line 목록 (dict 는 JSON 으로, bytes 는 그대로 기록)."""
+    squeeze = [
+        _entry("09:00:01", {"event": "scan_with_watchlist", "count": 42}),
+        _entry("09:00:02", {"event": "market_timing_updated", "market": "KOSPI", "ok": True}),
+        _entry("09:00:02", {"event": "market_timing_updated", "market": "KOSDAQ", "ok": False}),
+        _rej("09:01:00", "breakout_rejected", "005930", "삼성전자", "low_execution_strength", cgld=87.5, threshold=120),
+        _rej("09:02:00", "breakout_rejected", "005930", "삼성전자", "smart_money_filter_failed"),
+        _rej("09:03:00", "breakout_rejected", "000660", "SK하이닉스", "insufficient_projected_volume", proj_vol=120000, threshold=300000),
+        _rej("09:04:00", "breakout_rejected", "035420", "NAVER", "poor_candle_quality", pos=0.41),
+        _rej("09:05:00", "entry_rejected", "068270", "셀트리온", "over_extended", current=210000, max_entry=200000),
+        _rej("09:06:00", "breakout_rejected", "123456", "123456", "시가/현재가 0 (invalid price data)"),
+        _entry("09:06:30", {"event": "breakout_skipped", "code": "000660", "reason": "early_morning_guard"}),
+        _entry("09:10:00", {
+            "event": "buy_signal_generated", "code": "051910", "name": "LG화학", "reason": "스퀴즈 돌파",
+            "metrics": {"price": 412000, "volatility_20d_annualized": 0.31, "entry_reason": "squeeze",
+                        "confidence": 0.7, "expected_holding_period_days": 5},
+        }, level="INFO"),
+        _rej("09:11:00", "breakout_rejected", "051910", "LG화학", "low_execution_strength", cgld=99.0, threshold=120),
+        _entry("09:12:00", {
+            "event": "candidate_liquidity", "code": "051910",
+            "candidates": [
+                {"code": "051910", "name": "LG화학", "avg_trading_value_5d": 8.5e10, "planned_order_amount_won": 2_000_000},
+                {"code": "000660", "metrics": {"avg_5d_tv": 1.2e11}, "qty": 10, "price": 180000},
+                {"code": "999999", "avg_trading_value_5d": 0},
+            ],
+        }),
+        _entry("09:13:00", {
+            "event": "execution_quality", "code": "051910", "name": "LG화학", "source": "strategy:OneilSqueezeBreakout",
+            "order_key": "ok-1", "side": "BUY", "state": "FILLED", "order_type": "market", "spread_pct": 0.1,
+            "order_qty": 5, "filled_qty": 5, "remaining_qty": 0, "fill_ratio_pct": 100, "unfilled_ratio_pct": 0,
+            "order_age_sec": 2.0, "slippage_amount_won": 500, "slippage_pct": 0.12, "first_fill_latency_sec": 0.8,
+        }, level="INFO"),
+        _entry("09:14:00", {
+            "event": "execution_quality", "code": "051910", "source": "strategy:OneilSqueezeBreakout",
+            "order_key": "ok-1", "side": "BUY", "state": "FILLED", "order_type": "market",
+            "order_qty": 5, "filled_qty": 5, "slippage_pct": 0.15, "first_fill_latency_sec": 0.9,
+        }, level="INFO"),
+        b"not-json-line\n",
+        _entry("09:20:00", {"event": "scan_with_watchlist", "count": 37}),
+        {"timestamp": "2026-04-17 15:00:00,000", "level": "DEBUG", "name": "x",
+         "data": {"event": "breakout_rejected", "code": "111111", "name": "전일종목", "reason": "poor_candle_quality"}},
+    ]
+    htf = [
+        _entry("09:30:00", {"event": "htf_pattern_detected", "code": "247540", "name": "에코프로비엠",
+                            "surge_ratio": 2.3, "flag_days": 6}),
+        _rej("09:31:00", "htf_rejected", "247540", "에코프로비엠", "below_breakout_buffer"),
+        _entry("09:32:00", {"event": "htf_pattern_detected", "code": "086520", "name": "에코프로",
+                            "surge_ratio": 1.8, "flag_days": 4}),
+        _entry("09:33:00", {"event": "breakout_skipped", "code": "086520", "reason": "early_morning_guard"}),
+    ]
+    pocket = [
+        _rej("10:00:00", "pp_rejected", "000270", "기아", "no_ma_proximity", closest_ma_pct=5.5),
+        _rej("10:01:00", "pp_rejected", "005380", "현대차", "no_ma_proximity", closest_ma_pct=9.9),
+        _rej("10:02:00", "pp_rejected", "012330", "현대모비스", "insufficient_volume", proj_vol=5000, threshold=9000),
+        _rej("10:03:00", "entry_rejected", "012330", "현대모비스", "no_bullish_reversal"),
+        _rej("10:04:00", "fp_custom_rejected", "003550", "LG", "not_near_high", distance_pct=6.2, threshold=5.0),
+        _entry("10:05:00", {
+            "event": "buy_signal_generated", "code": "051910", "name": "LG화학", "reason": "포켓피봇",
+            "metrics": {"price": 413000},
+        }, level="INFO"),
+    ]
+    scan_only = [_entry("11:00:00", {"event": "scan_with_watchlist", "count": 12})]
+    inactive = [
+        {"timestamp": "2026-04-17 11:00:00,000", "level": "INFO", "name": "x",
+         "data": {"event": "scan_with_watchlist", "count": 3}},
+    ]
+    return {
+        "20260418_OneilSqueezeBreakout.log.json": squeeze[:10],
+        "20260418_OneilSqueezeBreakout_2.log.json": squeeze[10:],
+        "20260418_HighTightFlag.log.json.gz": htf,
+        "oneil/20260418_OneilPocketPivot.log.json": pocket,
+        "20260418_RSI2Pullback.log.json": scan_only,
+        "20260418_FirstPullback.log.json": inactive,
+    }
+
+
+def encode_line(item) -> bytes:
+    if isinstance(item, bytes):
+        return item
+    return json.dumps(item, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def write_fixture_logs(log_dir: str, files: dict[str, list] | None = None) -> dict[str, str]:
+    """fixture 로그를 log_dir 아래에 쓰고 상대 경로 → 절대 경로를 돌려준다."""
+    written = {}
+    for rel, lines in (files or fixture_files()).items():
+        path = os.path.join(log_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = b"".join(encode_line(item) for item in lines)
+        if rel.endswith(".gz"):
+            with gzip.open(path, "wb") as fp:
+                fp.write(payload)
+        else:
+            with open(path, "wb") as fp:
+                fp.write(payload)
+        written[rel] = path
+    return written
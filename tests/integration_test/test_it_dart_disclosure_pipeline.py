@@ -82,6 +82,7 @@ async def test_it_new_favorite_disclosure_is_sent_once_and_persisted(tmp_path):
     assert "전환사채권발행결정" in message
     assert "rcpNo=20260714001234" in message
     assert await repository.get_pending_immediate(70) == []
+    await repository.close()
 
 
 async def test_it_zero_stripped_favorite_codes_match_dart_six_digit_codes(tmp_path):
@@ -158,6 +159,7 @@ async def test_it_zero_stripped_favorite_codes_match_dart_six_digit_codes(tmp_pa
     assert "삼성전자" in sent_text
     assert "한미반도체" in sent_text
     assert await repository.get_pending_immediate(70) == []
+    await repository.close()
 
 
 async def test_it_actual_body_promotes_generic_title_to_immediate_alert(tmp_path):
@@ -248,3 +250,4 @@ async def test_it_actual_body_promotes_generic_title_to_immediate_alert(tmp_path
     message = reporter._send_message.await_args.args[0]
     assert "신제품·전용 공장·미국 법인" in message
     assert "75점" in message
+    await repository.close()
@@ -82,6 +82,7 @@ def fake_web_ctx():
 
     ctx.load_config_and_env = MagicMock()
     ctx.initialize_services = AsyncMock(return_value=True)
+    ctx.prewarm_websocket = AsyncMock(return_value=True)
     ctx.initialize_scheduler = MagicMock()
     ctx.ensure_strategy_states_loaded = AsyncMock()
     ctx._initialize_price_subscriptions = AsyncMock()
@@ -455,3 +455,9 @@ def test_cache_store_get_raw_rejects_invalid_timestamp_without_logger(cache_stor
 
 def test_cache_store_get_returns_none(cache_store):
     assert cache_store.get("missing_key") is None
+
+
+def test_cache_store_get_returns_memory_value_without_wrapper(cache_store):
+    cache_store.set("rsi_2_005930_20260501", [{"date": "20260501", "rsi": 42.0}])
+
+    assert cache_store.get("rsi_2_005930_20260501") == [{"date": "20260501", "rsi": 42.0}]
@@ -0,0 +1,226 @@
+"""ApiBudgetLimiter adaptive(AIMD) rate 제어.
+
+- 성공 응답이 이어지면 normal lane rate 가 additive 하게 오르고, EGW00201·p95 지연 상승 시
+  multiplicative 하게 내려간다. emergency lane 은 고정 rate 를 유지한다.
+- 숨은(시간에 따라 바뀌는) 호출 한도를 가진 fake 서버 시뮬레이션에서 고정 rate 보다
+  처리량이 높고, 한도 초과 거부는 일정 비율 이하로 유지된다.
+"""
+from __future__ import annotations
+
+import collections
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.types import ErrorCode, ResCommonResponse
+from core.api_priority import PRIORITY_EMERGENCY
+from core.retry_queue.api_budget_limiter import AdaptiveRateConfig, ApiBudgetLimiter
+from core.retry_queue.api_request_queue import ApiRequestQueue
+from core.retry_queue.retry_classifier import is_rate_limit_error
+
+
+class _VirtualClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _limiter(clock: _VirtualClock, adaptive: AdaptiveRateConfig | None = AdaptiveRateConfig()) -> ApiBudgetLimiter:
+    return ApiBudgetLimiter(
+        {"quotation_price": 4, "order_submit": 1},
+        rate_limits_per_sec={"quotation_price": 8.0, "order_submit": 2.0},
+        global_rate_limit_per_sec=8.0,
+        emergency_global_rate_limit_per_sec=2.0,
+        monotonic=clock.monotonic,
+        sleep=clock.sleep,
+        adaptive=adaptive,
+    )
+
+
+def _live(limiter: ApiBudgetLimiter, category: str) -> float:
+    return limiter.snapshot()[category]["adaptive"]["live_rate_per_sec"]
+
+
+def test_record_result_is_noop_without_adaptive_config():
+    limiter = _limiter(_VirtualClock(), adaptive=None)
+    limiter.record_result("quotation_price", success=False, rate_limited=True)
+
+    snapshot = limiter.snapshot()
+    assert snapshot["quotation_price"]["rate_limit_per_sec"] == 8.0
+    assert "adaptive" not in snapshot["quotation_price"]
+    assert "adaptive" not in snapshot["_global"]
+
+
+def test_success_increases_rate_additively_up_to_max():
+    clock = _VirtualClock()
+    limiter = _limiter(clock)
+    for _ in range(8):
+        clock.now += 0.125
+        limiter.record_result("quotation_price", success=True)
+
+    # 8 req/s 로 1초 분량 성공 → 약 +1 req/s
+    assert 8.9 < _live(limiter, "quotation_price") < 9.1
+    assert limiter.snapshot()["quotation_price"]["rate_limit_per_sec"] == pytest.approx(
+        _live(limiter, "quotation_price"), abs=1e-3,
+    )
+
+    for _ in range(2000):
+        clock.now += 0.05
+        limiter.record_result("quotation_price", success=True)
+    assert _live(limiter, "quotation_price") == 10.0  # max_rate_ratio 1.25
+
+
+def test_rate_limit_error_cuts_category_and_global_once_per_cooldown():
+    clock = _VirtualClock()
+    limiter = _limiter(clock)
+    limiter.record_result("quotation_price", success=False, rate_limited=True)
+    limiter.record_result("quotation_price", success=False, rate_limited=True)  # in-flight 중복
+
+    snapshot = limiter.snapshot()
+    assert snapshot["quotation_price"]["adaptive"]["live_rate_per_sec"] == pytest.approx(5.6)
+    assert snapshot["_global"]["adaptive"]["live_rate_per_sec"] == pytest.approx(5.6)
+    assert snapshot["quotation_price"]["adaptive"]["rate_limit_decrease_total"] == 1
+    assert snapshot["quotation_price"]["adaptive"]["rate_limited_total"] == 2
+    # global normal lane 은 knee(8) 아래로 emergency global rate(2) 만큼 headroom 을 남긴다.
+    assert snapshot["_global"]["adaptive"]["ceiling_per_sec"] == pytest.approx(6.0)
+
+    clock.now += 1.5
+    limiter.record_result("quotation_price", success=False, rate_limited=True)
+    assert _live(limiter, "quotation_price") == pytest.approx(5.6 * 0.7)
+
+
+def test_rate_never_drops_below_floor():
+    clock = _VirtualClock()
+    limiter = _limiter(clock)
+    for _ in range(30):
+        clock.now += 2.0
+        limiter.record_result("quotation_price", success=False, rate_limited=True)
+    assert _live(limiter, "quotation_price") == pytest.approx(2.0)  # min_rate_ratio 0.25
+
+
+def test_rising_p95_latency_decreases_rate():
+    clock = _VirtualClock()
+    limiter = _limiter(clock, AdaptiveRateConfig(latency_window=20, increase_per_sec=0.0))
+    for _ in range(20):
+        clock.now += 0.1
+        limiter.record_result("quotation_price", success=True, latency_sec=0.05)
+    assert limiter.snapshot()["quotation_price"]["adaptive"]["baseline_p95_sec"] == pytest.approx(0.05)
+
+    for _ in range(20):
+        clock.now += 0.1
+        limiter.record_result("quotation_price", success=True, latency_sec=0.3)
+
+    adaptive = limiter.snapshot()["quotation_price"]["adaptive"]
+    assert adaptive["latency_decrease_total"] == 1
+    assert adaptive["live_rate_per_sec"] == pytest.approx(8.0 * 0.85)
+    # 지연은 카테고리 신호 — global lane 은 건드리지 않는다.
+    assert limiter.snapshot()["_global"]["adaptive"]["latency_decrease_total"] == 0
+
+
+def test_emergency_lanes_keep_fixed_rate():
+    clock = _VirtualClock()
+    limiter = _limiter(clock)
+    for _ in range(50):
+        clock.now += 0.5
+        limiter.record_result("order_submit", success=True, priority=PRIORITY_EMERGENCY)
+    limiter.record_result("order_submit", success=False, rate_limited=True, priority=PRIORITY_EMERGENCY)
+
+    snapshot = limiter.snapshot()
+    assert snapshot["order_submit"]["emergency"]["rate_limit_per_sec"] == 2.0
+    assert "adaptive" not in snapshot["order_submit"]["emergency"]
+    assert snapshot["_global"]["emergency"]["rate_limit_per_sec"] == 2.0
+    # emergency 성공은 normal lane 을 올리지 않지만, 한도 초과는 global normal lane 을 줄인다.
+    assert snapshot["order_submit"]["adaptive"]["live_rate_per_sec"] == 2.0
+    assert snapshot["_global"]["adaptive"]["live_rate_per_sec"] == pytest.approx(5.6)
+
+
+def test_is_rate_limit_error_matches_kis_messages():
+    assert is_rate_limit_error(ResCommonResponse(rt_cd="1", msg1="EGW00201 초당 거래건수를 초과하였습니다.", data=None))
+    assert is_rate_limit_error(ResCommonResponse(rt_cd=ErrorCode.API_ERROR.value, msg1="요청이 많습니다", data=None))
+    assert not is_rate_limit_error(ResCommonResponse(rt_cd="1", msg1="잔고부족", data=None))
+    assert not is_rate_limit_error(ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="EGW00201", data=None))
+    assert not is_rate_limit_error(None)
+
+
+async def test_request_queue_reports_outcomes_to_limiter():
+    clock = _VirtualClock()
+    limiter = _limiter(clock)
+    queue = ApiRequestQueue(logger=MagicMock(), budget_limiter=limiter)
+    queue.MAX_RETRIES = 1
+
+    async def ok():
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data={})
+
+    async def throttled():
+        return ResCommonResponse(rt_cd="1", msg1="EGW00201 초당 거래건수를 초과하였습니다.", data=None)
+
+    await (await queue.submit(ok, request_category="quotation_price"))
+    assert limiter.snapshot()["quotation_price"]["adaptive"]["increase_total"] == 1
+
+    await (await queue.submit(throttled, request_category="quotation_price"))
+    adaptive = limiter.snapshot()["quotation_price"]["adaptive"]
+    assert adaptive["rate_limited_total"] == 1
+    assert adaptive["live_rate_per_sec"] < 8.0
+
+
+class _HiddenLimitServer:
+    """최근 1초 창 안의 호출 수가 숨은 한도를 넘으면 EGW00201 로 거부한다 (거부도 창에 포함)."""
+
+    def __init__(self, clock: _VirtualClock, schedule: list[tuple[float, int]]) -> None:
+        self._clock = clock
+        self._schedule = schedule
+        self._window: collections.deque[float] = collections.deque()
+
+    def limit_at(self, t: float) -> int:
+        return next((limit for until, limit in self._schedule if t < until), self._schedule[-1][1])
+
+    def call(self) -> bool:
+        t = self._clock.now
+        while self._window and self._window[0] <= t - 1.0:
+            self._window.popleft()
+        accepted = len(self._window) < self.limit_at(t)
+        self._window.append(t)
+        return accepted
+
+
+async def _simulate(adaptive: AdaptiveRateConfig | None, schedule, duration: float):
+    clock = _VirtualClock()
+    limiter = _limiter(clock, adaptive)
+    server = _HiddenLimitServer(clock, schedule)
+    phase_len = duration / len(schedule)
+    accepted = collections.Counter()
+    rejected = collections.Counter()
+    while clock.now < duration:
+        async with limiter.acquire("quotation_price"):
+            phase = min(len(schedule) - 1, int(clock.now // phase_len))
+            ok = server.call()
+            (accepted if ok else rejected)[phase] += 1
+        limiter.record_result("quotation_price", success=ok, rate_limited=not ok, latency_sec=0.05)
+    return accepted, rejected, limiter
+
+
+async def test_simulation_tracks_hidden_time_varying_limit():
+    """숨은 한도 12 → 7 → 15 req/s (각 30초). emergency headroom 2 req/s 를 남긴 한도가 목표."""
+    schedule = [(30.0, 12), (60.0, 7), (90.0, 15)]
+    headroom = 2.0
+
+    # 설정 rate(8) 위의 숨은 한도(15)까지 탐색하도록 상한을 2배로 연다
+    accepted, rejected, limiter = await _simulate(AdaptiveRateConfig(max_rate_ratio=2.0), schedule, 90.0)
+    static_accepted, _, _ = await _simulate(None, schedule, 90.0)
+
+    target = sum((limit - headroom) * 30 for _, limit in schedule)
+    total_accepted = sum(accepted.values())
+    total_rejected = sum(rejected.values())
+    assert total_accepted >= 0.9 * target
+    assert total_accepted > 1.15 * sum(static_accepted.values())
+    assert total_rejected <= 0.05 * (total_accepted + total_rejected)
+    # 각 구간(한도 변경 후 적응 시간 포함)에서도 headroom 목표의 75% 이상을 처리한다.
+    for phase, (_, limit) in enumerate(schedule):
+        assert accepted[phase] >= 0.75 * (limit - headroom) * 30
+    # 종료 시점 global live rate 는 숨은 한도를 넘지 않는다.
+    assert limiter.snapshot()["_global"]["adaptive"]["live_rate_per_sec"] <= 15.0
@@ -213,6 +213,7 @@ class TestAsyncMethodThroughQueue:
         ("method_name", "expected_category"),
         [
             ("get_current_price", "quotation_price"),
+            ("get_multi_price", "quotation_price"),
             ("get_current_conclusion", "quotation_conclusion"),
             ("inquire_daily_itemchartprice", "quotation_ohlcv"),
             ("inquire_time_itemchartprice", "quotation_ohlcv"),
@@ -235,6 +236,7 @@ class TestApiBudgetCoverageMatrix:
 
         assert {
             "current_price_rest",
+            "multi_price_rest",
             "ohlcv_daily_rest",
             "ohlcv_intraday_rest",
             "conclusion_rest",
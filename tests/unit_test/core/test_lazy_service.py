@@ -0,0 +1,75 @@
+"""LazyService 단위 테스트.
+
+- 첫 사용 시 한 번만 생성되고, 실패하면 None 으로 확정된다 (프록시 truthiness 는 생성하지 않는다).
+- aresolve_lazy 는 팩토리를 이벤트 루프 밖 스레드에서 돌린다.
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.lazy_service import LazyService, aresolve_lazy, resolve_lazy
+
+
+def test_lazy_service_builds_once_on_first_attribute_access():
+    factory = MagicMock()
+    factory.return_value.collect.return_value = ["news"]
+    lazy = LazyService(factory, name="stock_news_collector")
+
+    factory.assert_not_called()
+    assert lazy.collect("005930") == ["news"]
+    assert lazy.collect("000660") == ["news"]
+    factory.assert_called_once_with()
+    assert lazy.is_resolved and resolve_lazy(lazy) is factory.return_value
+    assert resolve_lazy("plain") == "plain"
+
+
+def test_lazy_service_failure_resolves_to_none():
+    logger = MagicMock()
+    factory = MagicMock(side_effect=OSError("download failed"))
+    lazy = LazyService(factory, name="overseas", logger=logger)
+
+    assert lazy  # truthiness 는 팩토리를 돌리지 않는다 — 판정은 resolve 결과로 한다
+    factory.assert_not_called()
+    assert resolve_lazy(lazy) is None
+    logger.warning.assert_called_once()
+    with pytest.raises(AttributeError):
+        lazy.get_meta("AAPL")
+
+
+def test_lazy_service_concurrent_first_use_builds_single_instance():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    lazy = LazyService(factory, name="youtube_channel_repository")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(lazy.resolve())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(result) for result in results}) == 1
+
+
+async def test_aresolve_runs_factory_off_the_event_loop_thread():
+    loop_thread = threading.get_ident()
+    factory_threads = []
+
+    def factory():
+        factory_threads.append(threading.get_ident())
+        return "repo"
+
+    lazy = LazyService(factory, name="overseas_stock_code_repository")
+
+    assert await aresolve_lazy(lazy) == "repo"
+    assert await aresolve_lazy(lazy) == "repo"
+    assert factory_threads and factory_threads[0] != loop_thread
+    assert len(factory_threads) == 1
+    assert await aresolve_lazy(None) is None
@@ -0,0 +1,142 @@
+"""ScanFunnel 단위 테스트 — reason intern, cycle delta, 로그 샘플링, 일 누적/롤오버, scan cycle CPU 벤치마크."""
+from __future__ import annotations
+
+import logging
+import time
+
+import pytest
+
+from core.scan_funnel import ScanFunnel, intern_reason, reason_name
+
+
+def test_intern_reason_is_stable_and_reversible():
+    rid = intern_reason("funnel_test_reason")
+    assert intern_reason("funnel_test_reason") == rid
+    assert reason_name(rid) == "funnel_test_reason"
+
+
+def test_cycle_stats_are_deltas_and_out_of_cycle_rejections_stay_daily_only():
+    funnel = ScanFunnel("전략")
+    cycle = funnel.begin_cycle("20260105")
+    funnel.reject("low_volume")
+    funnel.reject(intern_reason("low_volume"))
+    funnel.reject("over_extended")
+    funnel.calc_failure("scan_error", "005930")
+    funnel.calc_failure("cgld_check_failed", "005930")
+    funnel.calc_failure("scan_error", "")  # code 없는 실패는 분모와 맞지 않아 무시
+    stats = funnel.end_cycle(cycle, candidate_count=4, signal_count=1)
+
+    assert stats.rejected_reasons == {"low_volume": 2, "over_extended": 1}
+    assert stats.calc_failures == {"scan_error": 1, "cgld_check_failed": 1}
+    assert (stats.calc_failure_code_count, stats.failure_rate_pct(4)) == (1, 25.0)
+
+    funnel.reject("low_volume")  # 이벤트 라우터 evaluate_single 등 cycle 밖 거절
+    second = funnel.begin_cycle("20260105")
+    funnel.reject("over_extended")
+    assert funnel.end_cycle(second, candidate_count=2).rejected_reasons == {"over_extended": 1}
+
+    summary = funnel.daily_summary()
+    assert summary["rejected_reasons"] == {"low_volume": 3, "over_extended": 2}
+    assert (summary["scan_cycles"], summary["candidates"], summary["signals"]) == (2, 6, 1)
+
+
+@pytest.mark.parametrize("every, expected", [(1, [True] * 5), (0, [False] * 5), (2, [True, False, True, False, True])])
+def test_reject_returns_log_sample_decision_but_always_counts(every, expected):
+    funnel = ScanFunnel("전략", log_sample_every=every)
+    assert [funnel.reject("sampled") for _ in range(5)] == expected
+    assert funnel.daily_summary()["rejected_reasons"] == {"sampled": 5}
+
+
+def test_day_rollover_archives_summary_and_resets_counters():
+    funnel = ScanFunnel("전략")
+    funnel.reject("before_first_cycle")  # 첫 cycle 전 거절은 첫 거래일에 포함
+    funnel.end_cycle(funnel.begin_cycle("20260105"), candidate_count=3)
+    assert funnel.take_unreported_rejections() == {"before_first_cycle": 1}
+    assert funnel.take_unreported_rejections() == {}
+
+    funnel.begin_cycle("20260106")
+
+    assert funnel.daily_summary()["rejected_total"] == 0
+    archived = funnel.daily_summary("20260105")
+    assert archived["rejected_reasons"] == {"before_first_cycle": 1} and archived["candidates"] == 3
+
+
+class _LegacyRejectionHandler(logging.Handler):
+    """비교용: 제거된 logging.Handler 기반 거절 카운터와 같은 방식."""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = {}
+
+    def emit(self, record):
+        msg = record.msg
+        if isinstance(msg, dict) and msg.get("event") == "entry_rejected":
+            self.counts[msg["reason"]] = self.counts.get(msg["reason"], 0) + 1
+
+
+def test_rejection_logging_disabled_emits_no_log_records_but_counts_every_rejection():
+    """로그를 끈 funnel 은 거절마다 로그 레코드를 만들지 않는다 — 벤치마크 속도 차이의 구조적 근거."""
+    logger = logging.getLogger("strategy.funnel_log_off")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = _LegacyRejectionHandler()
+    logger.addHandler(handler)
+    funnel = ScanFunnel("전략", log_sample_every=0)
+    reason_id = intern_reason("volume_not_dry")
+    try:
+        for _ in range(3):
+            cycle = funnel.begin_cycle("20260105")
+            for i in range(100):
+                if funnel.reject(reason_id):
+                    logger.info({"event": "entry_rejected", "code": f"{i:06d}", "reason": "volume_not_dry"})
+            stats = funnel.end_cycle(cycle, candidate_count=100)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.counts == {}
+    assert stats.rejected_count == 100
+    assert funnel.daily_summary()["rejected_reasons"] == {"volume_not_dry": 300}
+
+
+@pytest.mark.slow
+def test_benchmark_scan_cycle_cpu_with_rejection_logging_disabled():
+    """후보 3,000 × 거절 1건 scan cycle 20회: 로그 dict + Handler 카운트 vs funnel(로그 끔). 시간은 보고만 한다."""
+    reasons = ["pullback_out_of_range", "volume_not_dry", "no_bullish_reversal", "low_execution_strength"]
+    codes = [f"{i:06d}" for i in range(3000)]
+    cycles = 20
+
+    logger = logging.getLogger("strategy.funnel_benchmark")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    legacy = _LegacyRejectionHandler()
+    logger.addHandler(legacy)
+    try:
+        t0 = time.process_time()
+        for _ in range(cycles):
+            for i, code in enumerate(codes):
+                low, ma = 1000 + i % 37, 1010.0
+                logger.info({
+                    "event": "entry_rejected", "code": code, "reason": reasons[i % 4],
+                    "pullback_pct": round((low - ma) / ma * 100, 2), "today_low": low, "ma_20d": round(ma, 0),
+                })
+        legacy_sec = time.process_time() - t0
+    finally:
+        logger.removeHandler(legacy)
+
+    funnel = ScanFunnel("benchmark", log_sample_every=0)
+    reason_ids = [intern_reason(r) for r in reasons]
+    t0 = time.process_time()
+    for _ in range(cycles):
+        cycle = funnel.begin_cycle("20260105")
+        for i, code in enumerate(codes):
+            if funnel.reject(reason_ids[i % 4]):
+                logger.info({"event": "entry_rejected", "code": code})
+        stats = funnel.end_cycle(cycle, candidate_count=len(codes))
+    funnel_sec = time.process_time() - t0
+
+    print(
+        f"\n[scan funnel {cycles}x{len(codes)} rejections] legacy handler={legacy_sec * 1000:.1f}ms "
+        f"funnel(log off)={funnel_sec * 1000:.1f}ms speedup={legacy_sec / max(funnel_sec, 1e-9):.1f}x"
+    )
+    assert sum(legacy.counts.values()) == sum(funnel.daily_summary()["rejected_reasons"].values())
+    assert stats.rejected_count == len(codes)
@@ -23,21 +23,35 @@ def disclosure():
     )
 
 
+@pytest.fixture
+async def open_repo():
+    repos = []
+
+    def factory(path):
+        repo = DartDisclosureRepository(path)
+        repos.append(repo)
+        return repo
+
+    yield factory
+    for repo in repos:
+        await repo.close()
+
+
 @pytest.fixture
 def importance():
     return DisclosureImportance(score=85, level="HIGH", reasons=["전환사채 발행 관련 공시"])
 
 
-async def test_save_detected_is_idempotent(tmp_path, disclosure, importance):
-    repo = DartDisclosureRepository(tmp_path / "dart.db")
+async def test_save_detected_is_idempotent(open_repo, tmp_path, disclosure, importance):
+    repo = open_repo(tmp_path / "dart.db")
 
     assert await repo.save_detected(disclosure, importance) is True
     assert await repo.save_detected(disclosure, importance) is False
     assert await repo.has_receipt(disclosure.receipt_no) is True
 
 
-async def test_ai_summary_round_trips(tmp_path, disclosure, importance):
-    repo = DartDisclosureRepository(tmp_path / "dart.db")
+async def test_ai_summary_round_trips(open_repo, tmp_path, disclosure, importance):
+    repo = open_repo(tmp_path / "dart.db")
 
     await repo.save_detected(
         disclosure,
@@ -49,8 +63,8 @@ async def test_ai_summary_round_trips(tmp_path, disclosure, importance):
     assert rows[0].summary == "풍문 보도는 사실이 아니며 구체적으로 확정된 사항이 없습니다."
 
 
-async def test_get_known_receipt_nos_checks_page_in_one_query(tmp_path, disclosure, importance):
-    repo = DartDisclosureRepository(tmp_path / "dart.db")
+async def test_get_known_receipt_nos_checks_page_in_one_query(open_repo, tmp_path, disclosure, importance):
+    repo = open_repo(tmp_path / "dart.db")
     await repo.save_detected(disclosure, importance)
 
     known = await repo.get_known_receipt_nos(
@@ -60,8 +74,8 @@ async def test_get_known_receipt_nos_checks_page_in_one_query(tmp_path, disclosu
     assert known == {disclosure.receipt_no}
 
 
-async def test_pending_immediate_excludes_suppressed_and_sent(tmp_path, disclosure, importance):
-    repo = DartDisclosureRepository(tmp_path / "dart.db")
+async def test_pending_immediate_excludes_suppressed_and_sent(open_repo, tmp_path, disclosure, importance):
+    repo = open_repo(tmp_path / "dart.db")
     await repo.save_detected(disclosure, importance, suppress_immediate=True)
     assert await repo.get_pending_immediate(70) == []
 
@@ -74,18 +88,18 @@ async def test_pending_immediate_excludes_suppressed_and_sent(tmp_path, disclosu
     assert await repo.get_pending_immediate(70) == []
 
 
-async def test_initialization_state_persists(tmp_path):
+async def test_initialization_state_persists(open_repo, tmp_path):
     path = tmp_path / "dart.db"
-    repo = DartDisclosureRepository(path)
+    repo = open_repo(path)
     assert await repo.is_initialized() is False
 
     await repo.mark_initialized()
 
-    assert await DartDisclosureRepository(path).is_initialized() is True
+    assert await open_repo(path).is_initialized() is True
 
 
-async def test_digest_rows_are_marked_after_send(tmp_path, disclosure, importance):
-    repo = DartDisclosureRepository(tmp_path / "dart.db")
+async def test_digest_rows_are_marked_after_send(open_repo, tmp_path, disclosure, importance):
+    repo = open_repo(tmp_path / "dart.db")
     normal_importance = DisclosureImportance(score=30, level="NORMAL", reasons=["정기보고서"])
     await repo.save_detected(disclosure, normal_importance)
 
@@ -96,8 +110,8 @@ async def test_digest_rows_are_marked_after_send(tmp_path, disclosure, importanc
     assert await repo.get_pending_digest("20260714", immediate_threshold=70) == []
 
 
-async def test_get_recent_by_stock_code_filters_and_orders(tmp_path, disclosure, importance):
-    repo = DartDisclosureRepository(tmp_path / "dart.db")
+async def test_get_recent_by_stock_code_filters_and_orders(open_repo, tmp_path, disclosure, importance):
+    repo = open_repo(tmp_path / "dart.db")
     older = disclosure.__class__(
         **{
             **disclosure.__dict__,
@@ -125,7 +139,7 @@ async def test_get_recent_by_stock_code_filters_and_orders(tmp_path, disclosure,
 
 
 async def test_event_key_round_trips_and_legacy_schema_is_migrated(
-    tmp_path, disclosure, importance
+    open_repo, tmp_path, disclosure, importance
 ):
     path = tmp_path / "legacy.db"
     with sqlite3.connect(path) as conn:
@@ -145,7 +159,7 @@ async def test_event_key_round_trips_and_legacy_schema_is_migrated(
             """
         )
 
-    repo = DartDisclosureRepository(path)
+    repo = open_repo(path)
     await repo.save_detected(
         disclosure,
         importance,
@@ -155,3 +169,57 @@ async def test_event_key_round_trips_and_legacy_schema_is_migrated(
     rows = await repo.get_recent_by_stock_code(disclosure.stock_code)
     assert rows[0].event_key == "ELS|37980,37981|20000000000"
     assert rows[0].summary == ""
+
+
+async def test_single_connection_is_reused_and_reopened_after_close(
+    open_repo, tmp_path, disclosure, importance
+):
+    repo = open_repo(tmp_path / "dart.db")
+    await repo.save_detected(disclosure, importance)
+    conn = repo._conn
+
+    await repo.get_known_receipt_nos([disclosure.receipt_no])
+    await repo.get_pending_immediate(70)
+    assert repo._conn is conn
+
+    await repo.close()
+    assert repo._conn is None
+    assert await repo.has_receipt(disclosure.receipt_no) is True
+
+
+async def test_receipt_cursor_only_moves_forward_and_prunes_past_days(open_repo, tmp_path):
+    repo = open_repo(tmp_path / "dart.db")
+    assert await repo.get_receipt_cursor("20260713") == ""
+    await repo.advance_receipt_cursor("20260713", "20260713000050")
+
+    await repo.advance_receipt_cursor("20260714", "20260714000010")
+    await repo.advance_receipt_cursor("20260714", "20260714000003")
+
+    assert await repo.get_receipt_cursor("20260714") == "20260714000010"
+    assert await repo.get_receipt_cursor("20260713") == ""
+    await repo.close()
+    assert await open_repo(tmp_path / "dart.db").get_receipt_cursor("20260714") == "20260714000010"
+
+
+async def test_save_analysis_updates_pending_row_and_reports_sent_state(
+    open_repo, tmp_path, disclosure, importance
+):
+    repo = open_repo(tmp_path / "dart.db")
+    low = DisclosureImportance(score=10, level="LOW", reasons=["일반 공시"])
+    await repo.save_detected(disclosure, low, analysis_pending=True)
+    assert [item.disclosure.receipt_no for item in await repo.get_pending_analysis()] == [
+        disclosure.receipt_no
+    ]
+
+    already_sent = await repo.save_analysis(
+        disclosure.receipt_no, importance, event_key="CB|1", summary="전환사채 발행"
+    )
+
+    assert already_sent is False
+    assert await repo.get_pending_analysis() == []
+    pending = await repo.get_pending_immediate(70)
+    assert pending[0].importance == importance
+    assert pending[0].summary == "전환사채 발행"
+
+    await repo.mark_immediate_sent(disclosure.receipt_no, datetime(2026, 7, 14, 10, 0, 0))
+    assert await repo.save_analysis(disclosure.receipt_no) is True
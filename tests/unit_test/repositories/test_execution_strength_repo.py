@@ -1,3 +1,4 @@
+import os
 import sqlite3
 import time
 from unittest.mock import MagicMock, patch
@@ -5,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from repositories.execution_strength_repo import ExecutionStrengthRepository
+from repositories.tick_segment_store import EXECUTION_STRENGTH_STREAM, TickSegmentStore
 
 
 @pytest.fixture
@@ -16,36 +18,29 @@ def repo(tmp_path):
     instance.close()
 
 
-def _rows(db_path):
-    conn = sqlite3.connect(db_path)
-    try:
-        return conn.execute(
-            "SELECT code, trade_date, trade_time, strength FROM es_history ORDER BY id"
-        ).fetchall()
-    finally:
-        conn.close()
+def _rows(base_dir, date="20260704"):
+    store = TickSegmentStore(str(base_dir), EXECUTION_STRENGTH_STREAM)
+    rows = []
+    for day in ([date] if date else store.days()):
+        blocks = store.read(day, store.codes(day))
+        for code, block in blocks.items():
+            rows.extend(
+                (code, day, f"{int(t):06d}", float(v), float(c))
+                for t, v, c in zip(block["time"], block["strength"], block["created_at"])
+            )
+    return sorted(rows, key=lambda r: (r[4], r[0]))
 
 
-def test_init_creates_db_and_table(repo):
-    tables = {
-        row[0]
-        for row in sqlite3.connect(repo._db_path).execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-    }
-    assert "es_history" in tables
-
-
-def test_record_tick_persists_after_flush(repo):
+def test_record_tick_persists_after_flush(repo, tmp_path):
     now = time.time()
     assert repo.record_tick("005930", "123.45", "091001", "20260704", now=now) is True
 
     repo.flush()
 
-    assert _rows(repo._db_path) == [("005930", "20260704", "091001", 123.45)]
+    assert [r[:4] for r in _rows(tmp_path / "es_repo")] == [("005930", "20260704", "091001", 123.45)]
 
 
-def test_record_tick_samples_per_code(repo):
+def test_record_tick_samples_per_code(repo, tmp_path):
     base = time.time()
     assert repo.record_tick("005930", "100.0", "090001", "20260704", now=base) is True
     # 같은 종목 60초 이내 → skip
@@ -57,14 +52,14 @@ def test_record_tick_samples_per_code(repo):
 
     repo.flush()
 
-    assert [(r[0], r[3]) for r in _rows(repo._db_path)] == [
+    assert [(r[0], r[3]) for r in _rows(tmp_path / "es_repo")] == [
         ("005930", 100.0),
         ("000660", 90.0),
         ("005930", 102.0),
     ]
 
 
-def test_record_tick_skips_invalid_values(repo):
+def test_record_tick_skips_invalid_values(repo, tmp_path):
     now = time.time()
     assert repo.record_tick("", "100.0", "090001", "20260704", now=now) is False
     assert repo.record_tick("005930", "N/A", "090001", "20260704", now=now) is False
@@ -74,65 +69,91 @@ def test_record_tick_skips_invalid_values(repo):
 
     repo.flush()
 
-    assert _rows(repo._db_path) == []
+    assert _rows(tmp_path / "es_repo", date=None) == []
 
 
-def test_record_tick_falls_back_to_local_date(repo):
+def test_record_tick_falls_back_to_local_date(repo, tmp_path):
     now = time.time()
     assert repo.record_tick("005930", "110.5", "091001", None, now=now) is True
 
     repo.flush()
 
     expected_date = time.strftime("%Y%m%d", time.localtime(now))
-    assert _rows(repo._db_path) == [("005930", expected_date, "091001", 110.5)]
+    assert [r[:4] for r in _rows(tmp_path / "es_repo", expected_date)] == [
+        ("005930", expected_date, "091001", 110.5)
+    ]
 
 
-def test_buffer_flushes_on_size_threshold(repo):
+def test_buffer_flushes_on_size_threshold(repo, tmp_path):
     now = time.time()
     for i in range(ExecutionStrengthRepository.FLUSH_BUFFER_SIZE):
         assert repo.record_tick(f"{i:06d}", "100.0", "090001", "20260704", now=now) is True
 
     # 명시적 flush 없이 버퍼 임계 도달로 이미 저장됨
-    assert len(_rows(repo._db_path)) == ExecutionStrengthRepository.FLUSH_BUFFER_SIZE
+    assert len(_rows(tmp_path / "es_repo")) == ExecutionStrengthRepository.FLUSH_BUFFER_SIZE
 
 
-def test_flush_interval_triggers_flush(repo):
+def test_flush_interval_triggers_flush(repo, tmp_path):
     now = time.time() + ExecutionStrengthRepository.FLUSH_INTERVAL_SEC + 1
     assert repo.record_tick("005930", "100.0", "090001", "20260704", now=now) is True
 
     # 마지막 flush 이후 FLUSH_INTERVAL_SEC 경과 → 즉시 flush
-    assert len(_rows(repo._db_path)) == 1
+    assert len(_rows(tmp_path / "es_repo")) == 1
 
 
-def test_retention_cleanup_on_init(tmp_path):
+def test_day_change_seals_previous_day_log(repo, tmp_path):
+    base = time.time()
+    repo.record_tick("005930", "100.0", "150001", "20260703", now=base)
+    repo.flush()
+    repo.record_tick("005930", "101.0", "090001", "20260704", now=base + 61)
+    repo.flush()
+
+    day_dir = tmp_path / "es_repo" / "20260703"
+    assert (day_dir / "execution_strength.seg").exists()
+    assert not (day_dir / "execution_strength.log").exists()
+    assert (tmp_path / "es_repo" / "20260704" / "execution_strength.log").exists()
+    assert [r[3] for r in _rows(tmp_path / "es_repo", "20260703")] == [100.0]
+
+
+def test_close_seals_and_reopen_keeps_history(tmp_path):
     base_dir = str(tmp_path / "es_repo")
+    today = time.strftime("%Y%m%d")
     first = ExecutionStrengthRepository(base_dir=base_dir, logger=MagicMock())
-    old_ts = time.time() - (ExecutionStrengthRepository.RETENTION_DAYS + 10) * 86400
-    with first._conn:
-        first._conn.execute(
-            "INSERT INTO es_history (code, trade_date, trade_time, strength, created_at)"
-            " VALUES (?, ?, ?, ?, ?)",
-            ("005930", "20260501", "090001", 100.0, old_ts),
-        )
-        first._conn.execute(
-            "INSERT INTO es_history (code, trade_date, trade_time, strength, created_at)"
-            " VALUES (?, ?, ?, ?, ?)",
-            ("005930", "20260704", "090001", 101.0, time.time()),
-        )
+    first.record_tick("005930", "100.0", "090001", today, now=1.0)
     first.close()
+    assert os.path.exists(os.path.join(base_dir, today, "execution_strength.seg"))
+
+    second = ExecutionStrengthRepository(base_dir=base_dir, logger=MagicMock())
+    second.record_tick("005930", "101.0", "090101", today, now=100.0)
+    second.close()
+
+    assert [r[3] for r in _rows(base_dir, today)] == [100.0, 101.0]
+
+
+def test_retention_cleanup_on_init(tmp_path):
+    base_dir = str(tmp_path / "es_repo")
+    old_day = time.strftime(
+        "%Y%m%d",
+        time.localtime(time.time() - (ExecutionStrengthRepository.RETENTION_DAYS + 10) * 86400),
+    )
+    today = time.strftime("%Y%m%d")
+    store = TickSegmentStore(base_dir, EXECUTION_STRENGTH_STREAM)
+    store.append(old_day, [("005930", 90001, 100.0, 1.0)])
+    store.append(today, [("005930", 90001, 101.0, 2.0)])
+    store.close()
 
     second = ExecutionStrengthRepository(base_dir=base_dir, logger=MagicMock())
     second.close()
 
-    assert _rows(second._db_path) == [("005930", "20260704", "090001", 101.0)]
+    assert TickSegmentStore(base_dir, EXECUTION_STRENGTH_STREAM).days() == [today]
 
 
-def test_init_db_failure_logs_error_and_record_returns_false(tmp_path):
+def test_init_store_failure_logs_error_and_record_returns_false(tmp_path):
     logger = MagicMock()
 
     with patch(
-        "repositories.execution_strength_repo.sqlite3.connect",
-        side_effect=sqlite3.Error("boom"),
+        "repositories.execution_strength_repo.TickSegmentStore",
+        side_effect=OSError("boom"),
     ):
         repo = ExecutionStrengthRepository(base_dir=str(tmp_path / "es_repo"), logger=logger)
 
@@ -140,3 +161,80 @@ def test_init_db_failure_logs_error_and_record_returns_false(tmp_path):
     assert repo.record_tick("005930", "100.0", "090001", "20260704") is False
     repo.flush()  # no-op이어야 하며 예외가 나지 않는다
     repo.close()
+
+
+def _write_legacy_db(path, rows):
+    """세그먼트 전환 전 스키마(es_history) 그대로 legacy SQLite 파일을 만든다."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            "CREATE TABLE es_history (id INTEGER PRIMARY KEY AUTOINCREMENT, code TEXT NOT NULL,"
+            " trade_date TEXT NOT NULL, trade_time TEXT NOT NULL, strength REAL NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO es_history (code, trade_date, trade_time, strength, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+    conn.close()
+
+
+def test_legacy_sqlite_rows_within_retention_are_migrated_then_file_removed(tmp_path):
+    base_dir = tmp_path / "es_repo"
+    base_dir.mkdir()
+    recent = time.strftime("%Y%m%d", time.localtime(time.time() - 2 * 86400))
+    expired = time.strftime("%Y%m%d", time.localtime(time.time() - 40 * 86400))
+    _write_legacy_db(
+        base_dir / "execution_strength.db",
+        [
+            ("005930", recent, "090100", 101.5, 1.0),
+            ("005930", recent, "090001", 100.0, 2.0),
+            ("000660", recent, "090001", 95.0, 3.0),
+            ("005930", expired, "090001", 80.0, 4.0),
+        ],
+    )
+
+    repo = ExecutionStrengthRepository(base_dir=str(base_dir), logger=MagicMock())
+    repo.close()
+
+    store = TickSegmentStore(str(base_dir), EXECUTION_STRENGTH_STREAM)
+    assert store.days() == [recent]
+    block = store.read(recent, ["005930"])["005930"]
+    assert block["time"].tolist() == [90001, 90100]
+    assert block["strength"].tolist() == [100.0, 101.5]
+    assert store.codes(recent) == ["000660", "005930"]
+    assert not (base_dir / "execution_strength.db").exists()
+
+
+def test_legacy_sqlite_migration_skips_days_already_in_segments(tmp_path):
+    base_dir = tmp_path / "es_repo"
+    base_dir.mkdir()
+    recent = time.strftime("%Y%m%d", time.localtime(time.time() - 2 * 86400))
+    store = TickSegmentStore(str(base_dir), EXECUTION_STRENGTH_STREAM)
+    store.append(recent, [("005930", 90001, 100.0, 2.0)])
+    store.seal(recent)
+    store.close()
+    _write_legacy_db(base_dir / "execution_strength.db", [("005930", recent, "090001", 100.0, 2.0)])
+
+    ExecutionStrengthRepository(base_dir=str(base_dir), logger=MagicMock()).close()
+
+    block = TickSegmentStore(str(base_dir), EXECUTION_STRENGTH_STREAM).read(recent, ["005930"])["005930"]
+    assert block["time"].tolist() == [90001]
+    assert not (base_dir / "execution_strength.db").exists()
+
+
+def test_unreadable_legacy_sqlite_file_is_kept(tmp_path):
+    base_dir = tmp_path / "es_repo"
+    base_dir.mkdir()
+    (base_dir / "execution_strength.db").write_bytes(b"not a database")
+    logger = MagicMock()
+
+    repo = ExecutionStrengthRepository(base_dir=str(base_dir), logger=logger)
+    try:
+        assert repo.record_tick("005930", "100.0", "090001", "20260704", now=1.0) is True
+    finally:
+        repo.close()
+
+    logger.error.assert_called_once()
+    assert (base_dir / "execution_strength.db").read_bytes() == b"not a database"
@@ -0,0 +1,90 @@
+import threading
+
+from repositories.latest_price_table import LatestPriceTable
+
+
+def test_write_and_read_typed_quote():
+    table = LatestPriceTable(capacity=4)
+
+    seq = table.write(
+        "005930", 70100.0, change=-300.0, rate=-0.43, sign="5", acml_vol=1200, acml_tr_pbmn=84_000_000,
+        high=70500.0, bid=70000.0, ask=70100.0, received_at=100.0, latency_sec=0.02,
+    )
+    quote = table.read("005930")
+
+    assert seq == 1 and quote.seq == 1
+    assert (quote.price, quote.change, quote.rate, quote.sign) == (70100.0, -300.0, -0.43, "5")
+    assert (quote.acml_vol, quote.acml_tr_pbmn) == (1200, 84_000_000)
+    assert isinstance(quote.acml_vol, int)
+    assert (quote.high, quote.low, quote.open) == (70500.0, None, None)
+    assert (quote.bid, quote.ask) == (70000.0, 70100.0)
+    assert (quote.received_at, quote.quality_reason) == (100.0, "websocket")
+    assert table.read("000660") is None
+    assert table.seq("000660") == 0
+
+
+def test_rewrite_updates_slot_in_place_and_bumps_seq():
+    table = LatestPriceTable(capacity=4)
+    table.write("005930", 70000.0, received_at=1.0)
+
+    assert table.write("005930", 70100.0, received_at=2.0, quality_reason="rest_snapshot") == 2
+    quote = table.read("005930")
+
+    assert (quote.seq, quote.price, quote.quality_reason) == (2, 70100.0, "rest_snapshot")
+    assert table.seq("005930") == 2
+    assert len(table) == 1
+
+
+def test_legacy_dict_keeps_string_price_fields():
+    table = LatestPriceTable()
+    table.write("005930", 75000.0, change=1000.0, rate=1.35, sign="2", acml_vol=10, received_at=5.0)
+
+    legacy = table.read("005930").to_legacy_dict()
+
+    assert legacy["price"] == "75000"
+    assert legacy["change"] == "1000"
+    assert legacy["rate"] == "1.35"
+    assert legacy["acml_vol"] == 10
+    assert legacy["received_at"] == 5.0
+
+
+def test_grows_past_capacity_and_reuses_removed_slots():
+    table = LatestPriceTable(capacity=2)
+    for i in range(5):
+        table.write(f"{i:06d}", float(i + 1), received_at=float(i))
+
+    assert table.get_stats()["capacity"] == 8
+    assert [table.read(f"{i:06d}").price for i in range(5)] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    slot = table._slots["000002"]
+    assert table.remove("000002") is True
+    assert table.read("000002") is None
+    # 재사용 슬롯의 seq 는 이어서 증가한다 (이전 종목 seq 와 겹치지 않음)
+    assert table.write("999999", 9.0) == 2
+    assert table._slots["999999"] == slot
+    assert table.get_stats()["capacity"] == 8
+
+
+def test_reader_thread_never_sees_torn_snapshot():
+    table = LatestPriceTable(capacity=1)
+    table.write("005930", 0.0, acml_vol=0, received_at=0.0)
+    stop = threading.Event()
+    torn = []
+
+    def _reader():
+        while not stop.is_set():
+            quote = table.read("005930")
+            # writer 는 세 필드를 항상 같은 값으로 쓴다
+            if not (quote.price == quote.acml_vol == quote.received_at):
+                torn.append(quote)
+
+    reader = threading.Thread(target=_reader)
+    reader.start()
+    try:
+        for i in range(1, 50_000):
+            table.write("005930", float(i), acml_vol=i, received_at=float(i))
+    finally:
+        stop.set()
+        reader.join()
+
+    assert torn == []
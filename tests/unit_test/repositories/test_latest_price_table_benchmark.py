@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from repositories.latest_price_table import LatestPriceTable
+
+CODES = [f"{i:06d}" for i in range(300)]
+TICKS = 200_000
+READS = 200_000
+
+
+def _ticks():
+    for i in range(TICKS):
+        code = CODES[i % len(CODES)]
+        yield code, {
+            "주식현재가": str(70000 + i % 100),
+            "전일대비": "500",
+            "전일대비율": "0.72",
+            "전일대비부호": "2",
+            "누적거래량": str(1000 + i),
+            "누적거래대금": str(70_000_000 + i),
+            "주식최고가": "70100",
+            "주식최저가": "69900",
+            "주식시가": "70000",
+        }
+
+
+def _sf(val):
+    try:
+        return float(val) if val and val != "N/A" else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _dict_tick(latest, code, data, now):
+    # 교체 전 PriceStreamService.on_price_tick 의 _latest_prices 갱신
+    latest[code] = {
+        "price": data["주식현재가"],
+        "change": data.get("전일대비", "0"),
+        "rate": data.get("전일대비율", "0.00"),
+        "sign": data.get("전일대비부호", "3"),
+        "acml_vol": int(data["누적거래량"]),
+        "acml_tr_pbmn": int(data["누적거래대금"]),
+        "high": _sf(data.get("주식최고가", "")),
+        "low": _sf(data.get("주식최저가", "")),
+        "open": _sf(data.get("주식시가", "")),
+        "received_at": now,
+        "latency_sec": 0.0,
+        "quality_status": "ok",
+        "quality_reason": "websocket",
+    }
+
+
+def _table_tick(table, code, data, now):
+    table.write(
+        code,
+        float(data["주식현재가"]),
+        change=float(data["전일대비"]),
+        rate=float(data["전일대비율"]),
+        sign=data["전일대비부호"],
+        acml_vol=int(data["누적거래량"]),
+        acml_tr_pbmn=int(data["누적거래대금"]),
+        high=_sf(data["주식최고가"]),
+        low=_sf(data["주식최저가"]),
+        open=_sf(data["주식시가"]),
+        received_at=now,
+    )
+
+
+@pytest.mark.slow
+def test_latest_price_table_vs_dict_cache():
+    ticks = list(_ticks())
+    now = time.time()
+
+    latest = {}
+    start = time.perf_counter()
+    for code, data in ticks:
+        _dict_tick(latest, code, data, now)
+    dict_write = time.perf_counter() - start
+
+    table = LatestPriceTable()
+    start = time.perf_counter()
+    for code, data in ticks:
+        _table_tick(table, code, data, now)
+    table_write = time.perf_counter() - start
+
+    # 읽기: DataQualityService.validate_order_reference 처럼 가격·수신시각·출처를 꺼내 수치로 쓴다
+    start = time.perf_counter()
+    acc = 0.0
+    for i in range(READS):
+        cached = latest.get(CODES[i % len(CODES)])
+        acc += float(cached.get("price")) + float(cached.get("received_at"))
+        _ = cached.get("quality_reason")
+    dict_read = time.perf_counter() - start
+
+    start = time.perf_counter()
+    acc_table = 0.0
+    for i in range(READS):
+        quote = table.read(CODES[i % len(CODES)])
+        acc_table += quote.price + quote.received_at
+        _ = quote.quality_reason
+    table_read = time.perf_counter() - start
+
+    # 기존 웹 라우트 경로(get_cached_price)가 dict 를 매번 새로 만드는 비용
+    start = time.perf_counter()
+    for i in range(READS):
+        table.read(CODES[i % len(CODES)]).to_legacy_dict()
+    table_legacy = time.perf_counter() - start
+
+    print(f"\n\n[Latest price table benchmark ({len(CODES)} codes, {TICKS} ticks, {READS} reads)]")
+    print("TICK UPDATE:")
+    print(f"  dict rebuild: {dict_write / TICKS * 1e6:.2f}us/tick")
+    print(f"  table write:  {table_write / TICKS * 1e6:.2f}us/tick")
+    print("READ (price + received_at + source):")
+    print(f"  dict + float parse: {READS / dict_read:,.0f} reads/s")
+    print(f"  table.read:         {READS / table_read:,.0f} reads/s")
+    print(f"  legacy dict view:   {READS / table_legacy:,.0f} reads/s")
+
+    assert acc_table == pytest.approx(acc)
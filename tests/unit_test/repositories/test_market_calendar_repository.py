@@ -0,0 +1,39 @@
+"""MarketCalendarRepository 단위 테스트 — 월 병합 저장·원자 교체·손상 파일 무시."""
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from repositories.market_calendar_repository import MarketCalendarRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return MarketCalendarRepository(path=str(tmp_path / "calendar" / "krx.json"), logger=MagicMock())
+
+
+def test_save_month_merges_and_round_trips(repo):
+    repo.save_month("202601", {"20260101": False, "20260102": True})
+    repo.save_month("202601", {"20260105": True})
+    repo.save_month("202602", {"20260216": False})
+
+    assert repo.load_months() == {
+        "202601": {"20260101": False, "20260102": True, "20260105": True},
+        "202602": {"20260216": False},
+    }
+    assert sorted(os.listdir(os.path.dirname(repo.path))) == ["krx.json"]  # tempfile 잔여물 없음
+
+
+def test_missing_corrupt_or_version_mismatch_returns_empty(repo):
+    assert repo.load_months() == {}
+
+    repo.save_month("202601", {"20260102": True})
+    with open(repo.path, "w", encoding="utf-8") as f:
+        f.write("{broken")
+    assert repo.load_months() == {}
+
+    with open(repo.path, "w", encoding="utf-8") as f:
+        json.dump({"version": 999, "months": {"202601": {"20260102": True}}}, f)
+    assert repo.load_months() == {}
+    assert repo._logger.warning.call_count == 2
@@ -1,6 +1,8 @@
 import sqlite3
+import time
 
 from repositories.orderbook_snapshot_repo import OrderbookSnapshotRepository
+from repositories.tick_segment_store import TOP_OF_BOOK_STREAM, TickSegmentStore
 
 
 def test_record_tick_persists_sampled_top_of_book(tmp_path):
@@ -39,12 +41,16 @@ def test_record_tick_persists_sampled_top_of_book(tmp_path):
         )
         repo.flush()
 
-        with sqlite3.connect(tmp_path / "orderbook_snapshots.db") as conn:
-            rows = conn.execute(
-                "SELECT code, trade_date, trade_time, ask_price, bid_price, "
-                "ask_qty, bid_qty, total_ask_qty, total_bid_qty "
-                "FROM top_of_book_history"
-            ).fetchall()
+        block = TickSegmentStore(str(tmp_path), TOP_OF_BOOK_STREAM).read("20260721", ["005930"])["005930"]
+        rows = [
+            (
+                "005930", "20260721", f"{int(block['time'][i]):06d}",
+                *(int(block[name][i]) for name in (
+                    "ask_price", "bid_price", "ask_qty", "bid_qty", "total_ask_qty", "total_bid_qty",
+                )),
+            )
+            for i in range(len(block["time"]))
+        ]
     finally:
         repo.close()
 
@@ -70,3 +76,50 @@ def test_record_tick_rejects_missing_or_crossed_quotes(tmp_path):
         ) is False
     finally:
         repo.close()
+
+
+def test_missing_quantities_are_stored_as_sentinel(tmp_path):
+    repo = OrderbookSnapshotRepository(base_dir=str(tmp_path), sample_interval_sec=0)
+    try:
+        assert repo.record_tick(
+            "005930",
+            {"주식체결시간": "101500", "영업일자": "20260721", "매도호가1": "71100", "매수호가1": "71000"},
+            now=1.0,
+        ) is True
+        repo.flush()
+        block = TickSegmentStore(str(tmp_path), TOP_OF_BOOK_STREAM).read("20260721", ["005930"])["005930"]
+    finally:
+        repo.close()
+
+    assert int(block["ask_qty"][0]) == -1
+    assert int(block["total_bid_qty"][0]) == -1
+
+
+def test_legacy_sqlite_rows_are_migrated_with_missing_qty_as_minus_one(tmp_path):
+    recent = time.strftime("%Y%m%d", time.localtime(time.time() - 86400))
+    conn = sqlite3.connect(tmp_path / "orderbook_snapshots.db")
+    with conn:
+        conn.execute(
+            "CREATE TABLE top_of_book_history (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " code TEXT NOT NULL, trade_date TEXT NOT NULL, trade_time TEXT NOT NULL,"
+            " ask_price INTEGER NOT NULL, bid_price INTEGER NOT NULL, ask_qty INTEGER,"
+            " bid_qty INTEGER, total_ask_qty INTEGER, total_bid_qty INTEGER,"
+            " created_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO top_of_book_history (code, trade_date, trade_time, ask_price, bid_price,"
+            " ask_qty, bid_qty, total_ask_qty, total_bid_qty, created_at)"
+            " VALUES ('005930', ?, '101500', 71100, 71000, 1200, NULL, 15000, NULL, 1.0)",
+            (recent,),
+        )
+    conn.close()
+
+    OrderbookSnapshotRepository(base_dir=str(tmp_path)).close()
+
+    block = TickSegmentStore(str(tmp_path), TOP_OF_BOOK_STREAM).read(recent, ["005930"])["005930"]
+    assert block["time"].tolist() == [101500]
+    assert block["ask_price"].tolist() == [71100]
+    assert block["ask_qty"].tolist() == [1200]
+    assert block["bid_qty"].tolist() == [-1]
+    assert block["total_bid_qty"].tolist() == [-1]
+    assert not (tmp_path / "orderbook_snapshots.db").exists()
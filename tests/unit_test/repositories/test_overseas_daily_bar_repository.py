@@ -0,0 +1,51 @@
+"""OverseasDailyBarRepository — 해외 일봉 로컬 저장소 (후보 거래대금 산출용)."""
+import pytest
+
+from common.overseas_types import OverseasExchange
+from repositories.overseas_daily_bar_repository import OverseasDailyBarRepository
+
+
+def _row(date, close=10.0, volume=100):
+    return {"date": date, "open": close, "high": close, "low": close, "close": close, "volume": volume}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = OverseasDailyBarRepository(str(tmp_path / "bars.db"))
+    yield repository
+    repository.close()
+
+
+def test_last_dates_are_keyed_by_exchange_and_symbol(repo):
+    repo.upsert_bars(OverseasExchange.NASD, "aapl", [_row("20260514"), _row("20260515")])
+    repo.upsert_bars("NYSE", "AAPL", [_row("20260518")])
+
+    assert repo.last_dates(OverseasExchange.NASD, ["AAPL", "MSFT"]) == {"AAPL": "20260515"}
+
+
+def test_upsert_is_idempotent_and_skips_malformed_dates(repo):
+    assert repo.upsert_bars("NASD", "AAPL", [_row("2026-05-15"), _row(""), _row("20260515", close=11.0)]) == 2
+
+    frame = repo.load_frame("NASD", ["AAPL"], lookback=5)
+    assert list(frame["date"]) == ["20260515"]
+    assert frame["close"].iloc[0] == 11.0
+
+
+def test_load_frame_returns_latest_lookback_bars_per_symbol(repo):
+    repo.upsert_bars("NASD", "AAA", [_row(f"2026051{i}") for i in range(1, 6)])
+    repo.upsert_bars("NASD", "BBB", [_row("20260515")])
+
+    frame = repo.load_frame("NASD", ["BBB", "AAA", "ZZZ"], lookback=2)
+
+    assert list(zip(frame["code"], frame["date"])) == [
+        ("AAA", "20260514"), ("AAA", "20260515"), ("BBB", "20260515"),
+    ]
+    assert repo.load_frame("NASD", ["ZZZ"], lookback=2).empty
+
+
+async def test_async_wrappers_round_trip(repo):
+    written = await repo.upsert_many_async("NASD", {"AAA": [_row("20260515")], "BBB": []})
+
+    assert written == 1
+    assert await repo.last_dates_async("NASD", ["AAA", "BBB"]) == {"AAA": "20260515"}
+    assert repo.prune_before("NASD", "20260516") == 1
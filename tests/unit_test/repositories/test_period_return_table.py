@@ -0,0 +1,216 @@
+"""
+기간 수익률 materialized 테이블 (StockOhlcvRepository.materialize_period_returns).
+
+- 테이블 조회 결과가 기존 SQL 경로(_query_*)와 같다 (parity).
+- daily_prices/ohlcv 쓰기가 최신 스냅샷·기준종가에 영향을 줄 때만 테이블을 버린다.
+- 구성 도중 쓰기가 끼어들면 낡은 결과를 저장하지 않는다.
+"""
+import random
+import time
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+
+from repositories.period_return_table import PERIOD_DAYS
+from repositories.stock_ohlcv_repository import StockOhlcvRepository
+
+_LATEST = "20260713"
+
+
+@pytest_asyncio.fixture
+async def repo(tmp_path):
+    r = StockOhlcvRepository(db_path=str(tmp_path / "period_returns.db"))
+    yield r
+    await r.close()
+
+
+def _snapshot(code, price, market_cap, market):
+    return {
+        "code": code, "name": f"N{code}", "current_price": price, "open_price": None, "high_price": None,
+        "low_price": None, "prev_close": None, "change_price": None, "change_sign": None, "change_rate": "0.5",
+        "volume": None, "trading_value": None, "market_cap": market_cap, "per": None, "pbr": None, "eps": None,
+        "w52_high": None, "w52_low": None, "market": market, "iscd_stat_cls_code": None,
+        "mang_issu_cls_code": None, "mrkt_warn_cls_code": None, "invt_caful_yn": None,
+        "minervini_stage": None, "minervini_reason": None, "rs_rating": None,
+    }
+
+
+def _trading_days(start: date, end: date):
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            yield day.strftime("%Y%m%d")
+        day += timedelta(days=1)
+
+
+async def _seed(repo, n_codes: int, seed: int = 7, start: date = date(2025, 6, 1)):
+    """상장 시점이 제각각인 종목, 0원 종가, 휴장일 전용 코드, 깨진 날짜가 섞인 이력."""
+    rng = random.Random(seed)
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    listed_from = {code: start + timedelta(days=rng.choice([0, 0, 0, 120, 250, 380])) for code in codes}
+    records = []
+    for day in _trading_days(start, date(2026, 7, 10)):
+        for code in codes:
+            if day >= listed_from[code].strftime("%Y%m%d"):
+                close = 0 if rng.random() < 0.01 else rng.randint(1_000, 200_000)
+                records.append({"code": code, "date": day, "open": close, "high": close, "low": close,
+                                 "close": close, "volume": 1000})
+    records.append({"code": "BOND01", "date": "20260101", "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1})
+    records.append({"code": codes[0], "date": "202600101", "open": 9, "high": 9, "low": 9, "close": 9, "volume": 1})
+    await repo.upsert_ohlcv(records)
+
+    snapshot = [
+        _snapshot(code, 0 if rng.random() < 0.02 else rng.randint(1_000, 250_000),
+                  0 if rng.random() < 0.02 else rng.randint(1, 10**9) * 1000 + i,
+                  rng.choice(["KOSPI", "KOSDAQ"]))
+        for i, code in enumerate(codes)
+    ]
+    await repo.upsert_daily_snapshot("20260710", snapshot[: n_codes // 2])  # 이전 거래일 (무시돼야 함)
+    await repo.upsert_daily_snapshot(_LATEST, snapshot)
+    return codes
+
+
+async def test_table_lookups_match_sql(repo):
+    await _seed(repo, n_codes=60)
+    table = await repo.materialize_period_returns()
+    assert table is not None and table.trade_date == _LATEST
+
+    assert await repo.get_snapshot_codes() == await repo._query_snapshot_codes()
+    for market in (None, "ALL", "KOSPI", "KOSDAQ"):
+        for limit in (1, 10, 500):
+            assert await repo.get_market_cap_snapshot(limit=limit, market=market) == \
+                await repo._query_market_cap_snapshot(limit=limit, market=market)
+            assert await repo.get_ytd_return_ranking(limit=limit, market=market) == \
+                await repo._query_ytd_return_ranking(limit=limit, market=market)
+    for days in list(PERIOD_DAYS.values()) + [3]:  # 3일은 테이블에 없는 기간 → SQL 경로
+        assert await repo.get_period_base_closes(period_days=days) == \
+            await repo._query_period_base_closes(period_days=days)
+    assert await repo.get_period_base_closes(ytd=True) == await repo._query_period_base_closes(ytd=True)
+
+    # 1년 전 이력이 없는 종목은 1y 수익률이 없고, 시총 0원 종목은 순위가 없다.
+    year_closes = (await repo._query_period_base_closes(period_days=365))["closes"]
+    assert set(table.returns["1y"]) <= set(year_closes)
+    ranked = [row["code"] for row in await repo._query_market_cap_snapshot(limit=500)]
+    assert [table.market_cap_rank[code] for code in ranked] == list(range(1, len(ranked) + 1))
+
+
+async def test_lookup_path_runs_no_sql_once_materialized(repo, monkeypatch):
+    await _seed(repo, n_codes=5)
+    await repo.materialize_period_returns()
+
+    def _fail():
+        raise AssertionError("테이블이 있으면 SQL 을 타지 않아야 한다")
+
+    monkeypatch.setattr(repo, "_get_read_connection", _fail)
+    assert len(await repo.get_market_cap_snapshot(limit=3)) == 3
+    assert (await repo.get_period_base_closes(period_days=30))["latest_date"] == _LATEST
+
+
+async def test_writes_invalidate_only_when_they_affect_the_table(repo):
+    codes = await _seed(repo, n_codes=5)
+    table = await repo.materialize_period_returns()
+
+    # 최신 거래일 이후의 당일 봉 추가는 기준종가와 무관하다.
+    await repo.upsert_ohlcv([{"code": codes[0], "date": "20260714", "open": 1, "high": 1, "low": 1,
+                              "close": 1, "volume": 1}])
+    assert repo.get_period_return_table() is table
+    # 과거 거래일 스냅샷 보정도 마찬가지.
+    await repo.update_minervini_fields("20260710", [{"code": codes[0], "minervini_stage": 2}])
+    assert repo.get_period_return_table() is table
+
+    # 최신 스냅샷 컬럼 갱신·과거 종가 백필·새 거래일 스냅샷은 테이블을 버린다.
+    await repo.update_newhigh_fields(_LATEST, [{"code": codes[0], "is_newhigh": True}])
+    assert repo.get_period_return_table() is None
+    assert (await repo.get_market_cap_snapshot(limit=10)) == await repo._query_market_cap_snapshot(limit=10)
+
+    await repo.upsert_ohlcv([{"code": codes[1], "date": "20260601", "open": 7, "high": 7, "low": 7,
+                              "close": 7, "volume": 1}])
+    assert repo.get_period_return_table() is None
+
+    await repo.upsert_daily_snapshot("20260714", [_snapshot(codes[0], 100, 10, "KOSPI")])
+    assert (await repo.get_period_base_closes(period_days=7))["latest_date"] == "20260714"
+    assert repo.get_period_return_table().trade_date == "20260714"
+
+
+async def test_write_during_build_discards_stale_table(repo, monkeypatch):
+    await _seed(repo, n_codes=5)
+    original = repo._build_period_table
+
+    async def _build_with_concurrent_write():
+        table = await original()
+        await repo.upsert_daily_snapshot("20260714", [_snapshot("NEW001", 100, 10, "KOSPI")])
+        return table
+
+    monkeypatch.setattr(repo, "_build_period_table", _build_with_concurrent_write)
+    stale = await repo.materialize_period_returns()
+    assert stale.trade_date == _LATEST
+    assert repo.get_period_return_table() is None
+
+    monkeypatch.setattr(repo, "_build_period_table", original)
+    assert await repo.get_snapshot_codes() == {"NEW001"}
+
+
+async def test_repeated_lookup_rounds_build_once_and_open_no_read_connection(repo, monkeypatch):
+    """히트맵(6개 기간) + YTD 랭킹 + 시총 스냅샷 10회분이 테이블 1회 빌드로 끝나고 SQL 을 열지 않는다."""
+    await _seed(repo, n_codes=20)
+    builds = []
+    original_build = repo._build_period_table
+
+    async def _counting_build():
+        builds.append(1)
+        return await original_build()
+
+    monkeypatch.setattr(repo, "_build_period_table", _counting_build)
+    await repo.materialize_period_returns()
+    reads = []
+    original_read = repo._get_read_connection
+
+    def _counting_read(*args, **kwargs):
+        reads.append(1)
+        return original_read(*args, **kwargs)
+
+    monkeypatch.setattr(repo, "_get_read_connection", _counting_read)
+    for _ in range(10):
+        for days in PERIOD_DAYS.values():
+            assert (await repo.get_period_base_closes(period_days=days))["latest_date"] == _LATEST
+        await repo.get_period_base_closes(ytd=True)
+        await repo.get_ytd_return_ranking(limit=10)
+        assert len(await repo.get_market_cap_snapshot(limit=10)) == 10
+
+    assert (len(builds), len(reads)) == (1, 0)
+
+
+@pytest.mark.slow
+async def test_benchmark_period_lookups_vs_sql(repo):
+    """1000종목 × 약 1년 이력: 히트맵(6개 기간) + YTD 랭킹 + 시총 스냅샷 1회분 조회 비용 (시간은 보고만 한다)."""
+    await _seed(repo, n_codes=1000)
+
+    async def _sql_round():
+        for days in PERIOD_DAYS.values():
+            await repo._query_period_base_closes(period_days=days)
+        await repo._query_period_base_closes(ytd=True)
+        await repo._query_ytd_return_ranking(limit=100)
+        await repo._query_market_cap_snapshot(limit=300)
+
+    async def _table_round():
+        for days in PERIOD_DAYS.values():
+            await repo.get_period_base_closes(period_days=days)
+        await repo.get_period_base_closes(ytd=True)
+        await repo.get_ytd_return_ranking(limit=100)
+        await repo.get_market_cap_snapshot(limit=300)
+
+    start = time.perf_counter()
+    await _sql_round()
+    sql_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    await repo.materialize_period_returns()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(10):
+        await _table_round()
+    table_ms = (time.perf_counter() - start) * 1000 / 10
+
+    print(f"\n[period returns 1000 codes] sql round={sql_ms:.1f}ms build={build_ms:.1f}ms lookup round={table_ms:.2f}ms")
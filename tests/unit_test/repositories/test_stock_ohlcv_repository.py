@@ -1233,3 +1233,52 @@ class TestGetMarketCapSnapshot:
     async def test_returns_empty_on_read_error(self, repo, monkeypatch):
         _broken_read_ctx(repo, monkeypatch)
         assert await repo.get_market_cap_snapshot() == []
+
+
+# ── preload_stock_data ────────────────────────────────────────────────────────
+
+class TestPreloadStockData:
+    """preload_stock_data: 여러 종목 최근 N일봉을 한 번에 읽어 LFU 캐시에 적재."""
+
+    @pytest.mark.asyncio
+    async def test_loads_latest_rows_per_code_in_ascending_order(self, repo):
+        await repo.upsert_ohlcv([
+            _make_ohlcv(code, f"202605{day:02d}", close=day)
+            for code in ("A001", "A002") for day in range(1, 6)
+        ])
+
+        loaded = await repo.preload_stock_data(["A001", "A002", "NONE"], ohlcv_limit=3)
+
+        assert set(loaded) == {"A001", "A002"}
+        assert [r["date"] for r in loaded["A001"]] == ["20260503", "20260504", "20260505"]
+        assert "code" not in loaded["A001"][0]
+
+    @pytest.mark.asyncio
+    async def test_populates_cache_so_get_stock_data_hits(self, repo):
+        await repo.upsert_ohlcv([_make_ohlcv("A001", f"202605{day:02d}") for day in range(1, 6)])
+        await repo.preload_stock_data(["A001"], ohlcv_limit=3)
+
+        repo._get_read_connection = MagicMock(side_effect=AssertionError("DB 조회 없이 캐시 히트여야 함"))
+        result = await repo.get_stock_data("A001", ohlcv_limit=3)
+
+        assert [r["date"] for r in result["ohlcv"]] == ["20260503", "20260504", "20260505"]
+
+    @pytest.mark.asyncio
+    async def test_skips_codes_already_cached(self, repo):
+        await repo.upsert_ohlcv([_make_ohlcv("A001", f"202605{day:02d}") for day in range(1, 6)])
+        await repo.get_stock_data("A001", ohlcv_limit=3)
+
+        repo._get_read_connection = MagicMock(side_effect=AssertionError("캐시된 종목은 다시 읽지 않음"))
+        loaded = await repo.preload_stock_data(["A001"], ohlcv_limit=3)
+
+        assert len(loaded["A001"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_respects_cache_capacity(self, repo):
+        await repo.upsert_ohlcv([_make_ohlcv(code, "20260501") for code in ("A001", "A002", "A003")])
+        repo._ohlcv_cache.capacity = 2
+
+        loaded = await repo.preload_stock_data(["A001", "A002", "A003"], ohlcv_limit=1)
+
+        assert set(loaded) == {"A001", "A002"}
+        assert len(repo._ohlcv_cache) == 2
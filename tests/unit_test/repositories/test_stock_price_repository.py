@@ -380,14 +380,32 @@ class TestStockPriceRepository:
         price_repo._cache_logger.log_price_hit.assert_not_called()
         price_repo._cache_logger.log_price_miss.assert_not_called()
 
-    def test_update_current_price_creates_tick_cache(self, price_repo):
-        with patch("repositories.stock_price_repository.time.time", return_value=123.0):
-            price_repo.update_current_price("005930", 70123, volume=55)
+    def test_update_current_price_creates_tick_row_without_lru_entry(self, price_repo):
+        price_repo.update_current_price("005930", 70123, volume=55)
 
-        cached = price_repo._price_cache.get("005930", count_stats=False, item_type="check")
-        assert cached["current_price_data"]["_source"] == "tick"
-        assert cached["current_price_data"]["output"]["stck_prpr"] == "70123"
-        assert cached["current_price_data"]["output"]["acml_vol"] == "55"
+        # 틱만 받은 종목은 LRU 에 올리지 않고 공유 최신가 테이블에만 둔다
+        assert price_repo._price_cache.get("005930", count_stats=False, item_type="check") is None
+        cached = price_repo.get_current_price("005930", count_stats=False)
+        assert cached["_source"] == "tick"
+        assert cached["output"]["stck_prpr"] == "70123"
+        assert cached["output"]["acml_vol"] == "55"
+
+    def test_update_current_price_keeps_row_written_by_stream(self, price_repo):
+        price_repo.latest_prices.write("005930", 70500.0, rate=1.2, acml_vol=77, quality_reason="websocket")
+
+        price_repo.update_current_price("005930", 70500, volume=77, rate="1.20")
+
+        quote = price_repo.latest_prices.read("005930")
+        assert quote.seq == 1
+        assert quote.quality_reason == "websocket"
+
+    def test_tick_only_price_expires_unless_streaming(self, price_repo):
+        price_repo.latest_prices.write("005930", 70000.0, received_at=100.0)
+
+        with patch("repositories.stock_price_repository.time.time", return_value=110.0):
+            assert price_repo.get_current_price("005930", max_age_sec=3.0, count_stats=False) is None
+            price_repo.mark_streaming("005930")
+            assert price_repo.get_current_price("005930", max_age_sec=3.0, count_stats=False) is not None
 
     def test_update_current_price_updates_dict_output_and_logs(self, price_repo):
         price_repo._price_cache.put(
@@ -439,8 +457,8 @@ class TestStockPriceRepository:
         """틱만 수신된 최초 캐시에도 등락률(prdy_ctrt)이 반영되어야 한다."""
         price_repo.update_current_price("005930", 70123, volume=55, rate="5.41")
 
-        cached = price_repo._price_cache.get("005930", count_stats=False, item_type="check")
-        assert cached["current_price_data"]["output"]["prdy_ctrt"] == "5.41"
+        cached = price_repo.get_current_price("005930", count_stats=False)
+        assert cached["output"]["prdy_ctrt"] == "5.41"
 
     def test_update_current_price_refreshes_stale_rate(self, price_repo):
         """기존 캐시의 오래된 등락률이 새 틱의 등락률로 갱신되어야 한다."""
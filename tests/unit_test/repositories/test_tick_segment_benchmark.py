@@ -0,0 +1,97 @@
+import sqlite3
+import time
+
+import pytest
+
+from repositories.tick_segment_store import EXECUTION_STRENGTH_STREAM, TickSegmentStore
+
+CODES = [f"{i:06d}" for i in range(200)]
+MINUTES = [h * 10000 + m * 100 + 1 for h in range(9, 16) for m in range(60) if 90000 <= h * 10000 + m * 100 <= 152000]
+BATCH = 20  # ExecutionStrengthRepository.FLUSH_BUFFER_SIZE
+DATE = "20260704"
+
+
+def _day_batches():
+    rows = [(code, t, 100.0 + (i % 50), float(t)) for t in MINUTES for i, code in enumerate(CODES)]
+    return [rows[i:i + BATCH] for i in range(0, len(rows), BATCH)]
+
+
+def _sqlite_write(db_path, batches):
+    # 교체 전 ExecutionStrengthRepository 의 스키마·flush 경로
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE es_history (id INTEGER PRIMARY KEY AUTOINCREMENT, code TEXT NOT NULL, "
+            "trade_date TEXT NOT NULL, trade_time TEXT NOT NULL, strength REAL NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX idx_es_history_code_date ON es_history(code, trade_date)")
+    start = time.perf_counter()
+    for batch in batches:
+        with conn:
+            conn.executemany(
+                "INSERT INTO es_history (code, trade_date, trade_time, strength, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(code, DATE, f"{t:06d}", v, c) for code, t, v, c in batch],
+            )
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def _sqlite_scan(db_path):
+    # 교체 전 BacktestMicrostructureCaptureService 의 es_db 조회
+    start = time.perf_counter()
+    result = {}
+    with sqlite3.connect(db_path) as conn:
+        for code in CODES:
+            rows = conn.execute(
+                "SELECT trade_time, strength FROM es_history WHERE code = ? AND trade_date = ? "
+                "AND trade_time >= ? AND trade_time <= ? ORDER BY trade_time ASC, id ASC",
+                (code, DATE, "090000", "153000"),
+            ).fetchall()
+            result[code] = [v for _, v in rows]
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.slow
+def test_tick_segment_vs_sqlite_write_and_day_scan(tmp_path):
+    batches = _day_batches()
+    records = sum(len(b) for b in batches)
+
+    sqlite_write = _sqlite_write(tmp_path / "es.db", batches)
+    sqlite_scan, sqlite_rows = _sqlite_scan(tmp_path / "es.db")
+
+    store = TickSegmentStore(str(tmp_path / "segments"), EXECUTION_STRENGTH_STREAM)
+    start = time.perf_counter()
+    for batch in batches:
+        store.append(DATE, batch)
+    segment_write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    unsealed = store.read(DATE, CODES, start_time="090000", end_time="153000")
+    log_scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.seal(DATE)
+    seal_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sealed = store.read(DATE, CODES, start_time="090000", end_time="153000")
+    segment_scan = time.perf_counter() - start
+    store.close()
+
+    print(f"\n\n[Tick recorder benchmark ({len(CODES)} codes x {len(MINUTES)} samples = {records} records)]")
+    print("WRITE (batch=20 flush):")
+    print(f"  SQLite:  {sqlite_write:.4f}s ({records / sqlite_write:,.0f} rec/s)")
+    print(f"  Segment: {segment_write:.4f}s ({records / segment_write:,.0f} rec/s)")
+    print(f"SEAL: {seal_time:.4f}s")
+    print("DAY SCAN (all codes):")
+    print(f"  SQLite:       {sqlite_scan:.4f}s")
+    print(f"  Segment log:  {log_scan:.4f}s")
+    print(f"  Segment seal: {segment_scan:.4f}s")
+
+    expected = {code: values for code, values in sqlite_rows.items()}
+    assert {code: block["strength"].tolist() for code, block in sealed.items()} == expected
+    assert {code: block["strength"].tolist() for code, block in unsealed.items()} == expected
@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pytest
+
+from repositories.tick_segment_store import (
+    EXECUTION_STRENGTH_STREAM,
+    TOP_OF_BOOK_STREAM,
+    TickSegmentStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    instance = TickSegmentStore(str(tmp_path / "ticks"), EXECUTION_STRENGTH_STREAM)
+    yield instance
+    instance.close()
+
+
+def _strengths(store, date, code, **kwargs):
+    block = store.read(date, [code], **kwargs).get(code)
+    if block is None:
+        return []
+    return [(int(t), float(v)) for t, v in zip(block["time"], block["strength"])]
+
+
+def test_unsealed_log_is_readable_in_time_order(store):
+    store.append("20260704", [("005930", 90101, 101.0, 2.0), ("000660", 90001, 90.0, 1.0)])
+    store.append("20260704", [("005930", 90001, 100.0, 3.0)])
+
+    assert _strengths(store, "20260704", "005930") == [(90001, 100.0), (90101, 101.0)]
+    assert store.codes("20260704") == ["000660", "005930"]
+
+
+def test_seal_writes_contiguous_per_code_blocks(store):
+    store.append("20260704", [
+        ("005930", 90001, 100.0, 1.0),
+        ("000660", 90001, 90.0, 1.0),
+        ("005930", 90101, 101.0, 2.0),
+        ("000660", 90101, 91.0, 2.0),
+    ])
+
+    assert store.seal("20260704") is True
+
+    day_dir = os.path.dirname(store._seg_path("20260704"))
+    assert os.listdir(day_dir) == ["execution_strength.seg"]
+    header, columns = store._read_seg_columns("20260704")
+    assert header["index"] == {"000660": [0, 2], "005930": [2, 2]}
+    assert columns["code"].tolist() == [b"000660", b"000660", b"005930", b"005930"]
+    assert _strengths(store, "20260704", "005930", start_time="090100") == [(90101, 101.0)]
+    assert _strengths(store, "20260704", "005930", end_time="090059") == [(90001, 100.0)]
+
+
+def test_seal_merges_existing_segment_with_new_log(store):
+    store.append("20260704", [("005930", 90101, 101.0, 1.0)])
+    store.seal("20260704")
+    store.append("20260704", [("005930", 90001, 100.0, 2.0), ("005930", 90201, 102.0, 3.0)])
+
+    # 봉인 전에도 seg + log 를 합쳐 읽는다
+    assert [v for _, v in _strengths(store, "20260704", "005930")] == [100.0, 101.0, 102.0]
+    store.seal("20260704")
+    assert [v for _, v in _strengths(store, "20260704", "005930")] == [100.0, 101.0, 102.0]
+
+
+def test_seal_skips_log_already_merged_before_crash(store, tmp_path):
+    store.append("20260704", [("005930", 90001, 100.0, 1.0)])
+    log_path = store._log_path("20260704")
+    with open(log_path, "rb") as f:
+        log_bytes = f.read()
+    store.seal("20260704")
+    # seg 교체 직후 log 삭제 전에 죽은 상황 재현
+    with open(log_path, "wb") as f:
+        f.write(log_bytes)
+
+    assert _strengths(store, "20260704", "005930") == [(90001, 100.0)]
+    assert store.seal("20260704") is False
+    assert _strengths(store, "20260704", "005930") == [(90001, 100.0)]
+    assert not os.path.exists(log_path)
+
+
+def test_torn_tail_is_ignored_on_read_and_truncated_on_reopen(tmp_path):
+    base_dir = str(tmp_path / "ticks")
+    writer = TickSegmentStore(base_dir, EXECUTION_STRENGTH_STREAM)
+    writer.append("20260704", [("005930", 90001, 100.0, 1.0), ("005930", 90101, 101.0, 2.0)])
+    writer.close()
+    log_path = writer._log_path("20260704")
+    record_size = EXECUTION_STRENGTH_STREAM.dtype.itemsize
+    with open(log_path, "r+b") as f:
+        # 두 번째 레코드 값 손상 + 반쯤 쓰인 세 번째 레코드
+        f.seek(16 + record_size + 20)
+        f.write(b"\xff\xff")
+        f.seek(0, os.SEEK_END)
+        f.write(b"\x01" * (record_size // 2))
+
+    reopened = TickSegmentStore(base_dir, EXECUTION_STRENGTH_STREAM)
+    assert _strengths(reopened, "20260704", "005930") == [(90001, 100.0)]
+
+    reopened.append("20260704", [("005930", 90201, 102.0, 3.0)])
+    reopened.close()
+
+    assert os.path.getsize(log_path) == 16 + 2 * record_size
+    assert _strengths(reopened, "20260704", "005930") == [(90001, 100.0), (90201, 102.0)]
+
+
+def test_prune_before_removes_old_days(store):
+    store.append("20260601", [("005930", 90001, 100.0, 1.0)])
+    store.append("20260704", [("005930", 90001, 100.0, 1.0)])
+    store.seal("20260601")
+
+    assert store.prune_before("20260701") == 1
+    assert store.days() == ["20260704"]
+
+
+def test_top_of_book_round_trips_integer_columns(tmp_path):
+    store = TickSegmentStore(str(tmp_path / "ob"), TOP_OF_BOOK_STREAM)
+    store.append("20260721", [("005930", 101500, 71100, 71000, 1200, -1, 15000, 18000, 1.0)])
+    store.seal("20260721")
+
+    block = store.read("20260721", ["005930"])["005930"]
+    store.close()
+
+    assert block["ask_price"].dtype == np.dtype("<i8")
+    assert [int(block[name][0]) for name in ("ask_price", "bid_price", "ask_qty", "bid_qty")] == [
+        71100, 71000, 1200, -1,
+    ]
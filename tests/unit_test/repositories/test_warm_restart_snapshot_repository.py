@@ -0,0 +1,83 @@
+"""WarmRestartSnapshotRepository 단위 테스트 — 바이너리 포맷·mmap 로드·기준일/버전/crc 검증."""
+import os
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from repositories.warm_restart_snapshot_repository import WarmRestartSnapshotRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return WarmRestartSnapshotRepository(path=str(tmp_path / "snap" / "hot_state.snap"), logger=MagicMock())
+
+
+def _write_sample(repo, trading_date="20260105"):
+    return repo.write(
+        trading_date,
+        arrays={
+            "ohlcv_values": np.arange(15, dtype=np.float64).reshape(3, 5),
+            "ohlcv_dates": np.array(["20260102", "20260103", "20260104"], dtype="S"),
+            "empty": np.empty((0, 5)),
+        },
+        documents={"latest_ticks": {"005930": {"price": "70000"}}, "subscription_refs": {}},
+    )
+
+
+def test_round_trip_maps_arrays_without_copy(repo):
+    size = _write_sample(repo)
+    assert size == os.path.getsize(repo.path)
+
+    snapshot = repo.load("20260105")
+    assert repo.last_load_status == "ok"
+    values = snapshot.arrays["ohlcv_values"]
+    np.testing.assert_array_equal(values, np.arange(15, dtype=np.float64).reshape(3, 5))
+    assert not values.flags.owndata and not values.flags.writeable  # mmap 위 read-only view
+    assert values.ctypes.data % 64 == 0
+    assert snapshot.arrays["ohlcv_dates"].astype(str).tolist() == ["20260102", "20260103", "20260104"]
+    assert snapshot.arrays["empty"].shape == (0, 5)
+    assert snapshot.documents["latest_ticks"] == {"005930": {"price": "70000"}}
+    assert snapshot.trading_date == "20260105" and snapshot.created_at > 0
+    del values
+    snapshot.close()
+
+
+def test_load_rejects_other_trading_date_and_missing_file(repo):
+    assert repo.load("20260105") is None
+    assert repo.last_load_status == "missing"
+
+    _write_sample(repo, trading_date="20260102")
+    assert repo.load("20260105") is None
+    assert repo.last_load_status == "stale_trading_date"
+    repo._logger.warning.assert_called_once()
+
+
+def test_load_rejects_version_mismatch(repo, monkeypatch):
+    _write_sample(repo)
+    monkeypatch.setattr(WarmRestartSnapshotRepository, "FORMAT_VERSION", 2)
+    assert repo.load("20260105") is None
+    assert repo.last_load_status == "version_mismatch"
+
+
+def test_load_rejects_corrupted_section(repo):
+    _write_sample(repo)
+    with open(repo.path, "rb") as f:
+        raw = f.read()
+    with open(repo.path, "wb") as f:
+        f.write(raw.replace(b"70000", b"99999"))  # latest_ticks 섹션 본문 변조
+    assert repo.load("20260105") is None
+    assert repo.last_load_status == "corrupt"
+
+    with open(repo.path, "wb") as f:
+        f.write(b"not a snapshot")
+    assert repo.load("20260105") is None
+    assert repo.last_load_status == "corrupt"
+
+
+def test_write_replaces_atomically_and_keeps_old_file_on_failure(repo):
+    _write_sample(repo)
+    with pytest.raises(TypeError):
+        repo.write("20260105", arrays={}, documents={"bad": object()})
+    assert os.listdir(os.path.dirname(repo.path)) == ["hot_state.snap"]
+    assert repo.load("20260105").documents["latest_ticks"]["005930"]["price"] == "70000"
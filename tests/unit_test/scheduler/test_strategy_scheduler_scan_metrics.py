@@ -1,7 +1,8 @@
 """StrategyScheduler scan_metrics 발행 단위 테스트 (P2 2-2 1차).
 
 scan() 직후 4종 메트릭(latency_ms / candidate_count / signal_count / rejected_reasons)을
-포함한 `scan_metrics` log event 가 발행되는지 검증한다.
+포함한 `scan_metrics` log event 가 발행되는지 검증한다. 거절·계산 실패는 전략이
+ScanFunnel 에 직접 누적한다.
 """
 from __future__ import annotations
 
@@ -19,7 +20,7 @@ from scheduler.strategy_scheduler_store import StrategySchedulerStore
 
 
 class _StubStrategy(LiveStrategy):
-    """scan() 시 지정된 reject 이벤트를 _logger 로 emit 후 신호 리스트 반환."""
+    """scan() 시 지정된 거절·실패를 funnel 에 누적(샘플 로그 포함) 후 신호 리스트 반환."""
 
     def __init__(
         self,
@@ -49,8 +50,10 @@ class _StubStrategy(LiveStrategy):
 
     async def scan(self):
         for reason in self._rejections:
-            self._logger.info({"event": "entry_rejected", "code": "X", "reason": reason})
+            if self.funnel.reject(reason):
+                self._logger.info({"event": "entry_rejected", "code": "X", "reason": reason, "funnel_counted": True})
         for payload in self._failures:
+            self.funnel.calc_failure(payload["event"], payload.get("code"))
             self._logger.warning(payload)
         if self._raise_in_scan:
             raise RuntimeError("scan boom")
@@ -58,6 +61,7 @@ class _StubStrategy(LiveStrategy):
 
     async def check_exits(self, holdings):
         for payload in self._exit_failures:
+            self.funnel.calc_failure(payload["event"], payload.get("code"))
             self._logger.error(payload)
         return []
 
@@ -75,7 +79,7 @@ class TestStrategySchedulerScanMetrics(unittest.IsolatedAsyncioTestCase):
             self._scheduler.close()
         shutil.rmtree(self.test_dir)
 
-    def _make_scheduler(self):
+    def _make_scheduler(self, **scheduler_kwargs):
         vm = MagicMock()
         vm.get_holds_by_strategy.return_value = []
         vm.log_buy_async = AsyncMock(return_value=True)
@@ -113,6 +117,7 @@ class TestStrategySchedulerScanMetrics(unittest.IsolatedAsyncioTestCase):
             logger=mock_logger,
             dry_run=True,
             store=mock_store,
+            **scheduler_kwargs,
         )
         self._scheduler = scheduler
         return scheduler, mock_logger
@@ -163,10 +168,11 @@ class TestStrategySchedulerScanMetrics(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(rec["candidate_count"], 3)
         self.assertEqual(rec["signal_count"], 1)
         self.assertEqual(rec["rejected_reasons"], {"reason_a": 2, "reason_b": 1})
+        self.assertEqual(rec["rejected_count"], 3)
         self.assertIsInstance(rec["latency_ms"], float)
         self.assertGreaterEqual(rec["latency_ms"], 0.0)
 
-    async def test_scan_metrics_handler_removed_after_exception(self):
+    async def test_scan_metrics_cycle_closed_after_exception(self):
         scheduler, mock_logger = self._make_scheduler()
         strategy = _StubStrategy(
             name="예외전략",
@@ -179,11 +185,35 @@ class TestStrategySchedulerScanMetrics(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(RuntimeError):
             await scheduler._run_strategy(config)
 
-        # 핸들러가 detach 됐는지: 신규 entry_rejected 이벤트가 더 카운트되지 않아야 한다.
-        # strategy logger 의 핸들러 목록에서 EntryRejectionCounter 부재 확인.
-        from core.scan_rejection_counter import EntryRejectionCounter
-        leftover = [h for h in strategy._logger.handlers if isinstance(h, EntryRejectionCounter)]
-        self.assertEqual(leftover, [])
+        # 예외여도 cycle 은 닫히고, 이미 센 거절은 일 누적에 남는다.
+        self.assertIsNone(strategy.funnel._active_cycle)
+        summary = strategy.funnel.daily_summary()
+        self.assertEqual(summary["rejected_reasons"], {"pre_reject": 1})
+        self.assertEqual(summary["scan_cycles"], 0)
+
+    async def test_rejections_counted_with_logging_disabled_and_forwarded_to_distribution(self):
+        distribution = MagicMock()
+        scheduler, mock_logger = self._make_scheduler(
+            rejection_distribution_service=distribution, rejection_log_sample_every=0,
+        )
+        strategy = _StubStrategy(name="샘플링끔", rejections=["reason_a"] * 5 + ["reason_b"])
+        strategy._logger = MagicMock(name="strategy.SamplingOff")
+        strategy._logger.name = "strategy.SamplingOff"
+        config = StrategySchedulerConfig(strategy=strategy, max_positions=10)
+        scheduler.register(config)
+
+        strategy.funnel.reject("event_path")  # cycle 밖(이벤트 라우터 평가) 거절은 다음 cycle 에 섞이지 않는다
+        await scheduler._run_strategy(config)
+
+        rec = self._scan_metrics_records(mock_logger)[0]
+        self.assertEqual(rec["rejected_reasons"], {"reason_a": 5, "reason_b": 1})
+        strategy._logger.info.assert_not_called()
+        distribution.record_counts.assert_called_once()
+        key, counts = distribution.record_counts.call_args.args
+        self.assertEqual(key, "SamplingOff")
+        self.assertEqual(counts, {"reason_a": 5, "reason_b": 1, "event_path": 1})
+        summary = scheduler.get_funnel_summaries()["샘플링끔"]
+        self.assertEqual((summary["scan_cycles"], summary["rejected_total"]), (1, 7))
 
     async def test_scan_metrics_zero_candidate_when_helper_returns_empty(self):
         scheduler, mock_logger = self._make_scheduler()
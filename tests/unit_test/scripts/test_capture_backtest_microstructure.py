@@ -7,7 +7,7 @@ def test_build_parser_execution_strength_defaults():
     args = build_parser().parse_args(["--date", "20260512", "--codes", "000001"])
 
     assert args.execution_strength_source == "rest_scalar"
-    assert args.execution_strength_db_path == "data/execution_strength/execution_strength.db"
+    assert args.execution_strength_dir == "data/execution_strength"
 
 
 def test_build_parser_execution_strength_es_db():
@@ -16,12 +16,12 @@ def test_build_parser_execution_strength_es_db():
             "--date", "20260512",
             "--codes", "000001",
             "--execution-strength-source", "es_db",
-            "--execution-strength-db-path", "custom/es.db",
+            "--execution-strength-dir", "custom/es",
         ]
     )
 
     assert args.execution_strength_source == "es_db"
-    assert args.execution_strength_db_path == "custom/es.db"
+    assert args.execution_strength_dir == "custom/es"
 
 
 def test_write_output_files_creates_overlay_and_intraday_files(tmp_path):
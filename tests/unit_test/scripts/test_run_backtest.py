@@ -12,16 +12,19 @@ from scripts.run_backtest import (
     ACTIVE_BACKTEST_STRATEGIES,
     _BacktestLedgerAccountSnapshotCache,
     _BacktestStrategyRiskProvider,
+    _build_cache_budget,
     _build_replay_bar_providers,
     _build_dates,
     _build_risk_sizing_services,
     _build_backtest_strategy,
     _build_execution_simulator,
     _format_console,
+    _format_portfolio_console,
     _format_walk_forward_console,
     _format_walk_forward_json,
     _get_program_provider,
     _parse_args,
+    _parse_portfolio_strategies,
     _run_profitability_gate_for_result,
     _run_profitability_gate_for_walk_forward,
     _run_monte_carlo_for_result,
@@ -315,6 +318,76 @@ def test_format_console_summarizes_execution_and_portfolio():
     assert "journal run: period_20260501_20260502" in text
 
 
+def test_parse_args_accepts_portfolio_options(monkeypatch):
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "run_backtest", "--dates", "20260501", "--portfolio",
+            "--portfolio-strategies", "oneil_squeeze_breakout,rsi2_pullback",
+            "--portfolio-compare-single", "--cache-retain-days", "3",
+        ],
+    )
+
+    args = _parse_args()
+
+    assert args.portfolio is True
+    assert args.portfolio_compare_single is True
+    assert args.cache_retain_days == 3
+    assert _parse_portfolio_strategies(args.portfolio_strategies) == [
+        "oneil_squeeze_breakout", "rsi2_pullback",
+    ]
+    assert _parse_portfolio_strategies(None) == list(ACTIVE_BACKTEST_STRATEGIES)
+    with pytest.raises(ValueError):
+        _parse_portfolio_strategies("oneil_squeeze_breakout,unknown")
+
+
+def test_cache_budget_option_builds_budget_and_console_reports_counters(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["run_backtest", "--dates", "20260501", "--cache-budget-mb", "64"])
+    args = _parse_args()
+    assert _build_cache_budget(args).max_bytes == 64 * 1024 * 1024
+    assert _build_cache_budget(SimpleNamespace(cache_budget_mb=0)).max_bytes is None
+
+    result = SimpleNamespace(
+        strategy_name="오닐PP/BGU",
+        dates=["20260501"],
+        execution_reports=[],
+        journal_records=[],
+        portfolio={},
+        replay_cache={"max_bytes": 64 * 1024 * 1024, "peak_bytes": 32 * 1024 * 1024, "hits": 900,
+                      "misses": 100, "hit_ratio": 0.9, "evictions": 42},
+    )
+    text = _format_console(result)
+    assert "replay 캐시: 상한 64MB, 최대 32.0MB, hit 900 / miss 100 (hit 90.0%), 축출 42" in text
+
+
+def test_format_portfolio_console_reports_wall_time_vs_single_runs():
+    def _side(value):
+        return SimpleNamespace(order=SimpleNamespace(side=SimpleNamespace(value=value)))
+
+    result = SimpleNamespace(
+        dates=["20260501", "20260502"],
+        strategy_results={
+            "오닐스퀴즈돌파": SimpleNamespace(execution_reports=[_side("BUY"), _side("SELL")], journal_records=[{}] * 3),
+            "RSI2눌림목": SimpleNamespace(execution_reports=[_side("BUY")], journal_records=[{}]),
+        },
+        strategy_eval_sec={"오닐스퀴즈돌파": 1.5, "RSI2눌림목": 0.5},
+        portfolio={"cash": 900_000, "available_cash": 900_000, "realized_net_pnl": 1_000,
+                   "positions": {"005930": {"qty": 1}}},
+        wall_time_sec=2.0,
+        single_run_wall_sec={"오닐스퀴즈돌파": 3.0, "RSI2눌림목": 3.0},
+        cache={"retain_days": 1, "resident_entries": 40, "evicted_entries": 760,
+               "regime": {"hits": 10, "misses": 4}},
+    )
+
+    text = _format_portfolio_console(result)
+
+    assert "[PORTFOLIO BACKTEST RESULT]" in text
+    assert "오닐스퀴즈돌파: BUY 1 / SELL 1 / 기록 3 / 평가 1.50s" in text
+    assert "wall time: 2.00s" in text
+    assert "단독 실행 합계: 6.00s (포트폴리오 대비 3.0x)" in text
+    assert "축출 760" in text and "레짐 hit 10 / miss 4" in text
+
+
 def test_format_console_includes_monte_carlo_summary_when_present():
     result = SimpleNamespace(
         strategy_name="오닐PP/BGU",
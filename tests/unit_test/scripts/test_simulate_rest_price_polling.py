@@ -0,0 +1,68 @@
+"""구독 슬롯 밖 종목 REST 폴링 재생 비교기 단위 테스트.
+
+합성 틱으로 트리거 근처 종목 1개와 움직이지 않는 관심종목 여럿을 재생해, 적응형 폴러가
+고정 주기 전 종목 조회보다 호출을 줄이면서 트리거 근접 종목은 더 자주 갱신하는지 확인한다.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.simulate_rest_price_polling import compare_policies, format_markdown_report, main, simulate
+
+
+def _ticks():
+    # S1: 트리거 10100 근처에서 t=301 에 돌파, IDLE*: 트리거 없는 관심종목 (31개 → 고정 주기는 배치 2회)
+    ticks = []
+    for t in range(0, 600, 2):
+        ticks.append((float(t), "S1", 10050.0 if t < 301 else 10150.0))
+        for i in range(31):
+            ticks.append((float(t), f"IDLE{i:02d}", 5000.0))
+    return ticks
+
+
+PRIORITIES = {"S1": 2, **{f"IDLE{i:02d}": 2 for i in range(31)}}
+LEVELS = {"S1": 10100.0}
+
+
+def test_fixed_policy_polls_every_code_each_scan():
+    result = simulate(_ticks(), PRIORITIES, LEVELS, adaptive=False, scan_interval_sec=5.0)
+
+    assert result["rest_calls"] == 2 * 120  # 32종목 → 30+2 배치, 5초마다 599초 동안
+    assert result["calls_per_sec_peak"] == 2
+    assert result["budget_share_peak_pct"] == 25.0
+    assert result["staleness_p99_sec"] == 4.0
+    assert result["triggers"] == 1
+    assert result["latency_max_sec"] == 3.0  # t=302 돌파 → t=305 스캔에서 감지
+
+
+def test_adaptive_policy_saves_calls_and_keeps_trigger_code_fresher():
+    report = compare_policies(_ticks(), PRIORITIES, LEVELS, scan_interval_sec=5.0)
+
+    fixed, adaptive = report["fixed"], report["adaptive"]
+    assert adaptive["rest_calls"] < fixed["rest_calls"]
+    assert report["comparison"]["rest_calls_saved"] > 0
+    assert adaptive["urgent_staleness_p90_sec"] < fixed["urgent_staleness_p90_sec"]
+    assert adaptive["latency_max_sec"] <= fixed["latency_max_sec"]
+    assert adaptive["calls_per_sec_peak"] <= 4  # burst_calls 상한
+    assert "REST 절감" in format_markdown_report(report)
+
+
+def test_main_writes_reports(tmp_path: Path):
+    ticks_path = tmp_path / "ticks.jsonl"
+    ticks_path.write_text(
+        "\n".join(json.dumps({"ts": t, "code": code, "price": price}) for t, code, price in _ticks()[:400]),
+        encoding="utf-8",
+    )
+    out_json = tmp_path / "out" / "report.json"
+    out_md = tmp_path / "out" / "report.md"
+
+    assert main([
+        "--ticks-jsonl", str(ticks_path),
+        "--output-json", str(out_json), "--output-markdown", str(out_md),
+    ]) == 0
+
+    report = json.loads(out_json.read_text(encoding="utf-8"))
+    assert set(report) == {"fixed", "adaptive", "comparison", "config"}
+    assert out_md.read_text(encoding="utf-8").startswith("# 구독 슬롯 밖 종목 REST 폴링 정책 재생 비교")
+    assert main([]) == 2
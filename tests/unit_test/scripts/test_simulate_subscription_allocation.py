@@ -0,0 +1,108 @@
+"""WebSocket 슬롯 배정 재생 비교기 단위 테스트.
+
+합성 틱으로 관심종목이 슬롯을 선점한 상황에서 utility 정책이 트리거 근접 종목을 구독해
+REST 폴링을 줄이고 돌파를 틱 시점에 감지하는지 확인한다.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.simulate_subscription_allocation import (
+    compare_policies,
+    default_scenario,
+    format_markdown_report,
+    load_scenario,
+    load_ticks_jsonl,
+    main,
+    simulate,
+)
+
+
+def _ticks():
+    # FAV1/FAV2: 관심종목(트리거 없음, 코드순으로 static 이 먼저 가져감)
+    # S1: 트리거 10100 근처에서 t=300 에 돌파, S2: 트리거가 멀어 돌파 없음
+    ticks = []
+    for t in range(0, 600, 2):
+        ticks.append((float(t), "FAV1", 5000.0))
+        ticks.append((float(t), "FAV2", 7000.0))
+        ticks.append((float(t), "S1", 10050.0 if t < 301 else 10150.0))
+        ticks.append((float(t), "S2", 20000.0))
+    return ticks
+
+
+PRIORITIES = {"FAV1": 2, "FAV2": 2, "S1": 2, "S2": 2}
+LEVELS = {"S1": 10100.0, "S2": 25000.0}
+
+
+def test_static_policy_keeps_favorites_and_polls_strategy_codes():
+    result = simulate(_ticks(), PRIORITIES, LEVELS, slots=2, resolve_interval_sec=30.0, rest_poll_interval_sec=5.0)
+
+    assert result["subscription_changes"] == 2
+    assert result["rest_calls"] == 2 * 120  # S1·S2 를 5초마다 600초 동안
+    assert result["triggers"] == 1
+    assert result["latency_max_sec"] == 3.0  # t=302 돌파 → t=305 폴링에서 감지
+
+
+def test_utility_policy_saves_rest_calls_and_detects_on_tick():
+    report = compare_policies(
+        _ticks(), PRIORITIES, LEVELS,
+        allocator_config={"min_hold_sec": 0},
+        slots=2, resolve_interval_sec=30.0, rest_poll_interval_sec=5.0,
+    )
+
+    assert report["utility"]["rest_calls"] < report["static"]["rest_calls"]
+    assert report["comparison"]["rest_calls_saved"] > 0
+    assert report["utility"]["tick_detected"] == 1
+    assert report["comparison"]["latency_mean_delta_sec"] == -3.0
+    assert "REST 절감" in format_markdown_report(report)
+
+
+def test_loaders_and_default_scenario(tmp_path: Path):
+    ticks_path = tmp_path / "ticks.jsonl"
+    ticks_path.write_text(
+        "\n".join([
+            json.dumps({"time": "090001", "code": "A", "price": 1000}),
+            json.dumps({"ts": 32400.0, "code": "B", "price": "2000"}),
+            "not json",
+            json.dumps({"ts": 32402.0, "code": "C", "price": 0}),
+        ]),
+        encoding="utf-8",
+    )
+    scenario_path = tmp_path / "scenario.json"
+    scenario_path.write_text(json.dumps({
+        "requests": [
+            {"code": "A", "priority": "LOW"},
+            {"code": "A", "priority": "HIGH"},
+            {"code": "B", "priority": 2},
+        ],
+        "trigger_levels": {"B": 2100},
+    }), encoding="utf-8")
+
+    ticks = load_ticks_jsonl(ticks_path)
+    priorities, levels = load_scenario(scenario_path)
+
+    assert ticks == [(32400.0, "B", 2000.0), (32401.0, "A", 1000.0)]
+    assert priorities == {"A": 1, "B": 2}
+    assert levels == {"B": 2100.0}
+    assert default_scenario(ticks, 2.0) == ({"B": 2, "A": 2}, {"B": 2040.0, "A": 1020.0})
+
+
+def test_main_writes_reports(tmp_path: Path):
+    ticks_path = tmp_path / "ticks.jsonl"
+    ticks_path.write_text(
+        "\n".join(json.dumps({"ts": t, "code": code, "price": price}) for t, code, price in _ticks()),
+        encoding="utf-8",
+    )
+    out_json = tmp_path / "out" / "report.json"
+    out_md = tmp_path / "out" / "report.md"
+
+    assert main([
+        "--ticks-jsonl", str(ticks_path), "--slots", "2",
+        "--output-json", str(out_json), "--output-markdown", str(out_md),
+    ]) == 0
+
+    report = json.loads(out_json.read_text(encoding="utf-8"))
+    assert set(report) == {"static", "utility", "comparison", "config"}
+    assert out_md.read_text(encoding="utf-8").startswith("# WebSocket 슬롯 배정 정책 재생 비교")
+    assert main([]) == 2
@@ -0,0 +1,231 @@
+"""
+Backtest replay 캐시 메모리 예산 (services/backtest_cache_budget.py).
+
+- 예산을 넘으면 bytes/weight 가 가장 큰 캐시의 LRU 항목부터 버린다.
+- 현재 거래일(pin_days) 항목은 버리지 않는다.
+- replay 서비스·bar provider·runner 레짐 캐시가 예산에 등록되고, 축출돼도 결과는 같다.
+"""
+import time
+
+import pytest
+
+from common.types import TradeSignal
+from services.backtest_cache_budget import BacktestCacheBudget, BoundedReplayCache
+from services.backtest_execution_simulator import BacktestBar, BacktestPortfolioLedger
+from services.backtest_period_runner import BacktestPeriodRunner
+from services.backtest_replay_adapter import (
+    StockQueryBacktestReplayService,
+    StockQueryDailyMtmBarProvider,
+    StockQueryIntradayReplayBarProvider,
+)
+from services.backtest_walk_forward import BacktestWalkForwardConfig, BacktestWalkForwardRunner
+
+
+def _unit(_value):
+    return 10
+
+
+def test_cache_counts_hits_misses_and_tracks_bytes():
+    cache = BoundedReplayCache("replay_rows", sizer=_unit)
+    assert cache.get(("005930", "20260501")) is None
+    cache[("005930", "20260501")] = [1]
+    cache[("005930", "20260501")] = [2]  # 덮어쓰기는 크기를 다시 잰다
+    assert cache.get(("005930", "20260501")) == [2]
+    assert ("000660", "20260501") not in cache  # in 검사는 세지 않는다
+
+    assert cache.stats() == {"entries": 1, "bytes": 10, "hits": 1, "misses": 1, "evictions": 0}
+    del cache[("005930", "20260501")]
+    assert cache.bytes == 0 and len(cache) == 0
+
+
+def test_budget_evicts_lru_from_heaviest_cache_but_keeps_pinned_date():
+    budget = BacktestCacheBudget(50, weights={"light": 0.5, "heavy": 1.0})
+    light = BoundedReplayCache("light", budget=budget, sizer=_unit)
+    heavy = BoundedReplayCache("heavy", budget=budget, sizer=_unit)
+    budget.set_backtest_date("20260504")
+
+    light[("A", "20260501")] = 1
+    light[("B", "20260501")] = 1
+    heavy[("A", "20260501")] = 1
+    heavy[("B", "20260501")] = 1
+    light.get(("A", "20260501"))  # A 를 최근 사용으로
+    light[("C", "20260504")] = 1
+    light[("D", "20260504")] = 1  # 60 bytes → light(30/0.5=60) 가 heavy(20/1.0) 보다 무겁다
+
+    assert ("B", "20260501") not in light and ("A", "20260501") in light
+    assert budget.total_bytes == 50
+
+    light[("E", "20260504")] = 1
+    light[("F", "20260504")] = 1
+    # light 는 고정일 항목만 남아 heavy 쪽에서 버린다.
+    assert ("A", "20260501") not in light
+    assert len(heavy) == 1
+    assert budget.total_bytes == 50
+
+    stats = budget.stats()
+    assert stats["evictions"] == 3
+    assert stats["peak_bytes"] == 50
+    assert stats["caches"]["light"]["entries"] == 4
+
+
+def test_budget_tolerates_pinned_overflow_and_drains_on_next_date():
+    budget = BacktestCacheBudget(20)
+    cache = BoundedReplayCache("replay_rows", budget=budget, sizer=_unit)
+    budget.set_backtest_date("20260501")
+    for code in "ABC":
+        cache[(code, "20260501")] = 1
+
+    assert len(cache) == 3 and budget.stats()["over_budget"] > 0
+    budget.set_backtest_date("20260504")
+    assert budget.total_bytes <= 20
+
+
+def test_unbounded_budget_only_accounts():
+    budget = BacktestCacheBudget(0)
+    cache = BoundedReplayCache("replay_rows", budget=budget, sizer=_unit)
+    for day in range(1, 6):
+        cache[("A", f"2026050{day}")] = 1
+    assert budget.max_bytes is None
+    assert budget.stats()["bytes"] == 50 and budget.stats()["evictions"] == 0
+
+
+class _MinuteSource:
+    """종목·거래일마다 결정적 분봉 rows 를 만드는 합성 저장소."""
+
+    def __init__(self, rows_per_day=30):
+        self._rows_per_day = rows_per_day
+        self.loads = 0
+
+    async def get_day_intraday_minutes_list(self, code, *, date_ymd, session="REGULAR"):
+        self.loads += 1
+        base = 10_000 + (int(code) * 31 + int(date_ymd) * 7) % 900
+        return [
+            {
+                "stck_bsop_date": date_ymd,
+                "stck_cntg_hour": f"{9 + minute // 60:02d}{minute % 60:02d}00",
+                "stck_prpr": str(base + minute % 5),
+                "stck_oprc": str(base),
+                "stck_hgpr": str(base + 5),
+                "stck_lwpr": str(base - 5),
+                "cntg_vol": str(100 + minute),
+                "acml_vol": str((minute + 1) * 100),
+            }
+            for minute in range(self._rows_per_day)
+        ]
+
+
+class _PriceScanStrategy:
+    """replay 현재가가 mod 로 나누어떨어지면 사고 다음 거래일에 판다."""
+
+    name = "SCAN"
+
+    def __init__(self, replay, codes, mod=3):
+        self._replay, self._codes, self._mod = replay, codes, mod
+        self.date = ""
+        self.emitted = []
+
+    def set_backtest_date(self, date_ymd):
+        self.date = date_ymd
+
+    async def scan(self):
+        signals = []
+        for code in self._codes:
+            response = await self._replay.get_current_price(code)
+            price = int(response.data["output"]["stck_prpr"])
+            if price % self._mod == 0:
+                signals.append(TradeSignal(code=code, name=code, action="BUY", price=price, qty=1,
+                                           reason="test", strategy_name=self.name))
+        self.emitted.extend((self.date, signal.code) for signal in signals)
+        return signals
+
+    async def check_exits(self, holdings):
+        return [TradeSignal(code=h["code"], name=h["code"], action="SELL", price=h.get("current_price") or 10_000,
+                            qty=h["qty"], reason="test", strategy_name=self.name) for h in holdings]
+
+
+class _SignalPriceBarProvider:
+    async def get_bar(self, *, signal, date_ymd, side, execution_policy="current_bar"):
+        return BacktestBar(timestamp=f"{date_ymd} 100000", open=signal.price, high=signal.price,
+                           low=signal.price, close=signal.price, volume=1_000)
+
+
+async def _walk_forward(max_bytes, codes, dates):
+    budget = BacktestCacheBudget(max_bytes)
+    source = _MinuteSource()
+    replay = StockQueryBacktestReplayService(source, cache_budget=budget)
+    strategies = []
+
+    def runner_factory(phase, segment):
+        strategy = _PriceScanStrategy(replay, codes)
+        strategies.append(strategy)
+        return BacktestPeriodRunner(
+            strategy=strategy,
+            bar_provider=_SignalPriceBarProvider(),
+            ledger=BacktestPortfolioLedger(10**12),
+            date_context_targets=[replay, budget],
+            cache_budget=budget,
+        )
+
+    started = time.perf_counter()
+    result = await BacktestWalkForwardRunner(
+        runner_factory=runner_factory,
+        config=BacktestWalkForwardConfig(train_size=20, tune_size=10, test_size=10, step_size=20),
+    ).run(dates)
+    elapsed = time.perf_counter() - started
+    return result, [s.emitted for s in strategies], budget.stats(), source.loads, elapsed
+
+
+def _trading_dates(count):
+    dates, day = [], 0
+    while len(dates) < count:
+        day += 1
+        month, dom = 1 + (day - 1) // 28, 1 + (day - 1) % 28
+        dates.append(f"2025{month:02d}{dom:02d}")
+    return dates
+
+
+async def test_replay_and_bar_provider_caches_register_with_budget():
+    budget = BacktestCacheBudget(None)
+    replay = StockQueryBacktestReplayService(_MinuteSource(), cache_budget=budget)
+    StockQueryIntradayReplayBarProvider(replay, cache_budget=budget)
+    StockQueryDailyMtmBarProvider(replay, cache_budget=budget)
+    replay.set_backtest_date("20260501")
+    await replay.get_current_price("000001")
+    await replay.get_current_price("000001")
+
+    stats = budget.stats()
+    assert set(stats["caches"]) == {
+        "replay_rows", "replay_program", "intraday_bars", "intraday_rows", "orderbook_rows", "mtm_bars",
+    }
+    assert stats["caches"]["replay_rows"]["hits"] == 1
+    assert stats["caches"]["replay_rows"]["misses"] == 1
+    assert stats["bytes"] > 0
+
+
+@pytest.mark.slow
+async def test_stress_long_walk_forward_under_fixed_memory_cap():
+    """40종목 × 160거래일 walk-forward: 상한 없이 vs 하루치 working set 의 3배 상한."""
+    codes = [f"{i:06d}" for i in range(40)]
+    dates = _trading_dates(160)
+
+    unbounded, unbounded_signals, unbounded_stats, unbounded_loads, unbounded_sec = await _walk_forward(
+        None, codes, dates,
+    )
+    per_day = unbounded_stats["bytes"] / len(dates)
+    cap = int(per_day * 3)
+    bounded, bounded_signals, bounded_stats, bounded_loads, bounded_sec = await _walk_forward(cap, codes, dates)
+
+    print(
+        f"\n[replay cache stress 40 codes x {len(dates)} days walk-forward] "
+        f"unbounded peak={unbounded_stats['peak_bytes'] / 1e6:.1f}MB {unbounded_sec:.2f}s "
+        f"loads={unbounded_loads} | cap={cap / 1e6:.2f}MB peak={bounded_stats['peak_bytes'] / 1e6:.2f}MB "
+        f"{bounded_sec:.2f}s loads={bounded_loads} evictions={bounded_stats['evictions']} "
+        f"hit_ratio={bounded_stats['hit_ratio']:.2f}"
+    )
+    # 축출은 속도에만 영향 — 시그널·체결·요약은 같다.
+    assert bounded_signals == unbounded_signals
+    assert bounded.summary == unbounded.summary
+    assert bounded_stats["peak_bytes"] <= cap
+    assert bounded_stats["over_budget"] == 0
+    assert bounded_stats["evictions"] > 0
+    assert unbounded_stats["peak_bytes"] > cap * 10
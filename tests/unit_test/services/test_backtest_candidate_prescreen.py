@@ -0,0 +1,267 @@
+"""
+벡터화 후보 프리스크린 (services/backtest_candidate_prescreen.py + BacktestPeriodRunner).
+
+- BreakoutVolumePrescreen 마스크는 직전 고가 돌파·거래량 하한을 (거래일 × 종목) 으로 계산하고,
+  이력이 부족한 칸은 후보로 남긴다.
+- 오닐스퀴즈돌파 전략을 합성 KOSDAQ 일봉으로 돌렸을 때 프리스크린 on/off 의 체결·저널이 같고,
+  scan 의 replay 현재가 조회는 마스크에 남은 쌍만 일어난다.
+- verify 모드는 필요조건이 아닌 잘못된 선언을 PrescreenMismatchError 로 잡는다.
+"""
+import logging
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from common.types import ResCommonResponse
+from services.backtest_candidate_prescreen import (
+    BacktestCandidatePrescreen,
+    BreakoutVolumePrescreen,
+    CandidatePrescreen,
+    DailyOhlcvPanel,
+    PrescreenMismatchError,
+    rolling_prior,
+)
+from services.backtest_execution_simulator import BacktestBar, BacktestPortfolioLedger
+from services.backtest_period_runner import BacktestPeriodRunner
+from common.oneil_common_types import OSBWatchlistItem
+from strategies.oneil_squeeze_breakout_strategy import OneilSqueezeBreakoutStrategy
+
+
+def _business_days(start: date, count: int) -> list[str]:
+    days, day = [], start
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+    return days
+
+
+def _kosdaq_fixture(n_codes: int, n_days: int, seed: int = 5) -> tuple[list[str], dict[str, list[dict]]]:
+    """랜덤워크 일봉 + 가끔 직전 20일 고가를 1% 넘기며 거래량 4배가 터지는 돌파일."""
+    rng = np.random.default_rng(seed)
+    dates = _business_days(date(2023, 1, 2), n_days)
+    bars: dict[str, list[dict]] = {}
+    for c in range(n_codes):
+        code = f"2{c:05d}"
+        close, rows = float(rng.integers(5_000, 50_000)), []
+        for i, day in enumerate(dates):
+            base_vol = 200_000 * (1 + 0.3 * rng.random())
+            prior_high = max((r["high"] for r in rows[-20:]), default=close)
+            if i >= 25 and rng.random() < 0.04:
+                close = int(prior_high * 1.01)
+                rows.append({"date": day, "open": int(close * 0.97), "high": close, "low": int(close * 0.96),
+                             "close": close, "volume": int(base_vol * 4)})
+                continue
+            close = max(1_000.0, close * (1 + rng.normal(0, 0.015)))
+            high = close * (1 + 0.01 * rng.random())
+            rows.append({"date": day, "open": int(close), "high": int(high), "low": int(close * 0.985),
+                         "close": int(close), "volume": int(base_vol)})
+        bars[code] = rows
+    return dates, bars
+
+
+class _ReplayClock:
+    def __init__(self) -> None:
+        self._date = "20230102"
+
+    def set_backtest_date(self, date_ymd: str) -> None:
+        self._date = date_ymd
+
+    def get_current_kst_time(self) -> datetime:
+        return datetime.strptime(f"{self._date} 140000", "%Y%m%d %H%M%S")
+
+    def get_market_open_time(self) -> datetime:
+        return self.get_current_kst_time().replace(hour=9, minute=0)
+
+    def get_market_close_time(self) -> datetime:
+        return self.get_current_kst_time().replace(hour=15, minute=30)
+
+
+class _ReplaySqs:
+    """일봉 fixture 로 replay StockQueryService 흉내. 14:00 현재가 = 당일 종가 (당일 고가 이하)."""
+
+    def __init__(self, bars: dict[str, list[dict]], *, replay_cost_sec: float = 0.0) -> None:
+        self._bars = bars
+        self._index = {code: {row["date"]: i for i, row in enumerate(rows)} for code, rows in bars.items()}
+        self._date = None
+        self._cost = replay_cost_sec
+        self.current_price_calls = 0
+        self.prefetch_prices = AsyncMock(return_value=0)
+
+    def set_backtest_date(self, date_ymd: str) -> None:
+        self._date = date_ymd
+
+    async def get_current_price(self, code: str, *args, **kwargs) -> ResCommonResponse:
+        self.current_price_calls += 1
+        if self._cost:
+            time.sleep(self._cost)  # 분봉 재구성 비용 대용
+        row = self._bars[code][self._index[code][self._date]]
+        return ResCommonResponse(rt_cd="0", msg1="OK", data={"output": {
+            "stck_prpr": str(row["close"]), "stck_hgpr": str(row["high"]), "stck_lwpr": str(row["low"]),
+            "acml_vol": str(row["volume"]), "pgtr_ntby_qty": str(int(row["volume"] * 0.15)),
+            "acml_tr_pbmn": str(row["volume"] * row["close"]),
+        }})
+
+    async def get_stock_conclusion(self, code: str) -> ResCommonResponse:
+        return ResCommonResponse(rt_cd="0", msg1="OK", data={"output": [{"tday_rltv": "150"}]})
+
+    async def get_recent_daily_ohlcv(self, code: str, limit: int = 60, end_date: str | None = None):
+        rows = [row for row in self._bars.get(code, []) if row["date"] <= (end_date or self._date)]
+        return ResCommonResponse(rt_cd="0", msg1="OK", data=[dict(row) for row in rows[-limit:]])
+
+
+class _ReplayUniverse:
+    """전 종목을 직전 20거래일 고가/평균거래량으로 watchlist 에 올리는 point-in-time 유니버스."""
+
+    def __init__(self, bars: dict[str, list[dict]]) -> None:
+        self._bars = bars
+        self._index = {code: {row["date"]: i for i, row in enumerate(rows)} for code, rows in bars.items()}
+        self._cfg = SimpleNamespace(high_breakout_period=20)
+        self._date = None
+
+    def set_backtest_date(self, date_ymd: str) -> None:
+        self._date = date_ymd
+
+    async def get_watchlist(self, **kwargs) -> dict:
+        watchlist = {}
+        for code, rows in self._bars.items():
+            today = self._index[code][self._date]
+            prior = rows[max(today - 20, 0):today]
+            if len(prior) < 20:
+                continue
+            watchlist[code] = OSBWatchlistItem(
+                code=code, name=code, market="KOSDAQ",
+                high_20d=int(max(row["high"] for row in prior)), ma_20d=0, ma_50d=0,
+                avg_vol_20d=int(sum(row["volume"] for row in prior) / 20),
+                bb_width_min_20d=1.0, prev_bb_width=1.0, w52_hgpr=0,
+                avg_trading_value_5d=0, market_cap=50_000_000_000, source="pool_b",
+            )
+        return watchlist
+
+    async def is_market_timing_ok(self, *args, **kwargs) -> bool:
+        return True
+
+
+class _CloseBarProvider:
+    async def get_bar(self, *, signal, date_ymd, side, execution_policy="current_bar") -> BacktestBar:
+        return BacktestBar(timestamp=f"{date_ymd} 140000", open=signal.price, high=signal.price,
+                           low=signal.price, close=signal.price, volume=10_000)
+
+
+def _make_runner(bars, dates, tmp_path, *, prescreen_mode: str, declared=None, verify_every=0,
+                 replay_cost_sec=0.0, tag=""):
+    sqs = _ReplaySqs(bars, replay_cost_sec=replay_cost_sec)
+    universe = _ReplayUniverse(bars)
+    clock = _ReplayClock()
+    logger = logging.getLogger(f"prescreen_test_{prescreen_mode}_{tag}_{id(sqs)}")
+    logger.disabled = True
+    strategy = OneilSqueezeBreakoutStrategy(
+        stock_query_service=sqs, universe_service=universe, market_clock=clock, logger=logger,
+        state_file=str(tmp_path / f"osb_{prescreen_mode}_{tag}_{id(sqs)}.json"),
+    )
+    strategy._save_state = MagicMock()
+    strategy._save_state_async = AsyncMock()
+    candidate_prescreen = None
+    if prescreen_mode != "off":
+        candidate_prescreen = BacktestCandidatePrescreen(
+            declared or strategy.backtest_prescreen(), stock_query_service=sqs, dates=dates,
+            verify_every=verify_every,
+        )
+    runner = BacktestPeriodRunner(
+        strategy=strategy, bar_provider=_CloseBarProvider(),
+        ledger=BacktestPortfolioLedger(initial_cash=10_000_000_000),
+        date_context_targets=[clock, sqs, universe], candidate_prescreen=candidate_prescreen,
+    )
+    return runner, sqs
+
+
+def _trades(result) -> list[tuple]:
+    return [(r.order.code, r.order.side.value, r.fill_price, r.filled_qty) for r in result.execution_reports]
+
+
+def test_rolling_prior_excludes_current_row_and_marks_short_history():
+    values = np.array([[1.0], [3.0], [2.0], [5.0]])
+    out = rolling_prior(values, 2, np.max)
+    assert np.isnan(out[:2]).all()
+    assert out[2:, 0].tolist() == [3.0, 3.0]
+
+
+def test_breakout_volume_mask_keeps_unknown_cells():
+    rows = {
+        "A": [{"date": f"2024010{i}", "high": h, "volume": v}
+              for i, (h, v) in enumerate([(100, 10), (100, 10), (102, 10), (99, 40), (110, 1)], start=1)],
+        "B": [{"date": "20240105", "high": 1, "volume": 1}],  # 이력 부족
+    }
+    panel = DailyOhlcvPanel.from_rows(rows)
+    mask = BreakoutVolumePrescreen(breakout_period=3, breakout_buffer_pct=1.0, min_volume_ratio=0.5) \
+        .candidate_mask(panel)
+    # A: 20240103 고가 102 ≥ floor(100 × 1.01)=101, 거래량 10 ≥ (10+10)/3×0.5 → 후보
+    #    20240104 고가 99 < 103 → 탈락, 20240105 고가 110 이지만 거래량 1 < (10+40)/3×0.5 → 탈락
+    assert mask[:, 0].tolist() == [True, True, True, False, False]
+    assert mask[:, 1].tolist() == [True] * 5
+
+
+async def test_prescreen_matches_full_scan_and_skips_replay_calls(tmp_path):
+    dates, bars = _kosdaq_fixture(n_codes=12, n_days=90)
+    run_dates = dates[25:]
+
+    full_runner, full_sqs = _make_runner(bars, run_dates, tmp_path, prescreen_mode="off")
+    full = await full_runner.run(run_dates)
+    masked_runner, masked_sqs = _make_runner(bars, run_dates, tmp_path, prescreen_mode="on")
+    masked = await masked_runner.run(run_dates)
+
+    assert _trades(full) and _trades(masked) == _trades(full)
+    assert masked.journal_records == full.journal_records
+    assert masked_sqs.current_price_calls < full_sqs.current_price_calls / 3
+    stats = masked.prescreen
+    assert stats["codes_loaded"] == 12 and stats["pairs_skipped"] > 0 and stats["verified_dates"] == 0
+    assert full.prescreen == {}
+
+
+async def test_verify_mode_passes_for_sound_prescreen_and_catches_unsound_one(tmp_path):
+    dates, bars = _kosdaq_fixture(n_codes=8, n_days=80, seed=9)
+    run_dates = dates[25:]
+
+    runner, _ = _make_runner(bars, run_dates, tmp_path, prescreen_mode="verify", verify_every=1)
+    result = await runner.run(run_dates)
+    assert result.prescreen["verified_dates"] == len(run_dates)
+    assert result.prescreen["verified_signals"] > 0
+
+    class _RejectAll(CandidatePrescreen):
+        def candidate_mask(self, panel):
+            return np.zeros(panel.high.shape, dtype=bool)
+
+    runner, _ = _make_runner(bars, run_dates, tmp_path, prescreen_mode="verify", declared=_RejectAll(),
+                             verify_every=1, tag="reject_all")
+    with pytest.raises(PrescreenMismatchError):
+        await runner.run(run_dates)
+
+
+@pytest.mark.slow
+@pytest.mark.real_sleep
+async def test_benchmark_prescreen_speedup_on_multi_year_kosdaq_fixture(tmp_path):
+    """KOSDAQ 합성 40종목 × 2년(500거래일), replay 현재가 1회 2ms: 전체 scan vs 프리스크린."""
+    dates, bars = _kosdaq_fixture(n_codes=40, n_days=525, seed=21)
+    run_dates = dates[25:]
+
+    timings, results, calls = {}, {}, {}
+    for mode in ("off", "on"):
+        runner, sqs = _make_runner(bars, run_dates, tmp_path, prescreen_mode=mode, replay_cost_sec=0.002)
+        start = time.perf_counter()
+        results[mode] = await runner.run(run_dates)
+        timings[mode] = time.perf_counter() - start
+        calls[mode] = sqs.current_price_calls
+
+    assert _trades(results["on"]) == _trades(results["off"])
+    stats = results["on"].prescreen
+    print(
+        f"\n[prescreen KOSDAQ 40 codes x {len(run_dates)} days] full={timings['off']:.2f}s "
+        f"prescreen={timings['on']:.2f}s speedup={timings['off'] / timings['on']:.1f}x "
+        f"replay calls {calls['off']}->{calls['on']} skip={stats['skip_ratio'] * 100:.1f}% "
+        f"mask build={stats['mask_build_ms']:.0f}ms trades={len(results['on'].execution_reports)}"
+    )
+    assert timings["on"] * 2 < timings["off"]
@@ -4,6 +4,11 @@ from unittest.mock import AsyncMock
 import pytest
 
 from common.types import ErrorCode, ResCommonResponse
+from repositories.tick_segment_store import (
+    EXECUTION_STRENGTH_STREAM,
+    TOP_OF_BOOK_STREAM,
+    TickSegmentStore,
+)
 from services.backtest_microstructure_capture import BacktestMicrostructureCaptureService
 
 
@@ -467,38 +472,25 @@ def test_write_overlay_files_creates_four_fixture_files(tmp_path):
     assert paths["capture"].name == "replay_microstructure_20260702.json"
 
 
-def _seed_es_db(tmp_path):
-    db_path = tmp_path / "execution_strength.db"
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
-            CREATE TABLE es_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                code TEXT NOT NULL,
-                trade_date TEXT NOT NULL,
-                trade_time TEXT NOT NULL,
-                strength REAL NOT NULL,
-                created_at REAL NOT NULL
-            )
-            """
-        )
-        conn.executemany(
-            "INSERT INTO es_history (code, trade_date, trade_time, strength, created_at)"
-            " VALUES (?, ?, ?, ?, ?)",
-            [
-                ("000001", "20260512", "090001", 110.0, 1.0),
-                ("000001", "20260512", "091001", 125.5, 2.0),
-                ("000001", "20260511", "090001", 90.0, 0.5),  # 다른 거래일 — 제외
-                ("000001", "20260512", "154000", 99.0, 3.0),  # 마감 이후 — 제외
-                ("000002", "20260512", "090001", 80.0, 1.5),
-            ],
-        )
-    return db_path
+def _seed_es_segments(tmp_path):
+    es_dir = tmp_path / "execution_strength"
+    store = TickSegmentStore(str(es_dir), EXECUTION_STRENGTH_STREAM)
+    store.append("20260512", [
+        ("000001", 91001, 125.5, 2.0),
+        ("000001", 154000, 99.0, 3.0),  # 마감 이후 — 제외
+        ("000002", 90001, 80.0, 1.5),
+    ])
+    store.append("20260511", [("000001", 90001, 90.0, 0.5)])  # 다른 거래일 — 제외
+    store.seal("20260512")
+    # 봉인 뒤 같은 날 재기동해 이어 쓴 log 도 seg 와 합쳐 시각순으로 읽는다
+    store.append("20260512", [("000001", 90001, 110.0, 1.0)])
+    store.close()
+    return es_dir
 
 
 @pytest.mark.asyncio
-async def test_capture_execution_strength_intraday_from_es_db(tmp_path):
-    db_path = _seed_es_db(tmp_path)
+async def test_capture_execution_strength_intraday_from_es_segments(tmp_path):
+    es_dir = _seed_es_segments(tmp_path)
     sqs = AsyncMock()
     sqs.get_stock_conclusion.side_effect = [
         _response({"output": [{"tday_rltv": "145.5"}]}),
@@ -507,7 +499,7 @@ async def test_capture_execution_strength_intraday_from_es_db(tmp_path):
     ]
     service = BacktestMicrostructureCaptureService(
         stock_query_service=sqs,
-        execution_strength_db_path=db_path,
+        execution_strength_dir=es_dir,
     )
 
     payload = await service.capture(
@@ -560,7 +552,7 @@ async def test_capture_execution_strength_es_db_missing_file_marks_all_fallback(
     sqs.get_stock_conclusion.return_value = _response({"output": [{"tday_rltv": "100.0"}]})
     service = BacktestMicrostructureCaptureService(
         stock_query_service=sqs,
-        execution_strength_db_path=tmp_path / "missing.db",
+        execution_strength_dir=tmp_path / "missing",
     )
 
     payload = await service.capture(
@@ -642,30 +634,20 @@ def test_write_overlay_files_persists_quality_gate_sidecar(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_capture_reads_top_of_book_history_from_db(tmp_path):
-    db_path = tmp_path / "orderbook_snapshots.db"
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            "CREATE TABLE top_of_book_history ("
-            "id INTEGER PRIMARY KEY AUTOINCREMENT, code TEXT, trade_date TEXT, "
-            "trade_time TEXT, ask_price INTEGER, bid_price INTEGER, "
-            "ask_qty INTEGER, bid_qty INTEGER, total_ask_qty INTEGER, "
-            "total_bid_qty INTEGER, created_at REAL)"
-        )
-        conn.executemany(
-            "INSERT INTO top_of_book_history "
-            "(code, trade_date, trade_time, ask_price, bid_price, ask_qty, bid_qty, "
-            "total_ask_qty, total_bid_qty, created_at) VALUES (?,?,?,?,?,?,?,?,?,?)",
-            [
-                ("000001", "20260721", "085959", 101, 99, 1, 2, 3, 4, 1.0),
-                ("000001", "20260721", "090001", 102, 100, 10, 20, 30, 40, 2.0),
-                ("000001", "20260721", "153001", 103, 101, 11, 21, 31, 41, 3.0),
-            ],
-        )
+async def test_capture_reads_top_of_book_history_from_segments(tmp_path):
+    orderbook_dir = tmp_path / "orderbook_snapshots"
+    store = TickSegmentStore(str(orderbook_dir), TOP_OF_BOOK_STREAM)
+    store.append("20260721", [
+        ("000001", 85959, 101, 99, 1, 2, 3, 4, 1.0),
+        ("000001", 90001, 102, 100, 10, 20, 30, 40, 2.0),
+        ("000001", 90101, 103, 101, -1, -1, 31, 41, 2.5),
+        ("000001", 153001, 103, 101, 11, 21, 31, 41, 3.0),
+    ])
+    store.close()
 
     service = BacktestMicrostructureCaptureService(
         stock_query_service=AsyncMock(),
-        orderbook_db_path=db_path,
+        orderbook_dir=orderbook_dir,
     )
     payload = await service.capture(
         codes=["000001", "000002"],
@@ -681,11 +663,15 @@ async def test_capture_reads_top_of_book_history_from_db(tmp_path):
             "time": "090001", "ask_price": 102, "bid_price": 100,
             "ask_qty": 10, "bid_qty": 20,
             "total_ask_qty": 30, "total_bid_qty": 40,
+        }, {
+            "time": "090101", "ask_price": 103, "bid_price": 101,
+            "ask_qty": None, "bid_qty": None,
+            "total_ask_qty": 31, "total_bid_qty": 41,
         }],
         "000002": [],
     }
     assert payload["metadata"]["orderbook_fallback_codes"] == ["000002"]
-    assert payload["metadata"]["row_counts"]["orderbook_intraday_rows"] == 1
+    assert payload["metadata"]["row_counts"]["orderbook_intraday_rows"] == 2
 
 
 @pytest.mark.asyncio
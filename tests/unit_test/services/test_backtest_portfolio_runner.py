@@ -0,0 +1,229 @@
+"""
+포트폴리오 백테스트 (services/backtest_portfolio_runner.py).
+
+- 전략 1개짜리 포트폴리오는 BacktestPeriodRunner.run 과 같은 체결·저널을 낸다.
+- 전략별 평가는 동시에, 장부 반영은 전략 순서대로 — 현금 한도가 전략 간에 공유된다.
+- 레짐 스냅샷·replay 분봉은 전략 간에 한 번만 로드되고, 보존 거래일 밖 캐시는 버린다.
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.types import TradeSignal
+from services.backtest_execution_simulator import BacktestBar, BacktestPortfolioLedger
+from services.backtest_period_runner import BacktestPeriodRunner
+from services.backtest_portfolio_runner import BacktestPortfolioRunner, SharedRegimeSnapshotCache
+from services.backtest_replay_adapter import StockQueryBacktestReplayService
+
+_DATES = ["20260501", "20260504", "20260505", "20260506"]
+
+
+def _signal(strategy, code, action="BUY", price=70_000, qty=1):
+    return TradeSignal(code=code, name=code, action=action, price=price, qty=qty,
+                       reason="test", strategy_name=strategy)
+
+
+class _ScriptedStrategy:
+    """buys[date] 종목을 사고, 다음 거래일에 보유 종목을 판다."""
+
+    def __init__(self, name, buys):
+        self.name = name
+        self._buys = buys
+        self.date = ""
+
+    def set_backtest_date(self, date_ymd):
+        self.date = date_ymd
+
+    async def scan(self):
+        return [_signal(self.name, code) for code in self._buys.get(self.date, [])]
+
+    async def check_exits(self, holdings):
+        return [_signal(self.name, h["code"], action="SELL", price=71_000, qty=h["qty"]) for h in holdings]
+
+
+class _SignalPriceBarProvider:
+    async def get_bar(self, *, signal, date_ymd, side, execution_policy="current_bar"):
+        return BacktestBar(timestamp=f"{date_ymd} 100000", open=signal.price, high=signal.price,
+                           low=signal.price, close=signal.price, volume=1_000)
+
+
+def _runner(strategy, ledger, **kwargs):
+    return BacktestPeriodRunner(strategy=strategy, bar_provider=_SignalPriceBarProvider(), ledger=ledger, **kwargs)
+
+
+async def test_single_strategy_portfolio_matches_period_runner():
+    buys = {"20260501": ["005930", "000660"], "20260505": ["035720"]}
+    solo = await _runner(_ScriptedStrategy("A", buys), BacktestPortfolioLedger(1_000_000)).run(_DATES)
+    portfolio = await BacktestPortfolioRunner(
+        [_runner(_ScriptedStrategy("A", buys), BacktestPortfolioLedger(1_000_000))]
+    ).run(_DATES)
+
+    merged = portfolio.strategy_results["A"]
+    assert merged.execution_reports == solo.execution_reports
+    assert merged.journal_records == solo.journal_records
+    assert portfolio.portfolio == solo.portfolio
+
+
+async def test_shared_ledger_applies_cash_limit_across_strategies_in_runner_order():
+    ledger = BacktestPortfolioLedger(100_000)
+    runners = [
+        _runner(_ScriptedStrategy("A", {"20260501": ["005930"]}), ledger),
+        _runner(_ScriptedStrategy("B", {"20260501": ["000660"]}), ledger),
+    ]
+    result = await BacktestPortfolioRunner(runners).run(_DATES[:1])
+
+    assert [r.order.code for r in result.strategy_results["A"].execution_reports] == ["005930"]
+    assert result.strategy_results["B"].execution_reports == []
+    assert "cash_short" in str(result.strategy_results["B"].journal_records)
+    assert set(result.portfolio["positions"]) == {"005930"}
+
+    # 다음 거래일 A 가 팔아 현금이 돌아오면 같은 장부로 B 가 살 수 있다.
+    runners[1]._strategy._buys["20260504"] = ["000660"]
+    result = await BacktestPortfolioRunner(runners).run(_DATES[1:2])
+    assert set(result.portfolio["positions"]) == {"000660"}
+
+
+async def test_strategies_are_evaluated_concurrently():
+    first_scanning, second_scanning = asyncio.Event(), asyncio.Event()
+
+    class _Waiting(_ScriptedStrategy):
+        def __init__(self, name, mine, other):
+            super().__init__(name, {})
+            self._mine, self._other = mine, other
+
+        async def scan(self):
+            self._mine.set()
+            await asyncio.wait_for(self._other.wait(), timeout=1.0)  # 순차 실행이면 timeout
+            return []
+
+    ledger = BacktestPortfolioLedger(1_000_000)
+    result = await BacktestPortfolioRunner([
+        _runner(_Waiting("A", first_scanning, second_scanning), ledger),
+        _runner(_Waiting("B", second_scanning, first_scanning), ledger),
+    ]).run(_DATES[:1])
+    assert set(result.strategy_eval_sec) == {"A", "B"}
+
+
+async def test_regime_cache_loads_each_snapshot_once_and_is_bounded():
+    inner = AsyncMock()
+    inner.classify_on_date.side_effect = lambda market, date: f"{market}:{date}"
+    cache = SharedRegimeSnapshotCache(inner, max_entries=2)
+
+    got = await asyncio.gather(*(cache.classify_on_date("KOSPI", "20260501") for _ in range(4)))
+    assert got == ["KOSPI:20260501"] * 4 and inner.classify_on_date.await_count == 1
+    await cache.classify_on_date("KOSDAQ", "20260501")
+    await cache.classify_on_date("KOSPI", "20260504")
+    assert cache.stats() == {"entries": 2, "hits": 3, "misses": 3}
+    await cache.classify_on_date("KOSPI", "20260501")  # 밀려난 항목은 다시 로드
+    assert inner.classify_on_date.await_count == 4
+
+
+async def test_rejects_unshared_ledger_and_duplicate_strategy_names():
+    with pytest.raises(ValueError):
+        BacktestPortfolioRunner([
+            _runner(_ScriptedStrategy("A", {}), BacktestPortfolioLedger(1)),
+            _runner(_ScriptedStrategy("B", {}), BacktestPortfolioLedger(1)),
+        ])
+    ledger = BacktestPortfolioLedger(1)
+    with pytest.raises(ValueError):
+        BacktestPortfolioRunner([_runner(_ScriptedStrategy("A", {}), ledger),
+                                 _runner(_ScriptedStrategy("A", {}), ledger)])
+
+
+async def test_evicts_shared_caches_outside_retain_window():
+    class _Cache:
+        def __init__(self):
+            self.cutoffs = []
+
+        def evict_before(self, date_ymd):
+            self.cutoffs.append(date_ymd)
+            return 1
+
+        def cache_entry_count(self):
+            return 5
+
+    cache = _Cache()
+    ledger = BacktestPortfolioLedger(1_000_000)
+    result = await BacktestPortfolioRunner(
+        [_runner(_ScriptedStrategy("A", {}), ledger)], cache_targets=[cache], cache_retain_days=2,
+    ).run(_DATES)
+
+    assert cache.cutoffs == ["20260504", "20260505"]
+    assert result.cache == {"retain_days": 2, "evicted_entries": 2, "resident_entries": 5}
+
+
+class _LatencyMinuteSource:
+    """분봉 저장소 흉내 — 종목·거래일 로드마다 I/O 지연."""
+
+    def __init__(self, latency_sec):
+        self._latency = latency_sec
+        self.loads = 0
+
+    async def get_day_intraday_minutes_list(self, code, *, date_ymd, session="REGULAR"):
+        self.loads += 1
+        await asyncio.sleep(self._latency)
+        price = 10_000 + (int(code) * 7 + int(date_ymd[-2:]) * 13) % 500
+        return [{"stck_bsop_date": date_ymd, "stck_cntg_hour": "100000", "stck_prpr": str(price)}]
+
+
+class _PriceScanStrategy(_ScriptedStrategy):
+    """전 종목 replay 현재가를 보고 가격이 mod 로 나누어떨어지면 산다."""
+
+    def __init__(self, name, replay, codes, mod):
+        super().__init__(name, {})
+        self._replay, self._codes, self._mod = replay, codes, mod
+        self.emitted = []
+
+    async def scan(self):
+        responses = await asyncio.gather(*(self._replay.get_current_price(code) for code in self._codes))
+        signals = [
+            _signal(self.name, code, price=int(resp.data["output"]["stck_prpr"]))
+            for code, resp in zip(self._codes, responses)
+            if int(resp.data["output"]["stck_prpr"]) % self._mod == 0
+        ]
+        self.emitted.extend((self.date, signal.code) for signal in signals)
+        return signals
+
+
+@pytest.mark.slow
+@pytest.mark.real_sleep
+async def test_benchmark_portfolio_vs_sum_of_single_strategy_runs():
+    """7전략 × 40종목 × 20거래일, 분봉 로드 1회 15ms: 전략별 단독 실행 합계 vs 공유 포트폴리오 실행."""
+    codes = [f"{i:06d}" for i in range(40)]
+    dates = [f"202605{d:02d}" for d in range(1, 21)]
+    mods = [3, 5, 7, 11, 13, 17, 19]
+
+    def _strategies(replay):
+        return [_PriceScanStrategy(f"S{i}", replay, codes, mod) for i, mod in enumerate(mods)]
+
+    single_sec, single_loads, single_signals = 0.0, 0, {}
+    for i in range(len(mods)):
+        source = _LatencyMinuteSource(0.015)
+        replay = StockQueryBacktestReplayService(source)
+        strategy = _strategies(replay)[i]
+        started = time.perf_counter()
+        await _runner(strategy, BacktestPortfolioLedger(10**12), date_context_targets=[replay]).run(dates)
+        single_sec += time.perf_counter() - started
+        single_loads += source.loads
+        single_signals[strategy.name] = strategy.emitted
+
+    source = _LatencyMinuteSource(0.015)
+    replay = StockQueryBacktestReplayService(source)
+    ledger = BacktestPortfolioLedger(10**12)
+    strategies = _strategies(replay)
+    portfolio = await BacktestPortfolioRunner(
+        [_runner(s, ledger, date_context_targets=[replay]) for s in strategies],
+        cache_targets=[replay],
+    ).run(dates)
+
+    # 시그널은 전략 state 만으로 정해져 단독 실행과 같다 (체결은 종목 단위 공유 장부라 달라질 수 있다).
+    assert {s.name: s.emitted for s in strategies} == single_signals
+    print(
+        f"\n[portfolio backtest 7 strategies x 40 codes x 20 days] single sum={single_sec:.2f}s "
+        f"portfolio={portfolio.wall_time_sec:.2f}s speedup={single_sec / portfolio.wall_time_sec:.1f}x "
+        f"minute loads {single_loads}->{source.loads} resident={portfolio.cache['resident_entries']}"
+    )
+    assert source.loads == len(codes) * len(dates)
+    assert portfolio.cache["resident_entries"] == len(codes)
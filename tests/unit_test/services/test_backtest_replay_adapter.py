@@ -566,3 +566,51 @@ async def test_recent_daily_ohlcv_fallback_applies_limit_and_end_date():
 
     resp = await replay.get_recent_daily_ohlcv("900100", limit=2, end_date="20260310")
     assert [r["date"] for r in resp.data] == ["20260309", "20260310"]
+
+
+@pytest.mark.asyncio
+async def test_replay_service_loads_concurrent_same_code_requests_once():
+    import asyncio
+
+    release = asyncio.Event()
+
+    async def _rows(code, **kwargs):
+        await release.wait()
+        return [{"stck_bsop_date": kwargs["date_ymd"], "stck_cntg_hour": "090000", "stck_prpr": "70000"}]
+
+    sqs = AsyncMock()
+    sqs.get_day_intraday_minutes_list.side_effect = _rows
+    replay = StockQueryBacktestReplayService(sqs)
+    replay.set_backtest_date("20260501")
+
+    pending = [asyncio.ensure_future(replay.get_current_price("005930")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*pending)
+
+    assert [r.data["output"]["stck_prpr"] for r in responses] == ["70000"] * 3
+    sqs.get_day_intraday_minutes_list.assert_awaited_once()
+    assert replay._row_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_replay_caches_evict_entries_before_cutoff_date():
+    sqs = AsyncMock()
+    sqs.get_day_intraday_minutes_list.return_value = [
+        {"stck_bsop_date": "20260501", "stck_cntg_hour": "090000", "stck_prpr": "70000"},
+    ]
+    sqs.get_recent_daily_ohlcv.return_value = ResCommonResponse(rt_cd="0", msg1="OK", data=[])
+    replay = StockQueryBacktestReplayService(sqs)
+    provider = StockQueryIntradayReplayBarProvider(sqs)
+    mtm = StockQueryDailyMtmBarProvider(sqs)
+    for date_ymd in ("20260501", "20260502"):
+        replay.set_backtest_date(date_ymd)
+        await replay.get_current_price("005930")
+        await provider.get_bar(signal=_signal(price=70_000), date_ymd=date_ymd, side="BUY")
+        await mtm.get_holding_bars(code="005930", start_ymd="20260430", end_ymd=date_ymd)
+
+    assert replay.cache_entry_count() == 2 and provider.cache_entry_count() == 6 and mtm.cache_entry_count() == 2
+    assert replay.evict_before("20260502") == 1
+    assert provider.evict_before("20260502") == 3
+    assert mtm.evict_before("20260502") == 1
+    assert replay.cache_entry_count() == 1 and provider.cache_entry_count() == 3 and mtm.cache_entry_count() == 1
@@ -6,6 +6,7 @@ import pytest
 from common.operator_alert_types import AlertSource
 from common.types import ErrorCode, ResCommonResponse
 from config.config_loader import DataQualityConfig
+from repositories.latest_price_table import LatestPriceTable
 from services.data_quality_service import DataQualityService
 
 
@@ -257,19 +258,20 @@ def test_validate_execution_report_missing_fields():
 @pytest.mark.asyncio
 async def test_validate_order_reference_blocks_stale_and_outlier():
     class PriceStream:
-        def __init__(self, cached):
-            self.cached = cached
+        def __init__(self, received_at):
+            self.table = LatestPriceTable()
+            self.table.write("005930", 70000.0, received_at=received_at)
 
-        def get_cached_price(self, code):
-            return self.cached
+        def get_price_quote(self, code):
+            return self.table.read(code)
 
     stale = DataQualityService(
         DataQualityConfig(max_tick_age_sec=1.0),
-        price_stream_service=PriceStream({"price": "70000", "received_at": time.time() - 5}),
+        price_stream_service=PriceStream(time.time() - 5),
     )
     outlier = DataQualityService(
         DataQualityConfig(max_price_jump_pct=10.0),
-        price_stream_service=PriceStream({"price": "70000", "received_at": time.time()}),
+        price_stream_service=PriceStream(time.time()),
     )
 
     stale_result = await stale.validate_order_reference(stock_code="005930", price=70000, qty=1)
@@ -280,7 +282,7 @@ async def test_validate_order_reference_blocks_stale_and_outlier():
     assert stale_result.metadata["reference_price"] == 70000.0
     assert stale_result.metadata["order_price"] == 70000
     assert stale_result.metadata["age_sec"] >= 5.0
-    assert stale_result.metadata["reference_source"] == "unknown"
+    assert stale_result.metadata["reference_source"] == "websocket"
     assert outlier_result.ok is False
     assert outlier_result.reason == "invalid_tick"
 
@@ -288,12 +290,14 @@ async def test_validate_order_reference_blocks_stale_and_outlier():
 @pytest.mark.asyncio
 async def test_validate_order_reference_disabled_invalid_cache_failure_and_ok():
     class FailingPriceStream:
-        def get_cached_price(self, code):
+        def get_price_quote(self, code):
             raise RuntimeError("cache down")
 
     class PriceStream:
-        def get_cached_price(self, code):
-            return {"price": "70000", "received_at": time.time()}
+        def get_price_quote(self, code):
+            table = LatestPriceTable()
+            table.write(code, 70000.0)
+            return table.read(code)
 
     disabled = DataQualityService(DataQualityConfig(enabled=False))
     invalid = DataQualityService()
@@ -1947,4 +1947,51 @@ async def test_calc_error_without_alert_service_still_counts():
         result = await service.get_rsi("005930", period=14)
 
     assert result.rt_cd == ErrorCode.UNKNOWN_ERROR.value
-    assert service.get_calc_error_stats_delta().get("rsi:ValueError") == 1
\ No newline at end of file
+    assert service.get_calc_error_stats_delta().get("rsi:ValueError") == 1
+
+def _daily_rows(count, start=10000):
+    return [
+        {"date": f"2025{1 + i // 28:02d}{1 + i % 28:02d}", "open": start + (i * 37) % 300,
+         "high": start + (i * 37) % 300 + 50, "low": start + (i * 37) % 300 - 50,
+         "close": start + (i * 53) % 400, "volume": 1000 + i}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_warm_confirmed_indicators_shares_cache_with_live_calls(cache_store):
+    """장전 웜업이 넣은 확정 지표를 장중 exclude_today 호출이 같은 키로 적중하고 값도 같다."""
+    confirmed = _daily_rows(250)
+    today = {**confirmed[-1], "date": "20990101", "close": 99999}
+    cold = IndicatorService(AsyncMock(), cache_store=None)
+    expected = (await cold.get_rsi("005930", period=2, ohlcv_data=confirmed + [today], exclude_today=True)).data
+
+    service = IndicatorService(AsyncMock(), cache_store=cache_store)
+    assert service.warm_confirmed_indicators("005930", confirmed) == 4
+    assert service.warm_confirmed_indicators("005930", confirmed) == 0  # 이미 캐시됨
+
+    with patch.object(service, "_calculate_rsi_series", side_effect=AssertionError("재계산 없이 캐시 히트")):
+        warm = await service.get_rsi("005930", period=2, ohlcv_data=confirmed + [today], exclude_today=True)
+    assert warm.data == expected
+
+
+def test_warm_confirmed_indicators_skips_short_history_and_rejects_unknown(cache_store):
+    service = IndicatorService(AsyncMock(), cache_store=cache_store)
+    # 200일 미만이면 MA200 은 건너뛴다 (증분 캐시도 이 길이에선 캐시를 쓰지 않는다).
+    assert service.warm_confirmed_indicators("005930", _daily_rows(100)) == 3
+    with pytest.raises(ValueError):
+        service.warm_confirmed_indicators("005930", _daily_rows(100), specs=(("macd", (12,)),))
+
+
+@pytest.mark.asyncio
+async def test_incremental_cache_key_separates_windows_with_same_last_date(cache_store):
+    """마지막 확정일이 같아도 조회 구간 길이가 다르면 캐시 항목을 공유하지 않는다."""
+    rows = _daily_rows(250)
+    service = IndicatorService(AsyncMock(), cache_store=cache_store)
+
+    long_resp = await service.get_rsi("005930", period=2, ohlcv_data=rows, exclude_today=True)
+    short_resp = await service.get_rsi("005930", period=2, ohlcv_data=rows[-60:], exclude_today=True)
+
+    assert len(long_resp.data) == 249
+    assert len(short_resp.data) == 59
+    assert short_resp.data[-1]["date"] == long_resp.data[-1]["date"]
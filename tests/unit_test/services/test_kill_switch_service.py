@@ -18,7 +18,8 @@ KST = pytz.timezone("Asia/Seoul")
 
 
 @pytest.fixture
-def cfg():
+def cfg(tmp_path):
+    # 상태 파일·delta journal 이 저장소 data/ 에 남지 않도록 tmp_path 에 둔다
     return KillSwitchConfig(
         enabled=True,
         daily_loss_threshold_won=1_000_000,
@@ -26,7 +27,7 @@ def cfg():
         max_consecutive_losses=3,
         max_consecutive_api_errors=5,
         abnormal_fill_deviation_pct=3.0,
-        state_file_path="data/test_kill_switch_state.json",
+        state_file_path=str(tmp_path / "test_kill_switch_state.json"),
     )
 
 
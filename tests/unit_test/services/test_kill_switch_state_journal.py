@@ -0,0 +1,205 @@
+"""KillSwitchStateJournal — 카운터 delta journal + snapshot 복원 / 크래시 복구.
+
+- 카운터 변경은 journal delta 로만 남고, 재시작 시 snapshot + replay 로 복원된다.
+- 트립은 반환 시점에 snapshot 에 durable 해야 한다(journal flush 없이도).
+- 크래시로 잘린 journal 마지막 줄은 무시하고 그 전까지 복원한다.
+- compaction 후 journal 은 비워지고 snapshot 의 journal_seq 가 전진한다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from config.config_loader import KillSwitchConfig
+from services.kill_switch_service import KillSwitchService
+from services.kill_switch_state_journal import KillSwitchStateJournal, apply_delta
+
+
+def _cfg(tmp_path, **overrides):
+    base = dict(
+        enabled=True,
+        max_consecutive_losses=5,
+        max_consecutive_api_errors=1_000_000,
+        daily_loss_threshold_won=10_000_000,
+        abnormal_fill_deviation_pct=99.0,
+        state_file_path=str(tmp_path / "ks_state.json"),
+    )
+    base.update(overrides)
+    return KillSwitchConfig(**base)
+
+
+def _notif():
+    svc = MagicMock()
+    svc.emit = AsyncMock()
+    return svc
+
+
+def _ks(cfg):
+    return KillSwitchService(cfg, _notif(), logging.getLogger("test_ks_journal"))
+
+
+async def test_counter_updates_are_journaled_not_snapshotted(tmp_path):
+    cfg = _cfg(tmp_path)
+    ks = _ks(cfg)
+
+    await ks.record_api_failure("timeout")
+    await ks.record_api_failure("timeout")
+    await ks.record_trade_result(-10_000, "005930", "s1")
+    await ks.flush_state()
+
+    # snapshot 은 한 번도 쓰이지 않고 journal 만 생긴다.
+    assert not (tmp_path / "ks_state.json").exists()
+    lines = (tmp_path / "ks_state.json.journal").read_bytes().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[-1])["d"] == {"consecutive_losses": 1, "daily_realized_loss_won": -10_000}
+
+
+async def test_crash_recovery_replays_journal_over_snapshot(tmp_path):
+    cfg = _cfg(tmp_path)
+    ks = _ks(cfg)
+    await ks.trip_strategy("custom_research_001", "manual")   # snapshot 1회
+    for _ in range(3):
+        await ks.record_api_failure("EGW00201")
+    await ks.record_trade_result(-20_000, "005930", "s1")
+    await ks.record_strategy_trade_result("custom_research_002", -5_000)
+    await ks.flush_state()
+    # shutdown 없이 프로세스가 죽었다고 가정 — 같은 경로로 새 인스턴스 생성.
+
+    restored = _ks(cfg)
+    assert restored._consecutive_api_errors == 3
+    assert restored._consecutive_losses == 1
+    assert restored._daily_realized_loss_won == -20_000
+    assert restored._strategy_consecutive_losses == {"custom_research_002": 1}
+    assert restored._strategy_daily_loss_won == {"custom_research_002": -5_000}
+    assert "custom_research_001" in restored._strategy_tripped
+
+    # 복원 후 seq 가 이어져야 다음 delta 가 replay 대상이 된다.
+    await restored.record_api_success()
+    await restored.flush_state()
+    assert _ks(cfg)._consecutive_api_errors == 0
+
+
+async def test_trip_is_durable_before_return_without_flush(tmp_path):
+    cfg = _cfg(tmp_path, journal_flush_interval_sec=3600)
+    ks = _ks(cfg)
+    await ks.record_api_failure("x")  # window 가 길어 아직 버퍼에만 있다
+    await ks.manual_trip("긴급", "op")
+
+    data = json.loads((tmp_path / "ks_state.json").read_text(encoding="utf-8"))
+    assert data["is_tripped"] is True
+    assert data["consecutive_api_errors"] == 1  # snapshot 이 버퍼 delta 를 포함
+    restored = _ks(cfg)
+    assert restored._is_tripped is True
+    assert restored._consecutive_api_errors == 1
+
+
+async def test_torn_journal_tail_is_ignored(tmp_path):
+    cfg = _cfg(tmp_path)
+    ks = _ks(cfg)
+    await ks.record_api_failure("a")
+    await ks.record_api_failure("b")
+    await ks.flush_state()
+    with open(tmp_path / "ks_state.json.journal", "ab") as fp:
+        fp.write(b'{"s":3,"d":{"consecutive_api_err')  # 쓰다 만 줄
+
+    restored = _ks(cfg)
+    assert restored._consecutive_api_errors == 2
+
+
+async def test_torn_tail_is_cut_so_later_deltas_survive_next_restart(tmp_path):
+    cfg = _cfg(tmp_path)
+    ks = _ks(cfg)
+    await ks.record_api_failure("a")
+    await ks.record_api_failure("b")
+    await ks.flush_state()
+    with open(tmp_path / "ks_state.json.journal", "ab") as fp:
+        fp.write(b'{"s":3,"d":{"consecutive_api_err')  # 쓰다 만 줄
+
+    recovered = _ks(cfg)
+    assert recovered._consecutive_api_errors == 2
+    await recovered.record_api_failure("c")
+    await recovered.record_api_failure("d")
+    await recovered.flush_state()
+
+    assert _ks(cfg)._consecutive_api_errors == 4
+
+
+async def test_compaction_rewrites_snapshot_and_truncates_journal(tmp_path):
+    cfg = _cfg(tmp_path, journal_compact_every=5)
+    ks = _ks(cfg)
+    for _ in range(12):
+        await ks.record_api_failure("x")
+        await ks.flush_state()
+
+    data = json.loads((tmp_path / "ks_state.json").read_text(encoding="utf-8"))
+    assert data["consecutive_api_errors"] == 10
+    assert data["journal_seq"] == 10
+    lines = (tmp_path / "ks_state.json.journal").read_bytes().splitlines()
+    assert len(lines) == 2
+    assert _ks(cfg)._consecutive_api_errors == 12
+
+
+async def test_legacy_snapshot_without_journal_seq_loads(tmp_path):
+    (tmp_path / "ks_state.json").write_text(json.dumps({
+        "is_tripped": False,
+        "consecutive_api_errors": 4,
+    }), encoding="utf-8")
+    ks = _ks(_cfg(tmp_path))
+    assert ks._consecutive_api_errors == 4
+    await ks.record_api_failure("x")
+    await ks.flush_state()
+    assert _ks(_cfg(tmp_path))._consecutive_api_errors == 5
+
+
+def test_apply_delta_merges_mapping_fields_and_deletes_none():
+    state = {"a": 1, "m": {"x": 1, "y": 2}}
+    apply_delta(state, {"a": 3, "m": {"x": None, "z": 5}, "n": {"k": 1}})
+    assert state == {"a": 3, "m": {"y": 2, "z": 5}, "n": {"k": 1}}
+
+
+def test_append_outside_event_loop_writes_immediately(tmp_path):
+    journal = KillSwitchStateJournal(tmp_path / "s.json", dict)
+    journal.append({"consecutive_api_errors": 1})
+    assert journal.pending_count == 0
+    assert (tmp_path / "s.json.journal").read_bytes().count(b"\n") == 1
+
+
+@pytest.mark.slow
+async def test_benchmark_orders_per_second_through_kill_switch(tmp_path):
+    """주문 응답 1건 = record_api_failure 또는 record_api_success 1회.
+
+    journal 경로(버퍼 + 배치 fsync)와 기존 방식(호출마다 snapshot fsync)의
+    초당 처리량을 비교한다.
+    """
+    count = 400
+
+    journal_ks = _ks(_cfg(tmp_path / "journal"))
+    start = time.perf_counter()
+    for i in range(count):
+        if i % 2:
+            await journal_ks.record_api_success()
+        else:
+            await journal_ks.record_api_failure("EGW00201")
+    await journal_ks.flush_state()
+    journal_elapsed = time.perf_counter() - start
+
+    legacy_ks = _ks(_cfg(tmp_path / "legacy"))
+    legacy_ks._journal_state = lambda _delta: legacy_ks._save_state()
+    start = time.perf_counter()
+    for i in range(count):
+        if i % 2:
+            await legacy_ks.record_api_success()
+        else:
+            await legacy_ks.record_api_failure("EGW00201")
+    legacy_elapsed = time.perf_counter() - start
+
+    journal_ops = count / journal_elapsed
+    legacy_ops = count / legacy_elapsed
+    print(f"\n[KillSwitch orders/sec (N={count})]")
+    print(f"  journal : {journal_ops:,.0f} ops/s ({journal_elapsed:.4f}s)")
+    print(f"  snapshot: {legacy_ops:,.0f} ops/s ({legacy_elapsed:.4f}s)")
+    assert journal_ops > legacy_ops
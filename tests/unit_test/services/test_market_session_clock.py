@@ -0,0 +1,194 @@
+"""MarketSessionClock 단위 테스트 — 세션 단계 계산, 휴장·개장 지연일, 전환 스트림, 달력 서비스 연동."""
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytz
+import pytest
+
+from core.market_clock import MarketClock
+from repositories.market_calendar_repository import MarketCalendarRepository
+from services.market_calendar_service import MarketCalendarService
+from services.market_session_clock import MarketSessionClock, MarketSessionPhase as P
+
+KST = pytz.timezone("Asia/Seoul")
+
+
+def _kst(y, m, d, hh, mm=0, ss=0):
+    return KST.localize(datetime(y, m, d, hh, mm, ss))
+
+
+class _FakeCalendar:
+    def __init__(self, holidays=(), latest_trading_date=None):
+        self.holidays = set(holidays)
+        self.latest_trading_date = latest_trading_date
+        self.is_business_day = AsyncMock(side_effect=lambda d: d not in self.holidays)
+        self.get_latest_trading_date = AsyncMock(side_effect=lambda: self.latest_trading_date)
+        self.preload_calendar = AsyncMock()
+
+    def get_cached_business_day(self, date_str):
+        if datetime.strptime(date_str, "%Y%m%d").weekday() >= 5:
+            return False
+        return date_str not in self.holidays
+
+
+class _FakeTime:
+    """가상 시계. sleep 은 시각을 앞당기고 이벤트 루프에 한 번 양보한다."""
+
+    def __init__(self, now):
+        self.now = now
+
+    async def sleep(self, sec):
+        loop = asyncio.get_running_loop()
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+        self.now = self.now + timedelta(seconds=sec)
+
+
+def _clock(calendar, fake_time=None, **kwargs):
+    return MarketSessionClock(
+        calendar, MarketClock(logger=MagicMock()), logger=MagicMock(),
+        now_fn=(lambda: fake_time.now) if fake_time else None,
+        sleep=fake_time.sleep if fake_time else None, **kwargs,
+    )
+
+
+@pytest.mark.parametrize("hhmm, phase, is_open, is_nxt_open", [
+    ((7, 59), P.CLOSED, False, False),
+    ((8, 0), P.NXT_PRE_MARKET, False, True),
+    ((8, 35), P.PRE_OPEN, False, True),
+    ((8, 50), P.OPENING_AUCTION, False, True),
+    ((9, 0), P.OPEN, True, True),
+    ((15, 25), P.CLOSING_AUCTION, True, True),
+    ((15, 40), P.AFTER_HOURS, True, True),   # 15:40 까지는 기존 is_market_open_now 와 동일하게 열림
+    ((15, 41), P.AFTER_HOURS, False, True),
+    ((18, 30), P.NXT_AFTER_MARKET, False, True),
+    ((20, 1), P.CLOSED, False, False),
+])
+async def test_phase_and_flags_match_existing_market_hours(hhmm, phase, is_open, is_nxt_open):
+    clock = _clock(_FakeCalendar())
+    now = _kst(2026, 3, 4, *hhmm)
+
+    assert await clock.refresh(now) is phase
+    assert (clock.is_open, clock.is_nxt_open) == (is_open, is_nxt_open)
+    assert clock.is_open == clock._market_clock.is_market_operating_hours(now)
+
+
+async def test_weekday_holiday_stays_closed_and_next_change_is_midnight():
+    calendar = _FakeCalendar(holidays={"20260301", "20260302"})  # 대체공휴일(월)
+    clock = _clock(calendar, max_sleep_sec=86400)
+    now = _kst(2026, 3, 2, 10, 0)
+
+    assert await clock.refresh(now) is P.CLOSED
+    assert clock.is_business_day is False and clock.is_open is False
+    calendar.get_latest_trading_date.assert_awaited_once()  # 개장 시각 이후 한 번만 재확인
+    await clock.refresh(_kst(2026, 3, 2, 11, 0))
+    calendar.get_latest_trading_date.assert_awaited_once()
+    assert clock.seconds_until_next_change(now) == pytest.approx(14 * 3600, abs=0.01)
+
+
+async def test_holiday_api_false_negative_is_confirmed_by_latest_trading_date():
+    calendar = _FakeCalendar(holidays={"20260304"}, latest_trading_date="20260304")
+    clock = _clock(calendar)
+
+    assert await clock.refresh(_kst(2026, 3, 4, 8, 30)) is P.CLOSED
+    calendar.get_latest_trading_date.assert_not_awaited()
+    assert await clock.refresh(_kst(2026, 3, 4, 9, 5)) is P.OPEN
+    assert clock.is_open is True and clock.is_business_day is True
+
+
+async def test_first_trading_day_of_year_opens_an_hour_late():
+    clock = _clock(_FakeCalendar(holidays={"20260101"}))
+
+    assert await clock.refresh(_kst(2026, 1, 2, 8, 50)) is P.NXT_PRE_MARKET
+    assert await clock.refresh(_kst(2026, 1, 2, 9, 45)) is P.OPENING_AUCTION
+    assert clock.is_open is False
+    assert await clock.refresh(_kst(2026, 1, 2, 10, 0)) is P.OPEN
+    assert clock.snapshot()["open_delay_min"] == 60
+    assert await clock.refresh(_kst(2026, 1, 2, 15, 25)) is P.CLOSING_AUCTION  # 마감은 그대로
+
+
+async def test_day_override_shifts_open_and_close():
+    """수능일: 개장·마감 1시간 지연."""
+    clock = _clock(_FakeCalendar(), day_overrides={"20261119": {"open_delay_min": 60, "close_delay_min": 60}})
+
+    assert await clock.refresh(_kst(2026, 11, 19, 9, 30)) is P.PRE_OPEN
+    assert await clock.refresh(_kst(2026, 11, 19, 16, 25)) is P.CLOSING_AUCTION
+    assert clock.is_open is True
+    await clock.refresh(_kst(2026, 11, 19, 16, 41))
+    assert (clock.phase, clock.is_open, clock.is_nxt_open) == (P.AFTER_HOURS, False, True)
+
+
+async def test_timer_loop_publishes_each_transition_once():
+    fake_time = _FakeTime(_kst(2026, 3, 4, 7, 0))
+    clock = _clock(_FakeCalendar(), fake_time)
+    queue = clock.subscribe()
+
+    await clock.start()
+    assert clock.is_live and clock.phase is P.CLOSED and queue.empty()  # 첫 갱신은 전환으로 보지 않는다
+    transitions = []
+    while not transitions or transitions[-1].current is not P.CLOSED:
+        transitions.append(await asyncio.wait_for(queue.get(), timeout=5))
+    await clock.stop()
+
+    assert [t.current for t in transitions] == [
+        P.NXT_PRE_MARKET, P.PRE_OPEN, P.OPENING_AUCTION, P.OPEN, P.CLOSING_AUCTION,
+        P.AFTER_HOURS, P.AFTER_HOURS, P.NXT_AFTER_MARKET, P.CLOSED,
+    ]
+    assert [t.at.strftime("%H:%M") for t in transitions] == [
+        "08:00", "08:30", "08:40", "09:00", "15:20", "15:30", "15:40", "18:00", "20:00",
+    ]
+    assert transitions[6].is_open is False and transitions[5].is_open is True
+    assert not clock.is_live
+    clock._calendar.preload_calendar.assert_awaited_once()
+
+
+async def test_calendar_failure_marks_clock_unhealthy():
+    calendar = _FakeCalendar()
+    calendar.is_business_day.side_effect = RuntimeError("chk-holiday 500")
+    clock = _clock(calendar)
+    clock._task = MagicMock(done=MagicMock(return_value=False))
+
+    await clock.refresh(_kst(2026, 3, 4, 10, 0))
+
+    assert clock.is_live is False
+
+
+async def test_calendar_service_reads_live_session_clock_without_api():
+    market_clock = MagicMock()
+    service = MarketCalendarService(market_clock, MagicMock())
+    broker = MagicMock(check_holiday=AsyncMock())
+    service.set_broker(broker)
+    session_clock = MagicMock(spec=MarketSessionClock, is_live=True, is_open=False, is_nxt_open=True)
+    service.attach_session_clock(session_clock)
+
+    assert await service.is_market_open_now() is False
+    assert await service.is_market_open_now(include_nxt=True) is True
+    broker.check_holiday.assert_not_awaited()
+    market_clock.is_market_operating_hours.assert_not_called()
+
+
+async def test_calendar_service_persists_synced_months_and_skips_api_on_restart(tmp_path):
+    from common.types import ResCommonResponse
+
+    path = str(tmp_path / "krx.json")
+    market_clock = MagicMock()
+    market_clock.get_current_kst_time.return_value = datetime(2026, 3, 4, 8, 0)
+    resp = ResCommonResponse(rt_cd="0", msg1="OK", data={"output": [
+        {"bass_dt": "20260302", "bzdy_yn": "N", "tr_day_yn": "N"},
+        {"bass_dt": "20260304", "bzdy_yn": "Y", "tr_day_yn": "Y"},
+    ]})
+    first = MarketCalendarService(market_clock, MagicMock(), calendar_repository=MarketCalendarRepository(path))
+    first.set_broker(MagicMock(check_holiday=AsyncMock(return_value=resp)))
+    await first.preload_calendar()
+
+    restarted = MarketCalendarService(market_clock, MagicMock(), calendar_repository=MarketCalendarRepository(path))
+    broker = MagicMock(check_holiday=AsyncMock(return_value=resp))
+    restarted.set_broker(broker)
+    restarted.load_persisted_calendar()
+
+    assert await restarted.is_business_day("20260302") is False
+    assert await restarted.is_business_day("20260304") is True
+    assert restarted.get_cached_business_day("20260307") is False  # 토요일
+    broker.check_holiday.assert_not_awaited()
@@ -0,0 +1,191 @@
+"""NotificationDispatcher 단위 테스트 — digest 요약, 채널 속도 제한·동시성, 지연/폐기 지표, 처리량."""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.notification_dispatcher import NotificationDispatcher
+from services.notification_service import NotificationCategory, NotificationLevel, NotificationService
+from task.background.always_on.notification_queue_task import NotificationQueueTask
+
+
+class _FakeClock:
+    """가상 시계. sleep 은 시각만 앞당기고 곧바로 돌아온다."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, sec):
+        target = self.now + sec
+        # asyncio.sleep 은 fast_sleep 픽스처가 바꿔치기하므로 직접 한 번 양보한다
+        loop = asyncio.get_running_loop()
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+        self.now = max(self.now, target)
+
+
+class _FakeTelegram:
+    """호출마다 가상 시계 기준 전송 시각을 기록하는 가짜 외부 핸들러."""
+
+    def __init__(self, clock, latency_sec=0.0):
+        self.clock = clock
+        self.latency_sec = latency_sec
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, event):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.sent.append((self.clock.now, event))
+        if self.latency_sec:
+            await self.clock.sleep(self.latency_sec)
+        self.active -= 1
+
+
+@pytest.fixture
+def ns():
+    clock = MagicMock()
+    clock.get_current_kst_time.return_value = datetime(2026, 1, 5, 9, 0, 5)
+    return NotificationService(market_clock=clock)
+
+
+def _dispatcher(ns, clock, **overrides):
+    cfg = dict(batch_max=50, coalesce_window_sec=0, digest_min_events=4, digest_max_lines=15,
+               handler_concurrency=2, rate_per_sec=1.0, burst=3)
+    cfg.update(overrides)
+    return NotificationDispatcher(ns, dispatch_config=SimpleNamespace(**cfg), logger=MagicMock(),
+                                  sleep=clock.sleep, monotonic=clock.monotonic)
+
+
+async def _emit(ns, category, level, title, n=1, **metadata):
+    return [await ns.emit(category, level, f"{title}{i}", f"본문 {i}", metadata=dict(metadata)) for i in range(n)]
+
+
+async def test_coalesce_digests_same_category_and_keeps_order_of_others(ns):
+    dispatcher = _dispatcher(ns, _FakeClock(), digest_max_lines=3)
+    system = await _emit(ns, NotificationCategory.SYSTEM, NotificationLevel.ERROR, "sys", n=1)
+    signals = await _emit(ns, NotificationCategory.STRATEGY, NotificationLevel.WARNING, "signal", n=5)
+    critical = await _emit(ns, NotificationCategory.STRATEGY, NotificationLevel.CRITICAL, "kill", n=1)
+    report = await _emit(ns, NotificationCategory.STRATEGY, NotificationLevel.WARNING, "report", n=2,
+                         telegram_channel="report")
+
+    messages = dispatcher.coalesce(system + signals[:3] + critical + signals[3:] + report)
+
+    assert [m.title for m in messages] == ["sys0", "signal0 외 4건", "kill0", "report0", "report1"]
+    digest = messages[1]
+    assert digest.metadata["digest_count"] == 5
+    assert digest.metadata["digest_event_ids"] == [e.id for e in signals]
+    assert digest.level == NotificationLevel.WARNING
+    assert digest.message.splitlines()[-1] == "… 외 2건"
+    assert digest.message.splitlines()[0] == "• 09:00:05 signal0 — 본문 0"
+
+
+async def test_channel_token_bucket_shapes_burst_to_rate(ns):
+    clock = _FakeClock()
+    handler = _FakeTelegram(clock)
+    ns.register_external_handler(handler)
+    dispatcher = _dispatcher(ns, clock, handler_concurrency=1, digest_min_events=100)
+    events = await _emit(ns, NotificationCategory.SYSTEM, NotificationLevel.ERROR, "e", n=6)
+
+    await dispatcher.dispatch(events)
+
+    send_times = [t for t, _ in handler.sent]
+    assert send_times == pytest.approx([0.0, 0.0, 0.0, 1.0, 2.0, 3.0])  # burst 3 후 초당 1건
+    channel = dispatcher.get_metrics()["channels"]["_FakeTelegram"]
+    assert channel["sent"] == 6 and channel["throttled"] == 3
+
+
+async def test_handlers_fan_out_concurrently_with_per_handler_bound(ns):
+    clock = _FakeClock()
+    slow, fast = _FakeTelegram(clock, latency_sec=0.5), _FakeTelegram(clock)
+    ns.register_external_handler(slow)
+    ns.register_external_handler(fast)
+    dispatcher = _dispatcher(ns, clock, handler_concurrency=2, rate_per_sec=100.0, burst=100,
+                             digest_min_events=100)
+    events = await _emit(ns, NotificationCategory.TRADE, NotificationLevel.WARNING, "fill", n=6)
+
+    await dispatcher.dispatch(events)
+
+    assert len(slow.sent) == len(fast.sent) == 6
+    assert slow.max_active == 2
+
+
+async def test_handler_error_is_counted_and_isolated(ns):
+    clock = _FakeClock()
+    ok = _FakeTelegram(clock)
+
+    async def broken(event):
+        raise RuntimeError("telegram 502")
+
+    ns.register_external_handler(broken)
+    ns.register_external_handler(ok)
+    dispatcher = _dispatcher(ns, clock)
+
+    await dispatcher.dispatch(await _emit(ns, NotificationCategory.SYSTEM, NotificationLevel.ERROR, "e", n=2))
+
+    assert len(ok.sent) == 2
+    assert dispatcher.get_metrics()["channels"]["test_handler_error_is_counted_and_isolated.<locals>.broken"]["errors"] == 2
+
+
+async def test_metrics_report_queue_latency_and_overflow_drops(ns, monkeypatch):
+    ns.register_external_handler(_FakeTelegram(_FakeClock()))
+    monkeypatch.setattr(ns, "_external_handler_queue", asyncio.Queue(maxsize=3))
+    for i in range(5):
+        await ns.emit(NotificationCategory.SYSTEM, NotificationLevel.ERROR, f"e{i}", "m")
+    queue = ns.external_handler_queue
+    batch = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert set(ns._ext_enqueued_at) == {e.id for e in batch}  # 폐기된 이벤트의 적재 시각은 남지 않는다
+    ns._ext_enqueued_at = {e.id: t for e, t in zip(batch, (11.0, 11.5, 12.0))}
+
+    clock = _FakeClock()
+    clock.now = 13.0
+    dispatcher = _dispatcher(ns, clock)
+    await dispatcher.dispatch(batch)
+
+    metrics = dispatcher.get_metrics()
+    assert [e.title for e in batch] == ["e2", "e3", "e4"]  # 가장 오래된 2건 폐기
+    assert metrics["dropped"] == 2 and metrics["queue_capacity"] == 3
+    assert metrics["queue_latency_ms"] == {"p50": 1500.0, "p95": 2000.0, "max": 2000.0, "samples": 3}
+    assert ns._ext_enqueued_at == {}
+
+
+async def test_throughput_opening_burst_against_fake_handler(ns):
+    """장 시작 burst 200건(시그널·체결·데이터 품질·긴급): 기존 1건/초 직렬 drain 대비 전달 소요 비교."""
+    clock = _FakeClock()
+    handler = _FakeTelegram(clock, latency_sec=0.2)  # Telegram sendMessage 왕복 ~200ms 가정
+    ns.register_external_handler(handler)
+    dispatcher = _dispatcher(ns, clock)
+    task = NotificationQueueTask(ns, logger=MagicMock(), dispatcher=dispatcher)
+
+    emitted = []
+    emitted += await _emit(ns, NotificationCategory.STRATEGY, NotificationLevel.WARNING, "signal", n=110)
+    emitted += await _emit(ns, NotificationCategory.TRADE, NotificationLevel.WARNING, "fill", n=60)
+    emitted += await _emit(ns, NotificationCategory.SYSTEM, NotificationLevel.ERROR, "dq", n=28)
+    emitted += await _emit(ns, NotificationCategory.SYSTEM, NotificationLevel.CRITICAL, "kill", n=2)
+
+    await task.start()
+    await asyncio.wait_for(ns.external_handler_queue.join(), timeout=5.0)
+    await task.stop()
+
+    covered = []
+    for _, message in handler.sent:
+        covered += message.metadata.get("digest_event_ids", [message.id])
+    assert sorted(covered) == sorted(e.id for e in emitted)  # 유실 없이 모두 전달 (digest 포함)
+    elapsed = clock.now
+    legacy_sec = len(emitted) * (1.0 + 0.2)  # 직렬 전송 + poll_interval 1초
+    metrics = task.get_progress()["dispatch"]
+    print(
+        f"\n[notification burst {len(emitted)} events] messages={len(handler.sent)} "
+        f"virtual={elapsed:.1f}s legacy~{legacy_sec:.0f}s batches={metrics['batches']} "
+        f"digests={metrics['digests']} throttled={metrics['channels']['_FakeTelegram']['throttled']}"
+    )
+    assert metrics["dropped"] == 0 and metrics["events"] == len(emitted)
+    assert len(handler.sent) <= 20
+    assert elapsed * 10 < legacy_sec
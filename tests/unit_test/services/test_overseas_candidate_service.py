@@ -109,3 +109,171 @@ async def test_passes_overseas_exchange_to_ohlcv(svc):
     # 일봉 조회가 해외 거래소 인자로 위임되는지 (Phase 1-1 어댑터 경유)
     _, kwargs = svc.sqs.get_recent_daily_ohlcv.await_args
     assert kwargs.get("exchange") == OverseasExchange.NASD
+
+
+# ── 세션 공유·로컬 일봉 저장소·호출 예산 ─────────────────────────────
+
+import asyncio
+
+from repositories.overseas_daily_bar_repository import OverseasDailyBarRepository
+from services.overseas_candidate_service import compute_liquidity_stats
+from services.overseas_daily_bar_fetcher import OverseasDailyBarFetcher
+
+
+def _dated_bars(close, volume, dates):
+    return [{"date": d, "open": close, "high": close, "low": close, "close": close, "volume": volume}
+            for d in dates]
+
+
+# 2026-05-11(월) ~ 2026-05-15(금) 5거래일, 다음 세션은 5/18(월)
+_WEEK = ["20260511", "20260512", "20260513", "20260514", "20260515"]
+
+
+@pytest.fixture
+def stored(tmp_path, svc):
+    """로컬 일봉 저장소 + 세션 provider 를 붙인 서비스. sqs 는 세션일까지의 일봉 전체를 돌려준다."""
+    session = {"date": "20260515"}
+    tv = {"AAA": (100.0, 100000), "BBB": (50.0, 1000), "CCC": (200.0, 500000)}
+    days = _WEEK + ["20260518"]
+
+    async def _ohlcv(symbol, limit=5, end_date=None, exchange=None):
+        close, vol = tv[symbol]
+        rows = _dated_bars(close, vol, [d for d in days if d <= session["date"]])
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data=rows[-limit:])
+
+    svc.sqs.get_recent_daily_ohlcv = AsyncMock(side_effect=_ohlcv)
+    repo = OverseasDailyBarRepository(str(tmp_path / "bars.db"))
+
+    async def _session():
+        return session["date"]
+
+    service = OverseasCandidateService(
+        overseas_stock_code_repository=svc.repo,
+        stock_query_service=svc.sqs,
+        logger=MagicMock(),
+        bar_repository=repo,
+        session_date_provider=_session,
+    )
+    yield SimpleNamespace(service=service, sqs=svc.sqs, repo=repo, session=session)
+    repo.close()
+
+
+@pytest.mark.asyncio
+async def test_suite_services_share_one_computation_per_session(svc):
+    first, second = await asyncio.gather(
+        svc.service.get_candidates(OverseasExchange.NASD, min_avg_trading_value=0.0, top_n=1),
+        svc.service.get_candidates(OverseasExchange.NASD, min_avg_trading_value=1_000_000.0),
+    )
+    third = await svc.service.get_candidates(OverseasExchange.NASD, min_avg_trading_value=0.0)
+
+    assert [c["code"] for c in first] == ["CCC"]
+    assert [c["code"] for c in second] == ["CCC", "AAA"]
+    assert [c["code"] for c in third] == ["CCC", "AAA", "BBB"]
+    assert svc.sqs.get_recent_daily_ohlcv.await_count == 3  # NASD 3종목 × 1회
+
+
+@pytest.mark.asyncio
+async def test_store_fills_only_missing_days_on_next_session(stored):
+    result = await stored.service.get_candidates(OverseasExchange.NASD, min_avg_trading_value=1_000_000.0)
+    assert [c["code"] for c in result] == ["CCC", "AAA"]
+    assert stored.repo.last_dates("NASD", ["AAA", "BBB", "CCC"]) == {c: "20260515" for c in ("AAA", "BBB", "CCC")}
+    assert {call.kwargs["limit"] for call in stored.sqs.get_recent_daily_ohlcv.await_args_list} == {6}
+
+    stored.sqs.get_recent_daily_ohlcv.reset_mock()
+    await stored.service.get_candidates(OverseasExchange.NASD, top_n=1)  # 같은 세션 → 캐시
+    stored.sqs.get_recent_daily_ohlcv.assert_not_awaited()
+
+    stored.session["date"] = "20260518"
+    await stored.service.get_candidates(OverseasExchange.NASD)
+
+    calls = stored.sqs.get_recent_daily_ohlcv.await_args_list
+    assert len(calls) == 3 and {call.kwargs["limit"] for call in calls} == {2}  # 빠진 1일 + 진행 중 세션 1봉
+    frame = stored.repo.load_frame("NASD", ["AAA"], lookback=5)
+    assert list(frame["date"]) == _WEEK[1:] + ["20260518"]
+    assert stored.service.get_last_run_stats()["stored_bars"] == 3
+
+
+@pytest.mark.asyncio
+async def test_intraday_partial_bar_does_not_crowd_out_missing_closed_day(stored):
+    """장중 조회는 진행 중 세션의 미완성 봉이 최근 봉으로 오므로 빠진 마감 봉을 밀어내면 안 된다."""
+    await stored.service.get_candidates(OverseasExchange.NASD)
+    stored.session["date"] = "20260518"
+
+    async def _intraday(symbol, limit=5, end_date=None, exchange=None):
+        rows = _dated_bars(100.0, 100000, _WEEK + ["20260518", "20260519"])  # 0519 = 진행 중
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data=rows[-limit:])
+
+    stored.sqs.get_recent_daily_ohlcv = AsyncMock(side_effect=_intraday)
+    await stored.service.get_candidates(OverseasExchange.NASD)
+
+    assert stored.repo.last_dates("NASD", ["AAA", "BBB", "CCC"]) == {c: "20260518" for c in ("AAA", "BBB", "CCC")}
+    assert stored.service.get_last_run_stats()["stored_bars"] == 3
+
+
+@pytest.mark.asyncio
+async def test_fresh_symbols_skip_live_fetch(stored):
+    stored.repo.upsert_bars("NASD", "AAA", _dated_bars(100.0, 100000, _WEEK))
+    stored.repo.upsert_bars("NASD", "BBB", _dated_bars(50.0, 1000, _WEEK))
+
+    await stored.service.get_candidates(OverseasExchange.NASD)
+
+    assert [call.args[0] for call in stored.sqs.get_recent_daily_ohlcv.await_args_list] == ["CCC"]
+    assert stored.service.get_last_run_stats()["stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_live_fetch_budget_falls_back_to_stored_bars(stored):
+    stored.repo.upsert_bars("NASD", "AAA", _dated_bars(100.0, 100000, _WEEK[:-1]))
+    stored.service._fetcher = OverseasDailyBarFetcher(stored.sqs, MagicMock(), concurrency=2, max_calls=1)
+
+    result = await stored.service.get_candidates(OverseasExchange.NASD, min_avg_trading_value=0.0)
+
+    assert stored.sqs.get_recent_daily_ohlcv.await_count == 1
+    stats = stored.service.get_last_run_stats()
+    assert stats["budget_skipped"] == 2
+    # 예산 밖 AAA 는 저장된 이전 일봉으로 점수가 남는다
+    assert "AAA" in {c["code"] for c in result}
+
+
+@pytest.mark.asyncio
+async def test_fetcher_bounds_in_flight_requests():
+    active = {"now": 0, "max": 0}
+
+    async def _ohlcv(symbol, limit=5, end_date=None, exchange=None):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        loop = asyncio.get_running_loop()
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+        active["now"] -= 1
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data=_bars(10.0, 10))
+
+    sqs = MagicMock()
+    sqs.get_recent_daily_ohlcv = AsyncMock(side_effect=_ohlcv)
+    fetcher = OverseasDailyBarFetcher(sqs, MagicMock(), concurrency=3)
+
+    result = await fetcher.fetch([f"S{i}" for i in range(50)], OverseasExchange.NASD)
+
+    assert active["max"] == 3
+    assert len(result.rows) == 50 and result.calls == 50
+
+
+def test_liquidity_stats_are_vectorized_and_ignore_invalid_bars():
+    import pandas as pd
+
+    frame = pd.DataFrame({
+        "code": ["AAA", "AAA", "AAA", "BBB", "CCC"],
+        "date": ["20260513", "20260514", "20260515", "20260515", "20260515"],
+        "close": [10.0, 20.0, 0.0, 5.0, 7.0],
+        "volume": [100, 300, 500, 0, 10],
+    })
+
+    stats = compute_liquidity_stats(frame)
+
+    assert set(stats.index) == {"AAA", "CCC"}  # BBB: 유효 봉 없음
+    assert stats.loc["AAA", "avg_trading_value"] == pytest.approx((1000 + 6000) / 2)
+    assert stats.loc["AAA", "median_trading_value"] == pytest.approx(3500.0)
+    assert stats.loc["AAA", "avg_volume"] == pytest.approx(200.0)
+    assert stats.loc["AAA", "last_close"] == pytest.approx(20.0)
+    assert stats.loc["AAA", "bars"] == 2
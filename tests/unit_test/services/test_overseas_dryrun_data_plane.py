@@ -0,0 +1,126 @@
+"""해외 dry-run suite 공유 일봉·지표 스냅샷(data plane) 테스트."""
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.overseas_types import OverseasExchange
+from common.types import ErrorCode, ResCommonResponse
+from services.overseas_dryrun_data_plane import (
+    BarRequirement,
+    OverseasDryRunDataPlane,
+    compute_indicators,
+)
+from services.overseas_rsi2_dryrun_service import OverseasRSI2DryRunService
+from services.overseas_squeeze_breakout_dryrun_service import OverseasSqueezeBreakoutDryRunService
+
+
+def _bars(closes):
+    return [
+        {"date": f"2025{i + 1:04d}", "open": c, "high": c + 1, "low": c - 1, "close": c, "volume": 1000}
+        for i, c in enumerate(closes)
+    ]
+
+
+def _sqs_for(bars_by_code):
+    sqs = MagicMock()
+
+    async def _recent(code, limit, exchange):
+        rows = bars_by_code.get(code)
+        if rows is None:
+            return ResCommonResponse(rt_cd=ErrorCode.API_ERROR.value, msg1="fail", data=None)
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data=rows[-limit:])
+
+    sqs.get_recent_daily_ohlcv = AsyncMock(side_effect=_recent)
+    return sqs
+
+
+def _candidates(*codes):
+    service = MagicMock()
+    service.get_candidates = AsyncMock(return_value=[{"code": c, "name": c} for c in codes])
+    return service
+
+
+def test_compute_indicators_matches_per_service_formulas():
+    rng = random.Random(7)
+    series = [[100 + rng.uniform(-5, 5) for _ in range(n)] for n in (250, 60, 30)]
+    keys = [("sma", 200), ("sma", 5), ("rsi", 2), ("bb_width", 20, 20)]
+
+    results, positive_tail = compute_indicators(series, keys)
+
+    for closes, ind, tail in zip(series, results, positive_tail):
+        assert tail == len(closes)
+        assert ind[("sma", 5)] == pytest.approx(sum(closes[-5:]) / 5)
+        assert ind[("rsi", 2)] == pytest.approx(OverseasRSI2DryRunService._rsi(closes, 2))
+        if len(closes) >= 200:
+            assert ind[("sma", 200)] == pytest.approx(sum(closes[-200:]) / 200)
+        else:
+            assert ("sma", 200) not in ind
+        history = closes[:-1]
+        if len(history) >= 39:
+            expected = [
+                OverseasSqueezeBreakoutDryRunService._bb_width(history[i - 20:i])
+                for i in range(len(history) - 20 + 1, len(history) + 1)
+            ]
+            assert list(ind[("bb_width", 20, 20)]) == pytest.approx(expected)
+        else:
+            assert ("bb_width", 20, 20) not in ind
+
+
+def test_compute_indicators_skips_windows_with_non_positive_close():
+    closes = [100.0] * 30
+    closes[-3] = 0.0
+
+    results, positive_tail = compute_indicators([closes], [("sma", 2), ("sma", 5)])
+
+    assert positive_tail[0] == 2
+    assert results[0][("sma", 2)] == pytest.approx(100.0)
+    assert ("sma", 5) not in results[0]
+
+
+@pytest.mark.asyncio
+async def test_build_fetches_each_symbol_once_with_largest_history():
+    bars = {"AAA": _bars([100 + i for i in range(250)]), "BBB": _bars([50 + i for i in range(80)])}
+    sqs = _sqs_for(bars)
+    candidate_service = _candidates("AAA", "BBB", "MISSING")
+    plane = OverseasDryRunDataPlane(candidate_service, sqs, MagicMock())
+
+    snapshot = await plane.build(OverseasExchange.NASD, [
+        BarRequirement(history=3),
+        BarRequirement(history=60, sma_periods=(10, 20, 50)),
+        BarRequirement(history=207, sma_periods=(200, 5, 20), rsi_periods=(2,)),
+    ])
+
+    candidate_service.get_candidates.assert_awaited_once_with(OverseasExchange.NASD)
+    assert sqs.get_recent_daily_ohlcv.await_count == 3
+    assert {c.kwargs["limit"] for c in sqs.get_recent_daily_ohlcv.await_args_list} == {207}
+    assert [c["code"] for c in snapshot.candidates] == ["AAA", "BBB", "MISSING"]
+    assert snapshot.view("MISSING") is None
+    assert len(snapshot.view("AAA").rows) == 207
+    assert snapshot.view("AAA").tail(3) == tuple(bars["AAA"][-3:])
+    assert snapshot.view("AAA").indicator("sma", 20) == pytest.approx(339.5)
+    assert snapshot.view("BBB").indicator("sma", 200) is None
+
+    stats = snapshot.stats
+    assert stats.fetch_calls == 3
+    assert stats.legacy_fetch_calls == 9
+    assert stats.fetches_saved == 6
+    assert stats.fetch_failed == 1
+    # sma20 은 두 서비스가 요구하지만 한 번만 계산한다
+    assert stats.legacy_indicator_series == 2 * 7
+    assert stats.indicator_series == 2 * 6
+
+
+@pytest.mark.asyncio
+async def test_snapshot_views_are_read_only():
+    plane = OverseasDryRunDataPlane(_candidates("AAA"), _sqs_for({"AAA": _bars([10.0, 11.0, 12.0])}), MagicMock())
+
+    snapshot = await plane.build(OverseasExchange.NASD, [BarRequirement(history=3, sma_periods=(2,))])
+
+    view = snapshot.view("AAA")
+    with pytest.raises(TypeError):
+        view.rows[-1]["close"] = 0.0
+    with pytest.raises(TypeError):
+        view.indicators[("sma", 2)] = 0.0
+    with pytest.raises(TypeError):
+        snapshot.candidates[0]["code"] = "BBB"
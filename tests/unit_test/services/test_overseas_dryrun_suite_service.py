@@ -1,9 +1,19 @@
-from unittest.mock import AsyncMock
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from common.overseas_types import OverseasExchange
+from common.types import ErrorCode, ResCommonResponse
+from services.overseas_buyable_gap_up_dryrun_service import OverseasBuyableGapUpDryRunService
+from services.overseas_channel_breakout_dryrun_service import OverseasChannelBreakoutDryRunService
+from services.overseas_dryrun_data_plane import BarRequirement, OverseasDryRunDataPlane
 from services.overseas_dryrun_suite_service import OverseasDryRunSuiteService
+from services.overseas_pocket_pivot_dryrun_service import OverseasPocketPivotDryRunService
+from services.overseas_rsi2_dryrun_service import OverseasRSI2DryRunService
+from services.overseas_squeeze_breakout_dryrun_service import OverseasSqueezeBreakoutDryRunService
+from services.overseas_vbo_dryrun_service import OverseasVBODryRunService
 
 
 @pytest.mark.asyncio
@@ -32,3 +42,135 @@ async def test_scan_dry_run_continues_when_one_service_fails():
     signals = await suite.scan_dry_run(OverseasExchange.NASD)
 
     assert signals == [{"code": "AAA"}]
+
+
+def _bar(d, o, h, l, c, v):
+    return {"date": d, "open": o, "high": h, "low": l, "close": c, "volume": v}
+
+
+def _suite_bars():
+    """RSI2 눌림목·OSB 스퀴즈 돌파·VBO 돌파가 섞인 심볼별 일봉."""
+    rsi2, price = [], 80.0
+    for i in range(205):
+        price += 0.15
+        rsi2.append(_bar(f"2025{i + 1:04d}", price - 0.2, price + 0.5, price - 0.5, price, 10_000))
+    rsi2.append(_bar("20260520", 112.0, 113.0, 106.0, 108.0, 12_000))
+    rsi2.append(_bar("20260521", 108.0, 109.0, 103.0, 104.0, 13_000))
+
+    osb = []
+    for i in range(20):
+        close = 100.0 + i * 0.6
+        osb.append(_bar(f"202604{i + 1:02d}", close, 120.0, close - 1.0, close, 100_000))
+    for i in range(20):
+        close = 118.0 + (0.02 if i % 2 == 0 else -0.02)
+        osb.append(_bar(f"202605{i + 1:02d}", close, 120.0, close - 1.0, close, 100_000))
+    osb.append(_bar("20260610", 119.0, 123.0, 118.0, 122.0, 220_000))
+
+    rng = random.Random(3)
+    noise, price = [], 50.0
+    for i in range(230):
+        price = max(1.0, price * (1 + rng.uniform(-0.04, 0.045)))
+        noise.append(_bar(f"2025{i + 1:04d}", price * 0.99, price * 1.03, price * 0.97, price,
+                          rng.randint(5_000, 40_000)))
+    return {"RSI": rsi2, "OSB": osb, "NOISE": noise}
+
+
+def _suite_services(bars):
+    candidate_service = MagicMock()
+    candidate_service.get_candidates = AsyncMock(return_value=[
+        {"code": code, "name": code, "avg_trading_value": 1e8} for code in bars
+    ])
+    sqs = MagicMock()
+
+    async def _recent(code, limit, exchange):
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data=bars[code][-limit:])
+
+    sqs.get_recent_daily_ohlcv = AsyncMock(side_effect=_recent)
+    indicator = MagicMock()
+    indicator.calc_adx_sync = MagicMock(return_value={"adx": 30.0, "adx_rising": True})
+    kwargs = dict(candidate_service=candidate_service, stock_query_service=sqs, logger=MagicMock())
+    services = [
+        OverseasVBODryRunService(**kwargs),
+        OverseasPocketPivotDryRunService(**kwargs),
+        OverseasBuyableGapUpDryRunService(**kwargs),
+        OverseasChannelBreakoutDryRunService(**kwargs, indicator_service=indicator),
+        OverseasRSI2DryRunService(**kwargs),
+        OverseasSqueezeBreakoutDryRunService(**kwargs),
+    ]
+    return services, candidate_service, sqs
+
+
+@pytest.mark.asyncio
+async def test_shared_snapshot_matches_per_service_fetch_signals():
+    bars = _suite_bars()
+    legacy_services, _, legacy_sqs = _suite_services(bars)
+    legacy = await OverseasDryRunSuiteService(legacy_services).scan_dry_run(OverseasExchange.NASD)
+
+    services, candidate_service, sqs = _suite_services(bars)
+    suite = OverseasDryRunSuiteService(
+        services, data_plane=OverseasDryRunDataPlane(candidate_service, sqs, MagicMock()),
+    )
+    shared = await suite.scan_dry_run(OverseasExchange.NASD)
+
+    assert {(s.get("strategy"), s["code"]) for s in legacy} >= {
+        ("RSI2Pullback_overseas", "RSI"), ("O'NeilOSB_overseas", "OSB"),
+    }
+    assert len(shared) == len(legacy)
+    for got, want in zip(shared, legacy):
+        assert got.keys() == want.keys()
+        for key, value in want.items():
+            assert got[key] == (pytest.approx(value) if isinstance(value, float) else value)
+
+    assert legacy_sqs.get_recent_daily_ohlcv.await_count == 6 * len(bars)
+    assert sqs.get_recent_daily_ohlcv.await_count == len(bars)
+    candidate_service.get_candidates.assert_awaited_once()
+    stats = suite.get_last_run_stats()
+    assert stats["shared_snapshot"] is True
+    assert stats["fetches_saved"] == 5 * len(bars)
+    assert stats["signals"] == len(shared)
+
+
+@pytest.mark.asyncio
+async def test_scan_dry_run_runs_services_concurrently():
+    loop = asyncio.get_running_loop()
+    release = loop.create_future()
+    started = []
+
+    def _service(name):
+        async def _scan(exchange):
+            started.append(name)
+            await release
+            return [{"code": name}]
+
+        service = AsyncMock()
+        service.scan_dry_run = AsyncMock(side_effect=_scan)
+        return service
+
+    suite = OverseasDryRunSuiteService([_service("AAA"), _service("BBB")])
+    task = asyncio.ensure_future(suite.scan_dry_run(OverseasExchange.NASD))
+    for _ in range(5):
+        if len(started) == 2:
+            break
+        waiter = loop.create_future()
+        loop.call_soon(waiter.set_result, None)
+        await waiter
+
+    assert started == ["AAA", "BBB"]
+    release.set_result(None)
+    assert await task == [{"code": "AAA"}, {"code": "BBB"}]
+
+
+@pytest.mark.asyncio
+async def test_scan_dry_run_falls_back_to_per_service_fetch_when_snapshot_fails():
+    plane = MagicMock()
+    plane.build = AsyncMock(side_effect=RuntimeError("boom"))
+    service = MagicMock()
+    service.bar_requirement = MagicMock(return_value=BarRequirement(history=3))
+    service.scan_dry_run = AsyncMock(return_value=[{"code": "AAA"}])
+    suite = OverseasDryRunSuiteService([service], data_plane=plane)
+
+    signals = await suite.scan_dry_run(OverseasExchange.NASD)
+
+    assert signals == [{"code": "AAA"}]
+    service.scan_dry_run.assert_awaited_once_with(OverseasExchange.NASD)
+    assert suite.get_last_run_stats()["shared_snapshot"] is False
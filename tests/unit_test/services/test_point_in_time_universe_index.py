@@ -0,0 +1,121 @@
+"""PointInTimeUniverseIndex — build_point_in_time_snapshot 과의 parity.
+
+같은 레코드 집합에 대해 임의 날짜·시장·SPAC 조합마다 인덱스 질의 결과가
+기존 스냅샷 빌더와 완전히 같아야 한다. 증감분 스트림을 누적한 결과도 같아야 한다.
+"""
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from services.point_in_time_universe_index import PointInTimeUniverseIndex
+from services.point_in_time_universe_provider import PointInTimeUniverseProvider
+from services.point_in_time_universe_service import (
+    PointInTimeUniverseRecord,
+    build_point_in_time_snapshot,
+)
+
+_BASE = date(2018, 1, 1)
+
+
+def _day(offset: int) -> str:
+    return (_BASE + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+def _random_records(seed: int, count: int = 120) -> list[PointInTimeUniverseRecord]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        symbol = f"{rng.randrange(0, count // 2):06d}"  # 심볼 충돌로 dedupe 경로도 검증
+        listing = "" if rng.random() < 0.1 else _day(rng.randrange(-400, 2500))
+        delisted = rng.random() < 0.4
+        delisting = ""
+        if delisted:
+            delisting = _day(rng.randrange(-200, 2700))
+        records.append(
+            PointInTimeUniverseRecord(
+                symbol=symbol,
+                name=("스팩" if rng.random() < 0.1 else "종목") + str(i),
+                market=rng.choice(["KOSPI", "KOSDAQ", "KONEX"]),
+                listing_date=listing,
+                delisting_date=delisting,
+                source="delisted" if delisted else "current",
+            )
+        )
+    return records
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+@pytest.mark.parametrize("markets", [("KOSPI", "KOSDAQ"), ("KOSDAQ",), ()])
+@pytest.mark.parametrize("exclude_spac", [False, True])
+def test_snapshot_parity_with_builder(seed, markets, exclude_spac):
+    records = _random_records(seed)
+    index = PointInTimeUniverseIndex(records)
+    rng = random.Random(seed * 31)
+    for _ in range(15):
+        as_of = _day(rng.randrange(-500, 2800)).replace("-", "")
+        expected = build_point_in_time_snapshot(
+            records, as_of, markets=markets, exclude_spac=exclude_spac,
+        )
+        actual = index.snapshot(as_of, markets=markets, exclude_spac=exclude_spac)
+        assert actual == expected
+
+
+@pytest.mark.parametrize("seed", [3, 11])
+def test_streamed_deltas_accumulate_to_builder_snapshot(seed):
+    records = _random_records(seed)
+    index = PointInTimeUniverseIndex(records)
+    dates = [_day(d).replace("-", "") for d in range(-30, 2700, 90)]
+    current: set[str] = set()
+    for delta in index.iter_deltas(dates, markets=("KOSPI", "KOSDAQ"), exclude_spac=True):
+        added = {r.symbol for r in delta.added}
+        removed = {r.symbol for r in delta.removed}
+        assert not (added & removed)
+        assert removed <= current
+        current = (current - removed) | added
+        expected = build_point_in_time_snapshot(records, delta.as_of, exclude_spac=True)
+        assert current == {r.symbol for r in expected}
+
+
+def test_listing_and_delisting_day_boundaries():
+    record = PointInTimeUniverseRecord(
+        symbol="900100",
+        name="상폐예정",
+        market="KOSDAQ",
+        listing_date="2020-03-02",
+        delisting_date="2026-06-05",
+        source="delisted",
+    )
+    index = PointInTimeUniverseIndex([record])
+    assert index.snapshot("20200301") == []
+    assert index.snapshot("20200302") == [record]
+    assert index.snapshot("20260604") == [record]
+    assert index.snapshot("20260605") == []
+
+
+def test_deltas_require_ascending_dates():
+    index = PointInTimeUniverseIndex(_random_records(5, count=20))
+    with pytest.raises(ValueError):
+        list(index.iter_deltas(["20240102", "20240101"]))
+
+
+def test_invalid_as_of_raises_like_builder():
+    index = PointInTimeUniverseIndex([])
+    with pytest.raises(ValueError):
+        index.snapshot("not-a-date")
+
+
+def test_provider_queries_match_linear_scan():
+    records = _random_records(9)
+    provider = PointInTimeUniverseProvider(records)
+    for offset in range(-100, 2700, 211):
+        as_of = _day(offset).replace("-", "")
+        expected = {
+            r.symbol for r in build_point_in_time_snapshot(records, as_of, markets=())
+        }
+        assert provider.listed_codes_as_of(as_of) == expected
+        assert provider.delisted_codes_as_of(as_of) == {
+            s for s in expected if provider.record_for(s).source == "delisted"
+        }
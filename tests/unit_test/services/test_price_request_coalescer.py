@@ -0,0 +1,245 @@
+"""PriceRequestCoalescer + StockQueryService.get_current_price batch 합치기.
+
+fake 시세 서비스가 quotation_price 예산 소모(단건 1회 = 1, 복수종목 1회 = 1)를 센다.
+
+- 동시에 들어온 snapshot fallback 조회 N건은 get_multi_price 1회로 처리된다.
+- batch 응답에 없는 종목만 단건 REST 로 fallback 한다 (종목 단위 격리).
+- batch TR 실패 시 모든 요청이 단건 REST 로 fallback 한다.
+- force_fresh / allow_snapshot=False / 거래소 지정 요청은 합치지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.types import ErrorCode, Exchange, ResCommonResponse, ResStockFullInfoApiOutput
+from services.price_request_coalescer import PriceRequestCoalescer
+from services.stock_query_service import StockQueryService
+
+
+class _NoTickPriceStream:
+    """구독은 했으나 tick 미수신 — 모든 조회가 REST fallback 대상."""
+
+    def __init__(self):
+        self.backfilled: dict[str, str] = {}
+
+    def get_price_quote(self, code):
+        return None
+
+    def cache_price_snapshot(self, code, price, **kwargs):
+        self.backfilled[code] = price
+
+
+class _FakeQuotationService:
+    """MarketDataService 대역. 호출마다 quotation_price 예산 1건을 쓴다."""
+
+    def __init__(self, *, rtt_sec: float = 0.002, missing: set[str] | None = None, fail_multi: bool = False):
+        self.rtt_sec = rtt_sec
+        self.missing = missing or set()
+        self.fail_multi = fail_multi
+        self.single_calls: list[str] = []
+        self.multi_calls: list[list[str]] = []
+
+    @property
+    def budget_used(self) -> int:
+        return len(self.single_calls) + len(self.multi_calls)
+
+    async def get_current_price(self, code, exchange=Exchange.KRX, count_stats=True, caller="unknown", force_fresh=False):
+        self.single_calls.append(code)
+        await asyncio.sleep(self.rtt_sec)
+        fields = {name: "" for name in ResStockFullInfoApiOutput.model_fields}
+        fields.update({"stck_prpr": str(int(code) + 1000), "per": "12.3"})
+        output = ResStockFullInfoApiOutput.model_validate(fields)
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="정상", data={"output": output})
+
+    async def get_multi_price(self, codes):
+        self.multi_calls.append(list(codes))
+        await asyncio.sleep(self.rtt_sec)
+        if self.fail_multi:
+            return ResCommonResponse(rt_cd=ErrorCode.API_ERROR.value, msg1="EGW00201", data=None)
+        data = [
+            {"stck_shrn_iscd": c, "stck_prpr": str(int(c) + 1000), "prdy_vrss": "10", "prdy_ctrt": "0.50",
+             "prdy_vrss_sign": "2", "acml_vol": "1234", "stck_hgpr": "99999"}
+            for c in codes if c not in self.missing
+        ]
+        return ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="ok", data=data)
+
+
+def _sqs(mds, **kwargs) -> StockQueryService:
+    return StockQueryService(
+        market_data_service=mds,
+        logger=MagicMock(),
+        market_clock=MagicMock(),
+        price_stream_service=_NoTickPriceStream(),
+        **kwargs,
+    )
+
+
+def _price(resp) -> str:
+    return resp.data["output"].stck_prpr
+
+
+async def test_concurrent_fallbacks_share_one_multi_price_call():
+    mds = _FakeQuotationService()
+    sqs = _sqs(mds)
+    codes = [f"{i:06d}" for i in range(10)]
+
+    results = await asyncio.gather(*(sqs.get_current_price(c) for c in codes))
+
+    assert mds.multi_calls == [codes]
+    assert mds.single_calls == []
+    assert [_price(r) for r in results] == [str(int(c) + 1000) for c in codes]
+    assert all(r.msg1 == "multi_price" for r in results)
+    assert results[0].data["output"].stck_hgpr == "99999"
+    # REST 응답과 같이 snapshot 캐시를 backfill 한다.
+    assert set(sqs.price_stream_service.backfilled) == set(codes)
+    stats = sqs.price_coalescer_stats_snapshot()
+    assert stats["calls_saved"] == 9
+    assert sqs.price_lookup_stats_snapshot()["coalesced_hit"] == 10
+
+
+async def test_batches_split_at_thirty_codes():
+    mds = _FakeQuotationService()
+    sqs = _sqs(mds, price_coalesce_window_sec=1.0)
+    codes = [f"{i:06d}" for i in range(45)]
+
+    await asyncio.wait_for(
+        asyncio.gather(*(sqs.get_current_price(c) for c in codes[:30])), timeout=0.5,
+    )
+    assert [len(c) for c in mds.multi_calls] == [30]  # 30종목이 차면 window 를 기다리지 않는다
+
+    await asyncio.gather(*(sqs.get_current_price(c) for c in codes[30:]))
+    assert [len(c) for c in mds.multi_calls] == [30, 15]
+
+
+async def test_missing_code_falls_back_to_single_call_only_for_that_code():
+    mds = _FakeQuotationService(missing={"000003"})
+    sqs = _sqs(mds)
+    codes = [f"{i:06d}" for i in range(6)]
+
+    results = await asyncio.gather(*(sqs.get_current_price(c) for c in codes))
+
+    assert len(mds.multi_calls) == 1
+    assert mds.single_calls == ["000003"]
+    assert results[3].data["output"].per == "12.3"  # 단건 REST 전체 응답
+    assert all(r.rt_cd == ErrorCode.SUCCESS.value for r in results)
+    assert sqs.price_lookup_stats_snapshot()["coalesced_fallback"] == 1
+
+
+async def test_batch_failure_falls_back_to_single_calls():
+    mds = _FakeQuotationService(fail_multi=True)
+    sqs = _sqs(mds)
+    codes = [f"{i:06d}" for i in range(4)]
+
+    results = await asyncio.gather(*(sqs.get_current_price(c) for c in codes))
+
+    assert len(mds.multi_calls) == 1
+    assert sorted(mds.single_calls) == codes
+    assert [_price(r) for r in results] == [str(int(c) + 1000) for c in codes]
+    assert sqs.price_coalescer_stats_snapshot()["batch_failures"] == 1
+
+
+async def test_open_multi_price_circuit_skips_coalescing():
+    mds = _FakeQuotationService()
+    sqs = _sqs(mds)
+    sqs._multi_price_prefetch_disabled_until = time.time() + 60
+
+    await asyncio.gather(*(sqs.get_current_price(f"{i:06d}") for i in range(3)))
+
+    assert mds.multi_calls == []
+    assert len(mds.single_calls) == 3
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"force_fresh": True},
+    {"allow_snapshot": False},
+    {"exchange": Exchange.NXT},
+])
+async def test_full_output_requests_are_not_coalesced(kwargs):
+    mds = _FakeQuotationService()
+    sqs = _sqs(mds)
+
+    await asyncio.gather(*(sqs.get_current_price(f"{i:06d}", **kwargs) for i in range(3)))
+
+    assert mds.multi_calls == []
+    assert len(mds.single_calls) == 3
+
+
+async def test_disabled_window_keeps_single_calls():
+    mds = _FakeQuotationService()
+    sqs = _sqs(mds, price_coalesce_window_sec=0)
+
+    await asyncio.gather(*(sqs.get_current_price(f"{i:06d}") for i in range(3)))
+
+    assert mds.multi_calls == []
+    assert sqs.price_coalescer_stats_snapshot() == {}
+
+
+@pytest.mark.real_sleep
+async def test_duplicate_waiters_share_result_and_cancellation_is_isolated():
+    calls = []
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fetch(codes):
+        calls.append(list(codes))
+        started.set()
+        await release.wait()
+        return {c: {"stck_prpr": c} for c in codes}
+
+    # max_batch=2 — 두 종목이 모이는 즉시 dispatch 하므로 timer 타이밍에 의존하지 않는다.
+    coalescer = PriceRequestCoalescer(fetch, window_sec=60, max_batch=2)
+    first = asyncio.create_task(coalescer.fetch("A"))
+    second = asyncio.create_task(coalescer.fetch("A"))
+    other = asyncio.create_task(coalescer.fetch("B"))
+    await asyncio.wait_for(started.wait(), timeout=5)  # batch 진행 중
+    first.cancel()
+    release.set()
+
+    assert await second == {"stck_prpr": "A"}
+    assert await other == {"stck_prpr": "B"}
+    assert first.cancelled()
+    assert calls == [["A", "B"]]
+    stats = coalescer.stats_snapshot()
+    assert stats["deduplicated"] == 1
+    assert stats["calls_saved"] == 2
+
+
+async def test_fetch_exception_resolves_waiters_with_none():
+    async def fetch(codes):
+        raise RuntimeError("boom")
+
+    coalescer = PriceRequestCoalescer(fetch, window_sec=0.001)
+    assert await asyncio.gather(coalescer.fetch("A"), coalescer.fetch("B")) == [None, None]
+    stats = coalescer.stats_snapshot()
+    assert stats["fallbacks"] == 2
+    assert stats["calls_saved"] == 0
+
+
+@pytest.mark.slow
+@pytest.mark.real_sleep
+async def test_benchmark_budget_for_gather_chunks():
+    """10-wide gather chunk 로 60종목을 조회할 때 quotation_price 예산 소모와 추가 지연."""
+    codes = [f"{i:06d}" for i in range(60)]
+
+    async def run(window_sec):
+        mds = _FakeQuotationService(rtt_sec=0.02)
+        sqs = _sqs(mds, price_coalesce_window_sec=window_sec)
+        start = time.perf_counter()
+        for i in range(0, len(codes), 10):
+            await asyncio.gather(*(sqs.get_current_price(c) for c in codes[i:i + 10]))
+        return mds.budget_used, time.perf_counter() - start, sqs.price_coalescer_stats_snapshot()
+
+    single_budget, single_elapsed, _ = await run(0)
+    batch_budget, batch_elapsed, stats = await run(0.01)
+
+    print("\n[get_current_price budget (60 codes, gather chunk=10)]")
+    print(f"  single   : {single_budget} calls, {single_elapsed * 1000:.1f}ms")
+    print(f"  coalesced: {batch_budget} calls, {batch_elapsed * 1000:.1f}ms, "
+          f"saved={stats['calls_saved']}, added_latency avg={stats['added_latency_ms_avg']}ms "
+          f"max={stats['added_latency_ms_max']:.1f}ms")
+    assert single_budget == 60
+    assert batch_budget == 6
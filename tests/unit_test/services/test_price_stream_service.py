@@ -26,7 +26,7 @@ def test_init(mock_stock_repo, mock_logger):
     service = PriceStreamService(stock_repo=mock_stock_repo, logger=mock_logger)
     assert service._stock_repo == mock_stock_repo
     assert service._logger == mock_logger
-    assert service._latest_prices == {}
+    assert len(service.latest_prices) == 0
     assert service._last_tick_ts == {}
     assert service._last_any_tick_ts == 0.0
 
@@ -35,12 +35,12 @@ def test_on_price_tick_missing_code_or_price(price_stream_service, mock_stock_re
     """필수 필드(종목코드 또는 현재가)가 누락된 경우 조기 반환(return)되는지 검증"""
     # 종목코드 누락
     price_stream_service.on_price_tick({'주식현재가': '10000'})
-    assert price_stream_service._latest_prices == {}
+    assert len(price_stream_service.latest_prices) == 0
     mock_stock_repo.update_realtime_data.assert_not_called()
 
     # 현재가 누락
     price_stream_service.on_price_tick({'유가증권단축종목코드': '005930'})
-    assert price_stream_service._latest_prices == {}
+    assert len(price_stream_service.latest_prices) == 0
     mock_stock_repo.update_realtime_data.assert_not_called()
 
 
@@ -458,7 +458,7 @@ def test_get_stale_codes_with_no_tick_after_grace(price_stream_service):
 
 def test_clear_subscription_state_removes_cached_tracking(price_stream_service):
     """구독 해제 시 캐시/추적 상태가 정리된다."""
-    price_stream_service._latest_prices["005930"] = {"price": "70000"}
+    price_stream_service.cache_price_snapshot("005930", "70000", evaluate_favorite_alert=False)
     price_stream_service._last_tick_ts["005930"] = 100.0
     price_stream_service._subscription_requested_ts["005930"] = 50.0
 
@@ -514,7 +514,7 @@ def test_exchange_specific_tick_only_feeds_matching_sse_queue(price_stream_servi
     assert krx_queue.qsize() == 1
     assert krx_queue.get_nowait()["price"] == 70000.0
     assert un_queue.qsize() == 0
-    assert price_stream_service._latest_prices == {}
+    assert len(price_stream_service.latest_prices) == 0
     mock_stock_repo.update_realtime_data.assert_not_called()
 
 
@@ -531,7 +531,7 @@ def test_unified_tick_does_not_feed_exchange_specific_queue(price_stream_service
 
     assert un_queue.qsize() == 1
     assert krx_queue.qsize() == 0
-    assert price_stream_service._latest_prices['005930']['price'] == '70000'
+    assert price_stream_service.get_cached_price('005930')['price'] == '70000'
     mock_stock_repo.update_realtime_data.assert_called_once()
 
 
@@ -0,0 +1,214 @@
+"""
+프로그램매매 열 지향 히스토리 (services/program_trading_history.py).
+
+- 원본 dict 를 숫자 열로 적재하고, [i]/반복/SSE 배열은 기존 형태로 재구성한다.
+- downsample 은 버킷별 시가/고가/저가/종가 + 누적값의 마지막 값을 돌려주고 since 커서를 지원한다.
+- 서비스는 DB 재시작 복원 시 created_at 을 수신 시각으로 써서 같은 집계를 낸다.
+"""
+import json
+import random
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from services.program_trading_history import (
+    INITIAL_CAPACITY,
+    ProgramTradingHistory,
+    ProgramTradingSeries,
+    replay_rows,
+    stream_rows,
+)
+from services.program_trading_stream_service import ProgramTradingStreamService
+
+_T0 = 1_760_000_400.0  # 10초·60초 경계에 맞춘 기준 시각
+
+
+def _tick(code="005930", trade_time="090000", price=70000, net_amt=0, **extra):
+    return {
+        "유가증권단축종목코드": code, "주식체결시간": trade_time, "price": str(price), "rate": "1.25",
+        "change": "500", "sign": "2", "매도체결량": "10", "매도거래대금": "700000",
+        "매수2체결량": "12", "매수2거래대금": "840000", "순매수체결량": "2",
+        "순매수거래대금": str(net_amt), "매도호가잔량": "300", "매수호가잔량": "400",
+        "전체순매수호가잔량": "100", **extra,
+    }
+
+
+def test_series_round_trips_ticks_and_grows_past_capacity():
+    series = ProgramTradingSeries("005930")
+    for i in range(INITIAL_CAPACITY + 5):
+        series.append(_tick(price=70000 + i, trade_time=f"0900{i % 60:02d}"), _T0 + i)
+
+    assert len(series) == INITIAL_CAPACITY + 5
+    last = series[-1]
+    assert last["price"] == 70000 + INITIAL_CAPACITY + 4
+    assert last["주식체결시간"] == f"0900{(INITIAL_CAPACITY + 4) % 60:02d}"
+    assert (last["rate"], last["sign"], last["순매수체결량"], last["전체순매수호가잔량"]) == (1.25, "2", 2, 100)
+    assert series[0]["price"] == 70000
+    assert [row["price"] for row in series][:3] == [70000, 70001, 70002]
+    with pytest.raises(IndexError):
+        series[len(series)]
+
+    blank = ProgramTradingSeries("000660")
+    blank.append({"price": "abc", "주식체결시간": ""}, _T0)
+    assert (blank[0]["price"], blank[0]["주식체결시간"], blank[0]["sign"]) == (0, "", "")
+
+
+def test_stream_rows_match_broadcast_array_for_series_and_dict_lists():
+    series = ProgramTradingSeries("005930")
+    series.append(_tick(net_amt=5_000), _T0)
+    expected = ["005930", "090000", 70000, 1.25, 500, "2", 10, 12, 2, 5000, 300, 400]
+    assert list(stream_rows("005930", series)) == [expected]
+
+    legacy = [{"주식체결시간": "090000", "price": 70000, "sign": "2"}]
+    assert list(stream_rows("005930", legacy))[0][:3] == ["005930", "090000", 70000]
+
+
+def test_replay_rows_send_one_minute_bucket_per_row_with_last_tick_values():
+    series = ProgramTradingSeries("005930")
+    series.append(_tick(trade_time="090000", price=70000, net_amt=1), _T0)
+    series.append(_tick(trade_time="090030", price=70500, net_amt=2), _T0 + 30)
+    series.append(_tick(trade_time="090100", price=69900, net_amt=3), _T0 + 60)
+
+    rows = list(replay_rows("005930", series))
+    assert rows == [
+        ["005930", "090030", 70500, 1.25, 0, "2", 10, 12, 2, 2, 300, 400],
+        ["005930", "090100", 69900, 1.25, 0, "2", 10, 12, 2, 3, 300, 400],
+    ]
+    legacy = [{"주식체결시간": "090000", "price": 70000}, {"주식체결시간": "090001", "price": 70100}]
+    assert len(list(replay_rows("005930", legacy))) == 2
+
+
+def test_downsample_buckets_ohlc_and_last_cumulative_values():
+    series = ProgramTradingSeries("005930")
+    # 10초 버킷 0: 가격 100 → 105 → 0(미수신) → 98, 버킷 1: 110, 버킷 3(20초 공백 뒤): 0 만
+    series.append(_tick(price=100, net_amt=1), _T0 + 0.5)
+    series.append(_tick(price=105, net_amt=2), _T0 + 3)
+    series.append(_tick(price=0, net_amt=3), _T0 + 7)
+    series.append(_tick(price=98, net_amt=4), _T0 + 9.9)
+    series.append(_tick(price=110, net_amt=5), _T0 + 10)
+    series.append(_tick(price=0, net_amt=6), _T0 + 35)
+
+    out = series.downsample(10)
+    assert out["t"] == [_T0, _T0 + 10, _T0 + 30]
+    assert out["open"] == [100, 110, 0]
+    assert out["high"] == [105, 110, 0]
+    assert out["low"] == [98, 110, 0]
+    assert out["close"] == [98, 110, 0]
+    assert out["net_amt"] == [4, 5, 6]
+    assert out["count"] == [4, 1, 1]
+    assert out["next_since"] == _T0 + 30
+
+    # since 는 자기가 속한 버킷부터 — 진행 중 버킷을 다시 받아 덮어쓴다.
+    tail = series.downsample(10, since=out["next_since"] + 4)
+    assert tail["t"] == [_T0 + 30]
+    empty = series.downsample(10, since=_T0 + 1000)
+    assert empty["t"] == [] and empty["next_since"] == _T0 + 1000
+
+    minute = series.downsample(60)
+    assert minute["count"] == [6] and minute["high"] == [110] and minute["close"] == [110]
+    with pytest.raises(ValueError):
+        series.downsample(0)
+
+
+def test_downsample_matches_naive_grouping_on_random_ticks():
+    rng = random.Random(3)
+    series = ProgramTradingSeries("005930")
+    ticks = []
+    ts = _T0
+    for _ in range(5000):
+        ts += rng.choice([0.05, 0.2, 1.0, 4.0])
+        price = 0 if rng.random() < 0.05 else rng.randint(69_000, 71_000)
+        ticks.append((ts, price))
+        series.append(_tick(price=price, net_amt=int(ts)), ts)
+
+    for bucket in (1, 10, 60):
+        groups = {}
+        for ts, price in ticks:
+            groups.setdefault(int(ts // bucket) * bucket, []).append(price)
+        out = series.downsample(bucket)
+        assert out["t"] == list(groups)
+        valid = [[p for p in prices if p > 0] for prices in groups.values()]
+        assert out["high"] == [max(v) if v else 0 for v in valid]
+        assert out["low"] == [min(v) if v else 0 for v in valid]
+        assert out["open"] == [v[0] if v else 0 for v in valid]
+        assert out["close"] == [v[-1] if v else 0 for v in valid]
+        assert out["count"] == [len(prices) for prices in groups.values()]
+
+
+def test_history_mapping_compat_and_service_restore(tmp_path):
+    history = ProgramTradingHistory()
+    history["005930"] = [{"price": "100", "주식체결시간": "090000"}]
+    assert "005930" in history and len(history) == 1
+    assert history.get("000660") is None and history["005930"][-1]["price"] == 100
+
+    base_dir = str(tmp_path / "program_subscribe")
+    with patch.object(ProgramTradingStreamService, "_get_base_dir", return_value=base_dir):
+        first = ProgramTradingStreamService(logger=MagicMock())
+        for i in range(3):
+            first.on_data_received(_tick(price=70000 + i, net_amt=i))
+        live = first.get_history_series("005930", 60)
+        first.flush_write_buffer_sync()
+        first._conn.close()
+
+        restored = ProgramTradingStreamService(logger=MagicMock())
+        assert restored.get_history_series("005930", 60) == live
+        assert restored.get_history_series("000660", 60) is None
+        assert restored.get_history_data()["005930"][-1]["순매수거래대금"] == 2
+        restored._conn.close()
+
+
+@pytest.mark.slow
+def test_benchmark_memory_and_serialization_synthetic_day():
+    """구독 5종목 × 6.5시간 × 초당 약 1틱 (약 12만 틱): 원본 dict 보관 vs 열 보관, 전체 replay vs 다운샘플."""
+    rng = random.Random(11)
+    codes = [f"{i:06d}" for i in range(5)]
+    ticks_per_code = int(6.5 * 3600)
+
+    legacy: dict = {}
+    columnar = ProgramTradingHistory()
+    start = time.perf_counter()
+    for code in codes:
+        price = rng.randint(10_000, 300_000)
+        for i in range(ticks_per_code):
+            price += rng.randint(-50, 50)
+            tick = _tick(code=code, trade_time=f"{9 + i // 3600:02d}{i // 60 % 60:02d}{i % 60:02d}",
+                         price=price, net_amt=rng.randint(-10**9, 10**9))
+            legacy.setdefault(code, []).append(tick)
+            columnar.append(code, tick, _T0 + i)
+    build_s = time.perf_counter() - start
+
+    def _deep_size(ticks_by_code):
+        total = sys.getsizeof(ticks_by_code)
+        for ticks in ticks_by_code.values():
+            total += sys.getsizeof(ticks)
+            for tick in ticks:
+                # 키 문자열은 틱 사이에 공유되므로 dict 본체와 값만 센다.
+                total += sys.getsizeof(tick) + sum(sys.getsizeof(v) for v in tick.values())
+        return total
+
+    legacy_mb = _deep_size(legacy) / 2**20
+    columnar_mb = columnar.memory_bytes() / 2**20
+
+    code = codes[0]
+    start = time.perf_counter()
+    replay_bytes = sum(len(json.dumps(row, ensure_ascii=False)) for row in stream_rows(code, columnar[code]))
+    replay_ms = (time.perf_counter() - start) * 1000
+
+    timings = {}
+    for bucket in (1, 10, 60):
+        start = time.perf_counter()
+        body = json.dumps(columnar[code].downsample(bucket))
+        timings[bucket] = ((time.perf_counter() - start) * 1000, len(body))
+
+    print(
+        f"\n[program trading day {columnar.tick_count()} ticks, build {build_s:.1f}s] "
+        f"memory dict={legacy_mb:.0f}MiB columns={columnar_mb:.1f}MiB | "
+        f"1 code replay={replay_ms:.0f}ms/{replay_bytes / 1024:.0f}KiB | "
+        + " ".join(f"{b}s={ms:.1f}ms/{size / 1024:.0f}KiB" for b, (ms, size) in timings.items())
+    )
+    assert columnar_mb * 5 < legacy_mb
+    assert timings[10][1] * 5 < replay_bytes
+    assert np.all(np.diff(columnar[code].column("ts")) > 0)
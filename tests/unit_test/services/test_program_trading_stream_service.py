@@ -80,7 +80,9 @@ async def test_on_data_received_stores_and_broadcasts(manager):
 
     # 1. 메모리 저장 확인
     assert "005930" in manager._pt_history
-    assert manager._pt_history["005930"][0] == test_data
+    stored = manager._pt_history["005930"][0]
+    assert stored["유가증권단축종목코드"] == "005930"
+    assert stored["price"] == 100
 
     # 2. 버퍼에 적재 확인
     assert len(manager._write_buffer) == 1
@@ -123,6 +123,14 @@ def test_flush_to_file_creates_directory(tmp_path):
     assert os.path.exists(os.path.join(nested, "20260513.jsonl"))
 
 
+def test_record_counts_adds_funnel_totals():
+    svc = RejectionDistributionService()
+    svc.record("StrategyA", "low_volume", date="20260513")
+    svc.record_counts("StrategyA", {"low_volume": 4, "over_extended": 2, "": 9}, date="20260513")
+
+    assert svc.get_distribution("StrategyA", "20260513") == {"low_volume": 5, "over_extended": 2}
+
+
 # ── attach_to_strategy_logger ─────────────────────────────────────────────
 
 
@@ -178,3 +186,21 @@ def test_attach_idempotent():
 
     for h in handlers:
         strategy_logger.removeHandler(h)
+
+
+def test_attach_skips_samples_already_counted_by_funnel():
+    svc = RejectionDistributionService()
+    svc.attach_to_strategy_logger()
+    today = datetime.now().strftime("%Y%m%d")
+
+    logger = logging.getLogger("strategy.TestFunnelCounted")
+    logger.setLevel(logging.DEBUG)
+    logger.info({"event": "entry_rejected", "code": "005930", "reason": "low_volume", "funnel_counted": True})
+
+    assert svc.get_distribution("TestFunnelCounted", today) == {}
+
+    strategy_logger = logging.getLogger("strategy")
+    from services.rejection_distribution_service import _StrategyRejectionHandler
+    for h in list(strategy_logger.handlers):
+        if isinstance(h, _StrategyRejectionHandler) and h._service is svc:
+            strategy_logger.removeHandler(h)
@@ -0,0 +1,104 @@
+import pytest
+
+from repositories.latest_price_table import LatestPriceTable
+from services.rest_price_poller import RestPollConfig, RestPricePoller, build_rest_price_poller
+
+
+def _poller(requests, table=None, fetch=None, **config):
+    table = table if table is not None else LatestPriceTable()
+    return RestPricePoller(
+        fetch,
+        table.read,
+        lambda: requests,
+        config=RestPollConfig(**config),
+        clock=lambda: 0.0,
+    )
+
+
+def test_interval_shrinks_with_trigger_proximity_volatility_and_holding():
+    table = LatestPriceTable()
+    table.write("NEAR", 10000.0, high=10000.0, low=10000.0, open=10000.0, received_at=1.0)
+    table.write("WILD", 10000.0, high=10500.0, low=9500.0, open=10000.0, received_at=1.0)
+    poller = _poller({}, table)
+
+    assert poller.interval_for("IDLE", 2) == 30.0
+    assert poller.interval_for("NEAR", 2, [10000.0], table.read("NEAR")) == 2.0
+    # 트리거까지 1.5% (band 3% 의 절반) → 2~30초를 로그 스케일로 절반 보간
+    assert poller.interval_for("NEAR", 2, [10150.0], table.read("NEAR")) == pytest.approx(
+        30.0 * (2.0 / 30.0) ** (1.0 - 1.5 / 3.0)
+    )
+    # 변동폭 10% (cap) → volatility_weight 0.5 만큼만 단축
+    assert poller.interval_for("WILD", 2, [], table.read("WILD")) == pytest.approx(30.0 * (2.0 / 30.0) ** 0.5)
+    assert poller.interval_for("HOLD", 1) == 3.0
+
+
+def test_plan_sweep_batches_overdue_codes_and_tops_up_last_batch():
+    table = LatestPriceTable()
+    for i in range(35):
+        table.write(f"D{i:02d}", 1000.0, received_at=100.0 - i)  # 30초 이상 지난 종목
+    table.write("HALF", 1000.0, received_at=115.0)  # 주기의 50% 경과 → 빈 자리 채움
+    table.write("NEW", 1000.0, received_at=129.0)
+    requests = {code: {"priority": 2} for code in table.codes()}
+    poller = _poller(requests, table)
+
+    batches = poller.plan_sweep(now=130.0)
+
+    assert [len(b) for b in batches] == [30, 6]
+    assert batches[0][0] == "D34"  # 가장 오래된 종목부터
+    assert batches[1][-1] == "HALF"
+    assert "NEW" not in batches[1]
+    assert poller.max_age_for("NEW") == 32.0
+    assert poller.max_age_for("UNKNOWN") is None
+
+    poller.clear_intervals()  # 장 마감·일시중지로 sweep 이 멈추면 태스크가 비운다
+    assert poller.max_age_for("NEW") is None
+
+
+def test_budget_limits_calls_per_sweep_and_refills():
+    requests = {f"{i:03d}": {"priority": 2} for i in range(90)}
+    poller = _poller(requests, max_calls_per_sec=1.0, burst_calls=2.0)
+
+    assert len(poller.plan_sweep(now=0.0)) == 2
+    assert poller.get_stats()["budget_skipped"] == 1
+    assert poller.plan_sweep(now=0.5) == []  # 토큰 1개 미만
+    assert len(poller.plan_sweep(now=1.0)) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_sweep_publishes_and_retries_failed_batch_after_min_interval():
+    table = LatestPriceTable()
+    fail = {"on": True}
+
+    async def fetch(codes):
+        if fail["on"]:
+            return None
+        for code in codes:
+            table.write(code, 1000.0, received_at=now["t"], quality_reason="rest_poll")
+        return list(codes)
+
+    now = {"t": 100.0}
+    poller = _poller({"A": {"priority": 2}, "B": {"priority": 1}}, table, fetch)
+
+    assert await poller.run_sweep(now=100.0) == 0
+    assert poller.plan_sweep(now=101.0) == []  # 실패 후 min_interval(2초) 대기
+    fail["on"] = False
+    now["t"] = 102.0
+    assert await poller.run_sweep(now=102.0) == 2
+
+    table.write("A", 1000.0, received_at=105.0)  # WebSocket·REST 무관 최근 수신이면 due 아님
+    assert poller.plan_sweep(now=105.0) == [["B"]]  # 보유 종목은 3초 주기
+    stats = poller.get_stats()
+    assert stats["calls"] == 2
+    assert stats["failures"] == 1
+    assert stats["refreshed"] == 2
+    assert stats["staleness_p50_sec"] is not None
+
+
+def test_build_rest_price_poller_reads_config_section():
+    kwargs = dict(fetch_batch=None, quote_reader=lambda code: None, request_source=dict)
+    assert build_rest_price_poller(None, **kwargs) is None
+    assert build_rest_price_poller({"enabled": False}, **kwargs) is None
+
+    poller = build_rest_price_poller({"enabled": True, "max_interval_sec": 60, "batch_size": 50}, **kwargs)
+    assert poller.config.max_interval_sec == 60.0
+    assert poller.config.batch_size == 30
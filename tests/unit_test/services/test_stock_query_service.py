@@ -162,25 +162,29 @@ class TestDataHandlers(unittest.IsolatedAsyncioTestCase):
 
     # --- get_current_price snapshot-first 테스트 ---
 
-    def _make_fresh_snap(self, price="75000", acml_vol=1000000, acml_tr_pbmn=5000000000, age_sec=0.0):
+    def _make_fresh_snap(self, price="75000", acml_vol=1000000, acml_tr_pbmn=5000000000, age_sec=0.0, **fields):
         import time
-        return {
-            "price": price,
-            "change": "500",
-            "rate": "0.67",
-            "sign": "2",
-            "acml_vol": acml_vol,
-            "acml_tr_pbmn": acml_tr_pbmn,
-            "received_at": time.time() - age_sec,
-            "latency_sec": 0.01,
-            "quality_status": "ok",
-            "quality_reason": "ok",
-        }
+        from repositories.latest_price_table import LatestPriceTable
+        table = LatestPriceTable()
+        table.write(
+            "005930",
+            float(price),
+            change=500.0,
+            rate=0.67,
+            sign="2",
+            acml_vol=acml_vol,
+            acml_tr_pbmn=acml_tr_pbmn,
+            received_at=time.time() - age_sec,
+            latency_sec=0.01,
+            quality_reason="ok",
+            **fields,
+        )
+        return table.read("005930")
 
     def _setup_sqs_with_pss(self, snap=None, snapshot_max_age_sec=5.0):
         from unittest.mock import MagicMock
         mock_pss = MagicMock()
-        mock_pss.get_cached_price.return_value = snap
+        mock_pss.get_price_quote.return_value = snap
         mock_pss.get_subscription_age.return_value = snapshot_max_age_sec + 1.0
         mock_pss.cache_price_snapshot = MagicMock()
         self.stockQueryService.price_stream_service = mock_pss
@@ -374,7 +378,7 @@ class TestDataHandlers(unittest.IsolatedAsyncioTestCase):
         await self.stockQueryService.get_current_price("005930", force_fresh=True)
 
         self.mock_market_data_service.get_current_price.assert_awaited_once()
-        mock_pss.get_cached_price.assert_not_called()
+        mock_pss.get_price_quote.assert_not_called()
 
     async def test_get_current_price_no_pss_uses_rest(self):
         """price_stream_service=None → 기존 REST 경로 그대로 (backward compat)."""
@@ -420,6 +424,32 @@ class TestDataHandlers(unittest.IsolatedAsyncioTestCase):
             SubscriptionPriority.MEDIUM,
         )
 
+    async def test_sync_price_subscriptions_forwards_trigger_levels(self):
+        """트리거 가격은 동기화 대상 종목분만 구독 정책의 슬롯 할당기로 넘긴다."""
+        sub_svc = MagicMock()
+        sub_svc.sync_subscriptions = AsyncMock()
+        self.stockQueryService.price_subscription_service = sub_svc
+
+        await self.stockQueryService.sync_price_subscriptions(
+            ["005930"],
+            category_key="strategy_test",
+            trigger_levels={"005930": 72000, "000660": 150000},
+        )
+
+        sub_svc.set_trigger_levels.assert_called_once_with("strategy_test", {"005930": 72000})
+
+    async def test_rest_fallback_counted_per_code(self):
+        """snapshot 대체 REST 조회는 종목별로도 집계된다 (슬롯 할당기 REST 비용 신호)."""
+        self.mock_market_data_service.get_current_price.return_value = ResCommonResponse(
+            rt_cd="0", msg1="정상", data={"stck_prpr": "80000"}
+        )
+
+        await self.stockQueryService.get_current_price("005930")
+        await self.stockQueryService.get_current_price("005930")
+        await self.stockQueryService.get_current_price("000660", count_stats=False)
+
+        self.assertEqual(self.stockQueryService.rest_fallback_counts_snapshot(), {"005930": 2})
+
     async def test_get_current_price_rest_backfills_snapshot(self):
         """REST fallback 성공 시 cache_price_snapshot() 호출로 캐시 backfill."""
         snap = self._make_fresh_snap(age_sec=10.0)  # stale → REST fallback
@@ -511,8 +541,9 @@ class TestDataHandlers(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_get_current_stock_price_allow_snapshot_uses_basic_fields(self):
         """기본 가격 필드만 필요한 호출은 신선한 snapshot으로 view를 만들 수 있다."""
-        snap = self._make_fresh_snap(price="75000", acml_vol=500000, acml_tr_pbmn=3000000000)
-        snap.update({"open": 73000.0, "high": 76000.0, "low": 72000.0})
+        snap = self._make_fresh_snap(
+            price="75000", acml_vol=500000, acml_tr_pbmn=3000000000, open=73000.0, high=76000.0, low=72000.0
+        )
         self._setup_sqs_with_pss(snap=snap, snapshot_max_age_sec=5.0)
         self.mock_market_data_service.get_name_by_code.return_value = "삼성전자"
 
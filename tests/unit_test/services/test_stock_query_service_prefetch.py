@@ -11,34 +11,36 @@ from unittest.mock import MagicMock, AsyncMock
 import pytest
 
 from common.types import ErrorCode, ResCommonResponse
+from repositories.latest_price_table import LatestPriceTable
 from services.stock_query_service import StockQueryService
 
 
 class _FakePriceStream:
-    """price_stream_service 의 get_cached_price / cache_price_snapshot 만 흉내내는 fake."""
+    """price_stream_service 의 get_price_quote / cache_price_snapshot 만 흉내내는 fake."""
 
     def __init__(self, fresh: dict | None = None):
         # fresh: {code: received_at} — 이미 신선한 snapshot 보유 종목
-        self._store: dict[str, dict] = {}
+        self._table = LatestPriceTable()
         if fresh:
             for code, ts in fresh.items():
-                self._store[code] = {"price": "1", "received_at": ts}
+                self._table.write(code, 1.0, received_at=ts)
 
-    def get_cached_price(self, code):
-        return self._store.get(code)
+    def get_price_quote(self, code):
+        return self._table.read(code)
 
     def cache_price_snapshot(self, code, price, change="0", rate="0.00", sign="3",
                              volume="0", acml_tr_pbmn=None, high=None, low=None,
-                             open_price=None):
-        self._store[code] = {
-            "price": price,
-            "change": change,
-            "rate": rate,
-            "sign": sign,
-            "acml_vol": int(volume) if str(volume).isdigit() else 0,
-            "acml_tr_pbmn": int(acml_tr_pbmn) if acml_tr_pbmn and str(acml_tr_pbmn).isdigit() else 0,
-            "received_at": time.time(),
-        }
+                             open_price=None, quality_reason="rest_snapshot"):
+        self._table.write(
+            code,
+            float(price),
+            change=float(change),
+            rate=float(rate),
+            sign=sign,
+            acml_vol=int(volume) if str(volume).isdigit() else 0,
+            acml_tr_pbmn=int(acml_tr_pbmn) if acml_tr_pbmn and str(acml_tr_pbmn).isdigit() else 0,
+            quality_reason=quality_reason,
+        )
 
 
 def _multi_price_ok(codes):
@@ -75,7 +77,7 @@ async def test_prefetch_batches_in_chunks_of_30():
     assert [len(c) for c in calls] == [30, 30]
     assert backfilled == 60
     # 모든 종목이 snapshot 캐시에 backfill 됨
-    assert all(pss.get_cached_price(c) is not None for c in codes)
+    assert all(pss.get_price_quote(c) is not None for c in codes)
 
 
 @pytest.mark.asyncio
@@ -190,3 +192,50 @@ async def test_prefetch_then_lookups_hit_snapshot_no_per_code_rest():
     stats = sqs.price_lookup_stats_snapshot()
     assert stats["snapshot_hit"] == 60
     assert stats["rest_fallback"] == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_price_snapshots_marks_rest_poll_source():
+    pss = _FakePriceStream()
+    mds = MagicMock()
+    mds.get_multi_price = AsyncMock(return_value=_multi_price_ok(["005930", "000660"]))
+    sqs = _make_sqs(pss, mds)
+
+    refreshed = await sqs.refresh_price_snapshots(["005930", "000660"])
+
+    assert refreshed == ["005930", "000660"]
+    assert pss.get_price_quote("005930").quality_reason == "rest_poll"
+    stats = sqs.price_lookup_stats_snapshot()
+    assert stats["rest_poll_call"] == 1
+    assert stats["rest_poll_backfill"] == 2
+
+    mds.get_multi_price = AsyncMock(side_effect=RuntimeError("temporary API failure"))
+    assert await sqs.refresh_price_snapshots(["005930"]) is None
+    assert sqs.price_lookup_stats_snapshot()["rest_poll_failure"] == 1
+
+
+@pytest.mark.asyncio
+async def test_polled_code_snapshot_window_follows_poller_interval():
+    """폴러가 관리하는 종목은 갱신 주기(+여유) 안의 snapshot 을 REST 없이 쓴다."""
+    pss = _FakePriceStream(fresh={"005930": time.time() - 10.0})
+    mds = MagicMock()
+    mds.get_current_price = AsyncMock(
+        return_value=ResCommonResponse(rt_cd=ErrorCode.SUCCESS.value, msg1="REST", data={"output": {}})
+    )
+    sqs = _make_sqs(pss, mds)
+    sqs._price_coalescer = None
+
+    stale = sqs.get_fresh_price("005930")
+    assert stale.fresh is False and stale.max_age_sec == 5.0
+
+    sqs.rest_price_poller = MagicMock()
+    sqs.rest_price_poller.max_age_for.return_value = 32.0
+
+    fresh = sqs.get_fresh_price("005930")
+    assert fresh.fresh is True
+    assert fresh.source == "websocket"
+    assert 9.0 < fresh.age_sec < 12.0
+    await sqs.get_current_price("005930", caller="test")
+    mds.get_current_price.assert_not_called()
+    assert sqs.price_lookup_stats_snapshot()["snapshot_hit"] == 1
+    assert sqs.get_fresh_price("000660") is None
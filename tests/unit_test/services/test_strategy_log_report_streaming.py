@@ -0,0 +1,169 @@
+"""StrategyLogReportService — 단일 스트림 섹션 누적기 + 증분(byte offset) 리포트.
+
+- fixture 로그 디렉토리 리포트가 리팩토링 이전 구현의 golden 출력과 같아야 한다.
+- 로그가 덧붙은 뒤 재실행하면 새로 덧붙은 바이트만 읽고, 처음부터 다시 만든 리포트와 같다.
+- 이미 읽은 구간이 재작성되면 누적 상태를 버리고 다시 읽는다.
+- checkpoint 에서 복원한 서비스도 같은 결과를 낸다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+
+import pytest
+
+from services.strategy_log_report_service import StrategyLogReportService
+from tests.fixtures.strategy_log_report.build_fixture_logs import (
+    GOLDEN_PATH,
+    TARGET_DATE,
+    encode_line,
+    write_fixture_logs,
+)
+
+_FOOTER_RE = re.compile(r"\n\n<i>생성: [^<]*</i>$")
+
+
+def _strip_footer(report: str) -> str:
+    return _FOOTER_RE.sub("", report)
+
+
+def _service(log_dir, **kwargs) -> StrategyLogReportService:
+    return StrategyLogReportService(log_dir=str(log_dir), premium_stocks_file="", **kwargs)
+
+
+def _append(path: str, *items) -> None:
+    with open(path, "ab") as fp:
+        for item in items:
+            fp.write(encode_line(item))
+
+
+def _late_events() -> list[dict]:
+    def entry(ts, data):
+        return {"timestamp": f"2026-04-18 {ts},000", "level": "INFO", "name": "x", "data": data}
+
+    return [
+        entry("13:00:00", {"event": "breakout_rejected", "code": "000660", "name": "SK하이닉스",
+                           "reason": "low_execution_strength", "cgld": 101.0, "threshold": 120}),
+        entry("13:01:00", {"event": "buy_signal_generated", "code": "035420", "name": "NAVER",
+                           "reason": "오후 돌파", "metrics": {"price": 190000}}),
+        entry("13:02:00", {"event": "execution_quality", "code": "035420", "name": "NAVER",
+                           "source": "strategy:OneilSqueezeBreakout", "side": "BUY", "state": "FILLED",
+                           "order_qty": 3, "filled_qty": 3, "slippage_pct": 0.05}),
+        entry("13:03:00", {"event": "market_timing_updated", "market": "KOSDAQ", "ok": True}),
+    ]
+
+
+async def test_report_matches_golden_output(tmp_path):
+    write_fixture_logs(str(tmp_path))
+
+    report = await _service(tmp_path).generate_report(TARGET_DATE)
+
+    with open(GOLDEN_PATH, encoding="utf-8") as fp:
+        golden = fp.read()
+    assert _strip_footer(report) + "\n" == golden
+
+
+async def test_incremental_run_reads_only_appended_bytes(tmp_path):
+    paths = write_fixture_logs(str(tmp_path))
+    service = _service(tmp_path)
+    await service.generate_report(TARGET_DATE)
+    stream = service._accumulation.stream
+    first_bytes = stream.bytes_read
+
+    target = paths["20260418_OneilSqueezeBreakout_2.log.json"]
+    late = _late_events()
+    _append(target, *late)
+    appended = sum(len(encode_line(item)) for item in late)
+
+    incremental = await service.generate_report(TARGET_DATE)
+    assert stream is service._accumulation.stream
+    assert stream.bytes_read - first_bytes == appended
+
+    fresh = await _service(tmp_path).generate_report(TARGET_DATE)
+    assert _strip_footer(incremental) == _strip_footer(fresh)
+    assert "오후 돌파" in incremental
+    assert "KOSDAQ 🟢" in incremental
+
+
+async def test_partial_trailing_line_is_deferred(tmp_path):
+    paths = write_fixture_logs(str(tmp_path))
+    service = _service(tmp_path)
+    await service.generate_report(TARGET_DATE)
+
+    target = paths["20260418_RSI2Pullback.log.json"]
+    line = encode_line(_late_events()[1])
+    with open(target, "ab") as fp:
+        fp.write(line[:20])  # 쓰는 중인 줄
+    partial = await service.generate_report(TARGET_DATE)
+    assert "오후 돌파" not in partial
+
+    with open(target, "ab") as fp:
+        fp.write(line[20:])
+    completed = await service.generate_report(TARGET_DATE)
+    fresh = await _service(tmp_path).generate_report(TARGET_DATE)
+    assert _strip_footer(completed) == _strip_footer(fresh)
+    assert "오후 돌파" in completed
+
+
+async def test_rewritten_file_resets_accumulated_state(tmp_path):
+    paths = write_fixture_logs(str(tmp_path))
+    service = _service(tmp_path)
+    await service.generate_report(TARGET_DATE)
+    first_state = service._accumulation
+
+    # 이미 읽은 파일을 더 짧은 내용으로 재작성 — 누적된 매수 신호가 사라져야 한다.
+    target = paths["oneil/20260418_OneilPocketPivot.log.json"]
+    with open(target, "wb") as fp:
+        fp.write(encode_line(_late_events()[0]))
+
+    rebuilt = await service.generate_report(TARGET_DATE)
+    assert service._accumulation is not first_state
+    fresh = await _service(tmp_path).generate_report(TARGET_DATE)
+    assert _strip_footer(rebuilt) == _strip_footer(fresh)
+
+
+async def test_target_date_change_starts_new_state(tmp_path):
+    write_fixture_logs(str(tmp_path))
+    service = _service(tmp_path)
+    await service.generate_report(TARGET_DATE)
+    other = await service.generate_report("20260417")
+    assert service._accumulation.target_date == "20260417"
+    assert _strip_footer(other) == _strip_footer(await _service(tmp_path).generate_report("20260417"))
+
+
+@pytest.mark.parametrize("append_after_restart", [False, True])
+async def test_checkpoint_restore_matches_fresh_report(tmp_path, append_after_restart):
+    log_dir = tmp_path / "logs"
+    paths = write_fixture_logs(str(log_dir))
+    checkpoint = str(tmp_path / "checkpoint.json")
+    await _service(log_dir, checkpoint_path=checkpoint).generate_report(TARGET_DATE)
+    with open(checkpoint, encoding="utf-8") as fp:
+        saved = json.load(fp)
+    assert saved["target_date"] == TARGET_DATE
+    assert set(saved["sections"]) == {"strategy_activity", "market_timing", "execution_quality"}
+
+    if append_after_restart:
+        _append(paths["20260418_OneilSqueezeBreakout_2.log.json"], *_late_events())
+
+    restored = _service(log_dir, checkpoint_path=checkpoint)
+    report = await restored.generate_report(TARGET_DATE)
+    stream = restored._accumulation.stream
+    expected_new = (
+        sum(len(encode_line(item)) for item in _late_events()) if append_after_restart else 0
+    )
+    assert stream.bytes_read == expected_new
+    fresh = await _service(log_dir).generate_report(TARGET_DATE)
+    assert _strip_footer(report) == _strip_footer(fresh)
+
+
+async def test_corrupt_checkpoint_falls_back_to_full_read(tmp_path):
+    log_dir = tmp_path / "logs"
+    write_fixture_logs(str(log_dir))
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text("{broken", encoding="utf-8")
+
+    report = await _service(log_dir, checkpoint_path=str(checkpoint)).generate_report(TARGET_DATE)
+    with open(GOLDEN_PATH, encoding="utf-8") as fp:
+        assert _strip_footer(report) + "\n" == fp.read()
+    assert os.path.getsize(checkpoint) > 0
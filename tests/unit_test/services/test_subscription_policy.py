@@ -487,3 +487,69 @@ async def test_subscribe_order_follows_priority_not_set_iteration(policy, mock_s
 
     requested = [c.args[0] for c in mock_streaming.subscribe_unified_price.await_args_list]
     assert requested == ["999998", "999999", "000001", "000002", "000003", "000004"]
+
+
+@pytest.mark.asyncio
+async def test_slot_allocator_gives_scarce_slot_to_trigger_near_candidate(
+    mock_streaming, mock_stock_repo, mock_streaming_logger, mock_streaming_stock_repo, mock_market_calendar
+):
+    """할당기가 켜져 있으면 코드순 관심종목보다 트리거 근처 전략 후보가 먼저 슬롯을 받는다."""
+    from repositories.latest_price_table import LatestPriceTable
+    from services.subscription_slot_allocator import SubscriptionSlotAllocator
+
+    now = [0.0]
+    mock_stock_repo.latest_prices = LatestPriceTable()
+    mock_stock_repo.latest_prices.write("500001", 10050.0)
+    policy = SubscriptionPolicy(
+        streaming_service=mock_streaming,
+        stock_repo=mock_stock_repo,
+        logger=MagicMock(),
+        streaming_logger=mock_streaming_logger,
+        streaming_stock_repo=mock_streaming_stock_repo,
+        market_calendar=mock_market_calendar,
+        slot_allocator=SubscriptionSlotAllocator(resolve_interval_sec=30.0, clock=lambda: now[0]),
+    )
+    policy.set_external_reserved_slots(SubscriptionPolicy.MAX_WS_SLOTS - 2)
+    policy.set_rest_fallback_source(lambda: {})
+
+    policy.set_trigger_levels("strategy_tvb", {"500001": 10100, "500002": 0})
+    await policy.sync_subscriptions(["000001", "000002"], "favorite", SubscriptionPriority.MEDIUM, rebalance=False)
+    await policy.sync_subscriptions(["500001"], "strategy_tvb", SubscriptionPriority.MEDIUM)
+
+    assert policy._active_codes_price == {"500001", "000001"}
+    assert policy._trigger_levels == {"strategy_tvb": {"500001": 10100.0}}
+    assert policy.get_status()["slot_allocator"]["held"] == 2
+
+    # 재계산 주기 전에는 워치독 호출이 재배정하지 않는다
+    assert await policy.resolve_slot_allocation() is False
+    now[0] = 31.0
+    assert await policy.resolve_slot_allocation() is True
+
+    await policy.remove_category("strategy_tvb")
+    assert "strategy_tvb" not in policy._trigger_levels
+    assert policy._active_codes_price == {"000001", "000002"}
+
+
+@pytest.mark.asyncio
+async def test_resolve_slot_allocation_is_noop_without_allocator(policy):
+    await policy.add_subscription("005930", SubscriptionPriority.MEDIUM, "favorite")
+
+    assert await policy.resolve_slot_allocation() is False
+    assert "slot_allocator" not in policy.get_status()
+
+
+@pytest.mark.asyncio
+async def test_pending_price_requests_lists_price_codes_without_slot(policy):
+    """슬롯을 받지 못한 가격 요청만 REST 폴러 대상이 된다 (PT 전용·구독 중 종목 제외)."""
+    policy.set_external_reserved_slots(SubscriptionPolicy.MAX_WS_SLOTS - 1)
+    policy.set_trigger_levels("strategy_tvb", {"000002": 10100})
+    await policy.sync_subscriptions(["000001"], "holding", SubscriptionPriority.HIGH, rebalance=False)
+    await policy.sync_subscriptions(["000002"], "strategy_tvb", SubscriptionPriority.MEDIUM, rebalance=False)
+    await policy.sync_subscriptions(
+        ["000003"], "capture", SubscriptionPriority.LOW, StreamingType.PROGRAM_TRADING
+    )
+
+    assert policy._active_codes_price == {"000001"}
+    assert policy.pending_price_requests() == {
+        "000002": {"priority": int(SubscriptionPriority.MEDIUM), "trigger_levels": [10100.0]},
+    }
@@ -0,0 +1,117 @@
+from services.subscription_slot_allocator import (
+    SlotCandidate,
+    SubscriptionSlotAllocator,
+    build_candidate,
+    build_slot_allocator,
+)
+
+
+def _allocator(**kwargs):
+    kwargs.setdefault("clock", lambda: 0.0)
+    return SubscriptionSlotAllocator(**kwargs)
+
+
+def test_trigger_near_candidate_outranks_idle_higher_class():
+    allocator = _allocator()
+    ranked = allocator.rank(
+        [
+            SlotCandidate("FAV", priority=2),
+            SlotCandidate("UI", priority=3),
+            SlotCandidate("NEAR", priority=2, trigger_distance_pct=0.3),
+            SlotCandidate("FAR", priority=2, trigger_distance_pct=8.0),
+            SlotCandidate("HOLD", priority=1, is_holding=True),
+            SlotCandidate("PT", priority=0),
+        ],
+        incumbents=set(),
+        now=0.0,
+    )
+
+    assert ranked[0] == "PT"  # CRITICAL 은 점수와 무관하게 맨 앞
+    assert ranked[1] == "HOLD"  # 그다음 보유(HIGH)
+    assert ranked[2] == "NEAR"
+    # 신호가 없으면 기존 클래스 순서(MEDIUM > LOW)를 유지하고 코드순으로 정렬된다
+    assert ranked[3:] == ["FAR", "FAV", "UI"]
+
+
+def test_incumbent_keeps_slot_unless_challenger_beats_swap_margin():
+    allocator = _allocator(swap_margin=1.0, min_hold_sec=0.0)
+    allocator.note_active({"OLD"}, now=0.0)
+
+    close_call = allocator.rank(
+        [SlotCandidate("OLD", 2, volatility_pct=5.0), SlotCandidate("NEW", 2, volatility_pct=10.0)],
+        incumbents={"OLD"},
+        now=100.0,
+    )
+    clear_win = allocator.rank(
+        [SlotCandidate("OLD", 2, volatility_pct=5.0), SlotCandidate("NEW", 2, trigger_distance_pct=0.0)],
+        incumbents={"OLD"},
+        now=100.0,
+    )
+
+    assert close_call[0] == "OLD"
+    assert clear_win[0] == "NEW"
+
+
+def test_recent_subscription_is_protected_for_min_hold():
+    allocator = _allocator(swap_margin=0.0, min_hold_sec=60.0)
+    allocator.note_active({"OLD"}, now=0.0)
+    candidates = [SlotCandidate("OLD", 3), SlotCandidate("NEW", 2, trigger_distance_pct=0.0)]
+
+    assert allocator.rank(candidates, incumbents={"OLD"}, now=30.0)[0] == "OLD"
+    assert allocator.rank(candidates, incumbents={"OLD"}, now=61.0)[0] == "NEW"
+
+
+def test_holding_outranks_min_hold_protected_incumbent():
+    allocator = _allocator(swap_margin=0.0, min_hold_sec=60.0)
+    allocator.note_active({"OLD"}, now=0.0)
+    candidates = [
+        SlotCandidate("OLD", 2, trigger_distance_pct=0.0),
+        SlotCandidate("HOLD", 1, is_holding=True),
+        SlotCandidate("PT", 0),
+    ]
+
+    assert allocator.rank(candidates, incumbents={"OLD"}, now=30.0) == ["PT", "HOLD", "OLD"]
+
+
+def test_rest_fallback_rate_is_per_minute_and_frozen_while_subscribed():
+    allocator = _allocator(rest_rate_smoothing=1.0)
+    allocator.observe_rest_fallbacks({"A": 0, "B": 0}, now=0.0)
+    allocator.observe_rest_fallbacks({"A": 12, "B": 3}, now=60.0)
+
+    assert allocator.rest_fallback_rate("A") == 12.0
+    assert allocator.rest_fallback_rate("B") == 3.0
+
+    # 구독 후에는 fallback 이 멈추지만 빈도를 깎지 않는다 (재배정 진동 방지)
+    allocator.note_active({"A"}, now=60.0)
+    allocator.observe_rest_fallbacks({"A": 12, "B": 3}, now=120.0)
+    assert allocator.rest_fallback_rate("A") == 12.0
+    assert allocator.rest_fallback_rate("B") == 0.0
+
+
+def test_is_due_follows_resolve_interval():
+    allocator = _allocator(resolve_interval_sec=30.0)
+    assert allocator.is_due(now=0.0)
+    allocator.rank([SlotCandidate("A", 2)], incumbents=set(), now=0.0)
+    assert not allocator.is_due(now=10.0)
+    assert allocator.is_due(now=30.0)
+
+
+def test_build_candidate_derives_distance_and_volatility():
+    candidate = build_candidate(
+        "A", 1, price=10000.0, high=10300.0, low=9800.0, open_price=10000.0,
+        trigger_levels=[10500.0, 10100.0],
+    )
+
+    assert candidate.is_holding
+    assert candidate.trigger_distance_pct == 1.0
+    assert candidate.volatility_pct == 5.0
+    assert build_candidate("B", 2).trigger_distance_pct is None
+
+
+def test_build_slot_allocator_reads_config_section():
+    assert build_slot_allocator(None) is None
+    assert build_slot_allocator({"enabled": False}) is None
+
+    allocator = build_slot_allocator({"enabled": True, "trigger_weight": 6.0, "min_hold_sec": 120})
+    assert allocator.weights.trigger_proximity == 6.0
+    assert allocator.min_hold_sec == 120.0
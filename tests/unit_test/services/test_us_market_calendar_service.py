@@ -93,3 +93,28 @@ class TestLatestTradingDate:
     async def test_trading_day_returns_itself(self):
         svc = _svc(clock_date="20260702")
         assert await svc.get_latest_trading_date() == "20260702"
+
+
+class TestLatestClosedTradingDate:
+    @staticmethod
+    def _at(yyyymmdd: str, hhmm: str) -> USMarketCalendarService:
+        from datetime import datetime
+
+        svc = _svc(clock_date=yyyymmdd)
+        svc._market_clock.get_current_kst_time.return_value = datetime.strptime(
+            yyyymmdd + hhmm, "%Y%m%d%H:%M"
+        )
+        return svc
+
+    async def test_before_close_returns_previous_trading_day(self):
+        # 2026-07-06(월) 장중 → 7/3 관측휴장 건너 7/2(목)
+        assert await self._at("20260706", "10:00").get_latest_closed_trading_date() == "20260702"
+
+    async def test_after_close_returns_today(self):
+        assert await self._at("20260706", "16:30").get_latest_closed_trading_date() == "20260706"
+
+    async def test_early_close_day_uses_1300(self):
+        assert await self._at("20261127", "13:05").get_latest_closed_trading_date() == "20261127"
+
+    async def test_non_trading_day_returns_latest_trading_day(self):
+        assert await self._at("20260620", "09:00").get_latest_closed_trading_date() == "20260618"
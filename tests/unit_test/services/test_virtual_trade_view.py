@@ -0,0 +1,306 @@
+"""VirtualTradeView — /virtual/history 증분 materialized view.
+
+- 원장·가격이 그대로면 refresh 는 재조회·재집계 없이 같은 version 을 돌려준다.
+- 매수/매도 기록, 실시간 가격 변화는 해당 행만 다시 계산하고 version 을 올린다.
+- changes_since 는 since 이후 변경분/삭제분만 (version, key) 순 cursor 페이지로 준다.
+- 라우트는 ETag 를 붙이고 If-None-Match 가 같으면 304 를 준다.
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.types import ResCommonResponse
+from repositories.latest_price_table import LatestPriceTable
+from repositories.virtual_trade_repository import VirtualTradeRepository
+from services.stock_query_service import FreshPrice
+from services.virtual_trade_service import VirtualTradeService
+from services.virtual_trade_view import VirtualTradeView, trade_row_keys
+from view.web import web_api
+from view.web.routes.virtual import _aggregate_virtual_data
+
+
+class _StepClock:
+    """매 호출마다 1초씩 흐르는 MarketClock 대역 (동일 매수 기록 중복 방지 우회)."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2025, 1, 3, 10, 0, 0)
+
+    def get_current_kst_time(self):
+        self.now += timedelta(seconds=1)
+        return self.now
+
+
+class _FakeQuotes:
+    def __init__(self, prices: dict[str, int]) -> None:
+        self.prices = prices
+        self.calls: list[list[str]] = []
+
+    async def get_multi_price(self, codes):
+        self.calls.append(list(codes))
+        data = [
+            {"stck_shrn_iscd": c, "stck_prpr": str(self.prices[c]), "prdy_ctrt": "1.0"}
+            for c in codes if c in self.prices
+        ]
+        return ResCommonResponse(rt_cd="0", msg1="OK", data=data)
+
+
+class _FakePriceStream:
+    def __init__(self) -> None:
+        self.latest = LatestPriceTable()
+
+    def tick(self, code: str, price: int) -> None:
+        self.latest.write(code, float(price), rate=2.0)
+
+    def get_price_quote(self, code):
+        return self.latest.read(code)
+
+
+@pytest.fixture
+def vm(tmp_path):
+    repo = VirtualTradeRepository(db_path=str(tmp_path / "virtual_trade.db"), market_clock=_StepClock())
+    return VirtualTradeService(repo, market_clock=repo.tm)
+
+
+def _view(vm, quotes, stream=None, **kwargs) -> VirtualTradeView:
+    names = MagicMock()
+    names.get_name_by_code.side_effect = lambda code: f"N{code}"
+    return VirtualTradeView(
+        vm,
+        aggregate=_aggregate_virtual_data,
+        fetch_multi_price=quotes.get_multi_price,
+        price_stream=stream,
+        name_resolver=names,
+        price_cache={},
+        **kwargs,
+    )
+
+
+async def _settled(view: VirtualTradeView, apply_cost: bool = True) -> int:
+    """첫 집계가 남기는 일별 스냅샷 쓰기까지 반영된 version."""
+    await view.refresh(apply_cost)
+    return await view.refresh(apply_cost)
+
+
+async def test_unchanged_refresh_reuses_rows_aggregate_and_payload(vm):
+    vm.log_buy("StratA", "005930", 70000, qty=2)
+    vm.log_buy("StratB", "000660", 150000, qty=1)
+    quotes = _FakeQuotes({"005930": 71000, "000660": 149000})
+    view = _view(vm, quotes)
+
+    version = await _settled(view)
+    payload = view.payload(True)
+    before = view.stats_snapshot()
+
+    assert await view.refresh(True) == version
+    after = view.stats_snapshot()
+    assert after["reloads"] == before["reloads"]
+    assert after["aggregations"] == before["aggregations"]
+    assert after["rows_enriched"] == before["rows_enriched"]
+    assert after["price_fetch_calls"] == before["price_fetch_calls"] == 1
+    assert view.payload(True) is payload
+    assert view.etag(True) == f'"vt-1-{version}"'
+
+    hold = next(t for t in payload["trades"] if t["code"] == "005930")
+    assert hold["stock_name"] == "N005930"
+    assert hold["current_price"] == 71000
+    assert payload["version"] == version
+    assert payload["counts"]["ALL"]["hold"] == 2
+
+
+async def test_trade_write_bumps_version_and_delta_contains_only_changes(vm):
+    vm.log_buy("StratA", "005930", 70000)
+    quotes = _FakeQuotes({"005930": 71000, "035420": 200000})
+    view = _view(vm, quotes)
+    version = await _settled(view)
+
+    vm.log_buy("StratA", "035420", 190000)
+    new_version = await view.refresh(True)
+    assert new_version > version
+
+    delta = view.changes_since(True, version)
+    assert [t["code"] for t in delta["trades"]] == ["035420"]
+    assert delta["trades"][0]["current_price"] == 200000
+    assert delta["removed"] == []
+    assert delta["version"] == view.version(True)
+    assert "cumulative_returns" in delta  # 집계는 delta 에도 통째로 포함
+
+    assert view.changes_since(True, view.version(True))["trades"] == []
+
+
+async def test_price_tick_reprices_only_rows_of_that_code(vm):
+    vm.log_buy("StratA", "005930", 70000)
+    vm.log_buy("StratB", "005930", 70500)
+    vm.log_buy("StratA", "000660", 150000)
+    stream = _FakePriceStream()
+    quotes = _FakeQuotes({"005930": 71000, "000660": 149000})
+    view = _view(vm, quotes, stream)
+    version = await _settled(view)
+    enriched = view.stats_snapshot()["rows_enriched"]
+
+    stream.tick("005930", 72000)
+    await view.refresh(True)
+
+    assert view.stats_snapshot()["rows_enriched"] - enriched == 2
+    delta = view.changes_since(True, version)
+    assert sorted(t["strategy"] for t in delta["trades"]) == ["StratA", "StratB"]
+    assert {t["current_price"] for t in delta["trades"]} == {72000}
+    assert all(t["is_cached"] is False for t in delta["trades"])
+
+    # 같은 가격의 tick 은 시각만 바뀌어도 version 을 올리지 않는다.
+    settled = await view.refresh(True)
+    stream.tick("005930", 72000)
+    assert await view.refresh(True) == settled
+
+
+async def test_fresh_price_lookup_keeps_rest_polled_quote_past_price_ttl(vm):
+    """REST 폴러 종목은 get_fresh_price 의 max_age(폴러 주기) 안이면 60초 TTL 이 지나도 재조회하지 않는다."""
+    vm.log_buy("StratA", "005930", 70000)
+    quotes = _FakeQuotes({"005930": 71000})
+    table = LatestPriceTable()
+    table.write("005930", 72000.0, rate=2.0, received_at=time.time() - 90.0, quality_reason="rest_poll")
+
+    def fresh_price(code):
+        quote = table.read(code)
+        age = time.time() - quote.received_at
+        return FreshPrice(quote, age, 120.0, quote.quality_reason, age <= 120.0)
+
+    view = _view(vm, quotes, fresh_price=fresh_price)
+    await _settled(view)
+
+    assert quotes.calls == []
+    assert view.payload(True)["trades"][0]["current_price"] == 72000
+
+
+async def test_sell_updates_row_in_place_and_rewrite_emits_removed_keys(vm):
+    vm.log_buy("StratA", "005930", 70000)
+    vm.log_buy("StratA", "000660", 150000)
+    view = _view(vm, _FakeQuotes({"005930": 71000, "000660": 149000}))
+    version = await _settled(view)
+
+    vm.log_sell_by_strategy("StratA", "005930", 73000)
+    await view.refresh(True)
+    delta = view.changes_since(True, version)
+    assert [(t["code"], t["status"]) for t in delta["trades"]] == [("005930", "SOLD")]
+
+    # 원장 재작성으로 한 건이 사라지면 tombstone 으로 전달된다.
+    version = view.version(True)
+    repo = vm._repo
+    df = repo._read()
+    repo._write(df[df["code"] != "000660"])
+    await view.refresh(True)
+    delta = view.changes_since(True, version)
+    assert delta["removed"] == ["StratA|000660|" + df[df["code"] == "000660"]["buy_date"].iloc[0] + "|0"]
+    assert all(t["code"] != "000660" for t in view.payload(True)["trades"])
+
+
+async def test_changes_since_paginates_with_cursor(vm):
+    for i in range(5):
+        vm.log_buy("StratA", f"00000{i}", 1000 + i)
+    view = _view(vm, _FakeQuotes({}))
+    await view.refresh(True)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = view.changes_since(True, view.base_version, cursor=cursor, limit=2)
+        seen.extend(t["row_key"] for t in page["trades"])
+        pages += 1
+        if not page["has_more"]:
+            assert page["next_cursor"] is None
+            break
+        cursor = page["next_cursor"]
+
+    assert pages == 3
+    assert sorted(seen) == sorted(trade_row_keys(vm.get_all_trades()))
+
+
+async def test_since_outside_view_lifetime_requires_reset(vm):
+    vm.log_buy("StratA", "005930", 70000)
+    view = _view(vm, _FakeQuotes({"005930": 71000}))
+    await view.refresh(True)
+
+    assert view.changes_since(True, view.base_version - 1) is None
+    assert view.changes_since(True, view.version(True) + 1) is None
+
+
+async def test_missing_quote_is_not_refetched_within_ttl(vm):
+    vm.log_buy("StratA", "999999", 1000)
+    quotes = _FakeQuotes({})
+    view = _view(vm, quotes)
+    await _settled(view)
+    await view.refresh(True)
+    assert len(quotes.calls) == 1
+
+    await view.refresh(True, force_code="999999")
+    assert len(quotes.calls) == 2
+
+
+def test_history_route_returns_304_for_matching_etag(web_client, mock_web_ctx):
+    web_api._PRICE_CACHE.clear()
+    vm = mock_web_ctx.virtual_trade_service
+    vm.get_all_trades.return_value = [
+        {"strategy": "A", "code": "005930", "buy_date": "2025-01-02 09:00:00", "buy_price": 1000,
+         "qty": 1, "sell_date": None, "sell_price": 0, "return_rate": 0.0, "status": "HOLD"},
+    ]
+    vm.get_daily_change.return_value = (0.0, None)
+    vm.get_weekly_change.return_value = (0.0, None)
+    vm._load_data.return_value = {}
+    mock_web_ctx.stock_code_repository.get_name_by_code.return_value = "삼성전자"
+    web_api._PRICE_CACHE["005930"] = (50000, 1.0, time.time())
+
+    first = web_client.get("/api/virtual/history")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.json()["version"] == int(etag.strip('"').rsplit("-", 1)[1])
+
+    cached = web_client.get("/api/virtual/history", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    web_api._PRICE_CACHE["005930"] = (51000, 2.0, time.time())
+    changed = web_client.get("/api/virtual/history", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+    delta = web_client.get(f"/api/virtual/history?since={first.json()['version']}").json()
+    assert [t["current_price"] for t in delta["trades"]] == [51000]
+    reset = web_client.get("/api/virtual/history?since=1").json()
+    assert reset["reset"] is True
+    assert len(reset["trades"]) == 1
+    web_api._PRICE_CACHE.clear()
+
+
+@pytest.mark.slow
+async def test_benchmark_unchanged_refresh_vs_full_rebuild(vm):
+    """거래 3000건 원장에서 최초 materialize 대비 변경 없는 refresh 비용 (시간은 보고만 하고 재계산 횟수를 검증)."""
+    rows = []
+    for i in range(3000):
+        rows.append({
+            "strategy": f"S{i % 8}", "code": f"{i % 300:06d}", "buy_date": f"2025-01-02 09:{i // 60 % 60:02d}:{i % 60:02d}",
+            "buy_price": 1000.0 + i, "qty": 1, "sell_date": None if i % 3 else "2025-01-03 10:00:00",
+            "sell_price": None if i % 3 else 1100.0 + i, "return_rate": 0.0, "status": "HOLD" if i % 3 else "SOLD",
+            "reason": "",
+        })
+    import pandas as pd
+    vm._repo._write(pd.DataFrame(rows))
+    quotes = _FakeQuotes({f"{i:06d}": 1050 for i in range(300)})
+    view = _view(vm, quotes)
+
+    start = time.perf_counter()
+    await _settled(view)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    before = view.stats_snapshot()
+    start = time.perf_counter()
+    for _ in range(20):
+        await view.refresh(True)
+        view.payload(True)
+    refresh_ms = (time.perf_counter() - start) * 1000 / 20
+    after = view.stats_snapshot()
+
+    print(f"\n[VirtualTradeView 3000 trades] build={build_ms:.1f}ms unchanged refresh={refresh_ms:.2f}ms")
+    for counter in ("reloads", "aggregations", "rows_enriched", "price_fetch_calls"):
+        assert after[counter] == before[counter], counter
@@ -0,0 +1,205 @@
+"""WarmRestartSnapshotService 테스트 — 수집/저장/복원 왕복과 재기동-준비 시간 비교."""
+import os
+import sqlite3
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+from core.cache.cache_store import CacheStore
+from repositories.stock_code_repository import TABLE_NAME, StockCodeRepository
+from repositories.stock_repository import StockRepository
+from repositories.streaming_stock_repo import StreamingType
+from repositories.warm_restart_snapshot_repository import WarmRestartSnapshotRepository
+from services.indicator_service import DEFAULT_WARMUP_INDICATORS, IndicatorService
+from services.price_stream_service import PriceStreamService
+from services.subscription_policy import SubscriptionPolicy, SubscriptionPriority
+from services.warm_restart_snapshot_service import WarmRestartSnapshotService
+
+TRADING_DATE = "20991231"
+
+
+def _records(codes, days):
+    dates = [f"{2024 + d // 336}{1 + d % 336 // 28:02d}{1 + d % 28:02d}" for d in range(days)]
+    return [
+        {"code": code, "date": day, "open": 10_000 + (i * 7 + d) % 300, "high": 10_400, "low": 9_600,
+         "close": 10_000 + (i * 13 + d * 7) % 400, "volume": 1_000 + d}
+        for i, code in enumerate(codes) for d, day in enumerate(dates)
+    ]
+
+
+def _write_code_master(db_path, n_symbols):
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    frame = pd.DataFrame({
+        "종목코드": [f"{i:06d}" for i in range(n_symbols)],
+        "종목명": [f"종목{i}" for i in range(n_symbols)],
+        "시장구분": ["KOSDAQ" if i % 2 else "KOSPI" for i in range(n_symbols)],
+    })
+    with sqlite3.connect(db_path) as conn:
+        frame.to_sql(TABLE_NAME, conn, if_exists="replace", index=False)
+
+
+def _policy():
+    streaming_logger = MagicMock()
+    return SubscriptionPolicy(
+        streaming_service=MagicMock(), stock_repo=MagicMock(), logger=MagicMock(),
+        streaming_logger=streaming_logger, streaming_stock_repo=MagicMock(),
+        market_calendar=MagicMock(is_market_open_now=AsyncMock(return_value=True)),
+    )
+
+
+def _service(snapshot_repo, **components):
+    return WarmRestartSnapshotService(snapshot_repo, logger=MagicMock(), **components)
+
+
+async def _warm_confirmed(stock_repo, indicators, codes, ohlcv_limit):
+    history = await stock_repo.preload_stock_data(codes, ohlcv_limit=ohlcv_limit)
+    for code, rows in history.items():
+        indicators.warm_confirmed_indicators(code, rows)
+    return history
+
+
+async def test_capture_and_restore_round_trip(tmp_path, test_cache_config):
+    codes = ["005930", "000660", "035720"]
+    stock_repo = StockRepository(db_path=str(tmp_path / "stocks.db"))
+    await stock_repo.upsert_ohlcv(_records(codes, 250))
+    indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+    history = await _warm_confirmed(stock_repo, indicators, codes, ohlcv_limit=250)
+
+    code_db = str(tmp_path / "codes" / "stock_code_list.db")
+    _write_code_master(code_db, 5)
+    stream = PriceStreamService(stock_repo=MagicMock(), logger=MagicMock())
+    stream.cache_price_snapshot("005930", "70000", rate="1.20", volume="1500", high="70500")
+    policy = _policy()
+    await policy.add_subscription("005930", SubscriptionPriority.HIGH, "portfolio", rebalance=False)
+    await policy.add_subscription("000660", SubscriptionPriority.MEDIUM, "strategy_rsi2", rebalance=False)
+    await policy.add_subscription("035720", SubscriptionPriority.LOW, "ui_detail", rebalance=False)
+    await policy.add_subscription("035720", SubscriptionPriority.CRITICAL, "program_trading",
+                                  StreamingType.PROGRAM_TRADING, rebalance=False)
+
+    snapshot_repo = WarmRestartSnapshotRepository(path=str(tmp_path / "hot_state.snap"))
+    stats = await _service(
+        snapshot_repo,
+        stock_code_repository=StockCodeRepository(db_path=code_db),
+        stock_repository=stock_repo, indicator_service=indicators,
+        price_stream_service=stream, subscription_policy=policy,
+    ).capture(TRADING_DATE)
+    assert stats["ohlcv_codes"] == 3 and stats["symbols"] == 5 and stats["ticks"] == 1
+    assert stats["indicator_series"] == 3 * len(DEFAULT_WARMUP_INDICATORS)
+    await stock_repo.close()
+
+    # ── 재기동 ──
+    fresh_repo = StockRepository(db_path=str(tmp_path / "stocks.db"))
+    fresh_indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+    fresh_stream = PriceStreamService(stock_repo=MagicMock(), logger=MagicMock())
+    fresh_stream.cache_price_snapshot("000660", "150000")  # 기동 후 이미 받은 값은 덮지 않는다
+    fresh_policy = _policy()
+    snapshot = snapshot_repo.load(TRADING_DATE)
+    master = StockCodeRepository.from_snapshot(snapshot.documents["symbol_master"], db_path=code_db)
+    result = _service(
+        snapshot_repo, stock_repository=fresh_repo, indicator_service=fresh_indicators,
+        price_stream_service=fresh_stream, subscription_policy=fresh_policy,
+    ).restore(snapshot)
+    snapshot.close()
+
+    assert master.get_name_by_code("000003") == "종목3" and master.is_kosdaq("000003")
+    assert result["restored"] == {"ohlcv": 3, "indicators": 3 * len(DEFAULT_WARMUP_INDICATORS),
+                                  "ticks": 1, "subscriptions": 2}
+    assert fresh_repo.export_ohlcv_cache(ohlcv_limit=250) == history
+    for code in codes:
+        for key, rows in indicators.export_confirmed_indicators(code, history[code]).items():
+            assert fresh_indicators.cache_store.get(key) == rows
+    tick = fresh_stream.get_cached_price("005930")
+    assert tick["price"] == "70000" and tick["high"] == 70500.0
+    assert tick["quality_reason"] == "warm_restart_snapshot"
+    assert fresh_stream.get_last_tick_ts("005930") == 0.0
+    assert fresh_stream.get_cached_price("000660")["price"] == "150000"
+    assert fresh_policy._refs == {
+        "005930": {"portfolio": {"priority": SubscriptionPriority.HIGH, "type": StreamingType.UNIFIED_PRICE}},
+        "000660": {"strategy_rsi2": {"priority": SubscriptionPriority.MEDIUM, "type": StreamingType.UNIFIED_PRICE}},
+    }
+    await fresh_repo.close()
+
+
+async def test_first_scan_after_restore_hits_caches_without_recompute(tmp_path, test_cache_config):
+    """복원 직후 첫 scan 은 일봉을 DB 에서 읽지 않고 확정 지표도 다시 계산·저장하지 않는다."""
+    codes = ["005930", "000660"]
+    stock_repo = StockRepository(db_path=str(tmp_path / "stocks.db"))
+    await stock_repo.upsert_ohlcv(_records(codes, 250))
+    indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+    await _warm_confirmed(stock_repo, indicators, codes, ohlcv_limit=250)
+    snapshot_repo = WarmRestartSnapshotRepository(path=str(tmp_path / "hot_state.snap"))
+    await _service(snapshot_repo, stock_repository=stock_repo, indicator_service=indicators).capture(TRADING_DATE)
+    await stock_repo.close()
+
+    fresh_repo = StockRepository(db_path=str(tmp_path / "stocks.db"))
+    fresh_indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+    snapshot = snapshot_repo.load(TRADING_DATE)
+    _service(snapshot_repo, stock_repository=fresh_repo, indicator_service=fresh_indicators).restore(snapshot)
+    snapshot.close()
+    fresh_indicators.cache_store.set = MagicMock(side_effect=AssertionError("복원된 지표는 다시 저장하지 않는다"))
+
+    for code in codes:
+        rows = (await fresh_repo.get_stock_data(code, ohlcv_limit=250))["ohlcv"]
+        resp = await fresh_indicators.get_rsi(code, period=2, ohlcv_data=rows + [{**rows[-1], "date": "20991231"}],
+                                              exclude_today=True)
+        assert resp.rt_cd == "0"
+
+    cache = fresh_repo._ohlcv_repo._ohlcv_cache
+    assert (cache.hits, cache.misses) == (len(codes), 0)
+    fresh_indicators.cache_store.set.assert_not_called()
+    await fresh_repo.close()
+
+
+@pytest.mark.slow
+@pytest.mark.real_sleep
+async def test_benchmark_restart_to_ready_with_and_without_snapshot(tmp_path, test_cache_config):
+    """종목 마스터 3000종목 + 40종목 × 400일 OHLCV/확정 지표: 재기동 후 첫 scan 준비까지 (시간은 보고만 한다)."""
+    codes = [f"{i:06d}" for i in range(40)]
+    ohlcv_limit = 400
+    code_db = str(tmp_path / "codes" / "stock_code_list.db")
+    _write_code_master(code_db, 3000)
+    stock_db = str(tmp_path / "stocks.db")
+    seed_repo = StockRepository(db_path=stock_db)
+    await seed_repo.upsert_ohlcv(_records(codes, ohlcv_limit))
+    await seed_repo.close()
+
+    async def _cold_restart():
+        started = time.perf_counter()
+        master = StockCodeRepository(db_path=code_db)
+        repo = StockRepository(db_path=stock_db)
+        indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+        await _warm_confirmed(repo, indicators, codes, ohlcv_limit)
+        return time.perf_counter() - started, master, repo, indicators
+
+    cold_sec, master, repo, indicators = await _cold_restart()
+    snapshot_repo = WarmRestartSnapshotRepository(path=str(tmp_path / "hot_state.snap"))
+    stats = await _service(
+        snapshot_repo, stock_code_repository=master, stock_repository=repo, indicator_service=indicators,
+    ).capture(TRADING_DATE)
+    await repo.close()
+
+    started = time.perf_counter()
+    snapshot = snapshot_repo.load(TRADING_DATE)
+    StockCodeRepository.from_snapshot(snapshot.documents["symbol_master"], db_path=code_db)
+    warm_repo = StockRepository(db_path=stock_db)
+    warm_indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+    _service(snapshot_repo, stock_repository=warm_repo, indicator_service=warm_indicators).restore(snapshot)
+    snapshot.close()
+    warm_sec = time.perf_counter() - started
+
+    # 복원 후 첫 scan: 일봉은 캐시 히트, 지표는 증분 캐시 히트여야 한다.
+    rows = (await warm_repo.get_stock_data(codes[0], ohlcv_limit=ohlcv_limit))["ohlcv"]
+    assert warm_repo._ohlcv_repo._ohlcv_cache.hits == 1
+    resp = await warm_indicators.get_rsi(codes[0], period=2, ohlcv_data=rows + [{**rows[-1], "date": "20991231"}],
+                                         exclude_today=True)
+    assert resp.data == indicators.cache_store.get(IndicatorService._confirmed_cache_key("rsi_2", codes[0], rows))
+    await warm_repo.close()
+
+    print(
+        f"\n[restart-to-ready 3000 symbols, {len(codes)} codes x {ohlcv_limit} days] "
+        f"cold={cold_sec * 1000:.0f}ms warm={warm_sec * 1000:.0f}ms "
+        f"(snapshot {stats['bytes'] / 1024:.0f}KB, capture {stats['elapsed_ms']:.0f}ms) "
+        f"speedup={cold_sec / warm_sec:.1f}x"
+    )
@@ -4,6 +4,10 @@
 `_logger.debug({"event": "entry_rejected", ...})` 패턴이 없어야 한다. 본 테스트는
 ast 파싱으로 모든 strategy 모듈을 검사해 신규 PR 에서 debug-level entry_rejected 가
 재유입되지 않도록 한다.
+
+거절·계산 실패 집계는 전략이 ScanFunnel 에 직접 누적한다. entry_rejected 로그는
+`funnel.reject(...)` 가 True 일 때만 남기고(`"funnel_counted": True`), 종목 code 를 담은
+실패 로그는 같은 함수에서 `funnel.calc_failure(...)` 를 호출해야 한다.
 """
 from __future__ import annotations
 
@@ -74,3 +78,71 @@ def test_no_entry_rejected_at_debug_level_in_strategies():
         "scan_metrics.rejected_reasons 가 prod LOG_LEVEL=INFO 환경에서 누락되지 않도록, "
         "다음 위치의 entry_rejected 로그는 _logger.info 로 변경해야 한다: " + ", ".join(offenders)
     )
+
+
+_FAILURE_MARKERS = ("error", "failed", "exception")
+
+
+def _is_logger_call(node: ast.Call) -> bool:
+    func = node.func
+    if not isinstance(func, ast.Attribute):
+        return False
+    inner = func.value
+    if isinstance(inner, ast.Name) and inner.id == "_logger":
+        return True
+    return isinstance(inner, ast.Attribute) and inner.attr == "_logger"
+
+
+def _dict_keys(arg: ast.Dict) -> set:
+    return {key.value for key in arg.keys if isinstance(key, ast.Constant)}
+
+
+def _calls_funnel(func_node: ast.AST, method: str) -> bool:
+    for node in ast.walk(func_node):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == method
+                and isinstance(node.func.value, ast.Attribute) and node.func.value.attr == "funnel"):
+            return True
+    return False
+
+
+def _iter_logged_events():
+    """(path, 함수 노드, logger call, event, dict 키 집합) 을 순회한다."""
+    for path in _iter_strategy_modules():
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=str(path))
+        for func_node in ast.walk(tree):
+            if not isinstance(func_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for node in ast.walk(func_node):
+                if not isinstance(node, ast.Call) or not _is_logger_call(node) or not node.args:
+                    continue
+                arg = node.args[0]
+                event_value = _extract_event_value(arg)
+                if event_value is None:
+                    continue
+                yield path, func_node, node, event_value, _dict_keys(arg)
+
+
+def test_entry_rejected_logs_are_counted_on_funnel():
+    """entry_rejected 로그는 funnel.reject 샘플링을 거친 것(funnel_counted)만 남아야 한다."""
+    offenders = [
+        f"{path.name}:L{node.lineno}"
+        for path, func_node, node, event_value, keys in _iter_logged_events()
+        if event_value == "entry_rejected"
+        and ("funnel_counted" not in keys or not _calls_funnel(func_node, "reject"))
+    ]
+    assert offenders == [], "funnel.reject 없이 남는 entry_rejected 로그: " + ", ".join(offenders)
+
+
+def test_per_code_failure_logs_are_counted_on_funnel():
+    """code 를 담은 실패 로그가 있는 함수는 funnel.calc_failure 를 호출해야 한다."""
+    offenders = [
+        f"{path.name}:L{node.lineno}"
+        for path, func_node, node, event_value, keys in _iter_logged_events()
+        if path.name not in ("strategy_executor.py", "overseas_daily_vbo_backtest.py")
+        and "code" in keys
+        and any(marker in event_value.casefold() for marker in _FAILURE_MARKERS)
+        and not _calls_funnel(func_node, "calc_failure")
+    ]
+    assert offenders == [], "funnel.calc_failure 없이 남는 종목 실패 로그: " + ", ".join(offenders)
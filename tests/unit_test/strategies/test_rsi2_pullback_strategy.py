@@ -200,6 +200,30 @@ async def test_check_entry_skips_bad_rsi_current_price_and_zero_qty(scan_setup,
     assert await strategy._check_entry("005930", watchlist_item_stage2, {"KOSPI": True}) is None
 
 
+@pytest.mark.asyncio
+async def test_check_entry_rejections_are_counted_on_funnel(scan_setup, watchlist_item_stage2):
+    """entry_rejected 로그 1건마다 funnel 거절 1건 — 삭제된 로그 핸들러 집계와 같은 수."""
+    strategy, sqs, _, indicator, _, logger = scan_setup
+
+    indicator.get_rsi.return_value = _rsi_resp(15.0)
+    await strategy._check_entry("005930", watchlist_item_stage2, {"KOSPI": True})
+    indicator.get_rsi.return_value = _rsi_resp(8.0)
+    sqs.get_current_price.return_value = _price_resp("0")
+    await strategy._check_entry("005930", watchlist_item_stage2, {"KOSPI": True})
+    watchlist_item_stage2.minervini_stage = 3
+    await strategy._check_entry("005930", watchlist_item_stage2, {"KOSPI": True})
+
+    logged = [
+        c.args[0]["reason"] for c in logger.info.call_args_list
+        if isinstance(c.args[0], dict) and c.args[0].get("event") == "entry_rejected"
+    ]
+    summary = strategy.funnel.daily_summary()
+    assert summary["rejected_reasons"] == {
+        "rsi_above_threshold": 1, "invalid_current_price": 1, "not_stage2": 1,
+    }
+    assert summary["rejected_total"] == len(logged) == 3
+
+
 # ── check_exits() 테스트 ─────────────────────────────────────────
 
 @pytest.fixture
@@ -930,6 +930,7 @@ class TestTraditionalVolumeBreakout(unittest.IsolatedAsyncioTestCase):
         sqs.sync_price_subscriptions.assert_awaited_once_with(
             ["A", "B"],
             category_key="strategy_traditional_volume_breakout",
+            trigger_levels={"A": 10500, "B": 10500},
         )
 
 
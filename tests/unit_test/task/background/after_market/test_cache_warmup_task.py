@@ -435,3 +435,160 @@ class TestForceWarmup:
         with patch.object(t, "_run_warmup", new_callable=AsyncMock) as mock_run:
             await t.force_run()
             mock_run.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# 일괄(bulk) 웜업 — ohlcv → indicators → prices + readiness
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def bulk_task(mock_mds, mock_sqs, mock_universe_service, mock_mcs, mock_market_clock):
+    repo = MagicMock()
+    repo.preload_stock_data = AsyncMock(side_effect=lambda codes, **kw: {
+        code: [{"date": "20260319", "close": 100}] for code in codes if code != "035420"
+    })
+    indicator_service = MagicMock()
+    indicator_service.warm_confirmed_indicators = MagicMock(return_value=4)
+    mock_sqs.prefetch_prices = AsyncMock(return_value=4)
+    return CacheWarmupTask(
+        market_data_service=mock_mds,
+        stock_query_service=mock_sqs,
+        universe_service=mock_universe_service,
+        market_calendar_service=mock_mcs,
+        market_clock=mock_market_clock,
+        logger=MagicMock(),
+        stock_repository=repo,
+        indicator_service=indicator_service,
+    )
+
+
+class TestBulkWarmup:
+
+    async def test_bulk_path_replaces_per_code_price_summary(self, bulk_task, mock_mds, mock_sqs):
+        await bulk_task._run_warmup("20260320")
+
+        mock_mds.get_price_summary.assert_not_awaited()
+        codes = ["000660", "005930", "035420", "035720"]
+        bulk_task._stock_repo.preload_stock_data.assert_awaited_once_with(
+            codes, ohlcv_limit=600, caller="cache_warmup",
+        )
+        assert bulk_task._indicator_service.warm_confirmed_indicators.call_count == 3
+        mock_sqs.prefetch_prices.assert_awaited_once_with(codes, count_stats=False)
+        assert bulk_task._last_warmed_date == "20260320"
+
+    async def test_publishes_readiness_with_coverage(self, bulk_task):
+        assert bulk_task.get_readiness()["ready"] is False
+
+        await bulk_task._run_warmup("20260320")
+
+        readiness = bulk_task.get_readiness()
+        assert readiness["ready"] is True
+        assert readiness["trading_date"] == "20260320"
+        assert readiness["coverage"] == {"total": 4, "ohlcv": 3, "indicators": 3, "prices": 4}
+        assert set(readiness["phase_ms"]) == {"ohlcv", "indicators", "prices"}
+        assert bulk_task.get_progress()["coverage"] == readiness["coverage"]
+
+    async def test_wait_until_ready(self, bulk_task):
+        assert await bulk_task.wait_until_ready(timeout=0.01) is False
+        await bulk_task._run_warmup("20260320")
+        assert await bulk_task.wait_until_ready(timeout=0.01) is True
+
+    async def test_indicator_and_price_failures_do_not_block_readiness(self, bulk_task, mock_sqs):
+        bulk_task._indicator_service.warm_confirmed_indicators.side_effect = ValueError("boom")
+        mock_sqs.prefetch_prices.side_effect = RuntimeError("rest down")
+
+        await bulk_task._run_warmup("20260320")
+
+        readiness = bulk_task.get_readiness()
+        assert readiness["ready"] is True
+        assert readiness["coverage"]["indicators"] == 0
+        assert readiness["coverage"]["prices"] == 0
+
+
+def _bench_records(codes, n_days):
+    dates = [f"{2024 + d // 336}{1 + d % 336 // 28:02d}{1 + d % 28:02d}" for d in range(n_days)]
+    return [
+        {"code": code, "date": day, "open": 10_000 + (i * 7 + d) % 300, "high": 10_400, "low": 9_600,
+         "close": 10_000 + (i * 13 + d * 7) % 400, "volume": 1_000 + d}
+        for i, code in enumerate(codes) for d, day in enumerate(dates)
+    ]
+
+
+async def _first_scan(repo, indicators, codes, n_days):
+    """장중 첫 scan: 일봉 + RSI2/MA5/MA200/ATR14 (exclude_today)."""
+    for code in codes:
+        rows = (await repo.get_stock_data(code, ohlcv_limit=n_days))["ohlcv"]
+        rows = rows + [{**rows[-1], "date": "20991231"}]  # 장중 today row 병합
+        await indicators.get_rsi(code, period=2, ohlcv_data=rows, exclude_today=True)
+        await indicators.get_moving_average(code, period=5, ohlcv_data=rows, exclude_today=True)
+        await indicators.get_moving_average(code, period=200, ohlcv_data=rows, exclude_today=True)
+        await indicators.calculate_atr(code, period=14, ohlcv_data=rows, exclude_today=True)
+
+
+async def _scan_with_optional_warmup(tmp_path, test_cache_config, codes, n_days, warm):
+    """(scan 초, 웜업 초, scan 중 지표 캐시 신규 저장 수) — 웜업이 되어 있으면 scan 은 지표를 다시 계산하지 않는다."""
+    import time
+
+    from core.cache.cache_store import CacheStore
+    from repositories.stock_repository import StockRepository
+    from services.indicator_service import IndicatorService
+
+    repo = StockRepository(db_path=str(tmp_path / f"bench_{warm}.db"))
+    await repo.upsert_ohlcv(_bench_records(codes, n_days))
+    indicators = IndicatorService(None, cache_store=CacheStore(config=test_cache_config))
+    warmup_sec = 0.0
+    try:
+        if warm:
+            task = CacheWarmupTask(
+                market_data_service=MagicMock(), stock_query_service=None, universe_service=None,
+                market_calendar_service=MagicMock(), market_clock=MagicMock(), logger=MagicMock(),
+                stock_repository=repo, indicator_service=indicators,
+            )
+            task._collect_target_codes = AsyncMock(return_value=set(codes))
+            started = time.perf_counter()
+            await task._run_warmup("20991231")
+            warmup_sec = time.perf_counter() - started
+            assert task.get_readiness()["coverage"]["indicators"] == len(codes)
+
+        cache_sets = []
+        original_set = indicators.cache_store.set
+
+        def _counting_set(key, value, *args, **kwargs):
+            cache_sets.append(key)
+            return original_set(key, value, *args, **kwargs)
+
+        indicators.cache_store.set = _counting_set
+        started = time.perf_counter()
+        await _first_scan(repo, indicators, codes, n_days)
+        return time.perf_counter() - started, warmup_sec, len(cache_sets)
+    finally:
+        await repo.close()
+
+
+async def test_first_scan_after_bulk_warmup_computes_no_indicators(tmp_path, test_cache_config):
+    """웜업 없이 첫 scan 은 종목 × 지표 4개를 새로 계산·저장하고, 웜업 뒤에는 하나도 저장하지 않는다."""
+    codes = [f"{i:06d}" for i in range(4)]
+
+    _, _, cold_sets = await _scan_with_optional_warmup(tmp_path, test_cache_config, codes, 250, warm=False)
+    _, _, warm_sets = await _scan_with_optional_warmup(tmp_path, test_cache_config, codes, 250, warm=True)
+
+    assert (cold_sets, warm_sets) == (len(codes) * 4, 0)
+
+
+@pytest.mark.slow
+@pytest.mark.real_sleep
+async def test_benchmark_first_scan_latency_with_and_without_bulk_warmup(tmp_path, test_cache_config):
+    """40종목 × 400일: 장중 첫 scan 지연 — 웜업 전후 (시간은 보고만 한다)."""
+    codes = [f"{i:06d}" for i in range(40)]
+    results = {
+        warm: await _scan_with_optional_warmup(tmp_path, test_cache_config, codes, 400, warm)
+        for warm in (False, True)
+    }
+
+    (cold_sec, _, cold_sets), (warm_sec, warmup_sec, warm_sets) = results[False], results[True]
+    print(
+        f"\n[first scan 40 codes x 400 days] cold={cold_sec * 1000:.0f}ms "
+        f"warm={warm_sec * 1000:.0f}ms (pre-open warmup {warmup_sec * 1000:.0f}ms) "
+        f"speedup={cold_sec / warm_sec:.1f}x"
+    )
+    assert (cold_sets, warm_sets) == (len(codes) * 4, 0)
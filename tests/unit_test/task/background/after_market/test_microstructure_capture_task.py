@@ -95,8 +95,8 @@ def _make_task(capture_service, tmp_path, **kwargs):
         capture_service=capture_service,
         output_dir=tmp_path / "out",
         program_db_path=tmp_path / "program_trading.db",
-        execution_strength_db_path=tmp_path / "execution_strength.db",
-        orderbook_db_path=tmp_path / "orderbook_snapshots.db",
+        execution_strength_dir=tmp_path / "execution_strength",
+        orderbook_dir=tmp_path / "orderbook_snapshots",
         logger=MagicMock(),
         quality_retry_attempts=0,
     )
@@ -585,15 +585,15 @@ def test_write_output_dir_passed_through(capture_service, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_execution_strength_source_auto_selects_es_db_when_db_exists(
+async def test_execution_strength_source_auto_selects_es_db_when_day_segment_exists(
     capture_service, universe_service, tmp_path
 ):
-    es_db = tmp_path / "execution_strength.db"
-    es_db.write_bytes(b"")
+    es_dir = tmp_path / "execution_strength"
+    (es_dir / "20260702").mkdir(parents=True)
     task = _make_task(
         capture_service, tmp_path,
         universe_service=universe_service,
-        execution_strength_db_path=es_db,
+        execution_strength_dir=es_dir,
     )
 
     await task._on_market_closed("20260702")
@@ -620,16 +620,16 @@ async def test_execution_strength_source_falls_back_to_rest_scalar_without_db(
 
 
 @pytest.mark.asyncio
-async def test_orderbook_source_auto_selects_db_when_file_exists(
+async def test_orderbook_source_auto_selects_db_when_day_segment_exists(
     capture_service, universe_service, tmp_path
 ):
-    orderbook_db = tmp_path / "orderbook_snapshots.db"
-    orderbook_db.write_bytes(b"")
+    orderbook_dir = tmp_path / "orderbook_snapshots"
+    (orderbook_dir / "20260702").mkdir(parents=True)
     task = _make_task(
         capture_service,
         tmp_path,
         universe_service=universe_service,
-        orderbook_db_path=orderbook_db,
+        orderbook_dir=orderbook_dir,
     )
 
     await task._on_market_closed("20260702")
@@ -652,12 +652,12 @@ async def test_execution_strength_metrics_exposed_in_last_result(
         "000660": [],
     }
     capture_service.capture = AsyncMock(return_value=payload)
-    es_db = tmp_path / "execution_strength.db"
-    es_db.write_bytes(b"")
+    es_dir = tmp_path / "execution_strength"
+    (es_dir / "20260702").mkdir(parents=True)
     task = _make_task(
         capture_service, tmp_path,
         universe_service=universe_service,
-        execution_strength_db_path=es_db,
+        execution_strength_dir=es_dir,
     )
 
     await task._on_market_closed("20260702")
@@ -100,3 +100,19 @@ def test_task_identity_and_initial_progress():
         "sent_count": 0,
         "last_error": None,
     }
+
+
+@pytest.mark.asyncio
+async def test_execute_skips_when_lazy_theme_service_failed_to_build():
+    from core.lazy_service import LazyService
+
+    def _broken():
+        raise RuntimeError("db open failed")
+
+    deps = _make_task()
+    deps.task._theme_daily_leader_service = LazyService(_broken, name="theme_daily_leader_service", logger=MagicMock())
+
+    await deps.task.execute({"date": "20260630"})
+
+    deps.telegram_reporter.send_daily_theme_report.assert_not_called()
+    assert deps.task.get_progress()["last_error"] == "theme_service_unavailable"
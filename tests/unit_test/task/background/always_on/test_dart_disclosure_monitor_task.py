@@ -1,8 +1,9 @@
+import asyncio
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-from repositories.dart_disclosure_repository import StoredDisclosure
+from repositories.dart_disclosure_repository import DartDisclosureRepository, StoredDisclosure
 from services.ai_disclosure_analyzer import AiDisclosureAnalysis
 from services.dart_disclosure_client import DartDisclosure, DartDisclosurePage
 from services.dart_disclosure_rule_service import DisclosureImportance
@@ -51,6 +52,10 @@ def _make_task(
     repo.has_receipt = AsyncMock(return_value=False)
     repo.get_known_receipt_nos = AsyncMock(return_value=set())
     repo.save_detected = AsyncMock(return_value=True)
+    repo.get_receipt_cursor = AsyncMock(return_value="")
+    repo.advance_receipt_cursor = AsyncMock()
+    repo.get_pending_analysis = AsyncMock(return_value=[])
+    repo.save_analysis = AsyncMock(return_value=False)
     repo.get_pending_immediate = AsyncMock(return_value=[])
     repo.mark_immediate_sent = AsyncMock()
     repo.increment_send_retry = AsyncMock()
@@ -67,6 +72,7 @@ def _make_task(
     reporter = MagicMock()
     reporter.send_disclosure_alert = AsyncMock(return_value=True)
     reporter.send_disclosure_digest = AsyncMock(return_value=True)
+    reporter.send_disclosure_ai_update = AsyncMock(return_value=True)
     config = SimpleNamespace(
         poll_interval_sec=300,
         off_hours_interval_sec=1800,
@@ -76,6 +82,9 @@ def _make_task(
         daily_digest_enabled=True,
         daily_digest_time="19:40",
         max_pages_per_poll=5,
+        ai_analysis_concurrency=3,
+        ai_analysis_timeout_sec=45.0,
+        ai_analysis_batch_size=20,
     )
     task = DartDisclosureMonitorTask(
         client=client,
@@ -156,7 +165,7 @@ async def test_favorite_codes_are_zero_padded_before_matching_recent_missed_case
     assert deps.task.get_progress()["matched_count"] == 2
 
 
-async def test_ai_summary_is_attached_to_immediate_alert_when_analyzer_present():
+async def test_rule_alert_goes_out_before_ai_enrichment_update():
     disclosure = _disclosure()
     importance = DisclosureImportance(85, "HIGH", ["자금조달·주식 희석 관련 공시"])
     analyzer = MagicMock()
@@ -165,22 +174,37 @@ async def test_ai_summary_is_attached_to_immediate_alert_when_analyzer_present()
     )
     deps = _make_task([disclosure], initialized=True, ai_analyzer=analyzer)
     deps.repo.get_pending_immediate.return_value = [StoredDisclosure(disclosure, importance)]
+    deps.repo.get_pending_analysis.return_value = [StoredDisclosure(disclosure, importance)]
+    deps.repo.save_analysis.return_value = True  # 즉시 알림이 이미 나감
+    order = []
+    deps.reporter.send_disclosure_alert.side_effect = lambda *a, **k: order.append("alert") or True
+    deps.reporter.send_disclosure_ai_update.side_effect = lambda *a, **k: order.append("update") or True
 
     await deps.task._tick()
 
-    analyzer.analyze.assert_awaited_once_with(disclosure, importance, "공시 실제 본문")
+    assert deps.repo.save_detected.await_args.kwargs["analysis_pending"] is True
+    assert order == ["alert", "update"]
     deps.reporter.send_disclosure_alert.assert_awaited_once_with(
-        disclosure, importance, ai_summary="전환사채 발행 요약"
+        disclosure, importance, ai_summary=None
+    )
+    analyzer.analyze.assert_awaited_once_with(disclosure, importance, "공시 실제 본문")
+    deps.repo.save_analysis.assert_awaited_once_with(
+        disclosure.receipt_no, importance, event_key="", summary="전환사채 발행 요약"
+    )
+    deps.reporter.send_disclosure_ai_update.assert_awaited_once_with(
+        disclosure, importance, "전환사채 발행 요약"
     )
+    assert deps.task.get_progress()["ai_update_sent_count"] == 1
 
 
-async def test_ai_analyzer_failure_falls_back_to_rule_only_alert():
+async def test_ai_analyzer_failure_keeps_rule_judgement_without_update():
     disclosure = _disclosure()
     importance = DisclosureImportance(85, "HIGH", ["중요"])
     analyzer = MagicMock()
     analyzer.analyze = AsyncMock(return_value=None)  # 폴백 신호
     deps = _make_task([disclosure], initialized=True, ai_analyzer=analyzer)
     deps.repo.get_pending_immediate.return_value = [StoredDisclosure(disclosure, importance)]
+    deps.repo.get_pending_analysis.return_value = [StoredDisclosure(disclosure, importance)]
 
     await deps.task._tick()
 
@@ -188,44 +212,64 @@ async def test_ai_analyzer_failure_falls_back_to_rule_only_alert():
         disclosure, importance, ai_summary=None
     )
     deps.repo.mark_immediate_sent.assert_awaited_once()
+    deps.repo.save_analysis.assert_awaited_once_with(disclosure.receipt_no)
+    deps.reporter.send_disclosure_ai_update.assert_not_awaited()
 
 
-async def test_telegram_retry_reuses_ai_summary_without_second_ai_call():
+async def test_telegram_retry_reuses_stored_ai_summary_without_ai_call():
     disclosure = _disclosure()
     importance = DisclosureImportance(85, "HIGH", ["중요"])
     analyzer = MagicMock()
-    analyzer.analyze = AsyncMock(
-        return_value=AiDisclosureAnalysis("재사용할 요약", importance)
-    )
+    analyzer.analyze = AsyncMock()
     deps = _make_task([disclosure], initialized=True, ai_analyzer=analyzer)
-    deps.repo.get_pending_immediate.return_value = [StoredDisclosure(disclosure, importance)]
+    deps.repo.get_pending_immediate.return_value = [
+        StoredDisclosure(disclosure, importance, summary="재사용할 요약")
+    ]
     deps.reporter.send_disclosure_alert.side_effect = [False, True]
 
     await deps.task._send_pending_immediate(deps.task._market_clock.now)
     await deps.task._send_pending_immediate(deps.task._market_clock.now)
 
-    analyzer.analyze.assert_awaited_once_with(disclosure, importance, "공시 실제 본문")
+    analyzer.analyze.assert_not_awaited()
     assert deps.reporter.send_disclosure_alert.await_count == 2
     for call in deps.reporter.send_disclosure_alert.await_args_list:
         assert call.kwargs["ai_summary"] == "재사용할 요약"
 
 
-async def test_telegram_retry_reuses_rule_fallback_without_second_ai_call():
-    disclosure = _disclosure()
-    importance = DisclosureImportance(85, "HIGH", ["중요"])
+async def test_analysis_stage_bounds_concurrency_and_applies_deadline_per_item():
+    items = [
+        StoredDisclosure(_disclosure(receipt_no=f"2026071400000{i}"), DisclosureImportance(85, "HIGH", ["중요"]))
+        for i in range(1, 6)
+    ]
+    stuck_receipt = items[0].disclosure.receipt_no
+    active = {"now": 0, "max": 0}
+
+    async def analyze(disclosure, preliminary, text):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        try:
+            if disclosure.receipt_no == stuck_receipt:
+                await asyncio.get_running_loop().create_future()  # 응답 없는 AI 호출
+            await asyncio.sleep(0)
+            return AiDisclosureAnalysis(f"요약 {disclosure.receipt_no}", preliminary)
+        finally:
+            active["now"] -= 1
+
     analyzer = MagicMock()
-    analyzer.analyze = AsyncMock(return_value=None)
-    deps = _make_task([disclosure], initialized=True, ai_analyzer=analyzer)
-    deps.repo.get_pending_immediate.return_value = [StoredDisclosure(disclosure, importance)]
-    deps.reporter.send_disclosure_alert.side_effect = [False, True]
+    analyzer.analyze = AsyncMock(side_effect=analyze)
+    deps = _make_task([], ai_analyzer=analyzer)
+    deps.task._config.ai_analysis_concurrency = 2
+    deps.task._config.ai_analysis_timeout_sec = 0.05
+    deps.repo.get_pending_analysis.return_value = items
+    deps.repo.save_analysis.return_value = True
 
-    await deps.task._send_pending_immediate(deps.task._market_clock.now)
-    await deps.task._send_pending_immediate(deps.task._market_clock.now)
+    await deps.task._run_analysis_stage()
 
-    analyzer.analyze.assert_awaited_once_with(disclosure, importance, "공시 실제 본문")
-    assert deps.reporter.send_disclosure_alert.await_count == 2
-    for call in deps.reporter.send_disclosure_alert.await_args_list:
-        assert call.kwargs["ai_summary"] is None
+    assert active["max"] == 2
+    assert deps.reporter.send_disclosure_ai_update.await_count == 4
+    deps.repo.save_analysis.assert_any_await(stuck_receipt)
+    assert deps.repo.save_analysis.await_args_list[-1].args == (stuck_receipt,)  # 느린 건이 나머지를 막지 않는다
+    assert deps.task.get_progress()["analysis_timeout_count"] == 1
 
 
 async def test_non_favorite_disclosure_is_ignored():
@@ -308,18 +352,21 @@ async def test_actual_content_analysis_can_promote_low_title_to_immediate_alert(
     disclosure = _disclosure(report_name="기업가치제고계획(자율공시)")
     preliminary = DisclosureImportance(10, "LOW", ["일반 공시"])
     promoted = DisclosureImportance(75, "HIGH", ["신제품·생산능력·해외진출 계획"])
+    summary = "하이브리드 본더 공장과 미국 법인 설립을 추진합니다."
     analyzer = MagicMock()
     analyzer.analyze = AsyncMock(
         return_value=AiDisclosureAnalysis(
-            "하이브리드 본더 공장과 미국 법인 설립을 추진합니다.",
+            summary,
             promoted,
             "기업가치제고|하이브리드본더|2027상반기",
         )
     )
     deps = _make_task([disclosure], initialized=True, ai_analyzer=analyzer)
     deps.rules.evaluate.return_value = preliminary
-    deps.repo.get_pending_immediate.return_value = [
-        StoredDisclosure(disclosure, promoted)
+    deps.repo.get_pending_analysis.return_value = [StoredDisclosure(disclosure, preliminary)]
+    deps.repo.get_pending_immediate.side_effect = [
+        [],
+        [StoredDisclosure(disclosure, promoted, summary=summary)],
     ]
 
     await deps.task._tick()
@@ -328,17 +375,63 @@ async def test_actual_content_analysis_can_promote_low_title_to_immediate_alert(
     analyzer.analyze.assert_awaited_once_with(
         disclosure, preliminary, "공시 실제 본문"
     )
-    assert deps.repo.save_detected.await_args.args[1] == promoted
-    assert (
-        deps.repo.save_detected.await_args.kwargs["event_key"]
-        == "기업가치제고|하이브리드본더|2027상반기"
-    )
-    assert (
-        deps.repo.save_detected.await_args.kwargs["summary"]
-        == "하이브리드 본더 공장과 미국 법인 설립을 추진합니다."
+    assert deps.repo.save_detected.await_args.args[1] == preliminary
+    deps.repo.save_analysis.assert_awaited_once_with(
+        disclosure.receipt_no,
+        promoted,
+        event_key="기업가치제고|하이브리드본더|2027상반기",
+        summary=summary,
     )
     deps.reporter.send_disclosure_alert.assert_awaited_once_with(
-        disclosure,
-        promoted,
-        ai_summary="하이브리드 본더 공장과 미국 법인 설립을 추진합니다.",
+        disclosure, promoted, ai_summary=summary
     )
+    deps.reporter.send_disclosure_ai_update.assert_not_awaited()
+
+
+class _PagedDartClient:
+    """최신순 페이지 fixture 를 돌려주는 로컬 가짜 OpenDART 클라이언트."""
+
+    def __init__(self, items, page_size):
+        self.items = list(items)
+        self.page_size = page_size
+        self.requested_pages = []
+
+    async def fetch_disclosures(self, date, *, page_no=1, page_count=100):
+        self.requested_pages.append(page_no)
+        ordered = sorted(self.items, key=lambda item: item.receipt_no, reverse=True)
+        total_page = max(1, -(-len(ordered) // self.page_size))
+        start = (page_no - 1) * self.page_size
+        return DartDisclosurePage(
+            ordered[start:start + self.page_size], page_no, self.page_size, len(ordered), total_page
+        )
+
+    async def fetch_disclosure_text(self, receipt_no):
+        return "공시 실제 본문"
+
+
+async def test_receipt_cursor_stops_paging_at_already_seen_receipts(tmp_path):
+    others = [_disclosure(code="000660", receipt_no=f"202607140000{i:02d}") for i in range(1, 10)]
+    client = _PagedDartClient(others, page_size=3)
+    repository = DartDisclosureRepository(tmp_path / "dart.db")
+    await repository.mark_initialized()
+    deps = _make_task([], initialized=True)
+    deps.task._client = client
+    deps.task._repository = repository
+    try:
+        await deps.task._tick()
+        assert client.requested_pages == [1, 2, 3]
+        assert await repository.get_receipt_cursor("20260714") == "20260714000009"
+
+        client.items.append(_disclosure(receipt_no="20260714000010"))
+        client.requested_pages.clear()
+        await deps.task._tick()
+
+        assert client.requested_pages == [1]  # 커서 이하가 보이는 첫 페이지에서 멈춘다
+        assert await repository.get_receipt_cursor("20260714") == "20260714000010"
+        assert await repository.has_receipt("20260714000010") is True
+        deps.reporter.send_disclosure_alert.assert_awaited_once()
+
+        await deps.task._tick()
+        deps.reporter.send_disclosure_alert.assert_awaited_once()
+    finally:
+        await repository.close()
@@ -40,7 +40,6 @@ def queue_task(ns):
     """핸들러 없이 생성된 NotificationQueueTask."""
     return NotificationQueueTask(
         notification_service=ns,
-        poll_interval=0,
         logger=MagicMock(),
     )
 
@@ -180,7 +179,7 @@ async def test_get_progress_reflects_queue_size(ns):
     """emit() 후 get_progress의 queued_events가 큐 크기를 반영해야 한다."""
     # 핸들러를 등록해야 emit()이 external_handler_queue에 적재한다
     ns.register_external_handler(AsyncMock())
-    task = NotificationQueueTask(ns, poll_interval=0, logger=MagicMock())
+    task = NotificationQueueTask(ns, logger=MagicMock())
 
     await task.start()
     await task.suspend()  # 처리 중단 후 이벤트 적재
@@ -202,7 +201,7 @@ async def test_drain_loop_calls_all_handlers(ns):
     handler2 = AsyncMock()
     ns.register_external_handler(handler1)
     ns.register_external_handler(handler2)
-    task = NotificationQueueTask(ns, poll_interval=0, logger=MagicMock())
+    task = NotificationQueueTask(ns, logger=MagicMock())
 
     event = await ns.emit(NotificationCategory.STRATEGY, NotificationLevel.INFO, "시그널", "삼성전자 매수")
 
@@ -223,7 +222,7 @@ async def test_drain_loop_processes_events_in_order(ns):
         call_order.append(event.title)
 
     ns.register_external_handler(tracking_handler)
-    task = NotificationQueueTask(ns, poll_interval=0, logger=MagicMock())
+    task = NotificationQueueTask(ns, logger=MagicMock())
 
     await ns.emit(NotificationCategory.SYSTEM, NotificationLevel.INFO, "first", "m")
     await ns.emit(NotificationCategory.SYSTEM, NotificationLevel.INFO, "second", "m")
@@ -244,7 +243,7 @@ async def test_drain_loop_handler_exception_does_not_stop_processing(ns):
 
     ns.register_external_handler(fail_handler)
     ns.register_external_handler(ok_handler)
-    task = NotificationQueueTask(ns, poll_interval=0, logger=MagicMock())
+    task = NotificationQueueTask(ns, logger=MagicMock())
 
     event = await ns.emit(NotificationCategory.SYSTEM, NotificationLevel.ERROR, "장애", "m")
 
@@ -263,7 +262,6 @@ async def test_drain_loop_filters_telegram_by_category_level(ns):
     ns.register_external_handler(handler)
     task = NotificationQueueTask(
         ns,
-        poll_interval=0,
         telegram_config=SimpleNamespace(
             enabled=True,
             route_levels={
@@ -292,7 +290,6 @@ async def test_drain_loop_sends_force_external_event_even_when_level_filtered(ns
     ns.register_external_handler(handler)
     task = NotificationQueueTask(
         ns,
-        poll_interval=0,
         telegram_config=SimpleNamespace(
             enabled=True,
             route_levels={"STRATEGY": ["warning", "error", "critical"]},
@@ -321,7 +318,6 @@ async def test_drain_loop_skips_external_when_telegram_disabled(ns):
     ns.register_external_handler(handler)
     task = NotificationQueueTask(
         ns,
-        poll_interval=0,
         telegram_config=SimpleNamespace(enabled=False, route_levels={}),
         logger=MagicMock(),
     )
@@ -338,7 +334,7 @@ async def test_drain_loop_skips_external_when_telegram_disabled(ns):
 @pytest.mark.asyncio
 async def test_drain_loop_no_handler_registered(ns):
     """외부 핸들러가 없어도 큐가 정상 소비된다."""
-    task = NotificationQueueTask(ns, poll_interval=0, logger=MagicMock())
+    task = NotificationQueueTask(ns, logger=MagicMock())
 
     await ns.emit(NotificationCategory.SYSTEM, NotificationLevel.INFO, "t", "m")
 
@@ -357,7 +353,7 @@ async def test_suspend_accumulates_events_without_calling_handlers(ns):
     """SUSPENDED 상태에서 emit()된 이벤트는 큐에 쌓이고 핸들러는 호출되지 않는다."""
     handler = AsyncMock()
     ns.register_external_handler(handler)
-    task = NotificationQueueTask(ns, poll_interval=0, logger=MagicMock())
+    task = NotificationQueueTask(ns, logger=MagicMock())
 
     await task.start()
     await task.suspend()
@@ -382,7 +378,7 @@ async def test_suspend_accumulates_events_without_calling_handlers(ns):
 @pytest.mark.asyncio
 async def test_drain_loop_continues_when_queue_get_times_out(ns):
     logger = MagicMock()
-    task = NotificationQueueTask(ns, poll_interval=0, logger=logger)
+    task = NotificationQueueTask(ns, logger=logger)
     task._resume_event = asyncio.Event()
     task._resume_event.set()
 
@@ -399,7 +395,7 @@ async def test_drain_loop_continues_when_queue_get_times_out(ns):
 @pytest.mark.asyncio
 async def test_drain_loop_logs_unexpected_exception_and_keeps_running(ns):
     logger = MagicMock()
-    task = NotificationQueueTask(ns, poll_interval=0, logger=logger)
+    task = NotificationQueueTask(ns, logger=logger)
     task._resume_event = MagicMock()
     task._resume_event.wait = AsyncMock(
         side_effect=[RuntimeError("resume event broken"), asyncio.CancelledError()]
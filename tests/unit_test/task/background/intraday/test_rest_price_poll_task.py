@@ -0,0 +1,56 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from task.background.intraday.rest_price_poll_task import RestPricePollTask
+
+
+def _task(*, operating=True, business_day=True):
+    poller = MagicMock()
+    poller.run_sweep = AsyncMock(return_value=3)
+    poller.get_stats.return_value = {"calls": 1}
+    market_clock = MagicMock()
+    market_clock.get_current_kst_time.return_value = datetime(2026, 8, 3, 10, 0)
+    market_clock.is_market_operating_hours.return_value = operating
+    market_calendar = MagicMock()
+    market_calendar.is_business_day = AsyncMock(return_value=business_day)
+    task = RestPricePollTask(
+        poller=poller,
+        market_clock=market_clock,
+        market_calendar_service=market_calendar,
+        logger=MagicMock(),
+    )
+    return task, poller, market_calendar
+
+
+@pytest.mark.asyncio
+async def test_tick_sweeps_during_market_hours_and_caches_business_day():
+    task, poller, market_calendar = _task()
+
+    await task._tick()
+    await task._tick()
+
+    assert poller.run_sweep.await_count == 2
+    market_calendar.is_business_day.assert_awaited_once_with("20260803")
+    assert task.get_progress() == {"running": False, "calls": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("operating", "business_day"), [(False, True), (True, False)])
+async def test_tick_skips_outside_market(operating, business_day):
+    task, poller, _ = _task(operating=operating, business_day=business_day)
+
+    await task._tick()
+
+    poller.run_sweep.assert_not_awaited()
+    poller.clear_intervals.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_suspend_clears_poller_intervals():
+    task, poller, _ = _task()
+
+    await task.suspend()
+
+    poller.clear_intervals.assert_called_once()
@@ -205,3 +205,20 @@ async def test_latest_report_is_refreshed_each_minute_without_extra_telegram():
     latest = deps.task.get_latest_report()
     assert latest["captured_at"] == "20260706 10:14"
     assert latest["data"][0]["normalized_name"] == "반도체"
+
+
+@pytest.mark.asyncio
+async def test_failed_lazy_theme_service_skips_without_attribute_error():
+    from core.lazy_service import LazyService
+
+    def _broken():
+        raise RuntimeError("db open failed")
+
+    deps = _make_task()
+    deps.task._theme_daily_leader_service = LazyService(_broken, name="theme_daily_leader_service", logger=MagicMock())
+
+    await deps.task._tick()
+
+    deps.ranking_task.refresh_basic_ranking.assert_not_called()
+    deps.telegram_reporter.send_daily_theme_report.assert_not_called()
+    assert deps.task.get_progress()["last_error"] == "theme_service_unavailable"
@@ -0,0 +1,46 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from task.background.intraday.warm_restart_snapshot_task import WarmRestartSnapshotTask
+
+
+def _task(operating=True):
+    service = MagicMock()
+    service.capture = AsyncMock(return_value={
+        "trading_date": "20260105", "bytes": 1024, "ohlcv_codes": 3, "indicator_series": 12, "elapsed_ms": 4.0,
+    })
+    clock = MagicMock()
+    clock.get_current_kst_time.return_value = datetime(2026, 1, 5, 10, 0)
+    clock.is_market_operating_hours.return_value = operating
+    return WarmRestartSnapshotTask(snapshot_service=service, market_clock=clock, logger=MagicMock(), interval_sec=5), service
+
+
+async def test_run_once_captures_with_today_trading_date():
+    task, service = _task()
+
+    result = await task.run_once()
+
+    service.capture.assert_awaited_once_with("20260105")
+    assert result["saved"] is True and task.get_progress()["capture_count"] == 1
+
+
+async def test_run_once_failure_is_logged_not_raised():
+    task, service = _task()
+    service.capture.side_effect = OSError("disk full")
+
+    result = await task.run_once()
+
+    assert result == {"saved": False, "reason": "disk full"}
+    task._logger.warning.assert_called_once()
+
+
+async def test_loop_skips_outside_market_hours_and_stop_saves_only_after_first_capture():
+    task, service = _task(operating=False)
+    await task.start()
+    await task.stop()
+    service.capture.assert_not_awaited()
+
+    task, service = _task(operating=True)
+    await task.run_once()
+    await task.stop()
+    assert service.capture.await_count == 2  # 주기 저장 1회 + 종료 직전 저장 1회
@@ -33,6 +33,7 @@ def mock_web_app_context_cls():
         mock_instance = MockClass.return_value
         mock_instance.load_config_and_env = MagicMock()
         mock_instance.initialize_services = AsyncMock(return_value=True)
+        mock_instance.prewarm_websocket = AsyncMock(return_value=True)
         mock_instance.initialize_scheduler = MagicMock()
         mock_instance.ensure_strategy_states_loaded = AsyncMock()
         mock_instance.scheduler = MagicMock()
@@ -68,6 +69,7 @@ async def test_lifespan_startup_shutdown(mock_web_app_context_cls, mock_web_api_
         mock_web_app_context_cls.assert_called_once()
         mock_ctx.load_config_and_env.assert_called_once()
         mock_ctx.initialize_services.assert_awaited_once_with(is_paper_trading=True)
+        mock_ctx.prewarm_websocket.assert_awaited_once()
         mock_web_api_module.set_ctx.assert_called_once_with(mock_ctx)
         mock_ctx.initialize_scheduler.assert_called_once()
         # restore_state 는 BackgroundScheduler 어댑터에서 단일 진입하므로
@@ -0,0 +1,110 @@
+"""BootstrapGraph 단위 테스트.
+
+- 의존 관계가 없는 단계는 동시에 실행되고, 의존 단계는 선행 단계 완료 후 시작한다.
+- 실패 단계의 하위 단계는 skipped, 무관한 단계는 끝까지 실행된다.
+"""
+import asyncio
+import itertools
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from view.web.bootstrap.bootstrap_graph import (
+    PHASE_FAILED,
+    PHASE_OK,
+    PHASE_SKIPPED,
+    BootstrapGraph,
+)
+
+
+async def test_independent_phases_overlap_and_dependents_wait():
+    # 시계는 호출마다 1씩 증가하는 카운터 — 단계 시작·종료 기록의 선후만 비교한다 (벽시계 무관).
+    ticks = itertools.count()
+    graph = BootstrapGraph(clock=lambda: float(next(ticks)))
+    order = []
+    token_started = threading.Event()
+    code_master_started = threading.Event()
+
+    async def token():
+        token_started.set()
+        # code_master 가 동시에 돌고 있어야 풀린다 — 순차 실행이면 타임아웃으로 단계가 실패한다.
+        assert await asyncio.to_thread(code_master_started.wait, 5)
+        order.append("token")
+
+    def code_master():
+        code_master_started.set()
+        assert token_started.wait(5)
+        order.append("code_master")
+
+    def broker():
+        order.append("broker")
+
+    graph.add("token", token)
+    graph.add("code_master", code_master, blocking=True)
+    graph.add("broker", broker, depends_on=("token", "code_master"))
+
+    assert await graph.run() is True
+
+    assert order[-1] == "broker"
+    timings = {row["phase"]: row for row in graph.timings()}
+    token_end = timings["token"]["start_ms"] + timings["token"]["duration_ms"]
+    code_master_end = timings["code_master"]["start_ms"] + timings["code_master"]["duration_ms"]
+    assert timings["code_master"]["start_ms"] < token_end
+    assert timings["token"]["start_ms"] < code_master_end
+    assert timings["broker"]["start_ms"] > max(token_end, code_master_end)
+    assert timings["broker"]["depends_on"] == ["token", "code_master"]
+
+
+async def test_failure_skips_dependents_but_runs_independent_phases():
+    logger = MagicMock()
+    graph = BootstrapGraph(logger=logger)
+    ran = []
+
+    async def token():
+        return False
+
+    def sqlite():
+        ran.append("sqlite")
+
+    def explode():
+        raise RuntimeError("boom")
+
+    graph.add("token", token)
+    graph.add("sqlite", sqlite, blocking=True)
+    graph.add("broker", lambda: ran.append("broker"), depends_on=("token",))
+    graph.add("services", lambda: ran.append("services"), depends_on=("broker", "sqlite"))
+    graph.add("audit", explode, depends_on=("sqlite",))
+
+    assert await graph.run() is False
+
+    assert ran == ["sqlite"]
+    assert graph.phase("token").status == PHASE_FAILED
+    assert graph.phase("sqlite").status == PHASE_OK
+    assert graph.phase("broker").status == PHASE_SKIPPED
+    assert graph.phase("services").status == PHASE_SKIPPED
+    assert isinstance(graph.phase("audit").error, RuntimeError)
+    logger.critical.assert_called_once()
+    assert "broker=skipped" in graph.summary()
+
+
+def test_add_rejects_unknown_or_duplicate_phase():
+    graph = BootstrapGraph()
+    graph.add("token", lambda: None)
+    with pytest.raises(ValueError):
+        graph.add("token", lambda: None)
+    with pytest.raises(ValueError):
+        graph.add("broker", lambda: None, depends_on=("code_master",))
+
+
+async def test_record_appends_external_phase_timing():
+    graph = BootstrapGraph()
+    graph.add("token", lambda: True)
+    await graph.run()
+
+    graph.record("websocket", start_ms=5.0, duration_ms=12.34, status=PHASE_FAILED)
+
+    assert graph.succeeded is True  # 외부 기록은 기동 성공 여부에 영향을 주지 않는다
+    assert graph.timings()[-1] == {
+        "phase": "websocket", "status": PHASE_FAILED, "start_ms": 5.0, "duration_ms": 12.3, "depends_on": [],
+    }
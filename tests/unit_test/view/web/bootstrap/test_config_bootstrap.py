@@ -146,3 +146,28 @@ def test_config_bootstrap_creates_market_calendar_service(patched_bootstrap_deps
 
     patched_bootstrap_deps["mcs_cls"].assert_called_once()
     assert ctx._mcs is patched_bootstrap_deps["mcs_cls"].return_value
+
+
+def test_config_bootstrap_adaptive_rate_is_opt_in():
+    """api_adaptive_rate 는 기본 off — enabled 일 때만 설정 상한으로 adaptive limiter 를 만든다."""
+    from config.config_loader import ApiAdaptiveRateConfig
+    from view.web.bootstrap.config_bootstrap import ConfigBootstrap
+
+    ctx = _make_fake_context()
+    ctx.api_budget_limiter = static = object()
+    ConfigBootstrap._apply_adaptive_rate(ctx, ApiAdaptiveRateConfig())
+    assert ctx.api_budget_limiter is static
+
+    ConfigBootstrap._apply_adaptive_rate(ctx, ApiAdaptiveRateConfig(enabled=True, max_rate_ratio=1.5))
+    assert ctx.api_budget_limiter is not static
+    assert ctx.api_budget_limiter._adaptive.max_rate_ratio == 1.5
+
+
+def test_adaptive_rate_config_defaults_match_limiter_defaults():
+    """설정 모델과 limiter dataclass 의 기본값이 한 곳에서 나온다."""
+    from config.config_loader import ApiAdaptiveRateConfig
+    from core.retry_queue.api_budget_limiter import AdaptiveRateConfig
+
+    cfg, limiter_cfg = ApiAdaptiveRateConfig(), AdaptiveRateConfig()
+    for name in ("min_rate_ratio", "max_rate_ratio", "increase_per_sec", "decrease_factor"):
+        assert getattr(cfg, name) == getattr(limiter_cfg, name)
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+from core.lazy_service import resolve_lazy
 from view.web.bootstrap.market_data_bootstrap import MarketDataBootstrap
 
 
@@ -32,5 +33,6 @@ def test_market_data_bootstrap_builds_core_market_data_services():
     assert ctx.market_data_service is market_data.return_value
     assert ctx.indicator_service is indicator.return_value
     assert ctx.data_quality_service is quality.return_value
-    assert ctx.theme_trading_value_snapshot_repository is snapshots.return_value
+    snapshots.assert_not_called()  # 테마 리포트 저장소는 첫 사용 시점에 생성
+    assert resolve_lazy(ctx.theme_trading_value_snapshot_repository) is snapshots.return_value
     quality.return_value.apply_trading_mode.assert_called_once_with(True)
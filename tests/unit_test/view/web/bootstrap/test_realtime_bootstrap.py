@@ -33,6 +33,7 @@ def test_realtime_bootstrap_builds_streaming_chain():
     assert price_stream.call_args.kwargs["orderbook_recorder"] is orderbook_repo.return_value
     assert ctx.price_stream_service is price_stream.return_value
     assert ctx.price_subscription_service is subscriptions.return_value
+    assert subscriptions.call_args.kwargs["slot_allocator"] is None
     assert ctx.websocket_watchdog_task is watchdog.return_value
 
 
@@ -63,3 +64,28 @@ def test_realtime_bootstrap_passes_futures_sidecar_monitor_codes():
         RealtimeBootstrap(ctx).run(config=config, needs_realtime=True)
 
     assert streaming.call_args.kwargs["futures_sidecar_monitor_codes"] == ["101TEST"]
+
+
+def test_realtime_bootstrap_builds_slot_allocator_when_enabled():
+    ctx = SimpleNamespace(
+        broker=MagicMock(), logger=MagicMock(), market_clock=MagicMock(),
+        market_data_service=MagicMock(), streaming_event_logger=MagicMock(),
+        data_quality_service=MagicMock(), _mcs=MagicMock(),
+        kill_switch_service=MagicMock(), stock_repository=MagicMock(),
+        notification_service=MagicMock(), operator_alert_service=MagicMock(),
+        program_trading_stream_service=MagicMock(), pm=MagicMock(),
+        favorite_repo=MagicMock(), stock_code_repository=MagicMock(),
+    )
+    ctx.program_trading_stream_service.load_snapshot.return_value = {}
+
+    config = {"subscription_slot_allocator": {"enabled": True, "swap_margin": 1.5, "min_hold_sec": 90}}
+    with patch("view.web.bootstrap.realtime_bootstrap.StreamingService"), \
+         patch("view.web.bootstrap.realtime_bootstrap.OrderbookSnapshotRepository"), \
+         patch("view.web.bootstrap.realtime_bootstrap.FavoritePriceAlertService"), \
+         patch("view.web.bootstrap.realtime_bootstrap.PriceStreamService"), \
+         patch("view.web.bootstrap.realtime_bootstrap.PriceSubscriptionService") as subscriptions, \
+         patch("view.web.bootstrap.realtime_bootstrap.WebSocketWatchdogTask"):
+        RealtimeBootstrap(ctx).run(config=config, needs_realtime=True)
+
+    allocator = subscriptions.call_args.kwargs["slot_allocator"]
+    assert (allocator.swap_margin, allocator.min_hold_sec) == (1.5, 90.0)
@@ -201,6 +201,18 @@ def test_trading_only_registers_intraday_and_watchdog(patched_scheduler_deps):
     }
 
 
+def test_trading_registers_optional_rest_price_poll_without_dispatcher(patched_scheduler_deps):
+    ctx = _make_fake_context(RuntimeMode.TRADING)
+    ctx.rest_price_poll_task = MagicMock(task_name="rest_price_poll")
+
+    _run(ctx)
+
+    names = _registered_bg_task_names(patched_scheduler_deps)
+    assert "rest_price_poll" in names
+    dispatched = [c.args[0] for c in ctx.time_dispatcher.register_task.call_args_list]
+    assert "rest_price_poll" not in dispatched
+
+
 def test_batch_only_registers_after_market_tasks_no_watchdog(patched_scheduler_deps):
     ctx = _make_fake_context(RuntimeMode.BATCH)
     _run(ctx)
@@ -9,10 +9,12 @@
 """
 import contextlib
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
+from services.overseas_dryrun_data_plane import OverseasDryRunDataPlane
+from core.lazy_service import resolve_lazy
 from view.web.bootstrap.runtime_mode import RuntimeMode
 
 
@@ -76,7 +78,7 @@ BACKTEST_BOOTSTRAP_PATCH_NAMES = [
 # — 같은 키로 넣으면 나중 것이 앞의 것을 덮어써서 어느 모듈의 mock 인지 알 수 없다.
 OVERSEAS_BOOTSTRAP_PATCH_NAMES = [
     "OverseasFavoritePriceAlertTask", "FavoritePriceAlertService",
-    "USMarketCalendarService",
+    "USMarketCalendarService", "OverseasDailyBarRepository",
 ]
 
 
@@ -289,6 +291,11 @@ def test_service_container_builds_enabled_ai_stock_analyzer(patched_service_cont
     }
 
     ServiceContainer(ctx).run()
+    # 분석 서비스·뉴스 분석기는 첫 사용 시점에 만들어진다.
+    assert not ctx.ai_analysis_service.is_resolved
+    assert not ctx.ai_news_analyzer.is_resolved
+    ai_analysis_service = resolve_lazy(ctx.ai_analysis_service)
+    ai_news_analyzer = resolve_lazy(ctx.ai_news_analyzer)
 
     ai_client_cls = patched_service_container_deps["AiClient"]
     patched_service_container_deps["AiUsageLimiter"].assert_called_once_with(
@@ -322,14 +329,14 @@ def test_service_container_builds_enabled_ai_stock_analyzer(patched_service_cont
     assert ctx.ai_stock_analyzer is patched_service_container_deps[
         "AiStockAnalyzer"
     ].return_value
-    assert ctx.ai_analysis_service is patched_service_container_deps[
+    assert ai_analysis_service is patched_service_container_deps[
         "AIAnalysisService"
     ].return_value
     patched_service_container_deps["AiNewsAnalyzer"].assert_called_once_with(
         ai_client_cls.return_value,
         max_tokens=1536,
     )
-    assert ctx.ai_news_analyzer is patched_service_container_deps[
+    assert ai_news_analyzer is patched_service_container_deps[
         "AiNewsAnalyzer"
     ].return_value
 
@@ -347,7 +354,7 @@ def test_service_container_skips_ai_news_analyzer_when_disabled(
 
     assert ctx.ai_news_analyzer is None
     patched_service_container_deps["AiNewsAnalyzer"].assert_not_called()
-    assert ctx.stock_news_collector is patched_service_container_deps[
+    assert resolve_lazy(ctx.stock_news_collector) is patched_service_container_deps[
         "StockNewsCollectorService"
     ].return_value
 
@@ -388,6 +395,8 @@ def test_service_container_injects_youtube_proxy_config(patched_service_containe
     }
 
     ServiceContainer(ctx).run()
+    patched_service_container_deps["YoutubeTranscriptCollectorService"].assert_not_called()
+    resolve_lazy(ctx.youtube_transcript_collector)
 
     patched_service_container_deps[
         "YoutubeTranscriptCollectorService"
@@ -440,6 +449,27 @@ def test_youtube_digest_chunk_stays_under_ai_input_budget(
     assert kwargs["chunk_chars"] < 24000
 
 
+def test_service_container_defers_non_trading_services(patched_service_container_deps):
+    """AI·YouTube·테마 리포트 객체는 조립 시점이 아니라 첫 사용 시점에 생성된다."""
+    from view.web.bootstrap.service_container import ServiceContainer
+
+    ctx = _make_fake_context()
+    ctx.full_config = {"ai_analysis": {"enabled": True, "base_url": "http://ai", "model": "m"}}
+    ServiceContainer(ctx).run()
+
+    deferred = [
+        "AIAnalysisService", "AiNewsAnalyzer", "StockNewsCollectorService",
+        "YoutubeChannelRepository", "YoutubeDigestRepository", "YoutubeTranscriptCollectorService", "ThemeLeaderService", "ThemeDailyLeaderService",
+        "ThemeTradingValueSnapshotRepository",
+    ]
+    for name in deferred:
+        patched_service_container_deps[name].assert_not_called()
+
+    assert ctx.theme_daily_leader_service.build_daily_theme_report is not None
+    patched_service_container_deps["ThemeDailyLeaderService"].assert_called_once()
+    patched_service_container_deps["ThemeLeaderService"].assert_not_called()
+
+
 def test_service_container_creates_query_and_order_services(patched_service_container_deps):
     """StockQueryService, OrderExecutionService, RiskGateService 가 ctx 에 주입된다."""
     from view.web.bootstrap.service_container import ServiceContainer
@@ -461,14 +491,15 @@ def test_service_container_creates_theme_leader_service(patched_service_containe
 
     assert ctx.theme_classification_repository is patched_service_container_deps[
         "StockClassificationRepository"].return_value
-    assert ctx.theme_leader_service is patched_service_container_deps["ThemeLeaderService"].return_value
-    assert ctx.theme_daily_leader_service is patched_service_container_deps[
+    assert resolve_lazy(ctx.theme_leader_service) is patched_service_container_deps[
+        "ThemeLeaderService"].return_value
+    assert resolve_lazy(ctx.theme_daily_leader_service) is patched_service_container_deps[
         "ThemeDailyLeaderService"].return_value
-    assert ctx.theme_trading_value_snapshot_repository is patched_service_container_deps[
+    assert resolve_lazy(ctx.theme_trading_value_snapshot_repository) is patched_service_container_deps[
         "ThemeTradingValueSnapshotRepository"
     ].return_value
     theme_kwargs = patched_service_container_deps["ThemeDailyLeaderService"].call_args.kwargs
-    assert theme_kwargs["snapshot_repository"] is ctx.theme_trading_value_snapshot_repository
+    assert theme_kwargs["snapshot_repository"] is resolve_lazy(ctx.theme_trading_value_snapshot_repository)
 
 
 def test_service_container_passes_order_execution_retry_config(patched_service_container_deps):
@@ -786,6 +817,14 @@ def test_service_container_wires_overseas_dryrun_position_sizing(patched_service
         max_qty=4,
         logger=ctx.logger,
     )
+    candidate_kwargs = candidate_cls.call_args.kwargs
+    # 후보 점수는 로컬 일봉 저장소 + 마감된 미국 세션 기준으로 계산·공유된다
+    assert candidate_kwargs["bar_repository"] is (
+        patched_service_container_deps["overseas_bootstrap.OverseasDailyBarRepository"].return_value
+    )
+    assert candidate_kwargs["concurrency"] == 4
+    assert candidate_kwargs["max_live_fetches"] == 600
+    assert callable(candidate_kwargs["session_date_provider"])
     dryrun_kwargs = dryrun_cls.call_args.kwargs
     assert dryrun_kwargs["candidate_service"] is candidate_cls.return_value
     assert dryrun_kwargs["position_sizing_service"] is sizing_cls.return_value
@@ -851,7 +890,9 @@ def test_service_container_wires_overseas_oneil_services_into_dryrun_suite(patch
             osb_cls.return_value,
         ],
         logger=ctx.logger,
+        data_plane=ANY,
     )
+    assert isinstance(suite_cls.call_args.kwargs["data_plane"], OverseasDryRunDataPlane)
     assert task_cls.call_args.kwargs["dryrun_service"] is suite_cls.return_value
     assert ctx.overseas_pp_dryrun_service is pp_cls.return_value
     assert ctx.overseas_bgu_dryrun_service is bgu_cls.return_value
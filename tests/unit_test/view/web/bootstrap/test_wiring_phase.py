@@ -100,6 +100,10 @@ def test_wiring_phase_wires_streaming_chain():
     )
     assert ctx.stock_query_service.price_stream_service is ctx.price_stream_service
     assert ctx.stock_query_service.price_subscription_service is ctx.price_subscription_service
+    ctx.price_subscription_service.set_rest_fallback_source.assert_called_once_with(
+        ctx.stock_query_service.rest_fallback_counts_snapshot
+    )
+    assert ctx.stock_query_service.rest_price_poller is None
 
 
 def test_wiring_phase_skips_streaming_chain_when_runtime_does_not_create_it():
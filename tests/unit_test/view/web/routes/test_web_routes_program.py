@@ -435,6 +435,29 @@ async def test_stream_program_trading_replays_history_and_disconnects(mock_web_c
     mock_rdm.remove_subscriber_queue.assert_called_with(test_queue)
 
 
+@pytest.mark.asyncio
+async def test_stream_program_trading_skips_replay_when_disabled(mock_web_ctx):
+    """replay=false (program.html) 면 히스토리를 보내지 않고 실시간 큐만 전달한다."""
+    from view.web.routes.program import stream_program_trading
+    from fastapi import Request
+
+    mock_request = AsyncMock(spec=Request)
+    mock_request.is_disconnected = AsyncMock(return_value=False)
+    mock_rdm = MagicMock()
+    mock_web_ctx.program_trading_stream_service = mock_rdm
+    test_queue = asyncio.Queue()
+    mock_rdm.create_subscriber_queue.return_value = test_queue
+    mock_rdm.get_history_data.return_value = {"005930": [{"주식체결시간": "120000", "price": 70000}]}
+
+    with patch("view.web.routes.program._get_ctx", return_value=mock_web_ctx):
+        response = await stream_program_trading(mock_request, replay=False)
+        await test_queue.put('["000660"]')
+        first = await response.body_iterator.__anext__()
+
+    assert first == 'data: ["000660"]\n\n'
+    mock_rdm.get_history_data.assert_not_called()
+
+
 def test_get_db_status(web_client, mock_web_ctx):
     """DB 상태 조회가 manager 결과를 그대로 반환한다."""
     mock_rdm = MagicMock()
@@ -445,3 +468,20 @@ def test_get_db_status(web_client, mock_web_ctx):
 
     assert response.status_code == 200
     assert response.json()["history_count"] == 3
+
+
+def test_get_program_trading_history_series(web_client, mock_web_ctx):
+    """GET /api/program-trading/history-series/{code}: bucket 검증 후 서비스 집계 결과를 그대로 반환."""
+    mock_rdm = MagicMock()
+    mock_web_ctx.program_trading_stream_service = mock_rdm
+    mock_rdm.get_history_series.return_value = {"code": "005930", "bucket_sec": 60, "t": [1_700_000_040],
+                                                "close": [70000], "next_since": 1_700_000_040.0}
+
+    response = web_client.get("/api/program-trading/history-series/005930?bucket=60&since=1700000000")
+    assert response.status_code == 200
+    assert response.json()["data"]["close"] == [70000]
+    mock_rdm.get_history_series.assert_called_once_with("005930", 60, since=1_700_000_000.0)
+
+    assert web_client.get("/api/program-trading/history-series/005930?bucket=7").status_code == 400
+    mock_rdm.get_history_series.return_value = None
+    assert web_client.get("/api/program-trading/history-series/000660").json()["success"] is False
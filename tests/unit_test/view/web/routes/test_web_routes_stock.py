@@ -1,6 +1,8 @@
 """
 종목 조회 관련 테스트 (index.html — 현재가, 차트, 지표, 환경 전환).
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from common.overseas_types import OverseasExchange
@@ -820,6 +822,29 @@ async def test_get_overseas_stocks_list_no_repo(web_client, mock_web_ctx):
     assert response.json() == {"stocks": [], "count": 0}
 
 
+@pytest.mark.asyncio
+async def test_get_overseas_stocks_list_builds_lazy_repo_off_loop(web_client, mock_web_ctx):
+    """지연 생성 프록시는 워커 스레드에서 만들고, 생성 실패면 빈 목록을 반환한다."""
+    from core.lazy_service import LazyService
+
+    on_loop = []
+
+    def _broken():
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        raise OSError("download failed")
+
+    mock_web_ctx.overseas_stock_code_repository = LazyService(_broken, name="overseas_stock_code_repository")
+    response = web_client.get("/api/overseas/stocks/list")
+
+    assert response.status_code == 200
+    assert response.json() == {"stocks": [], "count": 0}
+    assert on_loop == [False]
+
+
 @pytest.mark.asyncio
 async def test_search_stock_by_name(web_client, mock_web_ctx):
     """GET /api/stock/search 엔드포인트 테스트 (빈 쿼리 및 정상 쿼리)"""
@@ -1078,6 +1078,23 @@ async def test_force_cache_warmup_not_init(web_client, mock_web_ctx):
     assert response.status_code == 503
 
 
+def test_get_cache_warmup_readiness_waits_with_capped_timeout(web_client, mock_web_ctx):
+    mock_task = MagicMock()
+    mock_task.wait_until_ready = AsyncMock(return_value=True)
+    mock_task.get_readiness.return_value = {"ready": True, "trading_date": "20260105", "coverage": {"total": 3}}
+    mock_web_ctx.cache_warmup_task = mock_task
+
+    response = web_client.get("/api/background/cache-warmup/readiness")
+    assert response.json() == {"success": True, "data": mock_task.get_readiness.return_value}
+    mock_task.wait_until_ready.assert_not_called()
+
+    web_client.get("/api/background/cache-warmup/readiness?wait=120")
+    mock_task.wait_until_ready.assert_awaited_once_with(timeout=30.0)
+
+    mock_web_ctx.cache_warmup_task = None
+    assert web_client.get("/api/background/cache-warmup/readiness").status_code == 503
+
+
 # ── POST /api/background/newhigh/force-update ─────────────────────────
 
 @pytest.mark.asyncio
@@ -991,14 +991,18 @@ def test_aggregate_virtual_data_empty_and_exception_path():
     assert result["counts"] == {}
 
 
-def test_sanitize_for_json_replaces_nan_and_inf():
-    """NaN/Infinity 값이 0.0으로 치환되는지 검증."""
-    from view.web.routes.virtual import _sanitize_for_json
+def test_virtual_journal_route_serializes_nan_and_inf_as_null(web_client, mock_web_ctx):
+    """재귀 sanitize 없이 orjson 응답이 NaN/Infinity 를 null 로 내보낸다."""
+    mock_web_ctx.virtual_trade_service.get_standard_journal_records.return_value = [
+        {"code": "005930", "net_return_pct": float("nan"), "mfe_pct": float("inf")}
+    ]
 
-    payload = {"a": float("nan"), "b": [1.0, float("inf"), {"c": float("-inf")}]}
-    sanitized = _sanitize_for_json(payload)
+    response = web_client.get("/api/virtual/journal")
 
-    assert sanitized == {"a": 0.0, "b": [1.0, 0.0, {"c": 0.0}]}
+    assert response.status_code == 200
+    record = response.json()["records"][0]
+    assert record["net_return_pct"] is None
+    assert record["mfe_pct"] is None
 
 
 @pytest.mark.asyncio
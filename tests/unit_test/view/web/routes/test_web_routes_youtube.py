@@ -46,6 +46,20 @@ async def test_list_channels(web_client, mock_web_ctx):
         assert response.json()[0]["handle"] == "chesleytv"
 
 
+async def test_list_channels_returns_503_when_lazy_repo_failed_to_build(web_client, mock_web_ctx):
+    from core.lazy_service import LazyService
+
+    def _broken():
+        raise OSError("db open failed")
+
+    with _patch_ctx(mock_web_ctx):
+        mock_web_ctx.youtube_channel_repository = LazyService(_broken, name="youtube_channel_repository")
+
+        response = web_client.get("/api/youtube/channels")
+
+        assert response.status_code == 503
+
+
 async def test_add_channel_resolves_handle_to_channel_id(web_client, mock_web_ctx):
     """사용자는 URL/핸들만 안다 — 서버가 channel_id 로 해석해야 한다."""
     with _patch_ctx(mock_web_ctx):
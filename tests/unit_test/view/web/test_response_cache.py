@@ -0,0 +1,249 @@
+"""orjson 응답 · 압축 미들웨어 · 렌더링 응답 캐시.
+
+- FastJSONResponse 는 NaN/Inf 를 null 로 내보내 재귀 sanitize 없이도 500 이 나지 않는다.
+- CompressionMiddleware 는 임계값 이상 응답만 gzip 으로 압축하고 SSE 는 건드리지 않는다.
+- cached_response 는 (라우트, 파라미터, 데이터 버전) 이 같으면 직렬화된 bytes 를 재사용하고,
+  장마감 배치의 버전 bump · 종목 틱 · TTL 만료 시 다시 만든다.
+"""
+from __future__ import annotations
+
+import gzip
+import math
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from common.types import ResCommonResponse
+from core.cache.data_version import DAILY_PRICES, OHLCV, DataVersionRegistry, data_versions
+from view.web.compression import CompressionMiddleware
+from view.web.fast_json import FastJSONResponse, render_json
+from view.web.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _chart_payload(rows: int) -> dict:
+    return {
+        "ohlcv": [
+            {"date": f"2025{i:04d}", "open": 100.0 + i, "high": 101.0 + i, "low": 99.0 + i,
+             "close": 100.5 + i, "volume": 1000 + i}
+            for i in range(rows)
+        ],
+        "indicators": {
+            "ma20": [float("nan")] * 19 + [100.0 + i for i in range(rows - 19)],
+            "bb_upper": [float("nan")] * 19 + [103.0 + i for i in range(rows - 19)],
+        },
+    }
+
+
+def test_render_json_maps_non_finite_and_numpy_to_json():
+    body = render_json({
+        "nan": float("nan"), "inf": float("inf"), "arr": np.array([1.5, np.nan]),
+        "np_int": np.int64(7), 1: "non-str key",
+        "resp": ResCommonResponse(rt_cd="0", msg1="ok", data=[{"v": math.inf}]),
+    })
+    assert body == (
+        b'{"nan":null,"inf":null,"arr":[1.5,null],"np_int":7,"1":"non-str key",'
+        b'"resp":{"rt_cd":"0","msg1":"ok","data":[{"v":null}]}}'
+    )
+
+
+def test_chart_route_with_nan_indicators_no_longer_fails(web_client, mock_web_ctx):
+    mock_web_ctx.stock_query_service.get_ohlcv_with_indicators = AsyncMock(
+        return_value=ResCommonResponse(rt_cd="0", msg1="ok", data=_chart_payload(25))
+    )
+    response = web_client.get("/api/chart/005930?indicators=true")
+
+    assert response.status_code == 200
+    assert response.json()["data"]["indicators"]["ma20"][:2] == [None, None]
+    assert response.headers["x-cache"] == "BYPASS"  # ctx 에 ResponseCache 가 없으면 캐시하지 않는다
+
+
+def _compression_app(**kwargs) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **kwargs)
+
+    @app.get("/big")
+    async def big():
+        return FastJSONResponse(_chart_payload(200))
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/sse")
+    async def sse():
+        async def events():
+            for i in range(3):
+                yield f"data: {'x' * 600}{i}\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_compression_respects_threshold_encoding_and_sse():
+    client = _compression_app(minimum_size=1024)
+
+    big = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert int(big.headers["content-length"]) < len(render_json(_chart_payload(200))) // 4
+    assert big.json()["indicators"]["ma20"][0] is None
+
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/big", headers={"Accept-Encoding": "gzip;q=0"}).headers
+
+    sse = client.get("/sse", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in sse.headers
+    assert sse.text.count("data: ") == 3
+
+
+def test_compression_uses_gzip_even_when_br_is_preferred():
+    client = _compression_app(minimum_size=1024)
+    response = client.get("/big", headers={"Accept-Encoding": "br, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in client.get("/big", headers={"Accept-Encoding": "br"}).headers
+
+
+def test_response_cache_lru_respects_entry_and_byte_budget():
+    clock = _Clock()
+    cache = ResponseCache(max_entries=3, max_bytes=10, clock=clock)
+    cache.store(("a", 1), 0, b"aaaa", ttl_sec=5)
+    cache.store(("b", 1), 0, b"bbbb", ttl_sec=5)
+    assert cache.lookup(("a", 1), 0) == b"aaaa"  # a 가 최근 사용
+    cache.store(("c", 1), 0, b"cccc", ttl_sec=5)  # 12 bytes > 10 → 가장 오래된 b 축출
+
+    assert cache.lookup(("b", 1), 0) is None
+    assert cache.lookup(("a", 1), 0) == b"aaaa"
+    assert cache.lookup(("a", 1), 1) is None  # 버전이 바뀌면 stale 로 버린다
+    clock.now += 5
+    assert cache.lookup(("c", 1), 0) is None  # TTL 만료
+    stats = cache.stats_snapshot()
+    assert (stats["evictions"], stats["stale"], stats["expired"], stats["entries"], stats["bytes"]) == (1, 1, 1, 0, 0)
+
+
+def test_data_version_registry_is_monotonic_per_topic():
+    registry = DataVersionRegistry()
+    assert registry.get(DAILY_PRICES) == 0
+    assert registry.bump(DAILY_PRICES) == 1
+    assert registry.bump(DAILY_PRICES) == 2
+    assert registry.snapshot() == {DAILY_PRICES: 2}
+
+
+def test_chart_cache_hits_until_tick_or_ohlcv_batch_invalidates(web_client, mock_web_ctx):
+    mock_web_ctx.response_cache = ResponseCache()
+    last_tick = {"005930": 1.0}
+    mock_web_ctx.price_stream_service.get_last_tick_ts.side_effect = lambda code: last_tick.get(code, 0.0)
+    query = mock_web_ctx.stock_query_service.get_ohlcv_with_indicators = AsyncMock(
+        return_value=ResCommonResponse(rt_cd="0", msg1="ok", data=_chart_payload(25))
+    )
+    url = "/api/chart/005930?indicators=true"
+
+    first = web_client.get(url)
+    second = web_client.get(url)
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+    assert second.content == first.content
+    assert query.await_count == 1
+
+    # 다른 파라미터는 다른 키
+    assert web_client.get("/api/chart/005930?indicators=true&period=W").headers["x-cache"] == "MISS"
+
+    last_tick["005930"] = 2.0  # 해당 종목 틱 → 당일 봉 변경
+    assert web_client.get(url).headers["x-cache"] == "MISS"
+    assert web_client.get(url).headers["x-cache"] == "HIT"
+
+    data_versions.bump(OHLCV)  # 장마감 OHLCV 배치 완료
+    assert web_client.get(url).headers["x-cache"] == "MISS"
+    assert query.await_count == 4
+
+
+def test_failed_payload_is_not_cached(web_client, mock_web_ctx):
+    mock_web_ctx.response_cache = ResponseCache()
+    mock_web_ctx.price_stream_service.get_last_tick_ts.return_value = 0.0
+    query = mock_web_ctx.stock_query_service.get_ohlcv = AsyncMock(
+        return_value=ResCommonResponse(rt_cd="1", msg1="일시 오류", data=None)
+    )
+    web_client.get("/api/chart/000660")
+    web_client.get("/api/chart/000660")
+    assert query.await_count == 2
+    assert mock_web_ctx.response_cache.stats_snapshot()["entries"] == 0
+
+
+def test_heatmap_cache_follows_daily_price_batch_and_realtime_ttl(web_client, mock_web_ctx):
+    clock = _Clock()
+    mock_web_ctx.response_cache = ResponseCache(clock=clock)
+    snapshot = mock_web_ctx.stock_repository.get_market_cap_snapshot = AsyncMock(return_value=[
+        {"code": "005930", "name": "삼성전자", "change_rate": "-0.72", "market_cap": 1,
+         "trade_date": "20260730", "market": "KOSPI", "current_price": 70000},
+    ])
+    url = "/api/heatmap/domestic?limit=300"
+
+    web_client.get(url)
+    clock.now += 30
+    assert web_client.get(url).headers["x-cache"] == "HIT"  # 장마감 스냅샷 TTL 60초
+    data_versions.bump(DAILY_PRICES)
+    assert web_client.get(url).headers["x-cache"] == "MISS"
+    assert snapshot.await_count == 2
+
+    service = mock_web_ctx.naver_market_snapshot_service = AsyncMock()
+    service.get_snapshot.return_value = [
+        {"code": "005930", "name": "삼성전자", "change_rate": "1.0", "market_cap": 1, "current_price": 71000},
+    ]
+    mock_web_ctx.stock_repository.get_snapshot_codes = AsyncMock(return_value=set())
+    realtime_url = url + "&market=KOSPI"
+    assert web_client.get(realtime_url).json()["data"]["realtime"] is True
+    clock.now += 6  # 장중 실시간 응답 TTL 5초
+    assert web_client.get(realtime_url).headers["x-cache"] == "MISS"
+
+
+@pytest.mark.slow
+def test_benchmark_chart_serialization_paths(test_app, web_client, mock_web_ctx):
+    """지표 포함 일봉 1200개 차트: stdlib JSONResponse vs orjson vs 캐시 hit (TestClient, 오프라인)."""
+    payload = _chart_payload(1200)
+    mock_web_ctx.stock_query_service.get_ohlcv_with_indicators = AsyncMock(
+        return_value=ResCommonResponse(rt_cd="0", msg1="ok", data=payload)
+    )
+    mock_web_ctx.price_stream_service.get_last_tick_ts.return_value = 0.0
+
+    def _stdlib_sanitize(obj):
+        if isinstance(obj, float):
+            return 0.0 if (math.isnan(obj) or math.isinf(obj)) else obj
+        if isinstance(obj, dict):
+            return {k: _stdlib_sanitize(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [_stdlib_sanitize(v) for v in obj]
+        return obj
+
+    @test_app.get("/bench/stdlib", response_class=JSONResponse)
+    async def stdlib_chart():
+        resp = await mock_web_ctx.stock_query_service.get_ohlcv_with_indicators("005930", "D")
+        return _stdlib_sanitize(resp.to_dict())
+
+    def _time(url: str, n: int = 30) -> float:
+        web_client.get(url)
+        start = time.perf_counter()
+        for _ in range(n):
+            assert web_client.get(url).status_code == 200
+        return (time.perf_counter() - start) * 1000 / n
+
+    stdlib_ms = _time("/bench/stdlib")
+    orjson_ms = _time("/api/chart/005930?indicators=true")
+    mock_web_ctx.response_cache = ResponseCache()
+    cached_ms = _time("/api/chart/005930?indicators=true")
+    raw = len(render_json({"rt_cd": "0", "msg1": "ok", "data": payload}))
+    print(
+        f"\n[chart 1200 bars] stdlib+sanitize={stdlib_ms:.2f}ms orjson={orjson_ms:.2f}ms "
+        f"cached={cached_ms:.2f}ms body={raw / 1024:.0f}KiB gzip={len(gzip.compress(render_json(payload), 6)) / 1024:.0f}KiB"
+    )
+    # 시간은 보고만 한다 — 캐시 경로가 실제로 hit 였는지만 확인
+    assert web_client.get("/api/chart/005930?indicators=true").headers["x-cache"] == "HIT"
@@ -1120,11 +1120,18 @@ async def test_shutdown_closes_program_trading_service_and_stock_repository(mock
     ctx.program_trading_stream_service.shutdown = AsyncMock()
     ctx.stock_repository = MagicMock()
     ctx.stock_repository.close = AsyncMock()
+    ctx.dart_disclosure_repository = MagicMock()
+    ctx.dart_disclosure_repository.close = AsyncMock()
+    ctx.execution_strength_repo = MagicMock()
+    ctx.orderbook_snapshot_repo = MagicMock()
 
     await ctx.shutdown()
 
     ctx.program_trading_stream_service.shutdown.assert_awaited_once()
     ctx.stock_repository.close.assert_awaited_once()
+    ctx.dart_disclosure_repository.close.assert_awaited_once()
+    ctx.execution_strength_repo.close.assert_called_once()
+    ctx.orderbook_snapshot_repo.close.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -1151,7 +1158,9 @@ async def test_initialize_services_logs_bootstrap_service_failure(mock_deps):
     """서비스 부트스트랩 예외는 critical 로그 후 False를 반환한다."""
     ctx = WebAppContext(None)
     ctx.env = MagicMock()
-    ctx._bootstrap_broker = AsyncMock(return_value=True)
+    ctx._acquire_tokens = AsyncMock(return_value=True)
+    ctx._build_broker = AsyncMock(return_value=True)
+    ctx._open_repositories = MagicMock()
     ctx._bootstrap_services = MagicMock(side_effect=RuntimeError("service boom"))
     ctx._bootstrap_schedulers = MagicMock()
 
@@ -1538,3 +1547,144 @@ async def test_ensure_strategy_states_loaded_no_env_defaults_to_fail_open(mock_d
 
     await ctx.ensure_strategy_states_loaded()  # raise 없어야 함
     failing.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_initialize_services_runs_independent_io_phases_concurrently(mock_deps):
+    """토큰 · 종목 마스터 · SQLite 단계는 동시에 시작하고 broker 는 토큰과 마스터를 기다린다."""
+    ctx = WebAppContext(None)
+    ctx.load_config_and_env()
+    env_instance = mock_deps["env"].return_value
+    env_instance.get_access_token = AsyncMock(return_value=True)
+    env_instance.get_real_access_token = AsyncMock(return_value="fake_real_token")
+    mock_deps["scm"].assert_not_called()  # 생성자에서는 종목 마스터를 읽지 않는다
+
+    assert await ctx.initialize_services(is_paper_trading=True) is True
+
+    timings = {row["phase"]: row for row in ctx.bootstrap_graph.timings()}
+    assert set(timings) == {
+        "token", "snapshot_load", "code_master", "sqlite", "broker", "services", "snapshot_restore", "schedulers",
+    }
+    assert all(row["status"] == "ok" for row in timings.values())
+    assert timings["broker"]["depends_on"] == ["token", "code_master"]
+    assert timings["code_master"]["depends_on"] == ["snapshot_load"]  # 스냅샷 종목 마스터가 있으면 SQLite 로드 생략
+    assert ctx.favorite_service.stock_code_repository is mock_deps["scm"].return_value
+    mock_deps["oscm"].assert_not_called()  # 해외 종목 마스터는 첫 조회 시점에 만든다
+    mock_deps["cm"].assert_called_once()  # sqlite 단계에서 연 CacheStore 를 서비스 조립이 재사용
+
+
+@pytest.mark.asyncio
+async def test_initialize_services_token_failure_still_loads_code_master(mock_deps):
+    """토큰 실패 시 broker 이후 단계는 건너뛰지만 종목 마스터(즐겨찾기 이름 조회)는 로드된다."""
+    ctx = WebAppContext(None)
+    ctx.load_config_and_env()
+    mock_deps["env"].return_value.get_access_token = AsyncMock(return_value=False)
+
+    assert await ctx.initialize_services(is_paper_trading=False) is False
+
+    graph = ctx.bootstrap_graph
+    assert graph.phase("code_master").status == "ok"
+    assert graph.phase("broker").status == "skipped"
+    assert graph.phase("schedulers").status == "skipped"
+    assert ctx.stock_code_repository is mock_deps["scm"].return_value
+    mock_deps["broker"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_websocket_skips_without_streaming_service(mock_deps):
+    ctx = WebAppContext(None)
+    ctx.streaming_service = None
+
+    assert await ctx.prewarm_websocket() is False
+
+
+@pytest.mark.asyncio
+async def test_prewarm_websocket_failure_is_recorded_not_raised(mock_deps):
+    from view.web.bootstrap.bootstrap_graph import BootstrapGraph
+
+    ctx = WebAppContext(None)
+    ctx.bootstrap_graph = BootstrapGraph()
+    ctx.streaming_service = MagicMock()
+    ctx.streaming_service.connect_websocket = AsyncMock(side_effect=ConnectionError("refused"))
+
+    assert await ctx.prewarm_websocket() is False
+
+    ctx.streaming_service.connect_websocket.assert_awaited_once_with(ctx._web_realtime_callback)
+    assert ctx.bootstrap_graph.phase("websocket").status == "failed"
+
+
+@pytest.mark.slow
+@pytest.mark.real_sleep
+@pytest.mark.asyncio
+async def test_time_to_first_tick_budget_with_fake_broker(mock_deps):
+    """재기동 후 첫 실시간 틱까지의 시간을 I/O 단계 순차 실행 합과 나란히 보고한다 (report-only).
+
+    로컬 fake broker 가 토큰 발급 · 종목 마스터 · SQLite 오픈 · WebSocket 연결에 지연을 주고,
+    연결되면 체결가 틱 하나를 콜백으로 흘려준다. 벽시계 비교는 부하에 따라 흔들리므로 출력만 하고,
+    검증은 단계 기록의 선후(토큰 발급 중에 종목 마스터·SQLite 가 시작됐는지)로 한다.
+    """
+    import time as real_time
+
+    token_sec, real_token_sec, code_master_sec, sqlite_sec, connect_sec = 0.2, 0.1, 0.3, 0.3, 0.05
+
+    async def slow_token():
+        await asyncio.sleep(token_sec)
+        return True
+
+    async def slow_real_token():
+        await asyncio.sleep(real_token_sec)
+        return "fake_real_token"
+
+    def slow_code_master(*args, **kwargs):
+        real_time.sleep(code_master_sec)
+        return mock_deps["scm"].return_value
+
+    def slow_cache_store(*args, **kwargs):
+        real_time.sleep(sqlite_sec)
+        return mock_deps["cm"].return_value
+
+    first_tick = asyncio.Event()
+    tick_at = {}
+
+    async def fake_connect(callback):
+        await asyncio.sleep(connect_sec)
+
+        def deliver():
+            callback({"type": "realtime_price", "tr_id": "H0UNCNT0", "data": {"유가증권단축종목코드": "005930"}})
+            tick_at["t"] = real_time.perf_counter()
+            first_tick.set()
+
+        asyncio.get_running_loop().call_soon(deliver)
+        return True
+
+    mock_deps["scm"].side_effect = slow_code_master
+    mock_deps["cm"].side_effect = slow_cache_store
+    fake_broker = mock_deps["broker"].return_value
+    fake_broker.connect_websocket.side_effect = fake_connect
+    fake_broker.is_websocket_receive_alive.return_value = False
+
+    ctx = WebAppContext(None)
+    ctx.load_config_and_env()
+    env_instance = mock_deps["env"].return_value
+    env_instance.get_access_token = AsyncMock(side_effect=slow_token)
+    env_instance.get_real_access_token = AsyncMock(side_effect=slow_real_token)
+
+    started = real_time.perf_counter()
+    assert await ctx.initialize_services(is_paper_trading=True) is True
+    assert await ctx.prewarm_websocket() is True
+    await asyncio.wait_for(first_tick.wait(), timeout=5)
+    time_to_first_tick = tick_at["t"] - started
+
+    graph = ctx.bootstrap_graph
+    cpu_sec = sum(graph.phase(name).duration_ms for name in ("broker", "services", "schedulers")) / 1000
+    sequential_io_sec = token_sec + real_token_sec + code_master_sec + sqlite_sec + connect_sec
+    budget_sec = max(token_sec + real_token_sec, code_master_sec, sqlite_sec) + connect_sec + cpu_sec + 0.25
+    print(
+        f"\n[time-to-first-tick] {time_to_first_tick * 1000:.0f}ms "
+        f"(budget {budget_sec * 1000:.0f}ms, sequential I/O {sequential_io_sec * 1000:.0f}ms + cpu "
+        f"{cpu_sec * 1000:.0f}ms) | {graph.summary()}"
+    )
+    token_end = graph.phase("token").start_ms + graph.phase("token").duration_ms
+    assert graph.phase("code_master").start_ms < token_end
+    assert graph.phase("sqlite").start_ms < token_end
+    assert graph.phase("websocket").status == "ok"
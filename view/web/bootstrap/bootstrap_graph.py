@@ -0,0 +1,154 @@
+"""BootstrapGraph — 기동 단계를 의존성 그래프로 실행하고 단계별 소요 시간을 기록한다.
+
+토큰 발급·종목 마스터 로드·SQLite 오픈처럼 서로 무관한 I/O 단계는 동시에 돌리고,
+broker 조립처럼 앞 단계 결과가 필요한 단계만 의존 단계를 기다린다. 동기(blocking)
+단계는 ``asyncio.to_thread`` 로 돌려 이벤트 루프의 네트워크 I/O 와 겹친다.
+
+단계 함수가 예외를 던지거나 ``False`` 를 반환하면 실패로 기록하고, 그 단계에 의존하는
+단계는 건너뛴다(skipped). 의존 관계가 없는 단계는 끝까지 실행한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PHASE_OK = "ok"
+PHASE_FAILED = "failed"
+PHASE_SKIPPED = "skipped"
+
+
+@dataclass
+class BootstrapPhase:
+    """그래프의 한 단계와 실행 결과."""
+
+    name: str
+    func: Optional[Callable[[], Any]]
+    depends_on: tuple = ()
+    blocking: bool = False
+    status: Optional[str] = None
+    start_ms: Optional[float] = None
+    duration_ms: Optional[float] = None
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class BootstrapGraph:
+    """의존성 순서를 지키며 독립 단계를 병렬 실행하는 기동 그래프.
+
+    단계는 의존 단계보다 뒤에 add() 해야 한다 (순환 의존을 구조적으로 막는다).
+    start_ms 는 run() 시작 시점 기준 상대 시각이다.
+    """
+
+    def __init__(self, logger=None, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._logger = logger
+        self._clock = clock
+        self._phases: Dict[str, BootstrapPhase] = {}
+        self._origin: Optional[float] = None
+        self.total_ms: Optional[float] = None
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        *,
+        depends_on: Iterable[str] = (),
+        blocking: bool = False,
+    ) -> None:
+        if name in self._phases:
+            raise ValueError(f"중복된 bootstrap 단계: {name}")
+        deps = tuple(depends_on)
+        unknown = [dep for dep in deps if dep not in self._phases]
+        if unknown:
+            raise ValueError(f"{name} 단계의 선행 단계가 등록되지 않았습니다: {unknown}")
+        self._phases[name] = BootstrapPhase(name=name, func=func, depends_on=deps, blocking=blocking)
+
+    async def run(self) -> bool:
+        """모든 단계를 실행하고 전부 성공했는지 반환한다."""
+        self._origin = self._clock()
+        tasks: Dict[str, asyncio.Task] = {}
+        for name, phase in self._phases.items():
+            deps = [tasks[dep] for dep in phase.depends_on]
+            tasks[name] = asyncio.create_task(self._run_phase(phase, deps), name=f"bootstrap:{name}")
+        if tasks:
+            await asyncio.gather(*tasks.values())
+        self.total_ms = self._elapsed_ms()
+        return self.succeeded
+
+    async def _run_phase(self, phase: BootstrapPhase, deps: List[asyncio.Task]) -> None:
+        if deps:
+            await asyncio.gather(*deps)
+        blocked = [dep for dep in phase.depends_on if self._phases[dep].status != PHASE_OK]
+        if blocked:
+            phase.status = PHASE_SKIPPED
+            self._log("warning", f"[Bootstrap] {phase.name} 단계 건너뜀 (선행 단계 실패: {', '.join(blocked)})")
+            return
+
+        phase.start_ms = self._elapsed_ms()
+        try:
+            if phase.blocking:
+                result = await asyncio.to_thread(phase.func)
+            else:
+                result = phase.func()
+                if inspect.isawaitable(result):
+                    result = await result
+        except Exception as exc:
+            phase.status = PHASE_FAILED
+            phase.error = exc
+            self._log("critical", f"[Bootstrap] {phase.name} 단계 실패: {exc}", exc_info=True)
+        else:
+            phase.result = result
+            phase.status = PHASE_FAILED if result is False else PHASE_OK
+        finally:
+            phase.duration_ms = self._elapsed_ms() - phase.start_ms
+
+    def record(self, name: str, *, start_ms: float, duration_ms: float, status: str = PHASE_OK) -> None:
+        """그래프 밖에서 실행한 단계(예: WebSocket 선연결)의 소요 시간을 같은 표에 남긴다."""
+        self._phases[name] = BootstrapPhase(
+            name=name, func=None, status=status, start_ms=start_ms, duration_ms=duration_ms,
+        )
+
+    def elapsed_ms(self) -> float:
+        """run() 시작 시점부터 지금까지의 경과 시간 (record() 의 start_ms 기준)."""
+        return self._elapsed_ms()
+
+    def _elapsed_ms(self) -> float:
+        if self._origin is None:
+            return 0.0
+        return (self._clock() - self._origin) * 1000.0
+
+    @property
+    def succeeded(self) -> bool:
+        return all(phase.status == PHASE_OK for phase in self._phases.values() if phase.func is not None)
+
+    def phase(self, name: str) -> BootstrapPhase:
+        return self._phases[name]
+
+    def timings(self) -> List[dict]:
+        return [
+            {
+                "phase": phase.name,
+                "status": phase.status,
+                "start_ms": None if phase.start_ms is None else round(phase.start_ms, 1),
+                "duration_ms": None if phase.duration_ms is None else round(phase.duration_ms, 1),
+                "depends_on": list(phase.depends_on),
+            }
+            for phase in self._phases.values()
+        ]
+
+    def summary(self) -> str:
+        parts = []
+        for phase in self._phases.values():
+            if phase.duration_ms is None:
+                parts.append(f"{phase.name}={phase.status}")
+            else:
+                suffix = "" if phase.status == PHASE_OK else f"({phase.status})"
+                parts.append(f"{phase.name}={phase.duration_ms:.0f}ms{suffix}")
+        total = "" if self.total_ms is None else f" | total={self.total_ms:.0f}ms"
+        return " ".join(parts) + total
+
+    def _log(self, level: str, message: str, **kwargs) -> None:
+        if self._logger is not None:
+            getattr(self._logger, level)(message, **kwargs)
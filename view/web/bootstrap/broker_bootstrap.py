@@ -1,7 +1,8 @@
 """BrokerBootstrap — `WebAppContext._bootstrap_broker()` 본문을 전담한다.
 
 토큰 발급, BrokerAPIWrapper 생성, MarketCalendarService 동기화까지의
-범위만 책임진다. 후주입(`_mcs.set_broker(...)`)은 본 PR 범위 외로
+범위만 책임진다. 기동 그래프는 acquire_tokens / build_broker 를 별도 단계로
+호출해 토큰 발급을 종목 마스터 로드와 겹친다. 후주입(`_mcs.set_broker(...)`)은 본 PR 범위 외로
 그대로 유지한다.
 """
 from __future__ import annotations
@@ -21,6 +22,12 @@ class BrokerBootstrap:
         self._ctx = context
 
     async def run(self, is_paper_trading: bool) -> bool:
+        if not await self.acquire_tokens(is_paper_trading):
+            return False
+        return await self.build_broker()
+
+    async def acquire_tokens(self, is_paper_trading: bool) -> bool:
+        """토큰 발급만 수행한다. 기동 그래프에서는 종목 마스터 로드와 병렬로 돈다."""
         ctx = self._ctx
         try:
             token_acquired = await ctx.env.get_access_token()
@@ -30,6 +37,15 @@ class BrokerBootstrap:
             # 모의투자 모드에서도 실전 토큰 사전 발급 (조회 API는 항상 실전 인증 사용)
             if is_paper_trading:
                 await ctx.env.get_real_access_token()
+        except Exception as e:
+            ctx.logger.critical(f"[BrokerBootstrap] 초기화 실패: {e}", exc_info=True)
+            return False
+        return True
+
+    async def build_broker(self) -> bool:
+        """토큰 발급 이후 BrokerAPIWrapper 생성과 거래일 캘린더 동기화."""
+        ctx = self._ctx
+        try:
             ctx.broker = BrokerAPIWrapper(
                 env=ctx.env,
                 logger=ctx.logger,
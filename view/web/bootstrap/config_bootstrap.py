@@ -10,16 +10,21 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from config.config_loader import KillSwitchConfig, load_configs
+from dataclasses import fields
+
+from config.config_loader import ApiAdaptiveRateConfig, KillSwitchConfig, MarketSessionConfig, load_configs
 from brokers.korea_investment.korea_invest_env import KoreaInvestApiEnv
 from core.market_clock import MarketClock
+from core.retry_queue.api_budget_limiter import AdaptiveRateConfig, ApiBudgetLimiter
 from services.kill_switch_service import KillSwitchService
 from services.market_calendar_service import MarketCalendarService
+from services.market_session_clock import MarketSessionClock
 from services.notification_service import NotificationService
 from services.operator_alert_service import OperatorAlertService
 from services.rejection_distribution_service import RejectionDistributionService
 from services.strategy_log_report_service import _REASON_KR
 from services.telegram_notifier import TelegramNotifier, TelegramReporter
+from repositories.market_calendar_repository import MarketCalendarRepository
 from repositories.telegram_notification_repository import TelegramNotificationRepository
 from repositories.strategy_diagnostic_report_repository import (
     StrategyDiagnosticReportRepository,
@@ -56,6 +61,7 @@ class ConfigBootstrap:
             timezone=config_dict.get("market_timezone", "Asia/Seoul"),
             logger=ctx.logger,
         )
+        self._apply_adaptive_rate(ctx, getattr(config_data, "api_adaptive_rate", None))
         ctx.virtual_repo.tm = ctx.market_clock
         ctx.virtual_trade_service.tm = ctx.market_clock
         ctx.notification_service = NotificationService(ctx.market_clock)
@@ -90,9 +96,35 @@ class ConfigBootstrap:
             f"enabled_market_modes={ctx.enabled_market_modes}"
         )
 
+        session_cfg = getattr(config_data, "market_session", None)
+        session_enabled = isinstance(session_cfg, MarketSessionConfig) and session_cfg.enabled
         ctx._mcs = MarketCalendarService(
-            ctx.market_clock, ctx.logger, performance_profiler=ctx.pm
+            ctx.market_clock, ctx.logger, performance_profiler=ctx.pm,
+            calendar_repository=(
+                MarketCalendarRepository(session_cfg.calendar_path, logger=ctx.logger)
+                if session_enabled else None
+            ),
         )
+        ctx.market_session_clock = None
+        if session_enabled:
+            ctx.market_session_clock = MarketSessionClock(
+                ctx._mcs,
+                ctx.market_clock,
+                logger=ctx.logger,
+                day_overrides=session_cfg.day_overrides,
+                late_open_first_trading_day=session_cfg.late_open_first_trading_day,
+            )
+            ctx._mcs.attach_session_clock(ctx.market_session_clock)
+
+    @staticmethod
+    def _apply_adaptive_rate(ctx: "WebAppContext", adaptive_cfg) -> None:
+        """api_adaptive_rate.enabled 일 때만 AIMD 탐색 limiter 로 교체한다 (기본은 설정 rate 고정)."""
+        if not isinstance(adaptive_cfg, ApiAdaptiveRateConfig) or not adaptive_cfg.enabled:
+            return
+        known = {f.name for f in fields(AdaptiveRateConfig)}
+        params = {k: v for k, v in adaptive_cfg.model_dump().items() if k in known}
+        ctx.api_budget_limiter = ApiBudgetLimiter(adaptive=AdaptiveRateConfig(**params))
+        ctx.logger.info(f"웹 앱: API adaptive rate 활성화 {params}")
 
     @staticmethod
     def _register_telegram(ctx: "WebAppContext", config_dict: dict) -> None:
@@ -17,6 +17,7 @@ from services.market_data_service import MarketDataService
 from services.rs_rating_service import RSRatingService
 from services.theme_daily_leader_service import ThemeDailyLeaderService
 from services.theme_leader_service import ThemeLeaderService
+from core.lazy_service import LazyService, resolve_lazy
 from view.web.market_mode_utils import is_market_enabled
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -47,18 +48,34 @@ class MarketDataBootstrap:
 
         try:
             ctx.theme_classification_repository = StockClassificationRepository(logger=ctx.logger)
-            ctx.theme_trading_value_snapshot_repository = ThemeTradingValueSnapshotRepository()
-            ctx.theme_leader_service = ThemeLeaderService(
-                classification_repository=ctx.theme_classification_repository,
-                rs_rating_repository=getattr(ctx, "rs_rating_repository", None),
+            # 테마 리포트 계열은 매매 경로와 무관하므로 첫 조회(라우트·리포트 태스크) 시점에 만든다.
+            classification_repository = ctx.theme_classification_repository
+            ctx.theme_trading_value_snapshot_repository = LazyService(
+                ThemeTradingValueSnapshotRepository,
+                name="theme_trading_value_snapshot_repository",
                 logger=ctx.logger,
-                performance_profiler=ctx.pm,
             )
-            ctx.theme_daily_leader_service = ThemeDailyLeaderService(
-                classification_repository=ctx.theme_classification_repository,
-                snapshot_repository=ctx.theme_trading_value_snapshot_repository,
+            ctx.theme_leader_service = LazyService(
+                lambda: ThemeLeaderService(
+                    classification_repository=classification_repository,
+                    rs_rating_repository=getattr(ctx, "rs_rating_repository", None),
+                    logger=ctx.logger,
+                    performance_profiler=ctx.pm,
+                ),
+                name="theme_leader_service",
+                logger=ctx.logger,
+            )
+            snapshot_repository = ctx.theme_trading_value_snapshot_repository
+            ctx.theme_daily_leader_service = LazyService(
+                lambda: ThemeDailyLeaderService(
+                    classification_repository=classification_repository,
+                    # 팩토리는 aresolve 로 루프 밖에서 돌므로 스냅샷 저장소도 여기서 함께 만든다.
+                    snapshot_repository=resolve_lazy(snapshot_repository),
+                    logger=ctx.logger,
+                    performance_profiler=ctx.pm,
+                ),
+                name="theme_daily_leader_service",
                 logger=ctx.logger,
-                performance_profiler=ctx.pm,
             )
         except Exception as exc:
             ctx.logger.warning(f"[ServiceBootstrap:ThemeLeader] 초기화 실패: {exc}")
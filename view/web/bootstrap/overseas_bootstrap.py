@@ -13,12 +13,14 @@ from typing import TYPE_CHECKING
 
 from core.market_clock import MarketClock
 from repositories.favorite_repository import MARKET_OVERSEAS_US
+from repositories.overseas_daily_bar_repository import OverseasDailyBarRepository
 from repositories.overseas_trade_repository import OverseasTradeRepository
 from services.event_shadow_journal_service import EventShadowJournalService
 from services.favorite_price_alert_service import FavoritePriceAlertService
 from services.overseas_buyable_gap_up_dryrun_service import OverseasBuyableGapUpDryRunService
 from services.overseas_candidate_service import OverseasCandidateService
 from services.overseas_channel_breakout_dryrun_service import OverseasChannelBreakoutDryRunService
+from services.overseas_dryrun_data_plane import OverseasDryRunDataPlane
 from services.overseas_dryrun_suite_service import OverseasDryRunSuiteService
 from services.overseas_fill_reconcile_service import OverseasFillReconcileService
 from services.overseas_intraday_vbo_service import OverseasIntradayVBOService
@@ -103,6 +105,8 @@ class OverseasBootstrap:
                 log_root="logs/strategies", logger=ctx.logger,
             )
         self._build_manual_order_service()
+        # 조립 여부는 호출부의 시장 모드 설정(overseas_us)이 정한다. 심볼 마스터 프록시는 여기서
+        # 만들지 않는다 — 후보 서비스가 첫 조회 때 루프 밖에서 만든다.
         if getattr(ctx, "overseas_stock_code_repository", None) is None:
             return
         overseas_stock_cfg = getattr(ctx.full_config, "overseas_stock", None)
@@ -111,10 +115,20 @@ class OverseasBootstrap:
             max_qty=getattr(overseas_stock_cfg, "dryrun_max_qty", None),
             logger=ctx.logger,
         )
+        # 미국 정규장 마감(16:00 ET) 직후 트리거. O-1: 규칙 기반 NYSE 캘린더를
+        # 주입해 미국 휴장일에는 실행을 스킵한다 (기존: 주말 필터만).
+        dryrun_us_clock = MarketClock.for_us_equities(logger=ctx.logger)
+        dryrun_us_calendar = USMarketCalendarService(market_clock=dryrun_us_clock, logger=ctx.logger)
+        # 후보 점수는 마감된 미국 세션 단위로 1회 계산해 suite·장중 VBO 가 공유한다.
+        # 일봉은 로컬 저장소에 누적하고 빠진 날짜만 제한된 동시성·호출 예산으로 채운다.
         ctx.overseas_candidate_service = OverseasCandidateService(
             overseas_stock_code_repository=ctx.overseas_stock_code_repository,
             stock_query_service=ctx.stock_query_service,
             logger=ctx.logger,
+            concurrency=getattr(overseas_stock_cfg, "candidate_fetch_concurrency", 4),
+            max_live_fetches=getattr(overseas_stock_cfg, "candidate_max_live_fetches", None),
+            bar_repository=OverseasDailyBarRepository(),
+            session_date_provider=dryrun_us_calendar.get_latest_closed_trading_date,
         )
 
         async def _overseas_fx_provider():
@@ -184,16 +198,20 @@ class OverseasBootstrap:
                 ctx.overseas_osb_dryrun_service,
             ],
             logger=ctx.logger,
+            data_plane=(
+                OverseasDryRunDataPlane(
+                    ctx.overseas_candidate_service,
+                    ctx.stock_query_service,
+                    ctx.logger,
+                    concurrency=getattr(overseas_stock_cfg, "candidate_fetch_concurrency", 4),
+                )
+                if getattr(overseas_stock_cfg, "dryrun_shared_snapshot", True) else None
+            ),
         )
-        # 미국 정규장 마감(16:00 ET) 직후 트리거. O-1: 규칙 기반 NYSE 캘린더를
-        # 주입해 미국 휴장일에는 실행을 스킵한다 (기존: 주말 필터만).
-        dryrun_us_clock = MarketClock.for_us_equities(logger=ctx.logger)
         ctx.overseas_dryrun_task = OverseasDryRunTask(
             dryrun_service=overseas_dryrun_suite,
             shadow_journal=ctx.event_shadow_journal_service,
-            market_calendar_service=USMarketCalendarService(
-                market_clock=dryrun_us_clock, logger=ctx.logger,
-            ),
+            market_calendar_service=dryrun_us_calendar,
             market_clock=dryrun_us_clock,
             logger=ctx.logger,
             notification_service=ctx.notification_service,
@@ -11,6 +11,7 @@ from services.price_stream_service import PriceStreamService
 from services.price_subscription_service import PriceSubscriptionService
 from services.strategy_event_router import StrategyEventRouter
 from services.streaming_service import StreamingService
+from services.subscription_slot_allocator import build_slot_allocator
 from services.market_status_alert_service import MarketStatusAlertService
 from task.background.intraday.websocket_watchdog_task import WebSocketWatchdogTask
 
@@ -125,6 +126,7 @@ class RealtimeBootstrap:
             streaming_logger=ctx.streaming_event_logger,
             streaming_stock_repo=ctx.streaming_stock_repo,
             market_calendar=ctx._mcs,
+            slot_allocator=build_slot_allocator(config.get("subscription_slot_allocator")),
         )
         ctx.websocket_watchdog_task = WebSocketWatchdogTask(
             streaming_service=ctx.streaming_service,
@@ -121,6 +121,10 @@ class SchedulerBootstrap:
         self._register(self._optional_task("theme_intraday_leader_alert_task"))
         self._register(self._optional_task("market_index_threshold_alert_task"))
         self._register(self._optional_task("market_timing_daily_update_task"))
+        # 매 초 due 종목만 배치 조회하는 continuous loop — TimeDispatcher 미등록
+        self._register(self._optional_task("rest_price_poll_task"))
+        # 장 운영 시간 판정은 태스크가 자체 폴링으로 수행하므로 TimeDispatcher 미등록
+        self._register(self._optional_task("warm_restart_snapshot_task"))
 
     def _register_batch_tasks(self) -> None:
         ctx = self._ctx
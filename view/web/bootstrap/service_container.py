@@ -20,6 +20,7 @@ from config.config_loader import (
     PositionSizingConfig,
     RiskGateConfig,
     TradeTrendMonitorConfig,
+    WarmRestartSnapshotConfig,
     YoutubeDigestConfig,
 )
 from core.account_snapshot import AccountSnapshotCache
@@ -52,6 +53,7 @@ from services.paper_account_expiry_alert_service import PaperAccountExpiryAlertS
 from services.position_sizing_service import PositionSizingService
 from services.risk_gate_service import RiskGateService
 from services.strategy_log_report_service import StrategyLogReportService
+from services.warm_restart_snapshot_service import WarmRestartSnapshotService
 from task.background.after_market.after_market_reconcile_task import AfterMarketReconcileTask
 from task.background.after_market.cache_warmup_task import CacheWarmupTask
 from task.background.after_market.daily_price_collector_task import DailyPriceCollectorTask
@@ -73,6 +75,8 @@ from task.background.intraday.program_capture_subscription_task import ProgramCa
 from task.background.intraday.theme_intraday_leader_alert_task import ThemeIntradayLeaderAlertTask
 from task.background.intraday.market_index_threshold_alert_task import MarketIndexThresholdAlertTask
 from task.background.intraday.market_timing_daily_update_task import MarketTimingDailyUpdateTask
+from task.background.intraday.rest_price_poll_task import RestPricePollTask
+from task.background.intraday.warm_restart_snapshot_task import WarmRestartSnapshotTask
 from view.web.bootstrap.runtime_mode import RuntimeMode
 from view.web.bootstrap.backtest_task_bootstrap import BacktestTaskBootstrap
 from view.web.bootstrap.repository_bootstrap import RepositoryBootstrap
@@ -80,8 +84,10 @@ from view.web.bootstrap.market_data_bootstrap import MarketDataBootstrap
 from view.web.bootstrap.query_bootstrap import QueryBootstrap
 from view.web.bootstrap.realtime_bootstrap import RealtimeBootstrap
 from view.web.bootstrap.overseas_bootstrap import OverseasBootstrap
+from core.lazy_service import LazyService
 from view.web.market_mode_utils import is_market_enabled
 from repositories.dart_disclosure_repository import DartDisclosureRepository
+from repositories.warm_restart_snapshot_repository import WarmRestartSnapshotRepository
 from repositories.youtube_channel_repository import YoutubeChannelRepository
 from repositories.youtube_digest_repository import YoutubeDigestRepository
 from services.gemini_youtube_video_analyzer_service import (
@@ -89,9 +95,11 @@ from services.gemini_youtube_video_analyzer_service import (
 )
 from services.youtube_transcript_collector_service import YoutubeTranscriptCollectorService
 from services.youtube_digest_service import YoutubeDigestService
+from services.rest_price_poller import build_rest_price_poller
 from task.background.intraday.youtube_digest_task import YoutubeDigestTask
 
 if TYPE_CHECKING:  # pragma: no cover
+    from core.cache.cache_store import CacheStore
     from view.web.web_app_initializer import WebAppContext
 
 
@@ -130,6 +138,15 @@ def _extract_int_field(data: Any, *keys: str) -> Optional[int]:
     return None
 
 
+def config_as_dict(config: Any) -> Any:
+    """pydantic 설정 객체(v2 model_dump / v1 dict)를 dict 로 변환한다."""
+    if hasattr(config, "model_dump"):
+        return config.model_dump()
+    if hasattr(config, "dict"):
+        return config.dict()
+    return config
+
+
 def _config_value(section: Any, key: str, default: Any) -> Any:
     if isinstance(section, dict):
         return section.get(key, default)
@@ -180,7 +197,8 @@ class ServiceContainer:
     def __init__(self, context: "WebAppContext") -> None:
         self._ctx = context
 
-    def run(self) -> None:
+    def run(self, cache_store: Optional[CacheStore] = None) -> None:
+        """서비스를 조립한다. 기동 그래프가 SQLite 단계에서 미리 연 cache_store 가 있으면 재사용한다."""
         ctx = self._ctx
         mode = getattr(ctx, "runtime_mode", RuntimeMode.ALL)
         needs_web = bool(mode & RuntimeMode.WEB)
@@ -194,13 +212,10 @@ class ServiceContainer:
             needs_batch = False
             needs_realtime = False
 
-        config_dict = ctx.full_config
-        if hasattr(config_dict, "model_dump"):
-            config_dict = config_dict.model_dump()
-        elif hasattr(config_dict, "dict"):
-            config_dict = config_dict.dict()
+        config_dict = config_as_dict(ctx.full_config)
 
-        cache_store = RepositoryBootstrap(ctx).run(config_dict)
+        if cache_store is None:
+            cache_store = RepositoryBootstrap(ctx).run(config_dict)
         MarketDataBootstrap(
             ctx,
             us_market_calendar_factory=USMarketCalendarService,
@@ -223,8 +238,13 @@ class ServiceContainer:
         ctx.ai_disclosure_analyzer = None
         ctx.ai_stock_analyzer = None
         ctx.ai_news_analyzer = None
-        # 뉴스 수집 자체는 AI 와 무관하므로 AI 비활성 상태에서도 항상 생성한다.
-        ctx.stock_news_collector = StockNewsCollectorService(logger=ctx.logger)
+        # 뉴스 수집 자체는 AI 와 무관하므로 AI 비활성 상태에서도 항상 걸어 두되,
+        # 매매 경로와 무관해 첫 조회 시점에 만든다 (AI 분석기·YouTube·테마 리포트도 동일).
+        ctx.stock_news_collector = LazyService(
+            lambda: StockNewsCollectorService(logger=ctx.logger),
+            name="stock_news_collector",
+            logger=ctx.logger,
+        )
         raw_ai_config = config_dict.get("ai_analysis") or {}
         ai_config = AiAnalysisConfig.model_validate(raw_ai_config)
         if ai_config.enabled and ai_config.base_url and ai_config.model:
@@ -247,15 +267,22 @@ class ServiceContainer:
             ctx.ai_stock_analyzer = AiStockAnalyzer(
                 ctx.ai_client, max_tokens=int(ai_config.max_tokens)
             )
-            ctx.ai_news_analyzer = AiNewsAnalyzer(
-                ctx.ai_client, max_tokens=int(ai_config.max_tokens)
+            ai_client = ctx.ai_client
+            ctx.ai_news_analyzer = LazyService(
+                lambda: AiNewsAnalyzer(ai_client, max_tokens=int(ai_config.max_tokens)),
+                name="ai_news_analyzer",
+                logger=ctx.logger,
             )
-            ctx.ai_analysis_service = AIAnalysisService(
-                ctx.ai_client,
-                provider_name=ai_config.provider,
-                model=ai_config.model,
+            ctx.ai_analysis_service = LazyService(
+                lambda: AIAnalysisService(
+                    ai_client,
+                    provider_name=ai_config.provider,
+                    model=ai_config.model,
+                    logger=ctx.logger,
+                    max_tokens=int(ai_config.max_tokens),
+                ),
+                name="ai_analysis_service",
                 logger=ctx.logger,
-                max_tokens=int(ai_config.max_tokens),
             )
             if ai_config.disclosure_summary_enabled:
                 ctx.ai_disclosure_analyzer = AiDisclosureAnalyzer(
@@ -454,21 +481,29 @@ class ServiceContainer:
             ctx.logger.critical(f"[ServiceBootstrap:Streaming] 초기화 실패: {e}", exc_info=True)
             raise
 
-        # 유튜브 일일 다이제스트. 채널 저장소는 UI 관리용이라 항상 만들고, 요약 태스크는
-        # 본체가 AI 라서 AI 비활성 시 만들지 않는다.
-        ctx.youtube_channel_repository = YoutubeChannelRepository()
-        ctx.youtube_digest_repository = YoutubeDigestRepository()
+        # 유튜브 일일 다이제스트. 채널 저장소는 UI 관리용이라 항상 걸어 두고(첫 사용 시 생성),
+        # 요약 태스크는 본체가 AI 라서 AI 비활성 시 만들지 않는다.
+        ctx.youtube_channel_repository = LazyService(
+            YoutubeChannelRepository, name="youtube_channel_repository", logger=ctx.logger,
+        )
+        ctx.youtube_digest_repository = LazyService(
+            YoutubeDigestRepository, name="youtube_digest_repository", logger=ctx.logger,
+        )
         raw_youtube_config = config_dict.get("youtube_digest") or {}
         youtube_config = YoutubeDigestConfig.model_validate(raw_youtube_config)
-        ctx.youtube_transcript_collector = YoutubeTranscriptCollectorService(
+        ctx.youtube_transcript_collector = LazyService(
+            lambda: YoutubeTranscriptCollectorService(
+                logger=ctx.logger,
+                proxy_type=youtube_config.proxy_type,
+                proxy_username=youtube_config.proxy_username,
+                proxy_password=youtube_config.proxy_password,
+                proxy_http_url=youtube_config.proxy_http_url,
+                proxy_https_url=youtube_config.proxy_https_url,
+                proxy_locations=tuple(youtube_config.proxy_locations),
+                request_interval_sec=float(youtube_config.request_interval_sec),
+            ),
+            name="youtube_transcript_collector",
             logger=ctx.logger,
-            proxy_type=youtube_config.proxy_type,
-            proxy_username=youtube_config.proxy_username,
-            proxy_password=youtube_config.proxy_password,
-            proxy_http_url=youtube_config.proxy_http_url,
-            proxy_https_url=youtube_config.proxy_https_url,
-            proxy_locations=tuple(youtube_config.proxy_locations),
-            request_interval_sec=float(youtube_config.request_interval_sec),
         )
         ctx.youtube_digest_service = None
         ctx.youtube_digest_task = None
@@ -614,10 +649,11 @@ class ServiceContainer:
                 ctx.microstructure_capture_task = None
                 ctx.theme_intraday_leader_alert_task = None
                 if needs_web:
+                    notifications_cfg = getattr(ctx.full_config, "notifications", None)
                     ctx.notification_queue_task = NotificationQueueTask(
                         notification_service=ctx.notification_service,
-                        poll_interval=config_dict.get("notification_queue_poll_interval", 1.0),
-                        telegram_config=getattr(getattr(ctx.full_config, "notifications", None), "telegram", None),
+                        telegram_config=getattr(notifications_cfg, "telegram", None),
+                        dispatch_config=getattr(notifications_cfg, "dispatch", None),
                         logger=ctx.logger,
                     )
                 else:
@@ -677,6 +713,8 @@ class ServiceContainer:
                     notification_service=ctx.notification_service,
                     logger=ctx.logger,
                     worker_pool=ctx.worker_pool,
+                    stock_repository=ctx.stock_repository,
+                    indicator_service=ctx.indicator_service,
                 )
             else:
                 ctx.cache_warmup_task = None
@@ -720,6 +758,8 @@ class ServiceContainer:
                         logger=ctx.logger,
                         worker_pool=ctx.worker_pool,
                     )
+                # LazyService 프록시는 여기서 resolve 하지 않는다 (기동 지연 방지) — 태스크가 실행
+                # 시점에 aresolve_lazy 로 만들고, 생성 실패(None)면 건너뛴다.
                 if ctx.theme_daily_leader_service is not None:
                     ctx.theme_daily_leader_report_task = ThemeDailyLeaderReportTask(
                         ranking_task=ctx.ranking_task,
@@ -745,6 +785,7 @@ class ServiceContainer:
                             ctx.full_config, "strategy_profitability_gate", None
                         ),
                         enabled_strategy_provider=ctx._get_enabled_strategy_names_for_report,
+                        checkpoint_path=os.path.join("data", "strategy_log_report_checkpoint.json"),
                     ),
                     notification_service=ctx.notification_service,
                     operator_alert_service=ctx.operator_alert_service,
@@ -848,6 +889,21 @@ class ServiceContainer:
                 and index_alert_enabled
                 and ctx.market_status_alert_service is not None
             ) else None
+            # 구독 슬롯 밖 가격 요청 종목의 중앙 REST 폴링 (갱신 주기 = 트리거 근접·보유·변동폭)
+            price_policy = getattr(ctx, "price_subscription_service", None)
+            ctx.rest_price_poller = build_rest_price_poller(
+                config_dict.get("rest_price_poller"),
+                fetch_batch=ctx.stock_query_service.refresh_price_snapshots,
+                quote_reader=ctx.stock_query_service.latest_price_quote,
+                request_source=price_policy.pending_price_requests,
+                logger=ctx.logger,
+            ) if needs_trading and price_policy is not None else None
+            ctx.rest_price_poll_task = RestPricePollTask(
+                poller=ctx.rest_price_poller,
+                market_clock=ctx.market_clock,
+                market_calendar_service=ctx._mcs,
+                logger=ctx.logger,
+            ) if ctx.rest_price_poller is not None else None
             ctx.market_timing_daily_update_task = MarketTimingDailyUpdateTask(
                 universe_service=ctx.oneil_universe_service,
                 market_clock=ctx.market_clock,
@@ -858,13 +914,39 @@ class ServiceContainer:
                 and ctx.oneil_universe_service is not None
             ) else None
 
+            snapshot_cfg = WarmRestartSnapshotConfig.model_validate(
+                config_dict.get("warm_restart_snapshot") or {}
+            )
+            if needs_trading and snapshot_cfg.enabled:
+                ctx.warm_restart_snapshot_service = WarmRestartSnapshotService(
+                    getattr(ctx, "warm_restart_snapshot_repository", None)
+                    or WarmRestartSnapshotRepository(path=snapshot_cfg.path, logger=ctx.logger),
+                    stock_code_repository=ctx.stock_code_repository,
+                    stock_repository=ctx.stock_repository,
+                    indicator_service=ctx.indicator_service,
+                    price_stream_service=getattr(ctx, "price_stream_service", None),
+                    subscription_policy=getattr(ctx, "price_subscription_service", None),
+                    logger=ctx.logger,
+                    ohlcv_limit=snapshot_cfg.ohlcv_limit,
+                )
+                ctx.warm_restart_snapshot_task = WarmRestartSnapshotTask(
+                    snapshot_service=ctx.warm_restart_snapshot_service,
+                    market_clock=ctx.market_clock,
+                    logger=ctx.logger,
+                    interval_sec=snapshot_cfg.interval_sec,
+                )
+            else:
+                ctx.warm_restart_snapshot_service = None
+                ctx.warm_restart_snapshot_task = None
+
             OverseasBootstrap(ctx).build_favorite_price_alert(config_dict, needs_web=needs_web)
 
             if needs_web:
+                notifications_cfg = getattr(ctx.full_config, "notifications", None)
                 ctx.notification_queue_task = NotificationQueueTask(
                     notification_service=ctx.notification_service,
-                    poll_interval=config_dict.get("notification_queue_poll_interval", 1.0),
-                    telegram_config=getattr(getattr(ctx.full_config, "notifications", None), "telegram", None),
+                    telegram_config=getattr(notifications_cfg, "telegram", None),
+                    dispatch_config=getattr(notifications_cfg, "dispatch", None),
                     logger=ctx.logger,
                 )
             else:
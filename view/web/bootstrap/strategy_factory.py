@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from config.config_loader import ScanFunnelConfig
 from core.logger import get_strategy_logger
 from scheduler.strategy_scheduler import StrategyScheduler, StrategySchedulerConfig
 from strategies.first_pullback_strategy import FirstPullbackStrategy
@@ -45,6 +46,7 @@ class StrategyFactory:
                 ctx.runtime_mode,
             )
             return
+        funnel_cfg = getattr(getattr(ctx, "full_config", None), "scan_funnel", None)
         ctx.scheduler = StrategyScheduler(
             virtual_trade_service=ctx.virtual_trade_service,
             order_execution_service=ctx.order_execution_service,
@@ -64,6 +66,10 @@ class StrategyFactory:
             event_shadow_journal=getattr(ctx, "event_shadow_journal_service", None),
             price_stream_service=getattr(ctx, "price_stream_service", None),
             market_regime_service=getattr(ctx.oneil_universe_service, "market_regime_service", None),
+            rejection_distribution_service=getattr(ctx, "rejection_distribution_service", None),
+            rejection_log_sample_every=(
+                funnel_cfg.rejection_log_sample_every if isinstance(funnel_cfg, ScanFunnelConfig) else 1
+            ),
             live_expansion_gate_service=StrategyLiveExpansionGateService(
                 journal_records_provider=ctx.virtual_trade_service.get_standard_journal_records,
                 is_paper_trading_fn=lambda: bool(getattr(ctx.env, "is_paper_trading", True)),
@@ -59,6 +59,12 @@ class WiringPhase:
         if ctx.stock_query_service:
             ctx.stock_query_service.price_stream_service = ctx.price_stream_service
             ctx.stock_query_service.price_subscription_service = ctx.price_subscription_service
+            if ctx.price_subscription_service:
+                ctx.price_subscription_service.set_rest_fallback_source(
+                    ctx.stock_query_service.rest_fallback_counts_snapshot
+                )
+            # StockQuery ← RestPricePoller (폴링 대상 종목의 snapshot 신선도 기준)
+            ctx.stock_query_service.rest_price_poller = getattr(ctx, "rest_price_poller", None)
 
         # Streaming ← StreamingStockRepo
         if ctx.streaming_service and ctx.streaming_stock_repo:
@@ -0,0 +1,58 @@
+"""
+응답 압축 미들웨어 (gzip).
+
+차트·히트맵·가상매매 이력 JSON 은 수백 KB 까지 커지고 반복 키가 많아 압축률이 높다.
+크기 임계값 미만 응답은 압축 비용이 이득보다 커서 그대로 보낸다. SSE(text/event-stream)와
+이미지 등의 제외는 Starlette 공개 `GZipMiddleware` 를 그대로 따른다 — 스트림이 버퍼링되면 안 된다.
+이 모듈은 공개 미들웨어를 감싸 임계값·압축 레벨을 정하고 Accept-Encoding 의 q=0 을 존중할 뿐,
+Starlette 내부 responder 에는 기대지 않는다.
+"""
+from __future__ import annotations
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+DEFAULT_MINIMUM_SIZE = 1024          # bytes — 이보다 작은 응답은 압축하지 않는다
+DEFAULT_GZIP_LEVEL = 6               # 9 대비 CPU 는 절반, 크기는 1~2% 차이
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Accept-Encoding 에서 q=0 이 아닌 코딩 이름 집합."""
+    accepted = set()
+    for part in header.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip())
+    return accepted
+
+
+class CompressionMiddleware:
+    """gzip 을 받는 요청만 Starlette GZipMiddleware 로 넘기고 나머지는 그대로 통과시키는 ASGI 미들웨어."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = DEFAULT_GZIP_LEVEL,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self._gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in _accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        ):
+            await self._gzip(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,38 @@
+"""
+orjson 기반 JSON 응답.
+
+Starlette 기본 JSONResponse 는 json.dumps(allow_nan=False) 라 지표 계산에서 나온 NaN/Inf 가
+섞이면 500 이 나고, 그래서 라우트마다 재귀 sanitize 를 돌려야 했다. orjson 은 NaN/Inf 를
+null 로 내보내므로 별도 정제 없이 안전하고, numpy 배열·스칼라도 그대로 직렬화한다.
+orjson 이 모르는 타입(pydantic 모델, Decimal, pandas Timestamp 등)만 jsonable_encoder 로 넘긴다.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """orjson 이 직접 직렬화하지 못하는 객체의 폴백 변환."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "item") and not hasattr(obj, "__len__"):  # numpy/pandas 스칼라 (NaT 등)
+        return obj.item()
+    return jsonable_encoder(obj)
+
+
+def render_json(content: Any) -> bytes:
+    """content 를 UTF-8 JSON bytes 로. NaN/Inf 는 null."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse 호환 orjson 응답 (media_type application/json)."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
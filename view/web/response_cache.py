@@ -0,0 +1,162 @@
+"""
+렌더링된 JSON 응답 캐시 (opt-in 데코레이터).
+
+차트(지표 포함)·랭킹·히트맵은 여러 탭/사용자가 같은 파라미터로 수 초 간격 폴링하는데,
+원천 데이터는 장마감 배치나 해당 종목 틱이 들어올 때만 바뀐다. 같은 (라우트, 파라미터,
+데이터 버전) 이면 직전에 직렬화한 bytes 를 그대로 돌려준다.
+
+- 데이터 버전: core.cache.data_version 토픽 버전(장마감 태스크가 bump)과 종목 틱 시각 등,
+  라우트가 넘긴 version 콜백의 반환값. 값이 달라지면 TTL 이 남아 있어도 다시 만든다.
+- TTL: 버전으로 잡히지 않는 변화(장중 외부 시세 등)의 최대 지연 상한.
+- 캐시는 WebAppContext.response_cache 에 ResponseCache 가 있을 때만 동작한다. 없으면
+  (테스트의 MagicMock ctx 등) 매번 실행하되 orjson 렌더링 경로는 동일하게 탄다.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from common.types import ErrorCode
+from view.web import api_common
+from view.web.fast_json import render_json
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+VersionFn = Callable[[Any, dict], Union[Hashable, Awaitable[Hashable]]]
+TtlSpec = Union[float, Callable[[Any], float]]
+
+
+def is_success_payload(payload: Any) -> bool:
+    """rt_cd 가 성공인 dict 응답만 캐시한다 (일시 오류를 TTL 동안 굳히지 않는다)."""
+    return isinstance(payload, dict) and payload.get("rt_cd") == ErrorCode.SUCCESS.value
+
+
+class ResponseCache:
+    """(namespace, params) → (version, 만료시각, body) LRU. 항목 수와 총 bytes 로 제한한다."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[tuple, tuple[Hashable, float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "expired": 0, "stores": 0, "evictions": 0}
+
+    def lookup(self, key: tuple, version: Hashable) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        cached_version, expires_at, body = entry
+        if cached_version != version:
+            self._stats["stale"] += 1
+            self._drop(key)
+            return None
+        if self._clock() >= expires_at:
+            self._stats["expired"] += 1
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return body
+
+    def store(self, key: tuple, version: Hashable, body: bytes, ttl_sec: float) -> None:
+        if ttl_sec <= 0 or len(body) > self._max_bytes:
+            return
+        self._drop(key)
+        self._entries[key] = (version, self._clock() + ttl_sec, body)
+        self._bytes += len(body)
+        self._stats["stores"] += 1
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """namespace 의 항목(없으면 전체)을 지우고 지운 개수를 반환."""
+        keys = [k for k in self._entries if namespace is None or k[0] == namespace]
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def stats_snapshot(self) -> dict:
+        return {**self._stats, "entries": len(self._entries), "bytes": self._bytes}
+
+    def _drop(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[2])
+
+
+def _json_response(body: bytes, cache_state: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={"X-Cache": cache_state})
+
+
+def _public_mode(ctx) -> bool:
+    # public 모드는 _serialize_response 가 마스킹한 결과를 돌려주므로 키를 분리한다.
+    from view.web.deployment_policy import is_public_mode
+    try:
+        return is_public_mode(ctx)
+    except Exception:
+        return False
+
+
+def cached_response(
+    namespace: str,
+    *,
+    ttl_sec: TtlSpec,
+    version: Optional[VersionFn] = None,
+    cache_if: Callable[[Any], bool] = is_success_payload,
+):
+    """라우트 반환 dict 를 orjson 으로 렌더링하고, 캐시가 켜져 있으면 bytes 를 재사용한다.
+
+    Args:
+        namespace: 캐시 키 접두 (라우트 식별자). invalidate(namespace) 단위이기도 하다.
+        ttl_sec: 초 또는 payload → 초 콜백 (예: 장중 실시간 응답만 짧게).
+        version: (ctx, params) → 해시 가능한 데이터 버전. 동기/비동기 모두 허용.
+        cache_if: 캐시에 넣을 payload 판정 (기본: rt_cd 성공).
+
+    라우트가 Response 를 직접 반환하면 캐시하지 않고 그대로 통과시킨다. Request 인자는
+    키에서 제외한다. functools.wraps 로 시그니처를 보존해 FastAPI 파라미터 해석은 그대로다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            ctx = api_common._ctx
+            cache = getattr(ctx, "response_cache", None) if ctx is not None else None
+            if not isinstance(cache, ResponseCache):
+                result = await func(*args, **kwargs)
+                return result if isinstance(result, Response) else _json_response(render_json(result), "BYPASS")
+
+            params = {k: v for k, v in kwargs.items() if not isinstance(v, Request)}
+            key = (namespace, _public_mode(ctx), tuple(sorted(params.items())))
+            data_version = None
+            if version is not None:
+                data_version = version(ctx, params)
+                if inspect.isawaitable(data_version):
+                    data_version = await data_version
+
+            body = cache.lookup(key, data_version)
+            if body is not None:
+                return _json_response(body, "HIT")
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            body = render_json(result)
+            if cache_if(result):
+                ttl = ttl_sec(result) if callable(ttl_sec) else ttl_sec
+                cache.store(key, data_version, body, ttl)
+            return _json_response(body, "MISS")
+
+        return wrapper
+
+    return decorator
@@ -10,6 +10,8 @@ from view.web.api_common import (
     check_role_for_request,
 )
 
+from view.web.fast_json import FastJSONResponse
+
 from view.web.routes.auth import router as auth_router
 from view.web.routes.stock import router as stock_router
 from view.web.routes.balance import router as balance_router
@@ -31,7 +33,7 @@ from view.web.routes.ai import router as ai_router
 from view.web.routes.youtube import router as youtube_router
 from view.web.routes.trade_trend import router as trade_trend_router
 
-router = APIRouter(prefix="/api")
+router = APIRouter(prefix="/api", default_response_class=FastJSONResponse)
 protected_router = APIRouter(
     dependencies=[
         Depends(check_auth),
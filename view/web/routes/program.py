@@ -4,13 +4,15 @@
 import asyncio
 import json
 import logging
-from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 from view.web.api_common import (
     _get_ctx, _serialize_response,
     ProgramTradingRequest, ProgramTradingUnsubscribeRequest, ProgramTradingDataModel,
 )
 from repositories.streaming_stock_repo import StreamingType
+from services.program_trading_history import DOWNSAMPLE_BUCKETS, replay_rows
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -48,6 +50,26 @@ async def get_program_trading_history(code: str):
         return result
 
 
+@router.get("/program-trading/history-series/{code}")
+async def get_program_trading_history_series(
+    code: str,
+    bucket: int = Query(10),
+    since: Optional[float] = Query(None),
+):
+    """당일 프로그램매매 틱을 bucket 초(1/10/60) 단위로 집계한 열 지향 시계열.
+
+    since(epoch 초) 를 주면 그 시각이 속한 버킷부터만 돌려준다. 응답의 next_since 를 다음
+    요청의 since 로 넘기면 마지막(진행 중) 버킷을 다시 받아 덮어쓰는 증분 폴링이 된다.
+    """
+    if bucket not in DOWNSAMPLE_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"bucket 은 {DOWNSAMPLE_BUCKETS} 중 하나여야 합니다.")
+    ctx = _get_ctx()
+    series = ctx.program_trading_stream_service.get_history_series(code, bucket, since=since)
+    if series is None:
+        return {"success": False, "msg": "히스토리 없음"}
+    return {"success": True, "data": series}
+
+
 @router.post("/program-trading/unsubscribe")
 async def unsubscribe_program_trading(req: ProgramTradingUnsubscribeRequest = None):
     """프로그램매매 구독 해지. code 지정 시 개별 해지, 미지정 시 전체 해지."""
@@ -77,34 +99,24 @@ async def get_program_trading_status():
 
 
 @router.get("/program-trading/stream")
-async def stream_program_trading(request: Request):
-    """SSE 스트리밍: 프로그램매매 실시간 데이터를 브라우저에 전달 (Array 배열 전송 최적화 적용)."""
+async def stream_program_trading(request: Request, replay: bool = True):
+    """SSE 스트리밍: 프로그램매매 실시간 데이터를 브라우저에 전달 (Array 배열 전송 최적화 적용).
+
+    replay=false 면 과거 데이터 없이 실시간만 보낸다 — program.html 은 첫 로드를
+    /program-trading/history-series 로 따로 받는다.
+    """
     ctx = _get_ctx()
     # 매니저를 통해 큐 생성 및 등록
     queue = ctx.program_trading_stream_service.create_subscriber_queue()
 
     async def event_generator():
         try:
-            # 1. 저장된 과거 데이터 먼저 전송 (Replay)
-            history = ctx.program_trading_stream_service.get_history_data()
+            # 1. 저장된 과거 데이터 먼저 전송 (Replay) — 틱 전체 대신 1분 버킷 집계
+            history = ctx.program_trading_stream_service.get_history_data() if replay else {}
             for code, items in list(history.items()):
-                for item in list(items):
-                    # 과거 데이터도 클라이언트가 해석할 수 있도록 Array로 변환하여 전송
-                    # 배열 순서: [종목코드, 체결시간, 현재가, 등락률, 대비, 부호, 매도체결, 매수체결, 순매수체결, 순매수대금, 매도잔량, 매수잔량]
-                    payload = [
-                        code,
-                        item.get('주식체결시간', ''),
-                        item.get('price', 0),
-                        item.get('rate', 0),
-                        item.get('change', 0),
-                        item.get('sign', ''),
-                        item.get('매도체결량', 0),
-                        item.get('매수2체결량', 0),
-                        item.get('순매수체결량', 0),
-                        item.get('순매수거래대금', 0),
-                        item.get('매도호가잔량', 0),
-                        item.get('매수호가잔량', 0)
-                    ]
+                # 과거 데이터도 클라이언트가 해석할 수 있도록 Array로 변환하여 전송
+                # 배열 순서: [종목코드, 체결시간, 현재가, 등락률, 대비, 부호, 매도체결, 매수체결, 순매수체결, 순매수대금, 매도잔량, 매수잔량]
+                for payload in replay_rows(code, items):
                     yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
                     await asyncio.sleep(0.0001)
 
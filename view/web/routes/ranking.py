@@ -8,8 +8,11 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from common.types import ErrorCode
+from core.cache.data_version import DAILY_PRICES, RANKING, data_versions
+from core.lazy_service import aresolve_lazy
 from services.ai_usage_limiter import AiUsageLimitExceeded
 from view.web.api_common import _get_ctx, _serialize_response, _serialize_list_items
+from view.web.response_cache import cached_response
 
 router = APIRouter()
 
@@ -86,7 +89,7 @@ async def get_theme_leaders(include_industry: bool = False):
     데이터 미수집 시 rt_cd="0", data=[] 로 응답한다(진행률 폴링 없음).
     """
     ctx = _get_ctx()
-    svc = getattr(ctx, "theme_leader_service", None)
+    svc = await aresolve_lazy(getattr(ctx, "theme_leader_service", None))
     if not svc:
         return {"rt_cd": "1", "msg1": "ThemeLeaderService 미설정", "data": None}
     cats = ("theme", "industry") if include_industry else ("theme",)
@@ -127,7 +130,7 @@ async def analyze_ranking_candidates(payload: RankingAIAnalysisRequest):
             "data": None,
         }
 
-    ai_service = getattr(ctx, "ai_analysis_service", None)
+    ai_service = await aresolve_lazy(getattr(ctx, "ai_analysis_service", None))
     if ai_service is None:
         raise HTTPException(
             status_code=503,
@@ -179,6 +182,7 @@ async def get_period_investor_program_ranking(
 
 
 @router.get("/ranking/ytd")
+@cached_response("ranking_ytd", ttl_sec=300.0, version=lambda ctx, params: data_versions.get(DAILY_PRICES))
 async def get_ytd_return_ranking(limit: int = Query(100, ge=1, le=500), market: Optional[str] = Query(None)):
     """저장된 일별 스냅샷으로 연초 대비 수익률 랭킹을 반환한다."""
     ctx = _get_ctx()
@@ -267,7 +271,14 @@ async def _domestic_heatmap_rows(ctx, repository, *, limit: int, market: Optiona
     return await repository.get_market_cap_snapshot(limit=limit, market=market), False
 
 
+def _heatmap_ttl_sec(payload: dict) -> float:
+    """장중 실시간 스냅샷은 짧게, 장마감 스냅샷은 daily_prices 버전이 바뀔 때까지 길게."""
+    return 5.0 if (payload.get("data") or {}).get("realtime") else 60.0
+
+
 @router.get("/heatmap/domestic")
+@cached_response("heatmap_domestic", ttl_sec=_heatmap_ttl_sec,
+                 version=lambda ctx, params: data_versions.get(DAILY_PRICES))
 async def get_domestic_heatmap(
     limit: int = Query(300, ge=1, le=1000),
     market: Optional[str] = Query(None),
@@ -339,6 +350,7 @@ async def get_domestic_heatmap(
 
 
 @router.get("/ranking/{category}")
+@cached_response("ranking", ttl_sec=5.0, version=lambda ctx, params: data_versions.get(RANKING))
 async def get_ranking(category: str):
     """랭킹 조회 (rise/fall/volume/trading_value/foreign_buy/foreign_sell/inst_buy/inst_sell/prsn_buy/prsn_sell)."""
     ctx = _get_ctx()
@@ -9,6 +9,8 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from common.overseas_types import OverseasExchange
 from common.types import Exchange
+from core.cache.data_version import OHLCV, data_versions
+from core.lazy_service import aresolve_lazy
 from services.ai_client import AiClientError
 from services.ai_signal import extract_signal
 from services.ai_usage_limiter import AiUsageLimitExceeded
@@ -19,6 +21,7 @@ from view.web.api_common import _get_ctx, _serialize_response, EnvironmentReques
 import view.web.api_common as api_common
 from view.web.market_mode_utils import enabled_market_modes_of, is_market_enabled, market_mode_of
 from view.web.deployment_policy import is_demo_mode
+from view.web.response_cache import cached_response
 
 router = APIRouter()
 
@@ -129,7 +132,7 @@ async def get_stocks_list():
 async def get_overseas_stocks_list():
     """해외(미국) 전 심볼 리스트 반환 (클라이언트 자동완성용, localStorage 캐싱 대상)."""
     ctx = _get_ctx()
-    repo = getattr(ctx, "overseas_stock_code_repository", None)
+    repo = await aresolve_lazy(getattr(ctx, "overseas_stock_code_repository", None))
     if repo is None:
         return {"stocks": [], "count": 0}
     stock_list = repo.all_symbols()
@@ -269,7 +272,7 @@ async def get_ai_stock_analysis(code: str):
         ]
 
     async def _load_news():
-        collector = getattr(ctx, "stock_news_collector", None)
+        collector = await aresolve_lazy(getattr(ctx, "stock_news_collector", None))
         if collector is None:
             return []
         articles = await collector.collect(code, limit=10)
@@ -381,8 +384,8 @@ async def get_ai_news_review(code: str):
     ctx = _get_ctx()
     if not code.isdigit() or len(code) != 6:
         raise HTTPException(status_code=400, detail="국내 종목코드 6자리를 입력하세요.")
-    analyzer = getattr(ctx, "ai_news_analyzer", None)
-    collector = getattr(ctx, "stock_news_collector", None)
+    analyzer = await aresolve_lazy(getattr(ctx, "ai_news_analyzer", None))
+    collector = await aresolve_lazy(getattr(ctx, "stock_news_collector", None))
     if analyzer is None or collector is None:
         raise HTTPException(
             status_code=503,
@@ -584,7 +587,15 @@ async def get_overseas_market_cap():
     return {"rt_cd": "0", "msg1": "미국 주요 대형주 시가총액 조회 성공", "data": data}
 
 
+def _chart_data_version(ctx, params: dict):
+    """차트 데이터 버전 — 일봉 배치 버전 + 해당 종목 마지막 틱 시각(당일 봉 갱신)."""
+    stream = getattr(ctx, "price_stream_service", None)
+    last_tick = stream.get_last_tick_ts(params.get("code")) if stream is not None else 0.0
+    return data_versions.get(OHLCV), last_tick
+
+
 @router.get("/chart/{code}")
+@cached_response("chart", ttl_sec=10.0, version=_chart_data_version)
 async def get_stock_chart(code: str, period: str = "D", indicators: bool = False, exchange: str = Query("KRX")):
     """종목의 OHLCV 차트 데이터 조회 (기본 일봉). indicators=true 시 MA+BB 지표 포함. exchange=KRX|NXT|UN 선택 가능."""
     ctx = _get_ctx()
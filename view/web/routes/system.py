@@ -200,6 +200,15 @@ def get_operations_status():
         except Exception:
             queue_depth = 0
 
+    notification_dispatch = None
+    nq_task = getattr(ctx, "notification_queue_task", None)
+    if nq_task is not None and hasattr(nq_task, "get_progress"):
+        try:
+            progress = nq_task.get_progress()
+            notification_dispatch = progress.get("dispatch") if isinstance(progress, dict) else None
+        except Exception:
+            notification_dispatch = None
+
     kill_switch = None
     ks = getattr(ctx, "kill_switch_service", None)
     if ks is not None and hasattr(ks, "get_status"):
@@ -238,6 +247,7 @@ def get_operations_status():
             "data_quality": data_quality,
             "websocket": websocket,
             "notification_queue_depth": queue_depth,
+            "notification_dispatch": notification_dispatch,
             "kill_switch": kill_switch,
             "after_market_reconcile": reconcile,
             "price_lookup": price_lookup,
@@ -885,6 +895,22 @@ async def force_cache_warmup():
     return {"success": True, "message": "캐시 웜업이 시작되었습니다."}
 
 
+CACHE_WARMUP_READINESS_MAX_WAIT_SEC = 30.0
+
+
+@router.get("/background/cache-warmup/readiness")
+async def get_cache_warmup_readiness(wait: float = 0.0):
+    """일괄 웜업 준비 상태(ready, 기준일, 단계별 커버리지·소요). wait>0 이면 준비될 때까지 최대 그만큼 기다린다."""
+    ctx = _get_ctx()
+    task = getattr(ctx, "cache_warmup_task", None)
+    if not task:
+        raise HTTPException(status_code=503, detail="CacheWarmupTask가 초기화되지 않았습니다")
+
+    if wait > 0:
+        await task.wait_until_ready(timeout=min(wait, CACHE_WARMUP_READINESS_MAX_WAIT_SEC))
+    return {"success": True, "data": task.get_readiness()}
+
+
 @router.post("/background/newhigh/force-update")
 async def force_newhigh_update():
     """skip 조건을 무시하고 52주 신고가 탐색을 강제 실행한다."""
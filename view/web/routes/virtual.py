@@ -3,12 +3,14 @@
 """
 import asyncio
 import logging
-import math
-import time
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
 from common.trade_journal_comparison import compare_trade_journals
 from repositories.backtest_journal_repository import BacktestJournalRepository
+from services.virtual_trade_view import DEFAULT_PAGE_LIMIT, VirtualTradeView
 from view.web.api_common import _get_ctx, _PRICE_CACHE
+from view.web.fast_json import FastJSONResponse
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone, timedelta
@@ -160,8 +162,11 @@ def _build_chart_trade_counts(vm, histories: dict[str, list], strategy_names: li
 
 
 @router.get("/virtual/chart/{strategy_name}")
-async def get_strategy_chart(strategy_name: str, strategies: str | None = None):
-    """특정 전략의 수익률 히스토리(차트용) 반환 + 벤치마크(KOSPI200, KOSDAQ150) 포함"""
+async def get_strategy_chart(strategy_name: str, strategies: str | None = None, request: Request = None):
+    """특정 전략의 수익률 히스토리(차트용) 반환 + 벤치마크(KOSPI200, KOSDAQ150) 포함
+
+    원장(스냅샷 포함)이 바뀌지 않았으면 TTL 동안 직전 응답을 재사용하고 ETag 로 304 를 준다.
+    """
     ctx = _get_ctx()
     async with ctx.pm.profile_async(f"get_strategy_chart({strategy_name})"):
         t_start = ctx.pm.start_timer()
@@ -169,6 +174,13 @@ async def get_strategy_chart(strategy_name: str, strategies: str | None = None):
         if vm is None:
             return {"histories": {}, "benchmarks": {}, "chart_counts": {}}
 
+        view = _get_virtual_trade_view(ctx, vm)
+        cache_key = (strategy_name, strategies or "")
+        cached = view.get_chart(cache_key)
+        if cached is not None:
+            ctx.pm.log_timer(f"get_strategy_chart({strategy_name})", t_start)
+            return _conditional_json(request, cached["etag"], cached["payload"])
+
         # 1. 히스토리 데이터 수집
         if strategy_name == "ALL":
             selected_strategy_names = (
@@ -219,19 +231,11 @@ async def get_strategy_chart(strategy_name: str, strategies: str | None = None):
             "KOSDAQ150": kosdaq_benchmark,
         }
 
+        entry = view.store_chart(cache_key, jsonable_encoder({
+            "histories": histories, "benchmarks": benchmarks, "chart_counts": chart_counts,
+        }))
         ctx.pm.log_timer(f"get_strategy_chart({strategy_name})", t_start)
-        return {"histories": histories, "benchmarks": benchmarks, "chart_counts": chart_counts}
-
-
-def _sanitize_for_json(obj):
-    """NaN / Infinity → 0.0 으로 치환하여 JSON 직렬화 안전성 보장."""
-    if isinstance(obj, float):
-        return 0.0 if (math.isnan(obj) or math.isinf(obj)) else obj
-    if isinstance(obj, dict):
-        return {k: _sanitize_for_json(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_sanitize_for_json(v) for v in obj]
-    return obj
+        return _conditional_json(request, entry["etag"], entry["payload"])
 
 
 def _empty_divergence_report(backtest_records: list[dict] | None = None) -> dict:
@@ -359,7 +363,7 @@ async def get_virtual_standard_journal(limit: int | None = 500):
     if limit is not None and limit > 0:
         records = records[-limit:]
 
-    return _sanitize_for_json({
+    return FastJSONResponse({
         "records": records,
         "count": len(records),
         "total_count": total_count,
@@ -376,16 +380,16 @@ async def post_virtual_backtest_divergence(
     vm = _sync_virtual_trade_state(ctx)
 
     if vm is None:
-        return _sanitize_for_json(_expand_debug_divergence_report(_empty_divergence_report(backtest_records)))
+        return FastJSONResponse(_expand_debug_divergence_report(_empty_divergence_report(backtest_records)))
 
     if hasattr(vm, "compare_with_backtest_journal"):
-        return _sanitize_for_json(_expand_debug_divergence_report(vm.compare_with_backtest_journal(backtest_records)))
+        return FastJSONResponse(_expand_debug_divergence_report(vm.compare_with_backtest_journal(backtest_records)))
 
     if hasattr(vm, "get_standard_journal_records"):
         live_records = vm.get_standard_journal_records()
-        return _sanitize_for_json(_expand_debug_divergence_report(compare_trade_journals(backtest_records, live_records)))
+        return FastJSONResponse(_expand_debug_divergence_report(compare_trade_journals(backtest_records, live_records)))
 
-    return _sanitize_for_json(_expand_debug_divergence_report(_empty_divergence_report(backtest_records)))
+    return FastJSONResponse(_expand_debug_divergence_report(_empty_divergence_report(backtest_records)))
 
 
 @router.get("/virtual/backtest-journals")
@@ -394,7 +398,7 @@ async def get_virtual_backtest_journal_runs(limit: int | None = 50):
     ctx = _get_ctx()
     repo = _get_backtest_journal_repository(ctx)
     runs = repo.list_runs(limit=limit)
-    return _sanitize_for_json({"runs": runs, "count": len(runs)})
+    return FastJSONResponse({"runs": runs, "count": len(runs)})
 
 
 @router.get("/virtual/backtest-journals/{run_id}")
@@ -403,7 +407,7 @@ async def get_virtual_backtest_journal_records(run_id: str):
     ctx = _get_ctx()
     repo = _get_backtest_journal_repository(ctx)
     records = [_expand_debug_journal_fields(record) for record in repo.load_records(run_id)]
-    return _sanitize_for_json({
+    return FastJSONResponse({
         "run_id": run_id,
         "records": records,
         "count": len(records),
@@ -567,134 +571,104 @@ def _aggregate_virtual_data(trades, vm, apply_cost):
 
 
 @router.get("/virtual/history")
-async def get_virtual_history(force_code: str = None, apply_cost: bool = True):
-    """가상 매매 전체 기록 조회 (force_code 지정 시 해당 종목은 캐시 무시)"""
+async def get_virtual_history(
+    request: Request,
+    force_code: str = None,
+    apply_cost: bool = True,
+    since: int | None = None,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=5000),
+):
+    """가상 매매 전체 기록 조회 (force_code 지정 시 해당 종목은 캐시 무시)
+
+    응답에는 materialized view 의 version 과 ETag 가 붙는다. If-None-Match 가 현재 ETag 와
+    같으면 304 를 돌려준다. since 를 주면 그 version 이후 바뀐 거래(trades)·삭제된 row_key
+    (removed)만 cursor 페이지로 돌려주고, since 를 보장할 수 없으면 전체를 reset=true 로 준다.
+    """
     ctx = _get_ctx()
     from view.web.deployment_policy import is_demo_mode
 
     if is_demo_mode(ctx):
         return ctx.demo_market_data_service.get_virtual_history()
     async with ctx.pm.profile_async("get_virtual_history"):
-        return await _get_virtual_history_impl(ctx, force_code, apply_cost)
+        return await _get_virtual_history_impl(
+            ctx, force_code, apply_cost,
+            request=request, since=since, cursor=cursor, limit=limit,
+        )
+
+
+def _get_virtual_trade_view(ctx, vm) -> VirtualTradeView:
+    """ctx 에 붙은 VirtualTradeView 를 재사용한다 (가상매매 서비스가 바뀌면 새로 만든다)."""
+    view = getattr(ctx, "virtual_trade_view", None)
+    if isinstance(view, VirtualTradeView) and view.vm is vm:
+        return view
+
+    stock_query_service = getattr(ctx, "stock_query_service", None)
+    view = VirtualTradeView(
+        vm,
+        aggregate=_aggregate_virtual_data,
+        fetch_multi_price=(
+            (lambda codes: ctx.stock_query_service.get_multi_price(codes))
+            if stock_query_service is not None else None
+        ),
+        price_stream=getattr(ctx, "price_stream_service", None),
+        fresh_price=(
+            ctx.stock_query_service.get_fresh_price
+            if stock_query_service is not None else None
+        ),
+        name_resolver=getattr(ctx, "stock_code_repository", None),
+        price_cache=_PRICE_CACHE,
+        logger=logger,
+    )
+    try:
+        ctx.virtual_trade_view = view
+    except Exception:
+        pass
+    return view
 
 
-async def _get_virtual_history_impl(ctx, force_code, apply_cost):
-    """get_virtual_history의 실제 구현 (Pandas 고속 집계 적용 버전)"""
+def _etag_matches(request: Request | None, etag: str) -> bool:
+    if request is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in {tag.strip() for tag in header.split(",")}
+
+
+def _conditional_json(request: Request | None, etag: str, payload):
+    """ETag 가 일치하면 본문 없는 304, 아니면 ETag 를 붙인 JSON 응답."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(content=payload, headers=headers)
+
+
+async def _get_virtual_history_impl(ctx, force_code, apply_cost, *, request=None, since=None,
+                                    cursor=None, limit=DEFAULT_PAGE_LIMIT):
+    """get_virtual_history의 실제 구현 — 증분 materialized view(VirtualTradeView) 기반.
+
+    원장이 바뀌지 않고 가격도 그대로면 재조회·재집계 없이 직전 payload 를 재사용한다.
+    """
     t_start = ctx.pm.start_timer()
     vm = _sync_virtual_trade_state(ctx)
     if vm is None:
         return {"trades": [], "weekly_changes": {}}
 
-    trades = [t for t in vm.get_all_trades(apply_cost=apply_cost) if t.get('status') != 'FAILED']
-
-    # ---------------------------------------------------------
-    # 1~3단계: 종목명 및 현재가 Enrichment (기존 로직 유지 - API 통신)
-    # ---------------------------------------------------------
-    try:
-        mapper = getattr(ctx, 'stock_code_repository', None)
-        hold_codes = set()
-        
-        for trade in trades:
-            code = str(trade.get('code', ''))
-            trade['stock_name'] = mapper.get_name_by_code(code) if mapper else ''
-            if code.strip():
-                hold_codes.add(code)
-
-        hold_codes = list(hold_codes)
-        price_map = {}
-        
-        if hold_codes and getattr(ctx, 'stock_query_service', None):
-            now = time.time()
-            cached_codes = {}
-            fetch_codes = []
-            
-            # 캐시 확인
-            for code in hold_codes:
-                if code != force_code and code in _PRICE_CACHE:
-                    c_price, c_rate, c_ts = _PRICE_CACHE[code]
-                    if now - c_ts < 60:
-                        cached_codes[code] = (c_price, c_rate, False, c_ts)
-                        continue
-                fetch_codes.append(code)
-
-            price_map.update(cached_codes)
-
-            # API 배치 조회
-            if fetch_codes:
-                for batch_start in range(0, len(fetch_codes), 30):
-                    batch = fetch_codes[batch_start:batch_start + 30]
-                    try:
-                        resp = await ctx.stock_query_service.get_multi_price(batch)
-                        if resp and resp.rt_cd == "0" and isinstance(resp.data, list):
-                            for item in resp.data:
-                                if not isinstance(item, dict): continue
-                                code = item.get("stck_shrn_iscd", "")
-                                if not code: continue
-                                
-                                price_val = int(float(item.get("stck_prpr", "0")))
-                                rate_str = item.get("prdy_ctrt", "0")
-                                rate_val = float(rate_str) if rate_str not in ('N/A', '', 'None') else 0.0
-                                
-                                if price_val > 0:
-                                    _PRICE_CACHE[code] = (price_val, rate_val, time.time())
-                                    price_map[code] = (price_val, rate_val, False, time.time())
-                    except Exception as e:
-                        logger.error(f"[WebAPI] 복수종목 조회 예외: {e}")
-
-                # API 실패 시 기존 캐시 폴백
-                for code in fetch_codes:
-                    if code not in price_map and code in _PRICE_CACHE:
-                        cached_price, cached_rate, cached_time = _PRICE_CACHE[code]
-                        price_map[code] = (cached_price, cached_rate, True, cached_time)
-
-        # 현재가 반영 및 개별 수익률 재계산
-        for trade in trades:
-            if trade['code'] in price_map:
-                cur, daily_rate, cached, ts = price_map[trade['code']]
-                trade['current_price'] = cur
-                trade['is_cached'] = cached
-                trade['cache_ts'] = ts
-                
-                bp = float(trade.get('buy_price', 0) or 0)
-                qty = float(trade.get('qty', 1) or 1)
-                
-                if trade['status'] == 'HOLD':
-                    trade['daily_change_rate'] = daily_rate
-                    trade['return_rate'] = vm.calculate_return(bp, cur, qty, apply_cost=apply_cost)
-            
-            if trade['status'] == 'SOLD':
-                sp = float(trade.get('sell_price') or 0)
-                bp = float(trade.get('buy_price', 0) or 0)
-                qty = float(trade.get('qty', 1) or 1)
-                
-                if sp == 0.0 and trade.get('current_price'):
-                    cur = trade['current_price']
-                    trade['sell_price'] = cur
-                    trade['return_rate'] = vm.calculate_return(bp, cur, qty, apply_cost=apply_cost)
-                    try:
-                        vm.fix_sell_price(trade['code'], trade.get('buy_date', ''), cur)
-                    except Exception: pass
-                else:
-                    trade['return_rate'] = vm.calculate_return(bp, sp, qty, apply_cost=apply_cost)
-                    trade['sell_price'] = sp
-
-                # 미매도 가정 수익률 (매수가 → 현재가)
-                cur = trade.get('current_price')
-                if cur:
-                    trade['hold_return_rate'] = vm.calculate_return(bp, float(cur), qty, apply_cost=apply_cost)
-
-    except Exception as e:
-        logger.error(f"[WebAPI] virtual/history enrichment 오류: {e}")
+    view = _get_virtual_trade_view(ctx, vm)
+    await view.refresh(apply_cost, force_code=force_code)
+    etag = view.etag(apply_cost)
 
-    # ---------------------------------------------------------
-    # 4~7단계: Pandas 고속 집계 — CPU-bound 작업을 thread pool로 위임
-    # (이벤트 루프 차단 방지: 집계 중에도 다른 요청 처리 가능)
-    # ---------------------------------------------------------
-    loop = asyncio.get_event_loop()
-    agg = await loop.run_in_executor(None, _aggregate_virtual_data, trades, vm, apply_cost)
+    payload = None
+    if since is not None:
+        payload = view.changes_since(apply_cost, since, cursor=cursor, limit=limit)
+    if payload is None:
+        payload = view.payload(apply_cost)
+        if since is not None:
+            payload = {**payload, "reset": True}
 
     ctx.pm.log_timer("get_virtual_history", t_start)
-    return _sanitize_for_json({"trades": trades, **agg})
+    return _conditional_json(request, etag, payload)
 
 
 @router.get("/virtual/stage3-alerts")
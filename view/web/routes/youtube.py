@@ -8,6 +8,7 @@ import logging
 
 from fastapi import APIRouter, Body, HTTPException
 
+from core.lazy_service import aresolve_lazy
 from view.web.api_common import _get_ctx
 
 router = APIRouter(prefix="/youtube", tags=["youtube"])
@@ -21,6 +22,14 @@ def _ctx_attr(ctx, name: str, default=None):
     return getattr(ctx, name, default)
 
 
+async def _lazy_attr(ctx, name: str):
+    """지연 생성 저장소·수집기를 루프 밖에서 만들어 돌려준다. 생성 실패면 503."""
+    service = await aresolve_lazy(getattr(ctx, name, None))
+    if service is None:
+        raise HTTPException(status_code=503, detail=f"{name} 를 사용할 수 없습니다.")
+    return service
+
+
 # --- 채널 관리 ---------------------------------------------------------------
 
 
@@ -28,7 +37,8 @@ def _ctx_attr(ctx, name: str, default=None):
 async def list_channels():
     """등록된 채널 목록 (비활성 포함)."""
     ctx = _get_ctx()
-    return await ctx.youtube_channel_repository.get_all()
+    channel_repo = await _lazy_attr(ctx, "youtube_channel_repository")
+    return await channel_repo.get_all()
 
 
 @router.post("/channels")
@@ -39,14 +49,16 @@ async def add_channel(payload: dict = Body(...)):
         raise HTTPException(status_code=400, detail="채널 URL 또는 핸들을 입력하세요.")
 
     ctx = _get_ctx()
-    resolved = await ctx.youtube_transcript_collector.resolve_channel(url)
+    collector = await _lazy_attr(ctx, "youtube_transcript_collector")
+    channel_repo = await _lazy_attr(ctx, "youtube_channel_repository")
+    resolved = await collector.resolve_channel(url)
     if not resolved:
         raise HTTPException(
             status_code=400,
             detail=f"채널을 찾을 수 없습니다: {url}",
         )
 
-    added = await ctx.youtube_channel_repository.add(
+    added = await channel_repo.add(
         resolved["channel_id"],
         handle=resolved.get("handle", ""),
         title=resolved.get("title", ""),
@@ -62,7 +74,8 @@ async def add_channel(payload: dict = Body(...)):
 @router.delete("/channels/{channel_id}")
 async def delete_channel(channel_id: str):
     ctx = _get_ctx()
-    if not await ctx.youtube_channel_repository.remove(channel_id):
+    channel_repo = await _lazy_attr(ctx, "youtube_channel_repository")
+    if not await channel_repo.remove(channel_id):
         raise HTTPException(status_code=404, detail=f"등록되지 않은 채널: {channel_id}")
     return {"removed": True, "channel_id": channel_id}
 
@@ -72,7 +85,8 @@ async def toggle_channel(channel_id: str, payload: dict = Body(...)):
     """수집 on/off 전환."""
     enabled = bool((payload or {}).get("enabled", True))
     ctx = _get_ctx()
-    if not await ctx.youtube_channel_repository.set_enabled(channel_id, enabled):
+    channel_repo = await _lazy_attr(ctx, "youtube_channel_repository")
+    if not await channel_repo.set_enabled(channel_id, enabled):
         raise HTTPException(status_code=404, detail=f"등록되지 않은 채널: {channel_id}")
     return {"channel_id": channel_id, "enabled": enabled}
 
@@ -84,7 +98,8 @@ async def toggle_channel(channel_id: str, payload: dict = Body(...)):
 async def list_reports(limit: int = 30):
     """리포트 날짜 목록 (본문 제외)."""
     ctx = _get_ctx()
-    return await ctx.youtube_digest_repository.list_recent(limit=limit)
+    digest_repo = await _lazy_attr(ctx, "youtube_digest_repository")
+    return await digest_repo.list_recent(limit=limit)
 
 
 @router.get("/reports/latest")
@@ -95,13 +110,15 @@ async def get_latest_report():
     첫 실행 전 화면에 "불러오지 못했습니다"가 뜬다. 그래서 객체로 감싼다.
     """
     ctx = _get_ctx()
-    return {"report": await ctx.youtube_digest_repository.latest()}
+    digest_repo = await _lazy_attr(ctx, "youtube_digest_repository")
+    return {"report": await digest_repo.latest()}
 
 
 @router.get("/reports/{report_date}")
 async def get_report(report_date: str):
     ctx = _get_ctx()
-    report = await ctx.youtube_digest_repository.get(report_date)
+    digest_repo = await _lazy_attr(ctx, "youtube_digest_repository")
+    report = await digest_repo.get(report_date)
     if report is None:
         raise HTTPException(status_code=404, detail=f"리포트 없음: {report_date}")
     return report
@@ -13,22 +13,27 @@ let ptTimeUnit = 1;
 let ptResubscribing = false;
 let _resubscribeAbortCtrl = null; // 구독 복구 fetch 취소용
 let _ptDataCachedJson = null;     // beforeunload용 직렬화 캐시
+let ptBackfillBuffer = null;      // 히스토리 backfill 중 도착한 실시간 메시지 (순서 보존)
 
 // ==========================================
 // SSE 연결
 // ==========================================
 function connectPtEventSource() {
     if (ptEventSource) return;
-    ptEventSource = new EventSource('/api/program-trading/stream');
+    // 과거 데이터는 SSE replay 대신 history-series(1분 버킷)로 받는다.
+    ptEventSource = new EventSource('/api/program-trading/stream?replay=false');
     ptEventSource.onmessage = (event) => {
         const d = JSON.parse(event.data);
-        handleProgramTradingData(d);
+        if (ptBackfillBuffer) ptBackfillBuffer.push(d);
+        else handleProgramTradingData(d);
     };
     ptEventSource.onerror = () => {
         const statusDiv = document.getElementById('pt-status');
         if (statusDiv) statusDiv.innerHTML = '<span class="text-red">SSE 연결 끊김 — 재연결 시도 중...</span>';
     };
     ptEventSource.onopen = async () => {
+        // 첫 연결·재연결 모두 끊긴 동안의 구간을 집계 시계열로 채운다.
+        backfillPtHistory(Array.from(ptSubscribedCodes));
         if (ptSubscribedCodes.size === 0 || ptResubscribing) return;
         const statusDiv = document.getElementById('pt-status');
 
@@ -84,6 +89,44 @@ function connectPtEventSource() {
     };
 }
 
+// ==========================================
+// 히스토리 backfill (/history-series, 1분 버킷)
+// ==========================================
+async function loadPtHistorySeries(code) {
+    try {
+        const res = await fetch(`/api/program-trading/history-series/${code}?bucket=60`);
+        const json = await res.json();
+        if (!json.success || !json.data) return;
+        const s = json.data;
+        for (let i = 0; i < s.t.length; i++) {
+            const tt = s.trade_time[i];
+            const rate = s.rate[i];
+            // SSE 배열과 같은 순서: [종목코드, 체결시간, 현재가, 등락률, 대비, 부호, 매도체결, 매수체결, 순매수체결, 순매수대금, 매도잔량, 매수잔량]
+            // 대비·부호는 집계하지 않아 등락률 부호로 채운다 (서버 replay_rows 와 동일).
+            handleProgramTradingData([
+                code, tt >= 0 ? String(tt).padStart(6, '0') : '', s.close[i], rate, 0,
+                rate > 0 ? '2' : (rate < 0 ? '5' : '3'), s.sell_vol[i], s.buy_vol[i], s.net_vol[i],
+                s.net_amt[i], s.sell_rem[i], s.buy_rem[i]
+            ]);
+        }
+    } catch (e) {
+        console.warn(`[PT] History series load failed: ${code}`, e);
+    }
+}
+
+async function backfillPtHistory(codes) {
+    if (ptBackfillBuffer || codes.length === 0) return;
+    ptBackfillBuffer = [];
+    try {
+        await Promise.allSettled(codes.map(loadPtHistorySeries));
+    } finally {
+        // backfill 동안 쌓인 실시간 메시지를 뒤에 적용해 최신 값이 덮어쓰이지 않게 한다.
+        const pending = ptBackfillBuffer;
+        ptBackfillBuffer = null;
+        pending.forEach(handleProgramTradingData);
+    }
+}
+
 // ==========================================
 // 구독 관리
 // ==========================================
@@ -123,6 +166,7 @@ async function addProgramTrading() {
         renderPtChips();
         input.value = '';
 
+        if (ptEventSource) backfillPtHistory([code]);  // 새 연결이면 onopen 에서 채운다
         connectPtEventSource();
 
         statusDiv.innerHTML = `<span class="text-green">구독 중: ${ptSubscribedCodes.size}개 종목</span>`;
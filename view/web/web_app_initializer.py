@@ -4,93 +4,79 @@ TradingApp의 초기화 로직을 참고하여 서비스 레이어만 초기화
 """
 import asyncio
 import inspect
-import time
-from config.config_loader import load_configs, KillSwitchConfig, RiskGateConfig, DataQualityConfig
-from brokers.korea_investment.korea_invest_env import KoreaInvestApiEnv
 import os
-from brokers.broker_api_wrapper import BrokerAPIWrapper
-from services.stock_query_service import StockQueryService
-from services.streaming_service import StreamingService
-from services.order_execution_service import OrderExecutionService
-from services.deferred_order_queue import DeferredOrderQueue
-from repositories.virtual_trade_repository import VirtualTradeRepository
+import time
+from typing import TYPE_CHECKING
+
+# 모듈 import 는 기동 임계 경로라 생성자에서 실제로 쓰는 것만 둔다. 전략·장후 태스크·
+# AI/YouTube 서비스는 bootstrap 단계 모듈이 필요한 시점에 import 한다.
+from common.types import ErrorCode
+from core.logger import Logger, get_streaming_logger
+from core.retry_queue.api_budget_limiter import ApiBudgetLimiter
 from repositories.backtest_journal_repository import BacktestJournalRepository
-from services.virtual_trade_service import VirtualTradeService
-from repositories.stock_code_repository import StockCodeRepository
-from repositories.overseas_stock_code_repository import OverseasStockCodeRepository
-from repositories.rs_rating_repository import RSRatingRepository
 from repositories.favorite_repository import FavoriteRepository
-from services.favorite_service import FavoriteService
-from services.favorite_price_alert_service import FavoritePriceAlertService
-from services.indicator_service import IndicatorService
-from core.market_clock import MarketClock
-from core.logger import Logger, get_strategy_logger, get_streaming_logger
-from core.performance_profiler import PerformanceProfiler
-from scheduler.strategy_scheduler import StrategyScheduler, StrategySchedulerConfig
-from scheduler.background_scheduler import BackgroundScheduler
-from scheduler.foreground_scheduler import ForegroundScheduler
-from scheduler.ticket_queue.message_broker import MessageBroker
-from scheduler.ticket_queue.dlq_manager import DlqManager
-from scheduler.worker.worker_pool import WorkerPool
-from scheduler.dispatcher.time_dispatcher import TimeDispatcher
-from config.task_config_loader import load_after_market_delays
-from interfaces.schedulable_task import TaskPriority
-from task.background.intraday.strategy_scheduler_task_adapter import StrategySchedulerTaskAdapter
-from task.background.intraday.websocket_watchdog_task import WebSocketWatchdogTask
-from task.background.intraday.pre_market_health_check_task import PreMarketHealthCheckTask
-from task.background.intraday.paper_account_expiry_alert_task import PaperAccountExpiryAlertTask
-from task.background.intraday.opening_position_reconcile_task import OpeningPositionReconcileTask
-from task.background.after_market.ranking_task import RankingTask
-from task.background.after_market.minervini_update_task import MinerviniUpdateTask
-from task.background.after_market.daily_price_collector_task import DailyPriceCollectorTask
-from task.background.after_market.ohlcv_update_task import OhlcvUpdateTask
-from task.background.after_market.premium_watchlist_generator_task import PremiumWatchlistGeneratorTask
-from task.background.after_market.cache_warmup_task import CacheWarmupTask
-from task.background.after_market.log_cleanup_task import LogCleanupTask
-from task.background.after_market.newhigh_task import NewHighTask
-from task.background.after_market.strategy_log_report_task import StrategyLogReportTask
-from task.background.after_market.after_market_reconcile_task import AfterMarketReconcileTask
-from task.background.after_market.post_market_replay_audit_task import PostMarketReplayAuditTask
-from task.background.after_market.newhigh_strategy_coverage_backtest_task import NewHighStrategyCoverageBacktestTask
-from services.strategy_log_report_service import StrategyLogReportService, _REASON_KR
-from services.rejection_distribution_service import RejectionDistributionService
-from task.background.always_on.notification_queue_task import NotificationQueueTask
-from services.naver_finance_scraper_service import NaverFinanceScraperService
-from strategies.oneil_squeeze_breakout_strategy import OneilSqueezeBreakoutStrategy
-from strategies.oneil_pocket_pivot_strategy import OneilPocketPivotStrategy
-from strategies.high_tight_flag_strategy import HighTightFlagStrategy
-from strategies.first_pullback_strategy import FirstPullbackStrategy
-from strategies.larry_williams_vbo_strategy import LarryWilliamsVBOStrategy
-from strategies.rsi2_pullback_strategy import RSI2PullbackStrategy
-from strategies.larry_williams_channel_breakout_strategy import LarryWilliamsChannelBreakoutStrategy
-from services.oneil_universe_service import OneilUniverseService
+from repositories.overseas_stock_code_repository import OverseasStockCodeRepository
+from repositories.stock_code_repository import StockCodeRepository
 from repositories.stock_repository import StockRepository
-from services.program_trading_stream_service import ProgramTradingStreamService
+from repositories.streaming_stock_repo import StreamingType
+from repositories.virtual_trade_repository import VirtualTradeRepository
 from scheduler.after_market_loop import run_after_market_loop
-from services.market_data_service import MarketDataService
-from services.market_calendar_service import MarketCalendarService
-from services.notification_service import NotificationService, NotificationCategory
-from services.kill_switch_service import KillSwitchService
-from services.operator_alert_service import OperatorAlertService
-from core.account_snapshot import AccountSnapshotCache
-from core.retry_queue.api_budget_limiter import ApiBudgetLimiter
-from services.position_sizing_service import PositionSizingService
-from services.risk_gate_service import RiskGateService
-from services.order_policy_service import OrderPolicyService
-from services.execution_flow_service import ExecutionFlowService
-from config.config_loader import PositionSizingConfig, OrderPolicyConfig
-from services.price_subscription_service import PriceSubscriptionService
-from services.price_stream_service import PriceStreamService
-from repositories.streaming_stock_repo import StreamingStockRepo, StreamingType
-from services.telegram_notifier import TelegramNotifier, TelegramReporter
-from services.data_quality_service import DataQualityService
-from services.opening_position_reconcile_service import OpeningPositionReconcileService
-
-from core.cache.cache_store import CacheStore
-from services.rs_rating_service import RSRatingService
-from services.minervini_stage_service import MinerviniStageService
-from services.newhigh_service import NewHighService
-from common.types import ErrorCode
+from services.favorite_service import FavoriteService
+from services.program_trading_stream_service import ProgramTradingStreamService
+from services.virtual_trade_service import VirtualTradeService
+from task.background.intraday.websocket_watchdog_task import WebSocketWatchdogTask
+from view.web.response_cache import ResponseCache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from view.web.bootstrap.bootstrap_graph import BootstrapGraph
+    from brokers.broker_api_wrapper import BrokerAPIWrapper
+    from core.account_snapshot import AccountSnapshotCache
+    from core.market_clock import MarketClock
+    from core.performance_profiler import PerformanceProfiler
+    from repositories.streaming_stock_repo import StreamingStockRepo
+    from scheduler.background_scheduler import BackgroundScheduler
+    from scheduler.foreground_scheduler import ForegroundScheduler
+    from scheduler.strategy_scheduler import StrategyScheduler
+    from services.data_quality_service import DataQualityService
+    from services.execution_flow_service import ExecutionFlowService
+    from services.favorite_price_alert_service import FavoritePriceAlertService
+    from services.indicator_service import IndicatorService
+    from services.kill_switch_service import KillSwitchService
+    from services.market_calendar_service import MarketCalendarService
+    from services.notification_service import NotificationService
+    from services.oneil_universe_service import OneilUniverseService
+    from services.operator_alert_service import OperatorAlertService
+    from services.order_execution_service import OrderExecutionService
+    from services.order_policy_service import OrderPolicyService
+    from services.position_sizing_service import PositionSizingService
+    from services.price_stream_service import PriceStreamService
+    from services.price_subscription_service import PriceSubscriptionService
+    from services.rejection_distribution_service import RejectionDistributionService
+    from services.risk_gate_service import RiskGateService
+    from services.stock_query_service import StockQueryService
+    from services.streaming_service import StreamingService
+    from services.warm_restart_snapshot_service import WarmRestartSnapshotService
+    from task.background.after_market.after_market_reconcile_task import AfterMarketReconcileTask
+    from task.background.after_market.cache_warmup_task import CacheWarmupTask
+    from task.background.after_market.daily_price_collector_task import DailyPriceCollectorTask
+    from task.background.after_market.log_cleanup_task import LogCleanupTask
+    from task.background.after_market.minervini_update_task import MinerviniUpdateTask
+    from task.background.after_market.newhigh_strategy_coverage_backtest_task import (
+        NewHighStrategyCoverageBacktestTask,
+    )
+    from task.background.after_market.newhigh_task import NewHighTask
+    from task.background.after_market.ohlcv_update_task import OhlcvUpdateTask
+    from task.background.after_market.post_market_replay_audit_task import PostMarketReplayAuditTask
+    from task.background.after_market.premium_watchlist_generator_task import PremiumWatchlistGeneratorTask
+    from task.background.after_market.ranking_task import RankingTask
+    from task.background.intraday.warm_restart_snapshot_task import WarmRestartSnapshotTask
+    from repositories.warm_restart_snapshot_repository import HotStateSnapshot, WarmRestartSnapshotRepository
+    from task.background.after_market.strategy_log_report_task import StrategyLogReportTask
+    from task.background.always_on.notification_queue_task import NotificationQueueTask
+    from task.background.intraday.opening_position_reconcile_task import OpeningPositionReconcileTask
+    from task.background.intraday.paper_account_expiry_alert_task import PaperAccountExpiryAlertTask
+    from task.background.intraday.pre_market_health_check_task import PreMarketHealthCheckTask
+
 
 class WebAppContext:
     """웹 앱에서 사용할 서비스 컨텍스트."""
@@ -123,24 +109,27 @@ class WebAppContext:
         self.backtest_journal_repository = BacktestJournalRepository()
         self.virtual_trade_service = VirtualTradeService(repository=self.virtual_repo, market_clock=self.market_clock)
         self.virtual_trade_service.backfill_snapshots()  # 과거 CSV 기반 스냅샷 역산
-        self.stock_code_repository = StockCodeRepository(logger=self.logger)
-        # 해외 심볼 자동완성용 리포지토리. 첫 실행 시 FDR 다운로드가 실패해도
-        # 웹 시작을 막지 않도록 방어적으로 생성한다(실패 시 None → 목록 API는 빈 결과).
-        try:
-            self.overseas_stock_code_repository = OverseasStockCodeRepository(logger=self.logger)
-        except Exception as e:
-            self.logger.warning(f"해외 종목코드 리포지토리 초기화 실패(자동완성 비활성): {e}")
-            self.overseas_stock_code_repository = None
+        # 국내 종목 마스터는 initialize_services 의 code_master 단계에서 토큰 발급과 병렬로 로드한다.
+        self.stock_code_repository: StockCodeRepository = None
+        # 해외 심볼 자동완성용 리포지토리. 첫 실행 시 FDR 다운로드가 필요해 기동 경로에서 빼고
+        # 첫 조회 시점에 루프 밖(aresolve_lazy)에서 만든다. 실패하면 None 으로 확정돼 목록 API는 빈 결과를 준다.
+        from core.lazy_service import LazyService
+        self.overseas_stock_code_repository = LazyService(
+            lambda: OverseasStockCodeRepository(logger=self.logger),
+            name="overseas_stock_code_repository",
+            logger=self.logger,
+        )
         self.favorite_repo = FavoriteRepository()
         self.favorite_service = FavoriteService(
             repository=self.favorite_repo,
-            stock_code_repository=self.stock_code_repository,
+            stock_code_repository=None,
             overseas_stock_code_repository=self.overseas_stock_code_repository,
         )
         self.favorite_price_alert_service: FavoritePriceAlertService = None
         self.overseas_favorite_price_alert_service: FavoritePriceAlertService = None
         self.overseas_favorite_price_alert_task = None
         self.account_snapshot_cache: AccountSnapshotCache = None
+        # config api_adaptive_rate.enabled 면 ConfigBootstrap 이 adaptive limiter 로 교체한다.
         self.api_budget_limiter = ApiBudgetLimiter()
         self.risk_gate_service: RiskGateService = None
         self.order_policy_service: OrderPolicyService = None
@@ -160,6 +149,13 @@ class WebAppContext:
         self.ohlcv_update_task: OhlcvUpdateTask = None
         self.premium_watchlist_generator_task: PremiumWatchlistGeneratorTask = None
         self.cache_warmup_task: CacheWarmupTask = None
+        # 웜 리스타트 스냅샷 — snapshot_load 단계가 열고 snapshot_restore 단계가 되살린 뒤 닫는다.
+        self.warm_restart_snapshot_repository: WarmRestartSnapshotRepository = None
+        self.warm_restart_snapshot_service: WarmRestartSnapshotService = None
+        self.warm_restart_snapshot_task: WarmRestartSnapshotTask = None
+        self._warm_snapshot: HotStateSnapshot = None
+        # 세션 시계 — config_bootstrap 이 만들고 백그라운드 기동 시 타이머를 시작한다.
+        self.market_session_clock = None
         self.log_cleanup_task: LogCleanupTask = None
         self.newhigh_task: NewHighTask = None
         self.theme_classification_repository = None
@@ -186,12 +182,16 @@ class WebAppContext:
         self.dart_disclosure_repository = None
         self.dart_disclosure_rule_service = None
         self.dart_disclosure_monitor_task = None
+        self.execution_strength_repo = None
+        self.orderbook_snapshot_repo = None
         self.ai_client = None
         self.ai_usage_limiter = None
         self.ai_disclosure_analyzer = None
         self.ai_stock_analyzer = None
         self.initialized = False
         self.pm: PerformanceProfiler = None
+        # 기동 단계별 소요 시간 (initialize_services 가 채운다)
+        self.bootstrap_graph: BootstrapGraph = None
 
         # 프로그램매매 실시간 데이터 서비스
         self.program_trading_stream_service = ProgramTradingStreamService(
@@ -213,6 +213,8 @@ class WebAppContext:
         self.overseas_dryrun_task = None
         self._last_missing_reason_log_ts: dict[tuple[str, str], float] = {}
         self._last_rest_price_refresh_ts: dict[str, float] = {}
+        # 차트·랭킹·히트맵 렌더링 결과 캐시 (view.web.response_cache.cached_response)
+        self.response_cache = ResponseCache()
         self._pending_rest_price_refresh_tasks: dict[str, asyncio.Task] = {}
         self._pending_ohlcv_preload_tasks: set[asyncio.Task] = set()
         self._price_subscription_init_task: asyncio.Task | None = None
@@ -264,12 +266,22 @@ class WebAppContext:
             self.logger.warning(f"[PositionSizingState] 저장 실패: {e}")
 
     async def initialize_services(self, is_paper_trading: bool = True):
-        """서비스 레이어 초기화."""
+        """서비스 레이어 초기화.
+
+        토큰 발급 · 종목 마스터 로드 · SQLite 오픈은 서로 무관해 BootstrapGraph 로 동시에
+        돌리고, broker → 서비스 조립 → 스케줄러만 앞 단계를 기다린다.
+        """
+        from view.web.bootstrap.bootstrap_graph import BootstrapGraph
         from view.web.deployment_policy import is_demo_mode
 
+        graph = BootstrapGraph(logger=self.logger)
+        self.bootstrap_graph = graph
+
         if is_demo_mode(self):
             from services.demo_market_data_service import DemoMarketDataService
 
+            graph.add("code_master", self.load_code_master, blocking=True)
+            await graph.run()
             self.demo_market_data_service = DemoMarketDataService()
             self.broker = None
             self.initialized = True
@@ -277,29 +289,100 @@ class WebAppContext:
             return True
 
         self.env.set_trading_mode(is_paper_trading)
-        if not await self._bootstrap_broker(is_paper_trading):
-            return False
-        try:
-            self._bootstrap_services()
-            self._bootstrap_schedulers()
-        except Exception as e:
-            self.logger.critical(f"웹 앱: 서비스 초기화 실패: {e}", exc_info=True)
+        repositories: dict = {}
+        graph.add("token", lambda: self._acquire_tokens(is_paper_trading))
+        graph.add("snapshot_load", self._load_warm_snapshot, blocking=True)
+        graph.add("code_master", self.load_code_master, depends_on=("snapshot_load",), blocking=True)
+        graph.add("sqlite", lambda: repositories.update(cache_store=self._open_repositories()), blocking=True)
+        graph.add("broker", self._build_broker, depends_on=("token", "code_master"))
+        graph.add(
+            "services",
+            lambda: self._bootstrap_services(cache_store=repositories.get("cache_store")),
+            depends_on=("broker", "sqlite"),
+        )
+        graph.add("snapshot_restore", self._restore_warm_snapshot, depends_on=("services",))
+        graph.add("schedulers", self._bootstrap_schedulers, depends_on=("services",))
+        succeeded = await graph.run()
+        self.logger.info(f"웹 앱: 기동 단계 소요 {graph.summary()}")
+        if not succeeded:
             return False
         self.initialized = True
         mode = "모의투자" if is_paper_trading else "실전투자"
         self.logger.info(f"웹 앱: 서비스 초기화 완료 ({mode})")
         return True
 
+    def load_code_master(self) -> StockCodeRepository:
+        """국내 종목 마스터를 (아직 없으면) 로드하고 즐겨찾기 서비스에 후주입한다.
+
+        같은 거래일 웜 리스타트 스냅샷이 열려 있으면 SQLite 대신 스냅샷의 마스터로 만든다.
+        """
+        if self.stock_code_repository is None:
+            master = self._warm_snapshot.documents.get("symbol_master") if self._warm_snapshot else None
+            if master:
+                try:
+                    self.stock_code_repository = StockCodeRepository.from_snapshot(master, logger=self.logger)
+                except Exception as e:
+                    self.logger.warning(f"웹 앱: 스냅샷 종목 마스터 복원 실패, DB 로드로 대체: {e}")
+        if self.stock_code_repository is None:
+            self.stock_code_repository = StockCodeRepository(logger=self.logger)
+        self.favorite_service.stock_code_repository = self.stock_code_repository
+        return self.stock_code_repository
+
+    def _load_warm_snapshot(self):
+        """오늘 거래일 웜 리스타트 스냅샷을 mmap 으로 연다. 없거나 어긋나면 콜드 스타트(None)."""
+        from config.config_loader import WarmRestartSnapshotConfig
+        from repositories.warm_restart_snapshot_repository import WarmRestartSnapshotRepository
+
+        try:
+            cfg = getattr(self.full_config, "warm_restart_snapshot", None)
+            if not isinstance(cfg, WarmRestartSnapshotConfig) or not cfg.enabled:
+                return None
+            trading_date = self.market_clock.get_current_kst_time().strftime("%Y%m%d")
+            self.warm_restart_snapshot_repository = WarmRestartSnapshotRepository(path=cfg.path, logger=self.logger)
+            self._warm_snapshot = self.warm_restart_snapshot_repository.load(trading_date)
+        except Exception as e:
+            self.logger.warning(f"웹 앱: 웜 리스타트 스냅샷 로드 실패 (콜드 스타트): {e}")
+            self._warm_snapshot = None
+        return self._warm_snapshot
+
+    def _restore_warm_snapshot(self):
+        """열어 둔 스냅샷을 OHLCV·지표 캐시, 최신가, 구독 장부에 되살리고 mmap 을 닫는다."""
+        snapshot, self._warm_snapshot = self._warm_snapshot, None
+        if snapshot is None:
+            return None
+        try:
+            if self.warm_restart_snapshot_service:
+                return self.warm_restart_snapshot_service.restore(snapshot)
+        except Exception as e:
+            self.logger.warning(f"웹 앱: 웜 리스타트 스냅샷 복원 실패 (콜드 경로로 계속): {e}", exc_info=True)
+        finally:
+            snapshot.close()
+        return None
+
+    def _open_repositories(self):
+        """CacheStore · StockRepository 오픈. RepositoryBootstrap 에 위임하고 cache_store 를 반환."""
+        from view.web.bootstrap.repository_bootstrap import RepositoryBootstrap
+        from view.web.bootstrap.service_container import config_as_dict
+        return RepositoryBootstrap(self).run(config_as_dict(self.full_config))
+
+    async def _acquire_tokens(self, is_paper_trading: bool) -> bool:
+        from view.web.bootstrap.broker_bootstrap import BrokerBootstrap
+        return await BrokerBootstrap(self).acquire_tokens(is_paper_trading)
+
+    async def _build_broker(self) -> bool:
+        from view.web.bootstrap.broker_bootstrap import BrokerBootstrap
+        return await BrokerBootstrap(self).build_broker()
+
     async def _bootstrap_broker(self, is_paper_trading: bool) -> bool:
         """토큰 발급 및 BrokerAPIWrapper 초기화. BrokerBootstrap 에 위임."""
         from view.web.bootstrap.broker_bootstrap import BrokerBootstrap
         return await BrokerBootstrap(self).run(is_paper_trading)
 
-    def _bootstrap_services(self):
+    def _bootstrap_services(self, cache_store=None):
         """서비스 레이어 초기화. ServiceContainer → WiringPhase 순서로 위임."""
         from view.web.bootstrap.service_container import ServiceContainer
         from view.web.bootstrap.wiring_phase import WiringPhase
-        ServiceContainer(self).run()
+        ServiceContainer(self).run(cache_store=cache_store)
         WiringPhase(self).run()
 
     def _bootstrap_schedulers(self):
@@ -307,6 +390,38 @@ class WebAppContext:
         from view.web.bootstrap.scheduler_bootstrap import SchedulerBootstrap
         SchedulerBootstrap(self).run()
 
+    async def prewarm_websocket(self) -> bool:
+        """기동 직후 WebSocket 을 미리 연결한다.
+
+        lifespan 에서 전략 state 로드 · 주문 reconcile 과 동시에 돌려, 가격 구독 시점에는
+        연결이 이미 열려 있게 한다. 실패해도 구독 단계가 다시 연결하므로 기동을 막지 않는다.
+        """
+        from view.web.bootstrap.bootstrap_graph import PHASE_FAILED, PHASE_OK
+        from view.web.bootstrap.runtime_mode import RuntimeMode
+        from view.web.deployment_policy import is_demo_mode, is_public_mode
+
+        if not self.streaming_service or is_public_mode(self) or is_demo_mode(self):
+            return False
+        if not (self.runtime_mode & (RuntimeMode.WEB | RuntimeMode.TRADING)):
+            return False
+
+        graph = self.bootstrap_graph
+        start_ms = graph.elapsed_ms() if graph else 0.0
+        try:
+            connected = bool(await self.streaming_service.connect_websocket(self._web_realtime_callback))
+        except Exception as e:
+            self.logger.warning(f"웹 앱: WebSocket 선연결 실패 (구독 시 재시도): {e}")
+            connected = False
+        if graph:
+            graph.record(
+                "websocket",
+                start_ms=start_ms,
+                duration_ms=graph.elapsed_ms() - start_ms,
+                status=PHASE_OK if connected else PHASE_FAILED,
+            )
+            self.logger.info(f"웹 앱: 기동 단계 소요 {graph.summary()}")
+        return connected
+
     async def _initialize_price_subscriptions(self, *, rebalance: bool = True) -> None:
         """기동 시 포트폴리오(HIGH) 및 프리미엄 종목(MEDIUM) 구독을 초기화."""
         if not self.price_subscription_service:
@@ -466,6 +581,9 @@ class WebAppContext:
         if self.streaming_service:
             self.streaming_service._callback = self._web_realtime_callback
 
+        if self.market_session_clock:
+            asyncio.create_task(self._start_market_session_clock())
+
         if self.background_scheduler:
             asyncio.create_task(self.background_scheduler.start_all())
 
@@ -485,12 +603,23 @@ class WebAppContext:
         if self.streaming_service:
             self.streaming_service._callback = self._web_realtime_callback
 
+        await self._start_market_session_clock()
+
         if self.background_scheduler:
             await self.background_scheduler.start_all()
 
         if schedule_price_subscriptions:
             await self._initialize_price_subscriptions()
 
+    async def _start_market_session_clock(self) -> None:
+        """세션 시계 시작. 실패하면 is_market_open_now() 는 기존 달력 판정을 그대로 쓴다."""
+        if not self.market_session_clock:
+            return
+        try:
+            await self.market_session_clock.start()
+        except Exception as e:
+            self.logger.warning(f"웹 앱: 세션 시계 시작 실패 → 달력 조회 방식 유지: {e}")
+
     def _schedule_price_subscription_initialization(self):
         """초기 가격 구독 task를 background lifecycle에 맞춰 시작한다."""
         from view.web.bootstrap.runtime_mode import RuntimeMode
@@ -519,6 +648,8 @@ class WebAppContext:
         self._pending_rest_price_refresh_tasks.clear()
         self._pending_ohlcv_preload_tasks.clear()
         self._price_subscription_init_task = None
+        if self.market_session_clock:
+            await self.market_session_clock.stop()
         if self.background_scheduler:
             await self.background_scheduler.shutdown()
         if self.program_trading_stream_service:
@@ -527,8 +658,16 @@ class WebAppContext:
             await self.price_stream_service.shutdown()
         if self.broker:
             await self.broker.stop()
+        if self.kill_switch_service:
+            await self.kill_switch_service.flush_state()
         if self.stock_repository:
             await self.stock_repository.close()
+        if self.dart_disclosure_repository:
+            await self.dart_disclosure_repository.close()
+        # 틱 샘플 버퍼 flush + 당일 log 봉인 (파일 I/O 라 스레드로)
+        for tick_recorder in (self.execution_strength_repo, self.orderbook_snapshot_repo):
+            if tick_recorder:
+                await asyncio.to_thread(tick_recorder.close)
         self.logger.info("웹 앱: 서비스 종료 완료")
 
     # --- 프로그램매매 실시간 스트리밍 ---
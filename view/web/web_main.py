@@ -17,6 +17,8 @@ import view.web.web_api as web_api
 import view.web.api_common as api_common
 from view.web.authorization import ADMIN, OPERATOR, VIEWER, role_allows
 from view.web.deployment_policy import cors_policy, is_host_allowed
+from view.web.compression import CompressionMiddleware
+from view.web.fast_json import FastJSONResponse
 
 # ── 진단 전용 HTTP 서버 (포트 8001, 별도 OS 스레드) ──────────────────────
 # asyncio 이벤트 루프가 완전히 블록되어도 응답 가능.
@@ -115,6 +117,9 @@ async def lifespan(app: FastAPI):
     ctx.load_config_and_env()
     await ctx.initialize_services(is_paper_trading=True) # 기본 모의투자 설정
 
+    # 2-1. WebSocket 선연결 — 아래 전략 state 로드 · reconcile 과 병렬로 연결을 연다.
+    websocket_prewarm = asyncio.create_task(ctx.prewarm_websocket())
+
     # 3. web_api에 완성된 ctx 연결 (이게 없어서 503 에러가 났던 것임)
     web_api.set_ctx(ctx)
 
@@ -135,6 +140,8 @@ async def lifespan(app: FastAPI):
         await ctx.order_execution_service.restore_state_from_broker()
         await ctx.order_execution_service.reconcile_orders_with_broker()
 
+    await websocket_prewarm
+
     # 외부 알림 큐를 먼저 기동해야 초기 관심종목 가격 평가가 텔레그램 전송 전에 유실되지 않는다.
     await ctx.start_background_tasks_and_wait(schedule_price_subscriptions=False)
 
@@ -158,7 +165,7 @@ async def lifespan(app: FastAPI):
     await StrategyStateIO.flush_pending(timeout=5.0)
 
 # 1. FastAPI 앱 인스턴스 생성 (lifespan 추가)
-app = FastAPI(title="Trading App", lifespan=lifespan)
+app = FastAPI(title="Trading App", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 # debugpy가 요청 처리 컨텍스트를 인식하도록 첫 요청에서 트리거
 import sys
@@ -350,6 +357,8 @@ app.middleware("http")(api_auth_middleware)
 app.middleware("http")(request_tracker_middleware)
 app.middleware("http")(public_host_middleware)
 app.middleware("http")(exact_origin_cors_middleware)
+# 가장 바깥: 라우트·미들웨어가 만든 최종 본문을 크기 임계값 이상일 때만 gzip 압축
+app.add_middleware(CompressionMiddleware)
 
 
 # 2. 정적 파일 및 템플릿 설정